@@ -1,14 +1,21 @@
-from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout, QMessageBox, QSystemTrayIcon, QMenu, QAction, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QThread, pyqtSignal, QRectF
-from PyQt5.QtGui import QPixmap, QIcon, QCursor, QPainterPath, QRegion, QTransform
+from capsWatcherStartup import startupTrace
+from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout, QMessageBox, QSystemTrayIcon, QMenu, QAction
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QThread, QObject, QEvent, QAbstractNativeEventFilter, pyqtSignal, QRect, QRectF
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QIcon, QCursor, QPainterPath, QRegion, QTransform
+from PyQt5 import sip
 from winreg import OpenKey, QueryValueEx, HKEY_CURRENT_USER
-from configparser import ConfigParser
-from win32api import GetKeyState
+from capsWatcherConfig import loadSettings, fileStamp
+from capsWatcherThemes import themeSource, loadManifest, readThemeFile, releaseBundles, supportedKeys
+from win32api import GetKeyState, GetKeyboardState
 from datetime import datetime
+from collections import deque
 from os.path import join as pathj
-import capsWatcherResources, sys, os, json, subprocess, psutil
+from ctypes import wintypes
+from capsWatcherChannel import capsWatcher_commandServer, acquireInstanceLock
+import capsWatcherResources, sys, os, json, subprocess, time, ctypes, hashlib, mmap, struct
 
 appVersion = [1, 0, 1, 9]
+capsWatcherResources.registerResources('capsWatcherOverlay')
 
 class capsWatcher_customQMenu(QMenu):
     def __init__(self):
@@ -81,8 +88,10 @@ class capsWatcher_customQMenu(QMenu):
 class capsWatcher_Overlay(QWidget):
     def __init__(self):
         super().__init__()
+        if startupTrace is not None : startupTrace.instrument(self, ['checkForExistingProcess', 'parsePaths', 'parseConfig', 'parseTray', 'parseElements', 'parseColorScheme', 'parseElementsConfig', 'parseTheme', 'setupThreads', 'parseChannel'])
 
         self.checkForExistingProcess()
+        self.parseArguments()
         self.parsePaths()
         self.parseConfig()
         self.parseTray()
@@ -91,43 +100,81 @@ class capsWatcher_Overlay(QWidget):
         self.parseElementsConfig()
         self.parseTheme()
         self.setupThreads()
+        if self.traceReplay is not None : self.traceReplay.play()
 
-        self.checkReloadTimer = QTimer(self)
-        self.checkReloadTimer.timeout.connect(self.checkReloadFile)
-        self.checkReloadTimer.start(1000)
+        self.parseChannel()
     
     def checkForExistingProcess(self):
-        processRunning = 1
-        for process in psutil.process_iter(['name']):
-            if 'capsWatcher.exe' in process.info['name']:
-                if processRunning > 1:
-                    self.showMessageBox("capsWatcher launch error", "Only one instance of capsWatcher is allowed, try closing the existing one with capsWatcher Interface if you need it.", "critical")
-                    self.overlayQuit()
-                processRunning += 1
-
-    def checkReloadFile(self):
-        if os.path.exists(self.reloadFile):
-            self.reloadElements()
-            os.remove(self.reloadFile)
-
-        if os.path.exists(self.terminateFile):
-            for instance in self.capsWatcherKeyStateInstances : instance.terminate()
-            os.remove(self.terminateFile)
-            self.overlayQuit()
+        self.instanceLock = acquireInstanceLock('capsWatcher')
+        if self.instanceLock is None : self.overlayQuit()
+
+    def parseArguments(self):
+        self.keyStateSource, self.traceReplay = None, None
+        arguments = dict(argument[1:].split('=', 1) for argument in sys.argv[1:] if argument.startswith('/') and '=' in argument)
+        if 'replay' in arguments:
+            self.keyStateSource = capsWatcher_TraceKeySource(arguments['replay'], float(arguments.get('replaySpeed', '1')))
+            self.traceReplay = capsWatcher_TraceReplay(self, self.keyStateSource, arguments.get('replayReport', f"{arguments['replay']}.report.json"))
+
+    def parseChannel(self):
+        self.commandServer = capsWatcher_commandServer({
+            'ping': lambda: ("pong", None),
+            'activate': lambda: ("ok", self.handleActivateCommand),
+            'status': lambda: (json.dumps({"pid": os.getpid(), "version": ".".join(map(str, appVersion)), "keysToWatch": self.overlayKeysToWatch, "backend": type(self.keyStateEngine).__name__}), None),
+            'reload': self.handleReloadCommand,
+            'terminate': self.handleTerminateCommand
+        })
+        self.commandServer.listen()
+
+    def handleActivateCommand(self):
+        message = "Only one instance of capsWatcher is allowed, try closing the existing one with capsWatcher Interface if you need it."
+        if self.tray.isVisible() : self.tray.showMessage("capsWatcher is already running", message, QIcon(":/capsWatcher/appicon.png"))
+        else : self.showMessageBox("capsWatcher launch error", message, "information")
+
+    def handleReloadCommand(self):
+        self.reloadElements()
+        return "ok", None
+
+    def handleTerminateCommand(self):
+        self.keyStateEngine.stop()
+        return "ok", self.overlayQuit
     
     def reloadElements(self):
-        for instance in self.capsWatcherKeyStateInstances : instance.terminate()
-        self.parseConfig()
-        self.parseColorScheme()
-        self.parseElementsConfig()
-        self.parseTheme()
-        self.setupThreads()
-
-    def setupThreads(self):
+        previousSettings = self.settings
+        self.applySettings(self.loadConfig())
+        changes = self.settings.diff(previousSettings)
+        if self.parseColorScheme() != self.appliedColorScheme : changes.add('colorScheme')
+        # a theme reinstalled under the same name only shows up in the stamp of its bundle or manifest
+        if self.parseThemeStamp() != self.appliedThemeStamp : changes.add('theme')
+        if not changes : return
+
+        if changes & {'trayIcon', 'colorScheme', 'fadeEffectTime', 'diagnostics'} : self.parseElementsConfig()
+        if changes & {'theme', 'colorScheme', 'opacity'} : self.parseTheme()
+        elif 'positionOnScreen' in changes : self.parsePlacements()
+
+        if 'keyStateBackend' in changes:
+            previousEngine = self.keyStateEngine
+            previousEngine.stop()
+            previousEngine.stateChanged.disconnect()
+            self.setupThreads(currentStates=previousEngine.currentStates)
+            return
+        if 'keysToWatch' in changes : self.keyStateEngine.setKeyCodes(self.overlayKeysToWatch)
+        if isinstance(self.keyStateEngine, capsWatcher_KeyStateEngine) : self.keyStateEngine.scheduler = self.pollScheduler
+        self.keyStateEngine.latencyProbe = self.latencyProbe
+
+    def setupThreads(self, currentStates=None):
         if len(self.overlayKeysToWatch) > 0:
-            for instance in self.capsWatcherKeyStateInstances:
-                instance.stateChanged.connect(self.overlayShow)
-                instance.start()
+            if self.overlayKeyStateBackend == 1 : self.keyStateEngine = capsWatcher_RawInputKeyState(self.overlayKeysToWatch, self, source=self.keyStateSource, currentStates=currentStates)
+            else : self.keyStateEngine = capsWatcher_KeyStateEngine(self.overlayKeysToWatch, scheduler=self.pollScheduler, source=self.keyStateSource, currentStates=currentStates)
+            self.keyStateEngine.stateChanged.connect(self.overlayShow)
+            self.keyStateEngine.latencyProbe = self.latencyProbe
+            if self.traceReplay is not None : self.traceReplay.attach(self.keyStateEngine)
+            else:
+                try : self.keyStateEngine.start()
+                except OSError:
+                    self.keyStateEngine = capsWatcher_KeyStateEngine(self.overlayKeysToWatch, scheduler=self.pollScheduler, source=self.keyStateSource, currentStates=currentStates)
+                    self.keyStateEngine.stateChanged.connect(self.overlayShow)
+                    self.keyStateEngine.latencyProbe = self.latencyProbe
+                    self.keyStateEngine.start()
         else:
             self.appException("Unable to load configuration file.", 'Nothing to watch.\nPlease select at least one key to watch.')
 
@@ -152,55 +199,66 @@ class capsWatcher_Overlay(QWidget):
         self.hideTimer = QTimer(self)
         self.hideTimer.timeout.connect(self.overlayHide)
 
-        self.imageOpacity = QGraphicsOpacityEffect()
-        self.imageOpacity.setOpacity(self.overlayOpacity)
+        self.overlayFrames, self.overlayFramesKey = {}, None
+        self.emptyOverlayFrame = QPixmap()
+        self.pixelCache = capsWatcher_pixelCache(pathj(self.cfgPath, 'pixelCache'))
 
-        self.numLockEnabledOverlay, self.numLockDisabledOverlay = None, None
-        self.capsLockEnabledOverlay, self.capsLockDisabledOverlay = None, None
-        self.scrollLockEnabledOverlay, self.scrollLockDisabledOverlay = None, None
+        self.overlayPlacements = {}
+        QApplication.instance().screenAdded.connect(self.handleScreenAdded)
+        QApplication.instance().screenRemoved.connect(self.handleScreenChanged)
+        for screen in QApplication.screens() : screen.geometryChanged.connect(self.handleScreenChanged)
+
+        self.latencyProbe = None
     
     def parseElementsConfig(self):
         if self.settingsTrayIcon:
             self.tray.show()
+            if startupTrace is not None : startupTrace.mark('trayIcon')
             colorScheme = self.parseColorScheme()
             if colorScheme == 0 : self.trayMenu.setDarkMode()
             elif colorScheme == 1 : self.trayMenu.setLightMode()
         else:
             self.tray.hide()
         self.fadeEffect.setDuration(self.overlayFadeEffectTime)
-        self.imageOpacity.setOpacity(self.overlayOpacity)
+        if self.settingsDiagnostics and self.latencyProbe is None : self.latencyProbe = capsWatcher_LatencyProbe(self)
+        elif not self.settingsDiagnostics and self.latencyProbe is not None:
+            self.latencyProbe.detach(self)
+            self.latencyProbe = None
+            self.keyStateEngine.latencyProbe = None
+        self.diagnosticsAction.setVisible(self.latencyProbe is not None)
 
     def parseConfig(self):
-        self.configParser = ConfigParser()
+        self.applySettings(self.loadConfig())
+
+    def loadConfig(self):
         if not os.path.exists(self.cfgFilePath):
             self.showMessageBox("capsWatcher launch error", "Configuration file not found, please open capsWatcher configuration interface to manage.", "critical")
             sys.exit(1)
-        self.configParser.read(self.cfgFilePath)
-
-        self.overlayDisplayTime = int(self.configParser.get('overlay', 'displayTime'))
-        self.overlayOpacity = float(int(self.configParser.get('overlay', 'opacity'))/100)
-        self.overlayFadeEffectTime = int(self.configParser.get('overlay', 'fadeEffectTime'))
-        self.overlayPositionOnScreen = int(self.configParser.get('overlay', 'positionOnScreen'))
-        self.overlayTheme = self.configParser.get('overlay', 'theme')
-        self.currentThemeFile = pathj(pathj(self.themesPath, self.overlayTheme), f"{self.overlayTheme}.json")
-        self.currentThemeExists = os.path.exists(self.currentThemeFile)
-        self.overlayColorScheme = int(self.configParser.get('overlay', 'colorScheme'))
-        self.overlayKeysToWatch = list(map(int, self.configParser.get('overlay', 'keysToWatch').split(',')))
-        self.settingsTrayIcon = bool(int(self.configParser.get('settings', 'trayicon')))
-        self.themeFolder = pathj(self.themesPath, self.overlayTheme)
-
-        if not 500 <= self.overlayDisplayTime <= 2000 : self.appException("Unable to load configuration file.", "Display Time not in allowed range (500, 2000).", configRelated=True)
-        if not 0.10 <= self.overlayOpacity <= 1.00 : self.appException("Unable to load configuration file.", "Opacity value not in allowed range (10, 100).", configRelated=True)
-        if not 50 <= self.overlayFadeEffectTime <= 500 : self.appException("Unable to load configuration file.", "Fade Time value not in allowed range (50, 500).", configRelated=True)
-        if self.overlayPositionOnScreen not in [0, 1, 2, 3, 4, 5] : self.appException("Unable to load configuration file.", "Position on screen value not in allowed options (0, 1, 2, 3, 4, 5).", configRelated=True)
-        if not self.overlayTheme or not self.currentThemeExists : self.appException("Unable to load configuration file.", f"The theme file '{self.overlayTheme}.json' is not found or is corrupted.", configRelated=True)
-        if self.overlayColorScheme not in [0, 1, 2] : self.appException("Unable to load configuration file.", "Color scheme not in allowed options (0, 1, 2)", configRelated=True)
-        if any(item not in [20,144,145] for item in self.overlayKeysToWatch) : self.appException("Unable to load configuration file.", f"Invalid key {[x for x in self.overlayKeysToWatch]} to define to capsWatcher, supported keys is (20, 144, 145)", configRelated=True)
-
-        self.capsWatcherKeyStateInstances = []
-        if 20 in self.overlayKeysToWatch : self.capsWatcherKeyStateInstances.append(capsWatcher_KeyState("capslock"))
-        if 144 in self.overlayKeysToWatch : self.capsWatcherKeyStateInstances.append(capsWatcher_KeyState("numlock"))
-        if 145 in self.overlayKeysToWatch : self.capsWatcherKeyStateInstances.append(capsWatcher_KeyState("scrolllock"))
+        try : settings = loadSettings(self.cfgFilePath)
+        except ValueError as error : self.appException("Unable to load configuration file.", str(error), configRelated=True)
+        error = settings.validate(self.themesPath)
+        if error is not None : self.appException("Unable to load configuration file.", error, configRelated=True)
+        return settings
+
+    def applySettings(self, settings):
+        self.settings = settings
+        self.overlayDisplayTime = settings.displayTime
+        self.overlayOpacity = settings.opacity/100
+        self.overlayFadeEffectTime = settings.fadeEffectTime
+        self.overlayPositionOnScreen = settings.positionOnScreen
+        self.overlayTheme = settings.theme
+        self.currentThemeFile = themeSource(self.themesPath, self.overlayTheme)
+        self.overlayColorScheme = settings.colorScheme
+        self.overlayKeysToWatch = list(settings.keysToWatch)
+        self.overlayKeyStateBackend = settings.keyStateBackend
+        self.overlayPollMinInterval = settings.pollMinInterval
+        self.overlayPollMaxInterval = settings.pollMaxInterval
+        self.overlayPollBackoff = settings.pollBackoff
+        self.overlayPollFastWindow = settings.pollFastWindow
+        self.settingsTrayIcon = settings.trayIcon
+        self.settingsDiagnostics = settings.diagnostics
+
+        self.pollScheduler = capsWatcher_PollScheduler(self.overlayPollMinInterval, self.overlayPollMaxInterval, self.overlayPollBackoff/100, self.overlayPollFastWindow)
 
     def parseColorScheme(self):
         regScheme = QueryValueEx(OpenKey(HKEY_CURRENT_USER, r'SOFTWARE\Microsoft\Windows\CurrentVersion\Themes\Personalize'), 'AppsUseLightTheme')[0]
@@ -211,12 +269,21 @@ class capsWatcher_Overlay(QWidget):
         themeFile = self.currentThemeFile
         try:
             if not os.path.exists(themeFile) : raise Exception()
-            data = json.load(open(themeFile, encoding='utf-8'))
-            colorScheme = self.parseColorScheme()
-            if colorScheme == 0 and data['darkMode']['isSupported'] : self.treatThemeScheme(data, 'darkMode')
-            elif colorScheme == 1 and data['lightMode']['isSupported'] : self.treatThemeScheme(data, 'lightMode')
+            manifest = loadManifest(themeFile)
+            colorScheme = self.appliedColorScheme = self.parseColorScheme()
+            themeStamp = self.appliedThemeStamp = self.parseThemeStamp()
+            if colorScheme == 0 and manifest.darkMode.isSupported : self.treatThemeScheme(manifest.darkMode, themeStamp)
+            elif colorScheme == 1 and manifest.lightMode.isSupported : self.treatThemeScheme(manifest.lightMode, themeStamp)
+            else : self.overlayFrames, self.overlayFramesKey = {}, None
+            self.pixelCache.release()
+            releaseBundles()
         except:
             self.appException("Unable to set current selected theme.", f'The selected theme "{self.overlayTheme.capitalize()}", cannot be loaded, check integrity or reinstall.')
+        self.parsePlacements()
+
+    def parseThemeStamp(self):
+        try : return fileStamp(self.currentThemeFile)
+        except OSError : return None
 
     def parseTray(self):
         self.tray = QSystemTrayIcon(QIcon(":/capsWatcher/appicon.png"))
@@ -229,17 +296,20 @@ class capsWatcher_Overlay(QWidget):
         self.capsWatcherTrayName.setDisabled(True)
         self.configAction = QAction("Configuration")
         self.reloadAction = QAction("Reload watcher")
+        self.diagnosticsAction = QAction("Diagnostics")
         self.quitAction = QAction("Quit")
         self.trayMenu.addAction(self.capsWatcherTrayName)
         self.trayMenu.addSeparator()
         self.trayMenu.addAction(self.configAction)
         self.trayMenu.addAction(self.reloadAction)
+        self.trayMenu.addAction(self.diagnosticsAction)
         self.trayMenu.addSeparator()
         self.trayMenu.addAction(self.quitAction)
         self.trayMenu.setWindowFlags(Qt.Popup)
         self.tray.setContextMenu(self.trayMenu)
 
         self.reloadAction.triggered.connect(self.reloadElements)
+        self.diagnosticsAction.triggered.connect(self.handleDiagnosticsTrayClick)
         self.quitAction.triggered.connect(self.overlayQuit)
         self.configAction.triggered.connect(self.handleConfigTrayClick)
 
@@ -249,13 +319,19 @@ class capsWatcher_Overlay(QWidget):
         self.cfgPath = pathj(os.getenv('APPDATA'), 'capsWatcher')
         self.cfgFilePath = pathj(self.cfgPath, 'capsWatcher.cfg')
         self.themesPath = pathj(self.currentDirectory, 'themes')
-        self.reloadFile = pathj(self.currentDirectory, 'reload.d')
-        self.terminateFile = pathj(self.currentDirectory, 'terminate.d')
         self.currentDirectory = None
 
     def handleConfigTrayClick(self):
         subprocess.Popen(os.path.join(self.currentDirectory, 'capsWatcherInterface.exe'), shell=True)
     
+    def handleDiagnosticsTrayClick(self):
+        diagnosticsFile = pathj(self.cfgPath, 'capsWatcherDiagnostics.json')
+        report = self.latencyProbe.report()
+        with open(diagnosticsFile, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+        reportLines = [f"{stage}: p50 {values['p50']}ms, p95 {values['p95']}ms, p99 {values['p99']}ms, max {values['max']}ms" for stage, values in report.items() if values['count'] > 0]
+        self.showMessageBox("capsWatcher diagnostics", "Latency since key state detected ({} events)\n\n{}\n\nSaved to {}".format(report['showEntered']['count'], "\n".join(reportLines) or "No events recorded yet.", diagnosticsFile), "information")
+
     def handleMainTrayClick(self):
         if self.lastTrayClickTime is not None:
             currentTrayClickTime = datetime.now()
@@ -276,33 +352,41 @@ class capsWatcher_Overlay(QWidget):
         elif pos == 5 : return (1.25, 1.45)
 
     def overlayShow(self, key, state):
-        if key == 144 and state : self.currentOverlay = self.numLockEnabledOverlay
-        elif key == 144 and not state : self.currentOverlay = self.numLockDisabledOverlay
-        elif key == 20 and state : self.currentOverlay = self.capsLockEnabledOverlay
-        elif key == 20 and not state : self.currentOverlay = self.capsLockDisabledOverlay
-        elif key == 145 and state : self.currentOverlay = self.scrollLockEnabledOverlay
-        elif key == 145 and not state : self.currentOverlay = self.scrollLockDisabledOverlay
-        elif key == 0 and not state : self.currentOverlay = None
-
+        if self.latencyProbe is not None : self.latencyProbe.mark('showEntered', key)
         self.overlayFadeIn()
-        self.pixmap = QPixmap(self.currentOverlay)
+        self.pixmap = self.overlayFrames.get((key, state), self.emptyOverlayFrame)
         self.imageOverlay.setPixmap(self.pixmap)
-        self.imageOverlay.setGraphicsEffect(self.imageOpacity)
-
-        cursor_pos = QCursor.pos()
-        screen_number = QApplication.desktop().screenNumber(cursor_pos)
-        screenGeometry = QApplication.desktop().screenGeometry(screen_number)
-        self.move(screenGeometry.left(), screenGeometry.top())
-
-        x, y = self.overlayScreenPosition(self.overlayPositionOnScreen)
+        if self.latencyProbe is not None : self.latencyProbe.mark('pixmapSet')
 
-        centerX = int(screenGeometry.left() + (screenGeometry.width() // x - self.pixmap.width() // 2))
-        centerY = int(screenGeometry.top() + (screenGeometry.height() // y - self.pixmap.height() // 2))
-
-        self.setGeometry(centerX, centerY, self.pixmap.width(), self.pixmap.height())
+        screen = QApplication.screenAt(QCursor.pos()) or QApplication.primaryScreen()
+        if screen not in self.overlayPlacements : self.parsePlacements()
+        screenTopLeft, frameGeometries = self.overlayPlacements[screen]
+        self.move(screenTopLeft)
+        self.setGeometry(frameGeometries[(self.pixmap.width(), self.pixmap.height())])
+        if self.latencyProbe is not None : self.latencyProbe.mark('geometryApplied')
 
         if not self.isHidden() : self.displayTimer.start(self.overlayDisplayTime)
 
+    def parsePlacements(self):
+        x, y = self.overlayScreenPosition(self.overlayPositionOnScreen)
+        frameSizes = {(frame.width(), frame.height()) for frame in self.overlayFrames.values()} | {(0, 0)}
+        self.overlayPlacements = {}
+        for screen in QApplication.screens():
+            screenGeometry = screen.geometry()
+            frameGeometries = {}
+            for width, height in frameSizes:
+                centerX = int(screenGeometry.left() + (screenGeometry.width() // x - width // 2))
+                centerY = int(screenGeometry.top() + (screenGeometry.height() // y - height // 2))
+                frameGeometries[(width, height)] = QRect(centerX, centerY, width, height)
+            self.overlayPlacements[screen] = (screenGeometry.topLeft(), frameGeometries)
+
+    def handleScreenAdded(self, screen):
+        screen.geometryChanged.connect(self.handleScreenChanged)
+        self.handleScreenChanged()
+
+    def handleScreenChanged(self, *args):
+        self.overlayPlacements = {}
+
     def overlayHide(self):
         self.hideTimer.stop()
         self.hide()
@@ -321,17 +405,23 @@ class capsWatcher_Overlay(QWidget):
         self.fadeEffect.setEndValue(1)
         self.fadeEffect.start()
     
-    def treatThemeScheme(self, data, scheme):
-        overlayPath = pathj(self.themeFolder, data[scheme]['overlayPath'])
-        if data[scheme]['numLockSupport']:
-            self.numLockEnabledOverlay = pathj(overlayPath, '1441.png')
-            self.numLockDisabledOverlay = pathj(overlayPath, '1440.png')
-        if data[scheme]['capsLockSupport']:
-            self.capsLockEnabledOverlay = pathj(overlayPath, '201.png')
-            self.capsLockDisabledOverlay = pathj(overlayPath, '200.png')
-        if data[scheme]['scrollLockSupport']:
-            self.scrollLockEnabledOverlay = pathj(overlayPath, '1451.png')
-            self.scrollLockDisabledOverlay = pathj(overlayPath, '1450.png')
+    def treatThemeScheme(self, scheme, themeStamp):
+        overlayFramesKey = (scheme.overlayPath, themeStamp, tuple(supportedKeys(scheme)), self.overlayOpacity)
+        if overlayFramesKey == self.overlayFramesKey : return
+
+        self.overlayFrames = {(keyCode, state): self.bakeOverlayFrame(pathj(scheme.overlayPath, f'{keyCode}{int(state)}.png')) for keyCode in supportedKeys(scheme) for state in [False, True]}
+        self.overlayFramesKey = overlayFramesKey
+        self.pixelCache.prune()
+
+    def bakeOverlayFrame(self, overlayFile):
+        overlayImage = self.pixelCache.load(readThemeFile(overlayFile))
+        frame = QPixmap(overlayImage.size())
+        frame.fill(Qt.transparent)
+        painter = QPainter(frame)
+        painter.setOpacity(self.overlayOpacity)
+        painter.drawImage(0, 0, overlayImage)
+        painter.end()
+        return frame
 
     def showMessageBox(self, title, message, icon):
         msg_box = QMessageBox()
@@ -349,46 +439,433 @@ class capsWatcher_Overlay(QWidget):
         if configRelated == True : os.unlink(self.cfgFilePath)
         sys.exit(1)
 
-class capsWatcher_KeyState(QThread):
+class capsWatcher_pixelCache:
+    # decoded images are stored as raw premultiplied ARGB32 behind a small header, keyed by the hash of the source PNG
+    header = struct.Struct('<4sIIII12x')
+    magic, version = b'CWPX', 1
+
+    def __init__(self, cachePath):
+        self.cachePath = cachePath
+        self.mappings = []
+        self.usedFiles = set()
+
+    def load(self, data:bytes):
+        cacheFile = pathj(self.cachePath, f"{hashlib.sha1(data).hexdigest()}.argb")
+        self.usedFiles.add(cacheFile)
+        image = self.mapImage(cacheFile)
+        if image is not None : return image
+        image = QImage.fromData(data).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        if not image.isNull() : self.storeImage(cacheFile, image)
+        return image
+
+    def mapImage(self, cacheFile):
+        try:
+            with open(cacheFile, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        magic, version, width, height, bytesPerLine = self.header.unpack_from(mapping) if len(mapping) >= self.header.size else (None, None, 0, 0, 0)
+        if magic != self.magic or version != self.version or len(mapping) != self.header.size + height * bytesPerLine:
+            mapping.close()
+            return None
+        # the QImage reads the mapped pages directly, so the mapping stays alive until release()
+        pixels = (ctypes.c_char * (height * bytesPerLine)).from_buffer(mapping, self.header.size)
+        self.mappings.append((mapping, pixels))
+        return QImage(sip.voidptr(ctypes.addressof(pixels)), width, height, bytesPerLine, QImage.Format_ARGB32_Premultiplied)
+
+    def storeImage(self, cacheFile, image:QImage):
+        tempFilePath = f"{cacheFile}.tmp"
+        try:
+            os.makedirs(self.cachePath, exist_ok=True)
+            with open(tempFilePath, 'wb') as f:
+                f.write(self.header.pack(self.magic, self.version, image.width(), image.height(), image.bytesPerLine()))
+                f.write(image.constBits().asstring(image.sizeInBytes()))
+            os.replace(tempFilePath, cacheFile)
+        except OSError : pass
+
+    def prune(self):
+        # only the images loaded since the last prune are kept, edited or abandoned themes leave nothing behind
+        try:
+            with os.scandir(self.cachePath) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.argb', '.argb.tmp')) and entry.path not in self.usedFiles:
+                        try : os.unlink(entry.path)
+                        except OSError : pass
+        except OSError : pass
+        self.usedFiles.clear()
+
+    def release(self):
+        while self.mappings:
+            mapping, pixels = self.mappings.pop()
+            del pixels
+            mapping.close()
+
+class capsWatcher_KeyboardStateSource:
+    def __init__(self):
+        self.keyboardState = bytes(256)
+
+    def readStates(self, keyCodes):
+        # GetKeyState syncs this thread's input state so the batched read below is up to date
+        GetKeyState(0)
+        keyboardState = self.keyboardState = GetKeyboardState()
+        return {keyCode: bool(keyboardState[keyCode] & 1) for keyCode in keyCodes}
+
+    def keyboardActivity(self):
+        # the table entries past the mouse buttons change when a key is held down or pressed, mouse input leaves them alone
+        return self.keyboardState[8:]
+
+class capsWatcher_PollScheduler:
+    def __init__(self, minInterval=10, maxInterval=100, backoff=1.5, fastWindow=1500):
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+        self.fastWindow = fastWindow
+        self.currentInterval = minInterval
+        self.lastActivityTime = time.monotonic() * 1000
+
+    def notifyActivity(self, now):
+        self.lastActivityTime = now
+        self.currentInterval = self.minInterval
+
+    def nextInterval(self, now):
+        # backoff is a multiplier, the pollBackoff setting gives it in percent so 150 makes each idle tick 1.5 times longer
+        if now - self.lastActivityTime >= self.fastWindow:
+            self.currentInterval = min(self.maxInterval, self.currentInterval * self.backoff)
+        return int(self.currentInterval)
+
+def mergeKeyStates(keyCodes, knownStates:dict, source):
+    # keys already tracked keep their last seen state so a toggle made while swapping is still reported
+    missingKeyCodes = [keyCode for keyCode in keyCodes if keyCode not in knownStates]
+    readStates = source.readStates(missingKeyCodes) if missingKeyCodes else {}
+    return {keyCode: knownStates[keyCode] if keyCode in knownStates else readStates[keyCode] for keyCode in keyCodes}
+
+class capsWatcher_KeyStateEngine(QThread):
     stateChanged = pyqtSignal(int, bool)
 
-    def __init__(self, keyName:str):
-        super(capsWatcher_KeyState, self).__init__()
-        self.allowedKeyNames = ["capslock", "numlock", "scrolllock"]
-        self.keyName = keyName.lower()
+    def __init__(self, keyCodes:list, scheduler=None, source=None, currentStates=None):
+        super(capsWatcher_KeyStateEngine, self).__init__()
+        self.allowedKeyCodes = [20, 144, 145]
 
-        if self.keyName not in self.allowedKeyNames:
-            raise SyntaxError(f'The ({keyName}) is not allowed to watch, current supported keyWatches is ("Capslock", "Numlock", "Scrolllock").')
+        if any(keyCode not in self.allowedKeyCodes for keyCode in keyCodes):
+            raise SyntaxError(f'The keys {keyCodes} are not allowed to watch, current supported keyWatches is (20, 144, 145).')
 
-        if self.keyName == self.allowedKeyNames[0] : self.keyCode = 20
-        if self.keyName == self.allowedKeyNames[1] : self.keyCode = 144
-        if self.keyName == self.allowedKeyNames[2] : self.keyCode = 145
+        self.keyCodes = tuple(keyCodes)
+        self.requestedKeyCodes = self.keyCodes
+        self.source = source if source is not None else capsWatcher_KeyboardStateSource()
+        self.scheduler = scheduler if scheduler is not None else capsWatcher_PollScheduler()
+        self.latencyProbe = None
 
-        self.disableKeyEventValues, self.enableKeyEventValues = [-128, 0], [-127, 1]
+        self.currentStates = mergeKeyStates(self.keyCodes, currentStates or {}, self.source)
+        self.currentActivity = self.source.keyboardActivity()
+
+    def setKeyCodes(self, keyCodes:list):
+        if any(keyCode not in self.allowedKeyCodes for keyCode in keyCodes):
+            raise SyntaxError(f'The keys {keyCodes} are not allowed to watch, current supported keyWatches is (20, 144, 145).')
+        # picked up by the polling thread on its next pass, so the swap never races a read
+        self.requestedKeyCodes = tuple(keyCodes)
 
-        self.currentState = True if GetKeyState(self.keyCode) == 1 else False
-        self.handledEvent = False
-    
     def run(self):
         self.stateChanged.emit(0, False)
         self.checkState()
 
     def checkState(self):
-        while True:
-            currentInLoopState = GetKeyState(self.keyCode)
-
-            if currentInLoopState != self.currentState and not self.handledEvent:
-                if currentInLoopState in self.disableKeyEventValues : self.currentState = False
-                elif currentInLoopState in self.enableKeyEventValues : self.currentState = True
-
-                self.handledEvent = True
-                self.stateChanged.emit(self.keyCode, self.currentState)
-
-            elif currentInLoopState == self.currentState and self.handledEvent : self.handledEvent = False
+        while not self.isInterruptionRequested():
+            if self.requestedKeyCodes != self.keyCodes:
+                keyCodes = self.requestedKeyCodes
+                self.currentStates = mergeKeyStates(keyCodes, self.currentStates, self.source)
+                self.keyCodes = keyCodes
+
+            currentInLoopStates = self.source.readStates(self.keyCodes)
+            currentInLoopActivity = self.source.keyboardActivity()
+            detectedAt = time.perf_counter_ns()
+            now = time.monotonic() * 1000
+
+            if currentInLoopStates != self.currentStates:
+                changedKeys = [keyCode for keyCode in self.keyCodes if currentInLoopStates[keyCode] != self.currentStates[keyCode]]
+                self.currentStates = currentInLoopStates
+                self.scheduler.notifyActivity(now)
+                for keyCode in changedKeys : self.emitStateChange(keyCode, currentInLoopStates[keyCode], detectedAt)
+
+            elif currentInLoopActivity != self.currentActivity : self.scheduler.notifyActivity(now)
+
+            self.currentActivity = currentInLoopActivity
+            self.msleep(self.scheduler.nextInterval(now))
+
+    def emitStateChange(self, keyCode, state, detectedAt):
+        if self.latencyProbe is not None : self.latencyProbe.begin(keyCode, detectedAt)
+        self.stateChanged.emit(keyCode, state)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
+
+WM_INPUT_DEVICE_CHANGE, WM_INPUT, WM_WTSSESSION_CHANGE = 0x00FE, 0x00FF, 0x02B1
+NOTIFY_FOR_THIS_SESSION = 0
+RIDEV_REMOVE, RIDEV_INPUTSINK, RIDEV_DEVNOTIFY = 0x0001, 0x0100, 0x2000
+RID_INPUT, RIM_TYPEKEYBOARD, RI_KEY_BREAK = 0x10000003, 1, 1
+
+class RAWINPUTDEVICE(ctypes.Structure):
+    _fields_ = [('usUsagePage', wintypes.USHORT), ('usUsage', wintypes.USHORT), ('dwFlags', wintypes.DWORD), ('hwndTarget', wintypes.HWND)]
+
+class RAWINPUTHEADER(ctypes.Structure):
+    _fields_ = [('dwType', wintypes.DWORD), ('dwSize', wintypes.DWORD), ('hDevice', wintypes.HANDLE), ('wParam', wintypes.WPARAM)]
+
+class RAWKEYBOARD(ctypes.Structure):
+    _fields_ = [('MakeCode', wintypes.USHORT), ('Flags', wintypes.USHORT), ('Reserved', wintypes.USHORT), ('VKey', wintypes.USHORT), ('Message', wintypes.UINT), ('ExtraInformation', wintypes.ULONG)]
+
+class RAWINPUT(ctypes.Structure):
+    _fields_ = [('header', RAWINPUTHEADER), ('keyboard', RAWKEYBOARD)]
+
+class capsWatcher_RawInputFilter(QAbstractNativeEventFilter):
+    def __init__(self, keyState):
+        super(capsWatcher_RawInputFilter, self).__init__()
+        self.keyState = keyState
+
+    def nativeEventFilter(self, eventType, message):
+        if eventType == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_INPUT : self.keyState.handleRawInput(msg.lParam)
+            elif msg.message in [WM_INPUT_DEVICE_CHANGE, WM_WTSSESSION_CHANGE] : self.keyState.syncStates()
+        return False, 0
+
+class capsWatcher_RawInputKeyState(QObject):
+    stateChanged = pyqtSignal(int, bool)
 
-            self.msleep(25)
+    def __init__(self, keyCodes:list, targetWidget:QWidget, source=None, currentStates=None):
+        super(capsWatcher_RawInputKeyState, self).__init__()
+        self.allowedKeyCodes = [20, 144, 145]
+
+        if any(keyCode not in self.allowedKeyCodes for keyCode in keyCodes):
+            raise SyntaxError(f'The keys {keyCodes} are not allowed to watch, current supported keyWatches is (20, 144, 145).')
+
+        self.keyCodes = tuple(keyCodes)
+        self.targetWidget = targetWidget
+        self.source = source if source is not None else capsWatcher_KeyboardStateSource()
+        self.eventFilter = capsWatcher_RawInputFilter(self)
+        self.pressedKeys = set()
+        self.user32 = None
+        self.latencyProbe = None
+
+        self.currentStates = mergeKeyStates(self.keyCodes, currentStates or {}, self.source)
+
+    def setKeyCodes(self, keyCodes:list):
+        if any(keyCode not in self.allowedKeyCodes for keyCode in keyCodes):
+            raise SyntaxError(f'The keys {keyCodes} are not allowed to watch, current supported keyWatches is (20, 144, 145).')
+        self.currentStates = mergeKeyStates(keyCodes, self.currentStates, self.source)
+        self.keyCodes = tuple(keyCodes)
+        self.pressedKeys &= set(self.keyCodes)
+
+    def start(self):
+        self.user32 = ctypes.windll.user32
+        self.user32.RegisterRawInputDevices.argtypes = [ctypes.POINTER(RAWINPUTDEVICE), wintypes.UINT, wintypes.UINT]
+        self.user32.GetRawInputData.argtypes = [wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p, ctypes.POINTER(wintypes.UINT), wintypes.UINT]
+        self.user32.GetRawInputData.restype = wintypes.UINT
+
+        self.wtsapi32 = ctypes.windll.wtsapi32
+        self.wtsapi32.WTSRegisterSessionNotification.argtypes = [wintypes.HWND, wintypes.DWORD]
+        self.wtsapi32.WTSUnRegisterSessionNotification.argtypes = [wintypes.HWND]
+
+        self.targetHwnd = int(self.targetWidget.winId())
+        device = RAWINPUTDEVICE(0x01, 0x06, RIDEV_INPUTSINK | RIDEV_DEVNOTIFY, self.targetHwnd)
+        if not self.user32.RegisterRawInputDevices(ctypes.byref(device), 1, ctypes.sizeof(device)) : raise ctypes.WinError()
+        self.wtsapi32.WTSRegisterSessionNotification(self.targetHwnd, NOTIFY_FOR_THIS_SESSION)
+
+        QApplication.instance().installNativeEventFilter(self.eventFilter)
+        self.stateChanged.emit(0, False)
+        self.syncStates()
+
+    def stop(self):
+        if self.user32 is None : return
+        QApplication.instance().removeNativeEventFilter(self.eventFilter)
+        self.wtsapi32.WTSUnRegisterSessionNotification(self.targetHwnd)
+        device = RAWINPUTDEVICE(0x01, 0x06, RIDEV_REMOVE, None)
+        self.user32.RegisterRawInputDevices(ctypes.byref(device), 1, ctypes.sizeof(device))
+
+    def syncStates(self):
+        self.pressedKeys.clear()
+        currentStates = self.source.readStates(self.keyCodes)
+        detectedAt = time.perf_counter_ns()
+        changedKeys = [keyCode for keyCode in self.keyCodes if currentStates[keyCode] != self.currentStates[keyCode]]
+        self.currentStates = currentStates
+        for keyCode in changedKeys : self.emitStateChange(keyCode, currentStates[keyCode], detectedAt)
+
+    def emitStateChange(self, keyCode, state, detectedAt):
+        if self.latencyProbe is not None : self.latencyProbe.begin(keyCode, detectedAt)
+        self.stateChanged.emit(keyCode, state)
+
+    def handleRawInput(self, rawInputHandle):
+        rawInput = RAWINPUT()
+        rawInputSize = wintypes.UINT(ctypes.sizeof(rawInput))
+        if self.user32.GetRawInputData(rawInputHandle, RID_INPUT, ctypes.byref(rawInput), ctypes.byref(rawInputSize), ctypes.sizeof(RAWINPUTHEADER)) == wintypes.UINT(-1).value : return
+        if rawInput.header.dwType != RIM_TYPEKEYBOARD : return
+
+        self.handleKeyEvent(rawInput.keyboard.VKey, bool(rawInput.keyboard.Flags & RI_KEY_BREAK))
+
+    def handleKeyEvent(self, keyCode, released=False):
+        if keyCode not in self.keyCodes : return
+        if released:
+            self.pressedKeys.discard(keyCode)
+        elif keyCode not in self.pressedKeys:
+            detectedAt = time.perf_counter_ns()
+            self.pressedKeys.add(keyCode)
+            self.currentStates[keyCode] = not self.currentStates[keyCode]
+            self.emitStateChange(keyCode, self.currentStates[keyCode], detectedAt)
+
+class capsWatcher_LatencyProbe(QObject):
+    stages = ['detected', 'emitted', 'showEntered', 'pixmapSet', 'geometryApplied', 'firstPaint', 'fadeComplete']
+
+    def __init__(self, overlay:QWidget, sampleSize:int=4096):
+        super(capsWatcher_LatencyProbe, self).__init__()
+        self.histograms = {stage: deque(maxlen=sampleSize) for stage in self.stages[1:]}
+        self.pendingEvents = {}
+        self.currentEvent = None
+        overlay.installEventFilter(self)
+        self.fadeConnection = overlay.fadeEffect.finished.connect(lambda: self.mark('fadeComplete'))
+
+    def detach(self, overlay:QWidget):
+        overlay.removeEventFilter(self)
+        overlay.fadeEffect.finished.disconnect(self.fadeConnection)
+
+    def begin(self, keyCode, detectedAt):
+        self.pendingEvents[keyCode] = {'detected': detectedAt, 'emitted': time.perf_counter_ns()}
+
+    def mark(self, stage, keyCode=None):
+        if stage == 'showEntered':
+            if self.currentEvent is not None : self.record(self.currentEvent)
+            self.currentEvent = self.pendingEvents.pop(keyCode, None)
+        if self.currentEvent is not None and stage not in self.currentEvent:
+            self.currentEvent[stage] = time.perf_counter_ns()
+            if stage == 'fadeComplete':
+                self.record(self.currentEvent)
+                self.currentEvent = None
+
+    def record(self, event):
+        for stage in self.stages[1:]:
+            if stage in event : self.histograms[stage].append((event[stage] - event['detected']) / 1e6)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.currentEvent is not None and 'geometryApplied' in self.currentEvent : self.mark('firstPaint')
+        return False
+
+    def report(self):
+        report = {}
+        for stage, samples in self.histograms.items():
+            values = sorted(samples)
+            percentile = lambda p: round(values[min(len(values) - 1, int(len(values) * p))], 3) if values else None
+            report[stage] = {"count": len(values), "p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99), "max": round(values[-1], 3) if values else None}
+        return report
+
+class capsWatcher_TraceKeySource(QObject):
+    keyPressed = pyqtSignal(int)
+    finished = pyqtSignal()
+
+    def __init__(self, traceFile:str, speed:float=1.0):
+        super(capsWatcher_TraceKeySource, self).__init__()
+        with open(traceFile, encoding='utf-8') as f:
+            self.trace = sorted((json.loads(line) for line in f if line.strip()), key=lambda event: event['t'])
+        self.speed = speed
+        self.states = {20: False, 144: False, 145: False}
+        self.activity = 0
+        self.toggles = []
+
+        self.playTimer = QTimer(self)
+        self.playTimer.setSingleShot(True)
+        self.playTimer.setTimerType(Qt.PreciseTimer)
+        self.playTimer.timeout.connect(self.playNext)
+
+    def readStates(self, keyCodes):
+        states = self.states
+        return {keyCode: states[keyCode] for keyCode in keyCodes}
+
+    def keyboardActivity(self):
+        return self.activity
+
+    def play(self):
+        self.playIndex = 0
+        self.playStart = time.perf_counter()
+        self.scheduleNext()
+
+    def scheduleNext(self):
+        if self.playIndex >= len(self.trace):
+            self.finished.emit()
+            return
+        due = self.playStart + self.trace[self.playIndex]['t'] / 1000 / self.speed
+        self.playTimer.start(max(0, int((due - time.perf_counter()) * 1000)))
+
+    def playNext(self):
+        keyCode = int(self.trace[self.playIndex]['key'])
+        states = dict(self.states)
+        states[keyCode] = not states[keyCode]
+        self.toggles.append((keyCode, states[keyCode], time.perf_counter()))
+        self.states = states
+        self.activity += 1
+        self.keyPressed.emit(keyCode)
+        self.playIndex += 1
+        self.scheduleNext()
+
+class capsWatcher_TraceReplay(QObject):
+    def __init__(self, overlay:QWidget, source:capsWatcher_TraceKeySource, reportFile:str):
+        super(capsWatcher_TraceReplay, self).__init__()
+        self.overlay = overlay
+        self.source = source
+        self.reportFile = reportFile
+        self.detections = []
+        self.renders = []
+        self.connections = []
+        overlay.installEventFilter(self)
+        self.source.finished.connect(lambda: QTimer.singleShot(1000, self.writeReport))
+
+    def attach(self, keyStateEngine):
+        for connection in self.connections : self.source.keyPressed.disconnect(connection)
+        self.backend = type(keyStateEngine).__name__
+        keyStateEngine.stateChanged.connect(self.handleDetected, Qt.DirectConnection)
+        if isinstance(keyStateEngine, QThread):
+            self.connections = []
+            keyStateEngine.start()
+        else:
+            self.connections = [
+                self.source.keyPressed.connect(lambda keyCode: keyStateEngine.handleKeyEvent(keyCode, released=False)),
+                self.source.keyPressed.connect(lambda keyCode: keyStateEngine.handleKeyEvent(keyCode, released=True))
+            ]
+            keyStateEngine.syncStates()
+
+    def play(self):
+        self.source.play()
+
+    def handleDetected(self, key, state):
+        if key != 0 : self.detections.append((key, state, time.perf_counter()))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint : self.renders.append(time.perf_counter())
+        return False
+
+    def writeReport(self):
+        events, detectionIndex, renderIndex = [], 0, 0
+        for keyCode, state, toggledAt in self.source.toggles:
+            if keyCode not in self.overlay.overlayKeysToWatch : continue
+            event = {"key": keyCode, "state": state, "at": round((toggledAt - self.source.playStart) * 1000, 3), "detectionLatency": None, "renderLatency": None}
+            while detectionIndex < len(self.detections) and self.detections[detectionIndex][2] < toggledAt : detectionIndex += 1
+            candidate = next((detection for detection in self.detections[detectionIndex:] if detection[:2] == (keyCode, state)), None)
+            if candidate is not None:
+                event["detectionLatency"] = round((candidate[2] - toggledAt) * 1000, 3)
+                while renderIndex < len(self.renders) and self.renders[renderIndex] < candidate[2] : renderIndex += 1
+                if renderIndex < len(self.renders) : event["renderLatency"] = round((self.renders[renderIndex] - candidate[2]) * 1000, 3)
+            events.append(event)
+
+        summary = {"backend": self.backend, "speed": self.source.speed, "events": len(events), "missed": sum(1 for event in events if event["detectionLatency"] is None)}
+        for metric in ["detectionLatency", "renderLatency"]:
+            values = sorted(event[metric] for event in events if event[metric] is not None)
+            if values : summary[metric] = {"mean": round(sum(values) / len(values), 3), "p95": values[min(len(values) - 1, int(len(values) * 0.95))], "max": values[-1]}
+
+        with open(self.reportFile, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "events": events}, f, indent=4)
+        print(json.dumps(summary))
+        QApplication.instance().quit()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    capsWatcher_Overlay().show()
+    if startupTrace is not None : startupTrace.mark('application')
+    overlay = capsWatcher_Overlay()
+    if startupTrace is not None : startupTrace.watch(overlay)
+    overlay.show()
     sys.exit(app.exec_())
\ No newline at end of file
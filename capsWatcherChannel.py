@@ -0,0 +1,57 @@
+from PyQt5.QtCore import QObject, QDir, QLockFile
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from ctypes import wintypes
+import os, ctypes, getpass
+
+def channelName(application='capsWatcher'):
+    sessionId = wintypes.DWORD()
+    ctypes.windll.kernel32.ProcessIdToSessionId(os.getpid(), ctypes.byref(sessionId))
+    return f"{application}-{getpass.getuser()}-{sessionId.value}"
+
+def sendCommand(command, application='capsWatcher', timeout=500):
+    socket = QLocalSocket()
+    socket.connectToServer(channelName(application))
+    if not socket.waitForConnected(timeout) : return None
+    socket.write(f"{command}\n".encode('utf-8'))
+    socket.waitForBytesWritten(timeout)
+    while not socket.canReadLine():
+        if not socket.waitForReadyRead(timeout) : return None
+    reply = bytes(socket.readLine()).decode('utf-8').strip()
+    socket.disconnectFromServer()
+    return reply
+
+def acquireInstanceLock(application='capsWatcher'):
+    lockFile = QLockFile(os.path.join(QDir.tempPath(), f"{channelName(application)}.lock"))
+    if lockFile.tryLock(0) : return lockFile
+    sendCommand('activate', application)
+    return None
+
+class capsWatcher_commandServer(QObject):
+    def __init__(self, handlers:dict, application='capsWatcher'):
+        super(capsWatcher_commandServer, self).__init__()
+        self.handlers = handlers
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.handleConnection)
+        self.name = channelName(application)
+
+    def listen(self):
+        return self.server.listen(self.name)
+
+    def handleConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.handleCommand(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            if socket.canReadLine() : self.handleCommand(socket)
+
+    def handleCommand(self, socket):
+        while socket.canReadLine():
+            command = bytes(socket.readLine()).decode('utf-8').strip()
+            handler = self.handlers.get(command)
+            reply, afterReply = handler() if handler is not None else ("error unknown command", None)
+            socket.write(f"{reply}\n".encode('utf-8'))
+            socket.flush()
+            if afterReply is not None:
+                socket.waitForBytesWritten(500)
+                afterReply()
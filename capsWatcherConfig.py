@@ -0,0 +1,103 @@
+from configparser import ConfigParser
+from capsWatcherThemes import themeSource
+import os
+
+settingsFields = (
+    ('displayTime', 'overlay', 'displayTime', int, '1500'),
+    ('opacity', 'overlay', 'opacity', int, '95'),
+    ('fadeEffectTime', 'overlay', 'fadeEffectTime', int, '150'),
+    ('positionOnScreen', 'overlay', 'positionOnScreen', int, '4'),
+    ('theme', 'overlay', 'theme', str, 'elegant'),
+    ('colorScheme', 'overlay', 'colorScheme', int, '2'),
+    ('keysToWatch', 'overlay', 'keysToWatch', lambda value: tuple(map(int, value.split(','))), '20,144,145'),
+    ('keyStateBackend', 'overlay', 'keyStateBackend', int, '1'),
+    ('pollMinInterval', 'overlay', 'pollMinInterval', int, '10'),
+    ('pollMaxInterval', 'overlay', 'pollMaxInterval', int, '100'),
+    ('pollBackoff', 'overlay', 'pollBackoff', int, '150'),
+    ('pollFastWindow', 'overlay', 'pollFastWindow', int, '1500'),
+    ('runAtStartup', 'settings', 'runAtStartup', lambda value: bool(int(value)), '1'),
+    ('trayIcon', 'settings', 'trayIcon', lambda value: bool(int(value)), '1'),
+    ('language', 'settings', 'language', str, 'en-US'),
+    ('checkForUpdates', 'settings', 'checkForUpdates', lambda value: bool(int(value)), '1'),
+    ('diagnostics', 'settings', 'diagnostics', lambda value: bool(int(value)), '0'),
+)
+
+settingsRules = (
+    (lambda settings, paths: 500 <= settings.displayTime <= 2000,
+        lambda settings: "Display Time not in allowed range (500, 2000)."),
+    (lambda settings, paths: 10 <= settings.opacity <= 100,
+        lambda settings: "Opacity value not in allowed range (10, 100)."),
+    (lambda settings, paths: 50 <= settings.fadeEffectTime <= 500,
+        lambda settings: "Fade Time value not in allowed range (50, 500)."),
+    (lambda settings, paths: settings.positionOnScreen in (0, 1, 2, 3, 4, 5),
+        lambda settings: "Position on screen value not in allowed options (0, 1, 2, 3, 4, 5)."),
+    (lambda settings, paths: bool(settings.theme) and os.path.exists(themeSource(paths['themes'], settings.theme)),
+        lambda settings: f"The theme file '{settings.theme}.json' is not found or is corrupted."),
+    (lambda settings, paths: settings.colorScheme in (0, 1, 2),
+        lambda settings: "Color scheme not in allowed options (0, 1, 2)"),
+    (lambda settings, paths: all(item in (20, 144, 145) for item in settings.keysToWatch),
+        lambda settings: f"Invalid key {list(settings.keysToWatch)} to define to capsWatcher, supported keys is (20, 144, 145)"),
+    (lambda settings, paths: settings.keyStateBackend in (0, 1),
+        lambda settings: "Key state backend not in allowed options (0, 1)."),
+    (lambda settings, paths: 5 <= settings.pollMinInterval <= settings.pollMaxInterval <= 1000,
+        lambda settings: "Poll intervals not in allowed range (5 <= min <= max <= 1000)."),
+    (lambda settings, paths: 100 <= settings.pollBackoff <= 400,
+        lambda settings: "Poll backoff value not in allowed range (100, 400)."),
+    (lambda settings, paths: 0 <= settings.pollFastWindow <= 10000,
+        lambda settings: "Poll fast window value not in allowed range (0, 10000)."),
+    (lambda settings, paths: 'languages' not in paths or (bool(settings.language) and os.path.exists(os.path.join(paths['languages'], f"{settings.language}.json"))),
+        lambda settings: f"The language file '{settings.language}.json' is not found or is corrupted."),
+)
+
+settingsCache = {}
+
+def defaultConfig():
+    configParser = ConfigParser()
+    for attribute, section, key, convert, default in settingsFields:
+        if not configParser.has_section(section) : configParser.add_section(section)
+        configParser.set(section, key, default)
+    return configParser
+
+class capsWatcher_settings:
+    __slots__ = tuple(field[0] for field in settingsFields) + ('raw', 'stamp')
+
+    def __init__(self, raw:dict, stamp=None):
+        self.raw = raw
+        self.stamp = stamp
+        for attribute, section, key, convert, default in settingsFields:
+            value = raw.get(section, {}).get(key.lower(), default)
+            try : setattr(self, attribute, convert(value))
+            except ValueError : raise ValueError(f"Invalid value '{value}' for '{key}' in section [{section}].")
+
+    def validate(self, themesPath, languagesPath=None):
+        paths = {'themes': themesPath}
+        if languagesPath is not None : paths['languages'] = languagesPath
+        for check, message in settingsRules:
+            if not check(self, paths) : return message(self)
+        return None
+
+    def diff(self, other):
+        return {field[0] for field in settingsFields if getattr(self, field[0]) != getattr(other, field[0])}
+
+def fileStamp(configFilePath):
+    stat = os.stat(configFilePath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def loadSettings(configFilePath):
+    stamp = fileStamp(configFilePath)
+    cached = settingsCache.get(configFilePath)
+    if cached is not None and cached.stamp == stamp : return cached
+    configParser = ConfigParser()
+    configParser.read(configFilePath, encoding='utf-8')
+    raw = {section: dict(configParser.items(section)) for section in configParser.sections()}
+    settings = capsWatcher_settings(raw, stamp)
+    settingsCache[configFilePath] = settings
+    return settings
+
+def writeConfig(configFilePath, configParser):
+    tempFilePath = f"{configFilePath}.tmp"
+    with open(tempFilePath, 'w', encoding='utf-8') as f:
+        configParser.write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tempFilePath, configFilePath)
@@ -1,16 +1,25 @@
+from capsWatcherStartup import startupTrace, capsWatcher_lazyModule
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import QMainWindow, QApplication, QInputDialog, QMessageBox, QGraphicsOpacityEffect, QFileDialog
 from PyQt5.QtGui import QIcon, QPixmap
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from winreg import OpenKey, SetValueEx, QueryValueEx, DeleteValue, REG_SZ, KEY_ALL_ACCESS, HKEY_CURRENT_USER
 from datetime import datetime
-import capsWatcherResources, sys, os, subprocess, configparser, json, psutil, time, pywinstyles, pathlib, zipfile, requests, webbrowser
+from capsWatcherChannel import capsWatcher_commandServer, sendCommand, acquireInstanceLock
+from capsWatcherConfig import defaultConfig, loadSettings, writeConfig
+from capsWatcherThemes import capsWatcher_themeCatalog, capsWatcher_themeRepository, capsWatcher_themeBundle, supportedKeys, readThemeFile, releaseBundles, validateBundle
+import capsWatcherResources, sys, os, subprocess, configparser, json, hashlib, pathlib, zipfile
+requests, webbrowser, pywinstyles, psutil = map(capsWatcher_lazyModule, ['requests', 'webbrowser', 'pywinstyles', 'psutil'])
 
 appVersion = [1, 0, 1, 9]
+capsWatcherResources.registerResources('capsWatcher')
 
 class capsWatcher_configInterface(QMainWindow):
     def __init__(self):
         super().__init__()
+        if startupTrace is not None:
+            startupTrace.instrument(self, ['checkForExistingProcess', 'parsePaths', 'parseLanguages', 'parseThemes', 'parseConfig', 'configureInterface'])
+            startupTrace.instrument(capsWatcher_uiElements, ['setupUi'])
 
         self.messageBox = QMessageBox()
         
@@ -19,6 +28,9 @@ class capsWatcher_configInterface(QMainWindow):
         self.ui = capsWatcher_uiElements()
         self.ui.setupUi(self)
 
+        self.commandServer = capsWatcher_commandServer({'ping': lambda: ("pong", None), 'activate': lambda: ("ok", self.handleActivate)}, application='capsWatcherInterface')
+        self.commandServer.listen()
+
         self.currentScheme = None
         self.currentDirectory = None
         self.darkModeSupport = None
@@ -29,6 +41,11 @@ class capsWatcher_configInterface(QMainWindow):
         self.scrollLockSupport = ['Scroll Lock', None]
 
         self.parsePaths()
+        self.settingsStore = capsWatcher_settingsStore(self.configFilePath)
+        self.settingsStore.flushFailed.connect(self.handleFlushFailed)
+        self.themeCatalog = capsWatcher_themeCatalog(self.themesPath, os.path.join(self.configPath, 'capsWatcherThemes.json'))
+        self.themeRepository = capsWatcher_themeRepository(self.themeCatalog)
+        self.languageIndex = capsWatcher_languageIndex(self.languagesPath, os.path.join(self.configPath, 'capsWatcherLanguages.json'))
         self.parseLanguages()
         self.parseThemes()
         self.parseConfig()
@@ -40,7 +57,8 @@ class capsWatcher_configInterface(QMainWindow):
         self.processWatcherThread.processData.connect(self.handleProcessWatcher)
         self.processWatcherThread.start()
 
-        self.monitorConfigFile = capsWatcher_monitorConfigFile()
+        self.settingsStore.flush()
+        self.monitorConfigFile = capsWatcher_monitorConfigFile(self.configFilePath)
         self.monitorConfigFile.needReload.connect(self.handleFileModified)
         self.monitorConfigFile.start()
 
@@ -55,59 +73,38 @@ class capsWatcher_configInterface(QMainWindow):
         self.configFilePath = os.path.join(self.configPath, 'capsWatcher.cfg')
         self.themesPath = os.path.join(self.currentDirectory, 'themes')
         self.languagesPath = os.path.join(self.currentDirectory, 'languages')
+        # created here so the theme and language indexes can be saved on the very first launch
+        if not os.path.exists(self.configPath): os.mkdir(self.configPath)
     
     def parseConfig(self):
-        self.configParser = configparser.ConfigParser()
-
-        if not os.path.exists(self.configPath): os.mkdir(self.configPath)
         if not os.path.exists(self.configFilePath):
-            self.configParser.add_section('overlay')
-            self.configParser.set('overlay', 'displayTime', '1500')
-            self.configParser.set('overlay', 'opacity', '95')
-            self.configParser.set('overlay', 'fadeEffectTime', '150')
-            self.configParser.set('overlay', 'positionOnScreen', '4')
-            self.configParser.set('overlay', 'theme', 'elegant')
-            self.configParser.set('overlay', 'colorScheme', '2')
-            self.configParser.set('overlay', 'keysToWatch', '20,144,145')
-            self.configParser.add_section('settings')
-            self.configParser.set('settings', 'runAtStartup', '1')
-            self.configParser.set('settings', 'trayIcon', '1')
-            self.configParser.set('settings', 'language', 'en-US')
-            self.configParser.set('settings', 'checkForUpdates', '1')
-            with open(self.configFilePath, 'w') as f:
-                self.configParser.write(f)
-                f.close()
+            self.configParser = defaultConfig()
+            self.settingsStore.load(self.configParser)
+            self.settingsStore.flush(force=True)
             self.handleRunAtStart(2)
 
-        self.configParser.read(self.configFilePath)
-
-        if self.handleRunAtStart(getKeyStatus=True) == '1' : self.modifyConfig('settings', 'runAtStartup', '1')
-        else : self.modifyConfig('settings', 'runAtStartup', '0')
-
-        self.overlayDisplayTime = int(self.configParser.get('overlay', 'displayTime'))
-        self.overlayOpacity = int(self.configParser.get('overlay', 'opacity'))
-        self.overlayFadeEffectTime = int(self.configParser.get('overlay', 'fadeEffectTime'))
-        self.overlayPositionOnScreen = int(self.configParser.get('overlay', 'positionOnScreen'))
-        self.overlayTheme = self.configParser.get('overlay', 'theme')
-        self.currentThemeFile = os.path.join(os.path.join(self.themesPath, self.overlayTheme), f"{self.overlayTheme}.json")
-        self.currentThemeExists = os.path.exists(self.currentThemeFile)
-        self.overlayColorScheme = int(self.configParser.get('overlay', 'colorScheme'))
-        self.overlayKeysToWatch = list(map(int, self.configParser.get('overlay', 'keysToWatch').split(',')))
-        self.settingsRunAtStartup = bool(int(self.configParser.get('settings', 'runAtStartup')))
-        self.settingsTrayIcon = bool(int(self.configParser.get('settings', 'trayIcon')))
-        self.settingsLanguage = self.configParser.get('settings', 'language')
-        self.currentLanguageFile = os.path.join(self.languagesPath, f"{self.settingsLanguage}.json")
-        self.currentLanguageExists = os.path.exists(self.currentLanguageFile)
-        self.settingsCheckForUpdates = bool(int(self.configParser.get('settings', 'checkForUpdates')))
-
-        if not 500 <= self.overlayDisplayTime <= 2000 : self.appException("Unable to load configuration file.", "Display Time not in allowed range (500, 2000).", configRelated=True)
-        if not 10 <= self.overlayOpacity <= 100 : self.appException("Unable to load configuration file.", "Opacity value not in allowed range (10, 100).", configRelated=True)
-        if not 50 <= self.overlayFadeEffectTime <= 500 : self.appException("Unable to load configuration file.", "Fade Time value not in allowed range (50, 500).", configRelated=True)
-        if self.overlayPositionOnScreen not in [0, 1, 2, 3, 4, 5] : self.appException("Unable to load configuration file.", "Position on screen value not in allowed options (0, 1, 2, 3, 4, 5).", configRelated=True)
-        if not self.overlayTheme or not self.currentThemeExists : self.appException("Unable to load configuration file.", f"The theme file '{self.overlayTheme}.json' is not found or is corrupted.", configRelated=True)
-        if self.overlayColorScheme not in [0, 1, 2] : self.appException("Unable to load configuration file.", "Color scheme not in allowed options (0, 1, 2)", configRelated=True)
-        if any(item not in [20,144,145] for item in self.overlayKeysToWatch) : self.appException("Unable to load configuration file.", f"Invalid key {[x for x in self.overlayKeysToWatch]} to define to capsWatcher, supported keys is (20, 144, 145)", configRelated=True)
-        if not self.settingsLanguage or not self.currentLanguageExists : self.appException("Unable to load configuration file.", f"The language file '{self.settingsLanguage}.json' is not found or is corrupted.", configRelated=True)
+        try : settings = loadSettings(self.configFilePath)
+        except ValueError as error : self.appException("Unable to load configuration file.", str(error), configRelated=True)
+        self.configParser = configparser.ConfigParser()
+        self.configParser.read_dict(settings.raw)
+        self.settingsStore.load(self.configParser)
+
+        self.settingsRunAtStartup = self.handleRunAtStart(getKeyStatus=True) == '1'
+        self.modifyConfig('settings', 'runAtStartup', '1' if self.settingsRunAtStartup else '0')
+
+        self.overlayDisplayTime = settings.displayTime
+        self.overlayOpacity = settings.opacity
+        self.overlayFadeEffectTime = settings.fadeEffectTime
+        self.overlayPositionOnScreen = settings.positionOnScreen
+        self.overlayTheme = settings.theme
+        self.overlayColorScheme = settings.colorScheme
+        self.overlayKeysToWatch = list(settings.keysToWatch)
+        self.settingsTrayIcon = settings.trayIcon
+        self.settingsLanguage = settings.language
+        self.settingsCheckForUpdates = settings.checkForUpdates
+
+        error = settings.validate(self.themesPath, self.languagesPath)
+        if error is not None : self.appException("Unable to load configuration file.", error, configRelated=True)
 
         self.parseTranslation()
 
@@ -130,32 +127,25 @@ class capsWatcher_configInterface(QMainWindow):
 
     def parseThemes(self):
         self.ui.themeComboBox.clear()
-        if len(os.listdir(self.themesPath)) < 1: 
+        themes = self.themeCatalog.themes()
+        if len(themes) < 1: 
                 self.appException(self.appLang["UNABLE_TO_LOAD_THEMES"], self.appLang["UNABLE_TO_LOAD_THEMES_TEXT"].format(self.themesPath))
-        for folder in os.listdir(self.themesPath):
-            themeFolder = os.path.join(self.themesPath, folder)
-            themeFile = os.path.join(themeFolder, f"{folder}.json")
-            if os.path.exists(themeFile):
-                try:
-                    data = json.load(open(themeFile, encoding='utf-8'))
-                    lightMode = data['lightMode']['isSupported']
-                    darkMode = data['darkMode']['isSupported']
-                    if darkMode and lightMode : visualName = data['name']
-                    elif not darkMode and lightMode: visualName = f'{data["name"]} ({self.appLang["LIGHT_MODE_ONLY"]})'
-                    elif darkMode and not lightMode : visualName = f'{data["name"]} ({self.appLang["DARK_MODE_ONLY"]})'
-                    elif not darkMode and not lightMode : continue
-                    self.ui.themeComboBox.addItem(visualName, userData=data['theme'])
-                except ValueError : pass
+        for manifest in themes:
+            lightMode = manifest.lightMode.isSupported
+            darkMode = manifest.darkMode.isSupported
+            if darkMode and lightMode : visualName = manifest.name
+            elif not darkMode and lightMode: visualName = f'{manifest.name} ({self.appLang["LIGHT_MODE_ONLY"]})'
+            elif darkMode and not lightMode : visualName = f'{manifest.name} ({self.appLang["DARK_MODE_ONLY"]})'
+            elif not darkMode and not lightMode : continue
+            self.ui.themeComboBox.addItem(visualName, userData=manifest.theme)
     
     def parseLanguages(self):
         self.ui.languageBoxComboBox.clear()
-        if len(os.listdir(self.languagesPath)) < 1: 
+        languages = self.languageIndex.languages()
+        if len(languages) < 1: 
                 self.appException('Failed to load language files', f"There are no languages files installed to use capsWatcher, please try again or reinstall the software.")
-        for languageFile in os.listdir(self.languagesPath):
-            try:
-                languageFileStrings = json.load(open(os.path.join(self.languagesPath, languageFile), encoding='utf-8'))
-                self.ui.languageBoxComboBox.addItem(languageFileStrings["LANGUAGE_DESCRIPTION"], userData=languageFileStrings["LANGUAGE_SHORTNAME"])
-            except ValueError : pass
+        for shortName, description in languages:
+            self.ui.languageBoxComboBox.addItem(description, userData=shortName)
     
     def parseKeyToWatch(self):
         checkBoxList = [self.ui.numLockCheckBox, self.ui.capsLockCheckBox, self.ui.scrollLockCheckBox]
@@ -179,29 +169,26 @@ class capsWatcher_configInterface(QMainWindow):
             [self.treatCheckBox(key, disabled=False) for key in enabledCheckBox]
 
     def parsePreviewImage(self):
-        themeData = json.load(open(self.currentThemeFile, encoding='utf-8'))
-        themeFolder = os.path.join(self.themesPath, self.overlayTheme)
-        if (self.currentScheme == 1 and not themeData['lightMode']['isSupported']) or (self.currentScheme == 0 and themeData['darkMode']['isSupported']):
-            themeSchemeFolder = os.path.join(themeFolder, themeData['darkMode']['overlayPath'])
-        elif (self.currentScheme == 0 and not themeData['darkMode']['isSupported']) or (self.currentScheme == 1 and themeData['lightMode']['isSupported']):
-            themeSchemeFolder = os.path.join(themeFolder, themeData['lightMode']['overlayPath'])
-
-        previewCandidates = [os.path.join(themeSchemeFolder, '200.png'), os.path.join(themeSchemeFolder, '1440.png'), os.path.join(themeSchemeFolder, '1450.png')]
-
-        for overlayPath in previewCandidates:
-            if os.path.exists(overlayPath):
-                self.previewImage = overlayPath
+        manifest = self.themeRepository.get(self.overlayTheme)
+        if (self.currentScheme == 1 and not manifest.lightMode.isSupported) or (self.currentScheme == 0 and manifest.darkMode.isSupported):
+            themeScheme = manifest.darkMode
+        elif (self.currentScheme == 0 and not manifest.darkMode.isSupported) or (self.currentScheme == 1 and manifest.lightMode.isSupported):
+            themeScheme = manifest.lightMode
+
+        for keyCode in [20, 144, 145]:
+            if keyCode in supportedKeys(themeScheme):
+                self.previewImage = os.path.join(themeScheme.overlayPath, f'{keyCode}0.png')
                 break
             
-        overlayPreviewPixmap = QPixmap(self.previewImage)
+        overlayPreviewPixmap = QPixmap()
+        overlayPreviewPixmap.loadFromData(readThemeFile(self.previewImage))
+        releaseBundles()
         self.imageOpacity = QGraphicsOpacityEffect()
         self.ui.previewBoxIconLabel.setPixmap(overlayPreviewPixmap)
 
     def parseTranslation(self):
         self.ui.languageBoxComboBox.setCurrentIndex(self.ui.languageBoxComboBox.findData(self.settingsLanguage))
-        with open(self.currentLanguageFile, "r", encoding="utf-8") as languageFile:
-            self.appLang = json.load(languageFile)
-            languageFile.close()
+        self.appLang = self.languageIndex.strings(self.settingsLanguage)
         self.ui.opacityBox.setTitle(self.appLang["OPACITY"])
         self.ui.displayTimeBox.setTitle(self.appLang["DISPLAY_TIME"])
         self.ui.colorSchemeBox.setTitle(self.appLang["COLOR_SCHEME"])
@@ -310,23 +297,21 @@ class capsWatcher_configInterface(QMainWindow):
         currentData = self.ui.themeComboBox.currentData()
         if self.overlayTheme != currentData:
             self.overlayTheme = currentData
-            self.currentThemeFile = os.path.join(os.path.join(self.themesPath, self.overlayTheme), f"{self.overlayTheme}.json")
-            self.currentThemeExists = os.path.exists(self.currentThemeFile)
             self.handleColorScheme()
             self.modifyConfig('overlay', 'theme', str(currentData))
     
     def handleThemeInfo(self, event=None):
-        themeData = json.load(open(self.currentThemeFile, encoding='utf-8'))
+        manifest = self.themeRepository.get(self.overlayTheme)
         darkModeKeys = self.treatKeyWatchBasedOnTheme('darkMode', listKeys=True)
         lightModeKeys = self.treatKeyWatchBasedOnTheme('lightMode', listKeys=True)
-        createdDate = datetime.strptime(themeData['creation_date'], '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y at %I:%M:%S%p')
+        createdDate = datetime.strptime(manifest.creationDate, '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y at %I:%M:%S%p')
         infoString = f"""
             <span style="font-size:20px;">
-                {themeData['name']} {self.appLang["BY"]} {themeData['creator']}
+                {manifest.name} {self.appLang["BY"]} {manifest.creator}
             </span>
             <br />
             <span style="font-size:16px;">
-                {themeData['description']}
+                {manifest.description}
             </span>
             <br />
             <br />
@@ -334,8 +319,8 @@ class capsWatcher_configInterface(QMainWindow):
                 {self.appLang["CREATOR_GITHUB_PROFILE"]}
             </b>
             <br />
-            <a style="color:#00a2ff;" href="https://github.com/{themeData['github_user']}">
-                https://github.com/{themeData['github_user']}
+            <a style="color:#00a2ff;" href="https://github.com/{manifest.githubUser}">
+                https://github.com/{manifest.githubUser}
             </a>
             <br />
             <br />
@@ -344,7 +329,7 @@ class capsWatcher_configInterface(QMainWindow):
             <b>{self.appLang["CREATED_AT"]}</b><br />
             {createdDate}<br />
             """+"&nbsp;"*150
-        self.showMessageBox(f'{themeData["name"]} {self.appLang["BY"]} {themeData["creator"]}', infoString, 'information')
+        self.showMessageBox(f'{manifest.name} {self.appLang["BY"]} {manifest.creator}', infoString, 'information')
     
     def handleColorScheme(self, event=None):
         currentIndex = self.ui.colorSchemeComboBox.currentIndex()
@@ -442,33 +427,30 @@ class capsWatcher_configInterface(QMainWindow):
             self.modifyConfig('overlay', 'fadeEffectTime', str(currentValue))
 
     def handleStartProcess(self, event=None, argvCall=False):
-        if not argvCall : self.processWatcherThread.terminate()
         self.ui.watcherStart.setDisabled(True)
         self.ui.watcherStart.setIcon(self.ui.startIconDisabled)
         self.ui.watcherStatus.setStyleSheet(self.ui.yellowLabel)
         self.ui.watcherStatus.setText(self.appLang["STARTING_CAPSWATCHER"])
         subprocess.Popen(os.path.join(self.currentDirectory, 'capsWatcher.exe'), shell=True)
-        if not argvCall : self.processWatcherThread.start()
+        if not argvCall : QtCore.QTimer.singleShot(1500, self.processWatcherThread.resync)
     
     def handleStopProcess(self, event=None):
         self.ui.watcherStop.setDisabled(True)
         self.ui.watcherStop.setIcon(self.ui.stopIconDisabled)
-        self.processWatcherThread.terminate()
         self.ui.watcherStatus.setStyleSheet(self.ui.yellowLabel)
         self.ui.watcherStatus.setText(self.appLang["STOPPING_CAPSWATCHER"])
-        open(os.path.join(self.currentDirectory, 'terminate.d'), 'w').close()
-        self.processWatcherThread.start()
+        sendCommand('terminate')
 
     def handleReset(self, event=None):
         if self.showMessageBox(self.appLang["RESET_SETTINGS"], self.appLang["RESET_TEXT"]+"<br />"+self.appLang["RESET_WARNING"], "question") != QMessageBox.Yes: return
-        self.monitorConfigFile.terminate()
         os.unlink(self.configFilePath)
         self.parseConfig()
         self.treatColorScheme(self.overlayColorScheme)
         self.parseKeyToWatch()
         self.handlePreviewIconOpacity()
-        open(os.path.join(self.currentDirectory, 'reload.d'), 'w').close()
-        self.monitorConfigFile.start()
+        self.settingsStore.flush()
+        sendCommand('reload')
+        self.monitorConfigFile.acknowledge()
         
     def handleApply(self, event=None):
         self.handleFileModified(modified=False)
@@ -480,9 +462,25 @@ class capsWatcher_configInterface(QMainWindow):
             self.showMessageBox(self.appLang["SELECT_FAILED_TITLE"], self.appLang["SELECT_FAILED_TEXT"], "critical")
             return
         self.ui.addThemeBoxLineEdit.setText(selectedFile[0])
-        with zipfile.ZipFile(selectedFile[0], 'r') as zipTheme:
-            zipTheme.extractall(self.themesPath)
-            zipTheme.close()
+        self.ui.addThemeBoxButton.setDisabled(True)
+        self.themeInstallerThread = capsWatcher_themeInstaller(selectedFile[0], self.themesPath)
+        self.themeInstallerThread.installProgress.connect(lambda progress: self.ui.addThemeBoxLineEdit.setText(f"{selectedFile[0]} ({progress}%)"))
+        self.themeInstallerThread.installStatus.connect(self.handleThemeInstalled)
+        self.themeInstallerThread.start()
+
+    def handleThemeInstalled(self, installed, stagingPath, message):
+        self.ui.addThemeBoxButton.setDisabled(False)
+        if not installed:
+            self.showMessageBox(self.appLang["SELECT_FAILED_TITLE"], f'{self.appLang["SELECT_FAILED_TEXT"]}\n\n{message}', "critical")
+            return
+        releaseBundles()
+        # the installed bundle can still be open in another program, which Windows refuses to replace
+        try : os.replace(stagingPath, os.path.join(self.themesPath, f"{message}.zip"))
+        except OSError as error:
+            try : os.unlink(stagingPath)
+            except OSError : pass
+            self.showMessageBox(self.appLang["SELECT_FAILED_TITLE"], f'{self.appLang["SELECT_FAILED_TEXT"]}\n\n{error}', "critical")
+            return
         self.parseThemes()
         self.showMessageBox(self.appLang["THEME_INSTALLED_TITLE"], self.appLang["THEME_INSTALLED_TEXT"], "information") 
     
@@ -497,13 +495,27 @@ class capsWatcher_configInterface(QMainWindow):
             self.fileModified = False
             self.ui.applyButton.setEnabled(False)
             self.ui.applyButton.setIcon(self.ui.applyIconDisabled)
-            open(os.path.join(self.currentDirectory, 'reload.d'), 'w').close()
+            self.settingsStore.flush()
+            sendCommand('reload')
             self.ui.infoLabel.setText("")
-            self.monitorConfigFile.start()
+            self.monitorConfigFile.acknowledge()
+
+    def handleActivate(self):
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
 
     def handleQuit(self):
+        self.settingsStore.flush()
         sys.exit(0)
 
+    def closeEvent(self, event):
+        self.settingsStore.flush()
+        event.accept()
+
+    def handleFlushFailed(self, error):
+        self.showMessageBox("capsWatcher", "Unable to save configuration file."+'\n'+'ㅤ'*30+'\n'+error, 'critical')
+
     def handleKeyToWatch(self, state):
         self.parseKeyToWatch()
         senderName = self.sender().text().replace(" ", "").lower()
@@ -519,8 +531,6 @@ class capsWatcher_configInterface(QMainWindow):
         currentData = self.ui.languageBoxComboBox.itemData(self.ui.languageBoxComboBox.currentIndex())
         if self.settingsLanguage != currentData:
             self.settingsLanguage = currentData
-            self.currentLanguageFile = os.path.join(self.languagesPath, f"{currentData}.json")
-            self.currentLanguageExists = os.path.exists(self.currentLanguageFile)
             self.parseTranslation()
             self.modifyConfig('settings', 'language', str(currentData))
 
@@ -587,19 +597,18 @@ class capsWatcher_configInterface(QMainWindow):
         self.updaterThread.start()
     
     def treatKeyWatchBasedOnTheme(self, colorMode, listKeys=False):
-        themeData = json.load(open(self.currentThemeFile, encoding='utf-8'))
-        darkModeSupport = themeData['darkMode']['isSupported']
-        lightModeSupported = themeData['lightMode']['isSupported']
+        manifest = self.themeRepository.get(self.overlayTheme)
+        themeScheme = getattr(manifest, colorMode)
 
         supportedMode = None
         if not listKeys:
-            if self.currentScheme == 0 and not darkModeSupport : supportedMode = False
-            elif self.currentScheme == 1 and not lightModeSupported : supportedMode = False
-        else : supportedMode = False if not themeData[colorMode]['isSupported'] else None
+            if self.currentScheme == 0 and not manifest.darkMode.isSupported : supportedMode = False
+            elif self.currentScheme == 1 and not manifest.lightMode.isSupported : supportedMode = False
+        else : supportedMode = False if not themeScheme.isSupported else None
             
-        self.numLockSupport[1] = themeData[colorMode]['numLockSupport'] if supportedMode is None else supportedMode
-        self.capsLockSupport[1] = themeData[colorMode]['capsLockSupport'] if supportedMode is None else supportedMode
-        self.scrollLockSupport[1] = themeData[colorMode]['scrollLockSupport'] if supportedMode is None else supportedMode
+        self.numLockSupport[1] = themeScheme.numLockSupport if supportedMode is None else supportedMode
+        self.capsLockSupport[1] = themeScheme.capsLockSupport if supportedMode is None else supportedMode
+        self.scrollLockSupport[1] = themeScheme.scrollLockSupport if supportedMode is None else supportedMode
 
         if not listKeys : self.parseKeyToWatch()
         else : return [keySup[0] for keySup in [self.numLockSupport, self.capsLockSupport, self.scrollLockSupport] if keySup[1]]
@@ -633,10 +642,7 @@ class capsWatcher_configInterface(QMainWindow):
         except Exception as e : return f"Error: {e}"
 
     def modifyConfig(self, section, key, value):
-        self.configParser.set(section, key, value)
-        f = open(self.configFilePath, 'w')
-        self.configParser.write(f)
-        f.close()
+        self.settingsStore.set(section, key, value)
 
     def showMessageBox(self, title, message, icon):
         self.messageBox.setWindowTitle(title)
@@ -663,55 +669,213 @@ class capsWatcher_configInterface(QMainWindow):
         sys.exit(1)
     
     def checkForExistingProcess(self):
-        processRunning = 1
-        for process in psutil.process_iter(['name']):
-            if 'capsWatcherInterface.exe' in process.info['name']:
-                if processRunning > 1:
-                    self.showMessageBox("capsWatcher launch error", "Only one instance of capsWatcherInterface is allowed.", "critical")
-                    self.handleQuit()
-                processRunning += 1
+        self.instanceLock = acquireInstanceLock('capsWatcherInterface')
+        if self.instanceLock is None : sys.exit(0)
 
 class capsWatcher_processWatcher(QThread):
     processData = pyqtSignal(bool, str)
 
-    def run(self):
-        foundProcess = False
-        processInfo = ['capsWatcher.exe', None]
-        time.sleep(1.5)
-        while not foundProcess:
-            time.sleep(1)
-            for process in psutil.process_iter(['name']):
-                self.msleep(1)
-                if process.info['name'] == processInfo[0]:
-                    foundProcess = True
-                    processInfo[1] = process.pid
-                    break
-            if not foundProcess : self.processData.emit(False, "")
-
-        while True:
-            try:
-                process = psutil.Process(processInfo[1])
-                if process.is_running() and process.name() == processInfo[0] : self.processData.emit(foundProcess, str(processInfo[1]))
-                else : self.processData.emit(False, "")
-            except psutil.NoSuchProcess:
-                foundProcess = False
-                self.processData.emit(False, "")
-                break
+    def __init__(self):
+        super(capsWatcher_processWatcher, self).__init__()
+        self.lastState = None
 
-            self.msleep(1)     
+    def resync(self):
+        self.lastState = None
 
-class capsWatcher_monitorConfigFile(QThread):
+    def run(self):
+        while not self.isInterruptionRequested():
+            status = sendCommand('status')
+            # anything but a status object, like a reply from an older overlay, counts as not running
+            try : pid = json.loads(status)['pid'] if status is not None else None
+            except (ValueError, KeyError, TypeError) : pid = None
+            currentState = (pid is not None, str(pid) if pid is not None else "")
+
+            if currentState != self.lastState:
+                self.lastState = currentState
+                self.processData.emit(*currentState)
+
+            if pid is None:
+                self.msleep(1000)
+                continue
+
+            try : psutil.Process(pid).wait()
+            except psutil.NoSuchProcess : pass
+
+class capsWatcher_languageIndex:
+    indexVersion = 1
+
+    def __init__(self, languagesPath, indexFilePath):
+        self.languagesPath = languagesPath
+        self.indexFilePath = indexFilePath
+        self.entries = self.loadIndex()
+        self.stringTables = {}
+
+    def loadIndex(self):
+        try:
+            with open(self.indexFilePath, encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != self.indexVersion or index.get('languagesPath') != self.languagesPath : return {}
+            return {fileName: (tuple(entry['stamp']), entry['hash'], entry['shortName'], entry['description']) for fileName, entry in index['languages'].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def saveIndex(self):
+        index = {'version': self.indexVersion, 'languagesPath': self.languagesPath, 'languages': {fileName: {'stamp': stamp, 'hash': fileHash, 'shortName': shortName, 'description': description} for fileName, (stamp, fileHash, shortName, description) in self.entries.items()}}
+        tempFilePath = f"{self.indexFilePath}.tmp"
+        try:
+            with open(tempFilePath, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(tempFilePath, self.indexFilePath)
+        except OSError : pass
+
+    def languages(self):
+        entries, changed = {}, False
+        with os.scandir(self.languagesPath) as files:
+            for entry in sorted(files, key=lambda entry: entry.name):
+                if not entry.name.endswith('.json') : continue
+                fileStat = entry.stat()
+                stamp = (fileStat.st_mtime_ns, fileStat.st_size)
+                cached = self.entries.get(entry.name)
+                if cached is not None and cached[0] == stamp:
+                    entries[entry.name] = cached
+                    continue
+                with open(entry.path, 'rb') as f:
+                    data = f.read()
+                fileHash = hashlib.sha1(data).hexdigest()
+                changed = True
+                if cached is not None and cached[1] == fileHash:
+                    entries[entry.name] = (stamp,) + cached[1:]
+                    continue
+                try:
+                    strings = json.loads(data)
+                    entries[entry.name] = (stamp, fileHash, strings["LANGUAGE_SHORTNAME"], strings["LANGUAGE_DESCRIPTION"])
+                except (ValueError, KeyError) : pass
+        if changed or entries.keys() != self.entries.keys():
+            self.entries = entries
+            self.saveIndex()
+        return [(shortName, description) for stamp, fileHash, shortName, description in entries.values()]
+
+    def strings(self, shortName):
+        if shortName not in self.stringTables:
+            with open(os.path.join(self.languagesPath, f"{shortName}.json"), encoding='utf-8') as f:
+                self.stringTables[shortName] = json.load(f)
+        return self.stringTables[shortName]
+
+class capsWatcher_settingsStore(QtCore.QObject):
+    flushFailed = pyqtSignal(str)
+
+    def __init__(self, configFilePath, flushInterval=250):
+        super(capsWatcher_settingsStore, self).__init__()
+        self.configFilePath = configFilePath
+        self.configParser = None
+        self.dirty = False
+        self.flushError = None
+
+        self.flushTimer = QtCore.QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(flushInterval)
+        self.flushTimer.timeout.connect(self.flush)
+
+    def load(self, configParser):
+        self.flushTimer.stop()
+        self.configParser = configParser
+        self.dirty = False
+
+    def set(self, section, key, value):
+        if self.configParser.get(section, key, fallback=None) == value : return
+        self.configParser.set(section, key, value)
+        self.dirty = True
+        self.flushTimer.start()
+
+    def flush(self, force=False):
+        self.flushTimer.stop()
+        if not self.dirty and not force : return
+        try : writeConfig(self.configFilePath, self.configParser)
+        except PermissionError:
+            # usually the config is held open for a moment, so the write is retried shortly
+            self.dirty = True
+            self.flushTimer.start()
+            return
+        except OSError as error:
+            # the values stay pending for the next change or flush, the failure is reported once until a write succeeds
+            self.dirty = True
+            if self.flushError is None : self.flushFailed.emit(str(error))
+            self.flushError = error
+            return
+        self.dirty, self.flushError = False, None
+
+class capsWatcher_monitorConfigFile(QtCore.QObject):
     needReload = pyqtSignal(bool)
+
+    def __init__(self, configFilePath, debounceInterval=100):
+        super(capsWatcher_monitorConfigFile, self).__init__()
+        self.configFilePath = configFilePath
+        self.cachedStamp = None
+
+        self.fileWatcher = QtCore.QFileSystemWatcher(self)
+        self.fileWatcher.fileChanged.connect(self.handleChange)
+        self.fileWatcher.directoryChanged.connect(self.handleChange)
+
+        self.debounceTimer = QtCore.QTimer(self)
+        self.debounceTimer.setSingleShot(True)
+        self.debounceTimer.setInterval(debounceInterval)
+        self.debounceTimer.timeout.connect(self.checkChange)
+
+    def start(self):
+        self.acknowledge()
+        self.watchPaths()
+
+    def acknowledge(self):
+        self.cachedStamp = self.currentStamp()
+
+    def currentStamp(self):
+        try:
+            stat = os.stat(self.configFilePath)
+            return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError : return None
+
+    def watchPaths(self):
+        watchedPaths = self.fileWatcher.files() + self.fileWatcher.directories()
+        missingPaths = [path for path in [os.path.dirname(self.configFilePath), self.configFilePath] if path not in watchedPaths and os.path.exists(path)]
+        if missingPaths : self.fileWatcher.addPaths(missingPaths)
+
+    def handleChange(self, path):
+        self.debounceTimer.start()
+
+    def checkChange(self):
+        self.watchPaths()
+        currentStamp = self.currentStamp()
+        if currentStamp is not None and currentStamp != self.cachedStamp:
+            self.cachedStamp = currentStamp
+            self.needReload.emit(True)
+
+class capsWatcher_themeInstaller(QThread):
+    installProgress = pyqtSignal(int)
+    installStatus = pyqtSignal(bool, str, str)
+    # installed:bool, stagingPath:str, theme or error message:str
+    def __init__(self, bundlePath, themesPath):
+        super(capsWatcher_themeInstaller, self).__init__()
+        self.bundlePath = bundlePath
+        self.themesPath = themesPath
+
     def run(self):
-        self.configFilePath = os.path.join(os.path.join(os.getenv('APPDATA'), 'capsWatcher'), 'capsWatcher.cfg')
-        self.cachedStamp = os.stat(self.configFilePath).st_mtime
-        while True:
-            currentStamp = os.stat(self.configFilePath).st_mtime
-            if currentStamp != self.cachedStamp:
-                self.cachedStamp = currentStamp
-                self.needReload.emit(True)
-                break
-            self.msleep(50)
+        stagingPath = os.path.join(self.themesPath, f".{os.path.basename(self.bundlePath)}.part")
+        try:
+            with capsWatcher_themeBundle(self.bundlePath) as bundle:
+                theme = validateBundle(bundle, progress=lambda done, total: self.installProgress.emit(done * 90 // total))
+            totalSize, copiedSize = os.path.getsize(self.bundlePath), 0
+            with open(self.bundlePath, 'rb') as source, open(stagingPath, 'wb') as staging:
+                while chunk := source.read(262144):
+                    staging.write(chunk)
+                    copiedSize += len(chunk)
+                    self.installProgress.emit(90 + copiedSize * 10 // max(totalSize, 1))
+                staging.flush()
+                os.fsync(staging.fileno())
+        except (ValueError, KeyError, OSError, zipfile.BadZipFile) as error:
+            if os.path.exists(stagingPath) : os.unlink(stagingPath)
+            self.installStatus.emit(False, '', str(error))
+            return
+        self.installStatus.emit(True, stagingPath, theme)
 
 class capsWatcher_updateChecker(QThread):
     updaterStatus = pyqtSignal(bool, str, bool, bool)
@@ -1569,5 +1733,8 @@ QComboBox QAbstractItemView {
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    capsWatcher_configInterface().show()
+    if startupTrace is not None : startupTrace.mark('application')
+    configInterface = capsWatcher_configInterface()
+    if startupTrace is not None : startupTrace.watch(configInterface)
+    configInterface.show()
     sys.exit(app.exec_())
\ No newline at end of file
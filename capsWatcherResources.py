@@ -1,6031 +1,11 @@
-from PyQt5 import QtCore
+from PyQt5.QtCore import QResource
+import sys, os
 
-qt_resource_data = b"\
-\x00\x00\x19\xa5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x00\x90\x08\x02\x00\x00\x00\x68\x01\x22\xc6\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x31\x37\x44\x44\x38\x37\x35\x44\x38\x34\x41\
-\x35\x31\x31\x45\x45\x39\x45\x41\x36\x43\x42\x43\x33\x34\x35\x44\
-\x42\x34\x34\x43\x41\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x31\x37\x44\x44\x38\x37\x35\x45\x38\x34\x41\x35\x31\x31\x45\
-\x45\x39\x45\x41\x36\x43\x42\x43\x33\x34\x35\x44\x42\x34\x34\x43\
-\x41\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x31\x37\x44\x44\x38\x37\x35\x42\x38\x34\x41\x35\x31\x31\x45\
-\x45\x39\x45\x41\x36\x43\x42\x43\x33\x34\x35\x44\x42\x34\x34\x43\
-\x41\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x31\x37\x44\
-\x44\x38\x37\x35\x43\x38\x34\x41\x35\x31\x31\x45\x45\x39\x45\x41\
-\x36\x43\x42\x43\x33\x34\x35\x44\x42\x34\x34\x43\x41\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x88\
-\xb7\x57\x38\x00\x00\x16\x19\x49\x44\x41\x54\x78\xda\xec\x5d\x07\
-\x78\x94\x55\xba\x3e\x53\x33\x33\x99\x9e\x99\x4c\xa6\x24\xa4\xf7\
-\x4a\x30\x80\x48\x2f\x62\x67\x11\x91\x55\xaf\x0d\x5d\x77\xaf\xba\
-\xea\x7a\x2f\xae\xee\xee\x15\x74\xf5\xae\xb8\xf6\xb2\xde\x6b\x01\
-\xd7\xee\x62\x59\x54\x50\x9a\x10\x05\x43\x20\xa4\x93\xde\xa6\x4f\
-\x66\x32\x99\xde\x67\xfe\xfb\x23\xab\xa2\x17\x10\xc2\xfc\x75\xce\
-\xfb\xf0\xf8\xe4\xc1\x87\x9c\xf3\x9f\xff\x7b\xff\xf3\x7e\xe7\x9c\
-\xf7\x3b\x0c\xb0\x21\x1f\x40\x40\xa4\x2a\x98\x70\x08\x20\x20\x01\
-\x20\x20\x20\x01\x20\x20\x20\x01\x20\x20\x20\x01\x20\x20\x20\x01\
-\x20\xf0\x18\x7e\xc6\xd5\xa5\x99\xfa\xe5\x65\xd5\xb9\x19\x80\x01\
-\x87\x83\x00\xb0\xe1\x10\x10\x06\xa5\x68\xb0\x4e\x5b\x20\xe6\xa1\
-\x3f\xb6\xcf\xc8\xee\x2a\x54\x54\xb5\x9b\x81\xdd\x0b\x07\x06\xce\
-\x00\x74\x07\x8f\xbb\x79\x66\x2e\x32\xbf\xe0\x78\xf4\x1f\x47\xa5\
-\x94\x8f\xfe\xcd\x3f\x66\xe7\x01\x21\x17\x8e\x10\x6e\x60\x81\x85\
-\x32\x38\x0a\xf8\x81\xc1\xf8\x45\x89\xea\xe8\xec\xdc\x5a\x19\xff\
-\xa4\xff\xbf\x5c\xcc\x5b\x9f\xaf\x88\x73\xd9\x8d\xce\x00\x48\x20\
-\x70\xc0\x30\x7f\x21\x70\x27\x18\x47\xcd\x23\xec\xab\xd3\x15\x9f\
-\xf0\xd5\x3f\x0d\x82\xe1\xd8\xa5\x3d\xd6\x3d\x43\x13\x00\x81\x34\
-\x80\x04\xa0\xbe\xe6\x79\xa5\x5a\xbd\x36\xe7\xac\x27\xdb\x21\x4f\
-\xa8\xb0\xc3\x0c\xac\x1e\x38\x84\x30\x09\xa6\xaa\xe6\xb9\xb4\x48\
-\xf1\x71\x59\x16\x8b\xc3\x9a\xc2\xbf\x46\x93\x04\xe4\x82\xfc\xed\
-\x56\xef\xc5\x28\x0d\x3c\x41\x38\x9c\x70\x06\xa0\x14\x14\xc2\x9e\
-\x3a\x5d\xa9\x84\x97\x84\x5f\x85\x20\x1b\x47\x9c\xf7\x75\x99\x41\
-\x24\x0e\xc7\x15\x12\x80\xfc\x9a\x87\xfd\xbf\x55\xda\x5b\xa7\x25\
-\x79\x81\x01\x26\x06\x90\x00\x14\xd0\x3c\xcb\x0b\x94\x9f\x54\xa8\
-\xd8\x53\xd2\x3c\x30\x31\x80\x39\x00\x95\x91\x91\xde\x55\xa7\xab\
-\x90\xf2\x31\x6d\x04\x26\x06\x49\x04\xdc\x08\x4b\x12\xd2\xd8\x7f\
-\x9b\x31\x0d\x59\x58\x84\x75\xf4\x7f\x8f\x8b\xb2\x44\xc8\xd2\xe2\
-\xc7\xa6\x67\xa3\x4d\xc3\xe1\x87\x12\x88\xc8\x21\x5c\x52\xa0\xd8\
-\x5e\xa1\xc6\x4e\xf3\x9c\x1e\xb1\x68\xfc\x97\xbd\xe3\x5b\x06\xc6\
-\xe1\xc6\x19\x24\x00\xee\x90\xa7\x77\x4e\xd7\x55\xe2\xf5\xd5\x3f\
-\x0d\x8c\xbe\x48\x76\xa7\x19\x98\x5c\xf0\x9d\x40\x09\x84\x93\xe6\
-\x79\xae\x3e\x07\xd5\x3c\x64\x88\x7e\x14\x3a\x21\x17\x99\x9d\xbb\
-\x77\x7e\x21\x90\x0a\xe0\xcb\x81\x33\x00\xb6\x63\x36\x2f\x4f\xb9\
-\xa3\x32\x2b\x8d\xcb\x22\x63\xf7\x10\xf0\xc2\x98\xf3\x8e\x2e\x2b\
-\x08\x45\xe0\xbb\x82\x04\x48\xbe\xe6\x69\xaf\xd3\x55\xcb\xf8\x64\
-\xef\x67\x2c\x71\x73\xbf\x6d\x53\x9f\x1d\xc4\x13\xf0\xa5\x41\x02\
-\x24\x47\xf3\x3c\x5d\xa9\xb9\x2b\x57\x4e\x21\xe7\x8a\x3d\x10\x55\
-\x77\x9a\xe3\x86\x49\xf8\xf6\x4e\x05\xb8\x82\x76\x46\x5f\x89\x59\
-\x79\x19\x7b\x2a\xd4\x7c\xaa\x2d\x38\x2a\x05\x9c\xd8\xcc\x69\x87\
-\x8a\x94\x0d\x6d\x26\xe0\xf4\xc3\x37\x09\x67\x80\xb3\x87\x4c\xd0\
-\x52\xa7\x9b\x2e\xa7\x7c\x66\xf9\xba\xc1\x75\x63\xa7\x09\x04\xa2\
-\xf0\x95\x9e\x08\xb8\x0a\x74\x6a\x70\x59\x7f\x9d\x9e\x8d\x2c\x2a\
-\xa6\x41\xf4\xa3\xb8\x21\x5b\x8a\x5c\x58\x76\x77\xa5\x06\xb0\xe1\
-\x4b\x87\x33\xc0\xcf\x8d\x4a\x6d\x6e\xc6\x81\x4a\xea\x69\x9e\x33\
-\x81\x3b\x14\x9d\xd7\x65\xed\x18\x9b\x00\x70\xdf\x0c\x12\xe0\x24\
-\x90\x0a\x9a\xa7\xeb\xce\x93\xd3\x7c\x35\xbd\xcb\x15\x84\x1e\x7c\
-\x28\x81\x7e\x0c\x0e\xeb\x31\x54\xf3\x2c\x2e\xa6\x7d\xf4\x03\xe8\
-\xc1\xff\x0e\xd0\x14\xff\x2f\x54\xe4\xca\x47\xe7\xe4\x2f\x50\x0a\
-\x53\xaa\x3e\x0f\xf4\xe0\x43\x09\x74\x4c\xf3\x34\xd5\xe9\x66\x66\
-\xa4\xf4\x09\x82\x60\x38\x76\x51\x8f\x75\xdf\x90\x23\xd5\x12\x83\
-\xd4\x96\x40\x1c\xd6\x23\xb5\x3a\x64\x71\x51\x8a\x47\x3f\x0a\x34\
-\xdd\xdf\x5b\xab\xeb\x5c\x5c\x02\x94\x22\x38\x03\xa4\x04\x72\xa7\
-\xc9\x3b\xaa\x34\x22\x1e\xdc\x0a\xfc\x29\xb6\x98\xdc\x57\x75\x9a\
-\x80\x2f\x02\x09\x40\x53\x48\xf8\x07\xea\x74\xb3\x15\xe9\xb8\x35\
-\x38\x3e\x2e\xeb\xb1\x49\x07\xed\xa2\x41\x87\xa8\xcf\x91\x6e\xf5\
-\xa5\x79\xa2\x6c\x47\x80\x6d\x8b\x1c\x3b\x4e\xa7\xe2\xc6\x15\x82\
-\x98\x98\x13\xcb\x12\x86\x4b\x14\xfe\x42\x85\xb7\x50\xe9\x2d\x53\
-\xb9\x32\x33\x89\x3b\xc2\x90\x40\xfe\x34\xe4\xf8\xf3\x51\x2b\x88\
-\xc6\x21\x01\x68\xa5\x79\x1e\xaa\x50\xff\xa9\x20\x03\x30\x30\x4f\
-\x75\x6d\x36\xd9\xee\x7e\xed\xde\x61\xc5\x17\x43\x0a\xbd\x77\x2a\
-\x2b\x2d\x39\xa2\xc8\x85\x05\x8e\x05\xf9\x8e\xc5\xc5\x26\x95\x8a\
-\x00\x32\xa4\x82\x07\x3f\x85\x08\xa0\xce\x91\xf7\x54\xab\x25\x3c\
-\x0e\xa6\xad\xb8\x9c\x92\xf7\x5b\x73\xdf\x6e\xd3\xed\x33\x4a\x92\
-\xf8\x6b\xe7\xeb\xdc\xd7\xd4\x1a\x57\xd7\x8d\x4a\xe5\x6e\x9c\xc7\
-\x8d\xde\x1e\xfc\xd4\x20\x80\x98\xdf\x58\xa7\x9b\xab\xc4\x52\xf3\
-\x20\xcc\xc6\xa3\xd3\x9e\x6b\x2c\xda\xd2\xaf\xc0\xf4\x51\x56\x15\
-\x3b\xee\x9c\x37\x30\xaf\x7c\x0c\x30\x70\x3d\xe7\x4c\x57\x0f\x3e\
-\xdd\x09\xc0\x66\x3e\x58\xa9\x59\x8f\xa9\xe6\x41\x98\xdb\x5a\x0a\
-\x1f\xda\x53\x72\xd0\x82\xdf\xfa\x49\x43\x96\xf7\xc1\xc5\x7d\x17\
-\xd7\x0f\xe2\x4a\x83\xe3\xc5\xb9\xba\x2d\x20\x1c\x83\x04\xa0\x00\
-\x78\x39\x32\x6b\xb5\x06\x53\xcd\x73\x74\x44\x7d\xc7\x47\xd3\xbf\
-\x34\x48\x08\x79\xc0\x85\xd9\xee\x67\x57\xb4\x55\xe6\x9b\xf0\x6c\
-\x94\x66\x1e\x7c\x9a\x12\x40\xcc\xdf\x5b\xa7\x9d\xaf\x14\x62\xd7\
-\x42\xc8\x2b\x58\xb7\x75\xc6\x73\x2d\x3a\x82\x77\x8e\x18\xe0\xce\
-\x7a\xe3\xc6\xcb\x5a\x78\x62\x5c\x8f\xfb\xd3\xc6\x83\x4f\x3b\x02\
-\xb0\x99\x0f\x54\xa8\x1f\x29\x50\x00\x26\x86\xeb\x3c\x5f\x75\xe7\
-\xad\x79\xb7\xde\xec\x23\xcb\x29\x1a\x8d\x30\xf2\xee\x9a\x96\xb9\
-\x15\x23\x38\xb7\xbb\xcf\xee\x5b\xd0\x6e\x06\xae\x00\x75\xe3\x85\
-\x5e\x67\x81\xb2\x65\xce\x39\xf9\x97\xa8\x44\x18\x2a\xfe\x08\xe7\
-\xfe\x0f\x66\xaf\xdd\x5a\xe9\x8d\x90\xc8\x11\x8f\x76\x66\xd3\x91\
-\xec\xb0\x47\xbc\xa4\xc8\x0a\x58\xf8\x65\x05\xb9\xe9\xdc\xf5\x79\
-\x19\xca\x74\xee\x36\x67\x10\xc4\x28\xb9\x63\x40\x97\x19\x40\x9c\
-\xb6\xbb\x36\x7b\x51\xa6\x10\xd3\x46\x82\x1e\xe1\xe5\xaf\xce\xdb\
-\xa5\x97\x92\x76\x18\x96\xe4\xb8\xb6\xae\x6d\xe4\x8b\x7d\x78\x37\
-\x4c\x59\x0f\x3e\xf5\x09\xc0\x66\xae\x2b\x57\x3f\x56\x88\xad\xe6\
-\x41\xa1\x37\x2b\x96\xbd\x3c\xaf\xcf\xc5\x23\xf9\x78\x94\x48\x43\
-\x3b\x6e\x6d\xcc\xd1\x38\xf0\x6f\x9a\x8a\x1e\x7c\x8a\x13\x40\x27\
-\xb5\x57\x6b\x15\x02\x0e\xd6\xed\xb4\x0d\x6a\x67\xbd\x3a\x27\x1c\
-\xa2\xc6\xc1\xa1\x34\x5e\xac\x69\xed\xfe\xda\x42\x13\x21\xad\x1f\
-\x72\x06\x28\xe4\xc1\xa7\xec\x69\x50\x11\x6f\xc7\xdc\x42\x64\x56\
-\x2e\x4e\xd1\xff\xf2\x05\x54\x89\x7e\x14\x68\x57\xd1\x0e\xa3\xdd\
-\x26\xa4\xf5\xf3\xe4\x02\x64\x51\xd1\xe6\x99\xb9\x00\xfb\x57\x93\
-\x92\x04\x60\x33\xef\xad\xd2\x20\x4b\x4b\x96\xaa\x84\x38\xb4\x36\
-\xa0\x57\x35\xbc\x72\x41\x38\xc2\xa2\xd6\x20\xa1\x1d\x46\x39\x80\
-\x76\x9e\xa8\x0e\x50\xc5\x83\x4f\x35\x09\xa4\x95\x8e\xd7\x68\x95\
-\x78\x7d\x5a\x5c\x4e\x49\xd5\xd3\x4b\x8d\x5e\xaa\x9a\x06\x75\xa2\
-\x48\xc7\x5d\x3b\x65\x19\x6e\x02\xfb\x40\x72\x0f\x3e\x75\x66\x00\
-\x21\x77\xfb\xdc\x02\x64\x76\x2e\x6e\xd1\x0f\xa2\x9c\xcb\x5f\x9b\
-\x4b\xdd\xe8\x47\x81\x76\xfe\x8a\x4d\x73\x41\x84\x48\x29\x22\xe1\
-\x71\xda\x67\x64\x1f\xb3\xda\x28\x84\x90\x00\x53\x02\x8b\x79\x57\
-\xa5\x06\x59\x56\xb6\x5c\x85\xab\x59\xe9\xde\x2d\xb3\xbe\x32\x89\
-\x01\xc5\x81\x3e\xc2\x3d\x1f\xcc\x22\xbc\x1b\xc7\x3c\xf8\x0b\x0a\
-\x49\x98\x18\x90\x7e\x23\x4c\x23\xb1\x5d\x90\x7f\xa5\x5a\x8c\xc3\
-\x09\xfe\x13\xb1\xa3\xb5\xe0\xf6\x6d\xe5\x80\x16\x68\x32\x49\xce\
-\x57\x05\x0a\xd4\xc4\xaf\x4e\xd6\x4a\x8e\x79\xf0\xdd\x6c\x56\x93\
-\xd3\x4f\x92\xa3\x44\x24\x9e\x01\x84\xdc\x4f\x2f\x28\x40\xce\xcf\
-\xcb\x14\xe0\x2d\x42\x42\x5e\xc1\xf5\x5b\xa6\x03\x1a\x01\x7d\x9c\
-\x90\x27\x9d\x14\x5d\x61\x31\x9f\x2a\xcd\x74\x2d\x2f\xab\xce\xcd\
-\x20\x43\x01\x0e\x52\x12\x80\xc5\xbc\xa3\x42\x8d\x2c\x2d\xbd\x24\
-\x8b\x18\x83\xf6\xba\xad\x33\x6c\x01\x0e\x9d\x08\x80\x3e\xce\xba\
-\x4f\xea\xc9\xd3\x9f\x1f\x12\x03\xa2\x3d\xf8\xe4\x5b\x05\x52\x4b\
-\xcc\xb5\x5a\x75\x3a\x61\xa9\xe7\xd1\x11\x75\xc5\xb3\x0b\x01\x1d\
-\xd1\xfd\xdb\x2f\xcb\xf3\x2c\x64\xeb\x15\xb1\x1e\x7c\x32\xcd\x00\
-\xe9\xdc\x7f\xce\xc9\x47\xe6\xe4\x11\x18\xfd\x00\x01\xf7\x6e\xad\
-\x05\x34\xc5\xb1\x47\x23\xdf\x5a\xe4\x2a\xad\x04\x59\x56\xf6\xc7\
-\x1a\x2d\x20\xe2\x96\x41\x72\xcc\x00\x2c\xe6\xaf\x4b\x55\x7f\x2b\
-\x56\xa2\x3f\x10\xdb\x91\xde\x89\xa5\x45\x73\x6e\xf3\x06\xa2\xb1\
-\x18\x12\x08\xc7\xc2\x91\x44\x30\x1c\x0f\x85\xe3\x91\x68\xc2\x1b\
-\x8a\xc5\x62\x09\xaf\x3f\x1a\x08\xc7\xd1\x9f\xfd\xfe\xd8\xa4\x3f\
-\xe2\x0b\xc6\x7c\xc1\xb8\x37\x18\x75\xfb\xa3\x4e\x7f\xd4\x1d\x8c\
-\x19\x3c\x11\x10\x25\xef\x81\xb0\xa6\xdb\xbe\x9e\x59\xaa\x27\x67\
-\xdf\x08\xf1\xe0\x93\x60\x7b\x5f\x2d\x31\xd4\x68\x75\xe4\xa8\x50\
-\x19\x55\x5d\xc6\x62\x32\xa4\xff\xea\x4c\xda\xd4\x7e\x89\x3f\x18\
-\x73\xb8\xc3\x4e\x4f\xd8\xe9\x8e\xd8\x5d\x61\xd3\x44\xd0\x32\x11\
-\x34\x3b\x42\xe8\x0f\x03\xe3\x41\xcb\x64\x88\xc0\x07\xfc\xcb\xee\
-\xb2\x8f\xc8\x4a\x00\x7e\x1a\x7b\x77\xad\x6e\x28\x5f\x81\xa7\x07\
-\x9f\xd0\x19\x20\x9d\xfb\x41\x8d\x6e\xa5\x86\x2c\x6b\xed\x8e\x60\
-\xbd\xa2\xfe\x01\xac\x5b\x41\xe9\x31\x6a\xf5\xeb\x2d\xfe\x11\xab\
-\x7f\xc8\xe8\x6d\x1f\xf5\x7c\x35\xe2\x8e\x04\xf0\x73\xd9\x9a\x7f\
-\xbf\x5d\xad\x22\xfb\x81\x4d\xdc\x3c\xf8\x04\x11\x80\xc9\x58\x5b\
-\x9a\xf9\x4a\x89\x8a\x70\xcd\xf3\xa3\xf4\x17\x3c\x5c\x5e\x4e\xc0\
-\xda\x3f\x3a\xe1\x1b\xc7\x03\xbd\x63\x9e\x8e\x61\x57\x73\xef\xe4\
-\xae\xa3\x0e\x74\xea\xc0\xae\xb9\xff\x5e\x34\xf0\xfb\xcb\x0e\x51\
-\x20\x65\xc1\xc5\x83\x4f\x04\x01\xb2\xc4\x86\x5a\x9d\x8e\x6c\x55\
-\xb9\x11\x41\xb0\x70\x13\x49\x6e\xc4\x18\x36\xfb\x8e\xf4\x3a\x9b\
-\xba\x27\x76\xb7\xdb\xdb\x0c\x49\x2e\xe1\xaf\x13\x45\x0c\x0f\x7e\
-\x04\x58\xd4\x30\x70\x61\xed\xc1\xc7\x97\x00\x02\xce\x7b\x35\xba\
-\xd5\x5a\x09\x09\x07\x7a\xd0\xbb\xa2\x70\xe6\xbf\x91\xb0\x63\x68\
-\xfe\xf0\xe5\x61\xdb\x8e\x16\xdb\x3b\x87\xac\xc9\x52\x4a\x64\x4e\
-\x85\x4f\x0a\xec\x3c\xf8\x78\x1d\x85\x60\x32\x6e\x2c\xcd\x6a\x9d\
-\x95\x5b\x21\x21\xe9\x0d\xbb\x36\xfe\x8d\x4a\x45\x06\x09\x3b\x26\
-\x12\x70\xaa\x0a\xa5\x2b\xe6\xea\xd6\xad\x2c\x3a\xbf\x54\x2e\x64\
-\x33\x8e\xda\x02\xb1\x73\x5b\x68\xca\xe2\xc7\x17\x95\x1b\x29\x44\
-\x00\x31\x97\xb5\x3e\x5b\xba\x50\x29\xdc\xec\x0e\x81\x50\x32\xef\
-\xf9\xc3\x65\x06\x50\x89\xc7\x6a\xb5\x39\xa2\x34\x12\x8f\x30\xd3\
-\x93\xf3\xa6\x58\x98\x46\x89\x68\x88\x44\x13\xfb\x5a\xc7\xdf\xdc\
-\x31\xf6\xf7\x26\xf3\xd4\x96\x5c\xeb\x94\x81\x23\x0f\x7c\x0c\xa8\
-\x08\x04\xbc\x30\xe6\xbc\xa3\xcb\x0a\x42\x11\x2a\x10\x40\xc0\x79\
-\xa7\x5a\xb7\x46\x27\x21\xf9\xa8\x86\xa2\xe5\xbc\x9a\x87\x29\x17\
-\x0c\x36\x67\xe8\xed\x5d\x63\x2f\x6d\x1b\xe9\xb7\x9c\xb5\xff\xd0\
-\xbf\x7e\xab\x40\xe2\x03\x14\x45\xf2\x3c\xf8\x98\x2d\xc2\x30\x19\
-\xd7\x96\x66\x22\xcb\xca\xc8\x1f\xfd\xc7\x24\x66\x9c\x92\x47\xdf\
-\x54\x72\xde\x3d\xab\x4b\x7a\x36\x5d\xb8\xeb\x91\x0b\x96\xd7\x28\
-\xcf\xea\xdf\x1e\x31\x29\x00\x75\xc1\x66\xbe\x56\xae\x1e\xbf\xb0\
-\x8c\x95\x2d\x23\x25\x01\x32\x45\xc3\x4b\x4b\xdf\xa4\xce\x95\xb4\
-\x11\x4e\x2e\x75\x83\x81\xc9\x60\x2c\x9e\xa1\xda\xbe\x71\xde\xc1\
-\x27\x17\xac\x9e\xa9\x3e\xc3\x23\x96\x1d\x46\xca\xd7\x83\x52\x0a\
-\x38\xb1\x99\xd3\x9a\x17\x15\x03\x79\x3a\x69\x08\xc0\xe7\xbc\x39\
-\x2b\x17\x99\x57\x90\x27\x4a\xa3\xd0\x50\xf2\xc4\x2a\x40\x7d\x34\
-\x54\x64\xbc\xf7\xd0\xf9\x9d\x2f\x2e\x5e\x85\xd2\xe0\xe7\xd0\xef\
-\x10\x02\x5a\xe0\x07\x0f\x3e\x6f\x2a\x0b\xeb\xc9\x5b\x05\x62\x32\
-\xae\x2e\xc9\xec\x9a\x95\x57\x2d\xe5\x53\x6e\x10\x83\x92\xab\xe2\
-\x08\x33\x14\x4a\x8c\xbb\x42\x6e\x7f\xf4\xfb\x3f\x81\x70\x3c\x9e\
-\x40\x42\x91\x78\x38\x9a\xe0\x71\xa9\xe1\x8b\xcf\x94\xf1\x56\x2f\
-\xcc\x9e\x5f\x9e\xd1\x35\xe4\xb2\xb8\xc2\xa7\xfc\x7c\xf2\xe2\xd7\
-\xcc\x1c\x04\x74\xc1\xb7\x56\x9b\x0c\x3d\x13\xb4\x39\x83\x67\x75\
-\x94\x28\x49\xfb\x3e\x4a\xd1\x60\x9d\xb6\x40\xcc\xa3\xe8\xf0\x5d\
-\xfa\xbb\xad\xad\xf6\x33\xb8\x27\x8f\xc3\x94\xf2\xd9\x1a\x21\x57\
-\x2a\x60\x67\x88\xb9\x59\xd2\x34\xb9\x38\x2d\x43\xc2\x45\xff\xab\
-\x51\xf0\x35\x0a\x9e\x5a\x21\xc8\x94\x92\x62\xea\x5b\x58\xaf\x3a\
-\xf8\xe2\x92\x37\x3e\x1f\x59\xf7\xfa\x51\xbb\xfb\x24\x34\x30\xfb\
-\xd2\x00\xcd\xf0\x6d\x62\xa0\x64\xb3\x37\x76\x98\x70\x24\x00\x8f\
-\xbb\xb9\x46\x73\x43\xb6\x94\xd2\x43\x67\xf0\x9f\x99\xfd\x25\x9a\
-\x70\x45\x23\x2e\xcf\x69\x17\xe0\xb8\xcc\x0a\xa5\xa0\x48\x23\x2c\
-\xd1\x0a\x8b\xb2\x45\x05\x1a\x61\x81\x56\xa8\xcb\x14\x30\x70\x77\
-\x3f\xb1\x58\x8c\x1b\x2f\xc9\x5f\x31\x5f\x77\xff\x4b\xed\x2f\xed\
-\xfc\xe9\xb6\x97\xde\x47\xb7\xfb\xb1\x8f\xdd\x64\xd3\x6a\x02\xf6\
-\xb3\xdb\x38\x3f\x87\x65\x50\x06\xe3\x17\xc5\x99\x1f\x96\xa9\xa8\
-\x92\xe9\x9e\xee\x51\xfe\x73\x0d\x88\x61\xf8\x14\xfc\x74\xce\xfc\
-\x42\x69\x75\xae\xb8\xaa\x40\x5a\x55\x20\xa9\xc8\x95\xb0\xf1\x1d\
-\xb4\x1d\x07\x2d\x6b\x9f\x6d\x35\x3a\x4e\x38\x5b\xc6\x4e\x20\x8f\
-\xbf\x4b\x93\xd8\x8f\x25\xd6\xf4\x5a\xdf\xeb\xb7\x4f\xe1\xb8\xc4\
-\x54\x09\xa0\x14\xf6\xd7\xe9\x8a\x28\xab\x79\x7e\x3a\x0a\xf7\x5c\
-\x83\x6b\x7b\x69\xac\x4b\xcb\x33\xe6\x94\x67\x9c\x57\x26\xaf\x2f\
-\x93\x4b\x71\x39\x16\xe5\xf6\x46\xee\x7b\xa9\xfd\x7f\x76\xfd\x30\
-\x15\x20\x4f\xbd\x4d\x83\x77\xf7\x96\xd1\x75\x5d\xbb\x09\x04\xa7\
-\xb8\x3d\x3c\x15\x02\x3c\x50\xa3\x7d\xa4\x48\x09\x68\x04\xac\x67\
-\x80\xd3\x4f\xa4\x0b\x8a\x65\x4b\xa6\x67\xce\xab\xcb\x6c\x28\x93\
-\xa7\x61\x9c\x6a\x7f\xb8\xd7\xb0\xea\x99\x23\x48\x20\x46\x83\x19\
-\x60\xc4\x1b\xce\x6f\x35\x82\xf1\x73\x3a\x2c\x38\x95\x1c\xe0\xd1\
-\x6e\x4b\x20\x8e\x3c\x55\xa4\x20\xd5\x61\xe6\x73\x81\x82\x1b\x77\
-\x10\x45\x00\x04\xd9\xdb\xe7\x44\xff\x80\x77\x7a\x99\x3c\xd6\xd5\
-\xd3\x55\x97\xcd\x56\x2f\x6d\x50\x2b\xb0\x49\xa6\x57\x2e\xc8\x1e\
-\x28\x94\xae\x7e\xa8\x49\x6f\x9f\xa0\xb4\xe6\xb9\xae\xd7\xfa\xd6\
-\x94\x34\xcf\x4f\x33\xa5\xa9\x2c\x83\x26\x90\xa6\x71\xef\x06\xbd\
-\x33\x8f\xc7\xad\x95\xd0\x41\x05\xbd\x7b\xb0\xd8\x4a\x82\x32\x10\
-\x48\x0c\xe9\x32\x78\x3f\xf8\xc6\xf2\xf8\x47\x03\x07\xdb\xc6\x03\
-\xa1\xb8\x4e\x29\x10\xf2\x93\x7c\x42\x5b\x2e\x4e\xbb\x76\x71\x8e\
-\xc7\xe1\x5c\x5a\xd8\x4c\xc9\x97\x65\x74\x57\x1d\x18\xee\xb4\x78\
-\x93\xe2\x6f\x3e\xe7\xb3\x40\xf2\xf4\xe6\x5a\xed\x79\x72\x01\xa5\
-\x09\x70\xf1\xb3\x17\x6d\x1f\x21\xe5\xce\x28\x8b\xb1\xa2\x36\x73\
-\xcd\xc2\xec\x8b\xcf\xd7\x88\xd2\x93\x49\x51\x04\x41\x18\xfd\x37\
-\x82\x38\x95\x8e\x03\xe9\xbd\xe1\x69\x6d\x26\x60\x4b\xa6\x5b\xf2\
-\x9c\xe7\x7d\xa7\xbf\x61\x4f\x3f\xfb\xe0\x98\x3d\x10\xa5\x2e\x01\
-\x8a\x32\xc8\x5a\xcc\x3e\x8e\x7c\xdc\x62\x5b\xf3\xd7\xc3\xe2\x5f\
-\x7e\x76\xc7\x13\x87\x0f\xf5\x24\x4d\xb7\x4c\xba\x7d\x54\x8a\xfe\
-\x78\xe2\xa6\x6e\xeb\xb4\x9d\xbd\xc9\x8d\x7e\x90\xac\x9d\x60\xc4\
-\x13\x7a\x7c\x78\x42\x8f\x24\xae\x90\xa5\x63\x7d\x53\x0b\x16\x18\
-\xb6\x66\x6c\x1b\x24\xf7\xe1\xb0\x38\x72\x68\xc8\xfd\xf2\xe7\xa3\
-\xdb\x0f\x98\xd9\x00\x29\xce\x16\x73\x39\xe7\xf4\xf1\x32\x8c\x0d\
-\x66\x20\x5f\x52\xe2\xed\xbc\x6f\x72\x57\xee\x1f\x6e\xb3\x78\xb0\
-\xa8\xe9\x92\xbc\xa3\x10\x08\xd2\x66\xf7\x6f\x18\x9d\x54\x72\x59\
-\x0d\x12\x3e\xa0\x14\x0b\x42\x41\xde\xe6\xd6\x6c\x4a\x74\xd5\x34\
-\x19\xfe\x67\xb3\xf5\xa9\x4f\x86\x63\xbe\x68\x71\x8e\x48\x34\xd5\
-\x5a\xb3\x93\x63\x07\xe4\x9c\x0e\x92\x3f\xac\xd1\x17\x91\x34\x8f\
-\x6d\xe9\xb5\x61\x57\x69\x06\x1b\x3f\x80\x54\xb0\xb7\x46\x83\xe9\
-\x35\xbd\xc9\x45\xc0\x2d\x4c\x5f\x7f\x39\xf5\xa4\x1b\x87\xf9\xeb\
-\x05\xba\xdf\x5e\x55\x52\x36\xed\xac\x2b\x6b\x04\x3b\xd6\xf3\xd9\
-\x9d\x64\xd6\x3c\xb7\xf4\xd9\x5e\xed\xc5\xfc\x3a\x6e\x2c\x0d\x31\
-\x5a\xa9\xa1\x4a\x43\x3a\xf3\xfb\x29\x30\xfd\xd1\x15\x67\x74\x1c\
-\x88\x84\x60\x30\x6e\x9a\xaf\xbb\xef\x9a\xd2\x92\x33\xa6\x41\x30\
-\x14\xe5\x8f\x5c\x0b\x10\x92\xfa\xe2\x3f\x34\x7b\xae\x6c\x37\x02\
-\x3f\x1e\xc5\x12\xb1\xf4\x04\x7b\x43\x4f\x0d\x3b\xba\x63\xc8\x4a\
-\xb9\x80\x49\xfa\x1d\x03\x93\x5d\xd6\xa8\xa7\xea\x11\xf9\xb6\x51\
-\xcf\xf3\x9f\x8e\x98\x8c\xbe\xf2\x5c\xb1\x5c\xfc\xf3\x1b\x08\x46\
-\xa3\x49\x16\xdd\x4e\x52\xcd\x73\x48\xff\x7e\x8f\x15\x44\x71\x22\
-\x27\xc6\xa6\x78\x04\x1c\x9d\xf0\x3f\x3c\xea\x14\x70\x58\x73\xa4\
-\x7c\xc0\x20\x6f\x66\x20\x60\x30\x5f\x69\xc9\x01\x54\xc6\x91\x51\
-\xf7\x73\xdb\x86\x83\xee\x70\x7d\x89\x9c\x9f\x76\xba\x1d\xe5\x80\
-\xa5\x59\x0c\x0e\x93\x4d\xf3\xfc\xa6\x6f\xfc\xda\xe6\x31\xe0\xc1\
-\xb5\x72\x1e\x2e\x55\x21\xe2\x89\x5d\x16\xcf\x06\x93\x67\x66\x7a\
-\x5a\x11\x59\x8d\xe7\x3a\xa9\xef\xc5\x03\x25\x81\x28\x8b\xd2\x1c\
-\x00\x09\xb0\xbf\x6f\xf2\xe9\xcf\x86\x85\x4c\x46\x6d\x91\x8c\x73\
-\x8a\x89\x57\xec\x7d\x17\xc4\x48\x54\x26\x7a\xab\xc5\x53\xba\x7f\
-\xf8\xb0\xc9\x8d\x67\x55\xd0\xe3\xc0\x51\x99\x78\x82\x17\x7f\x3d\
-\xc4\xf8\x7a\x78\xc8\x13\x22\x63\xe8\xb0\xe3\xbf\xaa\x33\x01\x5a\
-\x20\x12\x88\xfd\xee\xd5\xae\x19\xb7\xed\xda\x7d\xc8\x7a\x92\xcf\
-\x51\x3c\x0e\x22\xdd\x24\xe9\xaa\xc5\x1f\x61\xec\x1f\xb9\x62\xff\
-\x30\x3e\x8a\x9f\x50\x02\x1c\x87\xd5\x53\xb8\xb3\x6f\x71\x9b\x31\
-\x18\x8e\x91\x2d\x6e\x6e\x9d\xd5\x0f\x68\x84\xa3\x66\xdf\x92\x3f\
-\xee\xbf\xfe\xe1\x26\x93\xfd\x47\x15\x36\x63\xde\x31\x90\x08\x93\
-\x40\xf3\x20\x77\xf6\xd8\x34\x3b\x7a\x81\x85\xc8\x4b\x2c\x89\xb9\
-\x23\x6c\xc4\x19\x78\x64\x64\x22\xce\x62\x2e\x92\x09\xc8\x93\x18\
-\x48\xc5\x81\xb6\x41\x4d\xdf\xa4\x80\x4e\x34\xe8\xd0\x7b\x9f\xdc\
-\x3e\xa2\x11\x70\xea\x8a\x65\x8c\x6f\x87\x9a\xed\xdd\x05\x02\x5d\
-\xc4\xf6\xea\x33\xab\xb7\xe4\xc0\x50\x33\x11\x9a\x87\x14\x04\xf8\
-\x56\xad\x22\x8d\x36\xef\x06\xc3\xe4\x79\x42\x5e\x31\x69\x12\x83\
-\x3c\x71\x94\xea\xa9\xf0\x49\x10\x4b\x7c\x7a\xc8\xda\xdc\x61\x9f\
-\x53\xa9\x90\x89\xb8\x60\xfc\x0d\x10\x73\x12\xd5\x97\xf1\x40\x44\
-\x78\x48\xff\x76\xb7\x05\x44\x48\xb1\x08\x4b\xf4\xea\xa4\x2f\x72\
-\x29\x99\x12\x83\x99\x25\xfa\xe5\xb9\x93\x80\x8e\xf8\xbc\xc3\x71\
-\xcf\xa3\x5b\x80\xfd\x43\x10\x1c\x22\xea\x93\x77\x77\xef\xb8\xea\
-\x8b\x5e\x60\x76\x93\x67\x58\xc8\xb1\x3c\x4f\x9e\xc4\x80\x01\x9e\
-\xb8\xbc\x0d\xd0\x14\x8f\x2c\x3f\x0c\xec\x6f\x1d\x5b\x2a\xc2\x9f\
-\x7e\x36\x2f\x63\x47\xcf\x33\x5d\xe6\x73\xaf\xe5\x46\x17\x09\x44\
-\xd6\xc4\x40\x29\xf3\x39\x27\x64\xcd\x66\x31\xcd\xa2\xff\xce\x7a\
-\xe3\x0d\xf3\x09\x58\xfc\xb1\x07\xa2\xc2\xc3\x86\xb7\xba\xc8\xa2\
-\x79\x48\x39\x03\x7c\x8f\x68\xfc\xcf\xed\x26\xf4\x53\xb1\xc5\x44\
-\xe4\x2c\xb9\xf1\xb2\x16\x95\x20\x4a\xa7\xe8\x47\x1f\x67\xe3\xe5\
-\x2d\xf8\x6b\x9e\xff\xe8\x1b\xcf\xdc\xd1\x83\x45\x59\x73\x9a\x12\
-\xe0\xbb\xc4\xe0\xaa\x6f\x46\x18\xfb\x86\xba\x5c\x41\x42\xda\xe7\
-\x89\xfd\x7f\x5f\x75\x84\x4e\x04\x78\xfd\xca\x36\xf4\xa1\xf0\x6c\
-\x71\xa7\xcd\xc7\xd8\xd9\xf7\x44\xa7\x19\x4d\xc1\xc9\x3c\x32\x24\
-\x3e\xa2\x63\xf7\x56\xed\xee\xab\x39\x6c\x70\x87\x08\xf8\x18\x2f\
-\xab\x1b\xba\xbb\xc1\x40\x8f\xe8\x47\x1f\xe4\xc2\xe9\x03\xb8\x35\
-\xe7\x08\x44\x19\x4d\xa3\xcb\xbe\x1a\x04\xde\x10\xf9\x07\x87\x44\
-\x39\xc0\x49\x61\x73\x05\xff\x32\x3c\xe1\x06\x8c\xe5\x32\x3e\xce\
-\x56\x9b\xe5\x25\x96\x3d\x3d\xd9\x7a\x2f\xb5\x2b\xa8\xcd\xd5\x7a\
-\xde\xbb\x69\x1f\x60\xe1\xf2\x19\x4e\x20\xf7\x0f\x38\xae\x68\x1a\
-\x01\x04\x4d\xdd\x53\x5a\xf5\x20\xdb\x4d\xf1\xa7\x82\x80\xb3\xb9\
-\x4a\x8b\x73\x09\xba\xc9\x09\x49\xf5\x33\x4b\x8d\x5e\xaa\x16\x51\
-\xd3\x89\x22\xed\x77\xed\x94\x67\xe0\x91\x50\xed\x19\xf7\x2d\x6e\
-\x33\x00\x4f\x98\x5a\x43\x44\x1d\x02\x1c\x07\xee\x1e\xfc\x01\xbd\
-\xaa\xe2\xc5\x05\xd1\x30\xf5\x0e\xc9\xa5\x71\xe3\x9d\xb7\xef\x2d\
-\xca\xb1\x61\xfe\x99\x08\x46\xe5\x1d\x66\x60\xa0\xe4\xfe\x09\xd5\
-\x0a\xfb\xe0\xee\xc1\x47\x03\xa8\xf9\x96\xaf\xd1\x60\xa2\x5c\xf4\
-\x37\xdd\xfa\x35\xe6\xd1\x9f\x40\xfe\x30\x60\x97\x7f\xd1\x43\xd1\
-\xe8\xa7\xe0\x0c\xf0\x43\xf2\xc2\xbc\xa9\x44\xf9\x5a\x31\x4e\x95\
-\x49\xdb\x06\xb5\xb3\x5e\x9d\x13\x0e\xb1\xa9\x11\xfd\xbc\x58\xd3\
-\xda\xfd\xb5\x85\xd8\x1e\x6e\xdd\x67\xf7\x2d\x68\x35\xe1\x70\x97\
-\x35\x24\xc0\xa9\xc1\xe3\x3e\x5f\x99\x75\xfb\x34\x39\x0e\x1e\x7c\
-\xbd\x59\xb1\xec\xe5\x79\x7d\x2e\xb2\x17\x02\x2b\x91\x86\x76\xdc\
-\xda\x98\xa3\x71\x60\xd7\x84\x3b\x14\xcd\xea\x30\x87\xf4\x74\x38\
-\x33\x42\x71\x02\x1c\x07\x5e\x1e\xfc\xa0\x47\x78\xc9\x2b\xf3\xbf\
-\x34\x90\xf7\xd6\xb3\x25\x39\xae\xad\x6b\x1b\xf9\x62\xcc\x0a\xfe\
-\x20\xc8\xfa\xa1\x89\x0d\x5d\x64\x5f\xdd\x4f\x31\x02\x1c\x07\x3e\
-\x1e\xfc\x30\xf7\x9e\x0f\x67\x3e\xdd\x4c\xc6\x1a\x2a\x77\x37\x18\
-\x9e\x5a\x79\x10\xa4\x61\xe5\x2c\xf9\xda\xe1\x9f\x7b\xc4\x48\x75\
-\xcd\x43\x5f\x02\x1c\x4b\xe9\x19\xab\x8a\x32\xdf\x29\xcd\x64\x73\
-\xb0\x5d\xb4\xd9\xde\x52\x74\xd3\x87\xb5\x36\x12\x94\x13\x3d\x0e\
-\x95\x20\xba\x69\x65\xdb\x45\xf5\x58\xed\x76\xa1\x9a\xa7\xac\xc3\
-\x62\xd1\x3b\x01\xed\x40\xf6\x8d\xb0\xb3\x9c\xa0\x71\xf2\xe0\x17\
-\x69\x9c\xff\x3e\x43\xef\x98\x14\xb5\xd8\x44\x84\x3f\xf4\xaf\x6a\
-\xcc\xdb\x6f\x69\x2c\xcf\xb3\x62\xa4\x79\x1e\x1e\x9a\xb8\xf0\x9b\
-\x51\xdf\x64\x00\xd0\x11\xf4\x9a\x01\x4e\x84\x98\xbf\xa7\x56\xbb\
-\x30\x13\xdb\xc4\xa0\x73\x58\x7b\xd7\xc7\xb5\x44\x65\x05\x0b\xb3\
-\xdd\xcf\xac\x68\xab\xca\xc7\x6a\xb5\xe7\x1b\x87\xff\xfc\x56\x23\
-\x70\x07\x01\x7d\x41\x5f\x02\xe0\x96\x18\x20\xcc\x4f\x5b\x0a\x1f\
-\xda\x55\x76\xc8\x96\x8e\xdb\x63\x9d\xa7\xf2\xff\xd7\x92\x9e\x4b\
-\xeb\x07\x01\x03\x93\x64\xd4\x1b\x8a\x55\x77\x9a\x47\xc7\x9c\x80\
-\xee\xa0\x3b\x01\x70\x4b\x0c\x10\x66\x63\xf7\xb4\xe7\xbe\x2a\xda\
-\xd2\x8f\x6d\x91\xdd\x55\xc5\x8e\x3b\xe7\x0e\xcc\xab\x18\xc3\x28\
-\xf4\x51\xcd\xf3\xe8\xd0\xc4\x1f\xba\x2d\xb8\x95\xa6\x82\x04\xc0\
-\x05\x69\xec\xc7\x2a\xd4\xeb\xf2\xe4\x58\x5b\x6d\x9c\x13\x92\x2d\
-\x6d\xb9\x6f\xb6\x66\x7f\x65\x4a\xa6\xa5\x66\xae\xd6\x73\x5d\x9d\
-\x61\x55\xed\x28\xa6\x07\x7b\x0e\x4e\x04\x66\xa1\x9a\xc7\x15\x00\
-\x29\x83\x94\x21\xc0\x77\x89\xc1\xb6\x6a\xcd\x45\x59\x78\x64\xae\
-\x36\x9b\x6c\x57\xbf\xb6\x71\x48\xb1\x6d\x58\x31\xb5\xe3\x74\x3a\
-\x51\xe4\xe2\x7c\xc7\xbc\x02\xc7\xa2\x62\x93\x5a\x85\xed\xae\x53\
-\x20\x1c\x6b\xe8\x34\x77\x8f\x3a\x41\x8a\x21\xc5\x08\x70\x1c\x59\
-\xe2\xc1\x6a\x0d\x7e\xd7\x7a\x23\xc0\x36\x2e\xeb\x19\x97\x0d\xd9\
-\x85\x83\x0e\x51\x9f\x23\xdd\xe8\xe1\x9b\xfc\x1c\x6b\x84\x95\x88\
-\xb0\x00\x0b\x51\xa5\xc5\x14\x82\x98\x98\x13\xcb\x12\x86\x4b\x14\
-\xfe\x42\x85\xb7\x40\xe9\x2b\xcb\x9c\x54\x65\x4e\xe2\x51\x65\x1e\
-\x01\x1b\x47\x26\xee\xeb\x34\xa7\x88\xe6\x81\x04\x38\xfe\xdc\x8c\
-\x45\x05\x19\x9f\x96\x65\xf1\xd3\xd8\x20\x85\x71\xc8\x19\x68\x38\
-\x92\x5a\x9a\xe7\xa7\x19\x62\x8a\x3e\x37\x82\xec\x19\x74\x08\x3e\
-\xef\xf9\xd3\x80\x1d\xeb\x0a\xf4\xe4\x44\x30\x1c\x9b\xd1\x62\x68\
-\xf8\xb2\x3f\x95\xa3\x3f\x85\x67\x80\x13\x21\xe4\xfe\xa3\x4a\xbb\
-\x4a\x2b\x49\x19\xf2\x83\x27\x47\x26\xee\xed\x32\x93\xb3\x4c\x03\
-\x24\x00\x41\x50\x8a\x3a\x6b\x34\x95\x52\x3e\xbd\x9f\xf2\x88\x33\
-\x50\xdf\x6a\x04\x93\x01\xf8\xc2\x53\x5b\x02\xfd\x7f\x10\xea\xc1\
-\xc7\x47\xf3\xcc\x3e\x62\xa8\x47\x35\x0f\x8c\xfe\x13\x40\xaf\xb3\
-\x40\xe7\x0c\x02\x3d\xf8\x98\x6a\x9e\x67\x46\x9d\x73\xbf\x19\x31\
-\x3a\xfc\xf0\x15\x43\x09\x74\x66\x20\xc2\x83\x8f\x05\x3a\x26\x83\
-\x35\xa8\xe6\x71\xc2\xd0\x87\x04\x98\x02\x70\xf7\xe0\x27\x11\xd1\
-\x48\x7c\x49\x97\xb5\x71\xc4\x0e\x10\xf8\x22\x21\x01\xce\x45\x26\
-\x66\xcb\x2c\x55\x1a\xa5\x80\x43\xa1\x3e\x3f\x3f\xe2\xbc\xb3\xcb\
-\x0c\xc8\x77\x0b\x09\xd9\xc0\x86\x43\xf0\xb3\x88\x1b\x26\x33\xcd\
-\x6e\x3c\x3d\xf8\xe7\x82\x2e\x57\xb0\xea\x08\xd4\x3c\x67\x0a\xb8\
-\x0a\x74\x86\x24\x48\x6c\x3a\x6a\x63\x7c\xde\xfb\xc2\xa8\x93\xb4\
-\x8a\x22\x16\x8d\x2f\x6d\x33\x56\xed\xee\x87\xd1\x0f\x25\x10\x96\
-\x90\x0a\xbe\xa9\xd3\xce\xca\x48\x27\x55\xa7\x5e\x1a\x9d\xfc\x4d\
-\xa7\x09\x6a\x1e\x48\x80\x94\x4b\x0c\xba\x5d\xc1\xca\x56\x13\x98\
-\xf0\xc1\x97\x02\x25\x10\xbe\x89\xc1\x17\x3d\x37\x1f\xb5\x10\x58\
-\x20\x04\xd5\x3c\x17\xb5\x99\x2b\x51\xcd\x03\xa3\x7f\xca\x1f\x32\
-\xb8\x11\x36\x75\x20\x48\x9b\xdd\xbf\x61\x74\x52\xc9\x65\x35\x48\
-\xf8\x00\xdf\x7d\xb3\x97\xc7\x26\x1b\x0e\x0c\x0f\x8e\x7b\xe1\x7b\
-\x80\x12\x88\x14\x89\x01\x3e\xc5\xb9\x50\xf4\xba\x43\x65\xad\x46\
-\xe0\x80\x5f\x7d\x48\x00\xb2\x01\x63\x0f\x7e\x3c\x1a\x5f\xd9\x63\
-\xdd\x3a\xe0\x20\xfc\x7a\x5d\xda\x00\xee\x03\x24\x15\x26\x57\xb6\
-\xc5\x8d\x91\x07\x7f\x93\xde\x75\x73\x87\x19\x84\x22\x70\x98\xe1\
-\x0c\x40\x7a\x24\xd5\x83\x3f\xe0\x09\x15\xa3\x9a\xc7\x0e\x35\x0f\
-\x24\x00\xb5\x70\xee\x1e\xfc\x58\x62\x65\x8f\xed\xa3\xfe\x71\xa8\
-\x79\x20\x01\x28\x8b\xa9\x7a\xf0\xdf\x30\xb8\xae\x6f\x87\x9a\x07\
-\xe6\x00\x54\x87\xd5\x53\x68\xf3\x9e\x95\x07\x7f\xc8\x13\x2a\x6c\
-\x35\x01\x3b\x5c\xe2\xc4\x1c\x70\x23\x0c\x17\x9c\xb9\x07\x3f\x96\
-\x58\xd3\x65\x2e\xdc\xd5\x07\xa3\x1f\x4a\x20\x9a\xe2\xd4\x1e\xfc\
-\xb7\x8c\xae\xeb\xda\x4d\x20\x18\x85\x83\x04\x09\x40\x77\xfc\xd8\
-\x83\x3f\xe2\x0d\xe7\xb7\x1a\x01\xdc\xd6\x85\x12\x28\x55\xf0\x9d\
-\x07\xdf\xe0\x0b\x5f\xd7\x65\xce\xdf\xd9\x0b\xa3\x1f\xce\x00\x10\
-\x10\x70\x06\x80\x80\x80\x04\x80\x80\x80\x04\x80\x80\x80\x04\x80\
-\x80\x80\x04\x80\x80\x80\x04\x80\x80\x48\x3e\xfe\x4f\x80\x01\x00\
-\x6e\xa4\x67\x1a\x7e\x90\xa7\xe5\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x00\xe6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\xad\x49\x44\x41\x54\x48\xc7\x63\x60\x18\x05\xa4\x01\
-\x57\x86\x4a\x86\x7a\x22\x61\x25\x50\x35\x0e\xb0\x84\xe1\x3f\x89\
-\x70\x31\x76\xd7\xfc\x27\x03\x62\x71\x55\x25\x58\x62\x3f\xd1\x5e\
-\xdb\x0f\x56\x5f\x89\x69\x50\x3d\x58\xa2\x9e\xe8\xf0\xc4\xa9\x9e\
-\xe6\x06\x71\x30\x58\x50\xc3\x20\x0e\x86\xed\x0c\xdf\x19\xdc\x29\
-\x37\x68\x26\x58\x14\x9b\x51\x38\x0d\x72\x00\xc7\x85\x03\x9a\xa8\
-\x2c\xc3\x5d\x1c\x46\x91\x1a\xa6\x0c\x72\x38\x8c\x22\xd9\x20\x90\
-\x51\xf7\xb0\x18\x45\xc0\x6b\xd8\xe1\x3c\x68\x3a\x46\x36\x8a\x40\
-\x60\x13\x82\x08\xa3\x68\x6f\x10\xd5\xbc\x46\xb5\xc0\xa6\x5a\xf4\
-\x53\x2d\x41\x52\x2d\x8b\xd0\x38\xd3\x52\xad\x18\x19\xc8\x12\x92\
-\x6a\x85\x3f\xd5\xaa\x23\xaa\x55\x90\x54\xac\xb2\x47\x01\x76\x00\
-\x00\xeb\x3f\x5f\x2e\x52\x26\x41\x12\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x00\xac\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x73\x49\x44\x41\x54\x48\xc7\xed\xd5\xbd\x0e\x80\x20\
-\x0c\x04\xe0\x5b\xfa\xdc\x2e\x0a\xcf\xe9\x00\x2f\xe1\x4f\x9d\x8d\
-\xd4\x58\xa8\x09\x4d\xb8\x8e\x24\xdf\x70\xc3\x01\x8c\xf8\x0d\x61\
-\x41\x06\x3f\x6e\xd2\x42\x73\x01\xa9\xa2\x56\x11\x52\x52\xdb\x0b\
-\x24\x5f\x46\x00\x59\x40\x0c\x46\xbc\x43\x7b\x35\x94\xac\x20\xee\
-\x1d\x3a\xa4\x07\x21\x4e\x21\xb3\x8e\x9a\xa0\xf3\x0f\xe8\x4b\x2f\
-\x4e\xa1\xa6\x8e\xb8\x3b\x28\x59\xed\x51\xb4\x5a\x48\x42\x28\x7e\
-\x47\xea\xcd\x1e\xf1\x94\x0b\x4a\x26\x39\xb6\x24\x17\xfa\xf2\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\xe8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x44\x30\x34\x33\x46\x35\x32\x42\x39\x31\x34\
-\x31\x31\x31\x45\x45\x42\x31\x43\x38\x39\x37\x33\x41\x43\x35\x43\
-\x36\x41\x36\x35\x46\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x44\x30\x34\x33\x46\x35\x32\x43\x39\x31\x34\x31\x31\x31\x45\
-\x45\x42\x31\x43\x38\x39\x37\x33\x41\x43\x35\x43\x36\x41\x36\x35\
-\x46\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x44\x30\x34\x33\x46\x35\x32\x39\x39\x31\x34\x31\x31\x31\x45\
-\x45\x42\x31\x43\x38\x39\x37\x33\x41\x43\x35\x43\x36\x41\x36\x35\
-\x46\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x44\x30\x34\
-\x33\x46\x35\x32\x41\x39\x31\x34\x31\x31\x31\x45\x45\x42\x31\x43\
-\x38\x39\x37\x33\x41\x43\x35\x43\x36\x41\x36\x35\x46\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x3f\
-\xf8\x7d\x36\x00\x00\x00\x5c\x49\x44\x41\x54\x78\xda\xec\xd7\x31\
-\x0e\x00\x10\x0c\x40\x51\xc4\x41\x38\x54\x4f\xd9\x43\x71\x93\x5a\
-\x2c\x36\xc2\x40\xfc\x3f\x4b\xfa\x06\x43\xeb\xcd\xcc\xdd\x54\x70\
-\x97\x05\x08\x10\xa0\xef\x40\x71\xe6\x91\x88\x94\x13\xc3\x54\x35\
-\x1f\x01\xf5\xd2\xa6\xa7\xf2\x87\x00\x01\x02\x04\x08\x10\x20\x40\
-\xaf\x2e\x68\x2b\xfb\xcc\x6e\x9e\x53\x1a\x10\x20\x40\x80\xc6\x9a\
-\x00\x03\x00\x79\x40\x0c\x27\xed\x96\x95\x5d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x8e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x39\x45\x33\x31\x35\x36\x44\x38\x39\x31\x34\
-\x31\x31\x31\x45\x45\x39\x43\x46\x41\x38\x43\x32\x41\x46\x37\x36\
-\x35\x43\x37\x38\x32\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x39\x45\x33\x31\x35\x36\x44\x39\x39\x31\x34\x31\x31\x31\x45\
-\x45\x39\x43\x46\x41\x38\x43\x32\x41\x46\x37\x36\x35\x43\x37\x38\
-\x32\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x39\x45\x33\x31\x35\x36\x44\x36\x39\x31\x34\x31\x31\x31\x45\
-\x45\x39\x43\x46\x41\x38\x43\x32\x41\x46\x37\x36\x35\x43\x37\x38\
-\x32\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x39\x45\x33\
-\x31\x35\x36\x44\x37\x39\x31\x34\x31\x31\x31\x45\x45\x39\x43\x46\
-\x41\x38\x43\x32\x41\x46\x37\x36\x35\x43\x37\x38\x32\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x28\
-\xe6\x97\x3c\x00\x00\x01\x02\x49\x44\x41\x54\x78\xda\x62\xfc\xff\
-\xff\x3f\xc3\x60\x02\x8c\xa3\x0e\x1a\x75\xd0\xa8\x83\x68\x0c\x98\
-\x48\xd5\x10\x1a\x1a\x6a\x34\xa8\x42\x08\xe8\xa0\xdf\x40\x6a\x02\
-\x10\xd7\xaf\x5e\xbd\xfa\xdb\x80\x87\x10\x10\xb0\x00\x71\x09\x10\
-\x5f\x01\x3a\xce\x75\x30\x84\x10\xba\x86\xc5\x40\x5c\x08\x0c\xad\
-\xb7\x03\x15\x42\xe8\x20\x16\x88\x6f\x00\x1d\x1a\x33\x58\x42\x08\
-\x19\xec\x02\xe2\x0c\x60\x68\xdd\x1f\x2c\x0e\x02\x01\x50\x42\xaf\
-\x07\xe2\x7e\xa0\xc3\xfe\x0e\x44\x94\xa1\x03\x2e\x20\xee\x06\xe2\
-\x53\xe4\x14\x11\xb4\x08\x21\x64\xf0\x87\xd4\x22\x82\x16\x21\x44\
-\x51\x11\x41\xeb\x10\x62\x20\xb5\x88\xa0\x75\x08\x91\x15\xa4\xf4\
-\x00\xa0\x62\x20\x1d\x18\x32\xbb\x07\x3a\x0d\x81\x12\x75\x0f\x10\
-\xeb\x10\xe3\x18\x5a\x87\xd0\x39\x20\x4e\x05\x3a\xe4\xdc\x40\x97\
-\x43\xa0\xec\x5d\x0a\xc4\x66\xa4\x3a\x86\x16\x21\x44\x71\xd5\x41\
-\x2d\x07\xbd\x81\x66\xe7\x25\x83\xa1\xb6\x07\x95\x2d\x1a\xd4\x70\
-\x0c\xa5\x21\x44\x74\x56\xa6\x75\x08\x91\x9c\x95\x49\x02\xa0\xaa\
-\x83\x14\x1c\x12\x12\x62\x44\xaa\x1e\x52\xf0\x68\xbf\x6c\xd4\x41\
-\xa3\x0e\x1a\x71\x0e\x02\x08\x30\x00\x43\x8a\xfc\x01\xa5\xc3\x34\
-\x6e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x6a\x91\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xfd\x00\x00\x00\x92\x08\x02\x00\x00\x00\x01\xf5\x5b\x24\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x45\x34\x43\x32\x43\x44\x45\x45\x39\x33\x31\
-\x42\x31\x31\x45\x45\x38\x33\x44\x42\x42\x46\x46\x33\x31\x37\x42\
-\x37\x37\x37\x46\x37\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x45\x34\x43\x32\x43\x44\x45\x46\x39\x33\x31\x42\x31\x31\x45\
-\x45\x38\x33\x44\x42\x42\x46\x46\x33\x31\x37\x42\x37\x37\x37\x46\
-\x37\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x45\x34\x43\x32\x43\x44\x45\x43\x39\x33\x31\x42\x31\x31\x45\
-\x45\x38\x33\x44\x42\x42\x46\x46\x33\x31\x37\x42\x37\x37\x37\x46\
-\x37\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x45\x34\x43\
-\x32\x43\x44\x45\x44\x39\x33\x31\x42\x31\x31\x45\x45\x38\x33\x44\
-\x42\x42\x46\x46\x33\x31\x37\x42\x37\x37\x37\x46\x37\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x83\
-\xf6\x59\x06\x00\x00\x67\x05\x49\x44\x41\x54\x78\xda\xd4\xbd\x69\
-\xb0\x2c\xc9\x75\x1e\x76\x32\xb3\xaa\xba\xfb\x2e\xef\xbe\x7d\x7f\
-\xb3\xbc\x19\x60\x16\x00\xe4\x00\xc3\x20\x21\x3b\x4c\x99\xa2\x44\
-\x33\x68\x5b\xf4\x12\x56\x48\xb6\x42\x32\x2d\xff\xb0\xe5\xb0\x2c\
-\x07\xed\x90\x4c\x89\x61\x4b\x41\x32\x6c\x4a\x41\x2d\xa4\x28\x4a\
-\x26\x6d\xd9\x84\xc3\x96\x44\x88\x32\x05\xd3\xa2\x48\x91\x26\x83\
-\x02\x14\x04\x48\x00\x43\x00\xc4\x36\x33\x78\xcb\xbc\xe5\xbe\xe5\
-\xbe\xbb\xf6\x52\x95\x99\xce\x73\x32\xb3\x2a\xb3\xaa\xba\xbb\xba\
-\xfb\xbe\x09\xe0\xcd\x8b\x89\xfb\xfa\x56\x57\x57\x57\x9d\x3c\xf9\
-\x9d\xef\x7c\xe7\x1c\xf6\x0f\xfe\xc1\xaf\x3d\x19\xac\x03\x00\x33\
-\xff\xf9\x3f\xda\xfc\x37\xfd\x8f\x3d\x92\x07\xc7\xd7\x0f\x60\x2c\
-\xfc\x81\x81\x3d\x54\x05\x87\xe0\xf9\x39\x03\xa5\x35\x67\xac\xf5\
-\x0c\x5a\xeb\xea\x0c\x8c\xc1\x22\x7f\xf4\x94\xe3\xfd\xd9\x66\xbe\
-\xd7\x5d\xad\xf9\x82\xf6\x32\xdd\xf1\x5c\xc3\x8c\x2b\x59\xee\x3a\
-\x6b\xb7\x6b\xa1\x83\xbb\xbd\x4b\x47\xcf\xcd\xfc\xdb\xdd\x55\xfc\
-\xa1\x79\x06\x06\xcb\x5c\xff\xec\x8b\xb1\x1f\x64\x0f\x08\x9f\x69\
-\xf3\x9f\xc7\xfb\xc7\x9e\xbc\xf9\x71\xe6\xcf\xc6\xe1\x41\xf2\x68\
-\x7d\xeb\xa0\x3f\xe8\x7e\xae\x2e\xf7\x1d\xad\x96\xd9\xb5\x81\x7f\
-\xfd\x71\x32\x7e\x0c\x73\xce\xb0\x8a\x4d\x4c\xfb\x6d\x97\xb3\x49\
-\x86\x26\x2e\xc8\xd0\x2b\x5b\x67\x53\x57\x66\xf7\x33\x2f\x6d\xf1\
-\xa1\x17\x58\xf0\x83\xea\x76\x5f\x7b\xbd\x34\xc7\x15\x8d\x8f\x73\
-\x0e\xdf\x38\x7f\x64\x9a\x26\x89\x92\xdd\x57\xcf\xb4\xfb\xee\x1c\
-\x24\xfd\x56\xf9\x57\xb8\xf3\x95\xe6\x05\x65\xd6\x81\x66\xed\xeb\
-\xa7\xf5\x19\x2f\xf1\x18\x96\x33\x7a\x4e\xf6\x4d\x97\xe8\x5e\x49\
-\x15\x5e\x34\xd3\xf6\xfa\xdb\x8d\xbe\x75\x53\x5a\xd4\x15\x75\x7f\
-\xd7\x94\x8b\xd7\x8b\x7a\xc0\x69\xf7\x6a\x69\xa3\xff\xc6\x32\xf7\
-\xf2\x4f\x52\x14\x89\xc6\xa7\xa0\x3b\x6e\xac\xd3\x6e\x90\x45\x2d\
-\xb2\x44\x19\xda\x79\x7a\x85\xbf\x42\xa3\xc2\x17\xf0\x53\x3a\x39\
-\xc8\x70\x4f\x5c\xc1\x2c\xa6\x6e\x7c\xf5\x87\xa7\xd1\xb0\x85\x8e\
-\xb6\x7b\x77\x42\xd6\x75\xb1\x75\xbc\xda\x70\xc7\xef\xee\xec\xa7\
-\x9c\x5f\x77\xf7\x05\xab\xb8\xf3\x19\x9e\xa8\xfb\x33\xfa\xba\xfa\
-\x63\x2e\x3b\xe9\x78\xef\xe6\xa3\x1a\x56\x7f\x10\xca\x3d\x1b\x32\
-\xab\xd8\xc3\xcd\x85\x83\x0b\xf9\xf8\xb9\x4b\x28\x3c\xa0\xfe\xa8\
-\x68\x3f\x4a\x54\x79\xf5\x4c\xb1\xe3\x59\x69\x35\x20\x54\xbb\x9e\
-\xc5\x77\x27\xb6\xa8\xad\x37\x2f\x63\xb9\x2d\x74\x96\xbf\xfb\xc6\
-\xb4\x7b\x74\xf9\x95\x6f\x5b\x7c\x2f\x2e\xef\x0b\xd7\x51\x24\x2c\
-\xa3\x35\xa0\x11\xe3\x18\xe3\x67\x7c\xc6\xc9\xc2\xe8\x67\x51\x67\
-\x3f\xd7\xe2\xe7\x9e\xcd\xe0\xb0\xd0\xd5\x1f\x8b\x83\xaf\x1d\x30\
-\xfb\x3a\x9b\x77\x3b\x78\x3b\xeb\x82\xfb\x9b\xd7\xb3\x90\xb3\x67\
-\x53\xd8\x85\xaf\x4f\xe3\x5e\xe8\xc2\x5a\x6f\xce\x54\x9c\xd3\xc5\
-\x9f\x85\x8c\x4d\x75\x35\x40\x9b\x88\x7b\xbf\xc4\x9f\x34\xda\x7c\
-\x17\x0f\xba\xa8\xa7\x5f\x71\x97\xe7\x55\xf0\xaa\x59\x07\xa8\xba\
-\xd0\x15\x9a\xbb\xda\x05\xfe\x86\x0b\x7e\xca\xc9\xa7\xc5\xa6\xd5\
-\xde\x58\xf3\x1a\x4b\x98\x51\x17\x8e\xe1\x5d\x03\x21\x73\x3f\xd1\
-\x5a\xac\xbd\xbd\x1d\x1d\x50\x78\x4e\xf3\xf3\x54\x7f\xdf\xd1\xb0\
-\x54\x19\xd1\x56\x70\x99\x53\x08\xab\x1c\xbc\x5f\x19\xab\x2c\xbd\
-\x26\xa7\x46\x63\x01\xb2\x17\xf6\x12\x17\x59\xe4\xc7\x15\x67\xaf\
-\x6e\x5b\x5d\x42\xaf\x69\x3e\x32\xdc\xb8\xde\x65\xcb\xee\x12\x2b\
-\xdb\xab\x0a\x4d\x36\xb4\xef\x85\x62\x24\x7b\x73\x6a\xcb\x23\x59\
-\x7a\x89\x73\xb2\x18\x3e\x95\x3a\x50\x9e\xb0\x67\x2b\x9a\x69\x6d\
-\xc9\x76\x39\xdb\x8c\x63\x2c\xaf\x5a\x45\xb1\xcc\x11\x4d\xec\x38\
-\xdc\xfc\xa2\xd7\xb9\x84\x37\x3c\xc6\xa5\x72\xbc\xee\x7c\x1a\x30\
-\xee\x0e\x98\x67\x3b\x9a\xd9\x40\x71\x06\xf8\x2c\x4f\x65\x7f\xab\
-\xe9\x4f\xb2\xc4\x2e\x53\x22\x92\x56\xa3\xd7\x25\xaf\x63\xfc\xa9\
-\xd6\xb3\x4f\xd6\xd1\xa4\x56\x77\xb4\xf6\x7e\x08\xb7\xd6\x0d\x9c\
-\xd7\x4c\xe1\xc5\x99\x28\x56\x31\xc7\xd3\xaf\x8e\x6d\x8e\xdd\x98\
-\x8e\x1d\x3f\x94\x9e\xf2\xd8\xdd\x7c\xab\x8d\x76\x4c\xf8\x3c\x8d\
-\x6b\x98\xfd\x40\x93\x85\xce\x3b\x0d\xb0\x32\x1b\xba\x3a\x60\xa3\
-\xe3\xcf\x58\xf8\x6c\xdd\xa3\x93\xee\x1e\x52\xf8\x84\x2b\x6d\x53\
-\xb4\x87\xf2\x0a\xed\xf0\x63\x35\xfa\x65\xcf\xa3\x8f\xf1\xe9\xce\
-\xbe\xcf\x4f\xc3\x04\x97\x46\xcb\xef\x72\x34\x4c\x3f\xf1\x44\xd7\
-\xcd\x74\x3e\xed\xd0\x7c\x4a\xda\x29\x1b\x54\x17\x86\xbe\x96\xb5\
-\x5e\x20\x7a\xee\x60\x58\x76\x71\xb0\xf8\x3a\x5d\x06\x4a\xbb\x7f\
-\x86\x84\x34\x9b\x77\x85\x73\x2f\xb2\x3b\xd6\x9c\x77\xaa\x95\x08\
-\x99\x19\xa0\x76\x15\x42\x26\xbc\x86\x30\x8c\xfe\xfa\xdc\xd3\x3a\
-\x7e\x27\xc9\x54\x52\x66\x23\xbb\x20\x30\x3e\x8d\x59\xa8\x2c\x9e\
-\x75\xe7\x16\x8e\xe5\x98\xda\x92\x30\x3f\x08\xf2\xe7\xe5\xa3\x16\
-\x25\xa0\x67\x0b\x3b\xe6\xee\xa9\xa5\xd9\x47\x4e\x37\x94\xa9\x5c\
-\xcd\x42\x6c\x5d\x33\x74\x5b\x45\x2f\x34\x17\xbd\xbc\x6b\x16\xbf\
-\x4a\xf2\x61\xea\xb3\x60\x72\x43\x16\xc9\xc2\xcc\xc3\x54\x5f\xa5\
-\xe7\x60\xa1\xa7\x73\xb3\x6a\xa7\x35\xa0\x25\xd1\x91\x02\x6e\xa1\
-\xcb\xe8\x18\x84\x2d\x11\xab\x2d\xf1\xf5\xbb\x78\x90\x25\x56\xe9\
-\xd3\x80\x52\x8b\x9e\xb9\x49\x2b\xd5\x6e\x6f\xf9\xdd\x9b\xa6\x3f\
-\x63\x6b\x6d\xee\x48\xf5\x2c\x0a\x40\x5f\x25\x4f\xd2\x41\x32\xf7\
-\x2a\x45\xe5\x98\xcc\xbb\xa4\x76\x96\xaf\xe2\xc3\x74\xc7\xfb\x58\
-\x7e\xab\xe5\x02\x89\xfa\xed\x0b\xa4\xa3\xaa\x54\xda\xc4\x6e\x54\
-\x77\xcb\x8f\x76\x04\x24\x5d\x8c\x7e\xda\xd3\x9a\x86\x6d\x56\x90\
-\x9d\x2d\xe9\x17\xe7\x2e\xfe\xe3\xdd\x28\x20\xd6\x77\x35\xcf\xdf\
-\x62\xa0\x53\x8e\x84\xce\x72\x46\x65\x50\x3c\xa6\x21\xcd\x39\x94\
-\xe4\x28\x1f\x4e\x55\xa1\x78\x76\x2b\x5b\xfb\x2d\x99\x26\x33\xbe\
-\x67\x05\x9a\x63\x8f\x4e\x2f\xa8\xe6\xb1\x4a\xa9\x63\x97\x58\xce\
-\x81\x37\xc1\x35\x71\x62\xe1\xb9\xae\x6f\x49\xec\x98\x74\x9a\x73\
-\x7d\xf0\x4c\x07\x3f\xcd\x28\xd9\x72\xb0\xa4\xe9\xe6\x97\xbe\xab\
-\x35\xca\xe5\xb8\x44\x81\x35\x7a\xb1\x7b\x9c\x06\x6d\xb2\x8e\x25\
-\xbe\x97\xd0\xc6\x1c\xa1\xe0\x5c\x28\x9e\x12\x0e\xdf\xef\x65\xbf\
-\x95\x6c\xfc\xd4\xa8\x07\x0f\x8a\x84\xb7\xf1\xeb\xcc\x8b\x2b\x63\
-\xa3\xd7\xde\xc0\x5a\xf0\xce\x8c\xf4\xe4\xd3\xe3\xcb\x6a\xfc\x23\
-\x5f\x0a\xb4\x2c\x11\x2f\xce\x7d\x60\x4f\x03\x54\x94\x46\xb9\xca\
-\xfd\x6c\x66\x18\x16\xc5\x63\x4b\xf0\x36\xc7\x4e\x55\x77\xe3\xf1\
-\x32\xc5\x64\xa2\xf3\x3e\x66\x27\xc5\x1b\x6b\x6b\x7f\x51\xf7\x61\
-\x27\x83\x3d\x80\x61\xda\x8e\x73\x78\x8b\x98\xc6\xd2\x94\x7c\x51\
-\x0c\xba\xe8\x73\x9a\xbd\x65\xd7\xce\xc6\xa7\x26\xce\x16\xb8\xdd\
-\x33\x3e\xae\xa3\xd6\x60\x95\xc7\xd6\xf1\x8d\xf6\x32\x8e\x11\x7e\
-\x2c\xbd\x44\xa7\xd2\x74\x5f\x4f\x94\x0d\x3a\x69\x96\x0f\xa4\xca\
-\x39\xbf\xd3\xcb\xfe\x65\xb2\xf1\xb3\x87\xc6\xe8\x35\x8c\xcc\x16\
-\x80\xea\x99\xa4\x76\xdd\x82\xb5\x2a\xb3\x58\xa5\xa8\x07\xb9\xba\
-\x7b\xe8\xb2\xcd\xe9\xe0\x23\x2b\xce\xa8\x33\x83\x56\x3d\xe0\x10\
-\x0b\x69\xa7\xb3\x77\xea\x0c\x36\xeb\x0a\xbb\x13\x94\xc1\x01\xfa\
-\xd8\x2d\xfe\x18\x7d\xe1\x62\xcf\x22\xfc\xd9\xae\xba\xa0\x18\xed\
-\xeb\xf5\x8f\x64\x3a\x41\x08\xce\x54\x4f\xcb\x42\x24\x6f\x65\xeb\
-\xff\x1d\x0c\xe0\x11\x87\x5d\x0d\x93\xb2\x02\x2a\xce\xd7\x72\x67\
-\x1c\xcd\x2c\xab\x0e\x4c\x48\xaf\xbe\xf1\x4d\x73\x69\x35\xd7\xcb\
-\xfd\x47\x2a\xbf\x26\x6d\xba\x41\xcd\xbc\xfd\x21\x21\x50\xb3\x44\
-\xcd\x99\x64\xc8\x72\x66\xfa\x78\x0c\x65\x15\x5c\xde\xfd\x9e\xac\
-\x68\xf7\x4b\xba\x76\xce\xa1\xa9\xe8\xfa\xba\x36\x7a\xf3\xac\x2d\
-\x89\x9d\x27\x3a\xdb\xc9\xb2\x8f\x65\x1b\x3f\x7f\x98\xc0\x43\x06\
-\x63\x56\xd9\x01\xfd\x50\xd9\xbd\xf0\x5f\x4f\xe1\xd7\x6b\xda\x77\
-\xf5\xca\x5c\xf2\xa1\xa3\x35\xb4\x56\x5b\xd6\xf7\x1f\xa2\x68\xb0\
-\xf6\x8f\x98\x25\xa1\x51\x09\xc7\xd9\x1c\xc7\x5a\xfb\x68\x55\xbd\
-\xee\xa8\x7d\xe9\x35\x0b\x4b\x73\x1a\x8b\x02\x86\xa5\xa5\x16\x4b\
-\x14\x73\x2d\x57\x06\xf5\x0d\x9b\x87\x0a\xbf\xbc\xda\x54\x70\x98\
-\x8a\x8f\x0f\xd6\xff\x6a\xbe\x0e\xf7\x01\x0e\x00\x81\x8d\x62\x95\
-\xf7\x2e\xed\xde\x61\x5c\xbf\xed\x7b\x9e\x71\xaa\xdd\x77\x31\xeb\
-\x2e\xcc\xda\xdc\xf3\x08\x40\xfd\x32\x73\x30\x0b\x0f\x2b\xe2\x48\
-\xb6\x46\x9f\xb6\x2e\xc5\x82\x6c\x9d\xfb\x55\xc4\xc8\x89\x89\xe9\
-\x95\xf3\x8b\x72\x0e\xfe\x6b\xce\xaa\x0b\x59\x34\xb0\x5b\xba\x8c\
-\x6b\x19\x5b\x9f\x22\xa1\x61\x7e\xdb\xff\x06\x28\x2e\x21\x3f\x68\
-\x1e\xb1\xe0\xf2\xed\xfe\xe6\x2f\x88\xb5\x5f\xda\x4f\x60\x07\x1c\
-\x9a\x67\x3a\xb4\xf8\xc8\xdf\xd3\xf7\x27\x37\xca\xec\x5d\x68\x95\
-\x10\x77\x32\xf7\x95\xa0\x8e\xf7\xcd\x89\xd5\xd2\x78\x0e\x52\x54\
-\x9e\x3b\x66\x85\x59\x15\x00\xcc\x10\xd9\x57\xf4\xaa\x0e\x8f\x3f\
-\x1e\xe6\xa1\x3a\xf5\x74\x20\xb0\x62\xe5\xc7\xb1\xef\x0f\x15\x69\
-\x31\x7d\xd7\xd2\x4f\x39\x3b\x3b\x2d\x1b\x3d\x4d\x75\xdc\xf4\xc2\
-\x1c\xf7\x6e\xae\x30\x43\xaf\x05\xe4\xc3\x84\x7f\xb2\x7f\xfa\x47\
-\xf3\x1e\x3c\x62\xb0\x0b\x88\xe6\xb5\xb7\x12\x5d\xc7\xec\x89\xad\
-\x12\xb4\x3d\x33\x34\xab\xbb\xf6\x45\x79\x98\xe3\xe2\xe6\x19\x15\
-\xe9\xb6\x1a\xf1\x42\x3b\x3b\x63\x71\x3d\x7b\xa5\xca\x58\xc0\x3a\
-\x9b\x29\x98\x63\x37\x85\x55\xd8\xf7\x45\x51\x4d\xb8\x39\xb0\xb9\
-\x8a\xd9\xa7\xed\xa9\xa7\xe4\x01\xe7\xe1\x05\x96\x1b\x6b\x47\xe8\
-\x5b\xac\xc9\x9c\x43\x76\xa7\xbf\xf1\x13\xd9\xda\x1b\xbb\x02\x76\
-\x14\x8c\x84\xeb\xdd\xa1\xa7\xd1\x0d\x3a\x11\x5e\x93\x49\xb8\xb7\
-\xdc\x09\xda\x11\xf4\x54\x9f\xba\x38\xcb\x36\x13\x48\x00\x27\x0b\
-\x5d\x88\xe3\x9b\xf6\x27\x35\xb1\xbd\x9e\xb5\x6c\x3a\x5c\xcf\x53\
-\x61\xe5\x8f\x25\x91\x37\xfb\xbb\xcf\x4d\x76\x3e\x55\xa3\xef\xa8\
-\xc5\xef\xe8\x6e\xa2\x80\x8d\x15\xa9\x59\xef\x9a\xa5\x5a\xee\xa7\
-\xd9\x27\x7a\x27\x7e\x62\xdc\x83\x77\x38\x1c\x21\x14\x76\x8c\xe3\
-\x34\xef\x4d\x22\xf4\xa4\xe1\xfb\x74\x77\xd2\xe6\x69\x92\xaf\x8c\
-\xaf\xba\x78\x2a\xaf\xc6\x57\x8b\x43\x16\x75\xf0\xdd\x6b\x18\x56\
-\xf1\x91\x4f\xf5\x23\x9e\xd2\x96\x75\x7c\x35\x2e\x59\x4f\xe5\x63\
-\xa1\xbf\xd4\xdb\xfc\xbf\x60\xed\xb7\x1f\x0b\xcc\x46\x8d\xa1\xb2\
-\xf8\x1a\x07\x19\xda\x56\x6e\x40\xff\x38\x09\x5e\x96\xf1\xc6\xc0\
-\x5a\x69\xc1\x63\x64\x2a\xc2\x2d\xc8\xf5\x69\xb2\x65\xb8\x88\xdb\
-\x34\xcc\xac\xe1\x7f\x77\x4a\x42\xa7\xc7\xb8\x7a\x86\xb9\x77\xf1\
-\xc1\x8b\x2a\x23\x66\xbf\x9d\x3d\x35\x27\x35\xad\xe0\xfd\x5d\x5e\
-\x54\xd6\xcb\x1b\x03\xe9\xa1\xf8\xc0\x20\x7b\xbe\xd3\xcb\x3e\x95\
-\x0e\xfe\xc6\x28\x85\x27\x1a\xf6\x59\x95\x55\xd2\x53\x10\x8e\x2b\
-\x01\x2c\x60\x13\xe0\x12\x4f\xe2\x05\x52\xae\x11\xb6\x84\x5b\x5d\
-\x32\x74\x0b\xb0\x3b\x2f\x55\x11\xf3\x04\x77\xb3\x05\x45\x1d\x8d\
-\x69\xb6\x09\x76\x38\x9b\xae\x85\xfb\xc7\xee\x83\x17\x15\x26\x1c\
-\xbb\x39\xd6\xda\x52\x84\x05\xdd\xef\x76\x24\xa0\x13\xc9\xd5\x44\
-\x18\x2f\xdf\x7f\x6b\xb0\xf6\xdf\xb0\x14\x76\x38\xec\x08\xf4\xdf\
-\xd2\xb1\xef\x95\x15\x57\x7d\x61\xb4\xc5\x0f\x50\x28\xe8\x4f\xe0\
-\x12\xc0\x06\x87\x9b\x2a\x81\x48\x5f\xc9\x16\x72\x9c\x2b\xde\x65\
-\xdb\xce\x80\xe2\xce\x18\x6f\xb1\x25\x63\xb8\xee\xd9\xdc\xd9\xe7\
-\x99\x92\x2d\xd2\xd3\xd7\xec\xd3\xba\x57\xcd\x5c\x1e\x4c\xbf\x49\
-\x4f\xc9\x07\x2f\x54\xbd\xfe\xf4\x42\x79\xce\xf4\x40\xb3\xdd\x74\
-\xf0\xff\x65\xeb\xff\xcb\xd1\x00\x1e\x29\x18\x26\x55\xf7\x82\x69\
-\x85\x0c\xca\x52\x99\x23\xb8\x9c\xc3\xd9\x04\x76\x7b\x70\x83\xc3\
-\x5e\x9a\x60\x77\x1b\xbd\x30\xa6\xaf\xd5\xea\x76\xe4\xd7\x6a\xc6\
-\x54\x6a\xe5\x4b\x6d\x44\xf7\xb3\xb5\xbe\xde\xb1\xbc\xa8\xa3\x9a\
-\xb2\x71\x1e\xdd\x6a\x67\xdd\xbb\xcd\x2d\xda\x01\x4e\x4d\x11\x93\
-\xd6\xda\xe6\x2c\xf7\x11\xc7\x4b\xa4\x2e\x0b\xf7\x3b\xed\xa5\x40\
-\xbc\x76\x2e\xe0\x73\xd9\xe6\x8f\xe5\xbd\x27\xdb\x00\x7b\xc6\x9a\
-\x13\x34\x68\x3d\x45\x27\x69\xcd\x19\x33\x56\x13\x38\x53\xc0\x85\
-\x04\xf2\x35\xb8\x0d\x98\xb8\x55\x18\xfb\x26\x1c\x8a\xa0\xa7\x65\
-\xa7\xed\xb5\xa3\xa6\x74\xda\x5b\x78\x50\xd2\xaa\xe3\x0f\x99\x5d\
-\x4f\x70\x5c\x22\xe7\x8e\x0f\x98\x5e\x99\x5f\x0f\xb5\x3a\x6f\x53\
-\xeb\x96\x51\x96\xed\x4f\xcb\x28\xb3\xe9\x4f\x61\xc5\x7e\x80\xc7\
-\xeb\xbf\x97\x3b\x1f\x99\x86\xb3\x68\xae\x85\x00\x59\xf0\xfc\x41\
-\xba\xfe\x29\x36\xf8\xa9\x43\x0e\x8f\x35\x1c\x89\x2a\xbd\x54\x8a\
-\x58\x4a\x78\xe3\x7a\x38\x31\x98\xe4\xb0\xa6\xe1\x32\x83\xb5\x3e\
-\x3c\x56\xb0\x6b\xe0\x10\x29\x2f\x24\x52\xfb\x89\x66\x0b\xa7\x18\
-\x97\xf6\x2b\xf5\x1e\x1e\x00\x1d\xc9\xca\x15\x0a\xf9\x16\xdb\x31\
-\x8e\x9d\xa3\x5c\xf4\x6c\x5d\xba\x67\xad\xae\x46\x3e\x76\x8f\xde\
-\x3c\xc7\xd2\x1b\x8f\xd0\x52\x32\xae\x40\x64\x4a\x0b\x98\x8c\x92\
-\xec\xcd\x74\xe3\xcf\xcb\x1e\x3c\x02\x38\x50\x30\x16\xce\xbe\x55\
-\x9b\x4a\xce\x2e\x03\x63\xd9\xe9\x08\xae\xa5\x70\x4a\x62\x02\xeb\
-\x86\x79\x51\x81\x4c\xf0\x75\x49\xc1\x40\x31\xa5\x3f\xe6\x5c\x25\
-\xfd\x22\x91\x96\xf3\x50\x2d\x46\xdf\x39\xb6\x9b\x0b\xeb\x17\xad\
-\xa8\x9a\x49\x9b\xe8\x63\xb1\xa4\xe3\xed\x84\xb5\xf4\xfd\x7f\x4a\
-\x46\xcf\xe7\x37\xc0\x5b\xf2\x92\x24\x25\x2d\x53\x28\x04\x97\xdb\
-\xbd\xde\xcf\xb3\xcd\x8f\xed\x26\x18\xc2\x8e\x8d\xbd\x0a\x87\x8f\
-\x15\x6b\x27\x6d\x0a\xe4\x29\xe1\xac\x82\x73\x29\x4c\x14\xdc\x22\
-\x2c\x64\xdc\xbc\xcc\xdc\x16\xa2\xf0\xf7\x91\x0e\xf9\x78\xa9\x9b\
-\x12\x96\x71\x4f\x48\xaa\x00\x89\xe9\x45\x4e\xd8\x8a\x40\x5a\xcb\
-\x79\x96\x78\xba\x4b\x24\x3b\x9f\x46\xa0\xef\x96\xee\xbc\x73\xd6\
-\x1a\x03\xbe\x6b\x7e\x9d\xb1\x63\x70\xe4\x5d\x57\x94\xe6\x99\x9e\
-\x1c\x64\xc9\x67\xb2\x33\x7f\x69\x9c\xc0\x63\x4e\x68\xde\x93\x2f\
-\x82\x42\x55\x15\x5b\x7c\x09\x7b\x36\x72\xb8\x62\xa2\x46\x01\x0f\
-\x14\xec\xa7\x1e\xf0\xd0\x45\x17\xcc\x6d\x05\x6a\xba\xbf\x3f\xae\
-\xbb\x26\xe2\x1a\x11\xf7\x08\xf5\x1c\x9f\x3a\xb7\xd9\xd0\x42\x25\
-\x42\xb3\x69\xca\x72\xfe\xc7\xb1\x18\x7d\x77\x13\xaf\xae\xa1\xc3\
-\xf1\x70\x7c\xfd\x11\x16\xb2\x75\xa5\xca\x65\x16\xb9\xf0\x63\xbc\
-\x0a\x0b\x55\x0c\xa4\x19\x52\xc6\x7f\x20\x21\x4f\xe4\xdd\x6c\xf0\
-\xcf\x60\xed\x1f\xee\x64\x58\x29\x32\x0e\xb8\xf9\x4a\x95\xee\x0b\
-\x29\xb8\x8f\x5f\x53\x09\x57\x24\x6c\x0a\xd8\xe5\x88\x6d\x0a\xa2\
-\xfb\x95\x45\x35\x9e\xd5\xa9\xec\xde\xe0\x7b\x4f\xca\x76\x6c\x9e\
-\x33\x03\xdc\x97\xe5\xef\xa0\x7d\xfb\xe3\xb6\x03\x15\x4d\x55\x68\
-\x25\x70\x22\xe9\xc8\xcc\x5e\xe1\xab\x90\xd9\xcd\x88\x50\x6b\xb5\
-\xa2\x17\xef\xde\x14\x28\xfa\x8e\x8b\x50\x61\x0b\xdd\x84\x25\x76\
-\x9e\x38\xb0\x0e\x6f\x94\x7d\x9e\x95\xf5\x1f\x8b\xcb\xe7\xc0\xca\
-\x88\x74\xc8\x45\xaa\xf3\x75\xad\x76\x7b\xc9\xa7\xd3\xf5\x1f\x19\
-\x59\xf3\x65\xe8\xa4\x21\x48\x45\xe9\x5a\x6c\xaf\x11\xaf\xeb\x02\
-\xce\x49\xb8\xcc\x61\xa4\xe1\x16\xa5\x63\x4b\x72\xd3\x1a\x7d\xe1\
-\x9b\x56\xca\xd2\xee\x49\x97\xd6\xa9\xc3\x7d\xb7\x86\x6f\x9c\xba\
-\xf0\x39\x50\x1f\x6b\x7d\x23\xd5\xc0\x0c\x19\x60\x87\x6e\x05\xb3\
-\xbd\xf8\x71\x61\x80\xb9\x39\x9a\xe5\x7a\xcb\x2c\x57\xcb\xb2\x50\
-\x83\xce\x45\x1b\xd1\xc5\x5e\x9c\x35\xfd\xba\x5f\x06\x9d\xfc\xbd\
-\x5d\x24\xe1\x5a\x6d\x4d\xbe\xab\x8a\xd3\xd3\x7d\x2d\x4d\x0c\xf7\
-\x76\xba\xfe\xa3\xbc\xf7\xa6\x81\xf2\x8f\x99\x33\x5f\xed\x1d\x7c\
-\x0d\xca\x33\xf2\xe5\x85\x82\x13\x06\xd8\x08\x48\x39\x4a\xed\x0f\
-\x7b\xce\xbe\x11\xd3\x2b\xd0\xdc\x96\x14\x06\x2f\x96\x3f\xeb\xa4\
-\xa3\x0f\x80\x99\x6d\x8c\x44\xd0\x87\x4c\xb2\xaa\xab\x08\xef\xec\
-\xaa\x17\xea\x00\x3a\xa3\xdd\xfb\x6c\xa3\x9f\xde\x14\x5f\xb7\x42\
-\xff\xd9\x95\xbe\xb0\xa0\x50\xbe\x7b\xf0\xbd\x3c\x63\x36\xf3\x9a\
-\xa7\x03\x45\x08\xc1\xcc\x2a\xee\x9c\xb1\xf2\x6c\x3a\x58\x03\xe5\
-\x39\x59\xa9\x85\xd3\x5c\x61\x7f\x56\xfc\x97\x3a\xca\xb2\x5f\xcf\
-\xd6\xff\xf6\x61\x86\xa4\xcd\x88\x39\xa5\x0d\x6f\x78\xfa\xf2\xc2\
-\xcc\xaa\x10\x63\x78\x06\xe0\x74\x02\x4f\x00\xde\x21\xae\xc6\x58\
-\x74\xc1\xbd\x77\xe7\xce\xd9\xeb\xc0\xd3\x4b\xff\x73\xce\x92\xd9\
-\x18\xba\x63\xf7\x12\x1b\xb3\x26\xad\xbd\x75\x56\x0b\x61\xa7\x5d\
-\x4c\x6b\x5c\xdb\x4d\xad\x05\x6d\xad\xbf\x17\xe0\x37\xdb\xab\x34\
-\x66\x1b\x74\x87\x83\xa6\x0d\xfd\x5b\x94\xae\x5d\x3a\x61\xf4\x34\
-\xe0\x7b\x50\xad\x6d\x6d\x56\x72\x9d\x1a\xd0\x2d\x09\xe9\xf6\x14\
-\x52\xf4\x5f\xed\x0f\xfe\x8a\x5c\xbf\xf5\x80\xc1\x9e\x84\xb1\x6d\
-\xf9\x41\x96\x24\x63\x5b\x2f\x4d\x5f\x8e\xe0\x54\x0e\x57\xfb\x68\
-\xfd\x37\x85\xd3\xd9\x5b\xde\x46\x41\xdd\xdc\xc3\xff\x57\xd6\x2f\
-\x13\x7e\x4c\xea\x2e\x5b\x12\xc5\x1b\x4d\x17\x56\xd7\xe5\x2f\x34\
-\x15\x67\x1e\x1f\xf5\xee\xc5\xaf\x95\xb1\x2e\xa8\x2d\x5d\x42\x6f\
-\xf7\x34\x38\xd3\xe3\xa5\x47\xfd\x0e\xc6\x34\x47\x85\x00\x57\xa2\
-\xaf\xc7\x93\x64\xf0\xd1\xde\xfa\x47\x8c\x9b\x7f\x60\x50\x0a\x0b\
-\xb2\x51\x2c\x72\xf3\x65\x38\x9b\x4b\x58\x63\xf0\xbc\x80\x35\x0e\
-\xb8\x4e\x12\x7c\x55\x6a\x74\xf3\x2a\x00\xf1\x3a\x76\xf0\x25\xc8\
-\xb1\x0b\xc9\x40\x20\xa9\x16\xe3\xef\x67\xf0\x36\x89\x76\xb3\xa2\
-\x5a\x22\xdd\xa5\x3c\x7d\xd8\x29\xee\x38\x58\x6d\xd6\xc8\xbf\x2e\
-\x46\x32\x2e\x77\x67\x3a\x82\x93\x85\x4c\xaa\x9c\x89\xd0\xb9\x3e\
-\xe1\xeb\x42\x8d\x4c\x9c\x47\xc2\x95\xe2\x6c\xc2\x79\xf2\x95\xec\
-\xd4\x9f\x53\xbd\x31\x8a\x0e\xc0\x69\xcb\xa4\x77\x99\x2a\x76\xf0\
-\xd6\x9a\x19\x31\x36\x17\x0a\x38\x4c\xe1\x16\xb9\x79\x65\xb9\xf9\
-\xc0\xdc\x8b\x7a\xfc\x5a\x5f\x03\x76\x51\x8d\x92\x64\xf6\x9d\x9d\
-\x0f\xfd\x1d\xe7\x3a\xcb\x62\xe6\x62\xfa\x19\xe2\xca\xd9\xd5\x68\
-\x0b\x6d\xb8\x1e\xc2\xea\xd9\x9c\xe6\x5c\x06\x7d\x51\xcf\xcd\xe6\
-\x1d\xb6\xe8\x30\xaf\x2e\x9c\x66\x98\xec\x5b\x19\xaf\x47\x77\xa6\
-\x0c\x5b\x97\xf1\x20\x6c\xcc\x81\x3f\xee\x6f\xfc\x2a\x5f\xff\xdf\
-\xf6\x28\x1b\x35\xa4\x64\x93\x0c\xfc\xba\x0e\x1b\x01\x58\xf3\x95\
-\x70\x62\x88\xf9\x57\x96\xc2\x3b\x02\xcc\x39\xa4\xd7\x60\xe6\xde\
-\xd0\x21\xe0\x6d\x9c\xc5\x5b\xb6\x27\xe6\x73\xcc\xf1\x13\x80\xad\
-\xdd\x64\xb6\x7b\x6b\xd2\x35\x21\x7c\xe7\xe0\xba\x67\xf2\xa7\xe4\
-\x1e\x8e\x89\xbc\x8f\x4b\x60\x17\xde\x2e\xba\xdb\x3d\x5b\x90\xf4\
-\xec\xc8\x48\xc2\x82\xda\x84\xda\x36\xb9\x90\xdd\x97\xac\x65\xeb\
-\xe5\x75\xdc\x33\xb9\xeb\x0a\xcf\x7c\x71\x85\x41\x37\x4a\xe0\x0c\
-\x31\xfe\xc5\xde\xfa\x7f\x5d\x64\xa8\x1f\xde\xa5\x8c\x92\x75\xc0\
-\xaa\xc9\x2f\x78\xf6\x3d\x33\x16\xcf\xe1\xe4\x00\x76\x18\x3c\xb1\
-\xe6\xce\x22\x1c\x5f\xc4\x08\xc7\xbe\x52\x78\xa3\x2f\x27\xef\xe4\
-\x1a\x86\x0c\x36\x47\xf0\xa1\x02\x4e\x0f\x92\xe5\x9c\x90\x6d\x23\
-\xc4\xa7\x78\xfa\xee\x0f\xb5\x0b\x2b\xb7\xf4\xb2\x29\x9f\xd3\xb4\
-\xf1\x2f\x1d\x05\x0e\xdd\xd9\x95\xee\xe2\xb9\x45\xdb\xb8\x76\xe9\
-\xe4\x5a\x63\x24\xbb\x7c\x42\x93\xbd\x29\xff\xb9\x4a\x2c\xa1\xaa\
-\x32\x66\xe4\x6c\xc6\x22\x3f\x57\xb0\x47\x69\xef\xe7\xb2\xf5\xbf\
-\xff\x38\x81\x3d\x05\x23\x4e\x8d\x2e\x62\x15\x71\x44\xb0\x99\xdf\
-\x4a\x38\x63\xe2\x57\xe3\xe0\x0b\xb8\x91\x21\x16\x42\x17\x6e\x83\
-\x57\x1d\x59\x3f\x78\x24\x53\x41\x1d\x73\xb0\xaa\x22\xdd\x11\x40\
-\x92\xc3\xb7\x4c\xe0\xf9\x14\xc6\x03\xb8\x3b\x4c\x16\xfa\x62\xc1\
-\x2c\xf2\x95\x58\xea\x8e\xe3\x41\x57\x39\xc3\x5c\xb2\xa5\xbb\xd1\
-\x2f\x40\xba\x77\xbe\x27\x4f\xa3\xd5\x54\xed\xc0\x2e\xef\x0b\x5d\
-\x7b\x50\x5c\x72\x0c\xda\x4c\x9c\xa2\x04\x0a\xeb\x2b\xf8\x68\x13\
-\xd8\xe7\xd6\x4e\xfc\x19\xd5\x87\x7b\x40\x3e\xbb\x4d\x50\x09\x41\
-\xe1\x48\xa1\xa0\x37\x84\x2b\x1c\x36\x6d\xfc\xba\x86\x6c\xbf\xa6\
-\x9e\x30\xce\xa9\xb3\x8a\x8f\xd7\x01\x63\x13\x42\x1d\x54\x5f\x16\
-\x70\x94\x80\x18\xc2\x7b\xc6\xf0\x72\x1f\x92\x01\x6c\x33\x84\x49\
-\xf9\x20\x81\x45\xfa\x50\x4b\x4a\xb5\xa6\xd4\x7e\x44\x4e\x2b\xdb\
-\x9d\x79\x92\x2e\x5a\x9a\x15\x53\x3f\xdd\xbd\xe3\xb1\x88\x6d\xd8\
-\x0c\x1e\xf4\x69\xb2\x28\xc7\xd2\xf9\x9e\xb1\x96\xbd\x68\xd1\x93\
-\x05\x5d\x5a\xf0\x3f\x9c\x67\x4c\x08\x07\x1b\xda\x30\x35\x4c\xd6\
-\x3e\x9a\xac\x7d\xe4\x80\xfa\x96\x0d\x03\x63\xad\x19\x7d\xa5\xb4\
-\x99\xc0\xf9\x02\x2e\x66\x58\x24\x7e\x43\x38\xae\x46\xb2\x2a\x36\
-\xd5\xde\xc1\xd7\xb2\xb0\x2a\xfe\x21\x97\x48\xdd\x5c\x3d\x84\x0f\
-\x30\x58\x5b\x83\x47\x12\x29\x23\xeb\xb1\x55\x07\x7d\x4e\x38\xfe\
-\xc9\x8a\xcc\xac\xb3\x17\xf1\x78\x85\x45\xbb\xa3\x85\xe7\x07\xc2\
-\x6c\x9a\xb1\xd9\x27\xea\xc8\x5e\x77\xc4\xa0\xc7\x50\x9e\xdb\x79\
-\x8e\x24\x74\x90\x5d\x2c\x1a\xb7\x2c\xa9\x6e\xd7\xad\xe4\xfa\xaa\
-\x6b\x8f\xd4\x29\xbc\x27\xc5\x50\x14\x9a\xab\x3e\x0a\x60\x8a\x22\
-\xe1\x5f\xce\xb6\xbe\x7f\x92\xc1\x5d\xc0\xf6\x94\x16\x75\x40\x03\
-\xd8\x94\x65\x81\xc6\x5b\x0f\x8e\xe0\x59\x01\x59\x0f\x99\xcd\x7d\
-\xd1\x62\xd9\x16\xe4\x68\x8b\xfe\xad\xfb\x57\x98\xa5\x2a\x02\x88\
-\x9f\x2b\x98\x48\x38\x9d\xa3\xc5\x9f\x63\xf0\x98\xa2\x61\x99\x55\
-\xd2\x65\x83\xbd\xe6\x7e\xf3\xaa\xe7\xb0\x76\x0d\xfa\xca\x77\xf0\
-\x45\x6c\x65\xda\xe3\xb7\x38\x4d\x73\x6c\xe3\x23\xa8\xfa\x0b\x96\
-\x6d\x3f\x18\x0c\x0b\x38\x7e\x32\x8e\x2d\x65\x7d\x8b\x6e\x5f\xb3\
-\xf5\x17\x2b\x1a\x3d\xac\x96\x93\x6a\x9d\xce\x50\x25\x54\xb5\x52\
-\xd8\xff\x45\x67\x05\x0c\xa4\x3a\xc8\x36\x3e\xd2\x1f\xfc\x9c\x31\
-\xf7\x47\x80\x05\x81\x45\x38\xd9\x35\xb8\xa7\xf6\x7c\x06\xd8\x98\
-\x5f\x5d\x98\xc0\xa5\x14\xf6\x34\x6c\x4f\x0c\x14\x41\xee\x45\x07\
-\xe6\x5e\x2e\x00\x4d\x16\x5f\x39\xf8\x20\x5d\x65\x4e\x38\x94\x90\
-\x6a\xf8\xd6\x09\x3c\x93\xe0\xca\xf9\x5a\x12\x81\x39\xbf\x57\x24\
-\x0b\x50\xec\x7c\x25\x07\x39\xed\x18\xeb\xe9\xb5\xc3\xc7\xb3\xce\
-\xb4\x08\x16\xd7\x4b\xf0\xe5\xef\xee\xf4\xc2\x76\xd2\xa6\x8b\xd9\
-\xad\x60\xf4\x6c\x05\x8f\xce\x02\x12\x33\x60\x5d\xfc\x5f\xc5\x44\
-\x21\xd4\x9a\xce\x05\x17\x5f\xe8\x6d\xfc\x99\x62\x0d\xee\x70\xe4\
-\xe6\x4b\xe2\x85\x55\x9d\xc9\xaa\xc4\x3e\x55\x81\xc0\xfa\x18\x9e\
-\x35\x30\xa2\x07\x77\x14\xb2\x2e\x32\x8d\x28\x9a\x16\x97\x1f\x20\
-\xfb\x92\xa1\x9f\x98\xd3\x8e\xe1\x95\x09\xbc\x27\x81\xbc\x0f\xef\
-\x00\xd6\x26\x6a\xa8\xc4\x9b\x15\xbd\xc3\x13\x98\xa9\x99\x21\xd9\
-\xb0\x42\x09\xd1\xf4\x44\x49\x47\x96\x7d\xda\xdb\x85\x1b\x33\xa8\
-\x75\x43\xca\xd6\xd5\x13\x57\x1c\x94\x5a\x1a\x6c\xcc\xb7\xbc\xa7\
-\x9f\xe7\x9c\x1b\x17\xbd\xeb\x19\x28\x16\xb0\x43\x9e\x06\x60\x45\
-\xf9\x94\xb8\xc1\x34\xde\xa0\x7a\x98\x49\xe2\xc3\x64\xfd\x9f\x8a\
-\xf5\x9f\x3e\x10\x58\x10\x38\xd4\x95\xbc\x2c\x2c\x8e\xd2\xbe\xfd\
-\x01\x6e\x02\x63\x4c\x45\x5d\x1c\xc0\xbe\xc6\x6a\x40\x1b\xf2\x86\
-\x26\x1e\x86\xad\x3a\xe6\x2e\xcb\x5f\xa1\x9e\x67\x0c\xd7\x86\xf0\
-\xca\x00\x06\x19\x76\xfd\x3e\x42\x9d\xbe\x87\x55\x3c\x92\xb8\x81\
-\xc7\xf7\xb5\x7e\xd9\xac\x0e\x3d\xd1\xd1\x9b\xf0\x9c\xcf\x6b\xdd\
-\xb1\xa4\x46\x72\xa6\x30\x77\x1e\xeb\xa2\xe3\x09\x15\xab\x94\x56\
-\x74\xc3\x36\x2b\x68\x45\x57\x20\x6a\x16\x5e\x73\x9d\xb3\x4b\xd6\
-\x1c\x38\xea\x07\x68\xe0\x76\x29\xaa\x08\x86\x10\x54\x00\xa9\x36\
-\x5d\x49\x33\x55\x90\xcc\xc6\xbc\x98\x81\x7c\xab\xb7\xf6\xc3\x72\
-\xfd\xd6\x43\x81\x5a\xb1\x31\xf7\x71\xaa\xe7\x25\xab\xef\x43\x0e\
-\x78\xa2\x61\x30\x44\x34\x9f\xf6\xe1\xae\x71\xf3\x34\x78\x52\x7a\
-\x4d\x01\x59\xa7\x63\xeb\x75\xbc\x12\x4a\xf7\x6f\x57\xce\x58\xc1\
-\xe9\x3d\x78\xbf\x20\x8e\x9f\xc3\x63\xdb\x64\x41\xa2\xb9\xeb\x80\
-\x85\x2c\xdf\xcb\x54\x7d\xee\x83\xfd\xc6\x09\x51\xfe\x75\x6c\xd0\
-\x76\xef\x17\xca\xa4\x2c\xcd\x57\xbe\x0b\x92\x9b\x63\x71\xc9\x2b\
-\xde\x8d\x69\x59\x94\x25\x7c\xfc\x42\x03\xbb\x3c\xc0\xb4\x1d\xa7\
-\x75\x3c\xa2\x6f\xce\x58\x2e\x03\xa5\x7b\xca\x80\x09\x25\x45\xef\
-\x63\xd9\xd6\xdf\xdc\x4f\xe0\x91\x80\x23\x56\x29\xc3\xa0\xc6\xcd\
-\x93\xb5\xa2\x6a\x52\xc2\x85\x21\x5c\xec\x63\xc9\xec\x03\x6a\x96\
-\x50\x96\x86\x94\x6f\xcc\x03\x82\x5f\xc6\xf2\x32\xfb\xe2\x10\xa0\
-\xb7\x07\x1f\xe4\x70\x75\x13\xc5\xf7\x18\xbc\xfa\xb7\x80\x68\x2f\
-\x3c\xd7\xb6\x91\xe0\xa8\xaa\x3b\x11\x50\xe5\xa1\x44\xd5\x40\xb5\
-\xd3\xe0\xcb\x25\x4c\x61\x6e\x6e\xab\x75\xd6\x7b\xf3\xa8\x2e\xc9\
-\xce\xa5\xaf\xa1\x15\xe3\xce\xbe\xd4\x6e\x00\xbd\x93\x64\x52\x57\
-\xd5\x39\xc7\x1f\xa7\xd2\x1c\x3e\x2b\xdd\xd1\x3e\xc4\xd4\x44\xbb\
-\x77\x0f\x45\x0c\x1e\x1f\x26\x0c\x0e\xc4\xe6\x5f\x4b\xd6\xfe\xc5\
-\x63\x0a\x61\xc7\xb6\x26\x50\xbb\x21\x0a\x50\x13\x54\x0a\x64\x63\
-\xb2\x43\xb8\x2e\xa0\xbf\x06\xdb\x39\x8a\x6d\x80\x57\xba\x31\x19\
-\xc4\xb2\x65\xfe\x35\x94\x55\x16\x5e\x6e\xc0\x26\xf0\xe2\x10\xde\
-\x33\xc0\x05\x73\xbf\x80\xbc\x57\x81\x99\x9a\xc5\xab\x20\x8f\x6b\
-\x93\x03\xc3\xb4\xaa\x3b\x09\xd4\x07\x11\x41\x29\x8e\x2f\x7a\x5b\
-\x22\xaf\x34\x8f\xfd\x98\x83\x6d\x56\x99\x4c\xa1\xba\x11\x56\xc7\
-\x15\x0d\xb7\x2d\xb3\xf9\xc6\xdd\x64\xbf\x3a\x7e\x04\xa7\x7c\xbb\
-\xe7\x00\x08\x6e\x33\x3d\xf7\xdd\x55\x00\xc6\x70\x60\xe0\x44\x88\
-\xcf\xf6\x36\xfe\xc2\x70\x00\xf7\x7d\x15\xac\x56\xae\x85\x80\x6a\
-\xe0\x29\xb4\xe6\x1c\xce\x28\xb8\x92\xe1\x9e\x70\xcb\x98\x7b\xcf\
-\x99\x72\x68\xb2\x32\xb6\xf8\x1a\xc2\x41\xc5\x41\x01\xa7\x46\xf0\
-\xfe\x04\x4e\xac\x63\x4e\xe0\xd0\x07\xaf\x32\x1e\x6a\xa2\x1b\xa7\
-\x2d\x88\xe2\xcc\x24\x3c\x23\x93\x76\x9e\x7e\x7a\xa7\xdc\x15\x3b\
-\xd5\x74\x47\xc0\xd3\xf5\x39\xc7\x63\x61\x73\xc7\xd7\x08\x9f\xc4\
-\x5f\x71\xac\x4b\xf7\x75\xb8\x84\xff\x9e\x0b\xe2\x43\xf7\x1c\x2e\
-\x24\x82\xd8\x2c\x60\x13\xf5\xec\x20\x20\xd5\x8a\x26\x68\x64\x8c\
-\xa1\x9d\x6e\xe5\xe2\x41\x5f\x7c\x9c\xad\xff\xf5\xc7\xd4\xa1\xf2\
-\xd0\x57\xc1\x2a\x1e\xbd\x8d\x79\x6d\x99\xf1\xd0\xc9\x08\x9e\x55\
-\x70\xa2\x07\xdb\x80\x76\x2f\xb5\xcb\xbf\x96\xd8\x46\x12\xe1\x23\
-\x03\xa2\x06\x43\xe8\xa2\xa2\x77\x0c\x98\xe9\x0f\xe1\x75\x5a\x39\
-\xbb\x1a\xc5\xf7\x92\xf9\xcb\x0f\x18\x1b\x16\x18\xbd\xfd\x3f\xca\
-\xd1\x24\x70\x13\x40\x0b\x18\x30\xb8\x13\xda\x7d\xec\xde\xf8\x6a\
-\xf6\x34\x0d\xba\xac\x8e\xb3\x8f\x65\xde\x53\xd7\x44\xec\xbb\x37\
-\xa7\xf1\x29\x52\x93\xa5\xd4\x2c\x60\x78\xf5\x4c\xf8\x5e\xb3\x79\
-\xe3\xda\xb5\x04\x46\xd3\x96\x26\x42\x09\x2d\xd4\x57\xd7\x07\x7f\
-\x6d\xb2\xf5\x85\x1d\x09\xfb\xdc\x8f\x15\x09\x22\x5e\x5d\xf6\x6f\
-\x22\x8b\x34\x21\xec\x89\x23\x24\xd4\x65\x06\xb7\x15\x16\x97\x68\
-\xb2\x72\x19\xb8\x64\xdb\xdc\x26\xb4\x57\x9b\xa6\x55\xc2\xeb\x2e\
-\x27\x70\x7d\x0c\x2f\x25\xb8\x4b\xdc\x48\x1c\x85\x5f\x52\x43\x35\
-\x78\xa3\xfd\x6e\xa8\xa9\x80\x4b\x9a\x7d\x06\x60\x8b\xc1\x70\x8c\
-\x73\x50\xce\xb2\x04\x74\xa4\x2d\xb3\xf8\x8e\x2f\x3e\x2a\xfa\x18\
-\xe3\xc8\x69\x1c\x4e\x2c\xae\x84\xb9\x51\xc7\x2a\xbd\x63\x75\x07\
-\x4f\xbf\xe8\x7b\x8f\xb1\x11\xdf\x42\xed\x94\x6d\xb4\xca\x09\x70\
-\x6b\x36\x37\x66\xad\x1d\x40\xf6\xcb\x8d\x93\x67\xeb\x05\xa4\x4c\
-\xed\x66\xea\x2b\x7c\xeb\xcf\x8d\xfa\x98\x52\x3d\x48\x5c\xe1\x76\
-\xe8\xe0\xc3\xea\x6f\x44\x3e\x12\xae\x1e\xc1\xb9\x35\x78\x08\xb0\
-\xaf\xd0\x79\xbb\xa8\x97\xd5\x99\x4a\xd5\xc4\xf7\x0a\x72\x0e\x93\
-\x09\x9c\x19\xc2\xfb\x52\x58\xeb\xc1\x03\x8e\x59\xb0\x5a\xfb\x10\
-\xd5\xf8\xa7\xed\xb9\x30\x61\x18\x40\x6f\x8e\xe1\xa4\xc0\xcb\x30\
-\x00\x69\xab\x07\xe7\x01\xee\x43\x22\xb4\x1b\xaa\x53\x6e\xf6\xa2\
-\x5b\x25\xf5\x72\xce\xb8\xe3\x90\xfb\x99\xaf\xeb\xe5\xdc\x79\xf8\
-\xba\x9a\x3e\x3a\x65\x6e\x2f\xef\x8e\x65\xb2\x9d\xe1\xc7\x31\xc3\
-\xf7\x92\x77\xf7\x5f\xc8\x22\x56\xa5\xa7\x13\xb3\xd3\x1e\x13\xb7\
-\x13\x62\xe8\x84\x09\x93\x7d\xc6\xb7\xb3\x8d\xff\x53\x64\x3f\xbf\
-\x2b\xe0\xbe\xb0\x0d\x98\x9c\xd1\x33\x5d\x4d\xf8\x2e\xf9\x13\x69\
-\xc0\xf4\x08\xae\x51\x08\x7b\xb7\xc0\xba\x6f\x29\x22\x1f\x6f\xd5\
-\x66\x39\x8b\x7c\x7c\x48\xe0\x8c\x38\x64\x63\xf8\xd0\x98\x80\x0d\
-\xc9\x0d\x50\xed\x46\xc2\x04\x1e\xb3\x34\x10\x03\xfa\x82\xf6\x93\
-\x64\x02\x67\x01\x06\x66\xcd\x16\xb8\x66\x58\x06\x4f\x14\x1c\x70\
-\xd8\x08\xf4\x39\xaa\xaa\x7e\xd7\x4b\x7b\xa6\xa6\xb9\x34\xc9\xfb\
-\x19\x6b\x63\xfa\xaf\xf4\xd2\xd5\x52\xad\xc6\xca\x3b\x5f\xff\x12\
-\x80\xbe\x3b\x12\x9b\x2f\x12\xe1\x2c\x2e\xd0\xee\x62\xf4\x9a\x31\
-\xd5\x70\x10\xac\x5b\x72\xc2\x5f\x3f\x67\x9c\x46\x47\x19\x34\x9f\
-\x2a\x96\x28\x2d\x13\xf5\xd6\xda\xda\x5f\x1d\xf7\xbf\xf0\x50\x20\
-\xb6\x2e\x87\x2c\xb8\x9a\x0c\x56\x99\xbb\x31\x32\x63\x57\x85\x82\
-\x53\x63\xc4\x36\x36\x84\xb5\x7c\x8b\xac\x11\x35\xac\x6e\xe8\x95\
-\x80\x9e\xe2\xd7\x2b\x43\x78\x39\x83\xa4\x0f\xb7\x39\x36\x82\x75\
-\x86\xce\x23\x96\x26\x62\x2a\x49\x7b\x3c\xa1\x6b\x38\x95\x23\xb0\
-\xc9\x14\xb6\x91\x82\x14\xe5\xfe\x89\x44\xb9\x4e\xa2\xe0\x6e\x8a\
-\x03\x61\x15\x38\x6c\x33\x97\x68\xef\xd2\x0d\xa1\x8b\x83\x6c\xcd\
-\xec\x76\x54\xb6\x2d\xcd\xf4\x6b\x9c\xfe\x35\x95\xba\xe9\xbe\x0b\
-\x2d\xd4\x21\x67\x06\x6d\x5a\x1e\x35\xed\x7c\x84\xcb\x75\x17\x74\
-\x57\x22\x43\xeb\xdd\xc3\x06\xd7\xb6\xa1\xd1\x94\x7e\xc1\x33\xf2\
-\x87\x4c\x72\xc5\x75\xca\xb5\x30\xee\x38\x11\xea\x4b\xc9\xc9\x3f\
-\x7b\x30\x40\xfe\xe4\x08\x2a\x6c\xad\xdb\xce\x67\x0c\x54\x8f\xe1\
-\xaa\x86\xf3\x1c\xee\x27\xc8\xf3\xc8\x38\x7e\xad\x71\x35\xd6\xf1\
-\xab\x00\xf9\x0c\x35\xac\x15\xf0\xba\x84\xd3\x29\x31\x36\x59\x04\
-\xe5\x21\xee\xb3\x50\xf9\x7b\x45\xc0\xa6\x80\x8d\x02\x2e\x28\xec\
-\x73\x6f\xd6\xc0\x38\xc1\xb3\xf5\x35\x5a\xbc\x79\xef\x9e\x42\x6c\
-\xb6\x2f\x90\xc7\xec\x62\xf1\x1d\x53\x95\x5d\x7e\x35\x03\xf8\xce\
-\xe6\x28\x97\xee\x8b\x56\x99\xfe\xcc\x34\xcc\x22\x7d\x92\x97\x8b\
-\xf8\xdb\xdd\xed\x8c\x44\x76\x67\xc6\x33\x54\x11\xd7\xda\xa5\x76\
-\xca\x44\x37\x69\x65\x13\xf7\x0d\x14\xd2\x2b\xbb\x59\xf2\x8f\x93\
-\x8d\xff\xf5\x71\x86\x52\xf8\x49\x43\x48\x5c\x9e\x8f\x69\xb7\x1e\
-\xfa\x87\xf0\x8c\xc1\x21\x03\xb8\x21\xf1\xf8\x22\x48\x63\x69\x68\
-\x49\xbe\x2a\x5f\x72\x65\xe3\xd7\x62\x04\x2f\x2b\xb8\xae\x60\xbf\
-\x87\x1b\x85\x14\x51\x93\xfb\x69\x4c\xa5\xf9\xc1\x44\xcf\x42\xc1\
-\x33\x12\x2e\x72\x04\x42\x26\x96\xc8\x15\xac\x01\x9c\x61\x98\x0c\
-\xde\xc9\x51\x8b\xaf\x28\x20\x19\xc9\xae\xfd\x73\x9e\x5e\x1f\xf4\
-\xd9\x03\xde\xc2\xfc\xd4\x12\xfc\xc9\xb1\xe4\x50\x8f\x6b\x48\xe3\
-\xb1\x10\x38\x1d\xae\x4d\x1f\xcb\x33\xca\x50\x59\x9c\x7f\xad\x9f\
-\xfd\x78\x71\xe2\x8d\x7b\x02\x1e\x07\x0a\xb3\x56\x36\x08\x6d\xd7\
-\x40\x8b\x02\x9e\x49\x91\xd6\x7c\xa8\xe8\x78\x3e\x2b\x15\x55\xbe\
-\xae\x0b\xc8\x13\x12\x0f\x0f\xe1\x15\x0e\xfd\x1e\x4a\x97\x47\xbc\
-\x9a\x20\xae\xe3\xc5\xa6\x83\x9d\xda\x69\x16\x8e\x90\xa3\xbc\xca\
-\x80\x27\xb0\x3b\xc1\xad\x63\xc3\xe0\x7b\x92\x64\xde\x32\x4b\x82\
-\xa0\xd1\x44\xe0\x15\xae\x69\xb8\x56\x24\x1d\x3d\xe5\x8a\xb4\xf4\
-\xea\x8c\x64\x17\x81\x6e\xb4\x65\xdb\xb7\x74\xbb\x80\x55\x6a\xea\
-\x3a\x4a\x29\xe7\x9e\xa9\x0c\x61\x67\x9e\x50\x37\x2e\x4c\xb7\x1d\
-\xa3\xbb\x5c\xad\x30\xe0\x9d\x45\x6c\x5e\xa2\xf5\x84\x0b\x63\xaa\
-\xa9\x52\x19\x93\x5f\xce\x36\xfe\xf4\xd1\x3a\x6c\x1b\xeb\x89\x83\
-\xce\x9a\x94\xc1\xf6\xba\x31\xd8\xe6\x52\x0e\xe7\x33\x44\x26\xbb\
-\x89\xe3\xe6\x21\x6c\x65\xa3\x2b\xd7\xee\xba\x7a\xf8\x72\x41\x83\
-\x46\xc4\x18\x3e\x50\x60\xfc\x6a\x16\xd8\x23\x40\xfa\x12\x45\xf6\
-\xb1\x94\x12\x02\xde\x86\x12\xcc\x08\x6c\x72\x09\x67\x0b\xb8\xde\
-\xc7\xae\x69\xbb\x63\x94\x64\xae\x27\x26\x30\x42\x40\x7f\x48\x5b\
-\x8d\x59\x7b\x66\x45\x09\x0d\x27\x0b\x3c\xb2\x97\xc2\xfd\x34\x99\
-\x66\x7f\x2b\x76\x7a\x82\x48\x0d\xbf\x70\xa6\x73\x21\x72\xbc\x1d\
-\x8a\xb4\xa1\xda\x45\x43\x82\x8e\x8c\x67\xb7\xe0\x64\xbe\x8f\x0f\
-\x47\xe8\x4d\x39\x21\xf7\xe3\x1e\x55\x4c\x19\xea\xb9\x44\x4d\x78\
-\x42\x63\xf1\x58\x42\xa4\xeb\x49\x55\x05\x22\xe7\xfa\x6c\x2e\x25\
-\xeb\x7f\x22\x5d\xfb\xc1\x03\x0e\xc6\xd3\x8f\x63\x8b\xaf\x6b\xe8\
-\x09\xde\x88\x23\x78\xce\xec\x11\x6b\x70\xab\x80\x51\x1a\x05\xa9\
-\x15\x9e\x89\x73\x52\xb6\x47\x31\xda\x65\x0e\x17\x0d\xb6\x31\xc1\
-\x57\x06\x37\x53\xd2\x20\x90\xc5\x97\xe0\x07\xe2\x94\x83\x93\xec\
-\x9b\xd5\xa2\xb1\x4e\xe5\xbd\x29\x9c\x4a\x61\x34\xc6\x4c\x82\xf1\
-\xe5\x32\x43\x69\xda\x91\x3f\x26\xd7\x58\x59\x7b\x51\x23\x7f\x6f\
-\x02\x80\xdd\x1e\xdc\x37\x08\x4a\x27\xb3\x83\xb0\xd9\xaa\x95\x8e\
-\x91\xe8\xb4\x28\x76\xda\x98\xc4\xce\x1e\x74\xea\x30\x5d\x16\xf4\
-\x2d\x5c\x0e\xbd\x74\x91\xee\x2c\xda\x74\x7f\x46\xfc\x0a\xbe\xcb\
-\xcd\x0c\x25\x52\xf0\x5b\x8d\xcd\x64\x90\x8a\x77\x5d\x01\x35\xaf\
-\xfc\x21\x53\xac\xd6\x68\x79\xc6\x45\x0a\xa8\x9a\x0d\xe3\x79\x84\
-\x5a\x53\xaa\x10\xbd\x9f\x4b\xd7\xff\xee\x13\x81\x80\x7e\xcc\xeb\
-\xf0\xba\x76\x32\x63\xbb\xeb\x23\x78\x36\x45\x0b\x7b\xc7\x00\xfa\
-\xac\x4e\xc3\xeb\x58\x78\x53\x32\x98\x66\xb5\x18\xc3\xcd\x46\xf0\
-\xcd\x0a\xce\x65\x70\x9f\x0a\x0b\x6d\xf1\x94\xf5\xf1\xad\x49\x36\
-\xab\x6b\x30\x6b\x83\xe7\x70\x4d\xc3\xa5\x0c\xff\x7d\x54\x40\xda\
-\x43\xa2\xe6\x01\x25\xd1\x80\xf4\xcf\x66\x39\x0d\x14\xce\x3b\x59\
-\x27\x79\xc2\x36\x87\x61\x8f\xce\x82\x28\x3f\x59\xda\x9d\xb7\x6e\
-\x14\xa1\x16\x7f\x39\x74\x14\xeb\x8a\x97\xb9\xb0\xb9\xb3\x0a\x17\
-\x9d\x13\xd1\xda\xd3\xaa\x63\xb3\x27\xc6\xe6\xbb\xff\x0e\x53\x13\
-\xcb\x0b\xf6\x20\x57\xf3\x68\x8e\xa2\xae\x7c\xbf\xd7\x0b\x47\x83\
-\xda\xa1\x61\xab\x3c\x90\xdf\x96\x07\xa6\x9a\xed\x8a\xad\x1f\xd6\
-\xe2\x13\xdb\x24\xe8\x2d\x02\x40\x5f\xb3\x7b\xe6\x19\xfa\x33\x13\
-\xb8\x92\xc2\x23\x8d\xd8\x46\x05\x18\x26\xb4\xfb\x9a\x4e\xc6\x26\
-\x62\x8b\x31\x3c\x3b\x84\xf7\x26\x30\xea\xc1\xd7\x84\xd3\x00\xab\
-\x38\x09\xc5\x1a\x1f\x8d\x46\x3f\xc1\x41\x26\xcf\x71\xc0\xae\xe1\
-\xe6\xf5\x14\x73\x5b\x0f\x39\xc2\x77\xb3\x0d\xe6\xa4\x02\xda\x54\
-\x70\x96\xc1\x40\xc0\xa1\x82\x3b\x02\xf2\xd4\x5d\xb7\x43\x4d\x3a\
-\x59\xd4\xd6\x97\x60\x66\x16\x09\xb0\x60\x3a\xe9\xd2\xe1\xed\xd3\
-\x31\xfd\x8a\x83\x80\x16\x0d\x82\x43\x9a\x72\x36\x31\x3f\xa3\xb4\
-\x00\x2a\x11\xbc\xf6\x05\x4b\x24\x13\x44\xd0\x1b\xbd\x8b\x26\x80\
-\x30\xed\xb9\x77\x45\x48\x86\x79\xc3\xe1\xfe\xed\xae\xbd\x07\xe5\
-\x6d\x15\x22\x7b\x2e\x70\xb2\x88\xb9\x54\x24\x2d\x27\x42\xdc\x4e\
-\x7a\xff\xfd\xb8\x77\xf3\xa1\x31\x62\xe1\xca\xfc\x74\x33\x7b\xeb\
-\x21\x84\x31\xe1\xcb\x05\x9c\xce\xe0\x5e\x4e\x39\xa9\x38\xe1\x0a\
-\xa1\xdd\x13\xad\x5e\xba\xf9\x89\x86\xb5\x23\x78\x8d\xc1\x89\x0d\
-\xd8\x56\x28\x27\x56\xbc\x22\x76\xa6\x4d\xef\x31\x7f\x46\x0a\xfa\
-\x39\x3c\x27\xb1\x1d\xac\xd9\x1e\x8d\xb9\x1f\x52\xc7\x70\x03\xf1\
-\x95\xd9\x6a\xcc\x8b\x12\x03\xeb\xb3\x29\xa4\xe6\x75\x09\x8f\xcc\
-\x31\x59\x04\xe6\xac\x34\x3f\x97\xc9\xb4\xbd\xbb\x7b\x2b\xe0\xe3\
-\x62\xd9\x4b\xec\xb3\x24\x3b\x1e\x34\xe0\x57\xf3\xfc\xf7\x5c\xc1\
-\xdc\xec\xda\xb1\x0e\x61\x09\x9b\xdd\x58\x78\x5e\x12\x4a\xc7\xcd\
-\x6b\x59\x29\x17\x2f\x23\xba\xf8\x68\x4e\xc2\x33\x65\x36\x21\xae\
-\x25\x55\x6d\x72\x54\x19\x7b\xef\x6e\x56\x45\x8a\x8d\x30\xb0\x3b\
-\x25\x77\xbd\x0e\xb0\xd4\x84\x1b\xc0\x64\x96\x88\x5a\x3b\xe2\xc5\
-\x5b\x69\xff\xcf\xee\xf7\xc0\x18\xfd\x01\x19\x7d\x0d\x52\x97\x22\
-\x33\x8b\xcb\x93\x31\x3c\x23\xa0\x97\x21\xb6\x19\xf7\xa2\x22\xa9\
-\x90\x7e\x71\x80\x9e\x46\xb5\x99\x50\x15\x87\x38\x98\x18\xf4\x08\
-\x9e\xcf\x90\x47\xbf\x4d\x76\x29\x03\x8d\x4d\x69\x9d\x2c\xf0\xfa\
-\xb6\xa2\x8a\x17\x38\x8b\xd3\x7c\xa8\x01\x29\x63\x01\x7b\x05\xcd\
-\x28\x27\xc9\x9a\x59\x00\x09\xcd\x2d\x3c\x9b\xb8\x14\xd5\xbe\x40\
-\x02\xd4\x06\x44\x66\x31\xe0\xe5\x91\x04\xda\xa0\xa3\x4d\x06\x67\
-\xa7\xf3\x98\x4b\x77\x27\x5d\x82\x65\x6f\xf6\x3c\x9a\x01\xa8\xa6\
-\x9e\xa1\xf4\xb5\x33\x30\xf2\x52\xfd\x96\x17\xda\x10\xc2\x0a\xd4\
-\xd5\xaa\xbf\x29\xf3\x8a\xdf\x1c\x42\xbc\xae\xdb\xc7\x99\xb1\x12\
-\x11\x2b\x26\x52\x60\x3d\xec\xc7\x2e\x27\xdc\xa0\x7d\x9e\x1a\x9b\
-\xc7\xe4\x6b\x31\x64\x7c\x1f\xd2\x7d\x2d\x76\xb5\xda\x93\xec\x0e\
-\x88\x77\x24\x7f\x54\xb0\xe1\xa4\x48\x4e\x65\xbf\x67\x7c\x27\x76\
-\x91\x27\x29\x01\xf3\x33\xa4\x9a\x64\x92\xc1\x36\x7d\x0d\x2f\x10\
-\x5f\x7e\x57\xa3\x97\x95\x31\xa4\x91\x4d\xb6\x9e\xc6\xaa\x4d\x24\
-\x6c\x0e\xe1\x55\x01\xfd\x75\xb8\xa7\x61\x24\x9c\xfa\x52\xc6\x5f\
-\x29\x5c\x6c\x8a\x18\x1b\x9d\xc3\xb9\x11\x5c\x4d\x61\x93\x8a\x19\
-\x1f\x50\xfa\xa9\xa0\x1d\xc6\xac\x22\x73\xa9\xe7\x14\xea\x11\x0a\
-\x81\x39\xb2\x43\xe6\x58\x4b\x28\x3f\x5d\xa0\x4a\xa7\x57\xe0\x61\
-\x5b\x1a\x9b\x17\xdf\x77\xf3\xca\x17\x1e\x49\xb9\x04\x7b\x03\xab\
-\x8e\x58\x9a\xf3\xd1\x4b\x13\xe2\xc7\x35\x1b\xb0\x4b\x62\xb5\x1b\
-\x45\xc6\x09\xb3\x48\x4a\xa5\x2b\x16\x88\x2a\xb8\xe7\x45\x30\xcd\
-\x6e\x33\xd0\xcc\xf6\x74\x29\x12\x86\x26\x9e\x73\x61\x7c\xf1\x50\
-\x8b\xc7\xba\xf7\x10\xf8\xb6\x62\x0f\x8b\xe4\xab\x39\xff\xd5\x09\
-\xbd\x0d\xa3\x3d\x4d\x10\x59\x38\xd5\x3b\xfa\xf5\x1c\x9e\x57\xb0\
-\x3b\xa0\xb4\x94\xc6\x4c\x53\x6d\x86\x14\x04\x59\x52\xd4\xbe\x2b\
-\x94\xdc\xec\x24\x88\x85\x64\xd0\x7b\xd5\xf6\xef\x56\xb1\xe0\xcc\
-\xfe\x80\x86\x78\x08\x2f\x16\xf0\xec\x00\x9e\xa4\xe8\xe6\x65\x43\
-\x47\x59\xe3\x60\x6d\x2c\x33\x92\x70\x62\x8c\x4d\xce\xce\x6c\x20\
-\x52\x37\xcb\x6c\x9f\xbb\xe2\xc3\x71\x81\x1a\x84\x0b\x1a\xce\x72\
-\xf4\xfa\xdb\x1a\xf9\x7e\x1d\x4b\xf0\x25\x65\x06\x36\x8c\xc5\x73\
-\x6c\xa1\x3c\x4a\xb0\xea\xd7\x04\xbe\x87\x49\x72\x2c\x0f\xbe\x4b\
-\x1c\x39\x73\x4f\x5f\x95\x2d\x5d\xee\x0c\xdd\xfb\xf5\xcd\x08\x64\
-\xbb\xe9\x08\x82\x28\x96\xe4\x25\x9a\xd5\xb1\x18\x55\xb8\x9a\x4f\
-\x21\xd5\x39\x02\x10\x57\xff\x67\x5e\xcd\xb1\x77\x36\xac\x15\xdc\
-\x0e\x5d\xcd\x14\x4b\x39\x55\x71\x1b\x83\xe7\x6c\xc2\xd2\x47\xa0\
-\x1f\x4b\x7e\x47\x66\x37\x46\xf0\xa9\x9c\xbf\x9d\x13\xa1\x31\x26\
-\x83\x93\xe4\x08\x65\x80\xb9\xcb\x3f\xe6\x80\xf4\x10\x5e\x4e\xb0\
-\x28\xfc\x1e\xd5\x74\x97\xc1\x65\x33\x1d\xab\x2d\xe1\x28\xe1\x42\
-\x8a\x95\x81\x7b\x22\xb2\x75\xab\x37\x2e\x2d\x3e\x84\x3d\x93\x02\
-\xb6\x46\xf0\x2a\x47\x96\xf3\x0e\x71\x38\x8a\xd5\xab\x10\x43\x8b\
-\xd7\x12\xb4\x40\xc8\x9e\x8e\xe1\xc5\x04\xae\xac\xa1\xd4\xe7\x96\
-\xf9\x44\x0a\xe5\x8d\x37\x30\x16\x9f\x70\xb8\xa4\xe0\x34\x4d\x6f\
-\xbe\x4f\x0d\xa1\x6a\xa2\x1d\x73\x98\x30\x58\x3f\x87\xb3\x06\x8c\
-\x25\xa8\x45\xbb\x6b\x1b\x2e\x38\xb8\x76\x0c\x73\xdd\x56\xf4\xf4\
-\xc7\x58\xb7\xf5\x34\x80\x59\x67\x40\x3f\x37\x5e\x0f\x88\xd1\x48\
-\x37\xe6\x01\x8c\xeb\xa5\x62\x6e\xa4\x4a\xb4\xa2\xc7\x27\x8c\x85\
-\x2b\xa6\x33\x4d\x58\x41\x68\x83\x2f\x14\xcf\x0e\x78\xb6\x0d\xf2\
-\x89\x4c\xde\x2c\xb2\x5f\x94\xea\x4d\x03\x9a\x87\x19\xd6\x64\x4c\
-\x08\x80\x4f\x1a\x09\xa6\x72\xe0\xab\xfd\x87\xa2\x40\xd8\x1c\xb6\
-\x9e\xc3\xcb\x29\x1c\xa5\x08\x6f\x0a\x56\x2f\x45\x75\x7f\x24\xa5\
-\xa5\x4c\xdc\x39\x42\x09\xc0\xc9\x1e\x2a\x2b\x8f\x32\x37\x1e\x50\
-\x05\x3b\x43\xad\x03\xbd\xb1\x30\xac\x1a\x19\xc1\x7b\x14\x3c\x9b\
-\xc0\x8e\x09\x7f\xb9\x5b\x27\x35\x11\x65\x84\xdb\x34\x62\x77\x20\
-\x28\xff\x5c\x86\xf6\x7d\x47\x12\x53\x44\xbf\xcc\x49\x70\x76\x41\
-\xc1\x39\x8d\xeb\xe7\x1e\x41\x1a\x1b\xb7\xab\xea\x7a\xd1\xc7\x9f\
-\x92\x70\x9e\x72\xb7\x06\xf9\x3c\x10\xc8\xb1\xba\x8f\xb1\xe2\x36\
-\x96\x70\x3e\x9f\xd1\x9b\x46\xb4\x77\xb4\xbc\x79\x9a\xde\x4e\xee\
-\xb6\x3d\xb3\xb6\x5a\xa2\xb7\xa3\xd1\xcf\xfc\xee\x5d\xf3\xaf\xb1\
-\xd1\x3b\xf4\xea\x9b\x17\xe8\xa0\x01\x13\xe2\x9c\x82\x69\x13\x86\
-\x0a\x8d\x23\x0a\x50\x1a\xc9\xb2\x43\x26\x1e\x81\xba\xad\xb2\xcf\
-\x8c\x93\x5f\x30\x96\x31\xa2\x72\x0a\x4c\xbc\x4b\x8c\xea\x88\xb3\
-\xaf\x9e\xbd\x22\x64\xcc\x54\x55\x5e\x5d\x25\x80\x98\xf3\xf4\x5b\
-\x05\xbc\xc8\xd0\x2c\x1e\x79\xa3\x6f\xa2\x79\xec\xb0\x40\x7e\x5d\
-\x18\xb0\x61\x42\xe6\x14\x75\x91\x93\xb4\xea\xbe\xad\x83\xe0\xb5\
-\x36\x4d\xcd\x40\xa6\x93\x63\x78\x45\x40\x9a\x60\x61\x54\xee\x1b\
-\xd5\x6b\xd6\x56\xfa\x42\x3c\x4f\x4e\x05\x56\x67\x47\xf0\x7c\x82\
-\xb2\x61\x83\x49\x76\x28\x7e\xd0\xb4\x84\xcc\xd7\x39\x23\x11\xb1\
-\x98\xab\xbd\x43\xdd\xc0\xcd\xe9\x34\x5d\xa1\xfd\x6a\x88\xd0\x8c\
-\xc5\x1b\x54\x93\x80\x48\xe0\x09\xc7\x34\xb3\xa4\x15\xcf\x58\xd5\
-\x4d\x84\x05\x3c\x66\x97\xea\xec\x19\x76\x33\x2d\x3f\x35\xe3\xed\
-\x76\x12\xd3\x14\xf6\x05\xba\x70\x2f\xae\xa5\x8c\xff\xd0\x85\x86\
-\x0b\xcd\xed\x72\x3c\xbb\x3f\x4a\x88\x6d\x6a\xe7\x08\xe7\xfe\x4d\
-\xd3\x54\x3b\x03\x21\xaf\xef\x45\x60\x1a\x7c\x51\xbf\xf9\xf7\x00\
-\x57\x42\x72\x24\x06\xf7\x81\xdf\x54\xea\xb7\xc7\xe9\x2f\x8e\x7a\
-\x06\x21\xa3\xdf\x9a\x10\x20\xb1\xb5\xdb\x12\xdc\x5c\x40\x2d\x1a\
-\xb2\x2d\x06\xa5\xfc\x54\xc5\x1f\x6e\x82\xbc\x73\x39\x5c\xc7\xf0\
-\x0e\x5d\x29\xe8\xf6\x19\xc8\x36\xa0\x30\x2b\x64\x7d\x8c\x51\xac\
-\xf9\xc1\x60\x68\x6b\xbe\x12\xea\xb2\x19\xe5\x17\x9b\xa2\x0d\x87\
-\x1f\xc0\x4b\x02\x1b\xbb\x3e\x66\xb0\x9d\x3a\xbd\x1a\x4c\x19\x56\
-\x65\x05\xc9\x63\x89\x1f\xf4\xbc\xc6\xe4\xeb\x13\x81\xb0\xa4\xa0\
-\xf5\x6c\xbe\x32\x9b\xa0\xc5\x9f\x4f\xf0\x8b\x3f\xd2\x18\x79\x2b\
-\xfa\x6a\x52\x54\xa4\x3e\x9f\xc0\xf9\x31\xaa\x24\x14\x29\x1d\x8e\
-\x78\xd5\x53\x1f\x78\xfd\x0e\x94\x38\x67\x45\xa1\xe5\xa2\x6f\xf7\
-\xbc\xcb\x6c\xf6\x65\xfa\xdb\xc3\xd4\x65\x5b\xeb\x9d\x8e\x92\xe9\
-\xe5\x48\x9b\xda\x6a\xaa\xcd\x34\x2e\x85\xf2\x34\xfc\xd5\x1f\x82\
-\x20\x26\x68\x25\x43\xe4\x13\x27\x87\x2f\x81\xf7\xb4\xf1\xee\x88\
-\x8e\xa5\x30\xb1\xa9\x38\x64\xe9\x9b\x9a\xff\xce\x24\xfb\x59\x13\
-\xae\x99\x60\xee\x48\x60\x18\xea\x54\xbb\x64\xcd\x2c\xf8\x60\xf4\
-\xf4\xc2\x3d\x4f\x1d\x1a\x94\xcf\x7a\xba\x35\xc5\x7c\x47\x79\x09\
-\x97\x47\xf0\xdc\x00\xee\x15\x0e\x3f\xe8\x06\xda\x66\x5e\x80\x60\
-\x7c\xf6\xa9\x03\x78\x6e\x0d\x6b\xf3\x9e\x80\x5b\x6f\x3a\xd8\x3d\
-\x72\xa8\x34\x36\xb6\x5f\xf1\x38\x87\xf3\x43\x78\x4f\x0f\x2f\x0a\
-\xbd\x72\x12\xad\x0d\x68\xda\x3d\x89\x87\xcd\x89\x9e\x9b\xc0\xb5\
-\x0c\x6d\xfa\x6d\x7b\x5a\x9a\xcb\x69\x7e\x3a\xad\xd1\xe2\xcd\xb7\
-\x36\x41\xc5\x50\xf8\x49\xe5\xe1\xc8\xf2\x09\x9c\xd2\x38\xa0\x9c\
-\x09\xec\x18\x75\x08\x2e\x4a\xd1\x71\xde\x21\x52\xf8\xe8\x84\x1e\
-\x95\x5e\x02\xa2\xcc\xdd\x28\x66\xba\xdb\x65\xfa\x76\x94\xbd\xb6\
-\xcb\xf1\xaa\x25\xab\xdd\xbc\xe6\xb9\x39\xb5\x19\x0b\x63\x6e\xe5\
-\xcd\x6c\xc5\x41\xe3\x67\xad\xab\x64\x9c\x56\x96\x65\x47\x4a\x9e\
-\x0b\x03\x66\x58\x21\x85\x09\xc1\x7a\x23\x95\x7e\x5e\x27\xbf\x32\
-\x16\x1f\x3f\x24\x29\xe2\x21\xf3\x63\x9b\x74\x3d\xf2\x53\x01\x6a\
-\xaf\x7e\x28\x27\x09\x7a\xab\x15\xda\xc5\x9a\x8c\x5a\x06\x14\x64\
-\xf4\xd7\x86\x70\xa9\x07\xb7\x4d\x2c\xc8\xa3\xe4\x68\x99\x00\x2b\
-\x0b\xb4\x4d\x64\x79\xde\xd8\xe2\x00\x53\x4b\xbb\x49\x64\xf1\x2a\
-\x36\x65\xfb\xf3\x84\xd6\xc1\xab\x39\x5c\x4e\x88\x6a\x4c\x48\x5b\
-\xd6\x1a\x25\xfb\x72\x37\x6c\x59\x2c\x71\xfa\xec\xb3\x94\x76\xbd\
-\xc9\xf1\x8b\x2b\x22\x9d\xd4\x04\xb6\x24\x5c\xe2\xe8\x1f\x76\x14\
-\x1c\xa4\x55\x35\x63\x88\xe3\x4f\x14\xb8\x2a\xcc\x77\xdf\x55\x28\
-\x33\x2e\x1a\x51\x72\xdd\xe2\x1d\x15\x9b\x2c\xda\x14\xb7\xd6\x04\
-\x66\x05\x9a\x7f\xd9\x18\x7a\x59\x62\x74\xb9\x89\xb0\x5d\x44\x07\
-\x33\x23\x07\x1d\x8a\x28\x51\xdb\xab\x93\x4c\x29\xb3\x67\x6b\xce\
-\x87\x49\xef\x40\x8b\xcf\xe5\xd9\x8f\x1a\xa4\x8e\x05\xda\x38\xae\
-\x1b\x93\x3b\x4c\x57\x2d\xc1\x9a\x68\xb8\x89\xc5\xa5\xb6\x82\xa4\
-\x78\x3d\x68\x4f\x5f\x68\x64\xd0\x8d\x51\x5e\x57\x70\x76\x03\x6e\
-\x17\x58\xa2\xda\x54\xb4\x87\x56\x52\xe4\x70\x55\x62\x1a\xe8\x16\
-\x87\x21\x6f\xe9\x6c\x53\x15\xb3\x12\x2e\xcf\x0b\xa4\xd8\xdf\x43\
-\x9b\xcf\xdb\x29\x6e\x50\xcd\xb4\x57\x35\xa4\x8d\x4e\x88\x3c\x8f\
-\x46\x8b\xef\x09\x84\x43\xfb\x24\xb5\x37\xd7\x6c\x4e\xb5\xae\x91\
-\xae\xe9\x5b\x8c\x4e\x53\x7d\x54\x30\x3e\x4d\x52\x0f\x1c\x13\x3c\
-\x5c\x16\x88\xe3\x11\xf9\x68\xac\xf0\xd2\xc4\x8c\x86\xf2\x0c\xdd\
-\x56\x80\x8b\x2a\x4e\x9d\x2c\x88\x4f\x58\xad\xf6\x6a\x51\xa8\xd0\
-\xbd\x4f\x77\x8b\x00\x61\xe9\x3e\x80\x2b\x90\x36\x0b\x35\x7b\x8a\
-\x0f\x0b\xdb\x59\x94\xb9\x64\xf3\x4c\x73\x25\xd2\x3b\x7c\xf0\xa5\
-\x22\xfb\x99\xa1\x78\x60\xbc\xfb\x01\xf1\x12\x05\x8d\x4d\x2a\xe7\
-\x1a\x94\x15\x77\x65\x18\x61\x85\xbb\xc6\x8b\x73\x05\xe4\xe3\xf0\
-\xe7\x14\x35\x09\x98\x92\x14\x84\x77\x18\x55\x15\x71\xe6\x22\xb9\
-\xb2\xc7\x81\x34\x01\x1f\x07\x9d\xc1\x6d\x1d\x19\xbd\x8a\xef\xa9\
-\x73\xe4\x43\xb8\x0e\x98\x24\xba\x33\x71\x40\xb9\x16\xbf\x86\xff\
-\x1f\x6b\x1c\xac\xf0\xb2\x84\x8b\x3d\x0c\x91\x77\xd3\x4a\x39\x2c\
-\x9b\xf1\xab\xad\x21\x94\xb0\x31\x84\x17\x38\xac\xa7\xc8\x87\xde\
-\xf7\xdf\xda\x60\xa4\xbe\x82\xe7\x4d\x44\x21\x60\xaf\x4f\x01\x77\
-\x89\x67\xe8\x6b\x98\xff\x63\x29\x89\x09\x7c\x19\xf4\x33\x64\x36\
-\xcd\xaa\x50\x85\xed\x2d\x0c\x65\xb3\xb3\x66\x63\x85\xf0\x9a\x31\
-\x80\x9e\xce\x63\xce\xd6\x0f\xc3\xe2\xc5\x28\x2c\xca\x39\x76\xb2\
-\xf5\x63\x54\xce\xac\x32\x3d\xa5\x63\xa7\x3e\xc4\xf4\x8c\xcc\x12\
-\x55\xec\x78\x8f\x33\x99\x15\xa8\xf7\x95\xe6\xc5\x9e\x79\x86\x3c\
-\x7d\x24\xd6\x7f\xbb\xc8\x3e\x72\xc4\xde\x3e\x24\x24\x33\xa6\x19\
-\x94\xc0\x22\x1e\xd0\x99\x38\x59\x33\x07\x1a\xb3\x41\xf6\x8d\xa5\
-\xa2\x1a\xa9\x3d\xc6\x2b\x8f\x8e\xd8\x9a\xbb\x7a\xed\xb1\x8d\x2c\
-\x35\xd5\x28\xd1\x73\x2e\x6c\x4e\x74\x08\xcf\x61\x7b\x7a\xb8\xa9\
-\x10\x70\x37\xfb\x8a\x95\xad\x30\x25\xe9\x1c\x5f\xe4\xa8\x05\xc0\
-\xa2\xd8\x7e\x35\x15\xb0\x1c\x93\xe6\xde\x2e\xd1\xa9\x8f\x15\xb6\
-\xfb\x7b\x31\xc1\x35\x76\x4b\x20\x05\xa9\x74\x94\x8d\xaa\x66\x99\
-\x90\xd5\x9a\xef\x9b\x4a\xb8\x5e\xc0\xe9\x3e\x1c\x00\xbc\xa3\x5c\
-\x09\xa2\xc1\x48\xbd\x21\xfa\xfe\x93\x09\xec\x33\x4c\x6c\x15\xc1\
-\xfa\xb7\xbb\x96\x9b\xd5\xac\xe1\x04\x85\x01\x77\xa4\x9b\x5c\x5b\
-\xfa\x6e\x16\x4f\x36\x97\xc1\x6c\x12\x19\x0b\x28\xb0\x3d\xbf\x6e\
-\x19\x47\x3e\x0d\x9a\x87\xf3\x09\x9b\x94\xc8\xbc\x30\x57\x77\xe9\
-\x41\x37\x03\x97\x2f\x11\x4b\xcc\x7d\xaf\xeb\x15\xa7\xd4\x8c\x48\
-\x66\xf6\x65\x87\x64\x65\x82\x3d\xe0\x59\x6e\xec\x52\xa7\x99\xd2\
-\x3d\x05\x19\x9b\x8c\x52\x3e\x86\xb5\xb7\x8a\xf4\xd7\x0e\x93\x5f\
-\x38\x30\x9b\x72\x62\x15\x33\x0e\xbb\xeb\xd8\xe2\xcd\x82\x31\x26\
-\xbe\x69\x16\x8a\x86\x3e\x83\x94\xe6\x34\x59\x09\x8a\x79\xcc\x47\
-\x29\xbe\xc5\xf8\x4b\x9b\x7e\x97\xcc\x2b\xba\xda\xa6\xda\x33\x7a\
-\xcb\x24\x87\xd7\x72\x58\xdf\x84\x9b\xc4\x2d\xca\x06\x58\xd2\xda\
-\x79\xca\x9c\xd6\x95\xf1\xdc\x66\xb5\xdc\x16\xd1\x20\x1d\x05\xf1\
-\x98\x34\x52\x19\x64\x43\xac\x14\x39\x4b\x92\x9e\xbd\x7e\xb9\xb1\
-\x05\xeb\xaa\xec\x5b\x22\x71\x49\x98\xdb\x60\xb0\xd3\x85\x04\xb1\
-\xdc\x1d\x8d\x24\x6c\x4e\x88\x5c\x8c\x70\xc0\xc9\xf9\x3e\x52\x93\
-\xef\xd0\x45\xea\xa0\xc3\x82\xb9\x21\x48\xd2\x4b\xa4\x74\x2e\x32\
-\xd4\x02\x99\x88\x7c\x2c\xed\xee\x56\xa1\xba\x66\x57\xc0\x70\x76\
-\xa7\x8c\xf7\xab\x3c\xc6\xf7\x5d\x06\x6b\xce\xa6\x44\x96\xce\xef\
-\xcc\xe8\x99\x33\x97\x35\x9a\x66\xd3\xb3\xf5\xc6\x71\x2d\x36\x5b\
-\x2e\x11\xdb\x58\x5d\x29\x30\x63\x35\x93\x81\x81\x32\x4c\xee\xf5\
-\xb2\x7b\x70\xf2\x73\xc3\xde\x4f\x1e\x11\xcf\x30\x0c\x9a\x5c\xbb\
-\xc9\x64\x0c\x83\xbc\x74\x82\x88\x76\xc0\xa0\xc7\xd1\x9d\xab\x1c\
-\x2d\xcf\x18\xc1\x2e\x61\x8c\x5c\x13\xf7\xcc\xc9\xd0\x09\xc3\xc8\
-\x46\xf1\x9e\x0c\x50\x8a\xf4\xb2\x47\xa4\x14\x87\xf0\xad\x0a\x4e\
-\x9f\x40\x4f\x9f\xf3\x3a\x9f\x58\x32\x9e\xc6\xc7\x8f\x53\x58\x9f\
-\xc0\x4b\x1c\x23\xc8\x6d\xe1\x8c\xbb\xac\x1f\x97\x31\x3d\x3f\x31\
-\x21\xef\x11\xbc\xd8\xc7\xcd\xea\x06\x27\x34\x4f\x8a\x4b\x68\x44\
-\x0b\x16\xd8\x98\x57\xcf\x1d\xc2\xe5\x0c\x97\xe2\x36\xc3\xe4\x03\
-\x76\xd1\x31\xdf\xeb\x08\x4e\x01\xce\x7a\x30\xb8\x6d\x1b\x30\xd4\
-\xae\x91\xbd\x56\x91\x76\xe2\x08\xae\x08\xfc\xe2\x06\x11\x1d\xd9\
-\x96\x86\x3e\x7e\xd0\x2c\x6e\xf0\xdd\xac\xdc\x6d\x6b\x36\x38\x09\
-\x70\xce\xb1\x0c\x7b\x3a\x46\x4c\x0f\x4b\xcd\xc4\xac\x8b\x76\x56\
-\xca\xc5\x76\x0d\xf1\xcb\x3f\xc6\x83\x65\x4a\xe6\x49\xb6\x9d\xf6\
-\xdf\xcc\xd3\xbf\x7c\x48\x5d\x23\x8f\x84\xcb\x6e\x3a\x35\x8b\x74\
-\x79\xc3\x81\x82\x75\x65\x00\x10\xea\x26\xb1\xfb\x05\xe5\x59\xb0\
-\x23\x80\xa8\xa0\x05\x90\xa2\x4b\x7b\xd2\xb0\xcc\x0a\x15\x65\x0f\
-\x02\xdf\x69\xac\x08\xd3\xb4\x14\x6b\x4e\xf6\xe1\xf7\x2b\xb8\x62\
-\x3d\x3d\x9f\x8a\xe9\xcd\xc2\x9b\x24\x28\x25\x30\x70\x65\x07\xb0\
-\xa1\x71\x29\x91\x6f\x56\x90\x18\x60\x63\xd0\xfc\x2b\x1a\xce\xf6\
-\xe1\xa1\x40\x74\x1e\x76\xc2\xd1\x0d\xca\xc5\x04\xa0\x5b\x39\x5c\
-\x63\xa8\xdc\xc4\xe0\xd5\xf6\x3f\x33\xee\xdf\x2c\xf5\x02\x07\x74\
-\x62\x50\xcb\xdd\x48\x9f\x1a\xf1\x62\xc0\x4f\x36\x81\xeb\x0c\x36\
-\x49\x57\xb3\x47\x68\x8a\x49\xbc\x57\xac\xcd\xc1\xb7\x36\xce\x97\
-\x71\x20\xee\xa6\xdb\x8a\xa4\xa3\x77\x5c\xf6\x4f\xd9\x9f\x5e\xcf\
-\x70\xd5\xac\x61\xa4\xba\x43\x75\xec\xdc\x18\x63\xe9\x95\x3c\x3f\
-\x03\x8d\xc4\xa4\xf9\x9f\x25\xea\x8c\xf5\x8b\xcc\x38\x64\x26\x73\
-\xc1\x6f\xe9\xf5\x5f\x1f\xf5\x3f\x72\x04\x24\x61\xd7\xae\x31\x18\
-\x3e\x00\x7a\x08\x19\xc3\x6a\x89\x75\x82\xe9\x06\x85\x8f\x33\xd8\
-\x21\xa0\x5c\x76\x5e\x0f\x53\x9e\x8a\x39\xe0\x5e\xb6\x02\x2e\x82\
-\x86\xc0\x45\x20\xff\xca\x83\x0d\xdd\x66\x2e\xf3\x43\xf8\x6e\x0d\
-\x2f\x6e\xc2\xd7\xbc\x72\x41\x06\x68\xbe\xa2\x56\xa8\x50\xe3\x2c\
-\x99\xd7\x7d\x86\x09\xa3\x66\xad\x89\x05\x60\x85\x75\xf3\x06\xcd\
-\xa7\x98\xb2\xbd\xc9\xdc\xbc\x2a\xe5\x7b\xda\xe8\x20\x98\xb7\x34\
-\x68\x56\xc0\x73\x0c\x21\xfb\xae\xc2\x86\x22\x05\xa5\xf4\xf2\x1c\
-\x0c\xfe\x7b\x01\x60\xa3\x87\x1b\xda\x76\x4e\x8e\x5f\x57\x35\x56\
-\xb6\x6f\xa6\xf1\x0e\xe7\x73\x38\x2f\x90\xc5\xbf\x45\x19\x0c\xa0\
-\xc8\xc1\x66\xac\x9a\x2d\x49\x8a\x66\x6f\x92\xb8\x0d\x5b\xb8\x1f\
-\x4e\xc2\xb9\x0f\x33\xab\xfe\x56\xe0\x43\x16\x60\x45\x2b\xc3\xea\
-\xc6\xde\xac\x5e\x0f\xbe\x9c\xa7\x1f\x73\x95\x99\x88\x40\xcb\x9c\
-\xb3\xcc\x84\x6a\xac\x30\x9e\xfd\x33\x72\xfd\x47\x0e\xd6\xd0\x67\
-\x0f\x6d\xef\x76\xe5\x04\x61\xe6\x11\xf6\x73\x38\x69\x2c\x9e\x63\
-\xeb\x22\x63\x85\x07\x3d\x54\x19\x38\x50\x9e\x44\x5c\x8a\x0c\x66\
-\x70\xe7\xfe\xaf\x0c\xcc\xdd\x9a\xc5\x38\x74\x6c\x92\x96\x0d\x73\
-\x40\xdf\x1c\x33\x1e\xc1\xf7\x4a\x78\x65\xcd\x05\xb2\x65\x3d\x2b\
-\x04\xf3\x17\x58\x0e\x2a\xc5\x8b\xb9\x98\x63\x40\x79\xbb\x87\x57\
-\x5e\x13\x1d\x28\x92\x10\x63\x5d\xb6\x89\x54\x72\x78\x7f\x01\xa7\
-\xd6\x30\xcb\x7b\xc8\xaa\xf9\x39\xba\x2d\x9f\xa0\x73\xb8\xa2\x10\
-\x8e\x9b\xf5\x7f\x5b\xa1\x7a\xcc\xe5\x71\x73\xb8\xa4\x51\x2b\x66\
-\x00\x3a\x16\x25\x0a\xa0\xba\x97\x2a\xfc\x35\xfb\x83\xd9\x52\x4e\
-\x14\x70\x95\xa3\xba\xe6\x3e\x81\x43\x4b\xf6\x6b\xd6\x2e\xee\xd7\
-\x7e\x58\x90\x6c\x53\xc5\x29\x3f\xff\x59\x45\x33\x9c\x93\x6e\x76\
-\xc0\x96\x35\xa0\xe5\xc7\x9e\xad\xc2\x3c\xae\x28\xa8\x9e\x5b\x03\
-\x9e\x51\xdf\x3c\xe0\x32\xe1\xe2\x81\xca\x7e\x63\xb2\xfe\xf7\xf6\
-\xe9\x19\x5b\x6b\xb6\x78\xc0\x58\x41\xaf\x80\x93\xe4\xdd\x0d\x02\
-\x32\xbf\xda\x25\xc6\x23\xc7\xf6\xaa\xbe\x40\x3c\xf0\xd6\x45\xd9\
-\xab\x9a\x1c\x76\x41\xff\xb7\x7f\xf3\xe0\x18\xdb\xa7\xa0\xa0\x77\
-\x16\x34\x24\xd0\xb1\x37\xda\x93\xd3\x13\xf8\xf7\x0f\xe1\x43\x9b\
-\x2e\x0d\x54\x34\xb2\xa4\xae\xa4\x23\xc5\xc5\x73\x6d\x82\xb9\xa1\
-\x1b\x19\x96\x32\xd9\xa9\x80\x35\x4f\x89\x97\x31\x86\x4b\x12\x5e\
-\x14\xa8\x7e\xbb\x49\xfa\x7b\xdb\xab\x55\xb3\x98\x98\x27\x11\x28\
-\x6a\xe5\x27\x38\x6c\xd9\x9c\xff\x2e\xc7\x5c\x84\x39\x45\x41\xd5\
-\xae\x67\xc8\x7f\x9b\x10\x68\x5b\x62\x80\x1e\x41\x73\xca\x64\x4d\
-\xf0\xc6\xc1\xb3\x1a\x4e\xf5\x10\x71\xed\x73\xd7\xb3\x39\xa4\x44\
-\x9b\x18\xc6\xb6\xb4\x0f\xc7\x46\x84\xd8\xa6\x2c\x7d\x8c\xa9\xcc\
-\x04\x8e\xa3\xc3\xf0\x72\x74\xe7\x72\x1f\x3a\x1b\x8f\x75\x99\x9e\
-\xdb\x8c\xc5\xa7\x31\xf4\x4e\xb4\x4a\x2a\x03\x2c\xe0\xa3\x82\x75\
-\x41\x09\xfb\x5c\x0f\xde\x52\x5b\x3f\x7d\x24\xbe\xb4\xa7\xf0\x29\
-\xe6\xfe\xbe\x1b\x7f\x9c\x16\x70\x5a\xc1\x5a\x82\x6f\x9e\xd0\x08\
-\x90\x89\xae\xea\x3b\xdd\x56\xae\x5d\xfa\xa6\x08\x2c\xbb\x34\xf4\
-\xb1\xff\xc1\x2e\x83\x12\xe1\x68\xd2\xe4\x63\xdf\x03\x8d\x11\x42\
-\x9f\x66\xf7\x25\x19\x96\x54\x67\x56\xaf\x50\xc0\xfb\x14\xbc\x76\
-\x0a\x3d\xfd\x90\x47\x43\x86\x83\x1a\x5c\xfa\x5c\x09\xcf\xe5\xd8\
-\x90\xec\x26\x6d\x50\xda\x8f\xc2\x44\xbe\x52\x91\x51\x72\xe4\x82\
-\xcc\xf9\x3f\xa0\xe0\x8c\x40\x23\x3e\xa0\x46\x09\xa0\x2a\xae\x26\
-\x84\xe3\x39\x09\xd1\x8c\x9f\xee\xf5\x51\x4f\x76\xc0\xdc\x74\x65\
-\x73\x07\x50\x78\x03\xd8\xc0\x03\x9b\x9f\xd1\x92\xb3\x0d\x94\xb5\
-\x28\x07\xad\xe1\xc2\x38\xa9\xb0\xe1\xd4\x30\x85\x5b\xd4\xf6\xcc\
-\x25\x9b\x1b\x7d\x19\x64\xd0\x4b\xb0\x6a\x3b\xa5\xdd\x7c\x94\x72\
-\xbf\x2a\x62\x20\x14\xc6\x00\x05\x4b\x66\x37\x26\xe8\x6e\x88\x75\
-\xe1\xcf\x8c\x99\x55\x33\x79\x7a\xe8\x3c\xed\x7e\xe9\xcd\x47\x29\
-\x55\x6f\x97\x39\x95\xa1\xc7\x5a\x3c\xd2\xd6\x60\x44\xb5\x41\xa4\
-\xc5\x36\xdf\xfc\x6c\x9e\xfc\xf5\x03\xa6\xf6\x78\x55\x6d\x54\x60\
-\xa3\x6c\xe8\x31\xf4\xee\x3d\xe2\x5e\x0e\xfc\xfc\x4a\x9b\x48\x82\
-\xf0\x99\x31\xb7\x4e\x26\x56\x6a\x46\xb8\x65\x44\x26\x3e\xa6\xbf\
-\x79\x41\xbf\xa2\x67\x6e\x0c\xda\x98\xf5\x5a\x01\xeb\x0c\x3b\xc3\
-\xf4\x15\x7e\x8a\x09\xcc\x04\x95\xcb\x4a\xea\xc2\x67\x4e\x68\x30\
-\xf7\xe1\x11\x7c\x68\x04\x1f\x38\x05\x6f\x59\xee\x48\x47\x5d\xe1\
-\x15\x54\xd5\x7b\xc6\x41\xbe\x30\x82\x13\x03\x78\x27\xe8\x98\xa0\
-\xa0\x9a\x27\x65\xe2\xe0\xc9\x10\xae\x00\xbc\x20\x30\xff\xff\x36\
-\xb5\x4b\x70\x46\xc6\x2b\xc1\x8f\x05\x57\x58\x2f\x3b\x84\x67\x19\
-\x96\xbd\xee\x53\x37\x4c\x4d\x1b\x11\xea\xfb\xc7\xf8\xfa\xc9\x14\
-\xbb\x97\xdd\xe7\xbe\xca\xd6\x0b\xc3\x6c\xf0\x63\x10\x7c\x6f\x04\
-\x2f\x68\xd8\x14\xb0\x9d\x61\xf5\x20\x27\xd9\x42\x11\x8b\x32\x4a\
-\x3e\x3e\x0f\x46\xbb\x95\xb2\x25\xc5\x22\x25\x45\x78\xbc\x6c\x48\
-\xe8\x72\xec\x14\xa4\x57\xf4\xe8\x33\x09\x1c\xb6\x84\x75\x3e\x3d\
-\x1d\x7f\x33\x56\x99\x9d\x8b\x15\x3a\xc9\x59\xce\x84\xec\x63\xc3\
-\x95\xec\x2b\xac\xff\x4b\x79\xf2\x0b\x8f\x39\x72\x0b\x92\x32\x44\
-\x05\xfd\x9f\x1b\x48\x0a\xb0\x4e\xf5\x3e\xc3\x02\x47\xf3\xd9\x26\
-\xa6\xcc\x37\xbc\xb1\xb5\x76\xb6\xe2\x49\x7a\xfb\x1e\x92\xc5\x8c\
-\x68\x8a\xf7\x18\x9c\x80\x1e\x89\xe9\x1c\x0d\xfd\x14\xc0\x69\x80\
-\x2d\x8e\x0b\x49\x98\x13\xf5\x48\xb4\x08\x88\xa6\x0e\xe8\xbd\xc6\
-\x1c\x27\x74\x01\x05\xb5\x12\x38\xcc\xe1\xf7\x1d\xc0\x4b\x1b\x70\
-\x73\x82\x1d\x0a\xaa\x4c\x8d\x17\xc3\xb8\x06\xae\x05\xee\x56\xef\
-\x2d\xb0\xd8\xef\x26\x73\x9b\x49\x05\x97\x49\xd1\x30\x12\x38\x71\
-\xed\x7d\x39\xac\x6f\xc0\x5d\xe6\xd0\x7c\x08\xaf\xdd\xc0\x5a\x5a\
-\x30\x26\x4e\xb8\x06\xc8\xca\x1b\x68\x67\x02\xd0\x82\x3c\x6d\x9e\
-\x62\xbb\x84\x73\x0a\x41\x94\x39\xdb\x3b\xaa\x12\xca\x87\x81\x35\
-\x5e\xfc\x08\x6b\x59\x2e\xa5\x58\x6e\xfb\x35\x2a\x2b\x61\x3c\xaa\
-\x92\x69\x8e\x73\xcb\xe3\x57\x6a\xd8\x4c\x37\x7e\x90\x8d\x53\xe5\
-\x2c\x59\xa5\xc9\x7d\x87\x44\xfd\x7c\x8d\x4d\x17\xdb\x75\x6d\xa9\
-\x39\x5f\xa8\xb5\x7c\x17\xf2\x27\x6e\xf8\xea\xd4\x6e\xc1\x95\x8f\
-\x4f\x6a\x39\x81\xec\x4d\x96\xfd\x93\xe1\xe0\x57\x76\x53\x9c\xae\
-\x3a\xb1\xb4\x34\x79\xd9\xfe\x04\x4e\x72\x6c\xc2\x68\xfc\xfd\x5e\
-\x8a\xbe\xd3\xe9\x25\x3d\x41\xa1\x02\x5c\x5e\x82\x75\x6b\xbe\x43\
-\x9a\x06\x65\xdc\xfc\x98\x3c\x52\x9f\x63\x7b\x82\xf3\x12\x4e\x02\
-\x4a\x53\xd0\x7a\x04\xa2\x85\xc7\xc4\xfd\x1f\x52\x67\x98\x1c\x1c\
-\x79\x6f\x4b\x04\x35\xa5\x28\xcd\xc2\xdb\xd3\xf0\xda\x1e\x7c\xcf\
-\x49\xb8\x9b\xc1\x91\x8e\x75\xc2\xbe\x65\x36\x23\xb5\x82\x59\x3c\
-\x2f\xe7\x90\x25\x58\xc1\x64\xd9\x4f\x19\xa3\x79\x63\x8b\x57\x68\
-\x46\xc3\xc1\x00\x21\x50\x11\xc3\xeb\x72\xdf\xc0\x00\x63\x04\xa7\
-\x18\x1e\x69\xce\xff\xb0\x80\xa3\x3e\x75\x66\x4d\x70\xe5\x6c\x1e\
-\xa2\x3a\x2d\x4d\x51\x20\x79\xc0\xaa\x79\x24\x61\x75\x88\x59\x27\
-\xfd\x02\xc9\xd3\xbe\x20\xf2\xde\x37\x3a\xae\x55\xeb\xaa\x60\xf4\
-\x55\x19\x02\xa9\x06\x41\x29\xdb\x5a\x11\xea\xc6\xa9\x5c\x3c\x00\
-\xc9\x42\x6e\xb5\x35\x3b\xdb\x25\x3f\x55\xb6\x61\xe7\x0b\x6e\x20\
-\x4d\x43\x9f\x61\xbb\xad\x96\x3d\x2d\x1e\x28\x5f\xf7\x6a\x2e\x52\
-\xf3\x13\x45\x89\x55\x85\xe8\x64\xf5\x38\x4d\x3e\x2d\x37\x7f\xf2\
-\x70\x70\x63\x9f\x3a\xb1\x4c\x44\x35\x53\xc0\x00\x8f\x0d\x8d\xbd\
-\xe9\x8c\x9f\x7e\x60\x7c\x61\xaf\x5a\xe9\x3a\x68\x74\x5a\x7a\xf7\
-\x31\xf9\xf5\x23\x0f\xdf\x8d\xcf\x9e\x28\x84\x46\xe6\x24\xcf\x19\
-\x7f\xc9\xe1\x24\xf9\xf5\xc3\x14\x9e\x10\xa5\x78\x20\x70\x8d\x8d\
-\xe2\x47\x6e\xd9\x95\x70\xee\x9f\x01\x54\x43\x09\x2f\x3c\x81\x3f\
-\xba\x86\x2b\xe4\xc0\xf3\xee\x16\x85\x97\x46\x6f\x9d\xab\xf1\xf4\
-\x2f\x17\x18\x06\xdc\x4c\x82\xf1\x80\xda\x81\x04\x83\xb0\x7b\x12\
-\x0b\x02\xcd\xc6\x75\x8f\xae\x56\x07\x13\x33\x2b\xa5\x97\x44\x42\
-\x73\x4b\xc1\x35\x85\x02\x9b\x47\x24\x29\xd3\xc2\xe5\x98\xd2\x11\
-\xb6\x73\x3a\x91\x61\x53\x83\x7b\x16\xd8\xa8\xca\xee\xa1\x8c\xe0\
-\x47\xd8\x2d\xf9\x92\x80\xfd\x02\x7b\xa4\x59\x4a\xde\x26\xbf\x64\
-\xa0\x32\x68\x1a\xbd\x0a\xf2\x18\xb5\x6c\x5a\x93\xc7\x2c\xcd\x9d\
-\x05\xbf\x25\xa4\xdb\xde\x47\x64\xf1\x7e\xdf\x95\xc6\xd4\x77\xbb\
-\x68\xa4\x90\x82\x8e\x43\x1d\xd3\x40\x61\x70\xdc\xaa\x2e\x6e\xca\
-\x10\xba\x77\x18\x0f\xa3\x17\x89\x3e\xd3\x6c\x7d\x85\x79\x77\x4a\
-\x9d\x65\x8e\x44\xef\x8b\x3a\xfb\x4b\x4f\x52\x94\x04\xe6\x5e\x0b\
-\x50\x50\xf7\x95\x13\x0a\x7b\x51\x98\x73\x1e\x52\x9f\x19\x3b\x62\
-\x89\xd5\x18\x03\x02\xee\x39\xe5\xa1\x8c\x95\x18\xb4\x3d\x0c\x20\
-\x0a\x0a\x68\x01\xd5\x8b\x57\x19\x9c\xa0\xee\x92\xc6\x2f\xde\x34\
-\x56\xab\x09\xfc\xb0\x28\x96\x95\x61\xae\x8a\x47\xfb\xb5\x89\x3b\
-\x4c\x8c\x71\xe9\x11\x7c\xdf\x16\x9e\xf9\x51\x12\x88\x52\x78\x45\
-\x80\x70\x70\xdd\x94\x5e\xa1\xac\xe7\xed\xb4\x32\x20\x1b\xc8\x9a\
-\x4b\x35\x5b\xc1\x55\x85\x69\xd1\x7d\x40\x7a\x47\x32\xb7\xc6\x20\
-\x26\x82\x0a\x0a\xa9\x5f\xa0\xba\xa7\xfd\x1e\xd1\x3b\xcc\x59\x3c\
-\x9b\xc0\x45\x05\x17\x18\x4a\xd9\x6e\x93\xcc\xce\x05\xbe\x81\x3a\
-\x1a\x7b\x7c\x1b\x88\x35\x86\x17\x32\xdc\xdf\x70\xd0\x55\xea\x54\
-\x12\xd2\x0f\x58\x0e\x2d\x3e\x8f\xf7\xa2\x9a\x9b\x97\xb1\xbf\x07\
-\x88\x3c\x82\x6c\x48\x41\x83\x90\x37\x59\x22\x76\x9c\xe9\x77\x5b\
-\x10\x8e\x73\xc3\x76\x2c\xe5\x52\x83\x6c\x8f\x97\x11\x6a\x92\xf4\
-\x99\x12\xf8\x3c\x79\x91\x82\x1a\x25\xe9\x67\xe5\xda\x0f\xef\xf4\
-\x30\xc0\x1a\x0a\xe7\xa8\x72\x02\xca\xeb\x63\x04\x21\x5c\x60\x94\
-\x66\xfc\xb7\xca\x00\xe2\x91\xf3\x3a\xe0\xdd\x47\xe4\xad\x47\x74\
-\x92\x51\x81\xf8\xd5\xfc\xdc\xcf\xe1\x45\x85\x52\xc4\xd3\x44\x2d\
-\x9b\x8d\xe2\xab\x1a\xab\x9e\x8f\xec\x2c\x4b\xe6\x80\x50\xc8\x69\
-\xd6\x62\x38\x08\x7e\x36\xb0\x6a\xe3\x3e\xfc\xa7\xeb\x48\xe5\x3c\
-\xd0\x91\x3c\xb8\x7c\x0e\x66\xe7\xca\x15\x96\xa5\xbe\x8f\xa1\x69\
-\xde\xe9\xbb\x9c\x71\x21\xf0\xec\x26\x0e\x31\xfb\xd5\x09\x89\xcd\
-\x0e\x92\x04\xd1\xbc\x55\x6b\x2a\x1f\xe0\x82\x74\xbd\xd9\x90\x60\
-\x91\xd8\x84\xec\x1a\x43\x30\x73\x8b\x3b\xb1\x71\x4e\x1b\xc5\x89\
-\x21\x26\x5f\xa1\x8f\xf9\xa9\x91\xac\xfa\xbf\x6a\x5f\x81\x66\xc5\
-\x67\x72\x08\x17\x0b\xb8\xd2\x43\x60\x76\x4b\x62\x2a\x5a\xf1\xba\
-\xac\x3f\x6f\xd8\xbd\x0c\x6e\x82\x9a\x6e\xf7\xba\xd1\xc0\xa7\xd6\
-\xe1\xb0\xd2\xa8\xb1\xe4\x5d\x60\xcd\xbb\x48\x06\x56\xf9\xed\x12\
-\x8c\x67\xed\xc5\x89\x90\x03\x18\x0d\x45\xf2\xdb\xf9\xe9\x1f\x79\
-\x94\xe2\x30\x61\x4b\xd4\xd8\x3c\xa5\xf1\x7c\xeb\x05\x06\x9a\x06\
-\x27\xec\xd9\x4e\x06\xe1\x88\x25\xf2\xa8\x32\xb0\x78\x4b\xce\xa0\
-\x83\x27\x3a\x6f\x48\x06\x7d\x2a\x87\x0f\x00\xd6\xd1\xf5\xa9\xfd\
-\xcb\x0d\x01\x4f\x12\x64\xcd\x8d\xed\xe6\x9e\xcd\x2c\x82\x44\x55\
-\xe9\xe3\xc3\x87\x2a\x83\xc1\x4f\xa8\x46\xdc\x87\x3f\x95\xc2\x99\
-\x01\x9e\xad\x08\xd2\x34\x91\x58\x80\x2e\xef\x15\xa2\x77\xee\x71\
-\x47\xff\xdb\xca\x29\xf3\x1d\xd9\x08\xd5\x91\x97\x7b\xf0\x68\x80\
-\xf8\x2a\x54\x5f\x3a\x2e\x48\x38\xe5\xb0\xb9\xfe\x67\x18\x06\x06\
-\x8f\x28\x53\x61\x7d\xb3\x79\x3d\x1b\xa3\x2a\x78\xb0\x86\x53\x0d\
-\xf7\xb5\x13\xcc\xd5\x64\xf7\xe6\x43\xcd\xca\x1f\x8c\xe1\xb9\x04\
-\xbb\x2a\xdc\x95\x48\x56\x42\x90\x0c\x0e\x75\x16\x79\x0c\x69\x9a\
-\x56\x1e\x8a\x11\x8a\x86\x34\x5a\x07\xae\xa1\xa6\x43\x0e\x32\x00\
-\xc9\x31\xb9\xcf\xa7\xde\x13\xe1\x29\x6c\x4a\x6e\xf7\xcd\x8c\x65\
-\x72\xf1\x2f\xe5\xc9\x1f\xde\x11\x88\x4a\x47\x9e\x79\xc0\x81\x7b\
-\x1a\xa7\x23\x9d\xa2\x3c\xd6\x2e\xa5\x81\x98\xd7\x5a\x69\x17\x14\
-\x38\xec\x51\xf2\xee\x63\x0a\xd1\x2c\xa4\x31\x2e\x5f\x48\xb8\x50\
-\xc0\x7b\x34\x5c\x26\xcc\xf0\x30\x81\xb7\xb0\xc1\x0d\xe9\x2b\x89\
-\x2e\xb4\x6f\x29\x51\xcd\xc4\xf3\xf4\x32\xe8\x35\x19\x3d\x5d\xa2\
-\x5c\xcc\x2b\xc3\x31\xfc\x89\x09\xbc\x74\x06\xde\x56\x4e\xa7\xae\
-\x20\x32\x7a\xbb\x60\xb8\x82\x57\x27\xd4\x6f\x83\xda\x44\x96\x26\
-\x35\xce\xb1\xec\xe3\x45\xc0\x6a\x5e\x03\xf7\xc7\xb5\x56\x67\x65\
-\xd5\x95\x59\xf3\x43\xc4\x63\x5b\x29\x98\xfb\xb3\xed\xd3\xcc\x98\
-\x7f\xc8\x91\xb1\xb9\x98\xe0\x16\x71\x9b\x58\xd7\xb2\xb8\x58\x07\
-\x35\x22\x06\x44\x99\xcf\xba\x24\xe1\x1a\xa9\xed\xb7\x35\x96\x01\
-\xe8\x98\x39\x2d\x02\x72\xa6\x08\xd0\x7c\x0d\xe2\x47\x63\x82\x74\
-\x94\xab\xd2\xf1\x70\x66\x88\x2b\x1b\x6b\x43\x81\x0a\xdd\x55\x97\
-\xd6\xa6\x4f\x8e\xd4\xc8\xb3\x92\x5f\x65\xa1\xf5\xf1\xe5\x56\xbb\
-\xe4\xa7\x5a\xf2\x0f\x14\xb9\xfa\xa2\x3f\x89\x75\xaf\x2c\xfb\x8c\
-\x5e\xfb\x41\x03\x69\x1e\x53\x2f\x2e\x49\x56\xa5\x29\x1a\xeb\x1b\
-\x14\xce\x31\xd6\x3c\x20\x3a\x85\x89\x6a\x96\x58\x18\xbc\x96\x16\
-\x3f\x24\x37\x7f\x44\xa5\xa8\xe6\xee\xf7\x49\x2c\xfe\x02\x83\xcb\
-\xd4\x14\xe0\x1e\xd0\x58\x28\xee\x62\xdc\x89\x7f\xc6\x63\x4f\xf2\
-\xe8\x20\x53\x6b\xeb\x9e\x0a\xed\xf0\x95\x22\xee\x48\x91\x21\x4b\
-\x9a\xa7\x70\x34\x86\x3f\x74\x08\xdf\x79\x1a\x11\xf6\x48\x44\xe5\
-\x82\xd5\x53\x27\x7f\xf8\x12\x15\x68\x1b\xf8\x51\x49\x1e\xc8\xa6\
-\x5e\x28\xe0\x6c\x06\x06\xce\x3d\x29\xc5\xa1\xb1\x32\xd9\x16\x6b\
-\xe3\xf8\x10\xea\x54\x7c\xdb\x0f\x60\xb3\x93\x93\x4f\x14\xa4\x91\
-\xcc\xb0\xad\xb6\x41\x4a\xce\xc7\x7b\xe5\x42\xc9\xff\x1c\x29\xec\
-\x71\xf0\x4a\x0e\x6b\x7d\xb8\x43\x1c\x80\xbd\xb7\x0a\x5c\x15\xa5\
-\x6c\x6c\x6e\x79\x6c\xe8\xad\x6e\xbe\xcc\x33\xd4\xb2\xcb\x30\x6d\
-\xee\x55\x4d\xb3\xa9\x93\x8e\xf6\xd7\xbd\x2d\x54\x4b\x1e\x6a\x7a\
-\xc7\xa5\xa7\x91\x9f\x6a\x66\xdc\xca\x83\x13\xcd\x73\x63\x0e\xbc\
-\x30\xc0\x9c\x89\xe4\x2b\xb0\xf1\x7f\xef\x24\xbf\xb9\x97\x62\x6a\
-\x13\xa8\x03\x23\x0e\x24\x93\x98\x70\xdd\x4a\x90\x4c\x34\x91\xeb\
-\x11\x79\x74\x51\x33\xa9\x92\xa8\x21\xd2\xdd\x32\xf1\x66\x97\xdf\
-\xc5\x0c\x2d\x6c\x24\x58\x4f\x74\x55\x63\xf2\xd2\x7c\xf4\xdd\x35\
-\xac\x85\xcb\x99\x83\x40\xa1\xfa\x40\x7a\x67\x3f\x69\xe6\x20\xed\
-\x8e\x4f\x46\x8f\xea\x83\x1c\xed\x15\x09\x7b\x63\xe5\x47\xf0\xde\
-\x11\xfc\x91\xd3\xe8\x3b\x0f\x59\xb4\xcb\x57\x45\x1e\x74\x96\xf7\
-\x17\x58\x3b\x72\x8f\xbb\xcf\xc2\x13\x52\x1f\xc9\xe7\xa8\x1d\xc8\
-\x4d\xd2\xe7\x80\x8e\xeb\x65\x0b\xaa\x56\xc9\xe1\x34\x4d\x11\x4c\
-\x05\x76\xd0\x3e\xf4\x7a\x49\x13\xa3\xa7\x39\x55\x63\x09\x78\x6c\
-\xb6\x47\x02\x42\xbc\x94\x37\x97\x52\x39\xc2\x6f\x06\xc5\x5d\x19\
-\x62\x73\xb5\x83\x01\xc6\x03\x76\x1b\xc1\xad\x89\x57\x62\xd2\x52\
-\x71\x94\xfb\xd5\x92\x43\xe4\xfe\x9b\x18\x2f\x8c\x59\x1d\x41\x14\
-\x77\x35\x6c\xc2\x7a\x1d\x6b\x51\x65\x87\x7e\x0a\x2b\xa2\xa0\x15\
-\x1a\x4d\x6a\x58\xaa\x28\x76\x1a\x65\x09\xe8\x19\x8b\xcd\x42\x09\
-\xdd\xbb\x21\xb2\x8f\xed\xf5\xff\xc9\x2e\x19\xc4\x84\x7b\x5c\x91\
-\xa0\xe9\x9f\x12\xc8\x2d\x8e\x86\xf0\xa8\x8f\xa1\x1b\x83\x96\xe2\
-\xe8\xc2\xfb\x78\xb3\x2a\x86\x44\xaa\x1c\x10\x28\x3a\x45\xe3\x65\
-\x4c\x90\x67\xa0\xf0\x9a\x01\xcd\x0a\xfb\xe9\xd9\xb5\x31\x09\x2c\
-\xbe\x74\xf3\xd6\x99\x4d\xa0\xea\xda\x57\x12\x17\xee\x18\x8d\x0c\
-\x52\x3a\xc6\x1e\xf3\x27\x53\xec\x10\x76\x7e\x8c\x9f\xf2\x6d\xa7\
-\x71\x0f\x79\x92\xba\x3a\x26\x59\xa3\xd0\x48\x6c\xf3\xb2\xc4\x6f\
-\x74\x97\xe3\xe2\x91\x1c\x17\x67\x32\x44\x85\xfd\x96\xc0\x56\x4a\
-\x7b\x89\x13\x33\x03\x8b\x7a\xe0\x9b\xbb\xb1\x61\xdc\xbc\x42\xf5\
-\xaf\x39\x6c\x5f\xb8\x13\xe6\x24\x29\xbd\x48\x85\x23\xe6\x54\xb7\
-\x25\xa2\x26\x1d\x2c\x1b\x08\x96\xae\xd9\xd0\xf8\x08\x5b\x61\x9e\
-\xe8\xc1\xfd\x11\x52\xfb\xdc\x83\x78\xd7\x13\x93\x05\x5f\x99\x45\
-\xcc\x55\x68\xee\xd3\xec\x3e\xac\xa2\x52\x2a\x52\x0a\xe9\x20\x57\
-\x15\xa2\x1d\x88\x6a\x82\x13\xe8\x5c\xd0\x34\xcd\x61\xb7\x36\x35\
-\xe8\x12\xe9\xc2\x82\x63\xcd\xbb\x0c\x15\x9c\x21\xa6\xe7\x14\x52\
-\xee\x64\xbd\x5f\x1a\xaf\xff\xec\x83\x14\x23\xce\x22\x24\x13\x72\
-\x24\x28\xb7\x38\x6e\xe2\xd8\x3f\x7a\xdd\xb5\x21\xd0\xb1\xa0\x5c\
-\x85\x91\x2b\x0d\x43\xdd\xa3\xb7\x9c\x27\x85\xc2\xe8\x00\x45\x88\
-\x26\x7a\x33\x27\x37\xb1\xe6\x38\x75\xf0\xbd\x54\xe0\x8c\xbc\x3f\
-\x0b\x99\xca\xdc\xcb\x09\x73\x3f\xa2\xc3\xb8\xf6\xde\x04\x2e\x8d\
-\x11\x3d\x9f\x07\x54\xd1\x6c\x6c\xa0\x74\x79\x9c\xc1\x6e\x81\x2d\
-\x37\x0c\x6c\xb8\x05\x4e\xde\x2c\x13\xa8\x55\x37\x98\x15\xf8\xde\
-\x09\x06\xdf\xb6\x6c\x0a\x43\xe7\x09\xca\xc2\xae\x65\xb8\x00\x6e\
-\x80\x4b\x44\x84\xc3\x93\xed\xbb\x8c\x2f\x37\x91\xf7\xc5\x02\xf6\
-\x7a\x58\x50\xa2\xa8\x37\x93\xb9\x4b\xe6\x92\x36\x73\xdc\xbe\xcc\
-\x35\x3c\xd0\x54\x20\xd2\xf3\x1d\x4a\x74\x34\x98\x0d\x7d\xc1\x04\
-\x71\xff\x8b\xd4\xfd\xf8\xa6\x39\xc9\x86\x2d\xed\xc3\xf3\x97\x12\
-\x9a\x72\xb5\x87\x12\xeb\xa6\xf0\x46\x36\xd2\x58\x3a\xde\x12\x01\
-\xaa\x7e\x69\xba\x41\xe9\xd4\x8a\xf1\xcb\x06\xb4\x2a\xd6\xe7\x1c\
-\x4b\x71\x2a\x9b\xf9\x2e\xcb\xc4\xcf\x2d\xec\x9a\xff\x29\x33\x8f\
-\x49\x34\x2b\xb0\xdf\xa4\x2e\xa8\xc2\x3a\x55\xd0\xd3\x7a\x2c\x92\
-\x8f\xeb\xf5\x1f\x79\x48\x96\x1a\x56\x82\x9a\x87\x9a\x4d\x90\x78\
-\xce\x12\xd8\xa1\xb4\xa8\x1d\x8a\xa0\x3c\x31\xcf\xbc\xb9\x97\xb6\
-\x6b\xb3\xad\x06\xd8\xe4\x43\x6c\xf0\x72\x26\x45\x46\x72\x74\x08\
-\xaf\xa7\x88\x8e\xee\x92\xc8\xa4\x08\x14\x66\x79\x20\xb4\xcc\x03\
-\x60\xe3\x5e\xb7\xa8\x80\xda\x92\x9d\xa6\xda\xa2\x6b\x1a\x2b\x50\
-\x53\x6a\x66\x7d\x40\x52\x9f\x07\x80\x60\x6c\x48\x37\xf8\xb5\x1e\
-\xdc\xa3\xea\x52\x14\xee\x27\x95\x06\xc1\x39\x33\x89\xfc\xba\x41\
-\x72\x37\xa9\x9d\x37\x42\xea\x21\xea\xdd\xb7\x32\x1c\x07\x72\x28\
-\x22\x4b\xc2\x5e\x62\xd6\x6e\x8c\xb1\x16\x98\x7c\x35\xe7\x7f\x67\
-\x80\x11\xbc\x43\x1d\x0c\xcb\xc1\x9e\xd5\x24\xa3\x07\x2a\x01\xe3\
-\x7e\x4b\xf1\x4d\x4a\xb4\x77\xd8\xe6\xb6\xf0\x21\xbc\x0c\x28\xd4\
-\x79\x98\xf8\x4c\x6d\xe9\xc2\x59\x65\xe8\x93\x40\x74\x10\x16\x18\
-\xa8\xf8\x07\x09\xf5\x36\x55\xb2\xd1\x6a\x5c\xd7\x96\x41\x03\xf5\
-\x85\xa5\x86\xfe\x80\xe4\x29\x01\x95\x69\x28\xe5\x29\x8d\x88\xab\
-\xfd\x31\xfb\xfa\x84\x09\x81\x4c\xbb\xca\x74\xce\x12\x71\x0b\xfa\
-\x3f\xb6\x3b\xf8\xf2\x13\x81\x51\x20\xf8\x7c\x8a\x55\x17\x9e\x2d\
-\x60\x93\xc6\x80\x3d\x14\x95\x95\xb3\x40\x46\x62\x75\xbf\x39\x15\
-\x89\x0e\x49\x51\x68\x2c\xde\xfc\x70\xaa\xc0\x3c\xeb\x6e\x0f\xbe\
-\x78\x00\xef\x93\xf0\xea\x1a\x42\xde\xbb\xba\x32\xf7\xa2\x01\xe5\
-\xcb\x05\x60\x9f\xbd\xf2\xca\x9c\x53\x07\xf0\x3a\x20\x6d\x72\xb2\
-\x0f\xa3\x01\x26\x8f\xee\x10\x2f\x34\x8a\x01\xc0\x91\x46\xc8\x2e\
-\x32\x5c\x09\x39\xab\xb4\x2e\x6e\x84\x72\x8e\x67\xbe\x06\xb0\xc6\
-\xe0\x16\x61\x77\x73\x66\x13\x69\x5c\x17\x08\x8a\x6e\xd3\xa0\x84\
-\xaa\xa6\x04\xb9\x1e\x7a\x45\xc1\xc6\x18\x11\xff\x46\x8a\x9d\xc6\
-\x0e\xc0\xd1\xb2\x96\xc0\xbd\x30\xa6\x54\x54\x86\x32\xfa\x5c\xf8\
-\x24\x94\xae\xaa\xcb\xb1\x32\x86\xe4\x37\x07\x23\xec\x84\x73\xbd\
-\x87\xfb\x83\x41\x41\x85\x17\xbe\x87\xe8\xc5\xf6\xf5\x2e\xda\x74\
-\x07\x2a\x4e\xca\xaa\x38\x25\x22\xdb\x42\x55\xd9\x86\xe3\xa1\x41\
-\x68\x36\x1b\xd0\x2a\x9d\xcc\x65\x45\xa6\x03\x95\x59\x05\xd7\xb3\
-\xbb\x07\x1f\xbb\x9e\x9e\x9e\x55\xd0\x9c\xc9\x98\x86\xd6\x03\x85\
-\x13\x84\xf7\x53\xfe\x2b\xe3\x13\x7f\xe7\x11\x35\xc5\xb5\xf9\xe9\
-\x12\xd8\xac\x2b\x38\xcd\xd1\x65\x3e\xa4\x16\xd8\x2c\xd0\xdd\xeb\
-\xc0\x4f\x4c\x28\x87\x3a\x4e\x9c\x8f\x3f\x50\x68\x58\x2f\x4d\x70\
-\x96\xd3\x17\xcc\x61\x4f\xe0\xbb\x38\x9c\x58\x47\x60\x33\xb2\xd3\
-\xf3\xbc\xad\x87\xff\x2f\xff\x16\xc1\x2e\x6f\xec\xf8\xfc\x21\x7c\
-\x50\xc1\xa5\x04\x26\x3d\x5c\x36\x5f\xa6\x95\x60\x2c\x09\x1b\x1a\
-\x07\xc0\xb7\x2c\xf3\x3b\xaf\x5d\x7a\x21\x1c\xc7\x60\x9b\x0e\x8c\
-\x52\xb8\x3c\xc6\xd4\xd2\x2d\x41\x6d\xa7\x72\xb8\x60\xc0\xd2\x00\
-\xad\x79\x8f\x87\x59\x7a\xd7\x82\x01\x8b\xe0\x8d\x2f\x97\x38\x25\
-\xca\x7c\x2f\x64\x6c\x52\x47\xa8\x9b\x98\xe4\x04\x09\xce\x78\x46\
-\xe2\x19\x8d\x0a\xca\x92\xba\xb5\x0a\x61\x49\x62\xa1\x9c\xc8\x2e\
-\x6e\x42\x6d\x8d\xb5\xe1\x8f\x6c\x31\x61\x5a\x01\x92\x3c\x18\x4a\
-\x25\x59\x54\x46\x13\x72\x97\x2a\x28\x42\xd0\x31\x3f\x93\xb7\x85\
-\xa7\x33\x82\x57\x88\x05\x45\xd0\x18\xdc\x22\x55\xb2\x82\xf7\xd5\
-\x0b\x05\xba\x5d\x98\xc7\xa5\x8b\x57\xea\xd2\x08\xd0\x19\x9b\xa8\
-\x6c\xf0\x3b\xea\xc4\x0f\x60\x7b\x51\x41\x43\xb4\xc9\x6d\x73\x2a\
-\x9b\x10\x12\xfb\xb8\xaf\xd1\xde\x3d\x64\xbe\xd9\x98\xae\x2a\xf4\
-\x4b\x7f\x63\x3d\x37\x5a\xbc\xf9\x2b\x71\xae\xc6\xf3\x06\x11\xa5\
-\x08\xaf\xdf\xca\xe1\xfa\x21\x7c\xc7\x00\x86\x7d\x78\x4b\x3a\xf1\
-\x59\xde\x00\x36\x45\x60\xf1\x45\xf0\x98\x0b\x63\xf1\x23\xf8\xd6\
-\x75\xb4\xaa\x9b\x3d\xb4\x9e\x71\x09\xf7\x79\x9d\xcc\x2e\xed\x40\
-\xf4\x30\xae\x08\x1f\x79\x39\xd5\x64\x23\xc7\x78\xc0\x40\xa0\x23\
-\xe3\x83\xc7\x68\xd0\x5b\x96\x3d\x0c\x99\x3e\xed\x0a\xcf\x31\x15\
-\x55\x20\xfe\x49\x18\xdc\xd7\x98\x48\x2a\x01\x49\x32\x42\xc9\xd0\
-\x69\x6a\xdb\xb4\x43\x79\x28\xee\x2b\x68\x81\x45\xb0\xdb\xb8\x83\
-\xc3\x09\x6a\x75\x5e\xe6\x98\x33\x7e\xc7\xcf\x5c\x08\x51\x7b\x1e\
-\x18\x77\x31\xc5\xd0\x67\x57\x09\xea\xc6\x4a\x50\x6d\xdc\xbc\xf2\
-\x03\x02\x9a\xfd\x96\xeb\xd3\x9e\xb1\x8f\x88\x9e\xa6\x8a\xf1\x3e\
-\xbb\xf9\x5b\xaf\x8b\x04\x1d\x56\xf0\xb8\xd5\x30\x45\xf6\xb8\x9c\
-\xe0\x79\x91\x99\x84\x9a\x69\x9a\x58\xc0\xf4\xba\xc8\x1f\xb1\x13\
-\xff\xe8\xa8\xff\x51\xf3\xd8\x0e\xb3\xaa\x2f\x00\x23\x16\x7c\xad\
-\xc0\xaa\xbf\x09\x35\x46\x2d\xcb\x3a\xc3\x1a\x3c\x5d\x42\x14\x4f\
-\x53\x3e\x2e\x0c\x74\x82\xcb\x80\x96\xb4\xcd\xe0\x0b\x24\x31\xf8\
-\xb6\x21\x7c\x38\xc3\x49\x97\xbb\xda\xc9\x33\x5b\x0d\x7d\xd2\xc0\
-\xaf\x76\xa2\xc1\x0b\x0a\xbe\x7d\x13\xde\x4a\x28\x23\xe6\x51\xd0\
-\xd8\xc3\x83\x3c\x7e\x57\x69\x10\x43\xb3\x99\x09\x27\xeb\x8f\xb2\
-\x33\x0a\x49\x18\x6c\x64\x99\xa1\xa7\xbf\x6e\xa2\xf8\x14\xde\x11\
-\x55\x71\x6d\xe1\xbf\x23\xe2\x6c\xb3\x7a\x69\x08\xe1\x8e\x89\x46\
-\x84\xb3\xe9\x09\x51\xfb\x06\xe5\x5f\x4a\x71\xab\xb9\x4d\xca\x53\
-\xe5\xf9\xab\xb0\x95\x95\xf4\x68\xde\xdc\x93\xe7\xc7\xa8\x3b\x78\
-\x42\x99\x6c\x8b\x7f\x42\x91\x85\x0a\xee\x43\x0d\xd8\x14\x0d\xf6\
-\xa6\x56\x21\x2e\xdb\x44\x07\xd0\x70\xf3\x32\x6e\x4a\xd5\xda\x7a\
-\x56\xf9\x7f\xb8\x84\x97\x6a\xa9\x3b\x99\x9d\x84\x0a\x0f\x67\xc0\
-\x9a\xb1\xec\xd2\x7d\xb7\x97\x2b\xed\xad\xaa\x49\x98\x32\x76\x2f\
-\x18\x4a\x24\x7f\x47\x9e\xf9\x81\x9d\x0c\x37\xdc\x89\xa8\xba\xed\
-\x99\x2f\x9f\x50\x0f\xd1\x1e\xc7\x6a\xee\xb1\x08\xbe\x41\xf0\x35\
-\xec\x93\xb0\x86\x68\xd1\xfc\x41\x0e\x27\x8f\xe0\x52\x1f\x0b\x8e\
-\xbe\xc8\x31\xc4\x34\xaf\x7c\xd7\x10\x5e\x32\x5e\xbf\x87\x91\x62\
-\xb9\x83\x17\xb1\xd6\xa0\xf9\x74\xcb\x56\x08\x66\x91\x7c\x93\xc1\
-\xc4\x12\x76\x33\x5f\x6b\x62\xb9\x7c\x16\x25\x29\x0b\x3f\xc5\xc0\
-\xe5\x35\x19\xf2\x39\x38\xa5\x35\x21\xba\xc9\x5f\xbd\xc1\xe8\x06\
-\xd2\xc8\x1e\x42\x9a\xb1\x84\xe7\x27\x90\xf6\xd1\xe8\x0b\x0b\x69\
-\x4a\x2a\x83\xba\x89\xf4\x87\x58\x42\xb5\xb6\x81\x5b\xd6\x88\x3b\
-\x53\x36\xd1\xcb\xa0\xc0\x2c\x5b\x4f\xc0\xa3\x02\x8e\x7a\x55\xea\
-\x57\x07\xba\xa0\x32\x0f\xb0\x67\x62\x92\x43\x78\x99\xe1\x07\xdd\
-\xb5\xab\x8b\x6a\x4d\xca\xef\x3b\xd1\xee\xb6\x34\xef\x40\xed\xce\
-\xc8\x36\x8b\xd7\x8d\x09\xb8\xd0\x08\x67\x5d\x1f\x07\xd6\xe2\xdd\
-\xab\x3a\x01\x1f\x90\x94\x6d\x62\xe9\x87\x64\xd1\x32\xab\x45\x59\
-\xfc\xee\x65\xe9\x2b\x4a\xea\x33\xc9\xd6\xd8\xf8\x81\xc8\x3e\x72\
-\x78\xf2\xe7\x1f\x91\xd8\x4b\xf3\x2a\xec\x33\xee\xf0\x64\x0e\xa7\
-\x12\x04\xbe\xf7\xa8\x9c\x87\xc7\x38\xa1\x74\x18\x96\x35\x1f\x93\
-\xc5\x3f\x01\xb4\x12\x83\x5c\xe5\x16\xbc\x09\xd8\x20\xe9\x88\xaa\
-\xb6\xbf\xc7\x20\x81\x13\x58\x27\x31\xf6\xcc\xa3\x04\x37\x85\xb8\
-\x66\xe2\x32\xde\xe5\x9d\x6f\x23\x52\xcf\xfc\xc3\x18\x8d\x2a\xc7\
-\x17\xb7\x65\x67\xaa\xe2\x68\x70\xdd\xa3\xee\x29\x38\x27\x9c\x08\
-\x5e\xfb\xba\x16\x83\x55\x36\x18\x29\x67\x34\x5c\x9c\xa0\x06\xe6\
-\x1e\x73\xd4\xb8\x0c\xc0\xae\xd9\xe2\x4e\x1c\xc0\xcb\x7d\x6c\xd8\
-\x74\x2b\x87\x82\xd0\xfc\x44\x61\x5e\xf6\x2a\xe0\x64\x42\xf3\xf6\
-\x77\xcc\xf5\xf4\xcb\xf9\xb8\x91\xaf\xb5\x0b\x1b\x35\x45\x05\x3c\
-\x2f\x51\x53\x69\x7c\xfc\xb6\x1d\x4f\xe2\xfb\x3b\x94\x14\x6d\x1e\
-\x07\x27\xb2\x21\x40\x68\xa2\x1a\x39\x1d\xd5\xd4\x72\xae\x55\xde\
-\x8a\xd5\x1d\x7c\x18\xc5\x56\x4b\x97\x55\x83\xe9\x28\xa9\x5c\xc7\
-\x39\x5d\x40\x76\x0d\x78\xe8\x0e\xdc\xe2\xa2\xd3\x11\x9b\x5b\x50\
-\xec\x96\x75\x4d\xeb\x26\x40\xf7\x78\xfa\x86\x3a\xf5\xdf\x1a\xf8\
-\xb1\x97\xb9\x7c\x78\xa9\x0d\xce\xc6\xb0\xc5\x90\x61\x7c\x68\xc7\
-\x69\x40\x9d\xf0\xd6\x81\xd1\x8f\xa9\x06\x6a\xcf\x3c\xe0\x11\x5c\
-\x22\xee\xfc\x2e\xc7\x98\xef\x88\xb2\x54\xe6\xc5\x3f\x5c\xc0\x55\
-\x13\xc5\xe6\xd8\xbb\xab\x80\x0a\xd6\xd7\x1a\x57\xd4\xf8\x38\x55\
-\x1b\x75\xc6\xe1\x8b\x29\xfc\x7b\x29\xdc\x20\x6a\xa8\x2c\x57\x0d\
-\x99\x0d\xe5\x0b\x76\x5d\x83\x24\xfa\xb2\xb7\x15\x3c\x2b\x20\x0b\
-\x01\xab\x42\xa3\x37\x41\xad\xb9\xe6\x5e\x01\x9b\x29\x3c\xf4\xe0\
-\xaa\x4c\x69\x31\x5a\x9c\x27\x26\xf0\x4a\x9f\x6a\x59\xe8\x9e\x59\
-\x37\xbf\x65\xbe\x0e\x69\x30\xef\x2b\xbc\x39\xf6\x53\xa4\xaf\x02\
-\x09\x3b\xf6\x98\x73\x1e\x15\xd0\x1f\xc1\xeb\x09\xea\xa8\xcd\x6d\
-\x19\x12\x91\x6a\x15\xcb\x79\xcc\xf6\xca\x86\xc2\xac\x55\x6c\x53\
-\x6b\x04\x32\x9b\xaf\x84\x60\xe7\xd1\x8d\xc5\x00\x8d\x28\x36\x7a\
-\xdd\x5b\x14\x81\xde\x3a\xce\x09\xba\xf8\xb6\x71\x26\xf1\x9c\x3e\
-\xd6\xa5\x7e\xb6\x73\xd9\x6b\x47\xb6\x5e\x53\x79\x86\x1d\x95\x63\
-\x76\x7a\xa1\x75\x06\x62\x3f\x4d\xfe\x8f\xa3\xde\x47\xef\x0b\x8c\
-\xcf\x64\xe0\x06\xcc\x57\x5c\x9b\x60\x0a\x36\x27\x37\xaf\xa8\x38\
-\x88\xd5\x59\x4f\xd7\x01\x78\x4c\xdc\xdf\x91\x42\x65\x62\xa6\xe1\
-\xd5\x04\xc5\xe2\x6f\x24\x68\x4f\x16\xe8\x8f\x27\xf0\x6f\x1e\xc2\
-\xa5\x93\xf0\xb6\xa8\x22\xb6\x3c\xce\x29\x86\xba\xc2\x26\x09\x5d\
-\x76\xe6\x30\x97\xf1\x46\x01\xbf\x3f\x87\xf7\xf5\x30\xae\xb5\x13\
-\xa9\xa0\x8d\xb8\x70\x09\x51\xe5\x9a\x85\x3c\x16\x70\x27\x87\x67\
-\x52\xa7\x59\x2f\x6b\xa9\x8e\xa8\x1f\xc1\x59\xea\xab\x3c\x56\x55\
-\x42\xb4\x04\x6f\x9b\x13\xb8\x9e\xc0\x63\x09\x07\x99\x0b\x49\x33\
-\x85\xba\xb4\x0d\x2c\x19\xc6\xc5\xc0\x82\xdb\x51\xd6\x04\x96\xc8\
-\xed\x88\x06\x26\x5f\x2d\xe0\xfa\x00\xd7\xff\x4d\x19\x4c\x32\xe4\
-\x2e\x27\x35\x99\x52\x36\x50\x53\xd2\xcb\x36\x77\x50\x2b\x11\x54\
-\x53\x92\xaf\x4d\xea\xa6\xa9\xb8\x84\x36\x0e\x27\x5a\x06\x3a\xe9\
-\x1e\x5c\xb2\x29\x13\x16\x66\x24\x50\x97\xd3\xd8\xcc\x7e\x17\xd1\
-\xc5\x42\x61\xe6\x50\xa7\x5a\xb2\x84\x7d\x59\xae\x7d\xff\xc3\x04\
-\x0d\x22\xf7\x49\x75\xc7\xcf\x14\x48\x35\xac\x65\x08\x57\xc6\x64\
-\x34\x3c\xe8\xa9\x18\xc6\x85\x88\xad\x89\x85\xdc\x27\x7f\x8f\xf1\
-\xab\x44\x95\xe2\xbd\x3e\x4d\x19\x21\x7e\xfa\x28\x87\xef\x1c\xc2\
-\xb5\x53\x70\x8b\x2a\x00\x55\xdc\x81\x51\x35\xac\x5c\x06\x65\x10\
-\x21\xf3\x80\xea\x14\x6a\xef\x68\x96\xe8\x3f\x9d\xc0\x7f\x2c\xe0\
-\x83\x02\x7e\xd3\xe6\xa4\xb4\xd3\xba\x44\xfe\x4c\x3b\x89\x8e\x4d\
-\xaf\x16\x19\xbc\xb9\x8f\xc3\xd5\x7a\xba\x4a\x44\x20\x52\xb2\x74\
-\x06\xc3\x75\x2b\x79\xdd\x7d\x0a\xa2\x7a\xf6\x28\xca\x37\x47\x6a\
-\x4a\x30\x5f\x60\x48\x89\xde\x64\xae\xbe\xa4\x1c\x04\xe4\x9a\x04\
-\x7a\xbe\xd5\x5c\xd8\xa1\x82\xde\x18\x5e\x93\x70\x32\x23\x51\x10\
-\xde\xfb\xea\x6b\xe6\xe0\xd4\x47\xb5\x86\x28\xcd\xcc\x94\x6c\xd3\
-\x0f\xcb\xb8\xa3\xa5\x9e\x12\xb6\xea\x36\xc1\x19\xf8\x9b\xa0\x62\
-\x73\x67\x71\x83\xd8\x1a\x3e\xe9\x68\xf7\x33\x40\x7f\xb9\x1e\x16\
-\x4a\x51\xcd\xee\x5c\x32\xbb\xd6\x1b\x2d\xdd\xa0\x1a\x9d\x63\xc3\
-\x73\x9e\xfd\xf2\x70\xe3\x27\xb6\x7b\xe8\xed\xca\x45\xcf\xe9\xa9\
-\x1b\x37\x7f\x8e\x23\x90\x7d\x48\x2d\x48\x6d\x89\x37\x07\x08\x8b\
-\x1d\x95\x47\xe7\xc6\xd6\xcd\x19\x4c\xb4\xba\x3e\x84\xeb\x7d\xd4\
-\xbd\xbc\xc1\x09\xd5\x58\x8f\xc5\xf1\xc1\xbf\x7e\x88\x20\xe1\x6d\
-\x1a\x35\x9c\x37\x20\x69\x13\xbc\xaa\xb6\xb4\x79\xe5\x1d\x26\x48\
-\x8d\xff\x6e\x01\xbf\xae\xe0\xdb\x19\x52\xf8\x1f\xd7\x28\x43\xa8\
-\xa3\x2f\x6d\xf9\x66\xf2\xfa\x1a\xf3\x44\x3c\xc1\x06\xd9\x37\x8f\
-\xe0\xc5\x35\x6f\xd3\xe4\x68\x25\x73\x75\x55\x13\x1e\x81\x04\xfb\
-\x35\x4f\x51\x72\xd7\xf8\xec\x62\x08\x1b\x0a\xae\x0e\xb0\x6c\x6a\
-\x5b\x61\x42\xca\x79\x81\x82\x6a\x05\xcb\x7e\x86\xcc\xa1\x3e\x83\
-\x18\xc7\x47\xd8\xde\xe3\x45\x81\x50\xea\x1d\x49\xa5\xf1\xcc\x75\
-\x22\x29\x84\xa3\xb0\xc2\xce\x56\x35\x7f\xdf\x0c\x57\x6a\x05\x34\
-\xba\x51\x18\xde\x9a\x85\x85\x18\xd9\xfb\xd9\x31\x55\xa3\x11\x1d\
-\xef\xe1\x91\x3a\x35\x38\x4b\xd3\xee\x97\x4b\x1b\x2d\xd1\x7e\x67\
-\x69\xda\x87\x7a\x6d\x8b\x81\x3c\x42\xb2\x98\x6f\xfd\x8f\x4f\x7a\
-\x5f\x7b\xc8\x5d\x27\x0c\xcb\xdf\x32\x4a\x22\x9e\xd2\x28\xa8\xdc\
-\x23\xfd\x8c\x1d\x6e\xaf\x63\x58\x66\xf5\x58\xee\xd1\x52\x08\x2b\
-\x47\x70\x4d\xc2\xfa\x00\xde\x4a\x31\x53\x33\xa1\xc6\x5d\x13\xe1\
-\x08\xbb\x2b\xfb\xf0\xe1\x01\x26\x41\xc7\x3a\xa2\x5c\x5a\x8b\x7d\
-\x9a\xd9\x72\x1d\x4a\xb2\x25\x0d\x29\x20\xbc\x3c\x4e\xe0\x13\x23\
-\x38\x3b\x80\x57\xcc\x95\x1f\xc1\x3f\x57\x28\x9f\x8c\x1a\xd2\xeb\
-\x48\x1b\x8c\xb5\xaa\x43\x74\xf9\x5f\x3c\x82\x8b\x6b\xb0\x11\xf8\
-\x33\x63\x8b\xa9\x76\x35\x8a\x35\x24\x80\xbb\x63\x82\xd2\x65\x73\
-\x3d\x57\x39\x46\x2c\x66\x03\x7c\x42\x53\xa2\x18\x5d\xba\x81\x7f\
-\x3a\xa9\x50\x8d\x35\x5f\x83\x9a\x0c\xcc\xeb\x8d\xe0\x5b\x38\x4a\
-\xe2\x90\x2a\xd0\x48\x19\x95\xfb\x00\xf6\x39\x0c\x6c\x5d\x35\xd8\
-\xfa\x5a\xad\x77\xde\x56\xf9\x2a\xe3\xc4\x6a\x0d\xbe\xd7\xa6\x32\
-\x96\xd5\x30\xaa\x0d\xc6\xc8\x9a\xf4\x3d\xa8\x64\x67\x7e\x06\x53\
-\x13\xe7\xcc\xe8\x62\xb9\x04\x76\x9f\xe1\xb3\x97\xe8\x05\x82\x78\
-\x53\x33\xce\x34\x4e\x5a\x37\x8e\x4b\xf4\x3e\xa1\xfa\x3f\x74\x7f\
-\x00\x8f\xd3\xaa\x7b\x11\x23\xeb\x37\xcf\xf8\x2c\x81\xa0\xfb\xd4\
-\x22\x4f\x04\xe6\xce\xc3\x51\x0c\x64\xbb\x23\xbf\x89\x9b\xcd\xe1\
-\xb2\x40\x53\xf8\x5d\xdb\x9c\x15\x5c\x19\x94\x7d\xa8\x7c\x08\x7f\
-\x20\x85\x9d\x94\xea\x89\x44\xbd\x76\x53\x36\x92\xe4\x4d\xd8\x1a\
-\xfd\x33\x90\x56\xa5\x1c\x6e\x28\x78\x83\x7c\xff\xcb\x03\xf8\xce\
-\x02\xfe\xdf\x02\x2f\x9b\x53\x38\x0b\xd4\x59\x4d\xea\x3a\x37\xc7\
-\x25\x52\xfe\x5f\xdc\x87\xd7\x37\x2b\x79\x8c\x85\xf2\x13\xab\xd7\
-\xe7\x91\xdd\xa4\xa4\x4b\xc3\x01\x21\xeb\xe8\xd1\xdf\xb1\x43\xc0\
-\xc9\x4d\x28\xe1\xe2\x07\x19\x18\x6e\x6e\xbb\x9b\x98\x28\xe2\x08\
-\xb7\x38\x13\xbc\x62\x37\xcc\x24\xd2\xd5\x4c\x82\xd4\x44\x93\xb3\
-\xaa\xa5\x1d\x54\x9c\x7a\x93\x6d\x46\xdf\xf4\xf1\x35\xf7\xc1\x3c\
-\x71\x59\xe3\x70\xa0\x3d\xc9\x14\x79\x7a\x1d\x1c\x8d\xb8\x51\x57\
-\x7c\xce\x5c\xe0\xb1\x10\xe9\x3e\xa3\xca\x7b\xb6\xd1\xb7\x7e\x16\
-\x66\x44\xcc\xa5\x32\x99\xf2\x5c\xb2\xec\x6f\x1d\x9e\xfc\xc5\xfb\
-\x09\x0a\xb6\xca\x36\xe8\xf6\xde\x99\xd0\xed\x34\xc3\xc6\x32\x0f\
-\x95\xcb\x32\xd6\xb8\xf9\x90\x16\x18\x29\x24\xf8\x8d\x4b\xbb\x3a\
-\x81\xcd\x0c\x03\xb5\x3b\x7d\x5c\x09\x13\xdf\xb3\xa0\xf0\xf3\x3c\
-\xbe\xad\x80\x8d\x35\x6c\xc6\x54\x5a\x58\x8d\x3a\x90\x8d\xd2\x87\
-\x1a\xe8\x77\x87\x51\xcf\x0f\x4d\xdd\xdc\xad\x35\xe3\x74\xd8\x14\
-\x3e\xfd\x04\x2e\x5d\x40\x7c\xf2\x7e\x06\xff\x96\x82\x7f\x3c\x86\
-\xbc\x47\x93\x4b\x74\x65\xeb\x96\xb7\x71\x03\xc1\x25\xa6\xae\xbe\
-\x7a\x84\x93\xaa\xae\xa4\x95\x71\x38\x09\x3b\xf7\xd5\x8f\xc4\xc9\
-\xe4\x05\xc6\x2a\xcf\x33\xfc\x0a\x8f\x0b\xd8\x4f\x5c\x8d\x48\x85\
-\x98\x59\x44\xbc\xda\x5e\x0f\xfd\x03\x72\xf3\x9b\xd8\x20\xe4\x20\
-\xf1\xad\x53\x02\xc5\x51\xd1\xc8\x51\x4c\x62\xd6\xb2\x16\xd0\xd7\
-\x0a\x02\x6b\x37\x07\x1a\xdd\x9d\x9a\xdb\x26\xd3\x75\xa5\x4d\x2d\
-\x66\xd5\x41\x2f\x7c\x5d\xeb\xcf\x1c\xda\x3d\xf1\xf7\x01\x21\xd8\
-\xce\x66\xce\xa9\x29\x59\xdc\xa3\xcf\xc6\x36\xad\xcd\xfa\x0a\x48\
-\xb7\xf4\x48\x0a\xf5\x06\x3b\xf3\x17\x70\xfa\x24\x41\x76\xf0\x46\
-\xcf\xa9\x7b\xd1\x96\xc6\xf9\x30\x4f\x24\x51\x13\xa2\x22\x3a\x4a\
-\x7f\xaf\x83\x0e\x72\xe6\xe9\xee\x1a\x47\x78\x84\x85\xa7\xc3\x3e\
-\x7c\xc1\xb8\xf9\xd4\x0b\xc8\x78\x54\xda\xb7\x91\xc3\x37\x69\x52\
-\xb1\x07\x35\xa0\xac\x0d\x86\xaa\xb6\xc1\x7d\xcd\x21\xf4\xd2\x6e\
-\xd6\xbe\x6a\xdb\x6c\x53\x26\x22\xff\xec\x0e\x7c\xf8\x1c\x7c\x56\
-\xc1\xab\x7d\xf8\x0f\x46\xf0\x0f\xf7\xe1\x60\x93\xc4\xd3\x39\x91\
-\xd0\xda\x8f\x24\x51\xd5\xa4\x93\x49\x06\x9f\xd9\x85\xcd\x73\xd8\
-\xbd\x07\xbc\xb0\x34\x67\x9e\xbd\xb5\x9d\x31\x47\x38\xd3\xea\x3d\
-\x29\xa6\x87\xd1\xcd\xf7\x28\xfe\xa1\x52\xf1\x92\x36\x0d\x2b\x83\
-\xcd\x5e\x37\x9a\x60\xff\xc0\xf7\xd0\x74\x06\xec\xf7\xd4\x8b\x54\
-\x34\x79\x43\x41\xdd\xf4\xf4\x2a\x2e\xcd\xa9\xf5\x7e\x82\x20\x58\
-\x6f\x95\xd9\xa8\x69\x5c\x4d\xdc\x81\x07\x9a\x3b\x03\x8b\x92\x53\
-\x61\x34\x55\xde\x34\xfb\x8a\x5a\x70\xbe\x55\xb7\xea\x55\xb6\x3a\
-\x4c\x8a\xc9\x53\x58\xd3\xa3\x51\xb6\xf6\x6b\xf9\xe0\xc7\xef\x51\
-\xcf\x75\x13\x4e\x71\xa2\x3e\xec\x0a\x4f\x27\x70\x86\xbe\xf6\xb6\
-\x46\xec\xcb\x02\x8b\x67\x35\x9b\xf3\x09\xf6\x43\xd2\xa3\x9f\xeb\
-\x99\x28\x01\x53\x3c\x47\xe0\x0a\x4c\xcb\x16\x06\xf6\xbd\x06\xe3\
-\x7e\x93\xf9\xdd\x26\x1a\x44\x1e\xef\xcb\x10\x90\x39\xa1\x44\x4c\
-\xc5\x69\x17\xa8\x91\x71\xb6\xd3\x98\x72\x9d\x2e\x0b\x0a\x45\x45\
-\x0f\x3e\x7f\x00\xcf\x8d\x50\xd7\xf5\x86\x86\xf7\x09\xf8\x63\x1a\
-\xfe\xfe\x63\xd8\x39\xdd\xf8\x02\x95\xa2\x10\xfd\xdf\x1d\x09\x5f\
-\xdc\x85\xd7\xb6\x2a\x9d\xc5\x04\xbb\x33\xbb\xaa\xd6\x93\x87\xf0\
-\x01\x0e\x1b\x7d\x4c\x2d\x1d\xf6\xaa\xa9\x6f\x8a\x57\x05\x81\x65\
-\x9a\x69\x44\x78\x2f\x3b\x84\x0f\x27\x18\x00\xdc\x67\xb8\x33\xe8\
-\x40\x6e\x30\x8e\x1b\x3d\x14\xc1\x7b\x9b\xac\x7c\x98\x8e\xd5\x31\
-\xa4\xd1\x41\xb3\x06\x35\xa5\x14\xb0\xe9\x3b\x74\x83\xaf\x6c\x52\
-\x96\x21\x82\x2f\x09\x9d\x10\xe7\x94\x93\x43\xb5\x4c\xa6\x21\xfb\
-\xd6\x39\x0d\x25\x08\x99\x3d\x90\x67\xc5\x3f\xa4\xab\xe4\x02\x4b\
-\x2a\x84\x79\x86\x29\x2f\x1e\x27\xc9\x4f\x3c\xd9\xfc\xe4\x7d\x2a\
-\xfa\x06\xdf\x9f\xd1\x7e\xda\xfa\x18\xe9\xf9\x43\x92\x86\x97\x93\
-\xcc\x58\xbc\x37\xe9\xa0\x68\x1f\x15\xbc\x34\xb7\xcc\x58\xdb\x57\
-\xe8\x5d\x21\x66\xad\x39\x6c\xe3\x6e\xaf\x53\x3d\xb5\xd2\x2d\xea\
-\x3f\xd5\xe4\x0d\x62\x66\x4d\x97\xb1\x29\xf3\xf3\x65\xb5\x7f\x3c\
-\x54\x9f\xe5\xfa\xbc\x6a\xe4\x88\x7e\xeb\x01\x7c\xf7\x35\x34\x88\
-\xcf\x71\x78\x39\x83\x3f\xce\xe0\x7f\xdf\x83\x07\x1b\x9e\x6c\xa1\
-\xfb\xc2\x2c\x52\x52\x74\x8f\x0a\x64\xae\x7e\x6f\x1f\xce\xaf\xa1\
-\xa2\x46\xd0\x3d\x39\x28\xe0\x84\x71\xd5\x63\x78\x71\x8c\x01\xc3\
-\xa1\xc0\x3c\xd7\x84\x92\xd3\x8e\xde\xf5\x12\x1d\x15\x84\xa4\xfb\
-\x54\x2c\x72\x7d\x04\x2f\x19\xa4\x97\xb8\x39\x11\xe5\x3e\x30\x89\
-\xb3\x51\x4d\xd2\x46\xb5\xfd\x50\xc4\x4d\x8c\x43\xbb\x2f\xe6\x89\
-\x87\x6b\x62\x04\xd6\x46\xe1\xd7\x1e\x6e\x64\xf7\xba\x34\xa3\xc0\
-\xfa\x99\x47\xf9\x78\x7d\x49\xab\xad\x4e\x4d\x48\x2d\x5e\x2f\xd2\
-\x9d\xf6\xf1\x07\xe0\x08\x63\xa6\x8b\x31\x63\x98\x4f\x17\xc9\x97\
-\xe5\x99\xef\xbf\x97\x52\x08\x0b\xae\x58\x84\x7b\xf1\xdd\xa9\x02\
-\xe9\xf9\xc7\x14\x0b\x02\x8b\x80\x0d\x04\x54\xbd\xf6\xad\x69\x0e\
-\xa9\xef\xc5\x75\x8e\xaa\x98\x9b\x36\xd7\x03\x51\xcb\x9a\x9a\xbc\
-\xfb\x44\x81\xad\xbf\x6e\x4d\xdf\x82\x61\x3a\xd9\x5c\x46\x51\x3a\
-\xf8\xc1\xce\x5d\xab\x22\x2d\x3b\x5b\x4a\xe1\x02\xbf\x51\xc0\x97\
-\x76\xe1\x03\x27\x30\x1f\xf4\x05\x80\x57\x35\xfc\x49\x80\x9f\xd9\
-\x87\xfb\x3d\x74\xe1\xca\xe6\xa8\x64\xb5\x7e\xa8\xbe\x06\xf1\xde\
-\xa7\xef\xc3\xc9\x2b\xd8\x35\x96\xd3\x68\xc4\x13\x23\xf8\x7d\x1a\
-\xa1\xf9\xbd\x09\x1c\x49\x50\x7d\xdf\xb7\x90\xfb\x1f\xac\x21\x92\
-\xd4\x19\x05\x48\x39\x0c\x34\x7c\xb3\x82\xad\x01\x12\x59\xfb\xcc\
-\x05\xfd\x79\xa3\x7e\x20\x6c\x70\x92\x37\x7a\x53\xca\xb8\x6d\x53\
-\x18\xe4\xc8\xb6\x5e\x4e\xd0\x9c\x37\x18\x74\x68\xac\x51\x34\xf5\
-\x0c\x54\xe0\xcb\x4b\xd3\xaf\xe6\xc7\x07\xde\x9d\x85\x0f\x82\x9e\
-\x10\x6b\xf4\x11\x39\x2e\xd9\xcc\x42\x29\xaa\xb6\x5f\x19\xd3\x57\
-\x9b\x9a\x0d\xd3\xb5\x5f\x1e\xf6\x7f\xf2\x7e\x1f\x8b\x42\x18\x01\
-\x53\xe1\xed\x3a\x1d\xe3\x74\x55\xf3\x45\x1e\x48\xd4\x99\x50\xfa\
-\xd6\x4d\xb1\xac\x39\xfb\x52\x67\x36\x1c\xe1\x08\x8d\xd3\x06\xdb\
-\x14\x98\xa1\x1c\x43\xd4\x15\xb5\xb9\xbb\x99\x37\x9e\x2c\x40\x70\
-\x2a\x24\x65\xf1\x8c\xec\x36\x1a\xa1\xd4\x84\x44\x05\xce\xcc\x37\
-\xca\xd3\xfe\x07\xb2\xb9\x72\xcf\xb5\x2e\x5c\x99\x4b\x59\x87\xdf\
-\x79\x0c\xcf\x0e\x60\x90\xe1\x47\x7f\x21\xc5\x4e\x4f\x7f\x0a\xe0\
-\xef\xec\xc1\xa3\x2d\x8c\x58\xd8\xc4\x5d\x28\xd3\x2e\x44\x66\x24\
-\x8b\xbf\x3f\x86\xdf\x7d\x02\xdf\x72\x0a\xbf\xce\xe5\x11\xfc\x2b\
-\x3d\xa4\xb3\xee\x00\xa1\x79\x5d\x8f\x2e\xca\x21\x08\x13\x4a\x4a\
-\xc8\x11\x32\x9b\xd7\x05\x6e\xa4\xb7\x98\x1b\x8c\x9e\x07\x31\x6e\
-\x11\x0b\x4b\x55\x5b\xa6\x42\x07\x3e\x5e\x37\x38\x4a\xd5\xd6\xbd\
-\x4c\x37\xbb\x3f\x40\x5d\x61\x06\x6d\x3e\x5e\x69\xff\xff\x50\x73\
-\xa6\xa3\xae\x6c\x10\x1c\x59\x9d\x82\xa4\xb8\x6e\xcb\x55\x53\xfa\
-\x46\xcd\x9b\xe8\xbd\x90\x60\x78\x36\x25\x1f\xbe\x8b\xa3\x15\xe0\
-\x61\x03\x96\x3c\x12\xfd\xff\xe1\xf1\xfa\xdb\x0f\xfc\x1c\x63\x4d\
-\x11\xa7\xb0\x42\x62\x92\x1e\x0c\x35\x4e\x8f\xd2\xc2\x0b\x8f\x58\
-\x45\xe0\xe8\x18\x5b\x0f\xcd\xff\xc7\x38\xcb\x32\xed\xc1\x5b\x19\
-\x3a\xfb\xd2\xe2\x8d\x1f\x55\xa2\x62\x79\x6b\xf7\x3a\x31\x08\x81\
-\x16\x95\xe6\x6e\x51\x35\xc1\xa5\x6a\xfd\x56\xcd\x57\x18\xd4\xdf\
-\x1f\x0f\x63\x30\x51\xca\x4e\x01\x9f\xde\x81\x7f\xed\x02\x5a\x98\
-\xf9\xca\x5f\x4a\xb0\x0c\xfc\x3f\x29\xe0\xef\x3e\x44\xd3\x17\xaa\
-\x41\xec\x91\xb6\xd8\x98\xfe\xef\x3d\xc4\x6a\xa9\x6f\xe7\xf0\x6d\
-\x7d\x24\xa0\xb6\x99\xa7\x83\x58\x55\x8d\x13\x52\x4f\x85\x44\xa3\
-\xef\xe7\x28\xa8\x1c\x00\xb6\x49\x3b\x12\xd5\xd8\xf1\xdc\x57\x45\
-\x15\xbe\x0d\x44\x09\x78\x6a\xf0\xbd\x55\x74\x50\xc5\xb5\xba\xd2\
-\xeb\xeb\x86\xa6\x12\x1a\xe9\x8e\xda\x7c\xab\xda\x43\x04\x8f\x55\
-\x4a\x60\xc3\x74\xb0\xa3\x6a\xbf\x18\x6c\x03\x95\x06\xdd\x63\x43\
-\x79\xff\x94\x93\x56\xb0\xc1\x3a\x97\xb4\x42\xe7\x1e\x24\x4d\xa5\
-\x9a\x7d\xa3\x74\xd3\x8a\xb1\xd9\xb1\x64\x0a\xa5\x07\x62\xe3\x8d\
-\x22\xfd\x8b\xf7\x38\xec\x50\x5d\x8f\xb9\x68\x8c\x62\xed\x60\xa3\
-\x02\x75\x54\x9b\x3d\x9c\x2c\x30\x0c\x06\x60\x59\x45\x2e\x6f\x70\
-\x5b\x85\xc2\x2a\x0d\x31\x81\xe7\x05\xf2\xd0\x6f\x27\x94\xb3\x0c\
-\xcb\xf2\x45\xb5\x21\x96\xf0\xa9\x3c\x43\x4e\x03\x69\x11\x4e\xf0\
-\xa9\x52\xa4\xd0\x98\x79\x65\xc6\x51\x8e\x4c\xd5\x30\x98\xa5\x68\
-\x94\x8d\xb1\xe8\x6f\x8e\xbb\x41\x62\x2c\xf8\x31\xbc\x7c\x02\x5b\
-\xa0\x59\xb2\xfc\x4b\x0c\x5e\x1d\xc0\xf7\x31\xf8\xdb\x7b\xb0\xbf\
-\x81\x2e\x9f\xf5\xe8\x3c\xb9\xbb\x54\x03\xfd\xcd\x7a\xc0\xe9\x71\
-\xdb\xf0\xad\xd7\x30\xb5\xb4\x9b\x44\xfc\x46\xb9\x00\x4a\xeb\x1c\
-\x91\x06\xe1\xfa\x10\x2e\xac\x61\xbb\x84\x9b\x54\x40\x18\x36\xae\
-\xaa\x6c\x3d\x30\x7a\xd5\x90\xce\xeb\xa0\x5e\x44\x35\x74\x66\xb6\
-\x96\x7c\x5a\xcc\xaa\xda\x44\x35\xf5\x7f\x5a\x16\x8b\x79\xfe\xc7\
-\x9b\xb5\x54\x01\xc3\x1b\x58\x3f\x30\x57\x08\x6f\x4b\x8b\x20\x4c\
-\x54\x71\x3f\x60\x54\x10\x89\x3c\xa5\x2f\xec\x71\x55\x51\xcd\xc0\
-\xf1\xe5\x1b\x7b\x38\xf3\x95\x4b\x86\xe0\xd5\xf8\xe1\x71\x36\xf8\
-\x8d\xbd\xec\x27\xb7\x7b\x94\x6a\xb5\x93\xe6\xbd\x39\x1b\xeb\x3f\
-\x67\x9e\x62\x46\xc3\xc0\x92\xca\xc4\x9a\x51\xac\xab\xca\x23\x7d\
-\xb9\x59\x27\x17\x13\xd8\x4e\xb0\xf7\x6a\xde\x56\x6d\xc9\x03\xfd\
-\x56\x68\xc4\x82\xa2\xde\x82\x42\x88\xb1\x6f\x0b\xcc\xa6\xcb\x9e\
-\xa6\xdf\xa3\x30\x53\xe8\x01\x8f\x72\x11\x2d\xf8\xfa\x46\xab\x8f\
-\x3f\xd2\xf0\xc9\x3b\xf0\x5d\x2f\xf8\x12\x47\x06\x5f\xd2\xf0\xca\
-\x3a\x9a\xfe\x4f\xee\xc1\x68\x13\x7b\x81\x80\xed\x5a\x93\x3b\xff\
-\x67\x8c\xef\x2c\xc0\x1f\xb9\x88\xb3\xc2\x8f\x64\x1c\x64\x07\x0b\
-\xc0\x12\xfc\x93\x09\xb6\x8d\x78\x26\x01\x36\x80\x77\xa8\x65\xa7\
-\x12\x15\x41\x19\xd2\x94\x61\x20\x3b\x89\x53\x04\x45\x8c\xd7\x65\
-\x8c\x6a\x42\xb6\xbe\xc5\xee\x83\xa9\x58\x35\xef\x1e\x5e\x36\x0b\
-\xea\x45\xa2\xb0\x95\x55\x2a\xd4\xca\xd9\xd8\x29\x04\x1a\xdb\xc0\
-\x28\x8a\xda\xcd\x15\x48\x1a\xaa\xa5\x26\x20\xc9\x47\x98\x18\xa9\
-\x6f\x1e\x65\x0e\x9b\x38\xf1\xbc\xae\x53\x60\x33\x13\x55\x73\xdb\
-\x11\x37\x7f\x35\xa3\xab\x82\x7d\x97\xa4\xb0\xae\xaf\xc6\xc6\xa1\
-\xef\xc0\xc9\x1f\xdc\xce\x6e\x3c\xcc\xd0\x37\x8b\xd8\x6b\x66\x0a\
-\x9f\xae\xf1\x55\x4f\x68\xde\x3c\xf7\x4b\xbc\xd6\x67\x59\xfb\xda\
-\xd9\x51\x8a\xbd\x96\x2e\x14\x70\x52\xc0\x3b\xd4\x5c\xdb\x6a\x06\
-\x65\x1b\xa0\x6f\x5d\xb9\x29\x60\x5c\xf1\x24\xc5\xe2\xac\x3d\xda\
-\x1a\x75\x5b\x4a\x9c\x35\x1c\x7f\x93\x42\xad\xa9\x61\xb5\xa7\x65\
-\x5c\x76\xc9\xbf\x8e\x73\x55\x52\xf8\xf2\x1e\xbc\x74\x00\xd7\x37\
-\x5c\x69\xf6\x30\xc5\x30\xf7\x9b\xd7\xe1\x4f\xe4\xf0\xd3\x47\x6e\
-\xbe\x39\x4e\xd7\xa2\x67\x6c\x7e\x1e\x4d\xe0\xbb\xd6\xb1\x2c\x66\
-\x5f\xe1\xde\x19\x7e\x35\x16\x14\x8e\x18\x93\x35\xfb\x9e\x59\x50\
-\x9b\x1c\x15\x3e\xfb\x2c\x12\x18\x87\x33\x85\xf2\x98\x9e\x97\x81\
-\xc4\x40\xb6\x21\x9c\xa6\xf4\x40\x35\x0a\x56\x42\x45\x4d\x93\xe7\
-\x8d\x80\xbe\xbf\x89\x8e\x84\x51\x15\x2b\x0f\x3e\x46\x0a\x1f\x9e\
-\x9e\x90\xd4\x8f\xb9\x48\xdd\xaa\xee\x7a\x12\xd6\x38\x0e\x17\x3b\
-\x37\xc1\x6e\xe3\x57\x00\x59\xaf\x93\xeb\x58\xb2\x63\x82\xf8\xd1\
-\x5e\x12\x5a\x7c\x50\x49\xb5\x58\x7b\x8f\x8e\xca\xca\x28\x05\x46\
-\x01\xb8\xb6\x7d\xda\xb5\x62\x49\xf2\x49\x79\xe2\x2f\xdf\xa7\x4e\
-\x1e\x32\xc8\x3a\x71\xca\x13\x62\x33\x26\x81\x35\x3e\x66\x5f\xae\
-\x70\x36\x03\x68\xf5\xbe\xa4\x50\xc8\x27\xa8\xb7\x49\x13\xb8\x91\
-\xd2\x60\x05\xe6\x86\xcc\xd4\x0e\x66\xde\x65\x08\x0f\x72\xac\x4f\
-\x11\xfe\x21\xfd\xae\xc6\x81\x98\x0f\xed\x60\x02\xbf\xed\xca\x0e\
-\x0a\x6c\xdd\xfa\x52\xfc\x97\xf9\x34\xa4\xf6\xb5\x11\x8c\xc4\xd2\
-\x9f\xbe\x01\x57\xdf\x87\x00\xc6\xe6\x56\x0d\x1c\xff\x02\x87\xf7\
-\x6f\xc1\x1f\xbb\x0f\x3f\x6b\x5c\xf4\x06\xe1\x1c\xbb\x84\x0a\xac\
-\x8e\xff\xc0\x69\x87\xc4\x54\x2c\x38\x75\xab\x54\xa3\xcf\x3b\x4d\
-\x53\x49\xcc\x7e\x72\x0b\x9c\xee\x48\x07\x43\xb5\xf2\xc0\xd0\xc3\
-\x3e\x56\x45\x2c\x9f\x2c\x1a\x7d\x2a\x55\x9b\x00\x21\x4c\xc1\xb6\
-\xe2\x78\x19\x27\x13\x75\xcc\x48\x96\xae\x81\xe9\x80\x82\xf4\x67\
-\x09\xf1\x92\xf4\x9a\x8b\x35\x89\x44\xd6\x05\xc0\x76\xcd\x26\x90\
-\xbb\x7c\x02\x53\x3a\xeb\x26\xa2\x3b\x81\x06\x63\x76\x00\xdb\x82\
-\x17\x87\x49\x9a\xb0\x90\x27\xcc\xcd\x5f\x5a\x52\x1d\xb9\x9c\xc6\
-\x58\x69\x55\x30\x9e\x6a\x1c\x4b\x60\x1c\xd4\x24\xe5\xbf\x7c\x90\
-\xfd\xf8\xbd\x94\xda\xe4\xaa\x4a\x35\x69\x75\xe7\xa7\x35\xae\xdd\
-\xc7\x54\xdc\xc4\x59\xc5\xe9\xd6\x90\x89\xf2\x5b\xe6\x84\xea\x3e\
-\xcd\x97\x37\xb8\xe9\x1d\x8e\x71\x9e\x9d\x02\x1b\x44\xf6\x55\xb1\
-\x95\x08\xda\xc7\xf1\xe0\xcc\xf6\xe4\xbd\x04\x15\x60\xdf\x22\xe0\
-\x5a\x0f\xdb\x2d\x59\xd6\x28\x67\x55\x3f\x29\x1e\x28\x9f\xec\xdf\
-\x24\x38\x9b\xeb\x47\x42\x50\xbe\xec\xdd\xc7\x54\xe5\x86\x4b\xc3\
-\x61\x64\x5f\x9a\xfa\xc8\x9a\x6b\xba\x75\x00\x6f\x3f\x80\x97\xce\
-\x79\xa0\x4c\x09\x8a\xcf\x17\xf0\x6d\xe7\xe1\xd1\x13\xf8\xf9\x21\
-\x4a\xd0\x38\xe9\x99\x15\xf5\x32\x39\x97\xba\xe2\x71\x1e\xbb\x4f\
-\xdb\x58\x6a\x30\x86\xcb\x29\x24\x34\x56\xe4\xc0\xaa\xd0\x82\xd6\
-\xcd\x45\xa3\x52\x24\x8f\xf3\xb8\x32\xee\x5e\xd6\xac\x79\x55\x6d\
-\xf4\x65\xb3\xc5\x4d\x0d\xd2\x84\x8d\xe8\xaa\xcc\x06\xab\xd8\x4c\
-\x4d\xc1\xa8\xbd\x63\xc0\x7c\xcd\x24\xc3\x35\x6c\xbe\x54\xcf\x20\
-\x58\xe3\xcb\x27\x38\x3f\xeb\x79\x0e\xcf\xac\xc3\xd6\x26\x36\x0a\
-\x30\x31\x92\xa4\xba\xb3\x11\xa3\xde\xe8\xda\xe5\xe9\xec\xd3\x72\
-\x43\x68\xd2\xae\xfd\x73\x96\xe8\x84\x33\x63\x09\x71\xb4\x7b\xc4\
-\x0d\x3d\x28\xee\x8b\xf5\xbf\xf9\xb0\xf7\x99\xed\x0c\x13\xe3\xcc\
-\xb7\xbf\xb2\xee\x36\x91\x28\xa0\x15\x0c\xc9\xca\x5c\x78\xa0\xcc\
-\xea\x5d\x6e\x20\x88\x93\xcc\x9a\xe6\x14\xc5\x9a\xf8\xf5\x11\x77\
-\x13\xa3\x54\xec\xe0\x79\x0c\x3a\x79\x1c\x89\xb2\x48\x18\x04\xc5\
-\x00\x7e\x79\x02\xff\x51\x81\x83\x57\xef\xa5\x55\x08\x55\x26\x53\
-\x78\x8c\x64\x5a\xcf\xd3\xdc\x68\x74\xe9\xbd\x82\xf4\xad\xf9\x6b\
-\x9e\xa8\xa6\xac\xf3\xa7\x6f\xc3\x33\xe7\x1c\xb8\xb2\x66\x77\x20\
-\xe0\x8b\x39\xfc\x1b\xa7\xe0\xe1\x08\x7e\x35\xc3\xd2\x2a\xa0\xf2\
-\xa8\x13\x19\x92\xad\x85\xbf\x27\x65\x2c\x24\xc9\x06\x2f\x6b\x38\
-\xd9\xc3\x5d\xf4\x09\xcd\xd3\x55\xbc\xbd\x9f\x4f\x98\x7f\x0d\x2b\
-\x03\xf3\xb6\xbe\xfb\xaa\xcd\xee\xa1\xd1\xfe\x60\x5a\xe9\x53\x94\
-\xa8\xf2\x6d\x1a\xb4\xaf\x73\x61\xc1\x88\x94\x42\xba\x96\xe5\x8a\
-\x22\x0c\x13\xaa\x5d\xa6\x76\x40\x2f\x24\x70\x65\x00\x67\x7b\x30\
-\xd8\x44\x64\x98\x4b\x04\xc0\x43\x12\xb0\x20\x47\xec\xab\xc6\x18\
-\x0b\xe6\xf5\x8a\xaa\xa6\x94\xf3\x64\xae\xb6\x7e\x89\x14\xd5\x5c\
-\xe6\x47\xf2\x74\x53\x8d\xcd\xc3\xfa\x0c\x9c\xfa\x81\xbb\x19\x95\
-\xbd\x25\x10\x4d\x82\xa3\x1e\x66\xa7\x53\xec\x9b\xbe\x93\xb8\xbe\
-\x37\x51\xa5\x70\x60\xf1\xe5\x5d\x36\x21\xdf\xe0\x08\xae\x24\x58\
-\x4e\xf1\x20\x73\x1b\x65\x98\xcf\xe2\x8d\xb4\x5c\x98\x17\x4c\x69\
-\x8b\xaf\x05\x0c\x66\x47\x34\xc0\xe0\x9f\x29\xf8\x9e\x0c\x0f\x7a\
-\x5c\x60\xc0\x3d\x22\xdd\x79\x78\x19\x3c\x6c\x65\x13\xac\x31\x06\
-\xce\xc1\x5b\x78\x06\x94\xa5\x02\x5b\x33\x16\x00\xa7\x72\xe7\xb6\
-\xeb\x21\xe1\x70\xf3\x00\xde\x7c\x08\xef\x3b\x1b\xc4\x88\x0c\x76\
-\x28\xdd\xf6\x1f\x9e\x83\xed\x7b\xf0\x79\x8d\xbe\xcd\xb8\x89\x2c\
-\x89\x4c\x8a\x13\x33\x6b\x62\x83\xd3\x39\x02\x1b\x63\xeb\x77\x24\
-\x66\xe8\xb4\x6f\xb4\x5f\x76\x1e\x0f\xc5\x64\xb5\x09\x2b\xaa\x51\
-\x03\xde\x34\x74\x35\xaf\x3b\x5f\x2d\x16\x52\xc1\x9d\x51\x41\x92\
-\x15\xc8\xac\x51\x32\x43\x7f\x11\xa6\x27\xd8\x80\xd6\x44\x23\xfd\
-\x09\x46\x68\x57\x24\x3a\xb2\x17\xfb\x70\x71\x00\xa7\x06\xd8\x36\
-\x6b\x4c\xe5\x35\x87\x1c\x9b\xee\x17\xbe\x1b\xb3\xb5\x6b\xd6\x9a\
-\x7c\x65\x91\xe3\x63\x33\xf3\x56\x33\x9c\xfa\x8a\x9a\xfb\x0d\x35\
-\x1e\x27\x1b\x1f\x1f\xae\xfd\xd8\xfd\x14\xdd\x98\xf5\x4f\x65\x5c\
-\x61\x7e\x5c\xcf\xb1\xe1\xfa\x2e\xd5\x07\x95\x28\x90\xe9\xc8\xbb\
-\x47\x7c\x25\xb1\xce\x1b\x43\x9a\xa5\x41\xad\x8b\x98\x0f\xa1\xb8\
-\x75\x7e\x10\x75\x4f\x28\x41\x4e\x4d\x7d\x50\x43\x29\xd6\x40\xb3\
-\x1e\x7c\xb2\xc0\x15\xf5\x1d\x6b\xa8\xe9\x15\x14\x73\x8f\x82\x45\
-\xa2\x63\x46\x88\xd5\x7e\x66\x50\x53\x82\x18\xd3\x97\x3e\xa8\x65\
-\x9e\xad\xb3\x17\x23\xa8\x11\x6c\x42\xb2\xb3\xdf\xfd\x1a\xbc\xf7\
-\xb4\xeb\xe3\x57\x66\xf8\xef\x00\xce\x3d\xff\x93\x67\xe1\xaf\xdc\
-\x46\xd9\x69\xd9\x55\xa1\x54\x07\x99\x8d\x71\x7d\x02\x57\x18\xae\
-\x8a\x47\xa4\x39\x95\x69\x34\x11\x3a\x6c\xb7\x3f\x8e\x75\xf3\x61\
-\x2b\x9b\xbc\xd1\xfb\x44\x35\x5a\x1e\x34\xc9\xf8\xb0\xf4\x1b\x9a\
-\x34\x65\x9c\x75\xb2\x14\x0d\x0e\xaf\x35\x86\x4e\x57\xd3\xcb\x61\
-\xc3\x20\x37\x0d\xef\x05\x78\x51\xc2\xa5\x0d\x38\xd3\xc3\x86\x28\
-\x26\x9a\x1f\xe5\x08\x83\x6f\x52\x2f\x65\xa0\xce\xd5\x2e\x63\xc3\
-\xdc\x6c\x2c\x5d\xde\xea\x46\x7c\x55\x5b\x0c\x7a\x66\xbf\xb4\xe3\
-\x2a\x96\xf5\xf5\x22\x2c\xd5\x26\x0a\x4b\x52\x9e\x0f\x45\xf6\xf7\
-\x1e\xaf\xff\xe2\xc3\x1e\xde\xf7\x12\x64\xbb\x8b\x9a\x20\x7f\xb2\
-\x46\x55\x45\x63\x1e\x24\x1d\x4a\xff\xea\xb3\x21\x61\x46\xc3\x3c\
-\xce\x3e\x35\x84\x79\x42\x53\xe4\x41\xb9\xa0\xd0\x9e\x5c\xc6\xf4\
-\xb9\x86\x08\xa0\x57\x51\x6c\x4c\x6b\xf2\xa0\x0f\x91\x01\x84\xbf\
-\x21\x71\xa4\xeb\x77\x0c\x70\xaa\xbd\x01\xca\x06\x36\x1c\x51\x9e\
-\x3f\x6c\x57\x14\x06\xca\x11\xbd\xc3\xe2\x84\x79\xd9\x76\x93\xbe\
-\x86\xa0\x42\x41\x4b\x68\x72\xfa\x85\x59\x15\x7d\x05\xef\x1c\xc1\
-\x9b\x8f\xe1\xbd\x67\xab\x59\x06\x82\x00\xd2\xdb\x0c\x5e\x19\xc0\
-\x1f\x3f\x03\x7f\xe3\x21\x81\x43\xe5\x68\x10\xf3\x35\xc5\x08\x2e\
-\x4b\x38\xd3\x47\x1c\xbf\xcd\xb0\x80\xab\x74\xdb\xa3\x78\xb4\x44\
-\x0d\xd8\x34\x47\x2d\x14\x6d\x09\x29\xd9\x6c\x57\xa6\xeb\xed\x88\
-\xcb\x70\x96\xf9\x49\x30\xae\x66\xd7\xf6\xd3\x54\xf8\xad\xf3\x14\
-\x11\x5d\x41\xd8\x7d\x63\x04\xe7\x72\x78\x06\xe0\x3d\x12\xae\xaf\
-\xa3\x58\x70\x13\x50\x9e\x8d\x43\xc1\x0a\x64\x14\x72\xb2\x75\x5d\
-\x4e\xce\x63\xb4\x35\xbb\x0e\xaf\x3e\x6d\xc2\xa3\xfb\xcf\xa6\x34\
-\xd2\xf1\x5b\x6b\xd2\xec\x5c\x30\x63\x7e\xf7\x2a\x52\x05\x85\x23\
-\xbf\xe1\x24\x8c\xde\x54\x5b\xff\x85\xb1\xf8\x07\x3e\x61\xc4\x29\
-\x5e\xb1\x6b\xd7\x3c\xb6\x33\x29\xde\xca\x07\x05\x46\xa5\xee\xea\
-\x79\x45\x81\x01\x8b\x52\x8f\xda\xb7\x5c\x5c\x1b\x62\x67\xc6\xfd\
-\x09\xba\x04\xe7\xad\x39\xde\x9c\xca\xef\x6a\xc7\x6c\x00\x8f\xac\
-\x5c\x04\x0c\x74\xd3\x55\x43\x20\x7c\x30\x11\xf8\x6f\x6a\x78\x72\
-\x04\x7f\x68\x80\xde\x74\x83\xe3\x23\xd9\xd1\xd5\x6c\x8f\xd2\xdb\
-\x09\x1f\x62\xba\xbf\xcc\xc9\x45\x18\x39\xf5\xa2\x5c\x69\xcc\xa9\
-\x18\x6c\xe8\xa6\xc3\x9a\x09\x4a\x36\x99\x75\xfb\xd9\x1b\xf0\xec\
-\x59\x3f\x7a\xd6\x3f\x60\x63\xac\x5f\xc9\x91\xc3\xf9\x83\x47\xf0\
-\xd1\x7d\x9a\x9e\x4e\xb9\xd5\x33\x47\x70\x35\xc3\x8a\xad\xbb\x39\
-\xcd\x6d\xe6\xce\x61\x4f\x62\xd2\xa6\x66\xf1\x79\xa3\x27\x6b\xd8\
-\xcb\x49\x46\xe3\x8e\xeb\x6a\xe1\x50\x5c\x10\x76\xb3\x01\x9b\x05\
-\xe7\xa4\xa8\x53\xd8\x36\x50\x51\xd9\x7b\x71\x84\xb7\xb1\x2f\xe1\
-\xdc\x3e\x36\x03\x7d\x4e\x60\x48\x7a\x59\x60\xd3\xd9\x2c\x45\xfb\
-\x3e\x24\x89\xd1\x4e\xb9\x5d\x24\x91\x13\xa9\x12\x1d\x81\x7f\x09\
-\xc3\xe5\x2e\x83\xc6\xed\xdc\x87\xd6\x3e\x22\xb3\xeb\x00\x17\xd1\
-\x2f\xe8\x32\xb5\xb4\x21\xf5\x80\xe9\x5f\xd7\x67\x7e\xf8\x2e\x8d\
-\x4c\xd3\x22\xda\x86\x14\x4d\xd7\x38\x43\x63\x17\x76\xa9\x7a\x5a\
-\xb7\xd5\x16\xd4\xb5\xd7\x0a\x33\x53\xd9\x08\x7b\xb9\x60\xa3\xa2\
-\x9e\x37\x53\xee\x22\x42\xe6\xed\xcc\x5e\x1b\xd7\x53\xa8\x4f\x6f\
-\xa3\x1a\xa2\x86\x0b\x2c\x64\x66\x12\xac\x6d\x7d\x23\x87\x47\xfb\
-\xf0\xaf\xaf\xc3\x7b\x05\x86\x59\x0f\x35\xca\x5a\xf6\x78\x34\x3f\
-\xb0\xdc\x2e\x44\x70\xcd\x65\xdc\xc2\x99\xf7\x52\x25\xfe\xf1\xc6\
-\x55\x26\x26\x2d\xb9\x99\x64\x70\x7b\x17\xbe\xf6\x00\x5e\x3c\x57\
-\x45\x96\xf6\x1d\x87\x29\x76\x29\xfc\x83\x17\xe0\xb7\x00\xdb\x3c\
-\xe1\x1d\x60\x30\x18\xc0\x8e\xc2\x2a\x61\x49\x36\x57\x22\xf8\x71\
-\xc0\x57\x36\xf5\xc3\x79\x83\x8f\xcf\x1b\xc1\xab\x6c\x2b\x36\x68\
-\x11\xdb\xb0\x6a\x68\xae\xfd\x44\x4d\x5c\x4a\x9f\x1a\x6f\x5d\xcc\
-\xd1\xca\xaf\x73\x2c\x97\x39\xd5\xc7\xb1\xb5\xda\x76\x67\x11\x38\
-\x83\xa8\xd0\xae\xf1\x09\x94\x95\xd0\xc1\x3e\xcf\x08\x01\xea\x86\
-\xee\xb0\xc6\x11\x95\x85\x88\x10\x93\x48\x75\xd3\xe7\xed\xfd\xd2\
-\x66\x4e\x7b\x5d\xc2\xd9\x6b\xa1\xf5\x38\xed\x7f\xec\x70\xf3\x7f\
-\xbe\x6b\x87\x8b\xe8\x80\x82\xe4\xae\x77\xdf\x29\x5a\xee\xfb\x82\
-\xe2\xf1\xc6\x75\x37\x09\x60\xd7\x9b\x60\x8c\x22\x16\x4e\x7d\xff\
-\xcc\x09\x33\xff\x44\x4b\xd1\x81\xad\xb6\x76\xff\x64\x75\x42\x53\
-\x06\x46\xcf\xfd\x0e\x50\xbe\xb7\xb6\x03\x88\x1c\xfb\x08\xdc\xe0\
-\xf0\xd1\x23\xf8\xd6\x14\x3e\x44\x52\xf5\x2d\x09\x77\x0b\x6c\xc5\
-\xba\x2f\x9c\x23\x2f\xa5\x93\x65\x32\xc4\x15\xc7\xb0\x2a\xc8\xae\
-\x4a\x3f\x2d\x91\x2f\xa3\x20\xcc\xda\x10\xa7\xea\xbe\x2f\xdc\x44\
-\x62\x87\x7b\xd0\xcc\x3d\xe0\x79\x9c\x60\xcc\xfd\xef\xf6\x30\xde\
-\x78\x1f\xf5\xb2\xbc\x45\x1d\xcb\x24\x73\x25\x54\x79\x6c\xee\x79\
-\x43\x61\x26\xe3\x6e\x95\x72\x66\xab\x8f\x6a\xba\x16\xab\xd7\xfe\
-\xd9\xc1\xba\xae\x59\x1a\xf1\x44\x06\xa4\x99\xa7\x79\x11\xe0\x85\
-\x1c\x09\x75\x63\xe8\x67\x7b\x90\xae\xa3\xb3\xb7\x5d\xd4\x91\x95\
-\x56\xbe\x68\x90\xf9\x3b\x43\x09\xd7\x92\x8d\x81\x58\x1b\x12\xb4\
-\xe9\x6b\x57\x37\x00\xd4\x67\xda\xb5\x14\x67\x29\x8b\x88\x92\x8e\
-\xe1\xec\x5c\xa3\x2f\x7f\xe5\xc4\xb2\x8c\x25\x9a\x69\x96\x4f\xa0\
-\x77\x42\xe7\x23\x96\xfc\xd4\xa3\xc1\xaf\x3d\x48\xc8\x07\xe8\x28\
-\xc4\xc4\x89\xb0\x94\x96\x7a\x3c\x86\x51\xdf\x89\x60\xa1\x8d\xfc\
-\xd2\x0d\x5d\xab\x89\xfa\x9f\xa7\x29\xc1\x8f\xb5\x43\x2c\xd6\x88\
-\x8b\x80\x4c\x28\x49\xcf\x22\x70\x06\xf6\x4f\xb9\x42\x44\x3c\x07\
-\xa6\x64\xe5\x79\x90\x3e\xb4\xdb\x08\x50\x61\x87\x89\xb6\x7f\x2d\
-\xc7\x49\x94\x1f\xd4\x70\xcd\xc4\x61\x3d\x6c\x81\x7d\x4f\xe2\x34\
-\x9b\xc7\x65\x97\x1e\x5d\xbd\x8b\x53\xb4\xca\x94\xab\xe3\x0e\xef\
-\x14\xd3\x81\x52\x9c\xe2\x54\x41\x43\xac\x38\x3d\x24\xf3\x59\xb7\
-\x1e\xc2\xed\x1d\x78\xe6\x54\x44\xb9\x8e\x69\x11\x0e\x72\xf8\xc3\
-\xa7\x10\x1e\xdc\xa2\x96\x10\x96\xde\x0e\x85\xf5\xcd\x56\xcc\x79\
-\xac\xb1\x99\xf8\x2f\x5b\x2b\x13\x09\x81\x4d\x28\xb4\x0c\x25\x0f\
-\x39\x3d\x3b\x5c\x84\x05\xf6\x18\x3c\x3f\xc1\xd9\x75\xd7\x14\xe2\
-\x96\x73\x19\x96\xf6\x0f\x28\xb3\x6e\x50\xe8\x48\xe3\x2a\x1d\xf1\
-\x4a\xac\xca\x69\xed\x96\x7c\x97\xa6\x36\xfc\xb8\x06\x92\x08\xc0\
-\xa8\x80\x1f\x6b\x32\x45\x4d\x14\xa0\x03\x64\xdf\x2e\xd6\xa7\xf3\
-\xe6\x3a\xe9\x48\xd4\x74\xf7\xf4\x24\x70\x76\xde\x8d\x41\x7a\x92\
-\x15\xb7\xd8\xd6\x9f\xde\xee\xd1\x8c\x27\xe1\x1e\xb6\xf0\x25\xee\
-\xe6\xe7\xb3\xe6\x06\x11\x43\x3f\x1c\xc4\x20\x2c\xfc\x02\x01\x0f\
-\x50\x3e\x5d\x14\x5d\x50\xe5\x68\x4e\x79\x59\x1e\x7c\x67\x11\xdc\
-\xb2\x8a\xec\x0f\xe6\xe1\xf0\x06\xf1\xcf\x02\x54\x23\x82\x84\x62\
-\x08\x75\x34\x77\xf4\x4b\x22\x30\x64\xfc\xfc\x11\xdc\xdb\xc3\x72\
-\xa7\x6b\x34\x6d\xfc\x0c\xc0\x65\x82\x19\xc6\xfd\xdf\xa4\x6f\x84\
-\x8d\xa8\x52\x1a\x44\x53\x46\xcc\x36\x45\xa5\xfd\x56\xc3\xbc\x0b\
-\x68\x4b\xe5\x6a\xfa\xff\x58\xc0\xe7\xdf\x82\x2b\xaf\x47\xce\xf5\
-\xca\x11\xbc\x3f\xc1\xb2\x60\x13\x08\x1d\x64\xce\x4c\xca\xd9\x6c\
-\x32\x1e\x0c\x5a\x93\xdf\xb4\x36\xee\x94\x7e\x2e\x95\xe4\xc1\x24\
-\x64\x3b\x33\x50\x57\x83\x75\x6d\xf0\x3d\x98\xc0\xf9\x21\x9c\x11\
-\x70\x85\xe6\x34\x9e\x17\x70\x5a\xc0\x89\x35\x64\x90\x6c\x23\xc1\
-\x23\xc2\xe8\x0f\xb8\x93\xa6\x85\xd4\x33\x8f\x4d\xd9\xc9\x70\xa7\
-\x54\x42\x47\x13\x45\x03\x1b\x57\x2c\x6a\x9b\xc3\xda\x6a\x3b\x5b\
-\x1b\x48\x39\xf6\x6f\xa9\xf9\xb5\x73\xc3\x06\x6f\x54\x3a\xe3\xfc\
-\xad\x62\xe3\xbf\x32\x80\xfe\x49\x5a\x89\xda\x05\x75\x04\x40\x4a\
-\xbe\x80\x4b\x39\x42\x93\x6d\x8d\x26\x12\x32\x62\x50\x9b\x5a\xc1\
-\x1c\x5f\x01\xac\x7a\xba\x39\x9d\xaa\xc7\xcf\x27\xc9\xb6\x09\x8e\
-\x73\xab\x4a\x17\xd4\xa8\x91\x45\x7d\xb6\xb8\x47\xf9\xda\x2b\x50\
-\x4b\x9d\x53\x4a\x48\x54\x34\x70\x79\x95\xc7\x65\x41\xa4\xeb\xb7\
-\x58\x86\x9d\xe6\x50\xda\xf5\x90\xc1\x3f\x3f\x84\xf7\x73\x78\xef\
-\x26\x7e\x8b\x44\xc2\xe9\x01\x8d\x31\x2c\x30\xb2\xdc\x99\xc0\xbd\
-\x02\xab\x54\xb7\x19\xf2\x3f\x13\xea\x52\x68\x47\x26\x16\x7e\x31\
-\x60\x03\x0f\x1b\xd4\x16\xed\xf2\x06\x03\x63\x6e\x3c\x80\x3b\x87\
-\x70\x61\x9d\x5a\xda\x8f\xe1\x9b\x12\xb8\xd0\x47\xdb\xc2\xfa\xd7\
-\xbe\xb3\xa4\x5a\x35\x77\xb3\x9b\x4d\xd3\xd9\xe7\xcd\x31\x52\x3c\
-\x60\x7b\x28\x89\x66\x0e\x32\x77\x6c\x6b\x8c\xab\xfa\x02\x83\xf3\
-\x0a\x6b\xbb\x4e\x67\xd8\x17\xba\x27\xb0\xf2\x21\x2f\xa8\xb7\x54\
-\x82\x04\xab\x89\xcd\x14\x8d\x09\xc3\x5d\xcb\xdf\x28\xe6\x67\x84\
-\x81\x0e\x95\xc0\x91\x89\x43\xdb\x0e\x0f\x3e\x6b\x51\x99\x04\x8f\
-\x0e\x53\x4d\x05\x5e\xec\xfe\x65\x9b\x04\x88\x32\xee\xc9\xdc\x44\
-\x55\x38\x8b\x6a\x5a\xdb\xca\xf0\x75\x1c\x5c\x8f\xdd\x3e\x44\x92\
-\xf0\x8f\x8f\x06\xff\xd3\x9d\xbe\x9b\x86\x67\x95\x36\x29\xa9\xe4\
-\x8c\xe3\x17\x94\x4a\x34\x37\x6e\x9b\x57\x3e\x46\xe9\x2a\x9b\x03\
-\xb5\xb1\x75\xac\x45\x02\x65\x22\xe0\xcf\xb1\xed\x97\x25\x32\x5f\
-\x9a\xb9\x31\x04\x13\xca\x65\x14\xda\xa5\xfa\x04\xfd\x0c\x41\x37\
-\xa5\xc4\x02\x65\xe6\x92\x47\x2a\x58\xac\x3c\x70\x4b\xac\xe1\xef\
-\xab\x0c\x83\xc0\xa5\x6b\xce\x92\x92\x44\xf9\x53\xc6\xb8\x1f\xc2\
-\x6b\x27\x71\x32\xe6\x2d\xc0\x36\xf0\x59\x06\x9b\x05\x4e\xcb\xfa\
-\x26\x80\x0f\x4a\x5c\x8a\x07\x1c\x9e\x8c\x61\x37\xc7\xd2\x55\xb3\
-\x1e\x1e\xe7\xd8\x93\xf9\xa0\x80\xc3\x82\x2c\x32\xc7\x3e\x0e\x5a\
-\x59\xd1\x48\x64\x17\x06\xea\x98\xc8\xe1\x77\xbe\x0a\xff\xf6\x7b\
-\xe0\x83\x80\x25\x88\x63\x0e\x77\x68\xb0\x21\x13\x51\x0a\x02\x1a\
-\xe3\xbc\x6b\x16\x2f\xdb\x7a\x77\x96\xc3\x29\x14\x71\x2f\x06\x65\
-\x6d\x4c\xb0\x81\xee\x79\x40\xf0\x76\x81\xfa\xc5\x9e\xe8\xe1\x98\
-\x5f\xe3\xa1\xcc\x17\x31\x80\x6a\x2c\x91\x8e\x2b\xa8\x75\x9d\x4e\
-\xbd\xff\xb6\x26\xce\xdc\x5e\xef\xd8\x15\x1d\xb2\x1b\x91\x8c\x22\
-\x02\x24\xca\x37\xd7\x67\x75\xe0\xde\xfc\x19\xe2\x4a\x2e\xde\x96\
-\x2e\x08\x5b\xa6\xe9\x06\xbe\xcd\x03\x1d\xb2\xd5\x48\x2e\x44\xdb\
-\x97\xc7\x9b\x15\xc1\xb5\x52\xae\x66\xa5\xe0\x2c\xe1\x3c\xfd\xd8\
-\xfe\xe0\x67\xee\x24\x24\xb9\xf1\x26\x9b\x08\xe7\x5d\x8c\x7b\xbe\
-\x48\x73\x4f\x1f\x64\x31\x2b\xcc\xe2\xc6\xb6\xba\x7a\x6f\x93\x46\
-\xc0\x27\x9a\xc1\x67\x00\xee\x52\x8e\x76\x43\xa0\x0f\x36\xcb\xc9\
-\x5c\x95\x15\xcd\x67\xd4\xad\x40\xf9\xfc\x7f\x41\x7d\xa0\x86\xd4\
-\x28\x6a\x14\xa8\x35\x52\x70\x03\x00\x4b\xaf\x5f\xc7\x39\xda\x79\
-\x7d\xe1\xef\x7a\x5e\xba\x22\x4a\xfd\xe9\x01\xfa\xe3\xdd\x6d\x78\
-\xff\x49\x78\x7e\x0d\x83\x33\xec\xa9\x94\x20\xd1\x69\xee\x50\x9a\
-\xe2\x10\xb4\x01\xc5\x21\xe7\x35\xbc\x4a\xf5\x81\xc6\xc8\x0c\x3c\
-\x9b\x64\x58\xe1\xbe\x77\x04\x3b\x63\xdc\x2e\xee\x1e\xc2\xad\x43\
-\xb8\x9f\xc3\x5e\x81\x9f\x98\xd2\x62\xc6\xda\xc8\x11\xbc\x3e\x82\
-\xef\x4e\xb0\x98\xf0\x1e\x89\xab\x5d\xd7\x00\xba\x56\x15\x77\xe7\
-\x6c\xba\xf9\xb0\x16\xd6\x0d\x20\xa2\xb9\x0f\x56\xc8\xde\xcf\xe1\
-\x12\x87\xd3\x0a\xce\x4b\x9c\xf5\x70\x26\xc1\xce\xb2\xe6\x9a\x2d\
-\x61\x6a\x07\xee\x3e\xf2\x35\x62\x88\xef\x79\xb5\x1b\x5a\x84\xc6\
-\x58\x20\x29\xad\xb1\x58\x2c\x56\x62\x06\x0f\x14\x7c\xd1\x23\xd0\
-\x39\x55\x23\x0f\x00\x0d\xb5\x0f\x40\x9d\xd7\xaa\xd7\xe3\xfa\x8b\
-\x09\x0b\x89\x4a\xa3\x2a\xed\x77\xc2\x93\x55\xe0\x4d\x49\xf3\xa7\
-\x18\xe0\x70\x7a\x56\x6a\x43\xf6\x8a\x24\xfb\x99\xdd\xf5\x5f\xbc\
-\x9b\xe2\xb6\xce\x83\x0b\xb5\xc3\x87\x7b\x43\xb8\x28\x50\x4a\xf0\
-\x70\xe0\x50\x7b\xc1\x5a\x32\x7f\x2a\x18\xc4\xa0\xda\xaa\xb9\xcb\
-\x9b\x7b\xdb\x98\x1d\x75\x89\x39\x29\xd0\xfa\x6d\x4d\x16\x50\xa4\
-\xcb\x98\xf3\xeb\x09\xc5\xa3\xc6\xfe\x4e\x51\x26\x5f\xd2\x00\xa6\
-\x7d\x86\x4f\xf4\x90\xba\x85\x95\x4a\x18\xd6\xf0\xf4\x36\xe3\xeb\
-\x8a\x18\x3d\x1f\xea\x2e\x8f\xbb\xc0\x2e\x4b\x71\x45\xfd\xd6\x23\
-\x78\x30\x81\x57\x4f\xe2\xe4\x44\x63\x52\x09\x73\x1b\x85\x31\x9d\
-\x3d\xe6\x96\x10\xa7\x7b\x22\x38\x2e\x7e\xb3\xfb\xad\xa5\x70\x7e\
-\x00\x97\x18\x7c\x33\xc3\x70\xa5\x98\xc0\x93\x1c\xde\xdc\x85\x4f\
-\xdc\x83\x4f\x0d\x21\x3f\x84\x6f\x1f\xc0\xf7\xbd\x0e\xef\xbd\x80\
-\x6d\xbe\x1f\xab\x8a\xa5\x56\xc1\xbe\x5f\x66\xc4\x98\x6f\x89\x15\
-\x36\x22\x76\x43\x25\x72\x12\xe8\xe6\x18\x8a\x9c\xe2\xa8\xf6\x33\
-\xa0\xfc\x64\x86\xbd\x94\x0d\x62\x31\x8b\x0c\x6b\xac\x04\x36\x03\
-\xdd\xa5\x51\x84\x96\xba\x29\x87\xdb\xd9\x30\x34\x22\x9d\x44\x44\
-\xad\x94\x80\xb0\xb5\x56\x30\x1c\x70\x1b\xd9\x2b\xab\x0a\x20\x55\
-\x43\xb0\xd9\x5c\x06\x00\x2d\xdd\x30\x65\xb8\x7b\xe8\xa0\xa1\x08\
-\xd4\x2d\x1e\x5c\x4d\x59\x32\x57\x66\xdc\x45\xaa\x50\x30\x96\x33\
-\xb6\xa6\xc6\x29\xd7\x47\xa2\xf7\x47\x77\x36\x60\x3b\x25\x89\x58\
-\xbc\xf2\xcc\x33\x30\x21\xd1\x39\xea\xe1\xfa\x84\x45\xa3\x24\xa7\
-\x4d\xd9\x85\xb6\x34\x78\x4d\x1c\xc2\x29\x15\x6f\x1c\xe1\x7d\xcb\
-\x87\x26\xf4\x2c\x19\xd5\x31\x15\x04\x6b\xb8\x17\x1b\xfb\x61\x76\
-\xbd\x84\x04\x7d\x06\x2e\x4b\x4c\x80\xef\xe4\x70\x9b\xc3\xa8\x87\
-\xa7\x4a\xa1\xa2\x90\x9b\xb9\x5b\x27\x1e\xa6\xe5\x54\x78\x21\x31\
-\x1a\x1c\x49\x4b\xe5\x00\xd5\xf3\xfb\x43\xf8\xe0\x05\xd4\x90\xe6\
-\xb4\x99\x94\x31\x34\xa7\xc6\x3e\x9a\xe4\x99\xdc\xaf\xea\x27\xde\
-\x7c\xcd\xb5\x99\xdf\xa6\x7d\x58\xef\xc1\xab\x27\xe0\x95\xcb\xf0\
-\x07\xee\xc2\xe6\x10\x3e\xfc\x1c\xd6\x12\xdc\xce\x11\x1c\x5a\xba\
-\x43\xe9\x20\x2b\xe9\x23\x60\xe0\xd5\x5c\x41\x54\xe7\x2a\xfc\x6b\
-\xae\x76\xa3\xc0\x62\x9d\x4d\x86\x5f\x76\xab\x07\x83\x04\x2f\x29\
-\xe1\xd4\xbe\x98\x40\xcb\x13\xe2\x1f\x15\x39\x5d\x46\x3a\x30\x46\
-\xfa\x7e\x0c\x37\x79\x55\x05\xd1\xca\x21\xd6\x4c\x4a\xcd\x34\xd6\
-\xa6\xcf\x0a\x9b\xfe\xc9\x29\x6d\x45\x5a\xdb\x2d\xaa\x46\xc0\xea\
-\x04\xd8\xac\xa5\x17\x3e\x6b\x30\x9b\xd6\xee\x97\xeb\xe9\x57\x3b\
-\x5d\xa2\x55\xca\xe5\x1d\x7e\xfa\x3f\x33\xd0\x65\xdb\x8e\x3e\x0d\
-\x67\xb0\x10\xc6\x4d\x0b\xdc\x4c\x77\x68\xb2\x8d\x64\x7e\x2c\x1e\
-\x6b\x95\xa6\xb7\xb7\x94\x68\xef\xe1\xa1\x9d\xbe\xc5\x9c\x73\x37\
-\xc5\xdc\x8d\xf9\x20\x63\xfa\x27\xa9\xc9\x75\x39\x9b\x49\xf8\x39\
-\x56\x82\x9a\x0f\x9b\x7f\x99\xc5\x99\x09\x64\x51\xcf\x12\xee\x7a\
-\x34\x84\xb7\x38\x3c\xe4\x94\xa2\xe2\xd5\x0e\x10\xa6\x02\x6c\x26\
-\x98\xe9\x66\x0e\x10\x0f\x45\x17\xde\x83\x7b\x43\xf8\xf8\x0d\x78\
-\xed\x2a\x9c\x4a\x29\xc0\xa0\xa5\x27\x82\x86\xc3\x95\xa7\x24\x54\
-\x56\x06\xd0\xf6\xb7\xdb\x00\xeb\x87\xf0\x0a\xc0\xf7\x5e\xc1\x1d\
-\xe9\x1e\xc1\xaa\x0a\x46\x07\x55\x54\x65\xa1\x86\x9d\xb8\x88\x8d\
-\x57\x72\x5c\xf0\xa7\x19\x52\x9c\x6b\x34\xd8\xd0\xe2\x72\x1c\xc7\
-\x92\x52\x67\x28\xe6\x8a\x6f\xb4\x67\xbb\xd8\x20\xa8\x5b\xa2\xba\
-\x4a\x1e\x97\x5f\xb6\x7a\x4d\xd6\xe6\x77\xd5\x14\xeb\x6f\xca\x7b\
-\x74\x9b\x50\xb9\xa5\xe9\xa2\x72\x04\xbf\x9e\xce\x6b\xc3\x94\x9f\
-\x67\x14\xc4\xe5\x53\xfa\x46\x95\xbe\x7c\x86\xfe\xcc\xe0\x09\x92\
-\x13\x53\x5b\x4a\xad\x7b\x2c\x7b\x87\x6d\xfd\xe7\x26\x8a\xdd\xe9\
-\x53\x1c\xe9\x57\xb0\x35\x1a\xe3\x45\x7a\x47\x70\x31\x83\x47\x02\
-\xe7\x32\x68\x3f\xcb\x80\xfb\xb2\x6e\x3d\xa5\x74\x43\x4f\xc9\x5b\
-\xe9\xb8\x85\x81\x0a\x15\x2c\x1c\x53\x63\xfb\x80\x84\x7a\x4f\x23\
-\x72\x35\xdb\xfa\x5a\x50\x07\xc4\x03\x1f\x5c\xd0\x1a\x78\x28\x90\
-\x81\x3e\xcb\xe1\x5f\xd5\x70\xbf\x80\x4f\x17\x98\x49\xb0\xe2\x5e\
-\xe1\x07\xd9\xf2\x20\xae\x45\x9a\xc2\x8f\x82\x73\x4d\x69\xfc\x83\
-\x65\x34\x03\xd0\x44\xae\x1f\xbf\x05\xaf\x5d\x86\x8b\x7d\x02\xd6\
-\x1e\xf3\xd4\x75\x82\x3c\x5a\xd5\x06\x8d\xb0\x09\xbc\x3c\x86\x57\
-\x7b\x78\xc4\xd7\x34\xbe\x02\xb1\x2c\x4f\xb3\x8a\x44\x67\xb4\xc2\
-\x4d\xd4\x94\x29\xe8\x6b\x34\xf1\x94\xd4\x5a\xe6\x96\x1a\x2b\x9f\
-\xd0\x20\x75\x9c\xc8\x40\x73\xe0\x18\xf7\xe2\x96\x72\xf3\xf1\x3b\
-\x55\x55\x1f\xcc\xa2\xf4\x50\x2b\x2f\xde\xf4\x47\xd0\xa6\x43\x96\
-\x95\x28\xc0\xbb\x73\xef\xe6\xdc\xf5\xeb\x6a\xb7\x07\x88\x68\x8c\
-\xea\x2f\x6f\x91\x2e\x43\x5b\x75\x3e\x9b\x3e\xc8\xad\xc5\xee\x21\
-\x69\x05\x33\xe5\x2b\x33\xfc\x3d\x05\xb2\x5c\x31\x13\x48\xca\x0d\
-\x5e\xdc\x54\xd9\x7f\x79\x67\x1d\xc3\x7c\x47\x3b\x06\xb5\x3f\x92\
-\x26\xc4\x5f\x49\x61\x3f\xc7\xa6\x7c\x89\xb7\x24\x1d\x24\x2f\x9a\
-\x9d\xe2\x84\x76\xc3\xdd\x19\xa5\x21\x79\x9b\xe9\x37\x1f\x46\x39\
-\xde\x23\xa1\xc5\x76\x44\x95\x16\x06\xfd\x9f\x06\x6c\xc1\xb0\x46\
-\x40\xbf\xa0\xd1\x34\x82\x55\x1c\x8e\x31\xf0\x3d\x81\xea\x09\x63\
-\xf4\x97\x33\xf8\x9e\x02\x3e\x33\x84\xcf\xa5\x68\xc1\xc2\xb6\x4d\
-\xf5\x8f\xc7\xf6\xba\xd1\x65\x2b\xfd\x32\x66\x62\x54\x08\xa2\x5c\
-\xee\x29\x49\x70\x48\xc4\xa7\x6e\xc2\x37\x5f\x85\x2b\x6b\x48\x31\
-\x49\xe6\x00\x17\x6f\xe4\xd8\x5d\x48\x3a\x86\x2b\x13\x78\x8d\x21\
-\xe6\x7e\x48\x03\x96\x81\x05\xc5\x19\xde\x3a\x4c\x0c\xd0\xa3\x11\
-\x57\x7d\x81\xc3\x29\x04\xf1\x30\x05\x35\x39\x3c\x24\xe8\x22\xad\
-\x06\xdd\xee\x2a\x76\x95\xf2\x7a\xd1\xa6\x2a\x69\xd9\xb6\xce\x2b\
-\xad\x8e\x33\xf2\xcd\xba\x7a\xc4\xad\xb3\x49\x22\x99\xc3\x14\x40\
-\xab\xd8\x9c\xb9\xb3\x4d\xc4\x02\x6d\x53\xc8\x35\xb4\xa8\x74\xd5\
-\xf4\xac\x2d\x75\xcf\x4d\x38\xb0\xe5\xda\xfd\x4d\x38\x42\xda\x35\
-\x35\x92\x49\xf2\x7b\x6a\xeb\xcf\xdf\xed\xe3\x24\xbd\x72\x60\x4e\
-\x49\x63\x61\xcc\x3a\x84\x67\x88\xf3\x92\x3d\x64\x24\x4a\xf6\x5d\
-\x37\xfc\x44\x94\x2f\x2c\x73\x3a\xbe\xbe\x49\xc6\x45\x1e\xd0\xb6\
-\x33\xc6\xbd\x39\x9c\x91\x61\xab\x47\x8d\x63\x42\x8c\xb9\x9c\x4f\
-\x31\x00\x48\xfd\x05\x58\x10\xc2\x7d\x9a\x70\x48\xba\x97\x33\x09\
-\xbc\x9e\xc1\xb9\x31\xfc\xc6\x10\x0e\x06\x78\x12\xab\x4f\x4e\x6c\
-\x68\x2e\x2b\xe2\x42\xeb\xaa\x8a\xc5\xa5\x60\xfd\xc7\x63\x4e\x9e\
-\xc1\x27\x6f\x83\xba\x00\x57\xb6\xaa\x8f\x13\xb5\xba\x16\xc0\x3a\
-\xe0\x53\x63\xf8\x10\x87\x4b\x6b\x28\xbd\xbe\xc1\x23\x3a\xcf\x2c\
-\xfe\x9e\xc2\x82\xd1\x01\x8a\x9c\x08\x17\xa5\x0e\x9d\x1f\x52\x71\
-\x59\x51\xe6\x41\xc9\x53\x68\x8f\xa3\x6a\xcd\x1d\xa0\xad\x35\x74\
-\xe4\xd1\x75\x94\x91\xd5\x0d\x46\xa1\x72\xc9\xa1\xd1\x2b\x37\xb6\
-\x48\xeb\x08\xcf\x48\x16\xad\x93\xf0\xb4\xaa\xad\x95\x88\x6a\x9b\
-\xd2\xd3\x6a\xf1\x4d\x9a\x1f\xe2\x41\x6e\xba\x99\x1a\x8b\xbf\x6c\
-\xce\xa6\xea\x14\xa6\x88\xcf\xdc\x6c\x29\xaa\xea\xd6\xa9\x2e\x8c\
-\xd3\xf9\x17\x7a\xeb\x87\x6e\x65\xd8\xbe\x22\xf7\x19\xbe\x52\xfa\
-\x82\xd5\xbe\x63\x6c\xca\xb7\x4e\x03\xd5\x36\x98\xeb\xd7\x07\x0d\
-\x19\xa0\x2c\xeb\xe2\xe2\x8e\xa1\xac\xd6\x7e\x48\xb9\xd6\xaa\xe5\
-\x01\x85\xf6\xff\x4f\x9d\xb6\x49\x41\xa5\xda\x2b\x83\x27\x4e\xf9\
-\x94\x27\x1a\x15\x0d\x6b\x63\x84\x34\x67\x53\xc8\x82\xe5\x54\x5a\
-\xa4\x81\x37\x28\x5b\x07\x78\x25\x81\xef\x95\xf0\xff\x1c\xc2\xe3\
-\x75\xf7\x5b\xcb\xfa\x33\xee\xc4\x05\xcc\x3f\x0a\xee\x53\x47\x45\
-\xe8\x8d\x14\xf1\x33\x1a\x3e\x73\x17\xcd\xe2\xd2\x26\xf2\x2a\x22\
-\x8e\x74\x0d\x8c\x49\x0e\xe0\x35\xf3\x59\x3d\x94\x1b\xdc\xa0\x2a\
-\x02\x21\x91\x81\x35\x61\xb7\x31\x74\x44\x2f\x94\xc3\x2f\xa8\x29\
-\xf1\xae\xa0\x2e\x20\x94\x07\x65\xb4\x8c\xb8\xdf\x85\x18\xf7\x15\
-\xba\xca\x29\x40\x2d\x12\xd3\x01\x3c\x67\x8d\xa2\xb0\x28\x39\xe8\
-\x71\x88\x6a\xb3\x7b\xd9\x60\x14\xca\x21\x3f\xaa\xe6\xd7\x83\x03\
-\x20\xa6\x71\xc2\x76\x23\x30\xbd\x54\x45\x05\xbc\xbb\x0e\xa2\x0b\
-\xdd\x66\xf1\x65\x90\xe3\x5a\xa6\xc5\x6c\x7d\x2b\x9f\x63\xec\x5e\
-\xc5\xd8\x67\x36\xc2\x71\x39\x1f\xaa\x07\xc7\x40\x56\xf0\xcf\x16\
-\xa7\x7e\xe8\x6e\x86\xe9\xd8\x22\xb8\x6b\x65\x7b\x54\x83\x2c\xaf\
-\x16\x98\x68\xcc\x69\xf6\x98\xad\x3c\xb0\x83\xd0\xd2\xb2\x8a\x87\
-\x14\x88\xb6\xf5\xb6\x54\x6e\xf8\x23\xf2\x7d\x39\x9e\x2d\x25\xc0\
-\x23\xc0\x51\xf2\x06\x55\xa5\xe4\x62\x19\xf7\x8a\x0e\xdb\x1d\xbb\
-\x80\xc9\x98\x2a\x89\x18\x96\xe1\x1c\x18\x4c\x35\xc6\x00\xf7\x30\
-\xa3\xee\x90\x0c\xe1\x75\x99\x0f\xdf\x37\x90\x66\x02\xb7\x8f\xb0\
-\x2c\xd5\xb8\xff\x75\xf2\xa9\x05\x73\x7e\x3d\xa1\x7c\x90\xb9\xa4\
-\xcf\x25\xf0\xb2\x86\x7f\x87\xc3\x3f\x3a\x82\x9d\x35\x97\xed\xb2\
-\xed\xab\xb8\xf2\x77\x99\x91\x8e\x3a\xae\xe8\x29\x7d\x04\x25\xf0\
-\x30\xb1\xf5\xc6\xd7\x40\x3d\x0b\x17\x4f\xa0\x59\x2b\x4f\x19\x99\
-\x7b\x72\x76\x08\x1f\xe6\xb0\x95\xc1\x03\xf2\x01\xa7\x35\x32\xad\
-\x26\xd4\x4e\xe9\x6e\x98\x95\x80\xfd\x23\x3c\x45\x53\xd2\xa6\x2e\
-\x8c\x09\x81\xb8\xff\x6a\x15\x74\x09\xba\x5c\xb1\xb8\x30\x45\x7b\
-\xd2\xbd\x5e\x17\xcb\x5b\x76\x60\x1d\x0f\x29\xa9\xe6\x2b\xb2\xfa\
-\xaf\xfe\x7f\xca\xae\xa5\xb5\xa9\x20\x0a\x9f\x79\xdc\xe4\xda\x1a\
-\xad\x68\x10\x45\x08\x62\xc1\x82\x2e\x54\x70\xe5\xda\xad\xbf\xc7\
-\x6d\x7f\x91\x3b\xf7\x6e\xdc\x14\xc4\x85\x8b\xa2\x42\xaa\xc5\x0a\
-\x46\xa5\x8f\x98\xe4\x3e\x66\x8e\x73\xe6\x75\x1f\x99\x08\x76\x57\
-\x02\xed\x9d\xdc\x33\x33\xe7\x7c\xe7\xfb\xbe\xb3\x0e\xc2\x24\x91\
-\x9c\xa4\x59\x5a\xcf\x50\x44\x77\x45\x52\x98\x72\x7f\xc1\xee\x1e\
-\x8e\x8c\x8f\x8d\xa6\xf8\xd8\xf4\xfe\xeb\x4a\x72\x60\x49\x54\x3e\
-\xf9\x93\xa1\xeb\xc9\x71\x86\x5a\x48\xf9\xa9\xc8\x5e\x9a\x42\xf6\
-\x77\xd6\x29\x2e\xdb\x49\x5e\x5e\xc3\x24\xb7\xf7\x3b\x0f\x24\x78\
-\xf4\x40\xbe\x3b\xda\x63\x87\x25\xc3\x46\x4d\x67\x3e\x33\x67\x9e\
-\xb0\x25\x17\x63\x5e\x4a\x63\x6a\x35\x27\x0f\xf7\x5f\x8d\xf6\xab\
-\x75\xb9\xa9\xc9\xb9\x73\x4d\xe9\x7b\x66\x71\x7a\x59\x50\x98\x16\
-\x1c\xce\x0b\x52\x6f\x1c\x49\x38\x91\xc4\x77\x15\x03\xfa\xcb\xac\
-\xa2\x51\x95\xab\x01\x7c\x29\xe0\xfb\x9c\x38\x95\xb7\x87\x34\x3b\
-\xc4\x91\x96\x33\xf0\x0d\x23\xf3\xeb\xa1\x84\xfb\x08\x2f\x04\xbc\
-\x2a\x29\x8b\x73\x89\x8d\xb4\x53\xd3\x1c\x5b\x58\xb8\xc4\x26\x1c\
-\xae\x1d\x8b\x07\xf4\x7c\x60\x5e\x52\x36\xf2\xfe\x08\x1e\x4c\x60\
-\x3c\xb2\xa8\x0b\x50\x19\xbd\xb7\x82\x67\x39\x15\xa3\x34\x4f\xc5\
-\x0a\x32\x0a\x49\x1d\x8f\x05\xb3\x1e\xfc\xca\x37\x86\x81\x87\x34\
-\xbd\x75\xec\x31\x48\xdb\x3e\xaf\x0b\x2f\x12\x99\x3a\xfa\xb3\x06\
-\x79\x5a\x29\x8b\x5d\x47\x4b\xdd\xf5\x8a\xea\xdd\x09\x49\x1b\xc0\
-\xe4\xf0\xcd\x75\x68\x0e\x02\x68\xe3\x2e\x0d\x48\x95\xad\xbd\xac\
-\x9d\xa5\x2a\x90\x64\x71\xe2\x4c\x75\x58\xab\xbd\x10\xf7\x96\xd6\
-\xb2\x92\xff\x41\xd1\xd1\x4c\x9a\x04\x73\x5b\x17\x42\x88\x83\xf2\
-\xea\xfe\xb7\x21\x81\x92\xf5\x7a\xbf\xc9\x0b\xa7\xc8\xba\x64\x5b\
-\x59\x98\x82\x7b\x0c\xd1\xc1\x76\x83\xf0\x52\x1d\xa7\xaf\x72\xa3\
-\x16\x98\xe7\x17\x38\x22\xc3\x9f\xe8\xfc\xc1\x2c\xcd\xb5\x65\xec\
-\x1f\x09\x7b\x1d\xf7\xed\x38\xb8\xd3\xac\x36\xa7\xcb\x21\x57\x94\
-\x5f\x99\xc0\x7d\x52\x92\x1c\xf3\xe3\x12\xde\xad\xe0\x78\x8b\xc0\
-\x7b\x59\x7b\x41\xa7\x89\xb3\x63\x4d\xcd\xa6\x31\x92\xe9\xc0\x65\
-\x0b\xef\x98\x27\x1f\x86\xff\x32\x2d\xc8\x4c\xef\x39\x87\xd7\x0b\
-\xb8\xd8\xb2\x4b\x10\x7e\x03\x68\xf4\xe8\x64\xd3\xe4\x62\x8d\x38\
-\x86\x76\x5e\x45\xd5\xea\xd2\xba\x19\x67\x25\xcc\x3e\xc3\xc3\x5d\
-\x98\x70\xc2\x4c\xc7\x39\x8c\xae\x50\x9a\x7e\x5a\xd3\x85\xe0\x66\
-\x45\x45\xec\x9c\xb8\xb8\x76\x39\x1c\x3b\xc7\x58\xb2\x06\x4d\xfa\
-\x3f\x27\x5d\x99\x74\x38\x59\x34\x4b\x98\x20\xa8\x0d\x02\x2b\xb5\
-\x96\xa2\xf4\x7a\xe7\x2a\xe5\x04\x88\x29\x6c\x47\x25\x4d\x55\x58\
-\x02\xaf\x4b\x5a\xeb\xe0\x3f\xfc\x5a\xb0\x1b\x1e\x71\xed\x41\xc6\
-\x09\xc1\x38\x96\x9c\xa8\x85\xdc\x39\x3f\xcd\xea\xba\x23\x2b\xd9\
-\x10\xf7\x04\x48\xd2\xa7\xe6\x34\x54\x87\xf5\xf5\xfd\x93\x25\xbd\
-\x33\x4f\x02\x0b\x13\x58\xa3\x68\xd2\x25\x39\x33\x7c\x3c\x63\xdb\
-\x92\x6b\x81\xe6\x8e\x28\x6d\x97\xfd\x6b\x69\x39\x4f\x25\x52\xbf\
-\x7d\xe5\x1c\x18\x6d\x9a\xe1\x88\x96\xae\x2e\x6e\x48\xcd\xac\xe5\
-\xa0\xd2\x7b\x91\x2c\x50\x1d\xb9\x1f\x3d\xe9\x5b\xe5\xca\xc3\x73\
-\x67\x18\xb8\x68\x8c\xb6\xdf\x1d\x7d\x63\x0f\x7f\x4e\x2f\xe0\x0d\
-\xc2\xec\x12\x85\xaf\xb6\x3e\x13\x66\xbd\x4b\x0d\xd3\x8a\x7a\x43\
-\x37\x07\x54\x5c\x9a\xdc\x7a\x51\x53\xf6\x6f\xa2\x7f\xc9\xe1\xc3\
-\xea\xe9\xae\x3c\x78\x54\xc2\xdb\x05\xd4\x43\xcb\xcc\x11\xd4\x11\
-\x23\x1b\x0f\xcb\xbb\xf0\x8f\x51\xf9\xd1\x6b\x94\xfa\x9b\x58\x2f\
-\x60\x40\x36\xe2\xd9\x5d\x31\xba\xc7\x76\x26\xb7\xe6\xd7\xb2\x1f\
-\x79\x45\x0f\x66\xb6\xd6\xaf\x39\x11\xb9\x9c\x12\x92\xe9\x66\x6c\
-\x8b\xd3\x19\x6a\xdd\x92\xc8\xf0\x26\xb8\xdb\x83\x0c\x38\xb6\xc4\
-\x99\x6d\x3d\x0d\x0b\xc1\xc4\x02\x56\x18\x33\xec\x50\x3b\xb9\x1a\
-\x34\x4a\x69\x55\xc8\xa4\x15\x86\x36\x2d\x78\xd2\x94\x0e\xb4\x59\
-\x0c\x73\x0e\x01\x3d\xc5\xdf\x17\xb2\xae\x66\xb3\x2e\x06\x8d\x01\
-\x7a\x70\x24\x8e\x60\x25\xb6\x8a\xe6\xc6\xf4\x38\x18\xb5\x6a\xec\
-\x6f\x5f\xc4\x3e\x0f\xb7\xa7\x52\xc2\xb5\x28\x55\xd8\x3b\xbf\x03\
-\x8b\x16\xbb\x78\x8e\x02\x75\xf6\x57\x80\x01\x00\x5d\x52\xd7\xb9\
-\xb1\xe8\xa5\xb9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x00\xae\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x75\x49\x44\x41\x54\x48\xc7\xed\xd4\x31\x0a\x80\x30\
-\x0c\x85\xe1\x0c\x5d\xbc\x95\x57\x70\xf2\x34\x92\xf3\x38\xf4\x5e\
-\x9e\xc1\xe5\x77\x91\xd2\x76\xb3\x09\x08\x9a\x37\x97\x0f\x92\x94\
-\x27\x12\x89\xbc\x18\x12\xab\x0f\x93\x01\xf5\x61\x00\x66\x1f\x46\
-\x83\xf9\x10\xc3\xc2\x4e\xf2\x60\x4e\x20\xf7\xd4\xe3\xa1\xd8\xee\
-\xe7\x0d\x35\xb4\x1b\xb4\xa7\x86\x57\xdc\x52\xa6\x4b\x55\xd4\x64\
-\x3c\x78\xa1\x0e\xf3\xbf\x29\x14\xe6\xce\x29\x94\xda\x3b\x50\x5d\
-\x18\x11\x11\x53\xfb\x45\xfe\x95\x0b\xf0\xb7\xf6\xed\xa5\x85\xa4\
-\xef\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xe9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\xb0\x49\x44\x41\x54\x48\xc7\x63\x60\x18\x05\x24\x81\
-\xff\xae\xff\x2b\xff\xd7\x13\x09\x2b\xff\xbb\xe2\x32\x66\xc9\x7f\
-\x52\xc1\x62\xec\xae\x21\x07\x60\xba\x0a\xe8\x54\x10\xd8\x4f\xb4\
-\xd7\xf6\x83\xd5\x57\x62\x1a\x54\x0f\x96\xa8\x27\x3a\x3c\x71\xa9\
-\xa7\xb9\x41\xff\x39\xfe\x5b\x50\xc1\x20\xa0\x31\xdb\xff\x7f\xff\
-\xef\x4e\xb9\x41\x33\xc1\xa2\x58\x8c\xc2\x6d\x90\x03\x38\x2e\x1c\
-\xd0\x44\x65\xff\xdf\xc5\x6e\x14\xa9\x61\xca\xf0\x5f\x0e\xbb\x51\
-\x24\x1b\x04\x36\xea\x1e\xa6\x51\x84\xbc\x86\x1d\xce\x83\xa6\x63\
-\x24\xa3\x08\x05\x36\x21\x00\x37\x8a\x0e\x06\x51\xcb\x6b\x54\x0b\
-\x6c\xaa\x45\x3f\xd5\x12\x24\xf5\xb2\x08\x6d\x33\x2d\xd5\x8a\x91\
-\x01\x2d\x21\xa9\x56\xf8\x53\xab\x3a\xa2\x5a\x05\x49\xc5\x2a\x7b\
-\x14\xe0\x00\x00\xcb\x28\x3d\x6c\xae\xcc\x96\x95\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xd9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x0d\x00\x00\x00\x0d\x08\x04\x00\x00\x00\xd8\xe2\x2c\xf7\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x07\x74\x49\
-\x4d\x45\x07\xe7\x0c\x06\x02\x3a\x0f\x91\x9c\x24\xc1\x00\x00\x00\
-\xbd\x49\x44\x41\x54\x18\xd3\x55\xd0\x3d\x4a\x43\x61\x10\x85\xe1\
-\xe7\xbb\xb9\x85\x62\x88\x55\xc4\x22\x95\xd8\x04\x05\x9b\x20\x82\
-\xa0\x58\x88\x7b\x71\x1f\x96\x6e\xc6\xca\x15\x58\x68\x69\xab\xb5\
-\x28\x41\x10\x2c\x44\x8c\xc7\xe2\xbb\xc9\xc5\x69\x66\xe6\xbc\xc3\
-\xfc\x89\x80\x88\x8c\x72\x9a\x49\x6a\x5c\xa5\x0e\x95\x5c\xe5\x33\
-\x37\xd9\xac\xa8\x29\x0a\x15\x0f\x4c\x6d\x98\x1a\x52\x14\x6d\x27\
-\xc3\x8f\x6b\x73\xb7\x5e\x6a\xda\x76\xf2\xba\x43\x17\x0e\x0c\x3c\
-\xfb\xfd\x8f\x4e\x9c\xd9\x76\x6e\x61\xa4\xb7\x88\xac\x45\x76\xf3\
-\x9a\xc7\x8c\x97\x03\x9a\xce\x7f\x61\xdf\xd8\x83\xb9\x1e\xd5\x1d\
-\x71\xac\xb8\xeb\x0f\x6a\x56\x7d\x87\x8e\x7c\xb8\xef\x07\xb5\xab\
-\x68\xc7\xd4\xc2\x9e\x89\x79\x2d\x68\x96\xdf\xb0\x05\x2e\xcd\xbc\
-\xd7\xe5\x4a\x50\x84\xa1\x99\x6f\x4f\xde\x96\x6d\xfe\x00\x24\x7b\
-\x44\x6d\x60\x6c\x4f\x18\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x33\x2d\x31\
-\x32\x2d\x30\x36\x54\x30\x32\x3a\x35\x38\x3a\x30\x38\x2b\x30\x30\
-\x3a\x30\x30\x46\x95\x88\x7b\x00\x00\x00\x25\x74\x45\x58\x74\x64\
-\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x33\x2d\
-\x31\x32\x2d\x30\x36\x54\x30\x32\x3a\x35\x38\x3a\x30\x38\x2b\x30\
-\x30\x3a\x30\x30\x37\xc8\x30\xc7\x00\x00\x00\x28\x74\x45\x58\x74\
-\x64\x61\x74\x65\x3a\x74\x69\x6d\x65\x73\x74\x61\x6d\x70\x00\x32\
-\x30\x32\x33\x2d\x31\x32\x2d\x30\x36\x54\x30\x32\x3a\x35\x38\x3a\
-\x31\x35\x2b\x30\x30\x3a\x30\x30\xcd\xa0\x70\x46\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x80\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x46\x37\x45\x31\x35\x36\x45\x44\x39\x31\x34\
-\x31\x31\x31\x45\x45\x41\x32\x31\x38\x46\x46\x38\x41\x34\x44\x46\
-\x45\x31\x41\x34\x32\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x46\x37\x45\x31\x35\x36\x45\x45\x39\x31\x34\x31\x31\x31\x45\
-\x45\x41\x32\x31\x38\x46\x46\x38\x41\x34\x44\x46\x45\x31\x41\x34\
-\x32\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x46\x37\x45\x31\x35\x36\x45\x42\x39\x31\x34\x31\x31\x31\x45\
-\x45\x41\x32\x31\x38\x46\x46\x38\x41\x34\x44\x46\x45\x31\x41\x34\
-\x32\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x46\x37\x45\
-\x31\x35\x36\x45\x43\x39\x31\x34\x31\x31\x31\x45\x45\x41\x32\x31\
-\x38\x46\x46\x38\x41\x34\x44\x46\x45\x31\x41\x34\x32\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xc4\
-\x37\xc1\xd0\x00\x00\x00\xf4\x49\x44\x41\x54\x78\xda\xec\xd8\x51\
-\x0a\xc2\x30\x0c\x00\xd0\x4d\xea\x87\x27\xf0\x12\x1e\x42\x8f\xe0\
-\xa4\x32\xf0\x30\x6e\x78\x19\xa5\x97\xf0\x26\x5e\x44\xa8\x29\x64\
-\x3f\x63\xcd\xd6\xae\x59\x07\x26\x10\xb6\xfc\x74\x8f\x66\x0d\x63\
-\xa5\xb5\xb6\x58\x53\x6c\x8a\x95\x85\x80\x04\x24\x20\xee\x50\x73\
-\x17\xd0\x5a\xc7\x3c\xf3\x02\xf9\x72\x85\x31\x26\xeb\x0e\x29\x84\
-\x3c\x21\xef\xb9\x5b\xd6\x61\x2a\xac\x1b\xc8\x63\x2e\x50\x1f\xd3\
-\x81\xde\x39\x40\x3e\x4c\x9b\xa3\x65\x41\x18\x6e\x50\x30\x86\x13\
-\x14\x85\xe1\x02\x45\x63\x38\x40\xb3\x30\xe4\xa4\x86\x09\x7c\x86\
-\x4b\x0d\x79\x83\x69\xfa\x5d\x02\xe3\xdd\x21\xc4\xb8\xc5\xaf\xee\
-\x0a\xb5\x5a\x02\x43\xb5\xec\x00\xb9\xc5\xfb\x6a\x04\x95\x0c\xe3\
-\x05\x41\x8b\x1e\xb8\x68\x41\xa1\xb0\x4e\x86\x21\x5f\x6a\x40\xb5\
-\x14\x8a\x03\x33\x7a\xca\x08\xd4\x8e\x03\x33\xe9\xd8\x7b\x50\x1f\
-\x0e\xcc\xe4\x39\x34\x80\xda\x73\x60\x82\x06\xe3\x00\x2a\x39\x26\
-\x78\x52\xf7\x50\x0d\xd6\x79\x3f\xf2\x11\x71\xe2\xc0\xb8\x28\xe5\
-\x67\x83\x80\x04\xf4\x6f\xa0\x9f\x00\x03\x00\x41\x57\x5d\x2e\xf2\
-\xf9\x2d\x0e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x6f\x49\x44\x41\x54\x48\xc7\x63\x60\x18\x05\xa3\x60\
-\x20\x01\x0b\x43\x38\x75\x8c\x59\xcb\xf0\x9f\xa1\x9e\x3a\xc6\x80\
-\xa0\x03\x75\x8c\xa9\x1f\x35\x66\x38\x19\x13\xc8\xb0\x12\xa8\x85\
-\x0a\xc6\xfc\x02\x2a\x5d\x8b\x61\x14\xc9\x9e\xaa\x85\x2a\x47\x35\
-\x8a\xac\xb0\xa9\xc7\x30\x8a\xec\x20\x46\x35\x8a\xa2\x98\x42\x18\
-\xc5\x49\x69\x84\xc3\x8c\x7a\x41\x79\xba\x81\x19\xf5\x9f\xf2\x32\
-\xa7\x9e\x3a\xc6\xc0\x8c\xa2\x82\x31\x20\xe0\xc0\x30\x0a\x46\x01\
-\x71\x00\x00\x6e\xaf\x65\x7f\x1e\x3c\xbd\xd8\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xb7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x7e\x49\x44\x41\x54\x48\xc7\x63\x60\x18\x05\xa3\x00\
-\x0b\x30\xa2\x96\x41\xbf\x19\xba\x19\xb8\xa8\x61\xd0\x7f\x20\xbc\
-\xc7\xe0\x4a\x1d\x83\x40\x70\x11\x83\x30\x75\x0c\xfa\xcf\xf0\x9a\
-\x21\x86\x3a\x06\x81\xe0\x4e\x06\x45\xea\x18\xf4\x9f\xe1\x2b\x43\
-\x09\x03\x33\x35\x0c\x02\xc1\xb3\xe4\x24\x8a\xff\x58\x21\x19\x89\
-\xe2\x3f\x4e\x48\x62\xa2\xf8\x8f\x17\x92\x90\x28\xe8\x60\x10\x55\
-\xbc\x46\xa5\xc0\xa6\x4a\xf4\x53\x29\x41\x52\x25\x8b\x50\x29\xd3\
-\x52\xa5\x18\xa1\x4a\xc1\x46\xb5\xa2\x96\x6a\x85\xff\x28\x18\x01\
-\x00\x00\x19\x25\xac\x87\x41\x89\xd9\x5a\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x8f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x0d\x00\x00\x00\x0d\x08\x03\x00\x00\x00\x45\x35\x14\x4e\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\xae\
-\x50\x4c\x54\x45\x01\x01\x01\x00\x00\x00\x00\x01\x01\x01\x04\x03\
-\x04\x05\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xff\xff\x8d\x6e\xf8\x74\x00\x00\x00\x38\x74\x52\x4e\x53\x00\x00\
-\x00\x00\x00\x0e\x3f\x1c\x01\x85\xf4\xb2\x0f\x04\xae\xdb\x1b\x3b\
-\x9a\x52\x02\x09\x86\xb5\xb8\x2f\x47\x88\xa0\xfa\xf7\x3d\x08\x24\
-\xe9\xd3\x15\x50\xfe\x9e\x8b\x64\x0c\xc3\xf0\x2e\xec\xed\x59\x4a\
-\x36\x44\x7e\x40\x3a\x16\x65\xd7\x80\xb9\x00\x00\x00\x01\x62\x4b\
-\x47\x44\x39\xd7\x00\x95\x40\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe7\x0c\x06\x02\x39\x11\x40\xbe\x4a\x61\x00\x00\x00\x76\x49\x44\
-\x41\x54\x08\xd7\x45\xcb\xeb\x16\x42\x50\x14\x04\xe0\x33\x48\x52\
-\x29\x14\x25\x94\x5c\x0a\xb9\x4b\xde\xff\xc9\x38\x88\xfd\x67\xd6\
-\xb7\x66\x36\x21\x04\xfd\xad\xf8\x35\xc0\x30\x64\x90\xb0\x11\xb7\
-\x3b\x2a\xda\x60\x2f\xb5\x87\x63\x9f\xa3\x20\x2b\xea\x69\xd2\x99\
-\xd7\xf4\xcb\x15\x93\x8c\x9b\x69\xd9\xf7\xbf\x1e\x70\x9e\xae\x87\
-\xf9\xcf\x0f\x5e\xc2\xa2\x77\x1b\x62\x56\x14\x7f\x92\x45\x49\x9a\
-\xe5\x45\x49\xc5\xb2\x40\x95\x66\x71\xed\x00\xdc\xa0\xe8\xdb\xfc\
-\xe8\x86\xeb\x00\x20\x17\x07\xf3\x83\x01\x3b\xb3\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x32\x33\x2d\x31\x32\x2d\x30\x36\x54\x30\x32\x3a\x35\x36\
-\x3a\x33\x39\x2b\x30\x30\x3a\x30\x30\x70\xa4\xb4\x9f\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x32\x33\x2d\x31\x32\x2d\x30\x36\x54\x30\x32\x3a\x35\
-\x36\x3a\x33\x39\x2b\x30\x30\x3a\x30\x30\x01\xf9\x0c\x23\x00\x00\
-\x00\x28\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x74\x69\x6d\x65\x73\
-\x74\x61\x6d\x70\x00\x32\x30\x32\x33\x2d\x31\x32\x2d\x30\x36\x54\
-\x30\x32\x3a\x35\x37\x3a\x31\x37\x2b\x30\x30\x3a\x30\x30\xab\x34\
-\x3a\xe2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\xda\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x35\x43\x46\x37\x42\x41\x38\x31\x38\x34\x39\
-\x42\x31\x31\x45\x45\x38\x36\x39\x43\x42\x39\x41\x36\x30\x39\x46\
-\x41\x31\x33\x37\x32\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x35\x43\x46\x37\x42\x41\x38\x32\x38\x34\x39\x42\x31\x31\x45\
-\x45\x38\x36\x39\x43\x42\x39\x41\x36\x30\x39\x46\x41\x31\x33\x37\
-\x32\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x35\x43\x46\x37\x42\x41\x37\x46\x38\x34\x39\x42\x31\x31\x45\
-\x45\x38\x36\x39\x43\x42\x39\x41\x36\x30\x39\x46\x41\x31\x33\x37\
-\x32\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x35\x43\x46\
-\x37\x42\x41\x38\x30\x38\x34\x39\x42\x31\x31\x45\x45\x38\x36\x39\
-\x43\x42\x39\x41\x36\x30\x39\x46\x41\x31\x33\x37\x32\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xb9\
-\x6b\x31\x08\x00\x00\x04\x4e\x49\x44\x41\x54\x78\xda\xec\x9b\x6d\
-\x48\x53\x51\x1c\xc6\x35\x2d\x33\x2a\xa2\x0f\xbd\x40\x6f\x18\xf8\
-\xa1\xc2\xde\xa0\x0f\x92\x61\x50\x54\x4a\x1a\x59\x22\x35\x88\x95\
-\xc4\x22\x0a\xd1\xb0\xc8\xd0\x32\x66\x60\xa0\x46\x06\x8a\x56\x42\
-\x58\x46\x66\x14\xc4\x48\x12\xc2\x60\x21\xf8\x25\x30\x21\x3f\x39\
-\x43\x12\x25\xc3\x96\x18\xbe\xf6\x1c\xb8\x67\xa8\xa5\x6e\x77\x67\
-\x6e\x77\x7b\x1e\xf8\x09\x0e\x71\xf7\x9e\x1f\xe7\x9e\xff\xb9\xf7\
-\xfe\xc3\x27\x26\x26\xc2\x98\xc0\x49\x38\x85\x50\x08\x43\x21\x14\
-\xc2\x50\x08\x85\x30\x14\x42\x21\x0c\x85\x50\x08\x47\x81\x42\x18\
-\x0a\xa1\x10\x86\x42\x28\x84\xa1\x10\x0a\x61\x28\x84\x42\x18\x0a\
-\x61\x28\x84\x42\x18\x0a\xa1\x10\x86\x42\x28\x84\xa1\x10\x0a\x61\
-\x28\x84\xa1\x10\x0a\x61\x28\xc4\xd0\x89\x88\x8a\x8a\x4a\x4c\x48\
-\x48\xe8\xe4\x50\x04\x48\x30\x43\xde\x75\x75\x75\x3d\xcc\xce\xce\
-\xde\x26\x66\x0b\xf1\x2f\xe2\x87\x2b\x6d\x6d\x6d\xa5\x26\x93\x69\
-\x15\x07\x66\xfe\x29\x2f\x2f\x4f\x19\x1c\x1c\x7c\x35\x45\x88\x96\
-\x77\xcd\xcd\xcd\x37\x92\x93\x93\x17\x71\xa0\x7c\x8f\xd5\x6a\x4d\
-\xec\xef\xef\x7f\x2e\xc6\x7d\x42\xfb\xf0\xbf\x19\x1b\x1b\xb3\xd5\
-\xd7\xd7\x9f\xe7\xa0\xf9\x86\xdc\xdc\xdc\x1d\xdd\xdd\xdd\x8f\xa5\
-\x08\x99\x19\x85\xc8\xd9\x32\x34\x34\xf4\xba\xb2\xb2\xf2\x04\x07\
-\x51\x0d\x16\x8b\x25\xa6\xa3\xa3\xe3\xc1\x74\x11\xee\x0a\x71\x89\
-\x11\xd3\xaa\xa8\xa8\x28\x91\x83\xaa\x8f\x8c\x8c\x8c\x95\xad\xad\
-\xad\x77\x66\x12\xe1\xa9\x10\x97\x18\x56\x64\x9e\x21\xd6\xe2\xa6\
-\xa6\xa6\x6b\x73\x89\xd0\x2b\xc4\x25\x86\x15\xd9\xdc\x34\x34\x34\
-\x58\xc4\x5a\xec\xc9\xc0\xea\x15\xc2\x8a\x6c\x16\x6a\x6a\x6a\x4e\
-\x0d\x0f\x0f\xbf\x75\x77\x56\xa8\x14\xc2\x8a\x6c\x12\x65\x65\x65\
-\x49\x4e\xa7\xf3\xa5\x1e\x11\x93\x85\x98\x81\x43\x81\x97\x90\xad\
-\xc8\x0a\x0b\x0b\xf7\xf6\xf5\xf5\xd5\x7a\x23\xc2\x25\x24\x36\x36\
-\x56\xfc\xd3\x68\x90\x0b\x7e\xaa\x10\x13\x2a\x15\x59\x4e\x4e\x4e\
-\x9c\xc3\xe1\xa8\x52\x21\x62\x8a\x10\x09\x7e\x17\x77\x7f\x8f\x02\
-\xa7\x0a\x31\xc1\x5a\x91\x65\x66\x66\x6e\x68\x6f\x6f\xbf\xa7\x52\
-\x04\xf2\x06\xac\x99\x2e\x44\x12\x09\x2c\x60\x44\x85\x98\x60\xa9\
-\xc8\xd2\xd3\xd3\x57\xb4\xb4\xb4\xdc\x56\x2c\xe2\x13\xd8\xec\xba\
-\xb9\x38\x83\x10\x89\xb8\x94\x59\x15\x7d\xb1\x61\x2b\xb2\xa4\xa4\
-\xa4\xc8\xc6\xc6\xc6\x2b\xe3\xe3\xe3\x2a\x45\x7c\x05\x3b\xff\xb9\
-\xdb\x3b\x87\x10\xc9\x4a\xf0\x2c\x14\x2b\x32\x71\xac\xa3\xa3\xa3\
-\x36\x85\x22\x7a\xc0\x7e\x6d\x79\x08\xd3\x2b\x44\xb2\x09\xd8\x43\
-\xa1\x22\xab\xae\xae\x4e\x17\xc7\xa8\xf0\xf2\x24\xd6\xe5\xe3\x60\
-\xc1\xac\xcf\x43\x3c\x14\x22\xd9\xad\x4d\xb9\xa0\xab\xc8\x4a\x4a\
-\x4a\x0e\x0f\x0c\x0c\xbc\x50\x28\x62\x44\x5b\x8f\x23\xdd\x7a\x40\
-\xa5\x53\x88\xac\xc8\x8e\x80\xfe\x60\xa8\xc8\x0a\x0a\x0a\xe2\x7b\
-\x7b\x7b\x6b\x15\x2f\xd8\xf9\x60\xb1\x47\x4f\x0c\xbd\x10\x22\x89\
-\xd0\x36\x97\x86\xac\xc8\xb2\xb2\xb2\xb6\x74\x76\x76\x56\x29\x16\
-\x21\x6e\xaf\x2f\xd3\xf5\x08\x57\x81\x10\x49\x14\xb8\x69\x94\x8a\
-\xcc\x6c\x36\xaf\x13\xf2\x15\x8b\x68\x00\xab\xbd\x7a\xa6\xae\x50\
-\x88\x64\x05\x78\x14\xa8\x15\x59\x5a\x5a\xda\x72\xbb\xdd\x7e\x4b\
-\xb1\x88\x8f\x20\x46\xc9\x4b\x0e\x3e\x10\x22\x59\x0f\xde\xab\xaa\
-\xc8\x2a\x2a\x2a\x8e\x7b\x7b\x4c\x36\x9b\x2d\x5b\xf1\x5e\xe2\x0b\
-\x88\x53\xfa\xd6\x89\x0f\x85\x48\xe2\xfc\x5d\x91\xd5\xd5\xd5\x9d\
-\xd5\xf6\x12\xaa\x64\x7c\x07\xfb\x66\xda\x4b\x04\xba\x10\x59\x91\
-\x1d\xd4\x36\x45\xf3\x56\x91\x89\x7d\x8e\xe2\xbd\xc4\x2f\x70\x6c\
-\xae\xbd\x84\x11\x84\x48\xc4\x89\x98\xc0\x90\x2f\x2b\xb2\xe2\xe2\
-\xe2\x03\x3e\xd8\x4b\x9c\x73\x77\x2f\x61\x24\x21\x93\x2b\xb2\xab\
-\x2a\x2b\xb2\xd4\xd4\xd4\x25\x79\x79\x79\x7b\x7a\x7a\x7a\x9e\x28\
-\x5e\xb0\xaf\x6b\xc7\x3b\x2f\x63\xe3\xef\x97\xad\x97\x81\x12\x90\
-\x19\x80\x6f\xd9\xde\x07\x79\xc0\x19\x8a\x6f\xbf\xaf\x05\x8f\xc1\
-\xa1\x00\x38\x96\xe7\xe0\x12\xe8\x63\x3b\x42\x58\xd8\x56\x50\x0b\
-\xb6\xfb\xe1\xbb\x3f\x00\x33\xf0\x6b\x27\x40\x20\xf6\x87\x84\x83\
-\xbd\xe0\x05\x58\x3d\x0f\xdf\xf7\x19\x98\x40\x1b\x1b\x76\x66\xcf\
-\x02\x70\x52\xbb\x94\x45\xfb\xe0\xff\x3b\xc0\x69\x60\x17\x5d\x19\
-\xec\xa0\x72\x3f\x0b\xc1\x65\x70\x57\x9b\x3d\xde\xe6\x27\x38\x03\
-\xde\x82\x71\xb6\xb4\xe9\xcf\x52\x60\xd5\xe4\xe8\xc9\x1f\x70\x01\
-\x3c\x01\x63\xec\x31\x54\x17\xb1\xae\x54\x81\xa3\xee\x36\x89\x81\
-\xab\xe0\x1e\x18\x66\xd3\xa7\xef\x12\x0b\x9e\x81\x5d\xb3\xfc\x4d\
-\x29\xc8\x07\xbf\x8d\x72\x52\xc1\xd0\x85\x1b\x0f\x9e\x82\x8d\x93\
-\x3e\x7b\xaa\x5d\xda\x7e\x18\xed\x64\x82\xa5\x2d\x5a\x54\x64\x29\
-\xe0\x2c\xb8\x08\xbe\x19\xf5\x44\xd8\xa7\x4e\x21\x0c\x85\x50\x08\
-\x43\x21\x14\xc2\x50\x08\x85\x30\x14\x42\x21\x14\x42\x21\x0c\x85\
-\x50\x08\x43\x21\x14\xc2\x50\x08\x85\x30\x14\x42\x21\x0c\x85\x30\
-\x14\x42\x21\x0c\x85\x50\x08\x43\x21\x14\xc2\x50\x08\x85\x30\x81\
-\x91\xbf\x02\x0c\x00\x1b\x50\xe8\x17\xa2\xc6\x4f\xc7\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xb7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x7e\x49\x44\x41\x54\x48\xc7\xed\x94\x31\x0d\x80\x30\
-\x14\x05\x09\x6c\xac\x28\xc0\x02\x1e\x70\x81\x0c\x5c\xe0\x02\x17\
-\x88\xc0\x02\x06\x98\x99\x18\x0e\x01\x05\x92\x92\xeb\x44\x4f\xc0\
-\x25\xfd\x7d\xef\x15\x45\x26\x13\x42\x67\x89\x4e\x26\x6a\x43\x04\
-\xb0\xd1\x3b\x22\x80\x99\xc6\x11\xc1\xce\xe0\x88\x00\x16\x5a\x47\
-\x04\x07\x23\x95\x21\x02\x58\x3f\x84\x82\x7b\xe2\x43\xc1\x33\x71\
-\xa1\xe0\x9d\x20\x14\x65\xfa\xae\x25\x7e\x9a\x74\x6c\xe5\xfb\xa5\
-\x40\x2a\x15\x91\x4a\xab\xcc\x88\x32\x6c\xda\xd4\x5a\xe3\x9f\xf9\
-\x03\x17\x2c\x50\x51\x3d\x2f\xcb\x83\xdf\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1d\x48\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x2c\x00\x00\x01\x2c\x08\x06\x00\x00\x00\x79\x7d\x8e\x75\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x66\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x4d\x4d\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\
-\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\
-\x6d\x6d\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\
-\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x52\x65\x66\x23\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x4f\x72\x69\x67\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x37\x44\x41\
-\x32\x41\x34\x34\x38\x45\x36\x38\x30\x45\x45\x31\x31\x41\x36\x36\
-\x43\x38\x34\x34\x32\x39\x33\x33\x46\x39\x34\x46\x37\x22\x20\x78\
-\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\
-\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x41\x36\x44\x30\x41\x33\x41\
-\x30\x38\x34\x30\x32\x31\x31\x45\x45\x41\x44\x34\x46\x46\x35\x45\
-\x30\x32\x44\x36\x30\x39\x33\x37\x46\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x41\x36\x44\x30\x41\x33\x39\x46\x38\x34\x30\
-\x32\x31\x31\x45\x45\x41\x44\x34\x46\x46\x35\x45\x30\x32\x44\x36\
-\x30\x39\x33\x37\x46\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\
-\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\
-\x65\x72\x69\x76\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\
-\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x36\x39\x34\x30\x36\x41\x37\x36\x31\x31\x38\
-\x31\x45\x45\x31\x31\x39\x42\x41\x33\x44\x30\x45\x34\x30\x36\x36\
-\x37\x46\x30\x42\x44\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x37\x44\x41\x32\x41\x34\x34\x38\x45\x36\x38\x30\x45\x45\x31\
-\x31\x41\x36\x36\x43\x38\x34\x34\x32\x39\x33\x33\x46\x39\x34\x46\
-\x37\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x6a\x8c\x67\x76\x00\x00\x19\x78\x49\x44\x41\x54\x78\
-\xda\xec\x9d\x5b\x6c\x96\xd5\x9a\xc7\xdf\x7e\x3d\xd1\x02\x22\x60\
-\x81\x7e\x45\x8e\xe5\x2c\x9e\x28\x9e\x51\xe3\x96\xbb\x89\x24\x73\
-\xa3\x89\x13\x0f\x3b\x5e\x4c\x26\xca\x8d\x17\xdb\x1b\xa3\x26\x93\
-\x98\x3d\x97\xba\xb3\xb9\x31\x92\xed\x64\xe2\xdd\x24\x73\x21\x99\
-\x19\xbd\x18\xdc\xa2\x1c\x5a\x28\x20\x94\xa3\x40\x0b\x45\xa0\x50\
-\x4e\x2d\xd0\x16\x3a\xfd\x7f\x11\x53\x4a\x4b\xbf\xf6\x3b\xac\x67\
-\xad\xf5\xfb\x25\x0d\xa5\x1c\xfa\xf6\x7d\xd7\xfb\x5f\xcf\xf3\xac\
-\xe7\x50\x52\x5b\x5b\x9b\x0c\xa6\xbd\xbd\xbd\x6c\xe0\x97\x69\x9b\
-\x36\x6d\x5a\xf0\xf9\xe7\x9f\xff\xe1\xc4\x89\x13\x2f\x74\x75\x75\
-\xad\xe8\xeb\xeb\x7b\xa0\xbf\xbf\xbf\x22\x01\x00\xc8\x23\x25\x25\
-\x25\x3d\x65\x65\x65\x1d\x55\x55\x55\x07\x67\xcf\x9e\xfd\xc3\x7b\
-\xef\xbd\xf7\xdf\xeb\xd6\xad\x3b\x3a\xf0\x47\x17\x06\x3e\x7a\xef\
-\xf8\xbb\x83\x05\x6b\x40\xac\xa6\x35\x35\x35\xcd\x1b\xf8\x07\x7f\
-\x6c\x6d\x6d\x7d\xf3\xd6\xad\x5b\x93\xb8\x9d\x00\x50\x4c\x52\xa9\
-\xd4\xf5\x74\x3a\xfd\x1f\x1b\x36\x6c\xf8\xeb\xaa\x55\xab\x8e\xff\
-\x26\x5c\x77\x0a\xd6\x80\x58\xd5\x7c\xf2\xc9\x27\x4f\x6e\xdc\xb8\
-\xf1\xf3\x9e\x9e\x9e\x79\xdc\x36\x00\x70\x49\x45\x45\xc5\xf1\xb7\
-\xdf\x7e\xfb\xbd\x8f\x3e\xfa\x68\xdb\xc0\x6f\xcf\xe9\x6b\xa5\x93\
-\x27\x4f\x96\x58\x4d\xff\xf0\xc3\x0f\x9f\xfd\xf2\xcb\x2f\xff\x7d\
-\xc0\xf5\x9b\xc5\xad\x02\x00\xd7\xdc\xbc\x79\xf3\xfe\xe6\xe6\xe6\
-\x7f\xe8\xec\xec\x6c\x7c\xe9\xa5\x97\x3a\x06\xbe\x74\xad\x44\x71\
-\xa9\x6f\xbf\xfd\xf6\xd1\x77\xde\x79\xe7\x3f\x7b\x7b\x7b\xeb\xb8\
-\x4d\x00\x60\x89\xf2\xf2\xf2\x53\x5f\x7c\xf1\xc5\x3f\xae\x5d\xbb\
-\xb6\x59\x82\x35\xb3\xa1\xa1\xe1\xcf\x03\x56\xd6\x9b\xdc\x1a\x00\
-\xb0\x48\x3a\x9d\xfe\x5b\x63\x63\xe3\x9f\x4a\x6b\x6b\x6b\x9f\xf8\
-\xe6\x9b\x6f\xfe\x4d\xee\x21\xb7\x05\x00\x2c\x72\xf5\xea\xd5\x15\
-\xd5\xd5\xd5\xff\x5b\x3a\xf0\xc9\x3f\x77\x74\x74\x3c\xcf\x2d\x01\
-\x00\xc3\x94\xb6\xb5\xb5\x5d\x2e\xad\xa8\xa8\xf8\xd7\x9e\x9e\x9e\
-\xd9\xdc\x0f\x00\xb0\x4c\x5f\x5f\x5f\xaa\x64\xce\x9c\x39\x27\x09\
-\xb6\x03\x80\x79\x13\xab\xb4\xf4\x42\x49\x3a\x9d\xee\xe9\xef\xef\
-\x2f\xe7\x76\x00\x80\x71\x6e\x29\x71\xb4\x9f\xfb\x00\x00\x3e\x80\
-\x60\x01\x00\x82\x05\x00\x80\x60\x01\x00\x82\x05\x00\x80\x60\x01\
-\x00\x20\x58\x00\x80\x60\x01\x00\x20\x58\x00\x00\x08\x16\x00\x20\
-\x58\x00\x00\x08\x16\x00\x00\x82\x05\x00\x08\x16\x00\x00\x82\x05\
-\x00\x80\x60\x01\x00\x82\x05\x00\x80\x60\x01\x00\x20\x58\x00\x80\
-\x60\x01\x00\x20\x58\x00\x00\x08\x16\x00\x20\x58\x00\x00\x08\x16\
-\x00\x00\x82\x05\x00\x08\x16\x00\x00\x82\x05\x00\x80\x60\x01\x00\
-\x82\x05\x00\x80\x60\x01\x00\x82\x85\x60\x01\x00\x82\x05\x00\x80\
-\x60\x01\x00\x82\x05\x00\x80\x60\x01\x00\x20\x58\x00\x80\x60\x01\
-\x00\x20\x58\x00\x00\x08\x16\x00\x20\x58\x00\x00\x08\x16\x00\x00\
-\x82\x05\x00\x08\x16\x00\x00\x82\x05\x00\x80\x60\x01\x00\x82\x05\
-\x00\x80\x60\x01\x00\x20\x58\x00\x80\x60\x01\x00\x20\x58\x00\x00\
-\x08\x16\x00\x20\x58\x59\xf3\xd5\x57\x5f\x25\x2f\xbf\xfc\xb2\x17\
-\x37\xe5\xeb\xaf\xbf\x4e\xde\x7f\xff\xfd\x28\x17\xc4\xfa\xf5\xeb\
-\x93\x0f\x3e\xf8\xc0\x8b\x6b\x7d\xf5\xd5\x57\x93\xbf\xff\xfd\xef\
-\xc1\x3f\x93\x19\x33\x66\x24\xcd\xcd\xcd\x66\xaf\xef\xc2\x85\x0b\
-\xc9\xca\x95\x2b\x93\xfe\xfe\xc2\x4b\x49\xaa\x58\x3f\xd4\x0f\x3f\
-\xfc\xe0\xcd\x02\x79\xec\xb1\xc7\xa2\xdd\xc1\x9e\x7f\xfe\x79\x6f\
-\xae\xf5\x99\x67\x9e\x89\xe2\x99\x3c\xf2\xc8\x23\xa6\xaf\x4f\xef\
-\x76\x31\xc4\xaa\xa8\x82\xe5\xd3\x4e\xb8\x78\xf1\xe2\x64\xe2\xc4\
-\x89\xd1\x89\x55\x75\x75\x75\xb2\x7a\xf5\x6a\x6f\xae\xf7\xa9\xa7\
-\x9e\x8a\xe2\xb9\x3c\xfa\xe8\xa3\xa6\xaf\xaf\x98\xef\x76\xd1\x04\
-\xeb\xc0\x81\x03\xc9\xf9\xf3\xe7\xbd\x58\x20\xa9\x54\x2a\x79\xf8\
-\xe1\x87\xa3\x13\x2c\x59\x2c\xe5\xe5\xe5\x5e\x59\xc2\x95\x95\x95\
-\x08\x16\x82\x95\x7f\x64\x32\x6e\xd9\xb2\x05\xb7\xd0\x30\x2f\xbc\
-\xf0\x82\x57\xd7\x5b\x51\x51\x91\x3c\xfe\xf8\xe3\xb8\x84\x0e\x69\
-\x6d\x6d\xcd\x7c\x04\x27\x58\xe2\xfb\xef\xbf\x67\x57\x33\x8c\x4f\
-\xf1\xab\xdb\x3c\xf9\xe4\x93\x41\x3f\x93\x39\x73\xe6\x24\xd3\xa6\
-\x4d\x33\x7b\x7d\xc5\x8e\x4d\xa7\x42\xfe\xe1\xb0\xb0\xb2\x27\x9d\
-\x4e\x27\x8b\x16\x2d\xf2\xd2\x8d\xc5\xba\x72\x47\xb1\x8d\x90\xa2\
-\x0a\x56\xb1\xcd\xc7\x5c\xa8\xab\xab\x4b\x6a\x6a\x6a\xb0\xae\x8c\
-\xb3\x6a\xd5\xaa\xa4\xac\xac\x0c\xc1\x72\x80\x8b\x30\x4f\xaa\xd8\
-\x3f\xa4\x4f\x56\x56\x4c\x6e\xe1\x8b\x2f\xbe\xe8\xe5\x75\x57\x55\
-\x55\x99\xb7\x42\x42\x15\xac\x96\x96\x96\xa2\x1f\xa4\x15\x5d\xb0\
-\x7c\x4a\x6f\x88\x21\xa0\x9b\x59\x04\xa9\x54\xb2\x66\xcd\x1a\x6f\
-\xaf\xff\xe9\xa7\x9f\x0e\xf6\xb9\x58\xde\x34\x5d\xc4\xa4\xb1\xb0\
-\xb0\xb0\x92\x87\x1e\x7a\x28\x99\x3a\x75\xaa\xb7\xd7\xff\xc4\x13\
-\x4f\x04\xf9\x5c\x16\x2c\x58\x60\x3a\x1f\xd0\xc5\xbb\x5c\x74\xc1\
-\x92\x09\x29\x53\xd2\x17\xc1\x2a\x29\x29\xc1\x1d\x34\x8e\x4e\x0a\
-\x4b\x4b\x4b\x83\x7b\x2e\x96\x0f\x7e\x7a\x7b\x7b\x93\xad\x5b\xb7\
-\x86\x2f\x58\x3e\xb9\x85\x53\xa6\x4c\x49\xe6\xcf\x9f\x8f\x60\x19\
-\x67\xf2\xe4\xc9\xc9\xb2\x65\xcb\x82\x7b\x2e\x96\xe3\x57\x4d\x4d\
-\x4d\x49\x77\x77\x77\x1c\x82\x85\x5b\x68\x07\xb9\x1c\x3a\x69\xf3\
-\x9d\x10\xe3\x58\x96\xd7\x9e\xab\x77\xd8\x89\x60\xfd\xf4\xd3\x4f\
-\xc9\xcd\x9b\x37\xbd\x58\x34\xa1\x07\xde\x7d\x2b\xc7\x89\x45\xb0\
-\x94\xaa\xb1\x62\xc5\x0a\xb3\xd7\xe7\xca\x4b\x72\x22\x58\x5d\x5d\
-\x5d\xc9\xce\x9d\x3b\xd9\xe5\x0c\xe0\x5b\x39\xce\x48\x28\xf0\x1e\
-\x52\xbc\x51\x2e\xae\xd5\x3a\x49\xbd\xbf\xbb\x76\xed\x8a\x47\xb0\
-\x5c\x2a\xf4\x58\xd1\x09\x5a\x08\x16\x48\xe8\x82\xa5\xf2\x95\x25\
-\x4b\x96\x04\xf3\x5c\x2c\x17\xdf\xff\xf8\xe3\x8f\x49\x5f\x5f\x5f\
-\x5c\x82\xe5\x4b\x1c\x4b\x05\xb6\xcb\x97\x2f\x0f\x52\xac\x94\xcd\
-\xbf\x70\xe1\xc2\x60\x7e\x9e\x90\xd2\x1b\x2c\x9f\x10\xba\x7c\x77\
-\x9d\x09\x96\x4e\x19\xae\x5d\xbb\xc6\xe2\x71\x88\xaf\xe5\x38\x23\
-\x11\x52\x5d\xa1\xe5\x13\x42\x97\xde\x91\x33\xc1\x52\x1e\xc7\xb6\
-\x6d\xdb\xbc\x58\x3c\xa1\xc6\xb1\x7c\x4f\x67\x18\x4a\x28\x0d\xfd\
-\x26\x4c\x98\x90\x2c\x5d\xba\xd4\xe4\xb5\x9d\x3b\x77\x2e\x39\x78\
-\xf0\x60\x7c\x82\xe5\x5a\xa9\x63\xb7\xb0\x7c\x2f\xc7\x19\x0e\xf5\
-\x3e\x9f\x37\x6f\x9e\xf7\x3f\x87\x4e\x07\xad\x26\xc2\xea\x9d\x2d\
-\x56\x3b\x64\x04\x6b\x9c\xd4\xd7\xd7\x27\x93\x26\x4d\x0a\xea\xe5\
-\x56\x50\xf7\xfe\xfb\xef\x0f\x4e\x88\x43\x70\x0b\x2d\x5b\xf4\xae\
-\xdf\x59\xa7\x82\xb5\x7f\xff\xfe\xa4\xb3\xb3\xd3\xfc\x02\xd2\x71\
-\x79\x68\x6e\x61\x28\xa7\x83\x43\x09\xa1\xa1\x1f\x09\xa3\x46\x05\
-\xeb\xd6\xad\x5b\xde\xb4\x4d\x46\xb0\xfc\x20\x84\x04\x52\xab\x6b\
-\xed\xf8\xf1\xe3\xc9\xa9\x53\xa7\xe2\x15\x2c\x0b\x8a\x9d\x2d\x21\
-\xc5\xb1\x42\x29\xc7\x19\x8e\xd9\xb3\x67\x67\xd2\x35\x7c\x45\x75\
-\x91\xea\xd2\x60\x91\xcd\x9b\x37\x3b\xbf\x06\xe7\x82\xe5\x4b\x9f\
-\xf7\x90\x4a\x74\x42\x29\xc7\x19\x09\x9f\x4f\x0b\x95\xce\x60\x35\
-\x63\xdf\x82\x71\xe1\x5c\xb0\x2c\x98\x99\xd9\x30\x73\xe6\xcc\xcc\
-\x07\xee\xa0\x1f\x82\xec\x2b\x56\x33\xdc\xad\x4c\xbd\x4a\x59\xb8\
-\x19\xb8\x85\xc5\x25\xb4\xfc\xab\xa1\xf8\x9c\xf1\x6e\x35\x7e\xb5\
-\x77\xef\xde\xe4\xe2\xc5\x8b\x08\x96\xf0\x25\xbd\x21\x04\xb7\x50\
-\x31\x1e\xab\x31\x92\x7c\xa1\x72\x23\xe5\x64\x21\x58\xe1\x19\x15\
-\x58\x58\x01\x2c\x26\xdc\xc1\xbb\xf1\x31\x8e\x35\x7d\xfa\xf4\xcc\
-\x86\x62\x11\x0b\x01\x77\x33\x82\x75\xf6\xec\x59\xa7\xe9\xfe\xd9\
-\xa2\x80\xa8\x32\xc4\x11\x2c\xfb\xf8\x98\x8f\x65\x75\x43\xec\xe9\
-\xe9\x49\x76\xec\xd8\x81\x60\xf9\x66\x65\x59\x3e\x72\xce\x06\x95\
-\x7b\x84\x56\x8e\x33\x12\x3e\x06\xde\xad\x16\x3c\x4b\xac\xae\x5f\
-\xbf\x8e\x60\x0d\x86\xba\xc2\xc2\xa3\x13\x28\xf5\xa9\x8f\x81\xc5\
-\x8b\x17\x7b\x57\x7a\x44\xfc\xca\x23\xc1\xd2\x04\x0e\x1f\xda\x26\
-\xfb\x2c\x58\xa1\x9f\x0e\x0e\x46\xb9\x4c\xbe\xc5\xb1\xac\x5a\x58\
-\x96\x72\x25\xcd\x08\xd6\xe5\xcb\x97\x93\xdd\xbb\x77\x23\x58\x05\
-\x24\xb4\xfe\x57\xa3\xe1\x93\x60\xa5\xd3\xe9\xa4\xa6\xa6\xc6\xdc\
-\x75\xe9\xbd\xdc\xb3\x67\x0f\x82\xe5\xab\x5b\xa8\xee\xa3\xea\x42\
-\xea\x1b\xea\x36\x11\x6a\x39\x4e\x08\x82\x65\xd5\x1d\xb4\x36\x30\
-\xc6\x94\x60\xf9\x10\x78\x57\x49\x8b\xfa\xbc\xfb\x86\x82\xd0\x9a\
-\xc4\x12\x13\x7a\x4e\x3a\x28\x41\xb0\xc2\x70\x07\xcd\x09\x56\x63\
-\x63\xa3\x99\xd3\x08\x1f\x63\x0d\xf7\x22\x96\x74\x86\x3b\x16\x77\
-\x2a\x95\x34\x34\x34\x78\x71\xad\x56\xd7\x94\x35\xaf\xc7\x94\x60\
-\xdd\xb8\x71\xc3\x4c\xbe\xc7\xbd\xf0\xd1\xb5\x8a\x29\xe0\x3e\xd4\
-\xb2\xb4\x8e\x0e\x08\x2c\x0a\xd6\xaf\xbf\xfe\x9a\x1c\x39\x72\x04\
-\xc1\xf2\x49\xd1\x7d\x32\xdf\x47\x42\xd9\xd3\xf3\xe7\xcf\x8f\x52\
-\xb0\x7c\x88\x63\xa9\xad\xf3\x7d\xf7\xdd\x87\x75\x85\x60\x15\x06\
-\x25\x8f\x5a\x5c\x60\xb8\x83\x77\xa3\xdc\xb3\xaa\xaa\x2a\xd3\xd7\
-\x68\xf5\xe4\xd9\x62\x4c\xd9\x9c\x60\xfd\xfc\xf3\xcf\xc9\xa5\x4b\
-\x97\xb0\xb2\x10\xac\xbc\xa0\x43\x12\xeb\x2e\xbc\xd5\x96\x32\x16\
-\x7b\xd5\x99\x13\x2c\x1d\xa1\x6a\xb2\xac\x75\x7c\xc9\xc7\x8a\xa9\
-\x1c\x67\x24\xac\xd7\x15\x5a\xec\x02\x72\xf8\xf0\xe1\xe4\xcc\x99\
-\x33\x08\x96\xaf\xa6\xa8\xaf\x82\x25\x4b\xd0\x55\x39\xce\x77\xdf\
-\x7d\x67\xe2\x1e\x58\x0e\xbc\x6b\x43\xd1\x58\x2f\xde\x41\x8f\x05\
-\xcb\x87\xb6\xc9\xbe\x08\x96\x4b\x77\x70\xd3\xa6\x4d\x66\x2c\x18\
-\xab\x2d\xa1\x55\xf3\x68\x31\xc6\x66\x35\x96\x6c\x52\xb0\x8e\x1e\
-\x3d\x9a\x39\x52\xb5\x8c\xca\x28\x54\x4e\x61\x1d\x97\xe5\x38\x07\
-\x0e\x1c\x30\x71\x0f\x2a\x2b\x2b\xcd\x6e\x30\x16\x63\xa1\x9a\x66\
-\x65\x35\x2c\x63\xb6\xb9\x93\x0f\xa7\x85\xd6\x3b\x90\x2a\xcb\xdb\
-\x55\xc0\xb9\xa3\xa3\x23\x33\xd6\xdc\x0a\x56\xc7\x7f\x59\x14\xac\
-\xe6\xe6\xe6\x4c\x0d\x21\x82\x15\x80\x0f\x6d\x7d\xb1\x0d\x46\xb1\
-\x1b\x57\x23\xcf\x65\x21\x5b\x3a\xed\xb5\x1a\x78\xb7\x78\x42\x68\
-\xd9\x58\xc0\xc2\xca\x01\xeb\x71\x2c\x97\xf1\xab\xd3\xa7\x4f\x27\
-\x57\xaf\x5e\x4d\xfa\xfa\xfa\x4c\xdc\x0b\x0d\xa6\xb0\x56\x4b\xa9\
-\x22\x7a\x02\xee\x81\x08\x96\xc5\xb2\x80\xe1\x76\x47\x57\x16\x4c\
-\x36\xb8\x2c\xc7\x39\x79\xf2\x64\xe6\x57\x2b\x47\xe3\xd5\xd5\xd5\
-\xe6\x8a\xd6\x25\x56\xd6\x44\x54\xb5\xbc\xaa\xe9\x45\xb0\x02\xb4\
-\xb2\x34\x41\xb9\xbe\xbe\xde\xe4\xb5\xcd\x99\x33\x27\x53\xf2\xe1\
-\x0a\xcd\x9b\x14\x96\x66\x4e\x5a\x8b\x63\x59\x0c\x29\x6c\xdf\xbe\
-\x3d\x53\xd3\x8b\x60\x05\x66\x9a\x5a\x77\x0b\x5d\x37\xeb\xb3\x28\
-\x58\xd6\xea\x0a\x2d\xc6\xaf\xac\xa7\x14\x99\x16\x2c\x1d\xad\xea\
-\x88\x15\xc1\xf2\xcb\x1d\x14\xc7\x8e\x1d\xcb\xfc\xda\xde\xde\x6e\
-\xe6\x9e\x28\x8e\x65\x69\xea\x91\xc5\xb5\x63\xdd\x48\x30\x2d\x58\
-\x3a\x65\xd2\xc4\x59\xcb\x58\x34\xeb\x15\x57\x7b\xee\xb9\xe7\x9c\
-\x7d\x7f\x6d\x32\x27\x4e\x9c\xc8\x7c\x7e\x3b\x96\x65\x01\x65\xfc\
-\x2f\x5b\xb6\x8c\x70\xc2\x08\x68\xb2\xb3\x6a\x79\x11\xac\x1c\xb0\
-\x1e\xc7\x52\xcb\xe4\x09\x13\x26\x98\x13\x51\x97\xdd\x24\xda\xda\
-\xda\x92\xde\xde\xde\xcc\xe7\x4a\x02\xb6\x84\x95\x31\xf6\x2b\x57\
-\xae\x34\x37\xe3\x72\xcb\x96\x2d\xe6\x3d\x1a\x04\x2b\x0f\xd6\x8c\
-\xb5\xd3\x27\xd7\xdd\x19\x5a\x5a\x5a\x86\xfd\xdc\x02\x56\xea\x0a\
-\x2d\xba\x83\x3e\xa4\x12\x99\x17\x2c\x75\x20\xd5\xe4\x59\xcb\x58\
-\x5b\x7c\xae\x03\xee\xfb\xf6\xed\xfb\xfd\xf3\xf3\xe7\xcf\x27\x17\
-\x2e\x5c\x30\x73\x6f\xac\x04\xde\x2d\x76\x18\xf5\xa1\x86\xd7\xbc\
-\x60\x29\x2f\xc4\x7a\xdb\x64\x4b\x82\xe5\xb2\x1c\x67\x38\xc1\x12\
-\x07\x0f\x1e\x34\x73\x7f\xa6\x4f\x9f\x6e\x22\x76\x64\xed\x84\x50\
-\xa7\xb9\xb7\x4f\x76\x11\xac\x1c\xb1\x7e\x72\x61\x29\xf0\xfe\xec\
-\xb3\xcf\x3a\x4f\x66\xdd\xbf\x7f\xff\x3d\x7f\x1f\xbb\x5b\xa8\x89\
-\xd4\x2e\x73\xe4\x7c\x75\x07\xbd\x11\x2c\xeb\x37\x53\x8b\x6f\xea\
-\xd4\xa9\x26\xae\xc5\x75\xfc\x4a\xee\x5f\x6b\x6b\xeb\x1d\x5f\x6b\
-\x6a\x6a\x32\xf5\xbc\x5c\xd7\x15\x5a\x3c\x59\x46\xb0\xf2\x88\x26\
-\x42\x5f\xb9\x72\x05\x2b\x2b\x0b\x5c\xe7\x5f\x6d\xdb\xb6\xed\xae\
-\xaf\x59\x73\xe9\x5d\x67\xbc\x5b\x8c\x5f\xf9\x90\xa4\xed\x8d\x60\
-\xa9\x6d\xb2\x26\xd0\x5a\xc6\x42\x1c\x6b\xee\xdc\xb9\x99\x0f\x97\
-\xa8\xb4\x63\x28\x8a\x8f\xa8\x18\xda\x0a\xb3\x66\xcd\x72\x7a\x9f\
-\xac\x59\x58\xea\x5b\x66\xa9\x15\x90\xf7\x82\xe5\x83\xc9\x6a\x41\
-\xb0\x2c\x0c\x9b\x18\xce\xc2\xb2\x68\x65\xb9\x3c\x2d\xb4\x26\x58\
-\xbe\xb8\x83\x5e\x09\x16\x81\x77\xfb\x82\x25\xb7\x7d\xa4\x4c\xe9\
-\x91\x84\x2c\x36\xb7\x70\xe6\xcc\x99\x99\x0f\xde\xad\xc0\x05\x4b\
-\x47\xe3\x67\xcf\x9e\x35\x7b\x7d\x3a\x2e\x57\x87\x04\x57\xe8\x64\
-\x50\x27\x84\x2e\xd9\xba\x75\xeb\x88\xfd\xaf\xac\xed\xe2\xae\x32\
-\xde\xad\xc5\xaf\x7c\x99\x52\xe5\x9d\x60\x61\x65\x8d\xee\x92\xba\
-\x1e\xee\x7a\xaf\xc4\x43\xf5\x36\xb3\x34\x36\x4a\x27\xbb\xb5\xb5\
-\xb5\x45\xff\xbe\xd6\xda\x6a\xef\xdc\xb9\x33\xe9\xea\xea\x42\xb0\
-\x62\xf4\xb5\x5d\x0a\x96\x85\xf8\xd5\x68\xcf\x47\xb5\x6a\x96\x70\
-\x91\xde\x60\x2d\x61\xd4\xa7\xf8\x15\x16\x56\x40\xbb\xa7\x6b\xc1\
-\x92\xf5\x74\xe8\xd0\x21\xaf\x5e\x0e\x17\x71\x2c\x02\xee\x11\x09\
-\x96\xf5\xf2\x01\x55\xe0\xbb\x68\x79\x2b\x57\xd0\xf5\x29\x65\x36\
-\x0b\xdf\x5a\xac\xa4\xd8\x19\xef\x4a\xa5\x50\x96\xbb\x15\xba\xbb\
-\xbb\x33\x2e\x21\x82\x55\x40\x2c\x17\x68\x6a\x20\xa6\x06\x63\x16\
-\x1b\x0b\xe5\x38\xd9\x58\xbf\x6a\x3b\x73\xbb\x4f\x96\x05\x16\x2e\
-\x5c\x98\x39\x2c\x89\xd5\xba\xd2\x21\xc9\xed\x36\x40\x08\x56\xa4\
-\x6e\xa1\x0b\x4b\xc7\x75\x77\x86\xb1\x6c\x24\xd6\xac\xac\x62\xba\
-\x85\xc4\xaf\x22\x14\x2c\x05\x6e\xfb\xfb\xfb\x11\xac\x41\xb8\x2e\
-\xc7\x39\x7c\xf8\x70\xd6\x93\xba\xad\xbd\x24\xc5\x4c\x20\xb5\x76\
-\x42\x88\x60\x15\x81\xce\xce\xce\xbb\xda\x97\xc4\x2c\x58\x16\xca\
-\x71\xc6\x62\xf5\x5a\xb3\xb0\x8a\x25\x58\xea\x2e\x6a\xa9\xd1\xa3\
-\x8a\xd4\xad\x35\x57\x0c\x52\xb0\xac\xef\x0c\x8a\x61\x69\x06\x5e\
-\xb1\xb0\x90\xce\x30\x96\xb8\xa2\x92\x7f\x2d\xf5\xc7\x52\x8f\x77\
-\xf5\x7a\x2f\x34\x8b\x16\x2d\xca\xf4\x71\xb7\x82\x36\x19\xcb\x9e\
-\x0a\x82\x55\x24\x14\xfc\xd6\x69\x61\x2c\xee\xa0\x7a\x80\x8f\xb5\
-\x30\xdd\x92\x95\x55\x52\x52\x52\x94\xac\x77\x6b\x19\xee\x3e\x74\
-\x17\x0d\x46\xb0\x54\x97\x66\xf9\x74\xa3\x58\xb1\x0a\xa5\x50\xb8\
-\x2e\xc7\xd9\xb5\x6b\x57\x72\xf9\xf2\x65\xaf\x37\x9c\x62\x04\xde\
-\xc9\xbf\x8a\x58\xb0\xae\x5d\xbb\x66\xae\x29\x9c\x8b\xdd\x54\xf1\
-\x32\xb5\x44\x76\xed\x5a\x8c\x15\x1d\xa7\x5b\x9a\xce\x52\x8c\x8c\
-\x77\x4b\x27\x84\x4a\x2d\x51\x8a\x09\x82\x65\xfc\x45\x29\x16\xc5\
-\x0a\xbc\xfb\x50\x8e\x33\x1c\xd6\xe6\xdf\x49\x4c\x0a\x19\x5f\x2a\
-\x2f\x2f\x2f\x6a\x98\xc0\xe7\x77\x27\x58\xc1\xb2\x6c\xd2\x3e\xf8\
-\xe0\x83\x45\x49\x48\x74\x2d\x58\xb9\x0c\x08\xb1\x54\x57\xa8\xb8\
-\xe3\xea\xd5\xab\x0b\xf6\xff\x2b\xb0\x2f\xd1\xe2\xdd\x89\x58\xb0\
-\x14\x3b\xb1\x5c\x65\x5e\x68\x2b\xcb\x42\x39\x4e\x2e\x99\xd2\xd6\
-\x76\xf9\x42\xba\x85\x96\xe2\x57\x3a\x19\xc4\xc2\x72\x80\xfa\x2e\
-\x59\x6e\x9b\x5c\x68\x31\xd1\x28\x7a\xd7\x93\x83\x73\xd9\xa9\xad\
-\x1d\x9c\x14\xb2\xae\xd0\xd2\x09\xa1\x26\x18\x59\x9a\x13\x19\x8d\
-\x60\x59\xf7\xc5\x0b\x2d\x58\xbe\xe5\x5f\x0d\x45\x85\xb7\xcd\xcd\
-\xcd\x66\x9e\x97\xac\xa0\xca\xca\xca\xe0\x2d\x2c\x9f\xdd\x41\xef\
-\x05\xcb\xf2\xcd\x2f\xf4\x22\xb5\x30\xce\x2b\xd7\x4c\x69\x4b\xcf\
-\x4f\x31\xa6\x42\x0c\xa0\x75\x55\x10\x8f\x60\x19\x44\xd3\x3e\x34\
-\x0a\xdd\x22\x85\x1c\x96\xa9\xff\xd7\x65\x3b\xe6\xdb\xd6\x6d\xae\
-\xa9\x09\x31\x14\x42\xab\x1c\xc7\x75\x27\x8d\xdb\xc8\x05\x57\xdc\
-\x11\xc1\x72\x84\xf5\x00\x62\xa1\xdc\x42\xd7\xd9\xed\xf9\xda\xa9\
-\x1b\x1b\x1b\x33\x27\x8d\x56\x28\x44\xe0\xdd\x92\x3b\xa8\xfb\xad\
-\x1c\x46\x04\x0b\x13\xb7\xa8\x82\x65\xa1\x9d\x4c\x3e\xee\x7b\x4f\
-\x4f\x4f\xe6\x25\xb2\x42\x43\x43\x43\xde\xd3\x0f\x2c\x09\x96\xcf\
-\xa7\x83\xc1\x08\x56\x6c\x16\x96\x85\x72\x1c\x65\x4a\x0f\x1d\x47\
-\x1f\xc2\x86\x33\x61\xc2\x84\xbc\x67\xa4\x5b\x3a\x21\xf4\x3d\x7e\
-\x15\x84\x60\xe9\xc5\xc9\xd7\xcb\x93\x6f\x14\xbf\xc8\x77\xcb\x64\
-\x5f\xcb\x71\x46\xc2\xda\x60\x8a\x7c\xc6\xb1\x94\x2b\xb7\x60\xc1\
-\x02\x13\x3f\xd7\xd5\xab\x57\x4d\x9d\xca\x46\x2b\x58\x96\xad\x2c\
-\x1d\x93\x2b\xcb\x39\x9f\xf8\x9e\xce\x30\x94\xdd\xbb\x77\x67\x06\
-\xb0\x86\x28\x58\x96\xac\x2b\xe5\x2c\x8e\x34\x33\x12\xc1\xf2\xf8\
-\x05\xb2\xee\x16\xba\x16\x2c\x1d\x74\xe4\xd3\x2a\xd2\x20\x4f\x4b\
-\x27\x57\x8a\x63\xe5\xeb\x54\x0f\x77\x10\xc1\xf2\xc2\xad\x28\x94\
-\x60\xa9\xd1\x9c\xeb\x72\x1c\x75\x7b\xcd\x77\xa6\xb4\x25\x0b\x59\
-\xee\x76\xbe\x3a\x83\x12\x70\x47\xb0\x86\x45\xb9\x58\x2a\x39\x08\
-\x5d\xb0\x7c\x2f\xc7\xf1\x65\xc3\xc9\x57\x43\x3f\x2b\x82\xa5\x2e\
-\xaf\xca\x59\x44\xb0\x0c\x61\x75\x07\xa9\xaf\xaf\x4f\x26\x4d\x9a\
-\x94\x97\xff\xcb\x42\xfe\x55\x21\xdc\x6f\x65\xcc\x5b\xaa\x6f\xcb\
-\x47\x5d\x61\x4d\x4d\x4d\x92\x4e\xa7\x79\x37\x10\x2c\xbf\x1e\x8a\
-\x2c\xa2\x7c\x1d\x95\xbb\xce\xbf\x52\xde\xd4\xf6\xed\xdb\xf3\xfe\
-\xff\x2a\x2e\x66\x29\xeb\x5d\x09\xa4\x6a\x9d\x9c\x0b\xc4\xaf\x10\
-\xac\x7b\x62\xf9\x14\x24\x1f\x6e\xe1\xfc\xf9\xf3\x33\x7d\xb6\x5c\
-\x52\xc8\x4c\x69\x4b\x1b\x8e\xca\xaa\x96\x2c\x59\x12\x84\x3b\x88\
-\x60\x19\x45\xbd\xb1\xd4\x23\xcb\x22\xf9\x58\xbc\xa1\x94\xe3\xf8\
-\xf2\x52\xe5\x9a\xde\x60\xc5\xc2\x3a\x76\xec\x58\xd2\xde\xde\x8e\
-\x60\x59\xc4\x6a\x7a\x43\x3e\x86\x52\xf8\xda\x0e\x79\x2c\x2f\x56\
-\xb6\xc3\x58\x8b\xe5\x16\xba\xb6\xaa\xf3\xc1\xe6\xcd\x9b\x43\x7a\
-\xc5\xc3\x12\x2c\xab\xe9\x0d\xb5\xb5\xb5\xc9\x8c\x19\x33\xc6\xfd\
-\xef\x95\x2d\x5f\xc8\x06\x73\xd9\xa0\xc9\x38\x4a\xf2\x8c\xc5\x75\
-\xc9\xc5\xc2\xaa\xab\xab\x4b\xa6\x4d\x9b\x66\xe2\xe7\x08\x29\xe0\
-\x1e\x9c\x60\x69\x92\x8e\xd5\x6a\xf4\x5c\xdc\x42\xf5\x69\xca\xd7\
-\x49\xe3\x78\x51\x50\x5c\x49\x9e\x85\xfe\x1e\x56\xd0\x29\xdf\x78\
-\xcb\x6a\xac\x8c\xa4\x57\xfb\x1f\x6b\x2d\x7c\x10\xac\x41\x58\xee\
-\xf7\x93\xcb\x22\x0e\xa5\x3b\x83\x4f\x16\x96\x18\xef\x18\x7b\x2b\
-\x23\xbd\x34\x99\x48\x13\x8a\x10\x2c\xc3\x58\x35\x81\x73\x89\x69\
-\x84\x56\x3f\x38\x12\x0a\x0e\x1f\x3f\x7e\xdc\xcc\x33\x1b\xaf\x1b\
-\x6e\xe5\x84\xd0\xd7\xe9\xce\x51\x09\x96\xd5\x87\xa4\x53\xa3\xf1\
-\xe4\xf6\xa8\x1c\xc7\xf5\x0b\xa0\x60\xf8\xd1\xa3\x47\xa3\xdb\x70\
-\xc6\x93\xf1\xae\x67\x6c\xc5\xc2\x0a\x29\x9d\x21\x58\xc1\x52\xd6\
-\x74\x67\x67\xa7\xb9\xeb\x1a\x6f\xab\x11\x0b\xe5\x38\xc5\xdc\x04\
-\x2c\x09\xd6\xec\xd9\xb3\xc7\x9c\xfb\xb6\x70\xe1\x42\xe7\xed\x7f\
-\x44\xa1\x92\x7c\x11\xac\x3c\xa3\x40\xa3\xd5\xd3\xc2\xf1\x58\x4a\
-\xa1\xe7\x5f\x0d\xc5\xda\xb3\x1b\x6b\x7a\x83\x15\xeb\x4a\x62\x75\
-\xe3\xc6\x0d\x04\xcb\x07\xac\x9a\xc2\xe3\x09\xbc\x5b\x08\xb8\x17\
-\xd3\xea\x51\x21\xbb\xa5\x42\xdd\xb1\xa6\x37\x58\x39\x21\x0c\x2d\
-\x9d\x01\xc1\xf2\xc0\xc2\x92\x0b\xe9\xba\x1c\xe7\xe0\xc1\x83\xc9\
-\x99\x33\x67\xa2\x7d\xd9\xc6\x2a\x58\x56\x32\xdc\x43\x0c\xb8\x07\
-\x2b\x58\x3a\x69\x3a\x79\xf2\xa4\xb9\xeb\x52\x9f\xa5\xb1\x0c\x39\
-\x88\xcd\x1d\xb4\xe8\x16\x6a\xa4\x5a\xb6\x49\xbf\x4a\xf0\xcd\x57\
-\x2f\xad\x5c\x50\x92\xef\xde\xbd\x7b\x11\x2c\x9f\xb0\x18\xc7\x92\
-\x58\xad\x58\xb1\x22\xeb\xbf\x1f\x7a\x39\xce\x48\xa8\x90\x3d\xd7\
-\x99\x87\x2e\xac\x2c\x0d\x4c\x2d\xd4\xf4\xe8\xb1\x50\x8c\x24\x5f\
-\x04\x2b\x12\xb7\x30\xdb\x7c\x2c\x89\x9b\xeb\x72\x1c\x2d\x7a\x89\
-\x47\xec\x16\x42\xb6\x09\xa4\x56\xea\x07\x43\x4c\x67\x08\x5e\xb0\
-\xac\x06\x1d\xb3\x8d\x63\xa9\x1c\x67\xe2\xc4\x89\x4e\xaf\x55\xdd\
-\x2f\x34\x6d\x25\xf6\xe7\x97\xad\x60\x11\xbf\x42\xb0\xc6\x8d\xda\
-\xc2\x2a\x60\x6c\x8d\x6c\x4f\x91\x2c\x9c\x0e\xba\x5c\xf8\x96\xac\
-\x04\xf5\xc6\xca\xa6\x98\xd9\x42\x86\x7b\x31\x93\x7c\x11\xac\x08\
-\x4c\x63\x9d\xfc\x29\x89\x74\x34\x2c\x04\xdc\x5d\x5a\x39\x3b\x76\
-\xec\xc8\xd4\x86\x5a\x61\xb4\xac\x77\xc5\xae\x96\x2e\x5d\x8a\x75\
-\x85\x60\x85\xe5\x16\xaa\x74\x63\x34\xd7\x41\x1d\x2f\x5d\x27\x20\
-\x76\x77\x77\x67\xba\x5f\xb8\x42\x5d\x37\x5c\x7e\xff\xa1\x8c\x16\
-\x4f\x2c\xc4\xd0\xdc\x50\xd6\x3c\x82\x95\x25\xea\xdc\x60\xf1\xb4\
-\x64\x34\xd7\x61\xcd\x9a\x35\xce\xcb\x71\x14\x6c\x77\x6d\xe1\x58\
-\x3a\xe9\x1d\x2d\xe3\x9d\xfa\x41\x04\x2b\x67\x74\xda\x64\x71\x3c\
-\xf7\x68\x71\x2c\x0b\xe9\x0c\x16\x76\x6a\x4b\xd6\x82\xd2\x51\xee\
-\xe5\xca\x5b\x38\x21\x3c\x74\xe8\x50\xd1\x93\x7c\x11\xac\x08\x4c\
-\xe4\xd1\x2c\xac\x58\xda\xc9\x8c\xc6\xce\x9d\x3b\x93\xeb\xd7\xaf\
-\xdb\x78\x51\x06\x2c\xde\xd5\xab\x57\x8f\xfb\x99\xe2\x0e\x22\x58\
-\xde\x9a\xc8\x33\x67\xce\x4c\x66\xcd\x9a\x35\xec\x9f\x29\x28\xaf\
-\x16\xbb\x2e\xb1\x52\xcf\x27\x97\x74\xdb\xb6\x6d\x66\x9e\xdb\x48\
-\xe9\x0d\xea\x06\xab\x2e\x0d\xac\x75\x04\x2b\x67\x14\xb8\xb5\xb2\
-\x4b\x67\xb3\x23\xab\x9d\x8c\x85\x85\xaf\x59\x81\x58\xc8\x77\x32\
-\x52\xc6\xbb\x02\xee\xb9\xce\x31\xcc\x15\x57\x49\xbe\x08\x56\x9e\
-\x51\x8b\x0d\x1d\x91\x5b\x63\xa4\x12\x1d\xd7\xd9\xed\xd6\x76\x6a\
-\x4b\x82\xa5\xc0\xfa\x70\xa5\x37\x16\x02\xee\x8a\xd5\x2a\x66\x8b\
-\x60\x05\x80\xc5\xdc\x94\x65\xcb\x96\x8d\x69\x17\x8f\x55\xb0\xd4\
-\x97\xdc\xca\x8b\x38\x52\x71\xb3\x85\x82\xe7\x18\xe2\x57\xd1\x08\
-\x96\xc5\x87\xb9\x7c\xf9\xf2\xbb\xbe\x56\x5f\x5f\x9f\x99\xd6\xe2\
-\x12\x6b\x9d\x2e\xac\xb9\x3a\xc3\x9d\xf0\x8e\xa5\xa0\x3d\x86\x4d\
-\x06\xc1\xca\x11\x15\xd2\x5e\xba\x74\xc9\xd4\x35\xcd\x9d\x3b\xf7\
-\x2e\xf7\xc2\x82\x3b\x68\xd1\x1a\xb5\x94\x8f\x35\x54\xb0\xf4\x0c\
-\xd5\xa5\xc1\x25\x8a\xd1\x36\x36\x36\x22\x58\xa1\x60\x71\x3e\x9b\
-\x82\xb4\x12\xad\xc1\xe4\x3a\x6d\x38\xd4\x9d\xda\x92\x85\x3c\xd4\
-\x95\x97\x58\x95\x96\x96\x3a\xbd\x26\x9d\xa4\xaa\x87\x3b\x82\x85\
-\x5b\x58\x70\x2b\xcb\x92\x6b\xa1\x93\x41\x8b\x7d\xc4\x54\xc4\xae\
-\x54\x0b\x0b\x28\xed\x64\x70\x13\x46\xb9\xf1\x6c\x32\x08\x56\x14\
-\xae\xce\x60\xc1\xaa\xae\xae\x76\xbe\xf8\xe5\x3a\x5b\x1c\xbc\x69\
-\x49\x48\x15\x78\x1f\x3c\xfd\x88\xfc\x2b\x04\xab\x20\xa8\xe5\x86\
-\x5a\x6f\x58\x15\x2c\x59\x57\x31\x8d\xf3\xf2\xf9\xa5\x1c\x1c\xb3\
-\x72\x2d\x58\x1a\x69\xb7\x6f\xdf\x3e\x04\x0b\x2b\xab\xf0\xa4\xd3\
-\xe9\xdf\x3f\xb7\x90\xcb\x63\x79\xa7\xb6\xe4\xaa\x0e\xb6\x84\x5d\
-\x5b\xc5\xba\x2f\x96\xda\x49\x23\x58\x81\x2e\x7a\xa1\x12\x9d\xdb\
-\xac\x5c\xb9\xd2\xe9\xb5\x58\x1f\xbc\xa9\x74\x8b\x53\xa7\x4e\x99\
-\xb3\x8c\x87\xc6\x21\xd9\x64\x10\xac\x60\x1f\xee\xe0\x7a\xc2\xf1\
-\x4c\x85\xce\x27\x3e\x0c\xde\xb4\xb2\xe1\xdc\x16\x29\x75\x6f\x50\
-\x1d\x21\x6b\x1a\xc1\x2a\x08\x8a\x61\x1d\x39\x72\xc4\xcc\xf5\x0c\
-\x4e\x12\x75\x2d\x58\x3e\x2c\x7c\x2b\x27\xbd\xb7\x05\xab\xb6\xb6\
-\xd6\xe9\x75\x28\xc1\x57\x96\x27\x82\x85\x95\x55\x14\x74\x3c\xae\
-\x5e\xe1\xda\xa9\xb3\xe9\x19\x5e\x48\x7c\x68\xad\x6b\xc5\xc2\x92\
-\x65\x5c\x51\x51\x71\x47\x0c\x92\x4d\x06\xc1\x8a\xe2\x21\xcb\xca\
-\xd2\xb0\x4e\x97\xa8\x0a\x40\x35\x7b\xd6\x39\x7d\xfa\x74\xf2\xcb\
-\x2f\xbf\x98\xb8\x96\x39\x73\xe6\x20\x58\x08\x56\xe1\x51\xc6\xbb\
-\xa5\x53\x15\xf5\x6f\x77\x2d\x58\xb2\x5c\x7c\x19\xbc\x69\xc5\x2d\
-\x94\x58\x65\x3b\x11\x3a\xf4\x7b\x81\x60\x15\x10\x6b\x43\x3a\x25\
-\x58\xd3\xa7\x4f\x67\xa7\xf6\xec\x25\x95\x5b\x38\x75\xea\x54\x67\
-\xdf\xbf\xa5\xa5\x25\xe9\xe8\xe8\x40\xb0\x70\x0b\x8b\x8b\x16\xfd\
-\x03\x0f\x3c\xe0\xf4\x1a\x7c\x1a\x0d\xa5\xce\x0d\x16\x9a\x0b\x2a\
-\xe0\xee\x52\xb0\x62\x74\x07\x11\x2c\x23\x82\xe5\x32\xe0\xae\xdc\
-\xa6\x63\xc7\x8e\x79\xf3\xec\x54\x53\x28\xeb\xc2\x82\x4b\x38\x65\
-\xca\x14\xdc\x41\x04\xab\xf0\x28\xe7\xc8\x4a\x75\xbb\x5c\x42\x97\
-\x82\xe5\xe3\xc2\xb7\x70\x5a\x28\xc1\x72\x65\x61\xf5\xf5\xf5\x45\
-\xd1\x0e\x19\xc1\xfa\x0d\x25\x48\x5a\xc9\xea\x7e\xe5\x95\x57\x9c\
-\xf6\xc1\xf2\x71\x52\xb0\x05\x91\xd5\x64\x6e\x57\xa3\xbd\x76\xed\
-\xda\x95\x74\x75\x75\x21\x58\x31\x61\x29\x6b\xda\x65\xd0\xdd\x47\
-\x0b\x4b\xfd\x9f\x5c\x9f\x6a\xaa\x07\x96\xab\x62\xf5\xd0\xc7\xd1\
-\x23\x58\xc3\x10\x6b\xd0\x72\x30\x8a\x05\x9d\x3b\x77\xce\xbb\xeb\
-\xd6\x49\xef\xee\xdd\xbb\x13\xd6\x2e\x82\x15\x0d\x5a\xf0\x57\xae\
-\x5c\x89\x5a\xb0\x7c\x5e\xf8\xb1\x06\x9d\xbb\xbb\xbb\x33\x2e\x21\
-\x82\x15\x19\x72\x29\xac\xb5\x4d\xe6\xa5\xf7\xcf\xa5\x2f\x36\x0a\
-\xb6\x6b\xc0\x2c\x82\x85\x85\x11\x15\x5a\xf4\x3e\x9f\x34\x69\xd6\
-\x64\x2c\x7d\xcc\x59\xb3\x08\x56\xd4\xbb\xb4\xf0\xfd\xa4\x49\x93\
-\x62\x34\xd5\x1b\xc1\x42\xb0\xa2\x41\xc3\x0d\xce\x9e\x3d\x8b\x75\
-\x89\x4b\xeb\x05\x4a\x9a\x3d\x70\xe0\x00\x82\x15\x33\xb1\x06\x6f\
-\x43\x38\x1a\x8f\xcd\x42\xd6\x5a\xb5\x50\x96\x84\x60\x61\x69\x14\
-\x15\xb9\x82\x21\x9c\x34\xe9\x67\xd0\xa9\x19\x9b\x0c\x82\x85\x60\
-\x05\x8c\x4e\x47\x55\xde\xe1\x3b\x3a\x38\x50\x12\x29\xde\x00\x82\
-\x15\x0d\xed\xed\xed\xd1\xb5\x99\x0d\x69\xe1\xc7\xf2\x12\x6b\x8d\
-\xb6\xb5\xb5\x21\x58\x09\x44\x67\x6a\x87\x64\x55\xc6\x12\xc7\xc2\
-\xba\x42\xb0\xa2\x5c\x0c\x2a\xc5\x09\xe9\xa4\x49\xad\x9d\xd5\xe2\
-\x99\x4d\x06\xc1\x8a\x4a\xb0\x62\x39\x7d\x09\x6d\xe1\xab\xdd\x75\
-\xe8\xad\x56\xb4\x36\xb1\xb0\x10\xac\xdf\xb9\x78\xf1\xa2\x17\x43\
-\x18\x10\xac\x38\xad\x0f\x8d\xa2\xd7\x48\x7a\x40\xb0\xa2\x73\x0b\
-\x43\x8c\xd7\x85\x5e\x13\x8a\x3b\x88\x60\x45\xb9\x28\x34\x22\x4b\
-\xa3\xb2\x42\x43\x15\x0b\x3e\xb6\xc9\x61\x6d\x22\x58\xe3\x46\xf9\
-\x3c\xa1\x57\xc1\x6f\xde\xbc\x19\x0b\xd9\x33\x62\xcb\x35\x43\xb0\
-\xb2\xe4\xda\xb5\x6b\x49\x63\x63\x23\x6e\xaf\xa7\x84\x9a\xde\xa0\
-\x35\xa9\xb5\x09\x08\x56\x54\x2f\xb4\x4e\xd3\x42\xce\x59\x0a\xf5\
-\xd9\xe1\x0e\x22\x58\x51\x0a\xd6\x9e\x3d\x7b\x32\xad\x85\x43\xa5\
-\xb5\xb5\x35\x39\x79\xf2\x24\x82\x85\x60\xc5\x43\xc8\xd3\x48\x62\
-\xc8\xe6\x0f\x6d\xc3\x51\x0b\xef\xe6\xe6\x66\x5e\x4c\x04\x6b\x78\
-\x42\x9e\xf7\x16\xc3\x4e\x1d\x9a\xcb\xab\xb5\xe8\x7a\x3a\x10\x82\
-\xc5\x8b\x5d\x74\xd4\x9d\x33\xf4\x03\x85\x10\x2d\x2c\xdc\x41\x04\
-\x2b\xba\x45\x2f\x34\x34\x56\xc3\x63\x43\xe7\xcc\x99\x33\xc9\x91\
-\x23\x47\x58\x8b\x08\x56\x3c\xa8\x30\x58\xad\x68\x43\x22\xa6\x6e\
-\x14\xa1\x58\x25\x12\x5f\x25\xc4\x02\x82\x75\x4f\x42\x2c\x34\x8d\
-\xc9\xb5\x08\xa5\x4c\x07\xeb\x0a\xc1\x8a\xf2\x05\x57\x61\xb7\x8a\
-\x67\x63\x41\x81\xf7\x10\x3a\x6f\x20\x58\x08\x56\x94\x82\xa5\x85\
-\xaf\xa4\xd1\x58\x90\x40\xef\xdf\xbf\x1f\x37\x1e\xc1\x8a\x07\xb5\
-\xa2\x3d\x71\xe2\x44\x10\x3f\x4b\x8c\x0b\xdf\xf7\x0d\x27\xd4\x22\
-\x75\x04\xab\xc0\xae\x45\x28\x16\x56\x6c\xf8\x1e\xc7\x0a\xb9\x48\
-\x1d\xc1\xc2\x32\xb9\xa7\xa5\x18\xdb\x80\x0d\xe1\x7b\xc2\x25\xf1\
-\x2b\x04\x2b\x4a\x0b\x2b\xd6\x85\xef\xf3\xdc\x45\xc5\x1b\x43\x6f\
-\x48\x88\x60\x15\x00\xe5\x62\xf9\x1e\xbc\x8d\xd9\xb5\xf0\x75\xc3\
-\xd9\xbb\x77\x6f\x14\x43\x35\x10\xac\x02\xe0\x73\xf0\x56\x47\xfb\
-\xb1\x8d\x72\x0f\xc1\xba\xe4\x74\x10\xc1\x8a\xd2\x2d\x6c\x69\x69\
-\x09\x2e\x63\x7f\x2c\xa8\x76\xb2\xa7\xa7\x87\x4d\x12\xc1\x8a\x07\
-\x05\x6f\x7d\x1d\xe9\x1e\xfb\x4e\xad\xda\x49\xd5\x50\xfa\x84\x04\
-\x76\xc7\x8e\x1d\xbc\x78\x08\xd6\xf8\xf0\x39\x78\xcb\x4e\xed\x5f\
-\x7a\x43\x2c\x45\xea\xb9\x50\x52\x5b\x5b\xdb\xcf\x6d\x00\x00\x04\
-\x0b\x00\x00\xc1\x02\x00\x04\x0b\x00\x00\xc1\x02\x00\x40\xb0\x00\
-\x00\xc1\x02\x00\x40\xb0\x00\x00\x10\x2c\x00\x40\xb0\x00\x00\x10\
-\x2c\x00\x00\x04\x0b\x00\x10\x2c\x00\x00\x04\x0b\x00\x00\xc1\x02\
-\x00\x04\x0b\x00\x00\xc1\x02\x00\x40\xb0\x00\x00\xc1\x02\x00\x40\
-\xb0\x00\x00\x10\x2c\x00\x40\xb0\x00\x00\x10\x2c\x00\x00\x04\x0b\
-\x00\x10\x2c\x00\x00\x04\x0b\x00\x00\xc1\x02\x00\x04\x0b\x00\x00\
-\xc1\x02\x00\x04\x0b\x00\x00\xc1\x02\x00\x40\xb0\x00\x00\xc1\x02\
-\x00\x40\xb0\x00\x00\x10\x2c\x00\x40\xb0\x00\x00\x10\x2c\x00\x00\
-\x04\x0b\x00\x10\x2c\x00\x00\x04\x0b\x00\x00\xc1\x02\x00\x04\x0b\
-\x00\x00\xc1\x02\x00\x40\xb0\x00\x00\xc1\x02\x00\x40\xb0\x00\x00\
-\x10\x2c\x00\x40\xb0\x00\x00\x10\x2c\x00\x00\x04\x0b\x00\x10\x2c\
-\x00\x80\xa2\x08\x56\x3a\x9d\xee\xe9\xef\xef\x2f\xe7\x56\x00\x80\
-\x71\x6e\xa5\xca\xca\xca\xce\x72\x1f\x00\xc0\x3a\xa5\xa5\xa5\x17\
-\x53\x95\x95\x95\x27\xb9\x15\x00\x60\x9d\xaa\xaa\xaa\x5f\x52\x75\
-\x75\x75\xff\xc7\xad\x00\x00\xeb\xd4\xd4\xd4\xfc\x94\x7a\xed\xb5\
-\xd7\xfe\xa7\xa4\xa4\xa4\x8f\xdb\x01\x00\x56\x19\xd0\xa8\xde\xd7\
-\x5f\x7f\xfd\xbf\x4a\xfa\xfb\xfb\x67\x36\x34\x34\xfc\xb9\xbd\xbd\
-\xfd\x4d\x6e\x0b\x00\x58\x24\x9d\x4e\xff\xad\xb1\xb1\xf1\x4f\xa9\
-\x81\xcf\x3b\x3f\xfd\xf4\xd3\xbf\x96\x97\x97\xb7\x73\x5b\x00\xc0\
-\x1a\xd2\x26\x69\x94\xb4\x2a\xa5\xb4\x86\xb5\x6b\xd7\x1e\x7d\xe3\
-\x8d\x37\xfe\xa5\xb4\xb4\xf4\x12\xb7\x07\x00\xac\x30\xa0\x49\x97\
-\xa5\x4d\xd2\xa8\x81\xdf\xf6\x94\xfd\x66\x6e\x9d\x1f\x70\x09\x7f\
-\x2c\x2b\x2b\xfb\xa7\x8d\x1b\x37\xfe\xa5\xa7\xa7\x67\x2e\xb7\x0a\
-\x00\x5c\x52\x51\x51\x71\xe2\xad\xb7\xde\x7a\xef\xe3\x8f\x3f\xde\
-\x3a\xf0\xdb\xf3\xfa\x9a\x32\xdd\x7f\xff\x0b\x03\xa2\x35\xad\xa9\
-\xa9\x69\xde\xbb\xef\xbe\xfb\xc7\xb6\xb6\xb6\xb7\x6e\xdd\xba\x35\
-\x91\xdb\x06\x00\xc5\x24\x95\x4a\x5d\x1f\x30\xa2\xbe\xde\xb0\x61\
-\xc3\x5f\x56\xad\x5a\x75\x7c\xe0\x4b\x17\x6e\xff\xd9\x1d\x82\xf5\
-\x9b\x68\xc9\xea\x9a\xb6\x69\xd3\xa6\x05\x9f\x7d\xf6\xd9\xcb\xad\
-\xad\xad\x2f\x74\x75\x75\xad\xe8\xeb\xeb\x7b\x80\x8c\x78\x00\xc8\
-\x37\x3a\x01\x1c\xf0\xee\x3a\xaa\xaa\xaa\x0e\xd6\xd5\xd5\x6d\x59\
-\xbf\x7e\xfd\xa6\x75\xeb\xd6\x1d\xfd\x4d\xa8\x7a\x07\xff\xdd\xff\
-\x17\x60\x00\xd3\x54\x64\xf1\x82\xc8\x85\xfc\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x14\xcf\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x04\x00\x00\x00\x28\x08\x06\x00\x00\x00\x18\x11\x84\xf3\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x33\x35\x32\x36\x30\x41\x37\x34\x38\x33\x32\
-\x38\x31\x31\x45\x45\x41\x44\x34\x44\x45\x32\x45\x35\x43\x41\x45\
-\x45\x42\x30\x32\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x33\x35\x32\x36\x30\x41\x37\x35\x38\x33\x32\x38\x31\x31\x45\
-\x45\x41\x44\x34\x44\x45\x32\x45\x35\x43\x41\x45\x45\x42\x30\x32\
-\x33\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x33\x35\x32\x36\x30\x41\x37\x32\x38\x33\x32\x38\x31\x31\x45\
-\x45\x41\x44\x34\x44\x45\x32\x45\x35\x43\x41\x45\x45\x42\x30\x32\
-\x33\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x33\x35\x32\
-\x36\x30\x41\x37\x33\x38\x33\x32\x38\x31\x31\x45\x45\x41\x44\x34\
-\x44\x45\x32\x45\x35\x43\x41\x45\x45\x42\x30\x32\x33\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xb6\
-\x5e\x72\x15\x00\x00\x11\x43\x49\x44\x41\x54\x78\xda\xec\x5d\x09\
-\x74\x56\xc5\x15\x9e\x24\x90\x05\x01\x21\x28\x9b\xec\x3b\xa8\x28\
-\x60\x21\x08\x16\x14\x5a\x17\x10\x15\x8f\x56\x5c\xab\xf6\xe0\xa9\
-\xcb\xd1\xda\x1e\xbb\x88\x8a\x4a\x5b\x39\xd5\x53\x10\x6b\x51\x29\
-\x58\xab\x52\x15\x15\xb5\x50\x36\x41\xc1\x02\x0a\x54\x76\xa1\xca\
-\xae\x80\x22\x4b\x08\x84\x40\xb6\xde\x6b\xbe\x77\x32\x19\xe7\xce\
-\x9b\xf7\xff\x49\x88\xf2\xee\x39\xdf\x49\xf2\xde\x9b\xe5\xcd\x9b\
-\xb9\xf7\x9b\x3b\x77\x26\x29\xa5\xa5\xa5\x2a\x96\x2a\x91\xfb\x08\
-\x63\x85\x7b\xfb\x09\xc3\x08\x1f\x78\xe4\xd3\x88\xf0\x16\xa1\x9f\
-\x70\x7f\x01\x61\x38\xe1\x40\x48\x3e\x6d\x09\x33\x08\x5d\x2d\xf7\
-\x72\x09\x43\x3d\xeb\xf3\x7d\x95\xfe\x68\xcb\x5a\x96\x7b\xe3\x09\
-\xf7\x9c\x08\x8d\x90\x1a\x8f\xdb\x2a\x93\x35\x8e\x7b\x27\x11\x5a\
-\x78\xe6\xd3\x18\x83\x59\x92\xd3\x08\x27\x7b\xe4\x93\x41\xc8\x14\
-\xee\x6d\x21\x6c\xae\x01\x6d\x96\x2e\x0c\xc8\x58\x62\x85\xf0\x9d\
-\x97\x75\x84\x9d\x8e\x8e\xdf\xc9\x33\x9f\x1f\x10\x9a\x3b\xee\x77\
-\x0a\x51\x18\x81\x74\x26\xb4\x16\xee\xad\x74\xd4\xb5\xaa\xa5\x09\
-\xa1\x37\xe1\x01\xc2\xbf\x09\x17\xc6\x5d\xe7\xf8\x49\xac\x8d\xab\
-\x4e\xf6\x10\x56\x38\x06\x73\x4f\x28\x86\x63\x21\x0a\xbb\xaf\x27\
-\xdd\x7d\x2f\xe4\x99\xee\x82\x01\x28\x26\x7c\x58\xcd\x6d\x93\x4d\
-\x18\x42\xe8\x85\xf7\xeb\x8d\xeb\x85\x84\xc7\xe3\xae\x13\x2b\x84\
-\xef\xa3\x1c\x21\xfc\x97\x70\xa9\x70\xbf\x15\xfc\x03\xbb\x1c\x79\
-\x64\x7a\x2a\x04\x7e\x26\x0d\x83\x5b\x62\x24\xa7\x0b\xf7\xf2\xa0\
-\xb8\xaa\x53\x6e\x21\xfc\xc9\x72\xbd\x30\xee\x36\xf1\x94\xe1\xfb\
-\x2c\x6c\x79\x0b\x84\x7b\x2d\x43\xa6\x02\x0a\x16\xb4\xbb\x47\x39\
-\xe7\x12\xea\x3a\xee\x37\x70\xe4\xb3\x13\x8a\xab\x3a\xa5\x59\xdc\
-\x35\x62\x85\x70\x22\xca\x6a\xc2\x26\xe1\xde\x29\x84\x6e\x21\xe9\
-\x07\x10\x52\x3c\xca\x69\xa0\xd1\x6e\x89\xa2\x77\x15\xee\xcd\x74\
-\x30\x8b\xaa\x92\x98\x09\xc4\x0a\xe1\x84\x94\x2f\x08\x1b\x42\x18\
-\x80\x6b\xc0\x9f\x67\xfc\x5d\xea\x18\xbc\xfd\x1d\xf9\x9c\xee\xb8\
-\xf7\x9f\x1a\xd6\x66\xf1\x3a\x78\x0d\xf5\x21\xb0\xb2\xe8\x43\xf8\
-\x21\x3a\x54\x47\x5c\x2f\x21\x6c\x07\xcd\x9c\x03\x2b\xe8\xfa\x88\
-\xdc\xe1\x7b\x20\x1f\x76\xa4\xb5\x47\xde\x45\x84\xad\x84\x65\xaa\
-\x6c\x9d\x7d\x5b\x84\x7a\xb7\xd7\x68\x27\xaf\xbf\x7f\xa2\x0d\x94\
-\x2c\xc2\x20\xc2\x25\xb0\xc0\x19\xb8\xbe\x9e\xb0\x94\x30\x5d\x95\
-\x39\xfc\xa2\x08\xbf\xff\x65\xf8\xd9\x0e\xd7\xf2\x55\xd9\xd2\xe2\
-\xc7\x84\xd9\x84\xdd\x42\x5a\x7e\xbf\x2b\x85\x7b\x1d\x50\x3f\xdb\
-\xb4\xa2\x23\xda\xcb\x9c\xef\xef\xc0\x7b\xa5\x84\x28\x0f\x73\x4a\
-\x61\x93\xc3\x21\x0a\x21\x0d\xbe\x8e\x01\xf0\x67\xdc\x68\x94\x7b\
-\x10\xef\xbe\x84\xf0\x91\x43\x59\x71\x9a\xda\x46\xbe\x92\xd4\x86\
-\xcf\x43\x97\x22\xf4\x3b\x15\xd2\xcf\xba\xa8\xb2\x55\x99\x3e\x96\
-\xb6\xe3\x77\x9d\x01\x05\x3d\x27\x49\x56\xc4\x79\x0f\x41\x1f\x53\
-\x5a\xff\x7a\x4d\x95\x39\x77\x0b\x12\xc8\x93\xdf\x99\x7d\x41\x83\
-\x09\x03\x8d\xb1\xb9\x00\x7d\x77\x3e\xe1\x90\x47\x5e\x69\x42\x1b\
-\x07\x06\xa5\x44\x63\xa0\x37\x69\xec\x71\x9e\xe2\xc0\x24\x03\xb5\
-\x08\x43\x08\x8b\x09\x47\x4b\xdd\x52\x40\x98\x49\x18\x4a\x48\x35\
-\xf2\x49\x21\x0c\x26\xcc\xf1\xc8\xe7\x30\xe1\x09\x42\x03\x4b\x7d\
-\x6c\x78\x96\x70\x0c\x58\x44\x38\x09\xd7\xcf\x27\x2c\x21\x14\x39\
-\xca\xda\x45\xb8\x97\x90\xe5\x51\xce\xa9\x84\x89\x84\x7c\x47\x7e\
-\x25\x84\x5c\xd4\xbf\x9b\x25\x8f\x41\x84\x23\x42\xda\xdd\x84\xe6\
-\x42\xd9\xd7\xe2\xfd\xcc\xba\x4f\x15\xf2\xdb\xe1\xc8\x6b\xa6\x50\
-\xfe\x7b\x84\xda\xc6\xb3\x69\x84\xf6\x84\xfb\x08\xab\xf0\xee\x25\
-\x21\xdf\x8f\xbf\xef\x1a\xf4\x1b\x5b\xf9\x3d\x08\x07\x08\x79\x80\
-\xab\x3f\x1c\xd1\x9e\x0b\x70\x91\xe3\x1b\xa5\xe2\xfe\x6c\xa4\x0d\
-\xab\x6b\x21\xe1\x05\xf4\x4f\x3d\x9f\xfe\xb8\x67\x93\x71\x78\xa6\
-\x11\xe1\x19\xf4\x7b\x29\xef\xa5\x84\x73\x3d\xfb\x31\x23\x83\x70\
-\x23\x61\x9d\xe5\x7b\xeb\xc2\x7d\x7a\x27\xe1\xb7\x84\x93\x43\xf2\
-\x1c\x6b\x69\xc3\x3c\xa4\xef\x4b\xa8\x8b\x36\x30\xcb\x9b\x69\x66\
-\xd4\x00\x03\xc0\x26\xdc\x31\x0e\x0a\x8d\x31\x99\x90\xae\xe5\xd3\
-\x8c\xf0\xb4\xa3\xf3\xe4\x0a\xf7\x58\x79\xd4\xf3\x68\xc4\x29\x5a\
-\x1a\x56\x00\x75\x08\xb7\x59\xea\x76\xd0\x31\x18\x9f\x27\xd4\x77\
-\x94\xd1\x86\xb0\xcc\x92\x2e\x0f\xf9\xda\x64\xba\x25\x1f\x7e\x9f\
-\xcd\x8e\x0f\xdd\x47\x28\xff\x49\xcb\xb3\xdb\x09\x77\x0b\xf9\xf1\
-\x7b\x0e\xb3\xe4\xc3\xef\xb8\x47\x28\x7b\x94\xe5\xf9\x66\xe8\x9c\
-\x89\x48\x31\xe1\x7e\x4b\x9e\xbd\x3c\x06\xaa\x4b\x86\x0a\x6d\xd4\
-\xd4\xd1\x5f\x5d\xf2\x8e\x45\x11\xba\x14\xc2\x58\xb4\xcb\x22\xcf\
-\xfc\xbf\x22\xe4\x78\xf4\x63\xce\xf3\x9f\x09\xd4\x7f\x1e\xa1\xad\
-\x23\xdf\xf1\x42\x3a\x56\xca\x03\x85\xbe\xc5\xf2\xa6\x4e\x4b\xea\
-\x13\x9e\x26\x8c\xd0\xae\x1d\x00\xcd\x9a\x83\x69\x42\x11\xa8\x4d\
-\x7b\x50\xb3\x6b\x40\x8f\xc6\xa8\xf2\xf5\xf4\x53\x09\xcf\x81\x52\
-\x05\xc2\x14\xfd\x6d\xd0\xa9\x9d\x78\x96\xcb\xcb\x21\xfc\x1c\x0e\
-\x36\x96\x1f\x11\xee\x25\x3c\x1c\x61\x9e\x79\x18\xf5\x78\x0a\x34\
-\x8b\xa3\xee\x26\x62\x1a\xb1\x1f\xd7\xda\x10\xae\xc7\x54\x22\x10\
-\xa6\x4a\xbc\xe4\x37\xca\x42\x1f\xeb\x10\xfe\x48\x38\x07\x7f\x73\
-\x7d\x5f\x51\x65\x81\x33\x9f\xa3\xfc\x46\xa0\x5a\x57\xe2\x39\xce\
-\x63\x9c\xa5\xae\x4c\xf3\xe7\x12\x46\x0a\xef\x72\x8e\xfa\x76\x1c\
-\x40\x63\x81\xe6\x17\x80\x96\x72\x99\x66\x30\x52\x26\x7c\x12\x6f\
-\x5b\xfc\x14\xf5\x2d\x79\x1d\xc3\x77\x35\x25\x23\x84\xd2\x87\xf9\
-\xa4\xc6\x80\x96\xbf\x6e\xdc\x2b\x49\x22\x5f\xdb\x94\x94\x23\x3d\
-\x5f\xc2\x54\x34\xaa\x94\x44\x7c\xbe\x1e\xe1\xd9\x10\x3f\x8d\x2e\
-\xa7\xa2\x1d\x86\x63\x5a\x65\x13\x9e\x8a\x4d\xc3\x38\x8a\x2a\x83\
-\xf0\xee\xd7\x60\x5c\xfa\xfa\x61\xf2\xd1\xef\xaf\x96\x5b\xba\x5c\
-\xab\x8c\x33\xb4\x05\x5b\xc7\x9e\x16\x4d\xaa\x53\xb5\x8e\x98\x16\
-\x98\x14\xe8\x4e\xd0\x11\xb6\x0a\xcf\x41\x9b\xa5\x09\xf9\xf4\x01\
-\xdd\xd5\xad\x7a\xab\x10\xcd\x3a\x59\x7b\xfe\x73\x58\x4e\x96\x09\
-\xb0\x1a\x4a\xb0\xd4\xbf\x80\x15\xd3\x29\x9e\xcd\x42\x0f\xd0\x9e\
-\xe3\xf7\xb8\xc3\xd1\x0e\xd9\x84\x91\x82\xb5\x0d\x30\xc2\xa1\xed\
-\xa7\x5a\x9e\x3f\x4f\x60\x51\xcf\x6a\x53\x26\xc9\xf2\x99\x53\xb7\
-\xdb\x04\xeb\xbc\x5a\x98\x62\xb4\x26\xac\xb7\xd0\x55\xb6\x2e\x5f\
-\x6b\x70\x4d\xcb\x3e\x33\x68\x6d\xef\xd2\xe4\xe4\x32\xa3\x8e\x59\
-\x11\xac\xb5\x4d\xde\x8a\xc8\x10\xf2\x12\x28\xa3\xc4\x52\xef\x00\
-\xe9\x8e\x69\x5c\xd0\xde\x41\x3b\xbb\xa6\xab\xe3\x85\xfc\xc7\x39\
-\xa6\x34\x85\x2e\xe6\x14\x30\x04\x76\xc2\xdc\xae\xe9\x89\x55\xaa\
-\x6c\xf3\xcd\xae\x10\x2d\xfb\x29\xa0\xcb\x51\x58\xeb\x02\x58\xe7\
-\x89\x21\xda\x8e\xad\xe3\x63\x48\x13\x68\x63\x66\x0a\x7f\xf3\xd4\
-\x96\xa7\xe1\xe7\x33\x84\xbb\x1c\xcf\xb1\xa5\xfe\x33\xac\xff\x18\
-\xcd\xa9\x7a\x37\xe1\x5a\xe3\xd9\x1e\xda\x0a\xcc\x67\x84\xc9\x8e\
-\xa5\xb2\x7d\xb0\x1e\x2e\x59\x02\x76\x65\x73\xe2\xe6\x58\xae\x75\
-\x13\xac\x7a\xb0\xf9\x88\x1d\x78\xb7\x5a\x56\x89\x3a\x83\x39\xe8\
-\x4b\x9d\xfd\x84\x95\x8c\x75\x0e\xe7\x6a\x1d\xfc\xe4\x7c\xde\xff\
-\xc6\xd9\x54\xe6\xd0\xfa\x52\x7b\xe6\x3a\xb0\xb9\x9e\x96\xf4\xcc\
-\xc8\x38\x20\xeb\x45\x8d\x69\xce\xd3\xea\xcb\x0c\xd3\x16\x46\xcd\
-\x2c\x6b\x2d\x61\xaf\x71\xfd\x4b\xe3\xef\x47\x3c\xac\xf5\x1e\xd4\
-\x3f\x1f\x7f\x73\x9c\x46\x4b\x38\xa3\xd3\x23\xae\x66\xe8\x31\x1e\
-\xcb\x61\xf5\xd9\xf9\x79\x36\xfa\xab\xe4\xe4\x1c\x0a\xc6\x56\x6a\
-\xb0\x28\xee\x73\x17\x0b\xe9\xd8\x51\xcd\xd1\x9a\x2f\xe0\x6f\x5e\
-\x4e\xfe\x3d\x9c\x8d\xa6\x8c\x44\xdf\x5b\x97\xe0\x22\xc2\x27\xda\
-\x18\x6f\xf8\x0d\xa3\x86\x46\x79\xc5\x98\xe3\xf7\x8d\xe0\x14\xa9\
-\x0c\xb4\x80\x36\x0c\x64\x4c\x04\x86\xc0\xb2\x81\xd0\xc4\xb3\x2c\
-\xb6\x5c\x2b\x8c\xf7\xed\x64\x3c\xf3\xa8\xc1\x94\x92\x7d\xbf\x93\
-\xe0\xeb\xb0\xc9\x7e\xf8\x2b\x74\xa7\xee\x24\xcb\x73\xc7\x60\xbd\
-\xf9\x99\xb3\x09\xfb\x04\x3f\xc2\x60\xc3\x41\xb8\x54\x28\xf7\x3e\
-\xa1\xae\xed\x61\x41\x1f\xc4\xef\xae\xf7\xea\x40\xd8\x22\xe4\xff\
-\x57\x47\xba\xd1\x42\x9a\x43\xb0\xd4\xae\x32\xbb\x0a\xef\xae\x3b\
-\xa8\x1f\x23\xf4\xb3\x38\x4b\x7b\x81\x45\x4e\x84\x63\xcd\x97\x21\
-\x04\xdf\xe9\x6e\x83\x59\xb0\x33\x73\x9b\x23\xcd\x72\x30\x66\xbd\
-\x9c\x96\x60\x50\x36\x59\xaf\x7d\x63\x1d\x5c\xd7\x95\x42\x9a\xd1\
-\x11\x18\x42\x20\x7b\xc0\x96\x9b\x19\x7d\xb4\x5b\x2a\x34\xb9\x1e\
-\x1e\xfb\x06\x2c\x5a\x75\xca\x01\xc3\x0a\xb4\x8b\x98\xfe\x29\x8b\
-\x15\x91\x84\xb7\xfa\x4e\x31\x96\x7b\xfa\x59\xe6\x5a\x81\x34\xc7\
-\x72\x56\x32\x92\x8f\x65\x23\xc9\xfa\xe4\x18\xfe\x83\x41\x96\xe7\
-\x56\x21\xae\x21\xb0\x22\xb6\xcd\x48\x99\x60\x37\x81\x74\x52\xf6\
-\x68\xc8\x7d\x8e\x6f\xbc\x0b\x96\xe7\x11\x25\x07\x55\x29\x8d\x3d\
-\xcd\x10\xee\x75\x51\xf2\xee\xca\x4c\x87\x55\xad\x17\x52\xe6\x0d\
-\xb0\x66\x52\x3b\x33\x73\xf9\x8d\x65\x39\x95\xd9\xc7\x0a\xb0\xc8\
-\xd1\xca\xbd\x87\xc4\x26\x6c\xa5\xc7\x1b\x4c\x71\x16\xe1\x41\x07\
-\xdb\xe8\x6a\xb1\xca\x83\x84\xfe\x5d\x08\xe6\x6a\x5b\x7e\xe7\xa5\
-\xc6\x27\x85\x32\x2e\x4b\xa0\x3f\x3e\x0c\xb6\xbc\xcb\xf0\xc5\xad\
-\x67\x85\x70\xb3\xf1\x11\x5e\xae\x26\x25\x90\x02\x6a\xda\x08\x34\
-\x37\x4b\xbb\xd7\x32\x42\x3e\x3c\x30\x16\x46\x2c\xfb\x5d\xe3\x23\
-\x9a\xb4\xf7\x63\xcd\xf1\xc4\x03\xea\x09\x74\xf0\x64\x9c\x62\xb3\
-\x04\x67\x16\x77\x98\xee\x46\x8c\x45\x1b\xcb\x73\x8b\x30\xed\x08\
-\x3a\xb7\xa4\x60\x72\xb4\x01\xc7\x75\x6e\x62\x79\x66\xab\x92\xf7\
-\x2f\xe4\x3b\x94\x6b\x3a\x90\x85\x3a\xba\x76\x59\x66\xe3\xdb\x56\
-\xa6\xd4\x77\xc4\x54\x70\x1b\xff\x01\x71\x26\x61\xb2\x3b\xa2\x42\
-\xe0\x3e\x36\x41\xb8\x37\xd5\xe1\x38\x4c\x37\xa6\x75\x69\x50\x08\
-\x29\x82\x22\x76\x8d\xbd\x95\xc2\xf5\x36\x1e\x4a\xd4\x9c\xbe\xfe\
-\xdd\x35\xa7\xb8\x48\x0b\xde\xd9\x14\x61\x3e\x12\x35\xe8\xa2\x03\
-\x06\x57\x13\xfc\xde\x04\x9e\xd6\xd6\xf8\x59\xdf\x50\x16\xbe\xf2\
-\x15\xa0\x22\xa6\xd9\xa9\xf9\x1f\x5a\x59\x1a\x6d\xbe\x36\x6f\xbb\
-\x04\x81\x3f\xd3\x30\xb0\xd9\x42\xff\x2f\x62\x70\xcb\x26\x0c\x44\
-\x9b\x75\x38\x53\xfb\x7d\xa0\xd0\xd9\xdf\x32\xae\xcd\x81\x1f\xc1\
-\xb6\x6a\x51\x0f\x3e\x9c\xd6\x96\x20\x9f\x80\x61\xe4\x7b\xce\x39\
-\xcf\x00\xd3\x48\xc7\x9c\x38\x08\xfe\x1a\xe6\xa9\xf4\x2b\x53\x5a\
-\x3a\x94\xd0\x46\xc2\x3f\xaa\xc8\x78\xcd\x81\x6f\xcc\x26\x45\x98\
-\x8b\xe7\x08\xdf\xad\x21\xfc\x57\x2c\x7c\x0e\xc6\x59\x0e\x1f\xd7\
-\x55\x8e\x36\xeb\xe2\x08\x42\x6a\x81\x3a\xf8\xc8\x3c\xad\x3e\xd6\
-\x0f\xae\x5b\xe6\x2f\x54\xf8\xc9\x3b\x51\x24\x03\xcb\x1c\xdc\x79\
-\x4e\x17\x2c\x5f\xb2\x72\x04\x74\x27\xea\xb2\xd3\x7e\x4d\x21\xb4\
-\xb0\x4c\x2b\x1e\x06\xfd\x6e\xa4\x39\x3b\x6f\x06\xb6\x60\x50\xcd\
-\x85\x85\xd8\xeb\x51\xe6\xe7\xf8\x68\x36\x85\xd0\x09\x9d\x7d\x87\
-\x40\x01\x37\x43\x99\xe8\x32\x17\xd4\x3f\xdb\xb2\x9c\xd5\x16\x4e\
-\xb5\x73\x84\x77\x0f\x9b\x12\xa6\x81\x9a\x0f\x47\x1e\x35\x65\x33\
-\x52\x53\xed\x9b\xd9\xda\x68\x7b\x15\x95\xbb\x3f\xe4\x7e\x81\x43\
-\x21\xea\xe3\x2b\x0b\x8e\x5f\x9b\xf0\xf8\x78\x35\x41\xa6\x9d\xe9\
-\xf9\x6c\xa1\x72\x1f\xdc\xf3\x2d\x2f\x75\x9a\xaa\xbc\xfd\x0d\x7d\
-\xe1\x15\xe7\x55\x86\x21\x86\x32\x28\x06\x65\xdb\x8b\xce\x39\xdd\
-\xa3\xd1\x5d\x0d\x92\x92\x60\x3a\x5d\x93\xdb\x3c\xfa\x4c\xef\x6c\
-\x9b\x7f\xda\x42\xc9\x4d\xc0\x5c\xf5\x4e\x8f\x76\x2b\x70\xd0\xbe\
-\xc6\x18\xc8\x4d\x0d\xb6\xa0\x5b\xf4\xdd\x16\x8b\x22\x85\x1d\x9f\
-\x07\x05\xd6\x46\xa8\x87\x2b\x5c\x99\xd7\xd0\x39\xe6\x62\x12\xfc\
-\x4b\x35\x69\x67\x62\xb6\x63\xda\xb6\xa7\x0a\xcb\x4d\x8d\xd0\x97\
-\x6c\x2c\x41\x7f\x2e\xbd\x0a\xea\xe7\xbb\x62\x72\x04\x46\xc4\x49\
-\x09\xab\x42\x06\x41\xdb\x65\x6b\x0a\x60\x1d\x06\x3f\xff\x5c\x0f\
-\x6d\xbe\x03\x94\xab\x21\x06\x60\xc3\x6a\xf4\x5f\xd4\x32\x1a\x4a\
-\x09\x8e\xbc\x4b\x31\x75\xb8\x43\x95\x2d\x33\x35\x36\x34\x72\x67\
-\x28\x86\xb3\xe0\xb0\x72\xc5\xb1\xaf\xc0\x7d\x53\xa3\x37\x00\xbd\
-\x3f\x45\xe8\x30\xab\x2c\x94\x95\xdb\x6d\x99\xb2\x9f\xb7\xc0\x4b\
-\x55\xef\xc0\x1f\x61\x0a\x2f\x59\xae\x15\xea\xc7\x16\x6c\x8a\xaa\
-\x18\x54\x66\xca\xd7\x18\x20\xdb\xc0\x36\x9a\x57\xa3\xd2\xa8\x15\
-\xc2\xfa\x4e\x44\xa9\x5b\x99\xe3\xd8\xcc\xa8\xb8\x12\x1a\x36\x1b\
-\x74\x3b\x50\x06\xec\x89\x7e\x14\xd4\xba\xb0\x86\x7c\xcc\xda\x86\
-\xdf\xe0\xb3\x90\x8e\x36\x07\x60\xba\xdf\x13\x8e\xad\x7e\xaa\xe2\
-\x96\xe3\x9f\xc1\x2f\xf1\x90\x23\xaf\xc5\x98\x3a\x74\xb0\xdc\x6b\
-\x2f\x28\xc4\x7c\x0c\x7c\x9b\x2c\x85\x75\x30\x2d\x54\x4f\xcc\x39\
-\x9b\x5a\xd2\xb8\x1c\xb0\xb7\x3a\x94\xc1\x42\xf8\x50\x96\xa1\xfd\
-\x16\xe1\xfa\x83\x2a\x3c\xb2\xb4\xb2\xc4\xa5\x6c\x1b\x7d\x47\x06\
-\x70\x89\xc0\x38\x76\x58\xfc\x44\x3e\x72\x54\xc9\x1b\xeb\x92\x56\
-\x08\xa7\xc1\x5a\xed\x4b\x22\xcf\xcb\x55\xf9\x32\x1e\x7b\x5f\x7f\
-\xe5\xf9\xa2\x89\x6e\x7b\x2d\x4d\x20\x6d\x2b\x63\x6e\xb7\xc5\x33\
-\xdd\x66\x80\x07\x46\x13\x28\x81\x51\x9a\xc5\x67\xff\xc2\xf3\x8e\
-\xfc\xd8\x7b\xbf\x5a\x50\x08\x7c\xed\x0c\xcb\xf5\x4d\x8e\x39\xff\
-\x26\x94\xd5\xce\xc2\x38\x06\x08\x69\x16\x39\xde\xef\x16\xe1\x3a\
-\x3b\x52\x47\x08\xfe\xa5\xda\xd5\x48\x7f\x0f\x3a\x06\x54\x3b\x30\
-\x95\x5d\x35\x58\x19\xb0\x41\xfc\x4a\x50\xd4\x5f\x2a\x77\x60\x5d\
-\xb5\x48\x2a\x06\x7f\x91\x66\xa5\x5a\x25\x49\xc5\xf5\xd8\xec\xad\
-\x70\x7e\x85\x49\x3a\xa8\x78\x22\x72\x4a\x02\x69\xcd\x75\xfe\xb5\
-\x09\x94\xcb\x1f\x90\xd7\xa6\x1f\xd1\x3a\x71\x4b\x15\x7e\xe4\xd9\
-\xfb\xc2\xf5\x8e\x98\xbf\x9b\xb2\xc1\xa1\xa0\x77\x09\x75\xcf\x52\
-\xf6\x03\x53\xb8\x33\x4a\xde\xe8\xae\xc2\xb7\x67\xd6\xf8\x94\x92\
-\x9d\xcd\x2d\x2b\xb1\x3f\xa6\x19\x8a\xda\x66\x45\xb7\x3a\xea\x7f\
-\x55\x0d\x67\x07\x05\x8e\xfa\x77\x4c\x72\xec\x55\x9a\x42\x60\x07\
-\x52\xae\x76\xed\xe6\x24\xf2\xcb\x30\x06\x67\xae\xf2\x5b\xde\x3a\
-\x33\x09\xff\x01\xaf\x10\x74\x8b\xf8\xce\xc3\xb5\xbf\xd9\x99\x39\
-\x3f\x89\x77\x7e\x55\x55\x3c\xc2\x3c\x6c\x80\x7c\x28\x4c\x91\x7a\
-\x29\x7b\x10\xd1\x87\x21\x4e\xa2\x05\x96\xeb\x75\x94\x7d\xd3\x0c\
-\x4f\x31\xa4\x15\x91\x86\x82\xe5\x2d\x0a\x51\x06\xfd\x12\xec\x77\
-\x52\xff\xe9\x1a\xa2\x10\x36\x3a\x94\xc9\xaf\x95\x7d\xd9\xd6\xd6\
-\x67\x6a\x1f\x87\xf1\xc6\xdf\x6b\xb9\x70\x8f\x8f\xd2\xbf\x2d\xe2\
-\x58\xab\x57\x15\x0a\x61\xbc\xaa\x18\xf5\x76\x85\x2a\xdb\xdb\x90\
-\x28\x43\x48\x31\xfc\x09\x27\x7b\xd4\x21\x19\xaa\x94\x05\xaa\xeb\
-\xeb\x58\x61\x85\xa7\x47\xf3\xcd\x34\x14\x62\x22\x5a\x3f\xdf\xa0\
-\x85\x2e\xf9\x58\xd9\xa3\x0c\xd3\xd5\xb7\x3d\xe8\x05\x0e\x46\x11\
-\xc8\x6a\x4b\xfd\x53\x54\x79\x6c\x89\x2e\x0b\x94\x7b\x89\x2c\x45\
-\xe8\x78\x3d\x84\x34\x77\x09\xd3\x9f\x30\x71\x1d\xf2\xc1\x51\x92\
-\xe7\x6b\x7f\xf3\x00\x6f\xab\x0d\xa8\x37\x1c\x6d\xcc\x0a\x95\x83\
-\x7b\xee\xb7\xd4\x8b\xd9\x17\x3b\x87\xff\x02\x56\x97\x71\x9c\xfc\
-\x07\x33\x35\x46\x6e\x0a\xef\x27\xba\xda\x23\x9f\x81\x78\xcf\xee\
-\x55\xa1\x10\x58\xe3\x4e\xd5\xae\xb1\xd6\x99\x12\xd1\xea\xea\x0e\
-\x0e\xbd\xb3\xb3\xe7\x3c\x27\x24\x0d\xff\x87\xa3\xa1\x49\xbe\x07\
-\xaf\xdd\xfb\x38\xb6\x78\x8e\xfe\x90\xa6\x3c\xf2\x41\x87\x4b\x85\
-\x67\x7d\x58\x4b\x47\xad\xc3\x72\x3e\x5f\x84\x3c\x7f\x0c\x9d\xc2\
-\x47\x78\x35\x26\xec\x44\xe4\x35\x9e\xf3\xe6\x43\x0e\xeb\xa4\xc0\
-\x1c\xa4\x81\x36\x5a\x55\x0c\x82\xea\x0d\x5f\x49\xa2\xff\xcd\xe8\
-\x53\xc7\x3d\xee\x33\xaf\x83\xb5\xcd\x87\x02\xd0\x97\x62\x5f\x0e\
-\x69\x13\xf6\x23\x70\x08\xf0\x6c\xf8\x4b\xde\x05\x16\xc0\xf7\x73\
-\x3b\xe6\xf0\x05\xea\xf8\xc8\x42\x87\x1f\x87\x7d\x3f\xbc\xa9\x8f\
-\x8f\x0f\xb8\xd8\xa2\xec\xd8\x8f\xf3\x12\xda\x64\xb8\x4a\x3c\x72\
-\xd6\xe1\xc1\x29\xdb\xd8\xc0\x07\x8c\x2c\x30\x36\x40\x6c\xc4\xf6\
-\x4d\xdb\xe9\x2c\xbc\xfd\xb4\x3b\xe1\x21\x9c\x22\xa3\xdf\xbb\xdc\
-\xc8\x67\x91\x65\xf3\x50\x70\x1a\xd1\x03\xda\x56\xd1\xfd\x5a\x9a\
-\x0f\x22\x6c\x6e\x3a\x6a\x1c\x64\xd1\x58\xd8\x5c\x34\xd8\xb2\xad\
-\x77\xac\x90\x7f\x6b\x6c\x26\xe1\xcd\x29\x3f\x26\x34\x14\xb6\x7f\
-\xb7\xc1\x96\xe3\x40\x3e\x35\x36\x2a\x49\xb8\xc2\x73\x0b\xed\xe3\
-\x9e\x9b\xa7\xde\xf4\xc8\x6b\x2d\x36\xd6\xb8\x4e\x1e\x5a\x16\x72\
-\xf8\x89\xcf\x96\xdc\x40\x56\x61\xd3\x9a\xad\xac\xb3\x70\x88\x88\
-\xaf\x98\x27\x31\x5d\x88\x8d\x50\xd5\xb5\xfd\x79\x5c\x48\xbb\xbd\
-\xe7\xd8\x6e\x6c\xeb\xfb\xfd\x43\x36\x68\x05\xfd\x5a\xdf\x6e\x9e\
-\x6b\xd4\xef\x10\xb6\xc9\x47\xd9\xfe\x9c\x8b\x13\xbc\xc4\xbe\xa4\
-\x5b\xca\x5b\x30\x1f\x0e\xa2\xdb\x38\x7a\x6e\x3a\xb4\xd9\x7c\x78\
-\xb3\x8b\xa1\x81\x79\xd9\xed\x22\x78\xd7\x33\x41\xd1\x4a\x34\xa7\
-\xd9\x3c\x55\x1e\xf6\xdb\x1f\x8e\xc5\x37\xa0\xd9\x6b\xc1\xaa\x5e\
-\xae\xb1\x90\x31\xb0\xf2\x0d\x12\xd0\x69\xbc\x0c\xc6\xcb\x86\x37\
-\x69\x6c\x83\xb7\x9c\x06\x21\xd8\xbc\x1a\x70\x81\xaa\x78\xfe\x9d\
-\x42\x9d\x1e\x17\x28\x32\xd7\x27\x08\x31\x9d\x8d\xb9\xf7\x72\xa0\
-\x18\xd3\x94\x5e\x28\x4b\x8f\x9c\x9b\xe0\x70\x1a\x99\x34\x9f\x2d\
-\x76\xdd\x90\xe7\x16\x7b\xb6\xc1\x62\xb4\xa7\x4b\x36\x60\x0e\xee\
-\xa2\xb3\x93\x94\x3d\xba\x31\x60\x93\x8d\x2c\x73\xfa\x6d\x4a\xde\
-\x62\x2d\x09\x3b\x42\x79\x19\xf7\xba\x04\xed\x18\x7f\x13\x5e\xe1\
-\x99\x1c\xe2\x84\xac\xa9\xc2\x31\x37\xbf\xc3\xf4\x25\xd5\xe1\x68\
-\xaf\xfe\xa5\x54\xcb\xb1\x61\xaf\x45\xd4\xb6\x7c\x70\x46\x3b\xcb\
-\x16\xd5\x8d\x9e\xe9\x47\x81\x85\xe8\xcf\x2f\x8e\xc0\x10\xde\x87\
-\xe5\x9b\x14\xa1\xce\xaf\x08\xdb\x4c\x19\x99\x09\x1e\x6b\x35\xc6\
-\x71\x08\x8c\xed\xa8\xba\x85\x21\xf9\x1d\x72\xd4\xd1\x66\x71\x8a\
-\x42\xf2\xbb\xc7\x23\x1f\x66\x7e\xd3\x3c\xdf\xb7\x10\x96\x7a\x94\
-\x70\x7f\x8d\x83\x21\x30\xce\xd0\x0e\xb6\x09\x93\x61\x42\x1e\x57\
-\x82\x95\x45\x95\x99\x16\x86\x70\x9e\x71\x78\x8e\xcf\x41\x24\x01\
-\x43\x58\xe8\x60\x55\x9d\x1c\x69\xaf\x8f\xc8\x94\xcc\x03\x58\x06\
-\x46\x3c\x42\x2d\xcf\x72\xa0\x51\x05\x98\xda\x89\xad\xdb\x0d\xb0\
-\x36\x4b\xe0\x13\x28\x15\xac\xc9\x41\xcc\xc9\x38\x52\xce\x0c\x8c\
-\xf8\x04\x56\x79\x8a\xb2\x6f\x0a\x61\x2b\xcb\x9b\x83\xae\x51\xe5\
-\x87\x95\xe4\xc3\x6a\x32\xa2\xec\x4d\xc8\xc0\x12\x20\x47\x12\xfe\
-\x52\x63\x32\xa6\xf0\xfc\x98\x23\xfe\x7e\x0a\x36\xb1\xcd\xe1\x24\
-\x1c\x09\xc6\x32\x0d\x8e\xac\x62\x87\xcf\x84\xad\x33\x87\x31\x3f\
-\xa0\xfc\x37\x3b\xe5\x22\xdd\x21\x07\x66\x29\xff\x2d\xdd\xcc\x60\
-\x3e\x72\xe4\xb5\x5d\x58\x8d\xb0\x79\xc1\xb9\x7d\x9e\x54\xf2\x66\
-\x9e\x62\xf8\x00\x7e\x02\x4b\x9d\xe2\x28\xb7\x34\x84\x25\x5c\x02\
-\x46\x59\xe8\x28\xeb\x5d\x25\xc7\x61\xbc\x0e\x07\xdb\x13\x68\xd3\
-\xb0\xf6\xe7\x7e\xcb\x21\xce\x33\x2c\x8e\xbd\x22\xf4\x69\xdb\x7b\
-\x84\xf9\x1b\x0e\x0b\xe9\x0e\x2a\x77\xd0\xdd\x8b\xa8\x3f\xfb\xb1\
-\xf2\x54\x78\x80\x5e\x29\xbe\xd1\x32\x30\xfa\x65\x8e\x3e\x6c\xab\
-\x4f\x9e\xc3\xa1\x59\xe6\x59\x76\xfc\x3b\xf8\x54\x50\x7a\x76\x20\
-\x75\x51\xe5\xa7\xe8\xec\x44\x87\xe0\x0f\xe9\xb3\xcb\xf0\x6c\x50\
-\xca\xce\x58\xea\x09\xd6\xce\xe7\xaa\xf2\x5d\x57\x41\x28\x71\x8a\
-\xf6\xe1\x5c\x15\x9f\xac\x2d\x8f\xf2\x60\xb8\x50\x95\x6f\x41\xcd\
-\x46\x23\xf3\xb2\x5b\x7d\xe4\xc9\xd3\x87\x95\xa0\xfc\x47\x23\x92\
-\xa8\xe6\x70\x8c\x76\x83\x33\x2a\x05\x8e\xc1\x8d\xe8\xa8\x6b\x54\
-\x62\x91\x96\x29\x21\x4b\x5f\x45\x11\xf3\x4d\x73\x38\x99\x4a\x55\
-\xf4\x7f\x8e\xc2\xd1\x8e\x03\x0c\xaf\x37\x2b\xfe\x17\xe0\x18\xdb\
-\x1b\x52\x6e\x29\xde\x21\x2c\x68\x2c\x1d\xd3\xca\x11\xaa\x62\x60\
-\xd6\x36\x38\xbb\xff\xe5\xa9\x68\x99\x5e\xff\x10\x53\x9e\x0b\x2c\
-\x0e\xd5\x59\x70\xf8\x4e\x17\x06\xb8\xeb\x7b\x14\x87\xd4\xa1\x96\
-\x83\xfa\x17\x2a\xbf\xc0\x39\xee\xab\x43\x30\xde\x72\x2c\x8a\x8c\
-\x15\xfa\x66\x4c\xb5\x76\x86\xf4\x0d\xdf\x63\xd8\x23\x29\x84\x9a\
-\x2c\x2e\x85\x10\x4b\x2c\xb1\x24\xb1\xec\x18\x4b\x2c\xb1\xc4\x12\
-\x2b\x84\x58\x62\x89\x25\x56\x08\xb1\xc4\x12\x4b\xac\x10\x62\x89\
-\x25\x96\x58\x21\xc4\x12\x4b\x2c\xb1\x42\x88\x25\x96\x58\x62\x85\
-\x10\x4b\x2c\xb1\x24\x21\xff\x17\x60\x00\xbb\xf4\xb3\xa3\x04\x40\
-\xbe\x14\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\x59\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x01\x00\x00\x00\x00\xc9\x7b\xa5\x35\
-\x00\x00\x00\x02\x74\x52\x4e\x53\x00\x00\x76\x93\xcd\x38\x00\x00\
-\x00\x12\x49\x44\x41\x54\x78\x01\x63\x20\x13\xd4\xff\x7f\x40\x27\
-\x92\x3c\x00\x00\xf4\xd5\x2a\x9d\x3d\xec\x59\x5c\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x24\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x01\xeb\x49\x44\x41\x54\x48\xc7\xed\xd5\x3d\x48\x55\x71\
-\x18\xc7\xf1\x9b\x92\x4a\x10\x64\x11\x04\x89\x5d\x88\x70\x69\x90\
-\xa2\x42\x7b\x01\x21\x68\x71\xb2\x21\x28\xc4\x45\x8a\xc2\x88\xc2\
-\xd0\x29\xef\xe8\xd4\x20\x38\x15\x46\xb4\xd4\x10\x09\x21\x2d\x51\
-\x4b\x5d\xa8\xa5\x29\xa8\x16\x2b\x8c\x42\x8b\x8c\x7c\x49\xbc\xf8\
-\x69\xf0\x78\xf5\xdc\x73\xce\x3d\xb7\x5c\x7d\xce\xf4\x7f\x9e\xdf\
-\xf9\xf2\x3c\xcf\x79\x9e\xf3\xcf\x64\x36\x6c\xdd\x66\xab\xac\xac\
-\xda\x84\xe8\x9e\x74\xc0\x76\xdd\x46\xcd\x58\xb1\xef\xee\x39\xab\
-\x2e\xa4\xe9\x37\x90\x96\xc5\x0d\xd3\xe2\x6c\xc2\x05\x9b\x03\xd5\
-\x55\xca\x82\x34\xfb\xb8\xe6\xd5\x3f\xc6\x43\x67\x5e\x6b\xc8\x64\
-\x5c\xb2\x54\x16\xe4\xb4\xd9\xe0\x85\xb7\x2e\xdb\x57\xf4\x1f\x94\
-\x33\x11\x44\xbe\x1a\xb4\x44\x19\x90\xe3\x16\xc0\xb4\x4e\x55\x91\
-\x68\x9d\x3e\xf3\xa1\xec\xe2\x41\x1a\x4d\x82\x77\x9a\x12\x33\x3e\
-\xe2\x4b\x3a\xe8\x01\x98\x94\x2d\xd3\xc1\xfd\xa6\x52\x40\x0e\x04\
-\x75\x9f\x0c\x79\x07\xf0\xbc\x78\x6a\xf2\x2d\xb5\x34\x77\xc1\x58\
-\x89\x77\x0d\xc8\xde\x50\x59\xf1\x20\x55\x41\xca\x27\x92\x40\xb2\
-\x3e\x45\xe6\x2a\x06\x74\x38\x98\xdf\xea\x44\x50\xbd\x6c\xe4\xd9\
-\x16\x05\x9d\x89\x2b\xac\xb4\x47\x95\x2c\xe7\x15\x70\x7b\xfd\xa0\
-\xeb\x60\x38\x16\xf4\x59\x73\xc4\xdf\x6f\xdc\xb8\xf3\x51\x50\x27\
-\x78\x18\xf1\x77\x98\x43\xc1\xb0\xfa\x90\x7f\x04\x9c\x8b\x82\xda\
-\xc0\x87\x98\x5c\xb3\x1e\x81\x29\xdd\xab\x6b\xe3\x05\x38\x1a\x95\
-\x6f\x31\x07\xf1\xcb\xe1\x94\xf7\xe0\x49\x70\xde\xa1\x80\x9f\x2b\
-\xbf\x94\xb0\xf8\x31\xb8\x99\xd0\xc3\x1a\x7d\x7e\xaf\xf4\xc4\x35\
-\x70\x3f\x5e\xda\x01\xe6\x35\x26\x7e\x90\x5d\xcb\xa5\xa9\xf7\x03\
-\xb4\xc5\xcb\x36\x79\x05\xf2\x49\x7f\xe8\x40\x57\x6d\x0c\x3c\x4b\
-\x96\x1c\x53\x58\x4e\x59\x4d\x19\xcc\x2d\xb0\xe0\x50\xfa\x58\xf2\
-\xd2\xee\xd8\xf8\x4e\x4f\x03\xc5\xc5\xb4\xc1\x1c\x0a\x84\xb3\x06\
-\x35\x94\x74\x28\xe7\x57\x10\x1d\xaa\x64\xc6\x7b\x2c\x16\xb7\xfb\
-\x8d\x3b\x72\x06\x8c\x04\xfd\x83\x45\x3d\x95\xae\x4b\xab\xbc\x24\
-\xcb\x6b\xfd\xb7\x1b\xb6\x3d\x74\x3d\xc2\x8c\x51\xed\xff\x77\x5d\
-\xd7\x6a\xd1\xa5\x57\xaf\x2e\x2d\xe5\x87\x62\xc3\xd2\xed\x2f\x0c\
-\x5a\x9d\x49\xf6\x1f\x1e\x99\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x6a\xa2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xfd\x00\x00\x00\x92\x08\x02\x00\x00\x00\x01\xf5\x5b\x24\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x30\x36\x43\x34\x39\x35\x31\x30\x39\x33\x31\
-\x43\x31\x31\x45\x45\x41\x36\x37\x32\x42\x32\x39\x35\x38\x44\x41\
-\x42\x32\x32\x32\x37\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x30\x36\x43\x34\x39\x35\x31\x31\x39\x33\x31\x43\x31\x31\x45\
-\x45\x41\x36\x37\x32\x42\x32\x39\x35\x38\x44\x41\x42\x32\x32\x32\
-\x37\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x30\x36\x43\x34\x39\x35\x30\x45\x39\x33\x31\x43\x31\x31\x45\
-\x45\x41\x36\x37\x32\x42\x32\x39\x35\x38\x44\x41\x42\x32\x32\x32\
-\x37\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x30\x36\x43\
-\x34\x39\x35\x30\x46\x39\x33\x31\x43\x31\x31\x45\x45\x41\x36\x37\
-\x32\x42\x32\x39\x35\x38\x44\x41\x42\x32\x32\x32\x37\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xd0\
-\xe5\xd4\x26\x00\x00\x67\x16\x49\x44\x41\x54\x78\xda\xec\xbd\xf7\
-\x97\x24\xd7\x75\x26\xf8\xbd\x17\x91\xb6\x7c\x75\x57\x7b\x6f\x61\
-\x1b\xde\x10\x00\x3d\x44\x91\x14\x09\x52\x14\x29\x72\x04\x49\xbb\
-\x23\xed\x6a\xf7\x9c\x39\x73\x76\xcf\x9e\x39\x67\xf7\x1f\xdb\xdf\
-\x67\x47\x1a\x19\x92\xa2\x44\x90\x84\x47\xa3\x81\x46\x7b\x53\x2e\
-\x6d\x98\xf7\xf6\x7d\x2f\x22\x32\x23\x32\x22\xd2\x54\x55\x37\x40\
-\x69\xea\x14\xc1\xea\xaa\xcc\xc8\x30\xf7\xdd\xf7\xdd\x7b\xbf\xfb\
-\x5d\xb7\x71\xe6\x95\x6e\xbb\x8d\xe8\x4b\xdb\xff\x0a\x11\xff\x33\
-\xf9\x7f\x0c\xff\x2d\x91\xff\x8a\x5e\xaf\xf5\xf0\x8d\x23\x7f\x1a\
-\x7c\x69\x39\x7a\xbc\xf1\xaf\x2f\xfa\xb0\x09\x2f\x93\xd9\x3f\x29\
-\x59\xf0\x31\x72\x8a\x4f\x8c\x7f\x2f\x8a\xce\x32\xfd\xaa\xd1\xbf\
-\xea\xe2\x5b\x34\xcd\x45\x8d\xfb\xe3\xe4\xa7\x30\xe6\x56\x08\x9d\
-\x7b\x0a\x62\xec\x07\x89\xd1\x9b\xa3\xf5\xd8\x4f\xd2\xb1\xe9\x94\
-\xdc\x34\x57\x4f\x77\xc2\x0f\xeb\x6b\x7f\xb3\xe1\x76\x37\xb7\xd0\
-\xed\x4e\x6d\xf7\xa2\xdc\x44\x0a\x9f\x99\x7c\x20\x76\x2f\xc7\x7c\
-\xe2\xc8\x4a\x73\x26\xbc\x4c\x60\x87\x76\x6f\x5f\x50\x64\x0e\xb2\
-\xe0\x9c\x1d\x09\xad\xa6\xba\x45\x93\x6f\x85\x98\xf6\xf1\x8e\x5e\
-\xa3\x4e\x4e\x57\x4e\x76\x1f\xe3\xed\x7e\xf4\x8d\x6a\x60\x3a\x85\
-\x37\x2d\xc0\x17\xcb\xee\x6f\x86\xa1\x0b\xd7\xd9\xed\x61\xb4\x9e\
-\xce\x64\x77\xf0\x25\x1e\xe0\xd5\xc7\x27\xac\x1f\xf8\x6d\x7e\xc8\
-\x0f\x3d\xff\x20\xf4\x83\xbe\x99\x32\x7b\x1b\xc5\x83\xfa\xac\x81\
-\x8f\x28\x73\x22\x53\x7e\xb9\x8e\x3b\xb5\xa3\x2d\x87\x37\xf9\xb7\
-\x8b\x07\xf6\xa8\xa5\x98\xd1\x3b\x4e\x3c\xf3\x9d\x1a\xd3\x4c\xa7\
-\x9a\x7f\x4e\x63\x6e\xd1\xe8\x67\x89\x5d\x9f\xdb\x88\x77\xdf\xe9\
-\x01\xc7\x6d\x41\x33\x9e\xf3\xf4\x77\xa3\xf0\x06\xee\xc0\xc0\xb2\
-\x47\x70\xe3\xeb\xd1\x7a\xe6\x3d\x54\xc8\xdd\x2e\xbb\x69\xfc\xbd\
-\x16\x85\xbe\xeb\xe1\x39\xcb\x2f\xfe\x97\x40\x89\x83\xcf\xbe\x42\
-\xef\x62\x13\x9d\x72\x69\x0d\xdc\xbf\xce\x46\x2c\x62\xd7\x4f\xcd\
-\x91\x31\x9e\xda\xe5\x5e\x91\x58\xac\x3b\xba\x41\x8d\xbb\xa3\xa2\
-\x60\x01\xa5\xef\x88\x90\x13\x9e\x89\x98\x78\x5b\x4b\x9e\xe1\xb4\
-\x1e\x68\x3a\xdc\x9f\x7e\xd5\xe8\x23\x99\x75\x8f\x16\x39\x30\x33\
-\xe3\xd6\x57\x70\x69\x62\x2a\xbb\x1e\xbe\x31\x77\x09\xb3\xdd\x16\
-\x3d\x09\xa9\x8a\x09\x3e\xa7\xec\x0a\xf6\xdc\x87\xc8\xbc\xe9\xab\
-\x62\x30\xa9\x4a\x50\x66\xf4\x38\x84\x70\x85\x10\xf6\xaa\x45\xd1\
-\x59\x8a\xdd\x61\xfa\x9c\xb7\x9e\xf9\x46\xe8\xf8\x2d\xd3\x6f\x6b\
-\xe3\x53\x07\x62\x16\x53\x9e\xcd\xf4\x77\xf3\x90\xc5\xa4\x6c\xc9\
-\x88\xa5\x4e\xba\xed\x33\x87\x14\x7a\x2a\x43\x9e\xec\xf4\xe5\x83\
-\xda\x96\xd5\xa4\xe0\x49\xa9\x99\x82\x2a\x17\xff\xde\xbf\xe4\xae\
-\x8c\x5e\x3e\xe0\xe0\x7b\x2a\xa3\x15\xbb\x85\x6a\x42\xce\xb8\xe1\
-\xcc\x88\xce\x3f\x87\xe7\x88\x07\x60\xf7\x85\x77\x76\x07\x17\x3f\
-\xf1\x09\xed\x3e\x8a\xdd\x31\x5e\x9f\xf6\x8d\x62\x66\x6b\x10\x3b\
-\x0d\x01\xc5\x4e\xef\xc6\x48\x06\x62\x90\x94\x14\x62\x2c\x4c\xd9\
-\x3b\xfb\x1e\xc4\x81\xd1\x11\x06\x8f\x55\xe9\x69\x9f\xf8\xae\x43\
-\x9c\xdf\x1f\x7f\x2f\xc5\x17\xd0\x4f\x7c\x1e\x61\xab\x78\xc0\x97\
-\x90\x07\x4e\x72\x7a\x9c\x31\xdb\x7e\x32\xf2\x4c\xf7\xf2\x11\x8b\
-\x7f\x13\x76\x2f\x45\xc6\x4b\xfd\x3b\xfc\x12\xb3\x16\x4d\xf7\x6e\
-\x21\xe9\xec\x47\x0b\x35\x61\x7d\xa9\x29\x9e\xe6\x83\xbf\x5f\xb9\
-\x7f\xea\xf2\x60\x46\xbb\x33\xa4\x32\x0a\x68\x08\x99\xdc\x90\xbd\
-\x5f\x62\xba\xb3\x9a\x74\x23\x94\x2e\xbd\xcb\xe9\xf7\xea\xb1\xd4\
-\x89\x1d\x7c\xee\xf4\xfb\xc3\x28\x21\x42\x27\xcb\x75\x12\xbc\xd1\
-\x25\x67\x52\x48\xf4\x28\x30\xf7\x9d\x56\x85\x86\x27\x20\x8a\xf3\
-\x6c\x83\x33\x1f\xe6\xb8\x74\xe6\xaa\x55\xce\x8e\xe3\xab\x56\x93\
-\x4c\x45\x8f\xde\xc3\xbd\x67\x2e\x8c\xbd\x4b\x26\xea\x95\x9a\x17\
-\xc8\xe5\xa0\xdc\xac\xdd\xff\x8f\xaf\x69\x42\x8e\x72\xf8\x3b\xc6\
-\xe8\xa7\x84\xe9\xd3\x6c\x71\x02\x33\xbb\xa7\xa9\x43\x92\x9d\x62\
-\x51\x67\x46\x74\xfd\xd0\x33\x01\x8e\x82\x08\x21\x1c\x1a\xbc\xae\
-\x0b\xdd\xfc\x7c\xed\x5e\xfc\x7e\x2e\x8c\xec\x2e\x37\x93\xd1\xef\
-\x64\x55\xc8\x5d\xdf\xb4\x89\x35\x04\xf9\x6f\xfd\x51\x56\x2c\x43\
-\xd1\x23\x57\x48\x55\x7c\x5d\x19\x6b\xf7\x83\x0c\xc0\x78\x1a\xc2\
-\x94\x77\x2d\x9d\x49\x78\x40\x09\x1c\x31\xbb\x23\x9c\xf2\xc8\x32\
-\x8d\x52\xd4\xcc\xa6\xb3\x63\x06\x58\xda\xa4\xca\x0a\x55\xe9\xf7\
-\x4e\x73\x39\x33\x59\x79\x74\xe1\x03\x14\x37\x6d\x64\xbc\xd3\x45\
-\x3e\x81\x00\x87\xd2\xbb\x34\xfe\x95\xa1\x63\xbe\xa5\xf0\x95\x0e\
-\x10\x02\x17\x4e\xbb\xbb\xcb\x24\xec\xfe\x3a\xe5\x4c\x1b\xe4\xe7\
-\x11\x61\xef\xd4\x86\xf6\x32\x2e\x4f\x27\x1c\xf5\xcc\xef\x8d\x48\
-\xa9\x62\x17\xf7\x59\x4e\xac\x94\x89\x99\xaf\xe6\xc1\x39\xb8\x02\
-\x9c\x13\x1a\xa8\xa3\xfa\x01\xea\x07\xf0\xd5\x9f\xe0\x4b\xdf\x76\
-\xc7\xc4\xa2\x33\x1f\x5d\x64\xa3\x69\x3d\xf8\x4d\x52\x0c\x1e\xc6\
-\x43\xd9\x5c\x80\xd8\x19\x3b\x40\x0e\x8f\x3f\xed\x0d\x15\x93\x2e\
-\x6d\xd6\x64\x76\xfe\xa3\x75\x36\x3a\x2c\xc9\x91\x4f\x3c\x01\x51\
-\x96\x93\xd6\xb9\x17\x8c\xbf\x28\x91\x3b\x85\x91\x9c\x81\x88\x1f\
-\xc7\xd0\xb8\x55\xf6\x43\xa7\x7e\x3a\xa2\x84\xd1\x30\xd8\x2e\xe2\
-\x1f\x90\xe5\x2d\xef\x28\x5b\x33\x21\xa2\x50\x76\xc1\x27\x8c\x6b\
-\xbf\x87\x20\xc4\x63\x5f\xc1\xb7\xff\x0c\x2b\x8f\xe0\xba\x9a\x02\
-\xe7\xec\x6c\x01\xe8\x34\x2d\xa9\x3c\xe1\x35\xa4\x21\x4c\xe9\x81\
-\x92\xe3\x46\x97\x14\x71\xe0\x67\xf3\x1f\x59\x2b\x28\xc0\x06\x62\
-\x0a\x0f\x37\xc6\x5e\xf3\xe8\x6e\xd6\x23\xc9\x89\x4f\x75\x36\x6c\
-\x9d\xa7\x85\x8d\x16\xf5\x27\xd6\x6b\xc5\x14\xcf\x65\x9a\xbf\xea\
-\x6c\x5e\xe8\xc1\x6d\xd3\xae\xb5\xde\x90\x27\x6e\xdc\xfc\xfc\x01\
-\x7c\xe3\x47\x78\xe1\x7b\xd8\xaa\xe1\xb7\x1a\x5d\xef\xc1\xc4\xb5\
-\xf9\xd2\xe0\x4e\x76\xcf\xcf\x37\x7e\xdd\x23\xaa\xf7\x1e\xa2\x47\
-\xb1\xd7\xe4\xde\x87\x96\xb0\x70\x22\x4b\xd0\xfc\xe1\x41\x7f\x6e\
-\xe4\x18\xb5\x8d\x62\xc3\x1e\x54\x13\x97\x5e\xc3\x77\xde\xc4\xc2\
-\x59\x7c\xa4\x70\x07\xe8\x0a\xc8\xfa\xc3\xc5\xf7\x0f\xe2\x19\xef\
-\xb8\x73\x60\x42\x3c\xa4\x76\x68\x4c\x7a\x77\x6c\x82\x19\x10\x51\
-\xc9\xb9\x0d\xe0\xc4\xb4\xee\x66\x62\x06\x69\xea\x6b\x19\x03\x10\
-\x76\x93\x54\x98\x09\x8d\x46\x3f\xa8\x1e\x7a\x1e\x56\x8f\xe3\x5b\
-\x6f\xe2\xd9\xd7\x71\x57\xe2\xd7\x0a\x5b\xc6\xe8\xed\x5f\x6b\x33\
-\xd5\x6b\x1f\x04\x03\xe7\x73\x5f\x36\xbb\xbc\xf6\x41\x36\x7d\xc7\
-\x98\xf0\xf7\xe8\x6b\xda\x06\x17\x3d\x39\x62\x9c\xa9\xe9\x67\x1a\
-\x14\x2c\x06\xa8\x52\x21\xf0\x10\xd4\xf1\xe2\x37\x2b\x7f\xf8\xa6\
-\x5f\x3d\x82\xf7\x81\xbb\x40\x47\xc0\x17\x09\x4c\x56\xbf\x77\x75\
-\x2b\x31\x3d\xac\xfd\x9c\x6c\x62\xc6\x46\x99\x9d\xaf\x93\x69\x4a\
-\x6c\x25\x61\xd5\xcc\x47\xd6\x33\xbc\x2f\x9d\xf8\x1e\xe5\xab\x8b\
-\x3d\x7a\x76\x3a\x17\xad\x49\xe8\x80\xdf\x3d\x1f\xfb\x0e\xe1\x7b\
-\x7f\x85\xc7\xbe\xee\xdf\x11\xf8\x58\x63\x23\x84\x27\xf9\x02\x99\
-\xbc\x55\x4b\x37\x75\x87\x44\x69\x93\x47\x99\xb7\x1b\xdf\x27\x3e\
-\x65\x3a\xb9\x6c\xc7\x8c\x92\x3c\xba\x84\x86\x20\xcb\x29\x18\x42\
-\x14\x3c\xfc\xe8\x80\x51\xc8\x31\xe6\xc4\xe4\xac\xb9\x8b\x49\x26\
-\x52\x10\xe4\x4c\xaa\x43\x89\x49\x2c\x31\x5d\x18\x8c\x66\x93\x27\
-\xe9\x23\xcb\x59\x99\x0e\x7a\x8a\xcb\x1c\x89\x9b\x75\xf1\x8b\x85\
-\x28\xb0\x93\x3d\x30\x7c\x95\x6a\x1a\xd6\x31\xa8\x37\xf1\xab\xab\
-\xf0\xda\x77\xf1\xf5\xbf\x80\x5c\xc3\x3b\x3e\xd6\x1d\xf4\x25\x02\
-\x97\x2b\x3f\xcc\x5c\x96\xfb\xf9\xb8\xcd\x87\x1f\xd1\x0e\x9c\x50\
-\x59\xb2\xef\xc1\x9d\xd2\xde\x42\xdb\x9d\xd8\x8c\xd8\xe1\x09\x97\
-\xa5\x25\x84\x28\x06\x7b\x0f\xcf\x96\xaa\xf6\xa3\xc2\x24\x0c\xeb\
-\xa1\xdb\xc7\xd1\xa7\xf1\xdd\x9f\xe2\xdc\xab\xb8\x01\xdc\xf4\x08\
-\x6c\x68\xf4\xa9\xed\x6e\x90\x3c\x94\x79\x7c\x3f\xa1\x6f\x70\xd2\
-\xfd\x15\x3b\xb2\x78\x31\x63\xa7\xf3\xf4\x02\x24\x22\x47\x7c\x55\
-\x45\xde\x57\x0e\x3c\xd3\x44\x40\x3f\x7b\x61\x25\x53\xc0\x12\x3b\
-\xa7\xd1\x4f\xf3\x50\xa4\xd8\xb9\xdd\x8b\x49\x9c\xc2\x69\x8b\x1e\
-\xa9\x3e\xbb\x11\x1c\x3f\xb1\x1c\x3b\x99\x2b\xaa\xe3\x3d\x4d\x28\
-\xa2\x1a\xf3\xe5\x87\xa8\xd4\xf1\xfa\x1f\xef\xff\xf2\x9f\xdd\x55\
-\xcb\x44\xf3\xeb\x40\xbf\x0a\x9f\xa4\x84\x21\xcc\x73\x52\xa5\x08\
-\x19\xfe\x3b\xe3\xa5\x95\x25\x3a\xd4\x83\xcc\x25\x7f\xfe\x54\xea\
-\xdd\x65\x4e\x27\x6a\x0d\xe9\x91\x1a\x85\x18\x57\xcd\xd8\xfd\xa6\
-\xc7\x77\xf5\x79\x57\x43\x41\x0c\x73\xe2\xd1\xca\xf7\xff\xd4\x3f\
-\xf5\xc2\xdd\xab\xb0\x69\xca\x80\x49\x1b\xe5\x0e\x2b\x63\x32\xf9\
-\xaf\x1e\x38\x3a\xef\x7f\xf0\x31\x45\x16\x46\xab\x2f\xf0\x99\xca\
-\x42\xb4\x3f\xc5\x29\xcf\xd8\xe5\x9c\xb7\x4e\x31\x71\x01\x97\x95\
-\x8a\xa3\xbd\x4e\xed\x59\xb2\x4b\x24\x55\x45\x2f\x84\xbb\x8c\x6f\
-\xfe\x00\x5f\xfb\xa1\xef\x37\xf0\x4e\x48\x34\xef\x5b\x2a\x8e\x16\
-\x43\x48\x33\x42\x54\x37\xff\x0c\x03\x2c\x0e\xf4\x14\x0a\xc3\x97\
-\x91\xf6\x30\x88\x09\xfd\xc7\x65\x9d\xe9\xa5\x5a\x03\xa2\xc0\x73\
-\x8c\x80\x90\x31\x08\xa7\x80\xc8\x3e\xd1\x9d\x8c\xd1\x0c\x54\xa5\
-\x21\xd4\x28\xba\x10\x53\x64\x51\x74\x2a\xf4\x2f\x82\x7f\x83\xc0\
-\x7d\xe2\x61\x47\x80\x8d\xb2\x7b\x53\x1a\xcf\xa4\xc3\x56\xa1\x86\
-\x32\x1e\xf9\xc3\xaa\xc2\xb8\x5a\x8f\x16\x74\x85\x33\x1a\xe5\x16\
-\x16\x25\x06\x25\xf9\x91\x3e\x95\xa1\x6c\x60\x5a\xa9\x61\x46\x8b\
-\x1f\x78\x6b\x7b\x90\x5a\x28\xfa\xae\x80\x6b\x61\x6a\x2f\x80\xaf\
-\x70\xf1\x69\xbc\xf1\x17\x38\xfa\x38\xae\x28\xdc\xe9\xa3\x5b\x23\
-\xdb\x32\x7d\xaa\xf1\x67\xea\xb8\x64\x1e\x85\xb6\x6e\x88\x33\x0a\
-\xc7\x5d\x77\x46\x10\xbf\x57\xed\x8f\x13\x73\x6f\x7b\xb2\xa7\xcf\
-\x0e\x76\x0b\xee\x86\x1c\x01\xb9\xd3\x9d\x80\x9e\x1c\xd7\x8a\x29\
-\xb3\x2b\x25\xd6\x56\x78\x45\x31\xdd\xaa\xc4\x59\xc8\x32\x56\x8c\
-\x98\xca\x0a\x47\xdd\xa2\x2e\xd5\x1b\x14\x59\x92\xd2\x0e\xba\x4c\
-\xd2\xdc\x53\x21\xfb\xd5\x2a\x02\x4f\xf4\x43\xed\x05\x58\x5a\x20\
-\xe9\xe0\xd5\xef\xa1\x35\x87\xdf\x86\xd8\x34\xf1\x6b\x8d\x66\xad\
-\x86\xa9\x1d\xfb\xb9\x22\x5e\x06\xf1\x2f\x5b\x38\x0a\x9c\x68\xc2\
-\xa9\xe0\x86\xc1\x39\x62\xf6\xce\xe8\x3d\x4c\x4d\x7c\x5e\x5f\xf2\
-\x81\x51\x4d\x67\x10\xe5\xb3\xa6\xaf\xf7\xba\x89\x7b\x07\x99\xa5\
-\x51\x51\xd1\xdd\x89\x9f\x65\x70\xc1\x8e\xf2\x3c\x03\xe9\x51\x6d\
-\x43\x64\xa6\xad\x43\x28\x5f\xf7\x80\xc7\x5f\xc2\x1f\xff\x0c\x07\
-\x2f\xe2\x0a\x70\x5b\xa1\xed\x0c\x33\x36\xe9\xa5\x12\x45\xb1\x2a\
-\x02\x36\x1e\x16\x14\xce\x36\xb0\x24\x71\xb7\x8d\xcf\x24\x7a\x4d\
-\x37\x15\xbe\xc8\x87\x67\x61\xbb\xa4\x9b\x8a\x9d\x2a\xdd\xe5\xbb\
-\xa5\x06\x91\xee\x48\xe3\xc8\x94\x76\x3c\x06\x4a\x95\xc5\x70\xe9\
-\xea\x81\x2e\x72\xe0\xa3\x62\xba\x59\xb4\xe9\x38\xa5\x9b\xe4\xac\
-\x9d\xb8\xa5\xb5\xb6\x92\x64\xd4\x0c\x51\xe9\x8c\x8d\x10\xa3\x27\
-\xac\x93\xff\x18\x8b\x77\xa1\x02\x6c\x74\xb0\x7f\x1f\x7e\xf2\xa7\
-\x78\xee\x8f\x70\xdf\xc1\xaf\x81\x96\x42\x4f\xc4\x96\x2d\x53\x9e\
-\x3e\xfa\xf0\x68\xe9\xca\x00\x95\x2e\x8e\x57\x71\xb0\x4e\x92\xc2\
-\x3b\x0a\x9b\x4d\xf4\x0c\x78\xfe\xb7\xd7\x67\x38\xeb\xe6\x23\xf7\
-\x5a\x2c\x72\xcf\xdd\xc7\xee\xe9\x21\x13\xd2\x8f\x62\xac\x83\x17\
-\x3b\x6a\x8a\x10\x53\xf9\x82\xb2\x13\xd6\xb6\xc8\xc4\x30\xc3\x58\
-\xb6\x0f\x5f\xe3\xf9\x6f\xe2\x7b\x3f\xc6\xca\x29\xeb\xe6\xa3\xc6\
-\x29\x99\xf1\x18\x32\x8b\x2e\xcd\x7a\x70\xda\x38\x14\xe2\xe8\x1c\
-\x23\xdd\x2b\x3e\xee\x2b\x74\x6c\x0c\x60\x8e\x5d\x9b\x60\xf7\x62\
-\x57\x69\x01\x4c\x23\x8b\x30\x36\x67\x2c\x66\xed\xd4\x9c\x5d\x73\
-\x6f\x02\xef\x32\x2f\xf9\xa6\x77\xe8\x5c\x0b\xd3\x7c\x3b\x0c\x79\
-\xca\x2e\xaa\xac\x31\x45\xe7\x8c\x6f\xea\xfd\x76\x2a\xb3\x2f\x53\
-\x2c\x9c\xda\x56\x18\xbc\x26\x27\x2f\x6c\x29\x5a\x11\xd8\xa0\x0f\
-\xac\x1d\xc3\xf7\xbe\x8f\xa7\xbf\x4b\x73\xff\x8d\x25\x96\x79\x8a\
-\x4d\x83\x03\x43\x0f\x53\x37\x55\xda\x35\x13\x68\x2c\x7b\x38\x5d\
-\x47\xd3\xc1\x0d\x1f\xb7\x43\xb4\x2b\xf0\x04\x5f\x19\xb3\xd6\xe4\
-\x78\xfe\xbd\x18\xf7\xbc\xc4\x74\xe1\x51\xa1\x59\xe8\x74\x72\xb5\
-\xd0\x30\x4a\x84\xe9\x0a\x66\x4c\x88\x02\x2b\xcc\xef\xe0\x72\x12\
-\xef\x52\x94\xc4\xaf\x65\x9a\xa6\x53\x76\xc4\xe5\xff\x5a\x5a\x11\
-\x93\x25\xdb\x91\x9e\x74\x9f\x75\xf1\xb5\xc7\xd4\x8c\xe4\x05\x43\
-\xe3\x94\x13\xe6\x18\xa4\x2f\xad\x58\xfd\x41\x8c\x8d\x6d\xf2\x57\
-\x3d\x85\x6b\x18\x24\xd7\x1d\xcd\xec\x7b\x10\xd2\x67\xbf\xfc\x8d\
-\xea\x77\xfe\xdc\x9b\x5f\xc3\xfb\x26\x7e\x05\xfa\x11\x9a\xcf\x7a\
-\x7a\x27\x79\xa3\x31\x6b\xf3\xae\x46\x17\xe7\x6a\xd8\xdf\xc4\xba\
-\xc6\x27\x01\xb6\x2a\x51\x57\x6d\x9c\xcf\x49\x2e\xfd\x73\xc2\x39\
-\x83\xb4\xa9\xde\xeb\x10\xf9\x41\x93\xd4\x1f\x1a\xd3\x73\x86\x2d\
-\x6b\xac\x40\x83\x40\x81\xde\xc1\x03\xba\x46\xb1\xd3\x74\x9f\x72\
-\x63\x82\xbe\xb2\x89\xda\x76\x1f\x47\x4f\xe1\x8f\x7f\x8a\xc7\x5f\
-\xf5\x6e\x68\xfc\xb6\xc7\x42\x53\x60\x8d\x3e\xc6\xf1\x61\xac\xc8\
-\x3d\xf8\x0a\x35\x64\x0f\x87\x2b\x38\x3e\xcf\x0c\xfd\x65\x13\x12\
-\x28\xae\x93\x7e\xc2\xcc\xd1\x89\x8f\xb5\xa6\xef\x3e\xc4\xcb\xdb\
-\x45\xb4\xba\xe3\x3a\x5f\xde\xcd\x97\x09\xdd\x8c\xf0\x14\x76\x7c\
-\x6e\x3b\xbe\x57\x3a\x29\x14\x94\xf1\xe3\xd5\x80\x4f\x31\xe9\x13\
-\xf7\x58\xd4\x5f\xec\xda\xb9\x4c\xa2\xc1\x09\x8f\x97\x2f\x2c\x9d\
-\x46\xd4\xf0\xed\x6f\xe2\xf5\x9f\x40\xad\xe1\x6d\x60\x5b\xc0\xab\
-\x67\x88\x65\x8e\xfd\x9f\x4e\x21\x61\x03\x8a\x16\x7d\x9c\x75\x51\
-\x17\xb8\xe1\xe1\x66\x85\x21\xaf\x6f\xdf\x12\x22\x13\xfb\x26\xd0\
-\xf1\xc1\xf8\xfb\x71\x73\x78\xbe\x18\x19\xcc\xcf\x5d\xca\x34\x7f\
-\x02\xa5\xa7\x94\x92\x1a\x9f\x4a\x2e\x21\x77\x93\xd5\x17\x5c\x26\
-\x44\xd0\x7f\x1b\xab\x34\xb8\xfc\xc4\xe3\xf8\xee\x8f\x71\xe1\x19\
-\xdc\x52\xb8\x16\x32\x4d\x19\x81\x72\x95\xba\x34\x91\xea\x34\x0e\
-\x15\x6a\x1e\x8e\xbb\x38\x50\x61\x9e\xe7\x32\xd0\x72\x88\x76\x02\
-\x27\x36\x7a\x31\xc4\x36\xe9\xfb\xe3\x3e\x74\x23\xd8\xd3\x3b\x38\
-\x6b\x21\x70\x07\x6a\xf4\x7b\xbc\xe9\x97\xcb\xec\xc8\x49\x77\x6c\
-\x10\xf3\x3c\x64\xc2\x0f\x3f\x77\x04\x29\x85\x7b\x79\x7c\x73\x39\
-\x3d\x8d\xfa\x3c\x5e\xff\x4e\xe5\x6b\x3f\xf2\xf5\x1c\x7e\x6b\xcc\
-\x37\x45\xca\x48\xfb\xec\x01\x01\xc1\xc0\x21\x13\xf8\x1e\x16\x38\
-\x51\x45\x18\xc6\x3c\xfb\xae\xcb\x3c\x4f\xe8\x0c\xc3\xdc\x12\x8b\
-\x73\x67\x36\xd1\x31\xbc\x00\x39\x69\xff\xd5\xce\xb8\x08\xc7\x5c\
-\xff\xc8\x11\x74\x09\x19\x7d\xe2\xc0\x19\x29\x66\x5e\x09\x65\x1d\
-\x40\xa3\x81\x72\x2a\x59\x9e\x1e\x12\x93\x51\xe1\xcb\xde\x9c\xf1\
-\xe4\x0e\x39\xc2\x5d\x91\xe5\xda\x2a\xa9\x8c\x07\x92\x72\xa9\x28\
-\x1a\x5d\xa1\xe4\x8c\x60\x43\x4c\x8a\x38\xc3\x14\x88\x92\x89\x30\
-\x89\x48\x2d\x03\x3d\xe9\x78\x32\x65\xb6\x11\x7f\xb8\x62\x01\xbd\
-\x8f\x7e\x07\x17\x9f\xc7\xf7\x7f\x8a\x63\x4f\xfa\x9f\x01\x77\x35\
-\xfa\x49\x91\x55\x27\x9e\xde\x4d\x0d\x7d\x50\x11\xb0\xe9\xe1\x64\
-\x15\x8d\x0a\x6e\x85\xb8\x25\xd1\x71\xb8\x5d\x28\x31\x44\xf3\x3a\
-\xb5\x39\xa8\xec\x4e\x28\xbe\x20\xba\xb0\x5f\x88\x8a\xef\xae\xa3\
-\x8e\xd2\x1d\x63\xec\xc7\xaa\x11\xc1\x4d\x31\x29\xe5\x31\xd1\xd1\
-\xec\x35\x1c\xd7\x13\xaf\x51\x4e\x22\xc7\xc9\x94\xde\x96\x62\xc6\
-\x06\xaa\xe6\xa9\x7e\x4f\x62\x79\x15\x3f\xfc\xa9\x7c\xe9\x0d\xd5\
-\x6e\x30\x69\xd3\x35\xe6\x9b\xd0\x69\x54\x2a\x63\xe3\xf6\x10\xd6\
-\x63\xa3\xaf\xb5\x19\xbf\x1e\x98\xc3\x56\x88\xf7\xfb\x94\x48\xf0\
-\xa2\x74\x8d\x48\x51\x86\xb2\x99\x39\xa9\xb3\xfa\x8a\x5f\x9c\x3e\
-\xc3\x87\x36\x5d\x70\xd6\xcd\xad\xac\xfe\x90\x6e\xe0\xda\x15\xc4\
-\x9a\x9e\xf9\x53\x66\x7c\x62\x6f\x56\xf8\x34\x2f\x17\x59\x81\xce\
-\xe1\x26\x29\x27\xd8\x3d\x0d\x33\x88\xed\x31\x94\xe6\x5f\x7d\x83\
-\xc2\x9f\x7c\x16\x3f\x78\x13\x47\xce\xa8\x4f\xc0\xba\x52\xdf\x89\
-\x53\x8d\x32\xcb\x0c\xa7\xcf\xb6\x46\x8f\x0e\xf6\x0b\x9c\x6c\x70\
-\x53\xfd\xb4\x8f\x0d\x87\x74\xb4\x20\xd9\x6f\xf2\x16\x3f\x3c\x6d\
-\xcb\xbd\x1b\xc2\x0d\xe9\x3e\x3c\xe5\x82\x89\x20\x0f\x13\xe5\x8b\
-\xc5\x2e\x46\x45\xc8\xd9\x4e\x6c\x24\x99\x3d\xb0\xf2\x99\xbd\x69\
-\x89\x2f\x94\xa2\x34\x0e\x2d\xad\x45\x0c\x6e\xc2\x78\x3b\x96\x93\
-\xe7\x00\xa1\x68\x31\x8f\xeb\xbd\x1c\xc9\x3b\x8d\xe7\xf3\xe4\xbe\
-\x1c\x4b\x28\x50\x56\x91\xd8\xa9\xa0\x0d\xcc\x1f\xc4\x8f\xbf\x8d\
-\x57\xbf\x85\xfb\x75\xfc\x46\xb3\xa8\xe4\xcb\x24\x4d\x69\x2d\x57\
-\xa6\x6e\x8c\x22\xdf\x1e\xf3\x7d\x1c\xd7\x58\x6e\xe0\x6e\x88\x1b\
-\x12\xad\x0a\xa1\x3c\x6f\x6d\x60\x17\x86\x9b\xb9\x97\x83\xc0\x37\
-\x4e\xe3\xc8\xe1\x06\xc2\x5f\xee\x09\xff\x5e\x3e\xb8\xd1\x4e\xbf\
-\xff\x5f\x22\x69\x84\xdd\x01\xb1\x7f\x4a\xaf\x31\xf3\x10\x31\x99\
-\x84\x49\x83\xfc\x68\x19\x3a\x2f\x19\x6b\x3e\x71\x1c\x96\x1e\xf1\
-\xbd\xd6\x1e\xcd\x7d\x30\x8e\xd9\xd7\x78\xe6\x39\x7c\xff\xcf\xb0\
-\x72\x1c\x1f\x03\x1b\x60\x50\xab\x44\x4c\x26\xa3\x75\x8a\xc1\x09\
-\xd2\x49\x33\x31\x1f\xe0\xb8\xc2\xe1\x1a\xfa\x2e\x3e\xf4\xb0\x59\
-\x8d\x99\x39\x71\xa5\xd6\x4d\x34\x73\x72\xfb\x52\x9e\xc8\x10\x2a\
-\xc8\x16\x4e\xb8\xee\x54\x37\x4c\xcc\xc8\xaa\x2b\xcd\xd0\x0f\x94\
-\xf2\x65\xe2\x3e\xf5\xb4\x47\x10\xe5\xcb\x66\x86\x85\x27\xa6\xbe\
-\xd8\x5c\x2e\x65\x72\x5c\x58\x46\x2f\xcb\x42\x38\x39\x72\x2b\xdc\
-\xd1\xa9\x69\xa3\x7d\xe1\x3a\xfb\x21\x62\x52\x28\x52\x7e\xeb\x74\
-\x9a\xbf\x32\xc6\x05\x39\xb9\x5b\xa1\x27\x05\xbe\x23\x83\x3b\x95\
-\xad\x90\xd8\x4f\x0c\xa3\x0d\x33\x24\x6f\x7e\xf1\x10\x7e\xf0\x23\
-\xbc\xf8\x75\xac\xd7\xf0\x9e\x42\x47\xa6\x7c\xb0\x45\xe1\x32\xa1\
-\x9a\x0d\xe2\xd7\x85\x1e\x4e\xd4\x51\x31\xf1\x6b\x80\xbb\x82\x1c\
-\x1b\xbf\xa8\x65\x56\xe7\x7a\x33\x52\x51\x6c\xec\xec\xe5\x16\xd6\
-\x80\xc3\x0b\x66\xff\x71\x77\xe7\x39\xa6\x40\x2f\x42\x94\x84\x48\
-\x62\x27\x9c\xa7\x62\x59\xbf\x5d\x53\xa9\x27\x2e\x95\xa9\xa4\x63\
-\x6c\xc3\x87\xc8\xe5\xf8\x54\x11\xeb\x5d\x97\x9a\xf9\xe8\xdd\x92\
-\x79\x46\xd0\xac\x55\xbc\x29\xa5\x4d\xc6\x64\xa2\x26\xf2\x1a\x46\
-\xc4\x40\xdd\x61\xf7\x89\x63\x7d\xbc\xf1\xe2\xcf\xbc\xbc\xf2\xbd\
-\x37\xd7\xf7\x9d\x64\xa7\xc8\xfd\x90\xd9\x46\x95\x6a\x85\x19\x90\
-\x28\xa3\x45\x17\x86\x70\xbb\x38\x54\xc5\xa1\x79\x6c\x04\xb8\x12\
-\xb0\x4f\x9c\x55\xdb\xac\xd1\x8b\xdc\x2e\x24\x52\xeb\x9a\xcf\xc2\
-\xc6\x0c\xca\xc7\x8a\x8f\xa3\x0d\x54\x25\x6e\x2a\xdc\xfb\x1f\x73\
-\x1f\x1e\x5a\x0e\x4a\xce\xb6\xd0\x52\xff\x74\xf6\x0c\x19\x8e\x2f\
-\x7b\xcf\xc2\xa6\x99\x70\x2b\xa4\xe3\x06\xaa\xa1\xf5\x36\xa3\x9b\
-\x3e\xe6\xd7\xf0\xdd\x1f\xe2\x4b\x7f\xb0\x7e\xdf\xa5\xbc\x47\xcf\
-\x66\x42\x07\xc1\x68\x5a\x42\x54\xda\xc4\x6e\x10\x60\x49\x33\x4d\
-\x69\xfe\xf9\x89\xc6\x5d\x4b\xd7\x09\x13\xaa\xbd\xd0\xc3\xed\x65\
-\x88\xa4\xec\xd2\x1a\xec\xac\x8e\xe5\xae\x05\x0e\x9d\xce\xa2\x8f\
-\x63\x02\x73\x35\xdc\x51\xb8\x16\x60\xcb\xd8\xbc\xbb\x3b\x9d\x40\
-\x29\x26\x78\x65\x31\xa6\xed\x72\x0a\x09\xf3\xb4\x47\x29\x24\x48\
-\xed\x81\xdc\x4d\x59\xf2\x6e\x40\xea\x12\x53\xc4\x9a\x63\x77\x18\
-\x29\x76\xb2\x02\x76\xdc\x63\x30\x73\xa6\x55\x8e\x0e\x34\x1f\xd9\
-\x18\x26\xaa\x57\xc8\x1c\x65\x55\x74\x4d\xcc\xb9\xcd\x4c\x4b\x05\
-\x4f\x3d\x87\x3f\x7e\x13\xf3\xa7\xf0\x91\xc6\xb6\x89\x42\x2b\x29\
-\x7f\x1c\x6d\x93\xa9\x4f\x37\xc0\xc6\xed\xe3\x94\x8b\xe5\x1a\xd6\
-\x15\x6e\x7b\x68\x87\xcc\xf3\x28\x27\xd5\x15\x2e\x32\x24\x85\xc2\
-\x73\x30\x46\x6f\x7c\x7c\xbd\x47\x1f\xbf\xbf\x82\x7b\x0a\xbf\x09\
-\xb1\x25\xd1\xb3\xf9\x1f\x67\x7c\xfe\x5e\xa9\x29\xa0\xed\x43\x71\
-\x9f\xb3\x02\xa2\xe9\xe1\xcd\x44\x0e\xef\x03\x0a\xc5\x45\xf9\x10\
-\xf0\x91\x15\xaa\x73\x99\xa8\x9d\xa5\x6b\x26\x5e\x51\x19\xe0\x2a\
-\x70\xe7\xe5\x83\x38\x91\x34\xd3\x98\x08\x72\xf1\x20\xbe\xfd\x27\
-\x6b\x2f\x7e\xfd\xce\x76\x05\x1f\xf8\x68\xb9\x71\x9a\x12\x99\x70\
-\x77\x48\x9e\x09\x5b\x58\x96\x38\xd2\xe4\xaa\xf8\xd8\xa7\x63\xee\
-\xd7\x89\xe6\x45\x36\x83\x24\xb3\x65\x29\xa4\x85\x12\xa2\x2a\x95\
-\x8d\xd4\x8f\x29\x1c\x71\xd1\xf1\xf1\x2e\x70\xc7\x65\x65\xc0\x1f\
-\x64\x3c\xc7\xe3\x1c\xb9\xb7\xfc\x05\x31\xdc\xa1\x0a\x69\x98\xe3\
-\x72\xe1\xe2\x41\x25\x7e\x66\x10\xc2\x9f\xf2\x54\x27\x9a\xd8\x88\
-\x12\x7f\xf6\x76\x88\x3d\xad\xe2\xa5\xc3\xa1\x89\x45\xee\xbc\x84\
-\xbf\x23\xc6\x84\xc1\xa3\xd9\x58\x91\x00\x7d\x13\xc8\xfa\x12\x4f\
-\x3e\xc3\xdc\xfc\xea\x99\x3b\x57\xad\xa0\x8d\x71\xfc\xc6\xe8\xa4\
-\x13\x67\x8f\x9c\xac\xc9\x1a\x73\x64\x63\x94\x71\xf3\x75\xdc\xed\
-\xe1\x86\x8b\x5e\x85\xb4\x4a\x65\xc5\x11\x98\x05\xd1\x19\x21\x7f\
-\x9d\x5a\x33\x48\x25\x28\xa3\x94\xe7\x9a\x8b\xa3\x01\xeb\x5c\x97\
-\x05\xd1\x7c\x4b\xf0\x94\x42\x4b\xf6\x4c\x3e\xdb\x1d\x16\xc6\xa7\
-\xa7\xba\xc8\xe9\x19\x88\x3a\x69\xdd\x90\xd6\x07\xeb\x2c\x17\x5c\
-\x17\xa4\xf0\xf3\x89\x82\x42\xa2\xbf\x33\xbd\x7b\x1e\x8b\x6d\x74\
-\x89\x11\x48\x51\x70\x6e\xc3\xe1\x56\x69\xc3\x95\x99\x2d\x7e\x64\
-\x07\x91\x65\xd9\x15\x5d\xb2\xbe\x44\x69\x17\xf6\x44\xc1\x64\x9d\
-\xef\x2f\x29\x4c\xc0\xcb\xa2\x0e\xf1\xc2\x3b\x56\x36\xe4\x67\xa0\
-\x31\x21\x92\x74\x49\xf2\x58\x7b\x1e\xea\x73\xf8\xc1\x4f\xf0\xea\
-\xb7\xd1\xaa\xe1\x03\x8d\x8e\x4e\x6a\xd2\x4e\x2a\x9d\x95\xc0\xab\
-\xd0\x86\xb0\x26\xe8\x3c\xd6\xa0\x4a\xc2\xc7\x3d\x6c\xba\x8c\x5f\
-\x55\x52\x54\x1d\x64\xb1\xc6\x28\x5a\x44\x35\x12\x03\x6c\xe6\xcd\
-\x71\x5c\x34\x05\xae\xd5\x70\x5d\x91\xa3\xe6\xd9\xe4\x69\x98\xa4\
-\x4a\xe3\xca\xf1\xe7\xc0\x53\x78\xd0\x0a\xe8\x9f\xfb\x1c\x66\x31\
-\x95\x77\x18\x63\xd6\x3b\xae\x59\xef\x52\x95\x49\xcc\x94\x0e\x4e\
-\x3a\xbe\x23\x16\x40\xe8\xd7\x3d\xdd\x33\xf6\xfa\xe8\x33\xf8\xd1\
-\x9f\x56\xd7\x1e\xf1\xae\x86\x44\xf3\xbe\x88\xe9\x03\xc8\x48\xb8\
-\xc6\x8b\x85\x6e\xbe\x87\x93\x82\x68\xfe\xae\xc7\x8e\xaa\x4e\x3d\
-\x26\x1d\xe4\x73\x91\xe9\xc8\x48\x46\x75\xdf\xe4\x9f\xc6\xac\xab\
-\x7d\x7b\x9c\x06\xee\x09\xbc\x07\x6c\x7b\xf0\x12\x60\xa3\x52\x19\
-\xb0\xe4\xde\xba\xb3\x5d\xbf\xdc\x11\xd7\x5c\xc8\xd9\x07\xc5\xcc\
-\xae\xbb\x52\xd8\x15\x3e\xfd\xa9\x8e\x0c\xb1\x9b\x72\x58\xda\xe4\
-\x28\x76\xe2\xfd\x11\x3b\x9f\xb3\x34\xad\xf2\x66\xbe\x56\x2d\x66\
-\x78\xb8\x32\xdf\xfb\x36\x30\x7a\xfb\x03\x1b\x9a\xfc\x5e\xbd\x82\
-\x3f\xfc\x1e\x5e\xff\x29\xfa\x35\xef\x0a\x48\x14\xf3\x31\x4c\xc6\
-\x8b\x5c\xb6\x51\xf4\x28\x70\x70\xa4\xce\x17\x7d\xdc\xc5\xb6\x4b\
-\x71\xbf\xc0\xb2\x19\x24\x8a\xf7\xf3\xb4\x62\x61\x74\x64\x03\xe5\
-\x45\x07\x47\x1c\x1c\xa8\x73\xa0\xc3\xbb\x01\xee\x49\x96\x05\x82\
-\x6a\x5c\xfd\x45\x01\xaf\xcf\xda\xfd\x0c\xde\x45\x3f\x00\x16\xf1\
-\x17\x2c\x2f\xf9\x6f\x52\xbd\x5e\xef\x72\x1f\x28\x4a\xca\x8a\x81\
-\xeb\x56\x68\x0b\x1c\x39\x8b\x37\x7f\x82\x8b\x2f\xb2\xef\xfb\x5e\
-\x02\x60\x06\xb9\x22\x9d\x0d\x6d\x94\x2d\x63\x1d\x55\xd8\xe7\xe2\
-\x76\x80\xdb\x06\xcd\x37\xb9\x48\xa2\x97\x55\x7c\xeb\x4d\x9c\xd1\
-\xd4\x6a\xbe\x0e\xa4\xcd\xca\x09\x99\xb1\x31\x2f\xff\x6c\x1b\xd7\
-\x9b\x5c\x3c\x3c\x8e\xcf\xac\x91\xce\xb6\x59\x65\xd2\x57\x26\xae\
-\x15\x5f\x48\xf3\x9d\x92\x2b\xb2\x13\x0c\xb2\x47\x67\x3b\xab\xb8\
-\xd0\x88\xfe\xb8\xd8\x2b\x25\xf8\x5d\xc4\xe8\xbb\xb9\xab\x51\x99\
-\x49\x85\xe8\xf7\xf0\xe5\xaf\xe3\xfb\x7f\x0e\x77\x05\x6f\x2b\x3a\
-\x5d\x5f\x0c\xe9\x65\x3a\x45\x9d\x87\xcd\xcc\x98\x9b\xb0\xa0\xe8\
-\xa1\x75\x13\x97\x7b\x71\xff\x6b\x98\xf2\xcd\xa2\x32\xba\x33\xe4\
-\xbf\xcc\xeb\x1b\xd6\xcd\xcf\x35\x70\xcb\x18\xbd\xc2\x76\xd3\x32\
-\x7c\x6c\x7f\xba\xae\x14\xbf\x57\x24\x89\xa6\xba\x72\xc7\x6e\xb8\
-\xbb\x7c\x26\x22\x9b\xfc\x9e\x86\x05\x35\xb6\x97\x34\x9d\xad\x1f\
-\xa6\xf3\xe5\xd8\x2c\xe0\x44\xa3\x17\xe3\x3a\x0a\xf2\x51\x75\x59\
-\x43\xb0\x2c\x09\x37\x75\x36\x0d\xae\x73\xcd\x10\x5a\x4c\xda\x73\
-\xc4\x04\x10\xaf\x4b\xf0\xcc\xc4\x87\x28\x45\x69\x6c\x5d\x90\xc5\
-\x97\x29\xc0\xa0\x29\xe5\xe1\xfb\x68\x1e\xc2\x8f\xfe\x0a\x2f\x7f\
-\x1d\x77\x1d\x7c\xaa\x58\x90\xca\x67\xad\x58\xbd\xf5\x69\xcd\x74\
-\xf3\x01\x0e\x02\x07\xab\xb8\xab\x70\xdb\x27\x9a\x0f\xb2\xc9\x22\
-\x59\x94\xf4\x4a\xaf\x9c\xd0\xe7\xca\x39\xac\x70\xb0\x81\x2d\x8d\
-\xb7\x7d\x6e\x2f\x51\x56\x5e\xdb\x10\x5c\x0d\xb3\x27\x31\xf7\x61\
-\x70\x87\xb9\x1a\x43\x9c\xf4\x71\x4e\x3c\xe8\xb8\x56\xee\xc0\x21\
-\xcf\xf2\x82\xdd\x8b\x1c\x4e\x0c\x21\xc4\xa4\xdc\xee\x2c\xe4\x25\
-\x31\x5e\x87\x62\x67\xfa\xc0\xce\x6e\x6f\xea\xf8\x37\x0c\x84\x26\
-\xa3\x6f\x6d\x21\x78\xa0\x70\xee\x09\xfc\xc9\xff\x8c\xc3\xe7\x71\
-\xd5\xc3\x56\x00\xbf\x36\x34\x38\x27\xf5\x5e\x37\x49\x62\x36\xbb\
-\x38\xd2\x40\xcd\xac\x90\x90\x4d\xdf\xbe\x1c\xed\xf8\x1e\x19\x19\
-\x3a\xf8\xa5\x93\x94\x63\x43\xbb\x57\x1c\x93\x50\x75\x76\x8e\xdf\
-\xb6\x92\x38\xdd\x54\x3f\xca\x40\x15\x70\x98\x3b\x1c\xe8\x04\x7a\
-\x5c\x72\xe7\x1c\x34\x6b\xe8\xf4\x5d\xa1\x1f\x24\xe7\xfd\x61\xc3\
-\xe5\x07\x5f\x62\x1b\x5f\xb2\x99\xb8\xc9\x88\x5d\x08\xef\x4c\xec\
-\xc7\x9f\xf2\x80\xb3\xa2\x1a\x69\xd3\xe7\x2c\x06\xf9\xf6\xc2\x15\
-\xb9\x74\x5f\xfb\xde\xe1\xef\xfe\xec\x46\xd0\xc4\x47\x3e\xeb\xa9\
-\xbe\x93\xd1\xb1\x49\xdb\xae\xb0\x8b\x64\x45\xe3\xa4\xc1\xdf\x21\
-\xab\xb6\x6d\x97\x89\xf9\x20\xfb\x1a\x31\xe2\x85\xf4\x50\x54\x38\
-\xee\xa3\xed\x92\x92\x69\xac\xf6\x56\x88\xcf\x42\xb4\x25\x7a\x6e\
-\x1c\x07\xeb\x9c\xf3\x11\x29\xfe\x3e\xf3\x9b\x21\x2e\x98\xd8\x37\
-\x80\xb7\x85\xce\x3c\xea\x8d\xb4\x4e\xe0\x9e\xe2\x3f\x4c\x31\xcb\
-\x7b\xfa\xe5\x51\x2c\x36\x28\x8b\x9f\xfd\x6c\xc3\xf4\x66\x3c\x93\
-\x11\x73\x97\x53\x1f\x61\xdc\xec\x83\xf1\xac\x2f\x4c\x6b\xee\xf9\
-\x23\xa7\x4f\x46\xee\xb8\x7d\x82\x98\x58\x86\x4a\x69\x6b\x67\x2b\
-\x2b\xf8\x93\x9f\xe0\xa9\x6f\xdc\xb8\x66\x0b\x52\xbd\xca\x90\x06\
-\x9c\x46\x9d\x91\x9f\x36\x4b\xc5\x38\xda\xd3\xc0\xe2\x1c\xcc\xeb\
-\xef\xc9\x21\x9a\xd7\x85\xe6\x9e\xe3\x2b\x72\xb8\x83\x71\xd5\x0e\
-\xf6\xcf\x63\x5b\xe1\xed\x3e\xee\xd5\xe0\xd9\x26\x74\x3f\xa7\x8c\
-\x39\xfc\xd9\x46\xde\x26\x7a\xae\x77\x70\xca\xc1\xf1\x1a\xa4\xcf\
-\xc5\x29\x56\x58\x2e\xb8\x77\xcf\x8d\x57\x70\x74\x91\x52\x7c\xb1\
-\xdd\xf9\x8c\x31\xe5\x03\xfd\x44\x39\x1d\xbc\x11\xbb\xbe\x57\x13\
-\x7d\x84\x28\x59\x2a\x62\xaf\x86\x17\x29\x48\xa5\x42\xc1\xb6\xd7\
-\x47\x9e\xc2\x4f\xff\x03\x56\x4f\xe2\xa3\xbe\x15\x21\x93\x31\xf8\
-\xd6\x29\xb7\x3d\x88\xe6\x8c\x9b\x9f\xf3\x70\xaa\xce\xdf\x7c\xec\
-\x61\xbd\x3a\xf4\xf1\xaa\xc8\xd6\x33\xb9\xce\xa8\xdb\xd0\xe3\x11\
-\x4e\xd4\x78\xf4\x8f\x15\xdb\x4d\x0c\x94\x37\xae\xc7\x0b\xb9\x63\
-\xa8\x12\x2e\x5d\x54\x1c\x70\x7b\x38\x12\xe0\x4c\x13\x4d\x1b\xcb\
-\xfa\x15\xc6\x03\xdd\x3e\xaa\x02\xfb\x22\x5d\x58\x29\xf7\x2e\xb1\
-\xb0\xa7\x42\xe1\xe3\x69\x67\x91\xe2\xca\xce\x3f\x6b\x7c\xf6\x43\
-\xa3\xb0\x29\x5f\x4e\xed\x8f\x67\xfb\xb8\x09\xa9\x93\xd4\x2b\x65\
-\x29\x95\x48\x66\x69\x05\x72\xc6\xb0\x61\x78\x45\x32\x09\x5e\x13\
-\x61\x71\x15\x30\x49\xf2\xfa\xb7\xaa\x7f\xf4\x53\xaf\xd7\xc4\xfb\
-\x9a\x25\xd5\x50\x0c\x95\x87\x75\x0e\xe1\x68\x1f\x6b\x92\xf2\x94\
-\x9b\x6d\x7c\x56\x47\xb7\x6a\xb7\x4a\x31\x8a\xe3\xf3\x6d\x67\xd1\
-\xe5\xb2\x14\x15\x90\x71\xb0\x52\xc5\x9d\x2e\x3e\xa9\xa2\x1d\x70\
-\xe1\x19\xf3\x55\x56\x67\x4a\x15\xe5\x37\x63\xc6\x7f\x88\xb5\x1e\
-\xce\x35\x98\xd4\x57\xb6\x60\xbc\x65\xec\x3e\x40\x03\xd8\x5f\x27\
-\x40\xba\x11\xb8\x5a\xec\x08\xe1\x14\xe8\xf5\x21\xe6\x23\xa4\x53\
-\x19\x13\xa8\x7c\x62\x52\x50\x38\x3b\xb7\xbe\x10\xe4\x64\xb4\x0f\
-\x46\x66\xd7\x94\xb1\xf9\x45\x1c\x32\xea\x2c\xa1\x48\x65\xf9\x83\
-\x05\xab\xb1\x24\xe4\x28\x55\x86\x9b\xb8\x1e\x64\x69\x63\xca\xc8\
-\x3f\xd5\x4e\xb7\xe5\xd1\x17\xb8\x56\x90\x4c\xd9\x48\x51\xa2\xaf\
-\xd0\x5c\xc2\x4f\x7f\x86\x17\xbf\xe5\x5d\x23\x79\x9d\xad\xdf\x41\
-\x42\x90\x54\x29\x8b\x1f\xd2\x80\xbb\x38\x2e\xb1\xe8\xe0\x5a\x17\
-\xf7\xaa\x96\x50\x69\x1b\xa9\x06\x57\x26\x47\x9c\x48\xd6\x55\xab\
-\x1e\xf6\x81\xac\xb2\xae\xc6\x3b\x3d\xdc\xad\xa2\xe7\xc4\x92\x38\
-\xaa\x24\xa3\x11\xe9\x04\x9a\xd5\xd2\x6c\xe3\xbc\x8b\xd3\x4d\x7a\
-\xf3\x4d\x8f\x85\x5b\xb3\x33\x34\x6a\x30\x90\x7e\xcb\x66\x3c\x5b\
-\xec\x40\x77\x77\xde\x35\xbb\x7b\x15\x97\x3d\xcc\xa6\x3f\x08\x60\
-\xa3\xd5\x70\xb4\xc1\xce\x83\xce\xdd\x03\x9b\x19\x5f\x2f\x77\xdf\
-\x16\x17\x58\x75\x55\x05\xc7\xc0\xf1\x1e\x4e\x9e\xc5\x9f\xfe\x4f\
-\x38\xfc\x28\x43\xd8\x96\xcd\x91\x93\x2e\xa6\x87\xaa\xb1\x4e\x18\
-\x27\x71\xb4\xdd\x84\x9b\x3e\x89\xc4\xa1\x8b\x8f\x02\x6c\x35\x86\
-\x19\x46\x2d\xd2\x4a\x7d\x99\x0b\x34\x98\x44\xd5\xe3\x0e\xf1\x66\
-\x1f\x47\x25\x1b\xac\xae\x05\xe4\xd8\x6c\xd5\x87\x74\x83\x74\x73\
-\x96\xce\x16\x62\x29\x80\xdc\xc3\x69\x89\x8b\xf3\x98\x57\xd8\x0c\
-\xb1\xdd\xe6\x55\x34\xe7\xb9\x35\xdd\x0f\x70\x5f\x53\x85\xaa\x2b\
-\x99\x09\x5d\xec\xba\x63\xdd\xbc\x98\x61\x01\xc4\x7a\x85\x62\x5a\
-\x1f\xbc\xb3\x9c\x43\x81\xcc\x98\x98\xd1\x0a\xa7\xae\xcb\xa6\x33\
-\xd6\x05\x39\xef\x19\x87\x5d\xee\xea\xf7\x53\x38\x1a\x29\x76\x6e\
-\xe8\x23\x2f\x90\xd1\x24\x40\x49\x5c\xf1\xec\x97\xf0\xe3\xbf\x34\
-\xf8\xc0\x32\xcc\x2a\xf6\xf7\xda\x26\x16\x45\x4a\xbd\xcc\x49\xc6\
-\xc8\x1a\x3f\xad\x59\x40\xdd\x50\xb8\xee\x11\x8b\xfb\x83\x78\x57\
-\x8c\xa6\x29\xd3\x19\xe0\xb0\xce\xf8\xd5\xd9\xc2\x81\x06\xd6\x1a\
-\x54\x80\xfa\xa0\x87\xf5\x0a\x83\x66\x3f\x29\xfd\xa6\x49\x07\x2a\
-\x2b\xfc\x6d\x80\xcd\xfe\x10\x8f\x39\x38\x0c\x6c\x79\xb8\xe6\xf2\
-\xaf\xf5\x39\x12\x16\xae\x6b\x06\xdf\x6d\x97\xbb\x96\x6c\x61\x3e\
-\xc0\xa1\x06\x0e\x2d\xec\x22\x7f\x2f\x76\x3d\x3a\x3c\xaa\xe9\x3c\
-\x84\xe0\x78\x8c\xc5\x4c\xa0\xdf\x88\x59\xe6\x97\x94\xe0\x79\xbd\
-\xa3\x4c\xc0\xe8\x6c\x88\x3d\x0a\xab\xc6\x30\xa8\x07\x9f\x18\x46\
-\x5a\x65\x2e\xbe\xfb\x46\xf3\xf5\x37\x3a\xf7\x5d\xdc\xb4\x92\x07\
-\x01\x32\xd9\xbf\xb4\x6a\x1f\x6d\xba\x8d\xa3\x15\xc2\xf1\x1b\x7d\
-\xdc\xa9\x31\x9d\xef\x47\x16\xef\xc7\x05\x54\x91\x8b\x5f\x07\xf0\
-\xcc\xec\x06\xf3\x5d\x1c\xad\xf2\x43\x3f\xee\xe3\xba\x41\x38\x8d\
-\x34\x5d\x3e\x33\xb5\x0a\xd9\x28\xc2\x6c\x2f\x67\xab\x38\x5d\x61\
-\x9d\xd8\x2c\x36\xed\xc2\x95\xa4\x4e\x5c\x0f\xb1\x61\x63\xf1\x9e\
-\xe2\x11\xf6\x29\x1c\x77\xb0\x52\x67\xdd\x60\x3d\xd8\x8b\xba\xd5\
-\xa0\x2f\xe9\x73\x9f\x57\xf9\x20\x0b\x03\xbb\xcd\xc9\x4e\x4f\xdc\
-\x17\x63\xd1\x7c\x61\xd9\x4b\xee\xa6\x25\x20\x77\xcc\x9e\xb1\xc2\
-\x39\x0e\x17\x79\xfa\x9b\x9d\xcf\x80\xfb\x96\x56\x69\x4c\x53\x86\
-\xb4\x4b\x99\xc2\xf4\x32\xc9\xed\x36\xba\xcc\xba\x18\x48\x7d\x39\
-\xa0\x90\x93\x3f\x68\x91\xb3\xac\x01\x91\xcb\xf6\x0c\x22\x81\xd0\
-\xea\xa6\x1d\xea\x72\x6a\xd5\x1d\xe0\xaa\x31\xd6\x0a\x55\x43\x82\
-\x94\x6b\x2f\xee\x2a\x0c\xb9\xa2\x8e\x02\xe7\x1b\x98\x03\xa3\xde\
-\xd0\xbe\x68\x5b\xb1\x82\xdb\x0e\xb9\x3b\x79\x60\x70\x7c\xbc\x8f\
-\x63\x35\x4a\xc6\xb6\x1a\xb8\xaa\xb1\x49\x21\x9d\x22\x3d\x85\xd2\
-\x92\x7b\x49\x8b\x9d\xb6\x52\x55\xd2\x29\x28\x9e\x96\x8e\x9c\x2f\
-\xa9\x18\x0c\xa8\xe7\x2a\x3b\x08\xb1\x54\xfd\x46\x4c\x6b\x5e\x23\
-\xd9\x7a\x9d\x08\x68\x8d\x62\xb3\xdc\x35\x38\x62\xaa\xf5\x30\x50\
-\xed\xd3\x32\xb3\x93\x8c\xb4\x47\xe5\x03\x06\x21\xa6\x8f\xe4\x8b\
-\xf3\xf1\x83\x42\x4f\x9a\xd9\xaf\x93\x68\x9e\x27\xa0\x92\x79\x6f\
-\x7a\xd8\xb1\x89\x14\xe4\x23\xa2\x4b\xd4\xf4\x7a\x1e\x8e\x9d\xc5\
-\xcf\xfe\x0a\x47\x2e\xe0\x23\x30\x16\x0c\x07\x92\xb4\xee\x70\x1d\
-\xca\x08\xd6\x4b\xc6\xb8\x8b\x6d\x6a\x39\xb5\x4c\x14\x6b\xb0\x90\
-\x9b\xd0\x30\xc5\x28\xf1\x38\x53\xcf\xb2\xfd\xaf\x4a\x59\xc6\x7c\
-\x15\x5e\x13\xef\x86\xb8\x2d\x63\x85\xfb\x20\x05\xdf\xc5\xc8\x00\
-\x9f\x48\xed\xd5\xc3\x6a\x88\xf3\x75\xa6\x8c\x42\xc5\x92\xad\x41\
-\x44\x5b\x01\xee\x85\xa4\xa6\x19\x10\x1f\x04\x4c\x80\x9e\x94\x38\
-\xe4\x72\x0a\xe2\x46\x80\xab\x06\xdc\xf7\x78\x6e\x5e\x7d\x52\x9f\
-\xe1\xf4\xce\x50\xca\xcf\x5f\xf0\x6c\x4f\x3c\xf9\x2e\xa5\x80\xc4\
-\xd4\x9b\xde\x8e\xd1\xdd\xe4\xc1\x44\x4e\x8a\x6a\xa5\x63\x7b\x1d\
-\x8c\xd4\xcc\xa4\xac\xec\x53\x33\x91\xa8\x52\x5c\x1a\xc6\x3c\x3d\
-\x85\x47\x9f\x3e\xf5\x1f\xfe\xd7\x2b\xce\x1a\x3e\x08\xe2\x82\x68\
-\xfe\xa9\xba\x16\x5f\x87\x0e\x6d\xf0\x60\x88\x03\xf3\xb8\x13\x92\
-\x59\xd9\x77\x87\xb5\xa4\x7c\x66\x53\xa4\x98\x6a\x81\x44\xad\x85\
-\x63\x15\xd6\x5f\x6f\x98\x60\xc0\x27\x32\xe9\x27\xd4\xe5\x91\x54\
-\x20\x3d\x49\x92\xb0\x37\x7f\x69\xb4\x71\x46\xe2\x44\x03\xae\x66\
-\x01\xcb\x80\xf8\x75\x1f\xf7\x4c\xcc\x5d\xe5\xaa\x0b\x03\x2c\xf5\
-\x71\x22\xc0\xbe\x3a\x53\x40\x77\xc1\xb9\xb6\x5d\xc1\x30\xdd\xaf\
-\xc7\x47\xa8\xee\x95\x9e\xc2\x5e\x61\xf4\xdf\x5f\x1a\xf0\xee\xbb\
-\x90\x77\xfe\x76\x39\xba\xfd\x6a\x15\xbb\x7f\xa6\xa4\xa2\xcc\xb2\
-\x4a\xfa\x00\xcd\xe3\x37\x76\x2b\x82\xb8\xa2\x69\x35\xcc\x84\xd4\
-\xfc\x93\x8b\xd7\x5e\x9f\xff\xe1\x9f\x5c\xd9\x9e\xc7\xd5\x1e\xfd\
-\x62\x50\xc4\x9c\x89\x94\xb0\x42\xab\xd2\x71\xd4\xc1\x12\xc8\xcf\
-\xb9\x2f\xd8\xe7\x11\x66\x9d\xb4\xcc\xea\x37\x0d\x39\x67\x21\xdf\
-\x75\x64\x1e\x9d\x10\xef\x79\xb8\x6b\xe2\x57\x5b\xd2\x1a\xd6\x5f\
-\x45\x0e\xc7\x5b\xa3\x97\x3d\x1c\xd4\xb8\xd8\xc0\x8a\x60\x9c\x7a\
-\xdf\x62\xb0\xfb\x8a\x15\xb4\xb6\xbd\xc6\x15\x0f\x27\x24\x56\x2b\
-\xe4\xed\xdc\xd0\xd8\xe8\xdb\xb5\x24\x6d\x7d\xcd\x66\x29\x74\x08\
-\xd1\xc7\x42\x86\x97\x16\xe9\xb3\x89\xd2\xe0\x6f\xa6\x54\x9d\x98\
-\x9e\x11\x59\x8e\x32\x98\x9c\xda\x51\x69\x56\xe7\x34\x67\xd2\x49\
-\x74\x31\x89\xf5\xb0\x07\x29\xf0\xf2\x95\x30\x12\x49\x8f\x42\xb2\
-\xd4\xd4\x65\xad\xa7\x4b\xd4\x64\x53\x24\x26\xd4\x53\x09\xb6\x36\
-\xa6\x6c\x70\xb0\xf0\x63\xe2\xaa\x5b\x45\xa5\x86\x85\xb9\xa0\x31\
-\x07\x7e\x37\xd0\x6c\xa2\xbe\x82\xc6\x22\xaa\x21\xd6\x0e\xe2\xd1\
-\x67\x5b\x77\xad\x22\xb1\x57\x8f\xc8\x38\xa3\x61\x7a\x74\x93\x8c\
-\x8d\xd6\xba\x4c\x56\x9a\x7f\x13\x0b\x55\x88\x76\xc2\x1c\x5a\x93\
-\x39\x1a\x42\xd8\x23\x9a\x3f\x5e\x61\x09\xc9\x40\xed\xcf\x1c\xb6\
-\xa7\x84\x18\x6a\x5c\x22\x47\xb6\x89\x56\xaf\xd9\x1f\xd6\x5a\x38\
-\x07\xee\x2d\xe6\xc5\x37\xc1\xbe\xaa\x75\x41\x51\x9d\x6e\x54\x23\
-\x53\x38\xe9\xb0\x91\xa5\xe5\xe2\xb2\xc6\x76\xa4\x3d\x58\x8b\x0f\
-\x1b\xf6\x79\x10\x13\x9c\xec\x97\x38\x59\xc1\x81\x5d\xe2\x9c\x1d\
-\x2b\xae\xec\xc8\x91\xed\x24\x09\xb8\xf3\x8f\x9e\x92\x65\x29\x4a\
-\x07\x60\x4d\xbf\x33\x88\xe9\xa6\xff\xc9\x32\x55\x09\x11\x3b\x72\
-\xce\x84\x0a\xe8\xe0\x9d\x1a\x6a\x4d\x5a\xf3\xc2\x32\x16\x16\xb1\
-\xb8\x86\xa5\x55\xcc\xaf\xa0\xb9\x8c\xda\x02\x6a\x73\x90\x55\x5b\
-\x92\xb3\xfa\x1c\x26\x88\x44\x07\x17\x1a\xa8\x09\x5c\xf6\x99\x3d\
-\x0c\x52\xde\x5a\xe5\x83\x51\x6d\x35\xcc\x0c\xa0\x0f\xf1\x59\x3f\
-\xe6\x12\xa7\x05\x70\x44\x6e\xb5\xc4\xd5\x28\x03\xca\x05\x0e\x1a\
-\x20\xee\x73\xb5\xb0\x1a\x95\x1c\x3f\x2d\x2b\xa2\xb3\x14\x9d\xb0\
-\xcb\x18\xe0\x4c\x15\xc7\xe6\xf9\x4f\x13\xfb\xde\x33\x38\xde\x25\
-\xbc\x31\x6f\x77\xfa\x58\x0b\x48\x85\x58\x70\xb0\xa9\xf0\x91\x8a\
-\x73\x38\xda\x23\x09\x34\x92\x05\x37\x2b\xdf\x04\xbe\xc7\x05\x77\
-\xa7\xba\x66\xff\xee\x15\xe1\xc6\x79\x18\x51\x44\x0a\x98\x6c\x4c\
-\x4e\xf2\xec\xcb\xac\x30\xb5\x78\xc7\x39\xfb\x9c\x91\x8d\xf3\xbe\
-\xe3\x3d\xab\xce\xaa\xe6\xe7\xf9\xfa\x62\x3a\x4a\xba\x28\x0e\x33\
-\x0b\x96\x7a\xae\x01\x40\x8c\x0f\x1e\x64\x72\x81\x89\x56\xd8\x70\
-\x2f\x4a\x8d\x61\x1b\x3c\x0e\x65\x5f\x19\x2b\x59\xbb\x43\x9d\x0c\
-\x6d\x27\xfe\x99\x9f\x8d\x95\xbb\x75\xcc\xed\xc3\xd2\x7e\xac\xac\
-\x61\xdf\x41\xfe\x77\x61\x0d\x8d\x15\x54\xe6\xa1\x6b\x2c\xdc\x78\
-\xa0\x95\xb4\x40\xbc\xdb\x47\xfc\x4f\x63\x13\x7d\x0f\x0b\xdb\xf8\
-\xca\x1c\x33\x36\x57\x02\xc6\xa6\xbd\x84\x52\x96\xa1\x49\xaa\xb8\
-\x9a\x61\x82\xc8\x03\x3e\x9b\x03\x6f\x1b\xa7\x2b\xd0\xab\x8f\x4a\
-\xf6\x89\xd4\xce\x30\x18\x1a\x6e\x2c\xaf\xa6\x71\xb8\x8a\xaa\x71\
-\xf3\x6d\x22\x90\x6d\xeb\xb6\x75\xd2\x26\x3b\x88\x95\x75\x3a\x59\
-\x62\x76\x95\x00\xc7\x1c\x9c\xaf\xa2\xa1\x69\xf1\xb7\x6c\x33\x97\
-\x01\xf1\xe6\x24\xcd\x7e\x64\x30\xcf\xa9\x2a\xe6\x2b\xd8\xf4\xf1\
-\x5e\xc5\x76\x2a\x5a\xa9\x12\xf3\xa7\xb0\x6a\x0f\xeb\x63\xb9\x8b\
-\xd3\x2e\x0e\xd5\x79\x1b\x0d\x28\xe2\x35\x9a\x3b\x39\xec\x3b\x11\
-\x3b\x2b\x2d\x8e\x64\xe3\x73\x89\x1e\x5d\xc4\xb8\x1b\x79\xd5\x60\
-\x04\x88\x9c\xac\x9e\x5a\x56\x3f\xd5\xe9\xc1\xf0\xa2\x64\xb3\x40\
-\xc1\x04\xc5\x91\x05\xa6\x12\xb6\x92\x9e\x14\xe9\x16\x36\x8e\x4c\
-\x91\xf5\x4c\xe1\x5c\xa7\xe8\xce\xd9\xcc\x58\x3a\x3f\xe3\x46\x8b\
-\x39\x40\xa8\x1d\x5f\x86\xdc\xaf\xcd\x2f\x9b\x58\xd8\x8f\xe5\x35\
-\x1c\x38\x84\xb5\x93\xb5\xfd\xc7\xd0\x58\xeb\x57\x57\xa0\xaa\xc4\
-\x27\x1d\x30\xd4\xbb\x06\x74\x15\x55\x29\xfd\xd0\x26\x49\x64\x2c\
-\xcd\xc7\xa6\xec\x3e\x82\x06\xa3\xbd\x23\x6d\xbc\x3e\x8f\x46\x15\
-\x9f\x84\x71\x2a\x06\xa9\xe6\xc0\xe1\xdd\x8a\x4a\x78\x7d\x0a\x8f\
-\xed\xaf\x31\xdb\xb8\xae\x69\x64\xaa\x68\x43\x10\xa9\xc9\xb8\xe6\
-\xcf\x06\x4f\xaf\x39\x38\x50\xc5\x7a\xc0\x0a\xee\x7a\x9d\x91\x40\
-\xa0\x46\x99\x0b\x23\x55\x1d\x4e\x9f\x95\x64\x95\x99\x48\x60\x2b\
-\xe4\xfe\x70\x3f\x24\x28\xea\xdb\x86\xda\x83\xc0\xa9\x06\x16\x41\
-\x6d\xa9\xf7\x64\x92\x39\x45\x3c\xfa\x21\xa8\x40\x9a\xbd\xc5\xec\
-\x12\xe6\x73\x17\xe8\xfe\x6f\x04\x0c\x7c\xbb\x55\x4b\x2b\x02\x2a\
-\x81\x1b\x67\x21\xe4\x8e\x8c\x7e\xe7\x33\x5c\x3f\x8f\xb8\xb3\xd0\
-\x22\x67\xe5\xd3\xe7\x0f\x38\xfd\xfb\x74\x39\xe8\x17\x3a\x41\xb8\
-\x92\xbe\x2a\xf2\xfa\xc6\x40\xd9\x40\x14\xc4\xe7\x56\x6d\x84\x07\
-\x57\x71\xf0\x18\x0e\x9f\xc3\xc1\xd3\x58\x3a\x09\x77\x95\x41\x5b\
-\x0b\x7d\xe3\xc8\x6f\x86\x24\x60\x75\x7b\xd4\x0a\x36\x26\x4e\xc3\
-\xb2\xfc\x2d\xce\x59\x08\x62\x7d\x6d\x1d\x65\x67\x8c\x3b\x9c\x43\
-\xe0\xe3\xf4\x16\xbe\xb3\x9f\x7f\xfa\x38\x40\x5f\x0e\xdb\xc0\x47\
-\x14\x43\xa2\xf2\x6d\xc5\xbc\x3e\xc0\x7c\x95\x04\xfa\x2d\x11\x77\
-\x8d\x8c\xb4\x4a\x0d\x60\xbd\x63\x11\xb9\xb1\xc2\x46\x8f\xc9\x44\
-\xd7\x40\x8b\x1e\xd9\x94\x03\xb9\x84\x50\x66\xd8\x94\x8e\xcf\x34\
-\x7e\x14\x21\xa8\x3e\x56\x02\x9c\xad\xe0\xa0\x8b\x6e\x07\x1f\xd4\
-\xd9\xcc\xd5\xb1\xdb\x94\x39\xff\xb5\x3e\x31\x8f\xf1\xf1\x1b\x3e\
-\xde\x57\xd8\xb4\x83\x69\x7d\x7b\x1e\x5c\xd8\x82\xd4\xa0\x83\x01\
-\xce\x55\xb1\x34\xc7\x60\xf7\x72\xc8\x7c\x8e\x31\x7d\x65\x83\x90\
-\x68\xa1\x3a\x51\xfe\x7e\xbc\xdc\x5f\x69\x45\x53\xcf\x36\xc3\x75\
-\x4f\xf2\x18\xd3\x14\x89\x66\x3a\xe0\xc0\xdc\x47\x00\xbd\xd2\xc3\
-\xa1\xd3\xb3\x05\x18\xe3\x75\x9a\x74\xd1\xfd\xb4\xe8\x5c\x26\x94\
-\x71\x6c\x5b\xa7\x25\xf9\x5f\x13\x89\x2e\x1d\xc5\xd1\xd3\x38\xfe\
-\x08\x8e\x9c\xc7\xd2\x1a\xc2\x45\x32\x0a\x37\x41\x7d\xe0\x6d\x9f\
-\x51\x9d\x71\x5e\xe4\xd9\x2a\xbb\x70\xa4\xbd\x22\x6b\x41\x4c\xe6\
-\x04\xfc\x38\x3f\x21\xbc\x33\x5b\xa9\x68\x73\xfd\x2e\x1e\xf3\xf1\
-\xc3\x26\xda\x3d\x7c\x52\xb7\x47\x48\x67\x1e\xf5\x10\x7a\x45\x7c\
-\xaf\x46\x97\x64\x2f\xb3\x5a\xde\x0d\xad\x0c\x93\x18\xb6\x8d\x23\
-\xdb\x1c\x18\x7d\x9b\x93\x97\x2d\x26\xd7\x39\x47\xd6\xaa\x52\x1a\
-\x54\xdd\x89\x3e\x45\xd9\x73\x91\x99\x5a\xaf\xc1\xe2\x8e\x85\x25\
-\xf5\x1e\x4d\xf6\xe8\x1c\xad\xf3\xb2\x62\xaa\xc7\xe0\xf8\xae\xed\
-\x1d\xd9\x6f\xfc\x77\x0d\x73\x73\xbc\xf6\x77\xc1\xac\xa5\x17\x75\
-\xc2\x04\x7c\xa3\xd7\xa0\x40\xc3\x01\xcd\xda\xed\xfe\x2a\xc1\xcc\
-\x65\x0f\xf7\x23\x4a\x9c\x6d\x3e\xf4\x33\xfa\x3b\x5f\x30\x5d\x58\
-\x21\xf7\x38\x6c\x15\x33\x7e\x50\x7a\x1f\x10\x62\xef\xd7\x6d\xbe\
-\x23\x2c\xa6\xfb\x3a\x34\x47\x76\x6a\x0b\xba\xf9\xc6\x3e\x1c\x3f\
-\x8b\x93\x8f\xec\x3b\x76\xea\x9e\x71\xed\x58\xc6\xa6\x20\x34\x37\
-\x1e\xae\x65\x4d\xdc\xe0\xf2\x20\xb0\x83\xfb\x14\xeb\x32\x06\xe5\
-\x87\xd6\x95\x51\x57\x23\xb4\x4d\xa5\x49\xa8\xa3\x93\xff\x8a\x24\
-\x84\xec\x49\xbc\xe0\xe2\x3b\x47\xb0\x2e\x99\x3b\xf7\x53\x2d\x4b\
-\x79\x9a\xa4\x09\x46\xe7\x05\xce\xd6\x39\x53\xf6\x13\xb0\x08\xaa\
-\x8a\x3a\x62\xd3\x6b\x20\x0c\xd0\x50\x38\x5e\xe7\x3d\x34\x78\xfa\
-\x86\x15\x08\x19\x7c\x0a\x92\x02\x9f\x1c\x94\x63\xa3\x85\xdf\xa5\
-\xc2\xc2\xc9\x39\x54\x24\x6e\x6b\x7e\x9b\xe5\xdd\x95\xe4\x66\xae\
-\x86\x44\x35\xcb\xb6\x32\x75\xb9\x87\xcd\x1a\x2f\xdc\x77\xe8\xe9\
-\xb5\x95\x97\x32\xf7\xd0\xbc\xe6\xa2\xc4\x9a\x20\xc9\xfe\x5d\x97\
-\x9c\x9c\x48\x58\x21\xb4\x79\x4c\xed\x64\xa0\xa5\x18\xaf\x23\x32\
-\xce\xd9\xef\xbe\xbe\xff\x79\x94\xa5\xf2\x08\x47\x8d\x25\xab\xec\
-\xa6\xf8\x3f\x02\xde\x07\x63\xdb\x46\xc8\x84\xe6\xd9\x30\x4f\xe7\
-\x40\x34\x31\xbf\x0f\xa7\x4e\xe2\x91\x27\x71\xe0\x02\xea\x47\xd1\
-\xaf\xdc\x33\xcf\xef\x5f\x0d\x8a\xf5\x48\x32\x31\xd0\x36\xe8\x31\
-\x46\x0c\x54\x3c\x1a\x8d\xc3\xec\xed\x32\x50\xd6\x18\xc9\xa3\x54\
-\xf1\x46\xad\x93\x5d\x4b\xdb\x11\x37\x03\x6b\x35\x2f\xfe\xca\x32\
-\x5e\x3f\xc3\xe6\xd4\xdb\x32\x6e\x1c\x41\x49\xeb\x93\x39\x3e\xe7\
-\xea\xb8\x7c\xf1\xb5\x3a\xfa\xa1\x4d\x92\x56\x46\xbd\x7b\xba\xdf\
-\xca\x98\xdb\x21\x41\xde\xfc\x7d\xcd\x4e\xf3\x4d\x67\x38\x2e\x3c\
-\x1e\xf2\xe3\x8c\x16\xb0\xcd\xa6\xb4\x14\xd2\x4f\x2f\x0b\xe6\x6a\
-\x6e\x3a\xd8\xb2\xe1\xb5\xea\x60\x31\xc4\xe9\x3a\x56\x6b\xe8\x74\
-\x70\xb9\x86\x75\xd7\xfa\xef\xbe\x1d\x68\x1e\xed\x39\x5d\xac\x2a\
-\x5c\xa8\x12\xdb\xdc\xab\xe1\x77\x9a\x76\xcf\x78\xc6\x84\x43\x35\
-\xdb\xd7\x3b\x68\x0e\x16\xf1\x3e\x16\xcf\xf1\x1c\x4f\x91\xcf\x8b\
-\xfe\xc5\x69\x9c\x54\xaa\xa9\x34\xbb\x2f\x47\xdd\x6a\x5e\xe2\x54\
-\x66\x83\x4a\x3d\xe2\x89\x07\x7a\x74\x7a\xb4\xb4\x5e\xea\xc5\x47\
-\x4e\x5e\x4e\x42\x38\xd9\x39\xc9\x05\xaa\xc8\xd9\xdf\xeb\x49\x1a\
-\x4c\xa3\xc9\x47\xdb\xc3\x1f\xda\xfa\x91\xb0\x59\x12\xb2\x17\x59\
-\x2e\xb7\x26\xab\x59\xa0\x58\x3b\x82\xd3\x4f\xe1\xf4\xf3\x38\x7c\
-\x01\x62\x91\x40\xe2\xaa\xcf\xf4\xc5\x96\x8f\x4e\x40\x92\xa3\xd9\
-\xe5\x8d\x13\x35\xf6\x61\xb0\x3e\x81\xbb\xa6\x53\x8f\xfe\x69\x70\
-\x51\x18\x2d\x4e\xbb\xeb\xab\x20\x21\xfd\xaa\x58\xbe\x8f\x57\x59\
-\xb1\x0b\xc3\xa3\xa8\xd8\xb7\x9e\xc4\xd7\xcf\x83\x34\x7a\x11\x43\
-\x6d\x91\x53\x5a\x8d\x04\xb5\xcd\x87\x9a\xc8\xf2\x98\x8b\x6b\x1e\
-\x6e\x46\xd3\x16\x52\x8e\x53\x2a\x5e\x17\x2a\xc3\x8d\xc2\x7c\x74\
-\x23\xa4\x68\x99\xb9\x9f\x1f\x0a\xdc\xb1\xfc\x4d\x1f\xc3\xc1\x24\
-\x69\x72\x8a\x13\x2d\x06\x3b\x6f\xd9\xac\x2b\x63\xd9\xdb\x26\x42\
-\x0d\x89\xd7\x3b\x02\xfd\x80\xb9\xcb\xb3\xa0\xf8\x7d\x5b\xd8\x88\
-\xa2\x4e\x8c\xee\x59\x46\x8c\xa8\x59\xa4\x1e\x62\xc9\xb3\xa0\x48\
-\x5a\xf1\x57\x97\xa1\x76\xcf\x62\x30\xdf\x16\xad\x65\xb6\x13\x4d\
-\x66\xb4\x5b\xbe\xe0\xfa\xf7\x72\x86\x4d\x63\x40\x07\xdf\x01\x8e\
-\xda\xc3\x40\x79\xc4\xd9\xab\x9a\x35\x17\x9f\x56\x42\x54\xa9\x9c\
-\xe0\x66\x68\xf0\x8c\x3b\x87\xfd\x27\x70\xe6\x51\x9c\x79\xd9\x59\
-\x3b\x6f\x9e\x3f\xb7\x66\xf6\x58\x74\x08\x85\x03\x8f\xae\x3d\xec\
-\xd2\xe7\xf9\x2e\xdb\x29\xe8\x68\x3d\xda\xa2\x0e\x62\xff\x29\x93\
-\xe4\x66\x3d\x44\xd5\xe5\x77\xa5\x82\x6a\x9d\x18\xa3\x6e\x0c\xcb\
-\xe5\x8a\x22\x69\x4a\x93\xbf\x85\x39\x5a\xc3\x89\x79\x3c\x75\x04\
-\x57\x3c\x26\xb9\xfd\x24\x1b\xe3\x64\xd1\x79\x04\xe8\x45\x9b\x66\
-\xb7\x32\xc7\x51\x3c\xf7\x92\x6c\x49\x9a\x14\xa9\x6d\x05\x74\xf8\
-\xfa\x2e\x8e\x79\x6c\x81\xbd\xe5\xe0\x33\x8d\x56\xc0\xcc\x49\x3f\
-\x99\x57\x25\xc4\x70\x98\xe6\xa0\xf2\x65\x62\x86\xa3\x82\xad\xe2\
-\x5e\x9f\x3d\x84\x06\x8b\xb3\x86\x15\xa2\xb9\x49\x6b\x36\x16\x6f\
-\x9c\xc2\x27\xc6\x8b\x3b\x04\x66\x81\x8c\xe7\x1c\x46\xb9\xd4\x86\
-\x87\xf3\xc0\x29\x30\x8e\x7f\x7f\x8e\xef\x25\xea\xd3\x34\xfa\x0c\
-\xa1\x2d\x07\xdb\x92\xff\x7e\xc1\xed\x7e\x16\x7a\xed\x94\x78\x6c\
-\x3c\xbc\xd9\xf3\xf3\x67\x18\x67\x8d\x9e\x75\x25\x63\xb5\x22\x5c\
-\x3d\x89\x93\x8f\xe3\xe2\xcb\x38\xf4\x24\xbd\xfb\x1d\x84\xbf\x35\
-\xb6\xd5\x62\x90\xca\xd4\x84\xd9\xc4\x37\x78\x7a\xa1\x75\x95\xe6\
-\x9f\x26\xcc\xad\x28\x0e\xea\x68\x58\x0d\x8c\x05\x07\x4b\x15\x2c\
-\x34\xd1\x6c\xa0\x6e\xbe\xab\xa8\xb9\xb4\x72\x8e\x79\x72\xe2\xb4\
-\x86\x4a\x8d\xc2\x8c\x7e\xa8\x74\x09\x91\xcd\xb6\xff\x61\xc7\x5a\
-\x89\x9b\xb1\xc2\xc1\xcd\x8e\xc6\x94\x54\x3a\x38\x65\x3e\xc8\xc5\
-\x47\x1d\xac\x37\xe2\x69\xb2\xc8\x2e\x8f\xc1\xf6\xaf\xbb\x58\xd0\
-\x54\x75\x75\x6a\xb8\xdc\xc6\x8d\x06\xc9\xee\x61\x25\x0e\x94\x23\
-\x36\xa5\xb4\x53\x1b\xa2\xd7\x9b\xa5\x5b\xf5\x70\xd4\x25\x47\xd2\
-\xfc\xe6\x33\x9f\xd3\x7b\x4c\x90\x6a\x00\x98\xd3\x67\xf2\xe7\xe4\
-\x12\xdd\xd3\xad\x1e\x77\xbc\x4e\x35\x46\x62\x61\x32\xf8\xb6\xd6\
-\x65\x46\xff\x82\xcb\xd7\x7c\xac\x39\xca\xa1\xa3\xed\xd8\xac\x14\
-\x67\x2e\xcd\x14\x73\x72\xf5\x21\x19\xfb\xfb\xd9\x7b\xc9\x0b\x75\
-\xe7\x0a\xc4\xc0\x26\xa5\x3e\xe4\x58\x4f\x3c\xeb\xf0\xc0\x98\x11\
-\x39\xb5\x20\xc2\x48\x02\xa7\x8c\x58\x51\xd0\xfd\x34\x53\xa7\x8b\
-\x75\xd2\x06\xbe\x37\x57\x70\xe6\x7c\xf5\xd1\xe7\xbd\xd3\x2f\xc0\
-\xd9\xc7\xba\xcf\x5b\x06\x6c\x78\x68\x75\x11\xf4\xe9\xf3\xfc\x2e\
-\x7c\x8f\x78\xc6\x78\xe8\x5a\xc8\x81\x1f\x26\x92\x5b\x5d\xc5\xfe\
-\x83\x58\xa8\x5b\x42\x41\x8d\xe4\x50\xbf\x12\x17\x9e\xbc\x28\x4f\
-\x1f\x62\xdb\xd2\xb9\x02\x2b\x75\x4d\x14\x64\x77\x83\xb8\x2f\xd6\
-\xf6\x46\xc9\x00\x5f\x12\x44\x44\x1f\x98\xfd\x64\x6e\xd8\xc6\x21\
-\xb3\x13\xc0\xa5\x35\xca\x8a\x4f\x91\x19\xb3\x8a\xa8\xae\xda\x8c\
-\x0b\xc0\x5a\x66\xc8\x95\x72\xe0\xc8\xfb\x38\x64\x73\xf3\x77\x43\
-\x5c\x35\x31\xe5\x82\xcd\xa0\x5b\x6d\x9c\x8c\x26\x82\xc3\x99\xb5\
-\xe4\xc6\xf4\x38\x85\xe1\xc4\x1c\xaa\xc6\x64\x7d\xde\x04\x92\xc9\
-\x6c\x87\xd7\xa1\x3e\xce\xd6\xa8\xae\x73\xcb\x16\x65\xbb\xf5\x24\
-\x5d\x33\xb8\x93\x6d\x1c\xf2\x71\x71\x01\xf3\x0e\x6e\xf8\xb8\x11\
-\xa2\x5d\x8d\x39\xfa\xa1\x65\xad\x89\x22\x56\x85\xc8\xd1\x6d\xc5\
-\x5e\xe1\x9c\x07\x4b\x26\x7b\xb8\xb2\x7e\x7b\xf6\x65\x1f\xbf\xb1\
-\xe6\x4a\x13\x47\x1e\xc7\x13\x2f\xe0\xdc\xcb\x68\x1e\xf7\x36\x80\
-\x77\x35\x6e\xb7\xe9\xdd\x0d\x8a\xed\x75\x48\x59\x51\x3d\xc8\x3e\
-\xe6\x7c\xac\x55\x70\x70\x01\xfb\x96\xb0\x6a\xad\x5c\x57\xb9\xd7\
-\x1b\xb3\x6e\x83\x84\xc7\xb6\x0d\x6d\xfb\xfd\x38\xed\x18\xa5\xab\
-\x23\xc2\xd6\xd0\x15\xa7\x0c\xd4\xb1\x76\x63\x4c\xed\x5b\x3e\x4e\
-\x2c\xb0\x4b\x70\xab\x96\xa1\x8e\x8d\x38\x48\x0a\xe8\x79\xb8\xd0\
-\x24\x4a\xbe\xea\xb1\x2b\xcf\x73\x62\x44\x20\xf2\xce\xde\xc7\x82\
-\x87\x63\x75\xae\xd2\x0f\x02\x86\xc8\x3d\x5b\x01\x18\xf4\x6b\xa7\
-\xe9\x06\xa1\xed\x3e\x59\xb6\xec\x86\x45\x97\xc1\xeb\x65\xd0\x6a\
-\x3b\x51\x2b\xad\xf9\xd0\x1a\x16\x9b\xec\xdc\xbd\xe2\xf3\xf7\xd1\
-\xc2\x56\xa9\x21\x28\xcb\x6d\x3c\x5a\xc3\xc1\x1a\x85\xd6\x7e\x23\
-\xc8\xd1\x1f\x34\x1f\x86\x49\xc3\x57\x5c\xec\x13\x43\xfb\x46\x91\
-\x6a\x83\x7d\xd5\x58\xbb\x1f\x6d\x72\x11\xd9\xf9\x8f\x79\x3a\x7e\
-\xea\x13\xf4\x18\xc5\x0b\x9d\x48\xec\xca\x1d\xae\xa5\xe1\x10\x9e\
-\x1c\x47\x40\xe7\x98\xfd\xa2\x48\x38\x5d\x4e\xa9\x72\x23\x87\x1f\
-\xa1\xd3\xf4\x01\xeb\xbd\xe8\xc0\xcc\xcf\xd5\xa4\x9f\xc8\xa7\x57\
-\x0b\x42\x78\x01\xbb\x7e\x56\x0f\xe0\x85\xa7\xf1\xf8\x97\x70\xe0\
-\x31\xb4\x9a\xf8\x0c\xb8\x69\xb0\x7b\x87\x8d\x70\xc6\xc1\x1b\xb0\
-\x6e\x5e\xdf\x70\x71\x3c\xc4\x91\x05\xac\x9c\x64\xab\x87\x6b\x31\
-\xf1\x16\x70\x55\xb1\x48\xd9\x02\x77\xf9\xbe\xd5\x8a\x51\x32\x55\
-\xdf\x0d\x63\x48\x13\xcf\xb0\x57\x19\x0a\x34\x83\x87\x80\x81\xaf\
-\x57\x23\x1b\xe1\x1b\x02\xe7\x16\xf0\xbe\x1d\x1f\x12\xa4\x94\x98\
-\x44\x56\x32\xc2\x6c\x12\x4b\x3e\x2e\xcc\xb1\x45\xf0\x53\x11\x8f\
-\x50\x46\x8a\x3c\xc3\xcf\x8f\x12\x32\x66\x3b\xda\xc6\xd1\x1a\xf6\
-\xcd\xd1\x31\x7f\x66\x07\x6b\x0e\x7a\xa3\x54\xae\xf2\x1e\x46\x6a\
-\x22\xe6\xf5\x15\x76\x79\x7f\xe0\x63\xd3\x4a\x3e\x75\x35\x16\xc0\
-\xb2\xc0\x61\x49\x3b\x7e\x3f\xb0\x51\x87\x25\x66\x9a\x4d\x2f\x8c\
-\x26\x3e\x28\x34\xb7\x71\xbe\x82\x93\x8b\x68\xdb\x1e\xf3\xfb\x8e\
-\x2d\xcc\x25\x46\x3f\xd2\xcb\x92\x56\x1d\xcd\xaf\xd5\x4c\x83\xe0\
-\xb1\x57\xd0\x6a\x15\xdb\x9c\x76\x72\x76\x3f\xde\x40\x53\x6a\x05\
-\xc5\x09\xd0\xec\x4c\xfa\xc9\x76\x5f\xde\x01\x13\xdb\x7d\x7e\xe6\
-\x59\x2e\xe1\x23\x6c\xc6\x46\x65\xf5\x14\xca\x7a\x6b\xc4\xc8\xd2\
-\x1a\xb0\x23\x07\x37\x54\x65\xba\x55\xf4\x60\xc7\x8f\x28\xbe\x06\
-\xbc\x36\x71\xf2\x1c\x9e\x7c\x15\x67\xbe\x04\x77\x8d\xbb\xf6\xd5\
-\x16\xee\xfa\x14\x83\xef\xf5\x49\x0c\xac\x07\x58\x71\x38\xdb\xc3\
-\x00\xdc\x95\x1a\xc4\x1c\x59\x31\x06\xae\x98\xef\xad\x68\x6a\x9f\
-\x63\xe3\x33\x39\x9c\xaf\xad\x8b\x49\x4c\xa5\x4b\x37\xb2\x3f\xa7\
-\x8d\x6f\xb8\x74\xa5\x1f\xda\x4f\xf7\x2b\xb1\x07\x75\x53\xf9\xb9\
-\x68\x5d\x1b\xd3\x34\x4e\xf7\x62\x1d\xb7\x43\x7c\x2a\x19\x66\x84\
-\x3a\x86\xd4\x22\x21\xe7\xc4\x0b\xa6\x87\xa5\x80\x83\x35\xcd\xc2\
-\xfe\xcc\x26\x9d\xda\x11\x8f\xcd\xce\x26\x19\x70\xbd\xb4\x05\x1e\
-\xbe\xe5\xca\x1f\x53\xec\xb8\x35\x0b\xe9\x1a\x48\x57\xee\x33\xf7\
-\x48\xc5\xcc\x73\x7d\x52\x23\xcd\x02\xb8\xe6\x30\xe9\x69\x96\x77\
-\x28\x63\x83\x8e\xcf\xad\x8d\x23\x02\x8f\xd6\x99\xd1\xbf\xea\xc7\
-\xaa\x80\x51\x1d\x20\xcf\xef\x18\x11\x69\x93\x25\xc2\xf9\x71\x79\
-\x38\xed\xef\xbf\xc8\xdc\xf7\x07\x3a\x54\x7d\x9a\x40\x59\x64\xcd\
-\x4a\xd9\xf2\x2a\xe3\x44\x4d\x53\x88\xea\x23\x8b\x47\x71\xe1\x19\
-\x3c\xf3\x1a\x0e\x9e\x47\xab\x4e\x4a\xc9\xd5\x9e\xe5\xb1\x04\xa4\
-\x83\x35\xdb\x38\x35\x8f\xd3\x2b\x38\x21\xb8\x36\x3a\x15\x96\xdf\
-\x7f\xd3\x23\x7d\xbc\x6b\x01\x89\xb1\x4b\x5d\x4d\x29\x65\x67\x4d\
-\x73\x98\x0d\xcc\x99\x7e\x98\x42\x56\xd1\xa0\x1b\xaf\xc9\xca\xff\
-\xf7\x05\x1e\x71\xf1\xa1\x9d\xe0\x17\x8a\xf8\x98\x32\x4b\x7e\x14\
-\x36\x30\x58\x0b\xf8\xca\x6b\x3d\x26\xe9\x7b\x51\x49\x35\xdd\xf6\
-\x21\x93\xa4\x4d\x80\xe3\x20\xc7\xeb\x86\x65\xbc\x70\xfe\x94\x88\
-\x8d\x7e\x98\x18\x42\xac\x3e\x22\x37\x18\xa4\x1e\x9d\xe7\x9a\xf9\
-\x54\x13\xdb\xf4\x1c\x76\x30\x9a\x25\x71\xac\x82\x73\x15\x66\x9f\
-\x6e\x6c\xd3\x9a\x5b\x0d\xb2\xe2\xfc\x14\x51\x9c\xba\x82\x1d\x3c\
-\x21\x18\x39\xdc\x04\xb7\xca\x56\x22\x9b\x1c\x14\x45\xd8\x28\x92\
-\x24\x19\x03\x93\xf5\xc0\xdf\x17\x33\xc5\x9d\xcc\xf6\x21\x26\xb6\
-\x48\x8b\x09\xf9\x75\x29\x8b\x49\x97\xa5\x2a\x7f\xe5\x41\xa7\xc8\
-\x5f\x3a\x12\x4f\x5c\x0e\xeb\x65\x56\xe1\xa7\xf8\x96\x88\xec\x86\
-\x33\x72\xc0\x8a\x2d\xfe\x73\x12\x0d\xcb\x47\x4c\xc0\xd7\xa8\xb4\
-\xf1\xd4\x57\x71\xfe\x55\x38\xfb\xe9\xe0\xaf\x78\xb8\x65\xf0\x71\
-\x17\xba\x83\x66\x80\xc3\x15\xca\xb9\x1c\x6a\xc0\xa9\x13\xba\xdc\
-\x74\x38\xc2\x69\xcb\x78\xbe\x4a\xcc\x72\x41\x36\xf5\x36\x68\xf5\
-\xd0\x59\xe3\xd6\xd6\xb2\x43\x4b\x36\x56\xb6\x34\x23\x2d\xc2\x71\
-\xad\xc0\x81\x6b\x33\x9b\xae\x5d\x8d\xb2\x8b\x2f\xd5\x70\x69\x95\
-\xa5\xfe\x0d\x67\xa8\x39\x2c\x52\x9c\xc7\xf8\xca\xfa\x4c\xd2\x9f\
-\x32\xce\xbb\x4b\xfd\x78\xcf\xfe\x46\xbb\xc3\xad\xde\x49\x9e\xcb\
-\x4a\x9b\x6e\x3e\x74\x09\xfd\xcd\xd6\xd4\xb5\x09\xf5\xb4\xf8\xf0\
-\xf0\xbf\x1e\xe7\xf6\x9c\xaa\xa0\x51\x61\xe4\x7a\x5b\x10\xa2\x74\
-\x05\xe1\xdf\xfe\x10\x8f\x98\x78\x3d\xc4\x5d\x49\x31\xa9\xad\x88\
-\x27\xac\x08\xe7\xa2\xcf\x52\x56\x57\xf0\xbc\x83\xf3\x35\x6e\x7d\
-\x57\xfb\xdc\x22\x7a\x29\x1c\x15\x85\x0b\xc2\xcd\x4d\x40\x29\x31\
-\xf7\xc2\x4c\xb8\xdc\x71\x5c\x5b\x8a\x79\xc6\x0f\xd2\x10\x0f\x78\
-\x43\xd8\xf5\xf1\x05\x26\xac\x0a\x6d\x0b\xa5\x81\x08\x4c\x70\x39\
-\xbf\x8a\x4b\x97\x70\xe9\x2b\xab\x47\x1e\xbf\xdf\x69\x92\x02\x75\
-\xb3\x45\xa9\x96\xde\x36\x64\x07\x87\x05\x2e\x2c\xe3\xf8\x1c\x2a\
-\x55\x3e\xbc\x0f\x6d\xbf\xb3\x79\xd2\x0c\xe6\xea\x31\x14\xd1\x59\
-\x62\x73\x3c\x09\x30\x62\xe9\x58\xf5\x9e\xc0\x46\x11\x14\xbf\xee\
-\xd3\x22\x0d\xc2\x6e\x48\xcc\x49\xd4\xaa\x8c\x0d\xea\x15\xd4\x2a\
-\x94\x08\x36\x48\xa0\x62\x1f\xa6\xb0\xf2\x65\x87\x16\xd9\x91\xf4\
-\x61\x68\x67\x45\x65\x67\x23\x67\x96\x73\x07\x27\x1c\xca\x33\x99\
-\x68\xf2\xa6\x35\x7a\x8d\x98\x97\x3f\x9c\x03\xce\xee\x2c\x56\xaf\
-\x0e\xce\x33\xb7\x78\x55\x63\xab\x9a\x81\xd7\x69\xe6\xb0\x31\xcf\
-\x66\x9f\x16\xbf\xaf\xce\xbc\xfb\xc7\x96\xf9\xec\x5b\x4f\x3f\xd7\
-\xc1\x93\x92\xfe\xdb\x20\xae\xb7\x3d\xcb\x27\xb3\x55\xea\x00\x71\
-\x27\x14\xb7\x94\x36\x77\x9e\xc7\xe7\x98\x42\x35\x61\xc3\x0d\x07\
-\xdb\xc9\x74\x72\x9d\x6a\xc5\x8a\x8a\xad\xf9\xa8\x4d\xe4\xe2\xf5\
-\xb2\xea\x39\xe3\x5a\xb9\x53\x23\x9b\xbe\x86\xaf\xc4\xd4\x9f\x32\
-\x5d\xd2\x10\xe2\x81\xad\x22\x99\x62\x4b\x25\xcd\x17\x22\x2a\x7c\
-\x5a\x0a\x8d\xdf\xe3\xaf\x0f\x9c\xc0\xd3\xaf\xe1\xd2\x97\x31\x7f\
-\x1c\x77\xe4\xfd\x5f\x29\x8a\xf4\x6e\x6d\xc1\xdf\x60\xd9\xfc\xb1\
-\x79\x9c\xdd\x87\xb9\x26\xfb\xdc\xde\x13\x1c\x22\xd9\x52\xe4\xa8\
-\xa8\xd4\x81\x85\x75\xcf\xfc\xd9\x8d\x67\x11\x47\x68\x41\xdb\x22\
-\x2e\x4b\xf1\x3d\xda\xba\xc3\x8a\x13\x16\xab\x58\xae\xf2\xbf\x4b\
-\x35\x34\x2b\x4c\xe4\x57\x22\x8a\xbc\x4c\x50\x90\x88\x19\x04\xbe\
-\xc7\x86\x57\x83\xa3\x3e\xd0\xd8\x88\x78\xc5\x14\x15\x28\x52\x4e\
-\xed\xd1\x40\x0f\xb9\xb8\xdc\xc1\x9d\x39\x6b\xf4\xa1\x65\x3a\xd4\
-\x52\xfb\x4f\x1f\x2b\x0a\x67\x1a\xc4\x42\x1f\xf4\x09\xcc\x7a\x95\
-\x61\xdf\x37\x52\xf1\xb1\x79\x6f\xad\x87\x23\x55\x76\x0f\x9a\x80\
-\xf5\x7d\x60\xb3\xcf\x00\x94\x14\x9a\x00\x67\x43\x9c\x6a\xd2\xaf\
-\x7f\xe2\xe1\x6e\x9d\x7b\x45\x10\xcd\x5a\x4b\xb8\x3a\x26\x90\xad\
-\xf7\xf1\x48\x95\x9a\xc9\x5b\x1d\xfc\xd6\xb8\xf9\x26\x91\x4f\xbf\
-\x84\x10\x2e\x67\x17\x75\xd7\x99\x9f\x07\x3a\x83\x7a\xdc\xb4\x0c\
-\x9d\xcf\x94\xcf\x02\xa9\xb5\xdd\x10\xc9\x08\x50\x13\xb2\x8a\x62\
-\x12\x3a\x13\x03\x5b\x94\xc3\x33\x29\x40\x41\x25\x32\xae\x62\x4c\
-\x1f\xc9\x20\x56\x4e\xd2\x1c\x2a\x4c\x3e\xc8\xfa\x4c\xfa\xa7\x26\
-\x4e\x3c\x85\x97\xbe\x8c\x47\x5e\x86\x5e\x25\x4f\xeb\x93\x3e\x75\
-\x29\xba\x5d\xb6\x7e\x1e\xd3\xb8\xb8\x8c\x63\x4d\xee\xcb\x9f\x59\
-\x12\xe2\x46\x85\xd9\x3d\x85\x38\x42\x1d\xca\x01\x60\x48\x04\x8b\
-\xf8\x39\xcc\x79\x7b\xfc\xc4\xb0\xc7\xf9\xf4\x0b\xc6\x35\x1a\x17\
-\x3b\x87\xd5\x39\x66\xf1\x8d\x5f\x77\x74\xcc\xe5\x0c\xac\x31\xf5\
-\x2d\xd3\xc6\xb7\x8b\xa4\x5b\xe1\x86\x10\xa5\x4d\x8d\x85\x39\x56\
-\x9b\x7b\x3d\x99\x6a\x2f\xaa\xb1\x84\x65\x86\x6e\xe2\xe1\x8c\xc6\
-\xaa\x83\xf7\x02\xac\xcf\x25\x7b\x42\xca\xd3\x9b\x0f\xaa\x78\xec\
-\xdc\x5b\xab\xe2\x96\x8f\xeb\x92\x9f\xd2\xcb\x72\x8f\x75\x52\x79\
-\x75\x0d\x96\x0b\xa9\x4e\x63\xe0\xc7\x55\x0b\x6c\x4c\x90\x60\x50\
-\x9c\x89\x7c\xd6\x7c\xe6\x1f\xeb\x35\x5c\x0f\x70\x4b\xc7\x59\xf9\
-\x30\xd1\xe0\x88\x9f\x60\x1f\xc7\x03\x3c\x51\xa7\x62\xeb\xe5\x36\
-\x6e\x36\x98\x42\x55\x09\x99\x1e\xb9\x72\xb2\x28\x1e\xdf\x51\x90\
-\xbf\xc7\xc8\x5e\x3a\xfc\x72\x33\xbc\x85\x7f\xcf\x5f\x51\x20\x2b\
-\x13\xd7\xae\x5c\x12\x9b\x68\x31\x1d\xa7\x15\x86\x95\x05\x3c\x7e\
-\x09\x5f\x7e\x05\x47\x5f\xc2\xc6\x3c\x7e\x17\xe2\x86\x47\x31\xba\
-\x5e\x17\xf3\x6d\x5c\x02\x1e\x99\x47\x63\x81\x48\xe6\x17\x0e\xee\
-\xf5\xb9\xb3\xb3\x2d\x43\x64\x44\x24\xa3\x01\xab\xee\x16\xe5\xc1\
-\xc2\x5a\x0c\x0c\x02\x9f\xb6\x0e\x1b\x09\xec\x6b\xb0\xf0\x79\x7c\
-\x01\x8b\x0b\xec\x40\x95\x36\xde\xed\x04\xd8\x0c\xc8\x4c\x34\xdf\
-\x51\x62\x9b\x10\xdf\xfa\xf8\xe8\xf8\xa2\xcb\xe4\x49\xaf\x8e\x0b\
-\x2d\x9c\xab\x11\xd3\xdf\xd7\x71\x97\xb7\x4a\x01\xfa\x41\x96\xc3\
-\xbc\xfe\x82\xc4\x62\x83\x6c\xde\x6d\xcb\xb8\x54\x55\x9b\xb4\xb1\
-\xc2\xf6\xda\xda\x32\x69\xee\x15\x22\x78\xb3\x5f\xad\xbb\x76\x81\
-\xc9\x61\xdf\xf7\x70\xfd\xf4\xb0\x1a\xe0\x4c\x9d\x02\x94\x06\xca\
-\x9b\x60\xb7\xe3\x32\x4c\x37\x67\xb8\xbc\x49\x8c\xbe\xba\xc4\x2e\
-\x27\x83\xf1\xda\x88\xd7\xa1\x9f\xe6\xbd\x29\x2c\xdc\xc7\xa5\x3a\
-\x0e\xd7\x71\xdd\x38\x11\x07\xed\x79\x1b\xe2\xeb\x82\x89\x6e\x22\
-\x97\xa5\x41\xb9\x54\x28\xc6\xbe\x80\xfe\xed\xc4\xab\xd8\x6e\x95\
-\xd8\x82\x5b\x40\x80\x19\xe7\xa4\x4b\xb6\x99\xd8\x8b\xc8\x5c\xd6\
-\x71\x6c\xa7\x52\xbe\xf9\x5a\x24\x63\x95\xf2\xf1\xeb\x30\xae\x75\
-\xc6\xd1\x13\xa2\x12\x44\x66\x73\xcb\x06\xb2\x71\x5e\x3c\xb0\x9b\
-\xaf\x75\xf9\x0b\xf3\x78\xe4\x25\x3c\xf7\x87\x38\xf0\x04\x29\x34\
-\x1f\x02\x77\x8c\x21\xb6\xa0\xb6\xb0\xcf\x27\xa4\x39\xb5\xc8\xe9\
-\x79\xc6\xbb\x7f\x2a\x09\x5b\x7b\x09\x41\x40\xa5\xf3\x8f\x3a\x95\
-\xa6\x09\x2c\x20\x09\x79\x04\xbd\x85\x26\x70\x78\x81\x21\xe3\xb1\
-\x1a\xf6\x55\x59\xd2\xef\x38\x68\xf9\x1c\x91\x60\x22\x81\x9e\xb2\
-\x13\x8c\x65\x9c\xd9\x0c\x8b\x1c\x98\xb0\x8b\xe1\x78\x1f\xaf\xd4\
-\x28\xc8\x71\xdd\x89\x6b\xfb\xe9\x17\xc8\x41\x47\x48\x0f\x8f\x4a\
-\xb2\x1b\xde\x57\xd8\x8e\xb2\x28\x21\x3d\x7d\xbc\x32\x03\x52\x5f\
-\x4e\x56\xb0\x62\x42\xd2\x2e\x3d\xf4\x76\x93\x8b\x2d\x4c\x89\xd6\
-\x73\x63\x08\xb8\x12\x6a\x92\x94\xb2\x03\x21\xd7\xbf\xb1\xda\xf5\
-\xa8\xde\xe4\xa3\xd6\xb1\xed\xb0\x0d\x2e\x80\x6b\x3e\xe9\xf2\x9d\
-\x4a\x9c\x8a\xd1\xa9\x93\x97\x6d\x9c\x0c\x79\x03\xcd\xd7\xc7\x7d\
-\x16\xa4\xba\x0d\x9e\x79\x50\x5c\x10\x1a\x8d\x4f\x46\xcc\x7a\x64\
-\x86\xb3\x1c\x09\xb5\x47\xed\xfe\x01\xf3\x73\x62\x32\xcc\x03\xa8\
-\x86\x4e\x49\x90\x9e\x2a\xae\x48\xad\x67\x8a\x19\x31\xad\x40\xf4\
-\xb9\xb8\x0f\x97\x9e\xc3\x0b\xdf\xc5\xca\x69\xdc\x92\xf8\xc7\x90\
-\x72\x79\xed\x1e\xed\xf5\x80\xc2\x13\x73\xcc\x4b\x9a\x47\xfb\x9e\
-\xcb\xa7\xbe\x59\xb3\x19\x40\x1d\x8f\x98\x8c\xfb\x3c\x06\x99\x4f\
-\xeb\x7b\x85\xc5\x33\x5c\x12\x9b\x68\xf6\x70\xd8\xc1\xa9\x7d\x34\
-\x9d\x45\xdb\x7a\xb7\x05\x02\xa7\x96\xa6\xf4\x97\x81\xc8\x66\x2d\
-\x85\x72\x18\x0f\xe8\x2c\x2b\x26\x93\xc7\x54\x54\x13\x78\xc5\x2c\
-\xc8\x1e\xae\xd7\x63\xde\x6f\x71\x96\xa3\x85\xc7\x9b\xa8\x84\x78\
-\x4f\xb1\x78\xa4\x23\x0e\x82\x13\x4b\xf9\x99\xe3\x1c\x02\x9d\xb7\
-\xa7\xf1\xa1\x87\x0d\x6b\xb8\x41\x4a\x90\x35\x66\xa1\x85\xbc\xcc\
-\xd3\x3e\x39\x36\xe6\x3c\x3f\xa8\x30\x84\xa5\xc5\x9b\x87\x62\x33\
-\xee\x17\x16\x50\xd1\x44\x7a\xb7\x2d\x3a\x32\x28\xce\x4b\x5f\x02\
-\x11\x0c\x75\x2a\x2f\xb9\x38\x3c\x87\x6b\x96\xe0\xb0\xd9\xb0\xbb\
-\x53\xd7\xa6\x86\xdd\x51\x49\x05\x5d\x0e\x6f\xca\x11\x7c\x66\x9b\
-\xd5\xe3\x3d\xfa\xde\x87\x88\x62\x38\xed\xf1\x73\x82\x2f\xb9\x5b\
-\x93\x93\xf1\x10\xa9\x18\xdd\xe9\x32\xc6\x5a\x38\x8c\xa7\xbe\x89\
-\x17\x5f\x47\xf3\x28\x07\x53\xfe\x4b\x8f\x4a\xa5\xbd\x1e\x1f\xcc\
-\xb1\x1e\x9e\xdc\x47\xb6\xe0\x7d\x81\x5f\xda\x4e\xe7\x4e\x82\x28\
-\x62\xc6\xa2\x4e\xe5\x58\xa3\x8f\xf4\x63\x76\x9a\xc1\xdf\x6e\x88\
-\xc3\x26\xce\x6b\x90\x7d\xb5\x5a\x27\x84\xdd\x10\xac\xf3\x1b\x24\
-\xd3\x92\x6c\xf6\x0b\xdd\x51\x4f\x91\x96\x8d\xcf\x17\xb0\xcc\x47\
-\x2f\xb4\xf0\x9a\x89\xa1\x25\x0b\x43\xfd\x14\xa7\x45\x66\x2f\xdc\
-\xf5\xac\xd1\xb7\xf1\xbe\xcb\x4a\x19\x0b\x02\x49\x36\xd0\x6c\x29\
-\x8b\xdb\x74\xd2\x26\x7a\xbe\xe1\xe3\xa6\x1b\x0b\xda\x04\xa9\x71\
-\x9c\x2a\xe2\xca\x7b\xec\xa2\x3a\x61\x00\xe1\x1c\xc7\x54\xdd\x56\
-\x34\x7d\xb2\x7f\x3d\xac\xb6\x59\xee\xdd\xef\xe2\x6e\x40\x5f\xd0\
-\x09\xad\xa4\xa6\xb0\x6a\x9b\x2a\xa9\x87\xd8\x5e\xf8\x53\x21\x9e\
-\xaa\xf1\xaf\xef\xf4\x70\xc7\x76\x54\x85\xd1\xb8\xab\x46\x06\xcc\
-\xe4\xb1\xbb\x98\x02\xe1\xe8\xec\x7e\x18\xe6\xca\x5b\xb9\x3c\xe6\
-\xe0\xfe\x8a\xb8\xc9\xbf\x20\xe6\x2b\x74\xa7\xa2\xd4\xf0\xa3\xf2\
-\x87\x4c\xe6\x6e\x8d\xd0\xeb\xc7\x30\xc9\x44\xc9\x94\xbf\x18\xe4\
-\x60\x42\xbb\xba\xcc\xd5\x33\xd2\xdc\x0a\x7a\x14\x8b\x37\x4c\x94\
-\x2c\xeb\x56\x5a\xc0\x23\x90\x30\x71\xdb\xca\x2a\xa7\x52\x3e\xf7\
-\x5d\xb8\xc7\xe8\x7d\xaf\x74\x98\xab\xf6\x6c\x0f\xc4\xb1\x3e\x9e\
-\x99\xc7\xfe\x23\xe4\x0f\xfe\x53\x0f\xb7\x1d\xdb\xa7\x8c\xa1\x77\
-\x1f\x74\x10\x09\x9d\xb8\x19\x97\x47\x0e\xfa\x2c\xc4\x2c\x07\x78\
-\x4c\xe1\xd1\x25\x1c\xac\xf3\x55\x06\x82\xb3\x3d\x34\xc0\x76\xc5\
-\x32\x8d\x53\xd0\x48\xe6\x3a\xcd\xf3\xce\x2c\x4c\x86\x1b\xd7\x3b\
-\x78\xad\xca\xe6\xa3\x8f\x05\x31\x74\xa0\x53\x84\x53\x31\x4c\xc0\
-\xcb\x2e\x2e\xd5\xa8\xec\x67\x8c\x7e\xbb\x11\x23\xf5\x68\xf3\x71\
-\x3b\x38\x25\x70\x72\x01\xdd\xc0\x92\x08\xaa\xf1\x8e\x41\xbf\x6e\
-\x2d\x21\x7e\x7a\x01\xbb\x40\xcc\xee\xb4\x20\xd8\x21\xfe\xa9\x62\
-\x77\x88\xf9\x5c\xf3\xae\xb9\x16\x99\xc3\xc7\x56\xd8\xc6\xfe\x9e\
-\xd5\x90\xea\xca\x18\x95\xc5\xaa\xae\x32\xee\x10\x58\xd4\xb8\x24\
-\x59\xf9\xfa\x54\xb3\x04\xdb\xb2\x2a\x3d\x1e\x52\xf5\xe0\x54\xa9\
-\xae\xcc\xf4\x91\xc5\x90\x79\x8b\x57\x83\x85\x9a\xab\x76\xab\xc9\
-\xfc\x1c\xf1\x85\x14\xfd\xdb\x71\x06\x73\x70\xdd\x01\x6d\x41\x5a\
-\xe2\xae\x30\xee\xa7\x2d\x7d\xad\xfa\xc6\xe1\x1d\xc1\xeb\xaf\xe1\
-\x85\x6f\xa2\x72\x82\x3e\xfe\x13\xc5\xce\x65\x76\x18\xf5\x71\xd8\
-\xc3\x53\x0b\x38\xb4\x9f\x3d\xf9\xff\xd0\xa6\xdd\xf7\x1b\xf1\x2c\
-\x03\xd8\xb6\x92\x18\x77\x85\x96\xcd\x22\x11\xa9\xd0\x51\x42\xbe\
-\x63\x9b\x3e\x03\x3c\x52\xc7\xe9\x39\x4e\x91\x6f\x6b\x56\x1f\x4d\
-\xe0\xbb\x6d\x30\x80\x4b\x30\x13\xf9\x51\x95\x6a\x1e\x50\x25\xc4\
-\x84\x48\x69\x4c\xdb\x96\x8d\x4a\x0f\xfe\x3c\x89\x96\xcf\xdb\xf2\
-\xd0\x3b\x7d\x74\x6b\xc3\xd1\xc7\x91\x83\x88\xcb\xb1\x60\x86\xf1\
-\xe9\x0a\x6d\xe1\x5d\x8d\x8e\x35\xfa\x98\x47\x20\x29\xb3\x71\xbe\
-\x82\x85\x1a\xc3\x74\x0a\x8f\xb9\x31\xb5\x53\xd9\xc6\xa8\xc1\x86\
-\x63\x20\xfb\x09\x50\xa4\xdb\xa0\xa3\xb7\xc1\x14\xbe\x1f\xd0\x4f\
-\x9b\x95\x73\xaa\x83\x0b\xf3\x70\x1c\xd6\x98\xee\x5a\x1e\xe5\x60\
-\xcf\x11\x36\x72\x88\x66\x0c\x9a\xff\x9d\x0a\xf0\x64\x95\x39\xfb\
-\xb7\x02\xde\x81\x7e\x8d\xaf\x54\x59\xd3\x14\x18\x65\x95\x95\x39\
-\x75\x9d\x4d\x38\x8b\x54\x8e\x7f\x50\x1b\xd1\x39\x94\xff\x90\xf0\
-\xfd\x17\xee\x4b\x26\xb6\x60\xad\xdf\xc0\x8f\x7e\x47\xd5\xd6\xf0\
-\xe2\xb7\xf0\xca\x0f\x08\x6f\x3e\x86\x65\xb3\x48\x62\x12\xb5\xce\
-\xc8\xf5\xd9\x25\x1c\x3d\x80\xfb\x3e\xfe\x29\xc0\xad\x1a\xd3\xf0\
-\x61\x3a\x6a\xb4\xf8\x37\x96\xa4\xb4\x0a\x1f\xca\x0e\x8c\x08\xba\
-\xa8\xb7\x70\x4a\x92\xf4\x72\xbc\x49\xda\xed\xa6\xc6\x3b\x8a\x83\
-\xcd\xe8\x95\xab\x71\x6f\x7f\x80\x58\x4b\x1e\x45\xcf\x4f\xe6\x36\
-\xe3\x98\x7d\xe9\xc2\xa9\xb0\x18\xfc\x68\x95\x43\x2d\xdf\x0e\x29\
-\x12\x16\x24\x7a\x0d\xe9\x60\xc0\x6a\x66\xd0\xd3\x9b\x73\xfb\xa0\
-\x8f\x96\x5d\x1b\xe6\xcf\xc6\x4f\x4b\x0f\xe7\x34\x09\x92\xdb\x06\
-\xa3\xb7\xe9\x7a\xfb\x83\xb2\xa8\x48\x65\xb7\x3d\x1c\xf3\xa9\xd0\
-\x1d\x56\xc9\xbc\xb8\x87\x98\x55\x61\x96\xfd\x72\x1f\x8f\xbb\xd8\
-\xb7\xc8\xda\xc5\x8d\x0e\xc9\x9e\x9e\x3b\x84\x7c\xb0\x25\x30\x72\
-\x42\x7d\xcc\x19\x60\xe3\x52\x75\xe7\x33\x8b\xfb\xb7\xad\x1e\x5b\
-\x20\x47\xb5\x77\xf2\x69\xf8\x3c\xaa\x51\x39\x30\xa3\x52\xf7\x6d\
-\x24\xe8\xd7\xc5\x49\xcc\xac\xbf\x1f\x60\xdf\xfc\xf8\x86\x71\x22\
-\x81\x22\x83\x5b\x44\x19\xeb\x2b\xd7\x9e\x17\xbf\x78\xd2\x50\xe2\
-\x69\x4a\xc5\x05\x64\x84\x32\xa7\x1f\xf5\x1b\x74\xe8\xf0\xfa\x9a\
-\x1d\x6b\x97\xfe\x08\x7f\xf0\x06\xf6\x3f\xc6\x87\x6a\xd0\xcb\x86\
-\x15\x16\x0d\xef\x63\xb1\x85\x67\x16\x71\xee\x28\xb3\x78\xbf\xb0\
-\xa8\xc6\x40\x5e\x4f\xc5\xc5\xc5\x08\xcc\x10\x29\x59\x3e\xe6\xb0\
-\xde\xd5\xa7\x39\x56\x3d\x0e\xde\x38\x3f\x4f\x6d\xb0\x8a\x20\x82\
-\x37\x61\xb1\xb1\xf8\x8e\x65\x9e\x28\xdb\x17\xa2\xb2\x73\x5b\x75\
-\x49\x5d\x26\xfa\xac\xa8\xdf\x3c\x48\x55\x2e\xc3\x0a\x2e\x6c\xe3\
-\xa9\x3a\x3e\xee\x62\x73\x6e\x48\x55\x1f\xb0\x2c\x1d\x6b\xf5\x6e\
-\x0f\x97\xe6\x58\x70\x7d\xd7\x61\xc3\x9e\xea\x31\x85\x6a\x96\xdc\
-\xaa\xcf\xb9\x96\x73\x92\x69\x28\x83\xb8\x8c\xe3\xef\x39\x19\x49\
-\x57\xee\x60\x2d\xb6\xbd\x9e\x68\xa2\x3e\xcf\x2e\x6f\xb3\x21\x74\
-\x5c\xe6\x5b\x0c\x2a\x34\x41\xc2\x13\x2e\xf5\x98\x3a\x96\x56\x7d\
-\xd7\x44\x26\x73\x49\xb9\x57\xb3\x94\xe1\xb8\x31\x0d\xce\xbc\xfa\
-\x74\x07\x4f\x5a\xd2\xff\x6f\x02\xa2\xf9\x48\xe6\x24\x14\x19\x9a\
-\x90\xcc\xef\x6c\x53\xa4\x23\x55\xea\xee\xe9\xac\xdd\x8b\xec\x9f\
-\x72\xc7\x71\x47\x8b\xa3\x62\x17\x32\xf6\x71\xbf\xec\x17\xa9\x1a\
-\x30\xda\x2f\x6b\xed\x95\x92\x1b\x75\x9c\x7d\x16\xdf\xf8\x1e\x8e\
-\xbd\xc4\x6c\xcc\x5b\x1d\x3e\xfe\x8e\xf1\xd3\xdb\xa8\x6e\xe0\x49\
-\x17\x4f\x9e\x60\x98\xf5\xaf\x3e\x81\x6c\x34\x83\x20\xca\x94\x47\
-\x79\x75\x39\x98\xf3\x91\x84\x3d\x6c\x2e\xd9\x42\xc3\xc7\x93\x06\
-\xd2\xcc\xb3\x05\x49\x54\xa8\x08\x60\x16\xcc\x6d\xdb\x20\xe2\x27\
-\x71\xa1\xae\x17\x3e\x89\xe2\xa4\x5b\x24\x35\x13\xb2\xa1\x88\x1e\
-\xda\x58\x70\x43\x63\xae\xc6\xae\x94\xe7\x96\x70\xd7\xc3\xed\x66\
-\x6c\xf4\x2a\x9b\xfa\x80\x4d\x59\x9a\x85\x51\xed\xe3\xfd\x10\xed\
-\xa6\x0d\x9a\x05\x2a\xdb\xc4\xe2\x27\x2a\x54\xd5\x7b\xcf\x6a\x8f\
-\x99\xa5\xe8\x55\xe2\x6a\x9a\x4c\x02\xd9\x46\x87\xaa\x7a\xcb\x73\
-\xac\x7f\x7d\x1c\xda\xf6\xf0\x0a\x73\x94\xba\x47\x56\xd9\x23\x0d\
-\x54\x15\x45\x02\x6f\x36\x2c\x13\x21\x25\x8e\x49\xcc\x56\xb7\x86\
-\xe4\xa1\xd9\xc1\x63\x4d\x9c\x5c\xc1\xf5\x2e\xb9\xcd\x9b\xd6\x71\
-\x84\x36\x79\x9a\x6e\x12\x40\xc9\x1c\x94\x91\xbb\xa1\xb2\xe8\x5b\
-\xe5\x08\x7c\x18\xeb\xef\xc5\xa8\xdd\xcb\x2c\x6f\x5e\x8e\xf5\xc1\
-\x3a\xcb\x3c\x2b\x0b\xbc\x75\x89\x33\x16\xd9\xa1\x93\x62\x52\xc5\
-\x57\x14\xd1\x21\x91\xd5\x1e\x94\x05\x9e\x5e\x0c\x76\xd0\xa4\x05\
-\xde\xc6\xd0\x32\xe8\x29\x13\x65\x1e\x3d\x8b\x6f\xfc\x29\x2e\xbe\
-\x8e\xbb\xc6\x97\x07\xb8\xd9\xab\x6c\x6b\x9f\x84\xf8\x2e\xce\x28\
-\x3c\x7b\x04\xcd\x39\x7c\xd4\xa3\x58\xe4\x36\xe9\x67\xb6\xa2\x6e\
-\x7b\x8e\x30\x17\x8f\x7e\x8f\x42\x30\xb3\x84\x1c\xdb\xf8\xd4\x77\
-\xd1\x68\xe1\xa2\xbb\x7c\x6a\x61\xa3\xee\xb3\xbc\xef\xd7\xb9\x51\
-\xdc\xb2\xb2\x16\x5e\xc0\xb7\x87\x51\xfb\x5f\x7d\xb4\x88\xa1\x72\
-\x85\xf7\x78\x20\x94\x9d\x93\x6c\xf6\x92\x05\x85\x85\x2a\x16\x2a\
-\x98\x13\x64\x28\x18\x57\x6a\x76\x95\x13\x76\x30\xe5\x27\x8e\xed\
-\xc2\x46\x8a\x65\x3d\xb0\xfe\x16\xbd\xac\xb1\x40\x03\x6f\x36\x17\
-\x99\x6f\x31\xf6\xbd\xea\xd0\x10\xeb\x5d\x46\x2f\xd4\x2d\xb3\x2d\
-\xd8\x41\x92\x32\x8f\x9a\x00\xcd\x45\x19\x8b\x3f\x34\x47\xbf\xfe\
-\x91\xc7\x5b\xe4\xd9\xda\x70\x57\x73\x4e\xdb\x13\x73\x38\x12\x72\
-\xac\xc8\xb5\x2a\xb6\x9a\xfc\xbd\x97\x4c\x43\xd2\x29\x29\x12\xdd\
-\x65\x1a\xc0\x6c\x35\x26\x8e\x7a\xbb\x83\x6b\x73\x7c\xa5\xb9\xf3\
-\x7e\x6d\x5c\x36\x44\x8c\x75\x04\xaa\xdc\xdf\xa3\x04\xd5\x94\xe5\
-\xef\x11\xf5\x19\x8e\x6a\x04\x94\xe5\xc8\x27\xe9\xfe\xe9\x88\x8a\
-\x23\xe3\x81\xb8\xc5\xe9\x73\x51\x4a\x8b\x28\x0e\xa4\xcb\x16\x18\
-\x92\x6e\x50\x9d\x38\xf2\x74\xa6\x48\xda\x28\xd3\xfa\x13\x1d\xe9\
-\x5b\x69\x13\xa4\xaa\xfa\x2a\xbe\xf1\x4d\x7c\xf9\x0d\x78\x07\xf1\
-\xcf\x21\xae\xf5\x59\x2b\xf5\x84\x6f\xe0\xf8\xfe\x1e\x5e\x5a\xc4\
-\xb1\x65\xce\xc2\xfe\xa5\x71\xff\x75\xa6\x77\x62\x9e\x56\x9a\xb9\
-\x63\x9d\x30\x35\x6a\x62\x92\x0b\x0b\x3d\x4f\x6d\xe3\xfc\x92\x89\
-\x14\x37\x5a\x76\x22\x48\xd0\xc4\x0d\xc4\x12\x2e\x4c\xe4\x55\xb2\
-\xdc\xc6\xbc\xfe\x4c\x72\x37\x02\x5b\xc1\xad\x76\x30\xef\x62\xd1\
-\x04\x9d\x0e\x9a\x12\x15\x5b\xf7\x65\x73\x96\xa4\x8a\x4e\xcf\xc7\
-\x4a\x97\x5b\xca\x07\xbe\x65\xe7\x5a\xe6\x82\xd0\xc3\xfd\x56\x5b\
-\xc2\xd9\x13\x0e\x65\xf4\x0c\xf4\x5f\x5f\x24\x22\xaf\x75\x59\xae\
-\x3a\x5a\x63\x7a\xea\xe3\x26\x7b\x52\xa9\xbd\xe3\xc4\xcd\xda\x4e\
-\xb2\x63\xac\x06\x64\xaa\x55\x24\xd3\xea\xd7\x24\xdb\x5b\xa9\xa1\
-\x69\xbb\x5a\x2f\x49\xf6\x8e\x98\x1d\xec\x2d\x50\x96\xd5\x17\xb1\
-\xf6\xa0\x4a\x4d\x9c\x15\x16\x5c\xd5\x0c\xee\x37\x91\xc3\x32\x6e\
-\x7b\xf8\xb4\x8b\x0d\x5b\xf9\xe2\xca\xaf\x15\x8c\x77\x1e\x83\x6a\
-\x74\xc9\x34\x2b\x9d\x0b\x67\x51\x12\x06\xa0\x74\xd8\xe3\xbf\xdd\
-\xb8\x56\xdb\x25\x2d\x6c\x65\x9c\xac\xc6\x26\x1e\x7f\x1e\x7f\xf8\
-\x26\x96\x2e\x72\x7f\xbf\x62\x0b\xa2\xa1\xd5\x8e\xac\x6f\xe2\xa5\
-\x39\x5c\x3a\x8e\xae\x8f\x7f\xe8\x91\x06\xd8\xaf\x0d\x19\xc2\x91\
-\x66\x81\x88\xa4\x1e\x6d\xa9\x52\x55\x69\x29\x81\x8f\xda\x26\x67\
-\x89\x3d\xb6\x00\xb1\x80\x1b\x9b\xd4\x32\x58\xad\x11\xec\xde\xf2\
-\x6d\x4a\xdb\x1d\xb2\x59\xf2\xbd\xfd\x99\x10\x56\xf0\x24\x6b\x8a\
-\x55\xd2\x7d\x2e\x16\xe6\x28\x8e\x10\xda\x3e\x95\xfb\x1d\xce\x95\
-\x67\xb6\xd4\x49\x72\xe1\x3d\x3c\x56\x67\x3d\x61\x23\x20\xf6\x08\
-\x06\xb8\x54\xc6\x1f\x64\x36\xae\x4b\x0e\x15\x94\xde\xee\xb1\xf6\
-\xd4\x0b\x18\x80\x3e\x36\x47\x80\xf6\x69\x1f\xf7\x6c\xea\x50\xe9\
-\x58\xf3\x2c\x8e\x0b\x43\xcc\xf5\x70\xb4\x8e\xa5\x06\x47\x86\x18\
-\xa3\xdf\xb0\xda\x7a\xbe\xf5\xdc\xc7\x3d\x3c\xd2\x24\x5d\xfe\x6a\
-\x9f\x72\x09\x1d\x2b\xcf\x36\x10\xfe\x16\x96\x97\x2f\x64\xcc\x35\
-\x3a\x68\x56\xc8\x02\x99\x36\xef\x77\x19\x15\x74\x9a\x56\xa7\x3b\
-\x8b\xe3\x31\x16\xd5\xe8\x6c\xb1\x49\x65\xd3\xf0\x23\x68\x5e\x8f\
-\xf5\xf7\xe5\x5f\x6e\x69\x78\x2a\xc6\x32\xe9\xf3\x05\x20\x29\x62\
-\x16\x51\xda\xd9\xef\x58\xff\x4c\x94\xd0\xc8\x86\x77\x2a\x3b\x6c\
-\x30\x6a\xaa\x1a\xd2\x2f\x64\x0c\xd8\xd4\x36\x1f\xfc\xbe\x73\xf8\
-\xc3\x3f\xc7\x13\x5f\xe5\xc0\xb0\xbf\x35\xbe\xbc\xc2\x06\x08\xb9\
-\x0d\x7d\x9f\x04\xc0\x97\xf6\xb1\x5e\xf3\xf6\x36\xde\x9f\x8f\x19\
-\x51\x31\xf6\xb0\x3f\x49\x11\x57\x19\x9d\x01\x6c\xeb\xc7\x34\xe3\
-\x27\x6c\x8f\xf3\x27\x1d\xd6\x8c\x0c\x8a\x35\xe0\xfb\x53\xcf\x1a\
-\x56\x65\x58\xf1\xc9\xd7\x39\xb4\x8e\x93\x8c\x31\xb4\xd0\x14\xe0\
-\x5e\x73\xb1\x4f\xb0\xbd\xd5\x20\xe0\xfb\x49\x2a\x90\x1c\x9e\x5a\
-\x9c\x89\xd7\x49\xeb\xc9\x9c\x66\xda\xd1\x60\xeb\xae\x48\x7d\x4a\
-\xd2\xff\x19\x9a\x80\x35\xc4\xc9\x3a\xde\xeb\xe1\x7e\x83\x43\x7b\
-\x4e\x74\xf0\xc8\x22\xcf\xf0\xfd\x30\xa6\x85\xc5\xdc\x9e\xe4\x41\
-\xca\x00\x07\x1d\x4e\xa7\xea\xb4\xf1\x51\x15\x37\xeb\x36\xfe\x06\
-\x85\x4c\x96\x3d\xb6\x3b\x1d\x5c\x62\xdb\xf8\x67\x3e\x6b\xd2\x5e\
-\xd2\xc4\x9d\x06\x92\xca\xe5\x7e\x5b\x6f\xe1\x42\x1d\xe7\x16\x71\
-\xaf\x8b\xf7\x1c\x76\xa5\x74\x2b\x71\x2c\x2e\xcb\x2d\x5e\x94\x67\
-\xd9\x55\x2e\x36\xcd\x1b\xbd\xc8\xa1\xf9\x12\x60\x33\x4b\xbd\xf6\
-\xf7\x88\xaf\x96\x46\xf6\x24\x3f\xda\xfd\x37\x08\xe0\x2e\xe0\xb5\
-\x6f\x3d\xf6\x95\x9f\xbd\x1d\xee\xc7\x2f\x42\xdc\xda\x44\xdb\xb7\
-\x37\x74\x9b\x0d\x50\xcf\xee\xc3\x85\x55\x4e\x3e\xfa\xa5\xc2\xbd\
-\x45\x3a\x69\x6d\xd5\x58\x23\xdd\xed\x28\xd6\x93\x6e\x12\xbc\x5a\
-\xad\x49\x76\x27\x6d\xe3\x69\x97\x4c\x49\x83\x04\xde\x0a\xb0\xe2\
-\xf2\x79\x6f\x82\xa4\x45\x83\x3a\xfa\xd9\xde\xa8\x11\x1f\x9f\x46\
-\x74\x5c\x48\x7d\xec\x0f\x28\x22\xc9\x81\x64\xc0\x6d\x37\x16\xfa\
-\x53\xd6\xc1\xe7\x73\x14\x06\xcf\xcc\xd9\xf1\x9a\x5b\x51\x8c\x98\
-\xb5\x18\x83\xce\x8f\xf4\xf0\xc8\x02\x3e\xf6\x71\xbb\xc1\x54\xec\
-\x23\x8a\x78\xe3\x56\x0f\xb7\xaa\xe8\x5a\xb2\x3b\xd9\x41\x6e\x92\
-\xde\xee\x62\xc1\x4e\xb2\xaf\x49\x96\xbd\x6e\xcc\x71\xd9\xfb\x04\
-\x84\xa8\xb6\x71\xb1\x82\x33\xe6\x9e\x84\x78\xdb\xea\xcd\xfb\x56\
-\xbb\xaa\xdf\x60\x5e\x5f\xa6\x2e\x21\x5a\xba\xfb\x7c\x3c\x2f\xb1\
-\x10\xb2\x18\x77\xcd\x46\x0e\x51\xb4\x4d\xe9\x66\xbb\x4e\x90\x9d\
-\xbb\x5e\x06\x6c\x90\x4d\xc3\xeb\x9c\xe3\xc7\x24\x7f\x3f\x1d\x41\
-\x6d\x47\x38\x47\x88\x2f\xea\xbc\xe5\x81\x66\x7c\x48\xb3\x38\x72\
-\x04\x6f\xfc\x0d\x4e\xbc\xfc\xf6\x87\x36\x44\xdb\xb2\x2a\x1d\xc2\
-\x83\xb3\x49\xea\xf9\x0b\xe7\x68\xd3\xff\x10\x72\x1a\x59\xdb\xd6\
-\x8f\x8c\x17\x27\x1b\xde\x89\xb5\x52\x9c\x84\xc7\x26\xa2\x2c\x50\
-\x48\x49\xa6\x67\xbb\x38\xba\x8f\x4c\xf4\x7f\x0a\xb0\xdd\x63\xa7\
-\x92\x81\x07\x66\x01\xdc\xf1\x2d\x63\xb1\x1a\xfb\x37\x99\xf5\x5b\
-\x32\x1b\xbf\xc6\x7f\xed\xb1\xaa\x3f\x5f\xa3\xb4\x58\x94\xdf\x8c\
-\x1c\xe3\x48\xbf\x95\x4c\xa5\xe4\x85\x55\x09\xef\xda\x7e\xf3\x48\
-\xb1\x43\x0f\xc2\x4a\xc5\xfc\xc9\xa5\x79\xa2\xac\x1b\x15\xf4\x7d\
-\x3c\xe9\x33\x91\x7a\xd9\x80\x96\x3a\xad\x39\xb4\xdd\xee\x11\xe3\
-\x52\xd9\x94\xeb\x71\x17\xa7\x0d\x30\xeb\x93\x98\xb9\x5e\xb3\x2a\
-\xdb\x96\x24\x73\x58\x71\x2b\x6b\xda\xb1\x98\x66\x87\x6c\x6b\x66\
-\x72\xbc\x7a\x52\x4c\x55\xf1\x66\x1b\xb5\x9c\xcb\x1e\x2e\x85\x78\
-\x64\x8e\xbc\xcb\x5f\x19\x60\xe6\x72\x23\xd2\xe9\x66\x11\xa7\x20\
-\xf1\x51\x98\xce\x52\x25\x6b\x40\x97\x80\xfb\x42\x73\x17\x25\x79\
-\xcf\x02\xbb\x1f\x69\xa9\x96\x72\x5c\xd1\x47\x94\x4b\x69\xcb\x34\
-\xa5\x04\x45\xe9\x9a\x92\x91\x0d\x11\x37\x46\x17\xc9\xf4\x8d\x62\
-\x30\x39\xcc\xe1\x38\x91\x2e\xa4\x55\x05\x8b\x65\xdd\x2d\x02\xf6\
-\xbb\x70\x16\xf0\xfa\x8f\xf0\xb5\x1f\x60\x7d\x19\x7f\xb7\x15\xc7\
-\x61\x26\x84\x0d\xb7\xb1\xd8\xc1\x0b\x8b\x38\x79\x94\xd3\x60\xde\
-\xd6\x2c\xe5\x84\x56\x37\x98\xa3\x21\xad\xc2\xa8\x13\xda\x3e\xd7\
-\x48\x07\x2f\xda\xc4\x7d\x16\xf3\x1f\xab\xe0\x71\x63\x40\x73\x64\
-\x95\x7c\x5a\x61\x48\xf7\x54\x03\xab\x56\x69\x7a\x43\x13\xdb\x84\
-\xc8\xa8\x04\x8f\x60\xfa\xe1\x2f\x85\x25\xd3\x07\x94\x82\x5a\x74\
-\x48\x4c\x6f\xbb\x14\xc6\x71\x93\x69\x0b\x23\x05\xcb\x30\x1b\xf4\
-\xf7\xec\xd4\x03\x2a\x07\xba\x31\x85\x5d\x26\x08\xf8\xa2\xc3\xc5\
-\xf3\x89\x03\xaf\x8d\xa7\x24\x77\x24\xf2\x0e\xac\x9b\x0f\xed\x4a\
-\x16\xd6\xf4\x8d\x27\x6e\x6e\xe1\x29\x87\xa3\x7e\xde\xd5\x64\xcc\
-\xb7\xaa\x56\x05\x24\xa0\xd4\x87\x89\x58\x8e\xce\x93\x73\x6a\x9c\
-\x45\xc4\x59\xf0\x65\x46\x7d\x44\xc8\x78\x19\x2b\x03\x20\xfb\x78\
-\x56\x61\x69\x9e\xc5\xbe\xeb\x40\xbb\x66\xd9\x69\x3a\x15\x75\xa4\
-\xf9\xcf\x25\x45\xd6\x7c\xd3\x99\x2e\x4a\xc5\xa0\x88\xa2\x87\x29\
-\x72\x38\xf9\xec\xd9\x83\x8a\x6b\xe5\x43\xd9\x0d\xd8\xca\x5c\x8d\
-\xdd\x8e\x13\xdd\x6e\x8f\xe9\x8e\xb3\x4f\xe0\x07\xff\x0b\xf6\x3f\
-\x43\xb3\xfe\xc4\xa7\xe6\x4c\x78\x97\xd9\x46\xb3\x7e\xce\xd4\xc4\
-\x8b\x67\x74\xd8\xc0\x3f\x76\xac\x27\xab\x0e\xd9\xb1\x22\xa9\x5d\
-\x70\x4a\x6b\xcb\x26\x82\x1a\xf6\x9f\x5b\xd8\x0f\x3c\xdd\xe0\xec\
-\xa4\x2b\x8e\x55\x47\x6a\xd0\x80\x9e\xd5\x1c\x89\x6a\x0c\xab\x6d\
-\x79\xbf\x7e\x52\xb5\x19\x1d\xc4\x97\x2b\x27\x45\xf4\x35\x55\x21\
-\x00\xa8\x7a\xcc\x72\x76\x25\x7d\x8d\x6b\x9f\x46\x25\x6b\x28\xf9\
-\xc8\xaf\xad\xe8\x98\xd3\xc3\x69\x94\xb5\xfa\x15\x8d\xc3\xf3\x0c\
-\x30\xba\x1e\xce\xb8\x58\xaa\xe3\xe3\x1e\xcf\x2d\x4c\xb4\x57\x55\
-\x25\x6e\x66\xdd\xbf\x85\xe7\x9a\xe4\x8d\xfd\x5c\xdb\x1e\x91\x3a\
-\x4b\x5a\x8d\x75\x5c\xd4\x38\xbb\x42\x97\xff\xbb\x90\x75\xd9\x9e\
-\x1b\x33\x90\xa3\x0f\x76\x52\x39\x65\xf3\x4b\xb7\x8f\x33\x1d\x6e\
-\x0b\x1b\x2e\x7e\x65\xd9\x75\xd1\xf0\xc3\x41\x82\x28\x9f\xae\xc9\
-\xf3\x05\x54\x49\xf9\x49\x97\xa4\xe1\x91\xad\xce\xea\x49\xe9\xce\
-\xc9\x71\xed\x1e\xc3\x8d\x87\x22\xd2\x24\x93\xc1\x7d\xb4\x69\x5b\
-\x3d\x71\x1a\xf8\xce\x8f\xf1\xda\xcf\xb0\xbd\x8c\x7f\xf0\xd8\xc3\
-\xaf\x3b\xb6\x67\x42\x50\xc2\xe5\x4b\x2b\x38\x73\x50\x7f\x10\xe0\
-\xfd\x1e\x73\xcf\xd1\x3c\x30\x47\xc5\x4a\xb9\xb1\xfc\xbc\xb0\x5a\
-\xa7\x15\x5b\x01\xd8\x26\xb0\xb9\x54\xc1\xc9\x2a\xa1\xc8\xcf\x25\
-\x21\x78\xcb\x4e\x40\x78\xae\xc2\x28\xd6\xc0\x68\xe3\xe1\x82\x94\
-\x4e\x81\x14\xa9\xb0\xb8\x0c\x62\x26\x71\xaa\xb1\x2a\xd7\x8e\x22\
-\xdb\x08\xc8\x11\x88\xfc\x7d\x2d\x31\xfd\xb2\xe9\xde\x06\x45\x6c\
-\x28\x26\x37\x07\x53\x74\xa2\xfe\xa9\x23\x0e\x39\xcc\x77\x42\xec\
-\xd3\x64\x04\x18\x2f\xde\x8e\x9a\x9b\xa2\xae\xa5\xc0\x32\x8d\xed\
-\x84\xe4\x17\x1d\x5c\x11\xf8\xd7\x3a\x6b\x0b\x5d\x45\xfc\x76\x54\
-\xb1\xab\x75\xc9\x72\x6c\x6e\x8a\x38\x7e\x55\x18\x8a\xe2\x23\x35\
-\xa3\xdc\xe0\xab\x65\x1f\x4f\x87\xd8\xbf\x8c\xcb\xc2\xce\xac\x15\
-\xf1\x80\x9d\x70\x6c\x11\x2a\xef\x98\x55\xf6\x37\xaa\xdc\xe8\xcb\
-\x30\x0f\x72\xe8\xbf\x34\xbf\x57\x56\xaf\x9d\x0a\xd3\xef\x9d\x23\
-\x1f\x99\x95\x52\x3c\x61\x41\x14\xe8\x1b\xa7\xe7\xbb\x6b\x0f\x76\
-\x22\x25\x39\x5e\x07\x2e\xe2\x87\x6f\xe2\xcc\x2b\x8c\x35\x2f\xb7\
-\xa9\x2c\x29\xda\x96\x54\xb8\x81\x53\xce\xc2\x4b\xe7\xb7\x8d\x4d\
-\xfd\xf7\x0e\xe5\x0c\x7a\xf6\xb9\x32\xfb\xd6\xb3\xea\x03\xd1\xc1\
-\x07\x23\x8e\xa3\x9e\xa3\x1e\x4e\x76\x48\x47\x33\xbf\xfc\x9d\xc6\
-\xad\x0a\xb3\x1c\x9e\x2d\xd1\x3f\x5b\x21\x5d\xf9\x4a\x8d\x5d\xcf\
-\x61\x2e\x1f\x3f\xa6\xae\x3e\x30\x84\xb8\xff\x44\xe0\x9e\x62\xe9\
-\xf4\x5e\x8b\x8c\x2e\x55\x1d\xc6\x8b\x32\xf5\x3d\x62\x43\xe6\xf4\
-\x4c\x2c\x71\x44\x72\x8b\x1b\xb0\x71\xcc\xa2\x6d\x08\x96\x9c\xcd\
-\xf5\x1e\x9f\x27\xeb\x6b\xcb\x8d\xc7\xc1\xc6\x64\x9b\x3a\x93\xfa\
-\x07\x43\x3c\xdb\xe0\x36\xf8\x3e\xa8\xba\xdc\xe9\x71\x8c\xe1\xd3\
-\x75\x9c\xb3\x75\xe5\x7f\x31\x6e\xdb\xd2\x83\x83\x84\xf2\x49\x22\
-\x4b\x22\x10\x12\x9f\x46\x1b\xa7\x2b\x0c\xeb\xcd\x56\xf9\xaf\x21\
-\x15\xce\xfa\xd6\xcd\x47\xc8\xd6\x15\x13\x2c\x4f\x97\x53\x0c\x74\
-\xae\xfe\x3a\xe6\x87\xb2\x4a\xd6\x44\xbb\x1f\xf8\x7b\x21\x84\xde\
-\x4b\x53\x7e\x88\x72\x7c\xfc\xa8\xaa\xd5\x85\xac\xe0\xe5\xef\xe2\
-\x5b\x7f\x81\xee\x0a\xfe\xbf\x1e\x59\x93\x94\xac\xe9\xb0\x9b\xc9\
-\xf1\xf1\xe2\x3e\x5c\x3a\xbc\xfd\x71\x88\xb7\x7c\x52\x59\x82\x10\
-\x71\xbb\xb2\x59\xf3\xcd\x88\x3f\x90\xe8\x44\x6b\x1a\x9f\x09\xf8\
-\x96\xb6\xf0\xe4\x02\x0e\x1d\x24\xdd\xea\x93\x10\xed\x86\xdd\xf1\
-\xad\x37\x7b\xba\x49\x0b\xb8\x62\xa7\x12\x04\x83\x66\xd9\x94\x83\
-\xd7\xc5\x80\x32\x03\xfa\x63\xc5\x32\x49\x92\x96\xb1\xc5\x27\xe6\
-\xf0\x0b\x8f\x9b\x49\xa4\xe6\x8d\x84\x63\x2c\x8b\x4a\x3c\xe6\x35\
-\xdb\x0a\x6d\x8f\x3d\x53\xfd\x41\xde\xd9\x26\x9d\x8c\xbf\x9f\x77\
-\xb9\xe7\x6c\xd8\x0a\x6b\xe8\x0c\x4f\xc6\xec\x78\xf3\xe6\x83\x1a\
-\x6c\xf9\x7b\x4f\x12\xf4\x1b\x34\x7f\xca\xc1\x13\x35\x1e\xf1\x9d\
-\x10\x77\x04\x49\xf9\x5e\x8a\xc0\x2c\x53\x44\x82\x68\x98\xe6\x7c\
-\x1b\x4f\x54\x70\x04\x64\xde\x7f\xaa\x48\x86\x33\x07\xf1\x53\x45\
-\x2b\x31\xd6\xcb\xea\xa2\x5c\x0d\x8a\x78\x94\x79\x73\x17\xa9\x3b\
-\xa9\xa6\xb0\xf5\x89\xf9\x1c\x2d\x74\x6a\x0a\x97\x2e\x11\xbc\x2f\
-\x71\xf6\x72\x44\xc0\xa1\x60\xee\x66\xb1\x26\x42\x19\xff\x4c\xc8\
-\xe2\xfc\x8c\x48\xf5\x70\xa0\x1a\xc3\x64\x15\xc2\x6f\x63\xe5\x18\
-\xde\xf8\x2b\x9c\xfb\x06\x3e\xd4\xf8\xa8\xcd\x6e\x54\xb5\x69\xdf\
-\xd5\xc6\xa1\x00\x2f\x9f\x40\x6d\x15\x7f\xdf\xc7\x75\x0b\x8b\x3d\
-\xeb\xff\x9c\x48\x79\xc6\x12\x07\x98\x9d\x68\x58\xc6\xac\x47\x9a\
-\x64\x65\x9d\xad\xd9\x8f\x2d\xb3\x01\xea\xb7\x01\xee\x35\xe3\x20\
-\xd2\xb7\x43\x21\x9f\xea\x53\x82\xf8\x0a\x18\x0d\x07\x39\xc2\x70\
-\x98\xb3\xf8\x34\xda\x4f\x27\x2b\x06\xbc\x00\xdf\xc5\x47\x2d\x3c\
-\x3d\x8f\x67\x6a\xf8\x65\x48\xcb\xd3\xc9\x92\x8c\xfc\xac\x50\x71\
-\x9a\x21\x8d\x92\xc3\x2a\x6e\xfb\x38\x0a\xb6\x35\x05\xd1\x8a\x0d\
-\xb8\x89\x99\x2d\x8e\x03\x5c\x41\xd4\x44\xa6\xb1\x1e\x32\x2b\x9d\
-\x16\x4e\xd6\x70\xc7\xc1\x3b\x2e\x05\x0b\xe6\x02\x42\xf3\x83\x82\
-\xda\xf6\x66\xe3\xda\x72\x62\x26\x66\x80\x94\xd1\xa7\x9f\x6d\x17\
-\x27\x6d\x92\xc7\xbc\xec\xb7\x2d\x5c\x9f\x67\xd9\xce\xd7\x54\xea\
-\x2c\x2c\xa9\x8b\x92\x7c\x8b\x2a\xc1\xf1\x2a\x57\xa0\x1d\x79\x63\
-\x30\x29\x59\xa9\xa7\x5e\x00\x09\xce\x51\x93\x56\xcd\x24\xca\xbb\
-\x4a\x48\xd3\xc5\xea\x0e\x33\x8e\xc1\x29\xb4\xfb\x41\xe1\x47\xd8\
-\x5e\x6b\x19\x30\x41\x61\x02\xd6\xc7\x5f\x3b\xf2\x83\xbf\xbe\xee\
-\x9c\xc1\x2f\xfb\xb8\xd1\xb7\x7c\xf7\x3e\x39\x67\xd8\x64\xb7\xf2\
-\xf3\xa7\x70\xad\x82\x5f\x6e\xe1\x7e\xcd\x4e\x9c\x0c\x2c\xb6\xb1\
-\x29\x79\x6a\x0f\x45\xa5\x28\x97\xa0\x45\x37\x99\x08\x5a\x58\x27\
-\x4f\x7d\x6d\x85\xe2\x2d\xd7\x3a\x31\x55\x5d\xd9\xfd\xc4\xa0\xe4\
-\x13\x9a\x0a\x8f\x57\x54\xcc\x5f\x50\x25\xc3\x15\x45\x69\xee\x2c\
-\xf3\xec\x07\x9b\xc0\x9d\x79\xce\x35\x38\x2f\xf0\xbc\xc0\x3f\xf6\
-\xc8\x07\x46\x62\xf4\x6e\x56\x17\x69\xd8\xb5\x68\x39\x5e\x2c\x60\
-\x45\x4a\x1b\x82\x7b\x51\xdb\x5a\x87\xb4\x78\x2c\x88\x6a\x88\x62\
-\x68\x5e\xe6\x95\xd5\x2a\xde\xb5\xf0\xef\x42\x0d\xe7\x17\xa8\xbf\
-\xf9\x6b\x0f\x77\xaa\x71\xfd\x2b\x7d\xb6\x4e\x8a\x4d\x60\x9c\x4b\
-\xb3\x43\xde\xfc\xd1\x06\xe9\x65\x9f\x08\xb6\xd5\xfb\x96\x10\xaa\
-\x72\xea\x6b\x85\xcc\xb0\x34\x2c\xc9\xdb\xbd\x9e\x54\x6a\xd5\x53\
-\x74\x8b\x8f\x31\xf7\x9d\xd4\xad\xbe\x80\xe9\x79\x2a\x4a\xb7\x98\
-\x91\xac\x1e\xc1\x1f\xfe\x14\x2f\xff\xe4\xfa\x67\x0e\x3e\xd8\xb6\
-\xfa\x8f\xd6\x5f\xa9\x2e\x16\xfb\x78\x75\x15\x07\x96\xf1\x6b\xcd\
-\xfc\x5a\xbf\x41\xe7\x1d\xd3\x01\x82\x58\x90\x43\x38\x71\x69\x9d\
-\xdd\x40\x26\x8a\xdd\x60\xcf\xd1\x93\x2b\xb4\x69\x13\x1e\x6c\x49\
-\xf4\xe7\x63\xd8\xaa\x6d\x41\x7e\xb5\x4d\x4a\xcc\x75\xdb\xff\x1a\
-\xa8\xb8\xf3\x75\xc4\xd0\x4b\x24\xe9\x8a\x93\x6e\x83\x27\x6d\x0e\
-\x6e\xa2\x4c\x83\xb3\x4f\x28\x7c\xa9\x8a\x7f\xf0\xd9\x81\x15\xc9\
-\xe3\x90\x3d\x2f\x63\xf3\x4a\xef\xa9\xd1\xbb\x6e\x2a\x34\x1d\x46\
-\xde\xec\xd3\xab\xd0\x8e\x9b\x49\x66\x93\x8d\x54\xa9\xb2\x17\x53\
-\xfb\x73\xd4\x1c\x6f\x74\xf0\x95\x25\x0e\x6d\x36\x11\xf9\xcd\x10\
-\xdb\x75\x3b\x40\x0a\xa3\xec\x48\xe3\x08\x54\x83\x97\x2f\x7d\x9c\
-\x6e\xd1\xcd\x9b\x9f\x7f\xb7\xcd\xed\xc2\xf8\x02\x2f\x9b\x4c\x94\
-\xb9\xca\x6b\xfa\x1a\xc7\xd7\x5c\xf3\x99\x78\x5d\x04\xdf\x55\xb9\
-\x1d\xeb\xd9\x57\x42\x6c\xf7\x3a\x89\xa4\xc6\x45\x96\x62\x6c\x9a\
-\xd2\xde\x03\x99\x9a\xdc\x2d\xa6\x16\x48\x2b\x98\xab\x53\x4e\xaf\
-\xd7\xca\x55\x9d\xa0\xef\xe3\xd4\xd3\x78\xe3\x3f\x61\xed\x12\x7e\
-\x13\xe2\xda\x26\xda\x21\xf9\x86\xce\x36\x07\x84\x1c\xaf\xe3\xcb\
-\x07\x58\x64\xf9\xbb\x00\x37\xad\x12\x06\x87\x85\xf4\x63\x9d\x8c\
-\x28\xf7\x2f\xe4\x60\xce\x11\x41\x70\xa3\x45\xd2\xd5\xb1\x79\x96\
-\x9f\xae\x86\x56\xae\x43\x66\x46\xd3\x38\xb6\xa8\xd9\xf3\x49\x70\
-\xf0\x44\xaa\xc8\x9f\xdb\x14\x91\xed\x25\x16\xb9\xa8\x37\xef\xe7\
-\xcc\xc1\x4d\x68\x78\xd5\x61\x5a\xd3\x40\xe7\xd7\x2a\xf8\x87\x2e\
-\xb5\xbf\x45\x35\x55\x88\xcd\xc1\x49\x73\x7a\x2d\x9b\xfb\x3f\x6a\
-\xd3\xf9\x06\x6f\x18\xbb\xaf\x57\x58\xa2\x46\xa2\x40\x36\xa4\x6d\
-\x79\x24\xe7\x1c\x50\xa8\xec\xa3\x44\x02\xc9\x98\x56\x01\xca\x4f\
-\x7c\xf0\x88\x54\x81\x31\x7a\x76\x15\x76\x19\x0f\x1c\x5b\xa6\x46\
-\x83\x79\xcb\x56\x23\x0e\x61\x75\x91\x58\x8d\x2e\x31\x7a\x3d\x85\
-\xd1\x8f\x24\xf5\x75\x91\xb9\x8f\x77\xfc\xd3\x6f\x08\xc3\x7c\x8e\
-\x78\x88\xcd\x84\x52\xcc\xb6\x5b\x8d\x22\x04\x3f\x30\xfe\xfe\xd5\
-\x9f\xba\xdf\xfa\xcb\x60\x6b\x05\x7f\xdf\xa5\x9e\x87\x6f\x1b\x2e\
-\xe4\x16\xe4\x26\x9e\x3f\x80\xc7\x4e\x10\x36\x18\x14\x6b\x40\x7e\
-\xb8\x1d\x2b\xc3\x18\xbf\x25\xa3\xec\x87\xa5\x30\xc0\x89\x79\x07\
-\xa1\x22\xc6\x7d\xaa\x46\x72\xef\xef\x04\xb6\x94\x95\xf8\x92\x99\
-\x27\x61\x7c\xe7\x61\x0f\xf3\x4d\x5c\x09\x63\x31\x5e\x55\x92\xa1\
-\x4b\xdb\x68\x99\x0f\x2b\x60\x14\x4a\xe6\x52\xb7\x40\x2a\x81\x09\
-\x33\x0e\x2a\x7c\xad\x8e\x7f\xdc\xc2\x5d\xdb\x16\xe3\x17\x35\xdd\
-\x09\xab\x39\x2e\x2a\xa4\xcd\x2c\x4a\xd4\x2d\xb1\xde\xc0\x15\x73\
-\xf2\xf5\x44\xac\x25\x2e\x97\xfa\x76\xd8\xb2\x66\xfb\xac\x89\x7c\
-\x7e\xd7\xe5\x3c\x92\xae\x1c\xca\x4d\x0e\x4a\x0a\x69\x9f\xad\x8d\
-\x9b\xef\xe3\x99\x0a\x73\x06\x6f\xc1\x62\x21\xc4\x6e\x1e\xf9\xf6\
-\xdf\xa2\xac\x62\x98\x0b\x64\x47\xc0\x3d\x8a\x96\x4a\x19\x2d\x07\
-\xb9\x0a\x57\xbe\xfd\x4a\xcc\x6a\xf7\xa3\xfb\x71\x21\xbc\x2e\x03\
-\xe2\xbb\x5e\x33\x3a\xcb\xad\xd7\xa9\xd6\xec\xa8\xae\x19\x13\xdf\
-\x35\x05\xfa\x16\x96\xf0\xc6\x7f\xc4\xa3\x6f\x04\x1f\x0a\x5c\x6e\
-\x61\x7b\xdd\xb6\x57\x1b\xcf\xbd\xc5\xe1\xa6\x2f\x3d\x86\x85\x05\
-\xfc\x73\x0f\x9f\xd4\xec\x0e\xd0\x8b\x1b\x20\x68\xf1\x51\xf6\xb3\
-\x62\x93\x95\x36\x6c\xd4\x01\x17\xc3\xc5\x1a\x1e\x11\xb8\x5b\xe3\
-\x9c\xb3\x6e\x68\xe7\x68\x8b\x51\x8c\xee\xd8\x7a\xfe\xa6\x15\xbc\
-\x0e\xcb\x61\xbd\xce\xd6\x23\x91\x65\x5c\x95\xd9\x7d\xe4\x9b\x4d\
-\xb8\xa2\x5b\x54\xc6\x6b\x54\x99\x89\x3f\xa0\xf1\xca\x12\xfe\xbe\
-\x45\xdf\xcc\xb6\xf7\x81\x40\xc3\x80\x75\xa7\xd9\x83\x12\x49\x9e\
-\x7c\xd6\xc6\x99\x05\xe2\xa2\x9e\xc3\x3c\xcf\x9c\x8c\xda\xbf\xec\
-\x56\x16\xb2\x0f\xe6\x91\x06\xab\xc2\x57\x3c\xca\xfb\x6c\xcc\x0d\
-\xe5\x7d\x06\x51\x44\xda\xd3\x6b\x3b\x3a\xea\x19\x0f\x47\x16\xb9\
-\xf5\x7d\x1a\xf2\xc2\xfb\x59\x29\x66\x51\x9e\xa3\xcc\x67\xe5\xcb\
-\x7e\x2e\x8c\x62\x55\x8e\x5d\xac\xc7\xae\xae\x69\x0a\xb4\xe5\x75\
-\x2b\x27\x91\x99\xd5\xb9\x45\x53\x04\x7e\x98\x22\x48\xf8\x75\x91\
-\x50\x82\x93\x4b\xe0\x69\x9d\x4a\xe6\x14\xa2\xb1\xa2\x86\x46\x21\
-\x25\x49\x01\xa1\x1a\x34\x2b\x46\x1d\xab\xbe\x1d\xf2\x71\xe1\xb9\
-\xda\x0f\xff\xba\xdf\x7c\x14\xbf\x68\xb3\x9f\xc3\xf7\xac\xc2\x9e\
-\xa6\x98\xe8\x45\x8d\x97\x4e\xf3\xa1\xfe\xad\x8f\xdb\x55\x6a\xcc\
-\x2b\x2b\x5c\x21\x83\x24\x31\x3f\x58\x4e\x56\x58\xca\x2c\x89\x79\
-\x0f\x4f\x36\xa9\x43\x7f\x45\xb3\x6c\xc4\x16\x6f\x19\x17\x1a\x55\
-\x76\xa7\x5e\xf5\x50\x59\xa2\x1e\x2a\x07\x3a\xb8\xa5\x3a\x16\x62\
-\x2c\x8e\x2f\x73\x1d\xf1\x83\x37\x57\xbd\x8c\x7e\x8f\x35\xd4\x5a\
-\x95\x51\xc4\x41\xe0\xab\x4d\xfc\xf7\x4d\x5c\x75\x63\x82\x3e\x2c\
-\xe7\x51\x5b\xa8\x66\xee\x8c\x01\x36\x9a\x35\x08\xcb\x87\xdb\xc2\
-\xd1\x45\x6e\x44\x1d\x45\xaf\x5f\xb7\xcf\x45\xb4\xc9\x41\x3a\xdb\
-\xe4\x50\xc4\x7f\x56\x4c\x53\x76\xdd\x18\xd8\x04\x09\x28\x77\x52\
-\x83\x9a\xd9\x13\xd3\xc3\x29\x1f\x4f\x99\xe5\xbd\x80\xb7\xba\x2c\
-\x59\x44\x42\xc4\x2a\x97\xa8\x15\x25\xb1\x8a\x2a\x49\xda\x14\x42\
-\x9d\xc2\xcc\x66\x9e\xc0\x57\x58\x85\x9d\x08\xeb\xd5\x84\xdc\x4a\
-\x11\x3f\x67\x3c\x4a\x51\x53\xe4\x67\x76\x48\xe4\x34\xf8\xbd\xcd\
-\xa8\xcb\xa0\x51\x76\x27\x85\x75\x5f\xf7\xc3\x40\x57\x7d\x7c\xe7\
-\x7b\xf8\xca\xff\xd6\xbf\x31\x8f\x5f\x05\x68\x6f\x33\x6f\x13\xcd\
-\xb3\xaf\xdf\xc1\x73\x73\x38\x77\x9e\x72\x76\x1f\x2a\x12\xe8\xc3\
-\x20\x1e\x35\xae\x12\x6a\xb8\x4c\x92\xe1\xd2\xaa\xd3\x18\x73\x39\
-\xda\xc1\x63\x4b\x34\x9d\xcb\x56\x14\xc0\x17\xa3\x39\x96\xf4\x5d\
-\x5b\x59\x20\xc5\xad\x97\x74\x66\x48\x8c\xaa\x1a\x0d\x6e\xb4\x28\
-\x72\x45\x13\xfb\xdf\x86\x46\x63\xf5\xc1\x4d\x00\x6a\x4e\xf6\xae\
-\x8f\xd5\x0a\x0b\xcc\x72\x1d\xd7\xcc\x02\xb6\x80\x7b\x00\x20\xa2\
-\x8a\x92\x4e\xfc\xf6\x9d\x2e\x99\xc9\x4d\x4b\x2c\x5b\xd7\xd4\x91\
-\x6d\x0a\x3c\x3e\x4f\xb9\xed\x0f\x7b\xf8\xd0\xc5\x76\x10\xd7\xb0\
-\x54\x2e\x35\x34\x98\xf0\xb3\x72\x0f\x4f\x34\x39\x65\xe8\x33\x1b\
-\x00\xb4\x2a\x44\xf3\x7e\xc9\xc5\xe6\x63\x15\x55\x84\x64\xd4\xd8\
-\xba\x6c\x61\x81\x56\x4c\x07\x54\xf4\x8c\x6e\x5e\x8f\xb1\xfb\x02\
-\xab\x15\xc5\xd5\x22\x55\x42\x49\x18\x69\x7a\x1a\xb3\x0c\x46\xa7\
-\x2a\xa4\xa6\xc3\x2a\x3b\xfe\x8e\x9b\x6b\xaf\x17\xfa\x58\x3e\x87\
-\x1f\xfe\x15\x2e\x7c\x15\xef\x68\x7c\xea\xa3\xdb\x8a\xc5\x13\xf5\
-\x06\xbb\x34\xbe\x72\x1a\xcd\x65\xfc\xb2\x87\xcf\x84\x0d\xd4\xaa\
-\xcc\x63\x46\xf3\xcc\x62\x61\x40\x1d\x9f\xa4\xb4\xa9\x9b\xca\x06\
-\x4e\x55\x71\x72\x3f\x07\x4d\x1a\xdb\xea\x55\x33\xd2\x48\x3a\x2b\
-\x84\x13\x69\xd4\x34\x25\x3c\x8f\x6b\x2c\xdd\x0a\xad\xa7\xc8\x1f\
-\x8f\xc9\x3c\x14\xb3\x05\x5d\x72\xa4\xd7\x43\x36\x13\x06\x15\x5a\
-\xf0\xb2\xc0\x2b\xcb\xf8\xdb\x2d\x5c\x6f\x59\xd3\x8f\x10\x51\xc4\
-\x3b\xb0\x8a\xe4\x91\xa5\x04\x55\x5c\xbd\x87\x73\x87\xd9\xed\xd1\
-\x6a\x91\xc2\xf0\x72\x03\x2d\x0f\x3f\x17\x94\x4f\x33\xb0\xde\xaf\
-\x27\x52\xac\xa9\x9e\xaf\xc1\xed\x77\x7a\x38\xef\xe3\xb1\xfd\xa4\
-\x94\xfd\xb6\x83\xdb\x95\x18\xd1\x85\x25\x88\xae\xd0\xe8\x55\x39\
-\x82\xd7\x25\x90\x5d\x15\x11\x30\xd5\x24\xff\xad\x67\xbc\xdb\x0f\
-\x8f\x9f\x23\x76\xbc\x21\x08\x66\x12\x98\x8b\xb4\x20\xd4\xf3\xf1\
-\xe4\xf3\x78\xe3\xff\x42\x78\x1a\x7f\x1f\xe0\xde\x16\xd3\x35\x62\
-\x9b\x29\xea\xa0\x4f\x8d\xbe\x57\x8e\x61\xbb\x8a\xff\xae\xd9\xa8\
-\xa1\x36\xec\xd0\xa8\x39\x8b\x8e\x12\xd9\xf1\xa8\xcf\x90\x29\x4b\
-\xcd\xca\x4b\x2d\xc0\xa3\x0d\xae\x96\x5b\xb0\xc3\x9e\xb2\x60\x5d\
-\x64\x05\xdd\x07\x09\xec\xaa\xa6\x5a\xa5\x89\x8f\x95\x28\x88\xb4\
-\xf2\x38\xa7\xb0\xc3\x4d\xe7\xc2\xdf\xc2\x07\x63\xf6\xba\xfb\x1e\
-\x65\x76\xe6\xac\xf2\xc2\x86\x4f\x4d\x35\x62\xfd\xbb\xb8\x6e\x76\
-\xc2\x26\x8f\xa5\xc2\x61\x76\x32\xa6\x27\x55\xb8\x60\xae\xdd\xc6\
-\xb1\x05\x5c\x0c\xf1\xd5\x39\xdc\xf4\xf0\xcf\x2e\x3b\xbf\xa2\x54\
-\x4f\x61\x20\x2e\x2c\x17\x63\x49\xb1\xd0\x71\xb0\xc6\x99\x98\x57\
-\x05\x47\x8f\x84\x48\xa6\xd5\x5a\x01\x1c\xa9\x91\x1f\x6a\xaf\x4a\
-\x20\x8d\x2a\xe2\x23\x14\xa2\x1a\x14\xb5\x84\xeb\xe9\x7c\xc4\xce\
-\xf2\x98\x0f\xb0\xcf\x30\xce\x0f\xee\x62\xb6\x7d\x45\xda\xde\xbf\
-\x3e\xc4\x1a\xbe\xfd\x13\x7c\xf5\x27\xf8\xac\x86\xf7\x3b\x68\x75\
-\x88\xda\x69\xa9\x35\xd4\xee\xe1\xb9\x35\x5c\x3c\x89\x8f\x3d\xbc\
-\xe3\x5b\x29\x49\x0d\x6f\xc1\x56\x6d\x7a\xc3\xf9\xe3\xf1\x33\xae\
-\x5a\xb2\xb8\x55\xea\x7a\x74\x91\x8c\x65\x13\xc2\xf6\x12\x25\x30\
-\x9d\x65\x10\xc8\xec\x63\x93\x03\x2d\x34\x39\x94\x89\x14\xd9\x49\
-\x7d\x53\x56\x4c\xc4\xd8\xc4\xce\x00\x0d\x98\x33\xef\x6b\xdc\x69\
-\x63\x6e\xce\x92\x0b\x5c\x0e\x90\x3a\xe8\xe3\x95\xfd\xf8\xaf\xeb\
-\xac\xd1\xca\xb8\xd1\xc3\x1a\x7d\xe2\xf2\xb5\x3d\xad\xcf\xee\xe2\
-\x31\x89\xef\xae\xb0\x68\xfd\xab\x2a\x71\x7f\x37\x9a\xce\xa0\xe3\
-\xf9\x03\xe9\xa6\x27\xb3\x78\x9c\x2e\xc7\x8a\x3c\x59\xa5\xe2\xe7\
-\xbf\x54\x29\xcb\x3a\x40\xf3\xc3\x79\x69\x4e\xb1\x9b\x0f\x8b\xd8\
-\x07\x85\x6e\xbe\x90\x4c\x9f\xc7\x7b\xa2\x88\xb2\x36\x0d\x62\xd1\
-\x93\xb2\xe5\xaa\x18\x26\xb9\x19\x65\xe0\x38\xa9\xa2\x33\xf4\xaf\
-\x61\x4c\x93\x38\x46\x99\x1c\x6f\x14\xd5\xa8\x24\x21\x93\x68\xfa\
-\x89\x5c\xac\x3c\xda\xd0\xa8\x39\x9a\x26\xce\x73\x87\x94\xe3\xeb\
-\x29\x2c\x3f\xba\xf6\xc7\x7f\x73\xe7\xe2\x4b\x78\xaf\x6d\x21\xb8\
-\xa0\x42\x81\xe8\x11\xf4\x2f\xb7\xf1\xf2\x59\xac\xae\xe0\x5f\x3b\
-\x4c\xb7\xb7\xa3\x28\x36\xd1\x86\x13\xb6\xc2\x29\x6c\xd6\x52\x57\
-\x2d\xb3\x11\xcc\xf6\x1c\x05\x4e\x2f\x12\x3a\x6d\x0c\xd8\xe4\x3a\
-\x83\x74\x47\x4a\x8f\xc3\xd9\x52\x01\xd7\x61\xa5\x61\x25\xea\xe5\
-\x50\xbd\x5e\x14\x15\xb2\x75\x91\x0a\x69\x59\x7b\x44\xde\x44\xd8\
-\x45\x60\x9d\xf7\xbd\x1e\xf6\x6b\xec\xb3\xad\x4f\x66\xbd\xdd\x93\
-\x24\x42\xbf\xb6\x82\xbf\xbb\xc6\x58\x53\xd4\xe9\x90\x45\x18\x5b\
-\xbf\xb2\x4c\x35\xb3\xb0\x4f\xfa\xd5\xaf\xed\xf7\xde\xef\xe1\x5f\
-\xab\x96\x5e\x16\xc4\x91\xba\x50\xb6\xff\x3e\x51\x3c\x0e\x2d\x67\
-\x81\x0a\x70\x8b\x1c\x2b\x72\xb9\x4f\x88\xb8\x69\x47\xa2\x0f\xb0\
-\x8d\x2c\x0a\xd3\x81\xcc\x2c\x68\x14\x29\x79\xa8\x92\x80\x55\x95\
-\x53\x12\x74\x4e\x47\x68\x22\xb3\x2d\x6d\xd3\x32\x7b\xd8\xd8\xfa\
-\xac\xda\xa6\x4a\x61\xd7\x01\x0e\x27\x2f\xd5\x3c\x50\xed\x96\xa7\
-\x15\xc5\x14\x3c\x82\xdd\x33\xcb\x6c\x0b\x66\x9c\xb8\xd4\xe4\x8e\
-\x5f\xfa\x32\x7e\xf8\x9f\xef\x04\x47\xf1\x77\x1d\x62\x5c\x7f\xdb\
-\x8e\x3e\x76\x68\xcd\xc7\x03\xbc\x7c\x9a\xf5\xd7\x7f\xdc\xc6\xdd\
-\x0a\xa9\x07\x2c\xd3\x58\xb1\xcb\x68\xcc\x20\xa5\xc6\x05\x2b\x3e\
-\x11\xaf\x58\x29\x7a\xb5\xe3\x75\xce\xe1\xe8\x58\xad\xf7\x81\x14\
-\x35\xc4\x28\xbc\x19\x81\x1f\xf1\xcf\x0e\x67\x0c\x1e\xd4\x14\x14\
-\xe8\xce\x0d\x63\x2f\x89\xa1\xe0\x8c\x9e\xc4\x4d\x18\x49\x36\x8b\
-\x92\xac\x0e\x12\x29\x0e\xb3\x7d\xdd\xdc\xc2\xca\x12\xaf\x45\x59\
-\x65\xb2\xbb\x9a\xdd\xb7\x2f\x1e\xc2\xdf\xde\x24\x09\x39\x02\x1e\
-\xda\x12\x85\x45\x94\x69\x68\xe1\xab\x27\xbc\xae\x22\x75\x74\xcb\
-\xea\xef\x45\xa4\x34\x95\x9a\xed\x6a\x7c\x41\xd0\x21\x13\xef\x89\
-\x2a\xce\xcd\x63\xdd\xc7\xbf\xb4\x70\xa7\x69\xa7\x39\xa8\xa1\xa6\
-\xc6\x18\x81\x3e\x55\xe2\xd7\x0b\xd9\x94\x28\xf2\xf1\xba\x3c\xb8\
-\xd7\x63\x71\x4b\x98\xde\x96\xa3\x46\x33\x67\x68\xfa\x83\xfe\xfd\
-\x60\x10\x25\x46\x3f\xf4\xa9\x86\xdb\xd0\xac\x72\x2c\x49\xce\x79\
-\x37\xff\x5d\xac\x98\x88\xff\x73\xe5\x29\x58\x40\xe2\x84\x41\x45\
-\xb3\xcf\x1b\x6e\x03\xdf\xfb\x8f\x78\xed\xc7\xac\xad\xbc\xdb\x21\
-\xc7\x35\x10\x14\xad\x96\xf7\xf9\xca\xc7\xd6\x6a\xcf\x1c\xec\x5f\
-\x05\xde\x6b\x61\xb3\xc9\x2e\x07\xa5\xe3\x7c\xbc\x10\xc3\x28\x96\
-\xeb\xc7\x56\x3a\xcd\x16\x51\xf5\x38\x7a\x60\xc1\x6e\xfa\x5e\xaa\
-\x0b\x2c\xbf\x95\x15\x26\x13\xa2\x8c\xe1\x1d\x6d\x5c\x29\xfb\xaa\
-\x36\x13\x59\x3f\x64\x05\xa6\x47\x24\x1d\xc7\x24\xb6\xcb\x84\xec\
-\xa2\x7f\xab\x08\xba\xd8\x27\xb9\xde\xc6\x9d\x06\x0e\x5a\x52\x7e\
-\x60\x4f\xfe\x6e\x40\xa9\x85\x2f\xed\xc7\xdf\xdd\xc0\x66\x3d\x29\
-\x90\x59\xa8\x13\x7a\x6c\x72\x3f\xb4\x8c\x0f\x5a\x58\x9f\x27\xa6\
-\x0f\x23\x55\xb6\x6c\xcd\xd8\xbc\xf2\x8c\xc6\xb3\x35\x7a\x84\x77\
-\x3a\xec\x38\x69\xcd\xc5\xb3\xd9\xd2\xea\xb9\x65\x34\x9b\x30\xe7\
-\xce\xf3\x80\x5e\xe5\x92\x39\xaa\x28\xce\x99\x86\x43\x9f\x67\xb3\
-\x0d\xe2\x6c\x26\x18\x9c\x8c\x16\x62\x68\x2f\xd9\x78\x46\x37\x44\
-\x5d\x61\xbe\x42\x61\x74\xb3\x67\x9a\x7d\x72\x9f\xe4\xc0\x98\x9a\
-\x8d\x55\xfc\x90\x79\x5e\x0e\x12\xf5\x73\x7a\x69\x65\x59\x2b\x95\
-\x97\xa8\xcd\x4d\x23\x1c\x79\xf8\x02\xc5\x49\x9b\x61\xe6\xd4\xd8\
-\xb4\xc7\x0d\xb6\xe7\x60\xed\xec\x81\x1f\xbe\x79\xfb\xf4\xd7\xf1\
-\xeb\x80\x62\x01\x06\xed\x98\xed\x58\xd8\xec\x4d\xbd\x8e\x57\x17\
-\xe5\xc9\xa3\xfd\xdf\x6a\x16\x4d\xbb\x0b\x7c\x5a\x3a\xea\x8a\xaa\
-\xa6\x08\xf4\x16\x56\x39\x51\x73\x67\x80\x86\x79\xcc\xf3\x98\x07\
-\xf5\x42\x7c\x27\xc6\x5d\x19\x4d\xfa\x5c\x0c\x2a\x8a\x70\x79\x47\
-\xe2\x6e\x07\x27\x97\x29\x7e\xef\x63\xd8\xda\x37\x22\x70\xa7\xc6\
-\x96\x0c\x75\x09\xca\x47\x32\xa5\x30\x76\xf6\x3a\x46\x2f\x81\x89\
-\x43\x5a\x58\x5d\xe5\xf5\x45\x23\x71\x3c\x49\xdd\xd6\x03\x35\xbc\
-\x78\x04\xff\xed\xaa\x6d\x81\x77\x63\x8d\x23\xb2\x33\x16\xd8\x87\
-\xc5\x99\xc6\x32\x3e\xc9\x8c\x3c\x81\x01\x4e\x2d\x3c\xbd\xc0\x86\
-\xac\xeb\x1e\x87\x4c\x6d\x54\x38\x87\x27\x18\x4c\x08\x14\x13\xaa\
-\x10\xaa\xa8\x02\xa5\xca\x13\x3b\x98\xd4\x3c\x55\x16\xfa\x97\x99\
-\xbe\xd0\xb1\xbe\xac\x4e\xcd\x0c\x86\x9d\x7d\x5d\x33\x38\x50\xe2\
-\x80\xcf\xb9\x91\x87\xad\xad\xcf\x87\x2c\x66\x9b\x28\x6e\x5b\x90\
-\x6a\x7a\x5b\xb2\xc3\xa6\xed\xc6\xd3\x62\x3c\x03\xfc\x1a\xee\xf4\
-\x8e\x79\xef\xbf\x74\xe4\xcc\x34\x2e\xbd\xb6\xf2\xfd\xff\x74\x5b\
-\x1d\xc2\xcf\xbb\xb8\xe3\xb1\x09\x88\x5a\x1d\x5d\xd6\xa4\x56\x2a\
-\x78\xf5\x34\x9a\x75\xf5\xf3\x3e\xae\xd7\x18\xea\x79\x83\xb9\x68\
-\xae\xd5\x0b\x49\xd5\x1f\x62\x7d\x56\x2b\x13\x70\x7a\x81\xbe\x79\
-\x1b\xb1\xae\xef\x60\x1a\x9e\x28\xe2\xc4\x8b\x92\x8a\x09\x63\xc1\
-\x1a\x3e\x0a\xf0\xbc\xc6\x85\x00\xbf\xb6\xa3\x83\x47\xc4\x8f\xc4\
-\x04\x4d\xf2\x09\x79\xe8\xb4\xf4\x55\x24\x4a\x25\x2d\xdb\x71\xa3\
-\xc7\x39\x0e\x06\xa4\xb9\x16\x84\x98\xd8\xc6\xec\x89\xf7\x43\x1c\
-\xab\xe2\x85\xfd\xf8\xfb\xab\x08\x1a\x43\x6d\xda\x85\x06\x25\xa5\
-\xba\x8d\x44\x6b\x2d\x61\x1f\x71\xd3\xf3\x29\x7b\xf8\xc4\x2a\x6b\
-\x7f\x6f\x6d\xe3\xda\x42\xcc\xb6\x08\x52\x82\x08\x61\x2e\x50\x41\
-\xce\x9a\xf3\x78\x5d\x65\x7d\x47\x58\x5e\x9c\x2a\x4b\xd1\xa4\x13\
-\x4d\xaa\xa8\x5c\x35\x32\xc9\xd4\xc4\x5a\x4e\x87\xba\x5a\x0b\x73\
-\x58\xab\xe0\x88\xc7\x59\xe7\x6b\x2e\xe7\x9e\x0b\x7b\x7f\xd6\x2b\
-\x76\x8a\x44\x40\x7d\xa1\x58\xbf\xd6\x86\x40\x81\x1d\x85\x3d\x78\
-\x4c\x55\xe5\xe6\xb0\x7b\x11\xc9\x7e\xa0\x0a\xa8\x27\xf1\x25\xc7\
-\xc5\x02\x16\x85\x87\x76\x78\x58\xc5\x8e\x60\x67\x77\x48\x0d\x7f\
-\xf0\xc7\xf8\xda\x5f\xac\x7f\xb6\x40\xa5\xa1\xad\x0e\xa1\x6a\xc5\
-\xd6\x23\xbb\x7d\x0e\x47\x78\xe5\x18\x5a\x21\x7e\xd1\x25\x15\xde\
-\xb3\x9c\xfb\x01\xad\x44\xd9\x12\x8f\xb4\x84\xb3\x28\x5b\x11\x4d\
-\xaa\x59\x16\xf4\x7f\x1a\xf1\xb8\x0e\xa4\x32\x30\x85\x84\x82\xf1\
-\xa6\x69\x5e\xd6\x9f\xc3\x3b\x6d\x3c\x3d\x47\x21\xa7\xb7\x6c\xfd\
-\x58\xea\xa4\xce\x9d\x5a\x3f\x72\x8a\xf4\xc2\xb8\x9a\xcb\xa0\x14\
-\x15\xf9\x36\x81\xeb\x1b\x38\x74\x88\x24\x7b\x95\x88\xde\xb4\x89\
-\x0b\x71\x71\x09\xdb\x5d\xfc\x6a\xdd\xce\x1e\xf4\x99\xc5\x32\x2e\
-\xa0\x1b\x55\xa6\x02\x6b\x7f\x6e\xdc\x74\x7b\xc4\xc7\x0b\x55\x2c\
-\x55\xd9\x44\x7f\xb5\x41\x2f\xe0\xe5\x35\xb2\x45\x46\xe9\x64\xc4\
-\x70\xc3\x9c\xa1\x17\x62\x7d\x35\xb6\x3a\x2b\x4b\x16\x40\xf4\x7f\
-\x0a\xc3\x31\xd1\x03\xe8\x32\xfc\x44\x4d\xba\xca\x52\x87\x8e\xfc\
-\x88\x24\x0f\xef\xc0\x22\xbd\xa1\xf1\xe8\x9d\x0a\x29\x55\x9f\x85\
-\x14\xf1\xdc\x68\x12\x23\xf8\x56\x64\x25\xa8\x8c\x9e\x89\x0c\xad\
-\x9c\x89\xb4\xa1\x11\x99\x2f\x6e\x86\x80\x50\x28\x97\xc0\x1a\x50\
-\xd6\x96\xf3\xc5\x29\xad\x47\x7f\x9f\x4f\x68\x6a\x9b\xb2\x20\xe9\
-\x46\x5b\x9d\x53\x1f\x4b\xfb\xf1\xc3\xff\x1d\x67\xff\x80\x02\xd9\
-\x9f\x6e\xd3\xaa\x8c\x49\x99\x95\x40\xfa\xe4\x7d\x3c\xbd\x84\xa7\
-\x8f\x51\xd8\xec\x3d\xc1\x29\x4b\x5e\x74\x3f\xdc\x18\xab\x38\xa9\
-\xe5\x2b\xed\x8a\xd2\x56\x80\x7b\x25\x64\x77\x69\x94\x84\x0e\x4a\
-\xc8\x47\x45\x82\xe8\x99\x28\x33\xed\x7e\x22\xda\xd6\xdd\x06\x7e\
-\xdb\x25\x55\xcb\xc0\xe7\xdf\x1a\xf0\x53\x4f\x34\x05\x06\x9d\xb5\
-\x93\x22\xff\xe2\x86\x7f\x65\xa9\xce\x3a\x36\x7a\x9d\x75\xad\x9b\
-\x5d\x36\x7c\x9d\x6a\xc6\xed\x57\xb0\x35\x5d\xe3\xcc\x9c\x00\xcf\
-\x1e\xe2\xde\xfd\xee\xa6\x1d\xa6\x82\x58\x25\x21\x88\x28\x0f\x16\
-\xec\x2e\x6f\xb3\x1f\xf2\xd4\x3c\x6e\x07\xf8\x47\x9f\xba\x51\xbd\
-\xdc\x00\x67\x51\x42\x9d\xd0\xa9\xe6\xda\x11\xe0\xae\x8a\x32\x8c\
-\x79\xa3\x57\xb9\x9a\x46\x3e\x35\x39\x98\x10\x93\xce\x83\x31\x32\
-\xf1\xe9\xcb\x1a\x01\x56\x43\x8e\x49\x3c\xe6\xe0\x50\x93\x42\x74\
-\x0d\x4b\xff\xde\xb6\xb9\xdd\x0f\x14\xd6\xfb\x54\x3b\xec\xbb\x96\
-\x25\xea\xd8\xe0\xde\x29\x76\xc5\x36\x8a\x8c\x35\x7c\x92\x6b\x7f\
-\x28\x71\xed\x60\x2d\x05\x75\xd4\x3b\xa1\x6e\xc9\x7b\xae\x3a\xff\
-\x2c\xde\xfc\xcf\xa8\x3c\x82\x5f\xb5\xd9\xcb\x1c\x8d\x22\x33\x10\
-\xc5\x9b\x47\xad\x8d\xd7\x56\x71\xfc\x10\xde\xf2\xf0\x29\xd8\x49\
-\xd4\x4f\x2a\x9a\x32\x69\xe2\x8c\x71\x48\xe2\xe9\x99\xd2\xf1\xb1\
-\x62\x76\x3d\xdb\x3b\x1b\x44\x8b\x5b\x94\xe6\x71\x27\xfe\x7e\x34\
-\xcb\x25\x39\x9c\xde\x78\xd3\x67\xaa\x2c\x2a\xfd\x2a\x20\xae\xd0\
-\x56\xdf\x9d\x1a\x24\x6e\x0c\x96\x9c\xb1\xcc\xad\x91\xdc\x08\x06\
-\xe6\x9e\x35\x0a\xa5\x62\xdd\x66\xf3\xeb\xeb\xf7\x70\xb8\x19\xb7\
-\x9c\x47\xab\xd1\x73\xd9\x48\x69\x36\x81\x57\x0e\xe3\xee\x26\x6e\
-\x1a\xbb\x5f\xb4\xca\xda\x01\xcf\x87\xcd\xf5\x1e\x9e\x36\xdf\x35\
-\xd2\xec\x0c\x30\xbb\x25\xa9\xa5\xe3\x8b\x58\x28\x5c\x4e\xda\x88\
-\x74\x36\x8a\xd5\x63\x81\x0d\x8a\x28\xc7\x28\x4a\x59\xaa\x91\x76\
-\xc1\x48\x2f\x28\x69\xf2\x92\x3e\x93\x10\x4b\x3d\x1c\xf0\xe8\xb6\
-\x4e\x38\x9c\xa2\xde\x58\xa0\xa3\x34\x5e\xfc\x7e\x17\xef\xd4\x98\
-\xc8\xda\xb2\x83\xee\xfa\xc9\x68\x54\xe5\x0e\xc7\x47\xcb\x92\xb2\
-\x60\xe1\x50\x30\x91\xd1\x09\x9c\x38\x33\x67\x6a\xdd\x3f\x91\x88\
-\xbf\x8e\xf0\xe9\x0d\x64\xef\xf6\xcc\x43\x52\xdf\xf8\x11\xbe\xf5\
-\x37\xb8\xb7\x84\xf7\xfb\xd4\x1b\x32\x20\xcc\xe9\xd1\xe8\x4d\x14\
-\xbb\x7a\x15\xaf\x9d\x40\x7d\xd5\x2a\x15\xdb\xed\x3b\x4c\x92\xb2\
-\xec\x90\x72\x33\xa8\x5a\xa4\x6e\xf3\x32\xb0\xdf\xb1\x7c\x43\xab\
-\x08\xab\x8a\x3a\x3e\x45\x11\x21\x64\x4c\x27\x44\xfa\x8d\xb2\x8e\
-\xeb\x21\x33\xad\xcf\xd4\xf0\x75\x89\x5f\x59\xe9\xbc\x80\x15\xdd\
-\xb8\x17\x56\xe6\x7a\x6d\x51\x34\x92\x49\xe5\x92\x39\xb1\xe9\xeb\
-\xc4\xfd\x23\xa6\x8f\x99\x70\x65\xc3\xc3\xad\x16\x87\x21\x3b\x29\
-\xd6\xbb\x5f\x61\x16\xf2\x68\x85\x37\xea\xff\xfd\x1d\x5a\x6d\xab\
-\x56\xe9\xb2\x68\x7d\x52\xb1\x6b\x71\x71\x1e\x97\xc1\x1e\xc2\x28\
-\xa6\x0f\xaa\xc3\x89\xa2\x28\x91\x27\xc9\x43\xf9\xbc\x9b\xd7\xe5\
-\x55\x2a\x55\xce\x3c\x45\x8a\xce\x19\x1d\x27\xb4\x43\xd8\x2b\x21\
-\x87\xdb\xad\x02\x87\x2a\x38\xae\xe8\xd4\x57\xec\x08\x5b\x73\x37\
-\xee\x09\x56\x15\xee\x06\xb4\x75\x13\x8f\x7a\xb6\x2b\x3a\x68\x24\
-\x96\x10\x24\x99\xdc\x92\xb1\xb5\x62\x6c\x1f\x1c\x1e\xfe\xbc\x13\
-\x13\x66\x85\xfb\xea\x6f\xfc\x75\xef\x95\x3f\xc1\x07\xa0\xd1\xb7\
-\xfb\x74\x54\x74\xd1\x1d\x84\x1d\x1c\x5e\xc4\x97\xcf\x51\x57\xf1\
-\x17\x8a\xca\x5b\xbe\xdd\xf8\x86\xa2\x1a\x72\xb8\x47\xc7\x49\x95\
-\x28\x51\x13\x70\xd0\xf1\x72\x25\x0e\x65\xe0\x8c\x76\x05\x8b\xa2\
-\x91\x18\x28\xc9\x3c\xe4\x7d\xd5\x60\x6d\x38\x0e\x67\xf7\xfd\xb7\
-\x10\x8f\x4b\xbc\x66\x67\x14\xff\x1a\x2c\x33\x11\x9b\x25\xc8\x34\
-\x3e\xa5\xf4\x82\x29\xab\xcc\xeb\x18\x46\xc6\x8e\x3f\x8c\x3d\x7d\
-\x94\x98\x8f\x6a\x52\x66\x5d\x5d\xbb\x8f\xb5\xf9\xa8\xee\x1c\xb7\
-\xde\x32\x74\xa9\xe0\x96\x47\x08\xf4\xcc\x01\xfc\xd7\xdf\xc1\xdf\
-\xc4\x9c\x8b\x97\x1a\x54\x67\xb8\xa3\xf0\x4f\x5d\x3b\x3d\xb3\x4e\
-\x37\xaf\x4b\xaa\x6c\xf9\xc2\x82\xca\xda\x77\xe1\x1a\x18\xd3\x4a\
-\xa2\x72\xb8\x51\x45\x0d\x6b\xbe\x65\x8f\x06\xec\xf1\x6f\x84\x0c\
-\x36\x0e\x00\xc7\x14\x45\x39\x0f\x2c\xa0\x6e\xa7\x29\xb6\x34\x27\
-\xca\xfc\x4e\xe2\x7e\xd5\x0a\x6b\xda\xc4\x76\xe8\xc6\x35\x75\x73\
-\x2b\x1c\x35\x64\x07\x6b\xb7\x60\x54\x84\x2e\x27\xcf\xed\x3d\x3f\
-\x67\x32\x15\x27\xd5\x29\xd0\xef\x62\xe5\x24\x7e\xfa\x7f\xf6\x8e\
-\xbc\x82\x9f\x03\xb7\xb6\xd1\xf7\xec\x25\xd9\xad\xce\xc0\xfd\xd3\
-\xab\x78\x6d\x1f\x3e\xad\xe1\x7d\x4d\x25\x23\x2f\x64\x10\x1c\x51\
-\xe7\x65\x36\x4d\x9e\x7e\x84\x06\xdc\xd7\x43\x2c\x26\x59\x2a\x95\
-\x80\xf2\xf4\xf5\xa9\xdc\xcc\x1c\xe4\x52\x13\x18\xab\xb5\x9b\x9e\
-\x7e\x6c\xf0\xc3\xaf\x7a\x1c\x1e\xf8\x58\x15\xdf\x11\xf8\x24\xc0\
-\xfb\x9b\xac\xa3\xf9\x73\xd4\xc3\xa9\xe4\xe7\x6c\xe6\xca\xc0\x83\
-\x34\x4e\xac\x51\x1e\x79\xfd\x41\x7a\x2e\xc1\xd7\xca\xe2\xfa\xf5\
-\x1e\x6e\x77\x38\x2c\x28\x8e\x37\x6c\xd4\x6b\xae\x74\xcb\x02\x80\
-\xe7\x4e\xe2\xca\x5d\x9c\x56\x78\xbe\xc6\x9d\xd3\xac\xc3\xdb\x21\
-\x25\x8b\x23\x09\x72\xad\xb2\x73\x06\xca\xb9\x8d\x3a\x6b\xf7\x79\
-\xe2\x4d\x58\x54\xab\xca\x3b\xfb\x21\x40\xb2\xca\x73\xb5\x00\x4b\
-\x02\x87\x36\x98\x78\x39\x52\xc3\xfe\x2a\xe6\x7d\xee\xdb\xfd\x1a\
-\x35\x54\x2e\x5b\xd7\xbe\xe5\x70\x96\xa3\xd9\xea\xcd\xb7\xd2\xa9\
-\x8a\xf8\xa0\xd2\x62\xa7\xc4\x49\x0c\xa5\x53\x50\xbe\x86\xa7\x49\
-\x2d\xf0\xef\xa7\xbf\x86\xed\xce\x58\x84\x93\x78\x57\x51\x44\xc8\
-\xc9\xdc\xc7\x68\x64\x5a\x35\xee\x60\x60\x7a\x3e\xe0\xd4\x10\x03\
-\x3c\x02\x8f\x32\x66\x3f\xfb\x2f\x08\xce\xf3\xd9\xac\x77\x2c\x09\
-\x27\xb4\xd8\x46\x5a\xdc\x3c\x8f\x27\x97\xf1\x0e\xf0\x49\x22\xc9\
-\x82\x20\xb3\xb2\x9d\x22\x3d\x19\xde\x0b\x9f\x9e\xde\x0b\x18\xb7\
-\x69\x91\x09\xda\x64\x51\xb6\x11\x39\x78\x93\x4f\x5f\x14\x76\x51\
-\xa8\xec\x73\x0d\x34\x5c\x9f\x13\x2d\xcf\x55\xe8\x8c\x6f\xb6\x70\
-\x59\x52\x98\xd2\xab\xc4\xe7\xe9\x64\xf7\x9c\x34\xd6\x8c\xcc\x9d\
-\xe3\x63\x07\x09\x1c\x1d\x7b\x47\x5e\x79\xcf\x22\x01\x3b\xfd\x53\
-\x59\x73\x5b\x31\x7e\xfd\x18\x7b\x05\x07\x61\x25\x47\x30\x06\xa8\
-\x6f\x51\x85\x7c\x4d\x11\xc9\x18\x1b\x32\xfb\xcf\xb6\x93\x04\xb8\
-\x45\xa1\xb6\xcc\x91\x0e\xd2\xf3\x2e\x87\x3c\x05\x1d\xa7\x8f\x74\
-\x0a\xa2\x84\x39\x73\x1f\xa4\x7a\x22\x56\x8f\xe8\xa3\x1e\xb0\x38\
-\xba\xe2\xb0\x8b\x8d\xdf\x8a\x02\xa0\x0d\xbb\x43\x79\x8a\x53\x10\
-\xef\x49\x22\xb4\x0d\x41\x65\x42\xcf\xce\x8c\x08\xdd\xe2\x0c\xa6\
-\xc8\x55\x54\xc4\xc4\x8c\x70\x51\x8e\xae\xb0\x32\x53\xdd\x63\x9c\
-\x23\x63\x20\x8e\x68\xb8\x9f\x31\xc4\x25\x36\xfb\x79\x3d\xbc\xf8\
-\x23\x7c\xef\x3f\xe1\xee\x22\xc5\x25\x37\x25\x79\x38\xe6\x36\x99\
-\x30\x37\x98\x43\xf5\x2e\xbe\x3c\x87\xc3\xcb\xf8\x67\xc1\x66\xe7\
-\xc0\x49\xee\xbe\x93\xd1\x90\x19\x18\xd3\x88\xe8\x5c\xdd\xf6\x89\
-\xb6\x35\x13\x58\xc2\xa6\xf9\x22\x4d\xf0\x7c\x69\x69\xd4\x04\x75\
-\x9c\xea\x9e\x58\x78\x2f\x44\xfc\x8e\x20\x39\xf9\x3d\xcd\x85\x7a\
-\x14\x38\x39\x87\x57\x35\x3a\x3e\xc5\xe3\x6f\x78\x58\x57\x56\xcc\
-\xa3\x92\xcd\xee\xab\x98\x91\xa1\x13\x35\x70\xb3\x77\x3b\xd6\x4e\
-\x85\x4a\x7c\xfc\xa0\x40\x63\xd3\x53\x11\x9c\xdd\xb8\xc7\x58\xe8\
-\xe8\x42\x7c\x39\x81\x35\xc3\xe5\x80\x6a\xac\x2b\x0a\x9f\x3a\xf8\
-\xa4\xc7\xd4\x75\xd7\x1d\x2a\x23\x4c\x93\x4b\x55\xd9\x64\x8b\x4e\
-\xd1\xf1\xe3\xdb\x12\x99\x7e\xa2\x47\xa2\x52\x13\x6d\xa3\xe1\x59\
-\xc6\x9d\xcf\xbb\xd8\x1f\x62\xcd\x80\x16\xfb\xcd\xbe\x47\x1b\xb1\
-\x74\xad\x78\xe0\x15\x10\xc0\xac\x0b\x42\xd0\x9e\x95\xb2\x0a\xa3\
-\x71\x60\x5e\xdc\xf0\xa9\x27\xe1\x72\x4c\x31\xee\x2a\xbf\x06\xc4\
-\x04\x6e\xe6\x5e\xf3\x31\x63\x8c\x6b\xbd\x01\x45\x89\xcd\x66\x37\
-\x8f\x1f\xfc\x25\x5e\xfe\x4b\x7c\x60\x0b\x40\x24\x09\x7a\x31\x4a\
-\x33\xf6\xda\xd8\xc6\x37\x57\x30\xb7\x8a\x5f\xda\xf1\x60\xaa\x12\
-\x9f\xb4\x6b\x77\x9b\xc1\x14\x22\xb7\x64\x62\xb5\xf2\x30\x5f\xa5\
-\xb5\xb5\x3b\x76\xea\xaf\xcb\xad\x50\x26\xd3\x76\x2d\xfd\x27\x89\
-\x7e\x06\xc3\x06\x07\x0b\x40\xc4\x5e\x16\x45\x38\x55\x95\x2f\x86\
-\xb4\x53\x31\xd6\xdf\x0b\xf1\x91\xe2\x40\xfa\x55\x41\xfd\xe1\xe3\
-\x2d\x9c\x9d\x63\xdd\x74\x3d\xc4\xfd\x1e\xb1\x47\x4b\xc4\xa9\x65\
-\x6d\x0b\x6d\xb2\x9f\x8c\x1e\xb2\x8d\x82\xd4\xa0\xb5\x80\x44\xdb\
-\x8e\x19\x35\x20\xd6\x27\xad\x6d\xe6\x2d\xe6\x86\x7d\x7a\x0f\xfb\
-\x16\x60\x05\x50\xd0\xe8\xe3\x11\x9f\x2c\x86\xbb\x0e\x7e\x1e\x50\
-\x01\xce\x73\x33\x6e\x5e\x8c\x25\x55\x15\x84\xaa\x3a\x6e\x96\x8f\
-\xb7\x32\x67\xb8\xb3\x85\x91\x58\xbe\xe6\xbe\x5a\xeb\x73\x99\x19\
-\x80\xbe\x26\x58\x22\x35\xdf\xab\x0d\x4e\x11\x35\x11\xaa\xd9\xbd\
-\x8d\xeb\x59\x97\x14\x43\x37\x17\xbe\x51\x25\x40\xef\x21\x1e\xe1\
-\x36\x8c\x22\x92\x71\xa5\xaa\x3a\x2a\xc7\x30\x1d\x2e\x9f\xa5\x20\
-\x58\x0c\xb7\xcb\xf1\x7d\x41\x75\x56\x8e\x3e\xf0\x31\x6a\x50\x91\
-\x97\x32\x7b\x89\x71\xf3\xd5\x0a\x7e\xfc\x7f\xe3\x89\xaf\x31\xf9\
-\xfd\xe9\x86\x55\xad\xe8\xdb\xcb\xb6\xbb\xdb\xea\x3d\x7c\xf9\x10\
-\xfc\x45\xfc\x73\xc0\x68\x46\xa5\x5c\xbb\x8b\xa1\x3e\xb0\x2c\x62\
-\x08\x8a\x84\x4f\xeb\x06\xcc\x6c\x54\xab\xe4\xb4\xb4\xed\x78\x7b\
-\x6d\xe7\x16\x46\x94\xdd\xbe\x9b\x6c\x14\x32\x3e\x82\x93\x76\x30\
-\x62\x34\x9d\xac\x8a\x48\xc2\x23\xac\xda\xd1\xca\xae\x9d\xe4\xb3\
-\x5d\xa1\x60\xd3\x2d\xe0\xa3\x79\x0a\x4d\xae\xd8\xed\xfe\x82\xe0\
-\x18\x4d\xf3\xe0\xdb\x15\xf2\xdb\xb6\x7b\x6c\x7d\x32\x70\xd6\x6c\
-\xf1\xfd\x90\x7e\x54\x24\x02\x69\x51\x38\x1b\xd7\xa1\xbd\x84\x76\
-\x16\xf1\x76\x6c\xc4\x70\xaf\x85\x1b\xb7\x70\x78\x09\x27\x05\xce\
-\x3a\x8c\x6b\xdf\xb2\x22\xdd\xdb\xd1\x2c\x86\x6c\x90\x2a\x73\xd8\
-\x57\x14\x92\x9f\x07\xd8\x3d\x8c\x4b\xc2\xc1\x40\xd3\x2a\x64\xa1\
-\xb7\xa1\x98\x30\x88\xac\x7c\x9f\xf9\xae\x61\xce\xba\x4a\x03\xc4\
-\x0d\x34\x36\xfb\x76\x54\x1c\x35\xe6\xde\xaa\x31\x29\x17\xd8\x99\
-\x03\x4a\xc4\xa4\xb1\x48\xb8\x93\x33\x77\xeb\x5c\xc3\x23\xaa\xc8\
-\xe3\xcb\x1d\x62\x76\x59\xa8\x59\xa4\xa3\xf6\x3c\x9f\x13\x0d\xa7\
-\x76\xe8\x05\xf7\x9d\xc4\x9b\xff\x05\x0b\xcf\xe3\xef\xed\xb0\x27\
-\x52\xa0\xec\x18\x64\x58\xd6\xeb\x81\x1e\xbe\x76\x9c\x8e\xe1\x5d\
-\xbb\x03\x1a\x6f\x57\xb5\x32\xbf\x4e\x22\x8c\x3a\x02\x72\x44\xd1\
-\x33\x73\x1b\x6c\x0a\x31\xef\x5d\x6b\xe0\x70\x9d\xcf\x30\x66\x9c\
-\xab\x38\x3d\x62\x9e\x50\x3c\x7d\x5b\x58\x5a\x6f\x68\x4b\x5a\xd1\
-\x83\x71\xb3\x94\xf4\xd4\x7f\xf3\x89\xce\x32\xc0\x13\x01\x92\x38\
-\xdc\x54\x7c\xf6\x7d\xab\xcb\x70\xdb\xf6\x77\xd7\x1c\x2c\xf8\x9c\
-\x86\x39\x57\xe1\x78\x88\x03\x56\xbb\x3c\x3a\x9a\x09\x0f\xfa\x3e\
-\xbf\xcd\x56\xd0\x09\x48\x82\x6f\x9b\x78\xb4\xcf\x1e\xd9\xb6\x4d\
-\xe1\xc7\x13\x5c\xec\x09\x05\x5d\xa8\x36\x16\x6b\x6c\xbf\xaa\x08\
-\x7c\x18\x52\x72\x67\xbd\x6e\xed\xcc\x46\xff\x6a\x30\x97\x7c\x0a\
-\x5f\xa8\x12\x28\xaf\x92\xf4\xb9\xf9\xac\x6a\x88\xa5\x2e\xe6\x15\
-\x56\x5d\x8e\xa2\x58\x11\x58\x76\xd1\xac\x90\xcf\x18\x28\x06\xca\
-\x5b\x1a\x57\x2b\x24\xf6\xb4\x14\x79\x2f\xe6\xf9\x72\x20\x9c\xb0\
-\xf3\x82\x64\xec\x6b\x86\x69\x80\x64\xa6\x8b\xa8\x16\xe8\xa8\x0d\
-\xf0\xe7\x80\x3c\x1c\xee\xd4\x9d\xeb\xb1\x4c\xd8\x32\xbb\xa7\xc3\
-\x39\xf3\x0d\x6c\xb5\x4b\xfc\xfd\x60\x6c\x60\xa1\xbf\xb7\xf6\x4d\
-\x05\x32\xeb\x2d\x88\x65\xa5\xf5\x55\x3d\x3e\xb9\xb3\x2f\xe2\xcd\
-\xff\x83\x51\xec\x5b\x8a\x84\x2a\x6a\xcf\x5b\xba\x8c\xd9\xeb\x43\
-\x1f\xc7\x35\x5e\x5e\xa1\x71\x7c\x2a\xa8\xb1\x18\xd6\xb9\x00\xab\
-\xb6\x00\xe4\x24\xce\xbe\x30\x57\x25\x72\x82\x13\x2a\x1a\x0a\x1b\
-\xf2\x8d\x4e\x94\xde\xa9\x72\xe5\x44\x07\x71\x35\xeb\x5c\x83\x4d\
-\x43\x45\xcc\x24\x70\xba\x7c\xab\x47\x06\x44\x6b\xd1\x46\x93\x32\
-\xd3\x4a\x52\x38\xe8\x5d\x17\x09\x52\x47\xcb\x2c\x42\x26\x2a\xa2\
-\x0a\xda\xd6\x6f\xd7\x61\x5f\x41\xf4\xd1\x8e\xa5\xcf\xd5\xed\x7a\
-\xae\x2b\x6a\x1c\x98\x15\x5e\x95\x6c\xb2\xa9\x5a\x01\x64\x77\xb0\
-\x7d\x29\xaa\xf4\x98\xc8\xef\x56\x0b\xd7\xef\xd0\xc7\x77\xe7\x79\
-\xba\xc6\xc7\x7f\xeb\x04\xce\xad\xe2\x76\x8f\x46\x7f\xb7\x61\x87\
-\x4f\x39\xf1\xf2\x96\x95\x4c\x14\xee\xa4\xc3\x09\xdb\x43\x3e\x60\
-\xdd\x06\x11\x02\xf4\x50\x51\x1c\xa7\xb5\x08\x92\x72\x19\x86\x86\
-\x98\x17\xfc\x8d\xb4\x46\xdc\xb5\xd2\x0c\x1b\xa0\x23\x37\x7e\x7d\
-\xcb\x86\xd1\xa1\x75\xf3\x61\x6a\x46\x50\xba\xf4\x1b\x0d\x1f\xc8\
-\x13\x5d\x05\x46\xe9\x0a\x7a\x6c\xf5\x70\xbc\x60\x8e\x9e\xd4\x6f\
-\xa5\x73\x41\x70\x61\x7f\x1c\xd3\x25\x67\xbe\x89\xad\x56\x89\xdd\
-\xcb\xd2\x72\x55\x3c\x7c\xc1\xce\x8c\x97\x36\xe3\x66\xd6\x00\x1b\
-\xb7\x35\x9d\xd6\x33\x2f\xe3\x4f\xff\x1f\xac\x1f\xc0\x5b\x3d\x9b\
-\x45\xee\x50\x27\xc3\x20\x10\x73\x77\xc2\x0e\x4e\x02\x2f\x1c\xa4\
-\x48\xc6\x0d\x41\x28\x49\x14\x9e\xd8\x47\xa4\x13\xe6\xe4\x86\x05\
-\xa8\x92\xfa\x9f\x4e\x25\x22\xac\xc4\xa5\x9d\x17\xa9\xe2\x6a\xa8\
-\x93\xcc\x53\x70\x6d\x4e\x2d\x32\xb2\xaa\x46\x43\xf2\xbb\x62\x0f\
-\xdd\xb3\x99\xe3\x7b\x8a\x71\x61\xe0\xc6\x71\xb3\xce\x16\xd8\xcb\
-\x98\xb1\x48\x31\xbf\x55\x18\x97\x9f\xc2\xa8\x5a\x67\xa7\x51\x98\
-\x6f\x37\xb5\x7d\x0d\x96\xb4\x9b\xfc\xec\xd8\x73\x33\x37\xdc\xbc\
-\xc6\xa0\xe4\x7a\xc8\xc5\x50\x73\x69\x91\xe6\x2a\x3e\xd9\xc4\xfb\
-\x57\xf1\xfc\x3c\x9e\x39\xc9\x11\xea\xef\x7a\xb8\x59\xb3\xa4\x23\
-\xcd\x2d\x6b\x84\x2b\x2b\x53\xd4\x45\x91\x0c\x43\x57\x76\x9e\x05\
-\x3b\xf5\x05\x16\x8d\x17\x87\xad\xee\x85\x64\xa2\x9b\xb5\x67\xf6\
-\xa8\xb0\x4f\x6a\xa7\x01\x69\x1b\x36\xcd\xb2\x69\x01\x4c\xdc\x76\
-\x2c\xe2\xce\x95\x50\x8c\x76\x2a\xea\x92\x88\x53\xe4\x70\x71\xe1\
-\xad\x43\x6e\x34\x46\xd9\x7c\x87\xf1\x65\x6f\x3d\x45\x1e\xb3\xf0\
-\xf5\x3b\xb7\xfb\x48\xc5\x85\xac\x98\x8a\xc5\x0c\x21\xd9\x51\xc6\
-\xf1\x6f\x2e\xe0\xe5\x1f\xe1\xc7\x7f\x8d\x4f\x1b\xf8\x9d\x95\x61\
-\x0a\x95\x15\x8d\xf7\x19\xc8\x9b\x6d\xf1\xe2\x06\x5e\x58\xc1\x75\
-\x87\x4e\x0b\x29\x5b\xaf\x24\xb0\x5e\x64\xd5\xdf\xf3\x09\xc4\x30\
-\x97\x69\x0e\x52\x1b\x77\xb4\x77\x9b\x78\xda\xb3\x00\x3a\xca\x2a\
-\xa6\xe3\x04\x57\xf1\xbb\xa2\x51\xf9\xff\x59\xbb\xb6\x16\x39\x8a\
-\x28\x7c\xaa\xfa\x96\x99\x5d\xb3\xb3\xd9\x6c\xd8\x88\x31\x26\x21\
-\x68\x30\x21\x48\xe2\x53\x10\xf4\xc1\x20\x31\x20\x04\x04\x2f\xe0\
-\x8b\x4f\x3e\x18\xf0\x2f\x06\x04\x91\x08\x4a\x50\xd4\xe8\x43\x2e\
-\x82\x31\x71\x93\xcd\xce\xb5\x2f\x55\xd6\x77\xaa\x7a\xba\xba\x67\
-\xa6\x67\x36\x08\xfb\xb0\x0b\xb3\x33\xd3\x33\xa7\x4f\x9d\x73\xbe\
-\xef\x7c\x1f\xbb\x64\x6e\xb0\xb0\x70\x0c\x19\x59\xf8\x40\xfd\x5d\
-\x30\xe3\x72\xaa\x17\xe2\x2d\x64\xcc\x7e\x79\x35\x62\x56\x19\xf7\
-\xb6\xca\xb2\x1c\x3e\xc4\x7d\x80\xd6\x42\x7a\xd1\x5f\x05\x3d\x13\
-\x9f\xec\x36\x70\xc0\x38\x86\x49\x1c\x26\x35\x04\x7c\x50\x98\x30\
-\x3d\x17\x21\x46\x4d\x4b\xf0\x5b\x46\x0f\xd6\x1d\xab\x2c\xf7\xd8\
-\xa0\x18\x9a\xe5\x98\x85\x57\xdf\x2b\x5f\x9d\x29\x5a\xd6\x0b\x98\
-\x92\x6f\x05\x28\xca\x8f\x68\x54\xea\x21\xef\x73\x8d\x27\xa8\xc5\
-\x9f\x2a\x00\x5b\xa6\x5c\x31\x1d\x11\x64\xa4\x22\x70\xd3\x73\x1e\
-\x93\x37\x52\xa3\xf2\x66\xb2\xb3\xe9\x59\xce\x8b\xfb\xf6\xa5\xef\
-\x46\xdc\x2f\xda\x13\x57\x33\x84\x70\x5a\xc6\x6a\xf6\xc1\xf8\x46\
-\xf9\xda\x78\x70\x30\x5b\xdf\xcb\x03\x29\xfb\x29\x37\xed\x12\xfc\
-\xd9\x98\xda\xf4\xea\x47\x74\xf5\x2b\xba\x1b\xd0\x9f\x19\x7a\x2f\
-\xc5\x08\x2a\xc6\xea\x5d\xe0\xb2\x67\x33\xba\x7c\x1c\xf4\xda\x51\
-\x07\xcc\x78\xf3\xf5\x04\x41\x15\x0a\xfe\xe4\x71\x96\xd5\x2d\x3d\
-\xf4\x44\xd4\xcd\xb5\xfd\xc5\x11\x59\xf6\xdc\xd2\x93\x8b\x49\x19\
-\x0b\xb1\xad\x6d\x50\x9a\x8b\x98\x47\x3e\xd3\xd0\xdb\x31\x61\xd3\
-\x35\xdd\x88\xa2\xd3\x11\x6c\xfd\xee\x8f\xe1\xba\x3a\x5e\x63\x01\
-\x12\xb9\x70\xf3\xa8\x96\x60\xea\x99\x47\x68\xb7\xe3\xa2\xad\xf5\
-\x9a\x70\x5d\x1d\x39\x89\xce\xf2\xd2\xca\x56\xcf\x16\xfd\x45\xe4\
-\xe8\x2b\xf1\x80\x4e\x15\x74\x9e\x05\x20\x7e\x8a\x00\xe4\xed\x33\
-\x43\xc9\x3a\xc6\xd9\x3d\x14\x1d\xe3\x74\x2a\xb8\x4f\x8f\x52\xe0\
-\xa0\x87\x0b\xb8\xcf\x6e\x85\xb4\x4d\xb4\x91\xd0\xa1\x10\x72\x6b\
-\x39\x37\x0f\x4f\x58\x5f\xc4\x14\xe8\x7d\x16\xb8\xcc\xb8\xc9\x01\
-\x97\x2b\x72\xa4\x1d\x3b\x5e\xa3\x3a\x77\x75\x3a\x6f\x09\x97\x0d\
-\x88\x5a\xfe\x5c\xa4\x92\xa0\xe6\xdd\x0c\x2d\x05\x0c\xad\xb0\x42\
-\xae\x5b\xfd\x6b\xeb\x25\x6b\xb8\xc2\x5c\x72\x31\xe6\xa5\x59\xda\
-\x0e\xbb\x9e\x31\x15\xeb\x74\xed\x53\xba\xf2\x39\x56\xdd\xee\x4f\
-\x30\xc8\xb3\x4d\x93\x60\xbd\x3b\x95\xd2\xe9\x9c\x2e\xf7\x98\x10\
-\xbf\x0e\xc2\x74\xc8\x45\xb0\x3f\x92\x6f\x0c\x6d\xd4\x0c\xfb\x4f\
-\xcc\x5c\x9b\x7f\x9f\xa8\x59\x29\x04\x7e\x95\x8c\x11\xd6\x94\xa1\
-\x13\xfb\x2c\x91\x70\x9b\x53\x92\x97\xfa\x52\x6b\x22\x22\x21\xe0\
-\xb1\xad\xe9\x94\x69\x91\x89\xee\x0e\xa1\xd9\x64\xb9\x37\x8b\xba\
-\x43\xf2\xac\x39\x67\x3b\x2f\x17\xfa\xac\xfc\x11\x72\x8c\x0a\x31\
-\x47\x85\x21\xb2\x9d\xae\xe4\x26\x61\x48\xc7\x63\x58\x33\xf4\x78\
-\xc3\xe6\x0f\x49\x7b\xa5\xd8\x49\xa6\x9d\x89\x83\x09\x77\xb8\x3c\
-\x64\x74\x74\x40\x47\x14\xbc\x10\x77\x04\x6d\x84\x98\x68\x89\x00\
-\x8d\x75\x3f\xa7\x87\xcc\x6c\xd9\x0f\xa1\xa8\x63\xb2\x8f\xdd\x4d\
-\xb3\x23\x79\xf3\x4b\x16\x36\xa3\xd3\xe2\xa0\xd3\x4c\x63\xa7\x31\
-\x72\xc1\x68\x65\x05\x34\xf4\x85\x65\x6d\x96\x10\x49\xc4\xc1\x6f\
-\x12\xfa\x3f\x79\x0a\xe5\x8c\x1d\x94\x89\x01\x23\x8b\x5d\xba\xfe\
-\x19\x5d\xfe\x82\x7e\x24\x7a\xc8\x5c\x39\x9d\xf2\xa0\xa0\xc3\xdd\
-\x15\xd1\x8e\xa6\x4b\x09\xdb\x04\xc4\xe8\xf0\x92\xd4\xfd\xbb\x9c\
-\x19\x41\xe8\x65\x4c\xee\x06\x21\x49\xcc\x44\xff\xf4\x2e\x52\x65\
-\xba\xb2\xbb\x29\xa6\xd6\x37\xa1\x9f\xa5\xe8\xdb\xa6\x7e\x52\x82\
-\x7f\xc9\x78\x8e\x34\x61\xba\xdf\xee\x84\x76\x42\xba\xd8\xa5\xcd\
-\x8c\x7e\x1e\x52\xd6\x75\xcf\xb0\x90\xc6\xac\x4b\x67\x2b\xef\x02\
-\x2c\x0e\x85\x59\x78\x86\x70\x34\xad\xa7\x0a\xd0\x32\x8a\xa0\x76\
-\x60\x06\x36\x1c\xb9\x1b\xee\x0d\xe9\x92\xa0\xd7\x24\x3d\x19\xd1\
-\xb7\x11\x38\x79\x7d\x81\xb7\xaa\x39\x27\x9b\x36\xa0\x97\xd2\x8e\
-\x02\x08\xba\x1d\x52\xaf\x8b\xf2\xcc\x64\x96\x89\xc6\x56\xf8\xbd\
-\x1c\x68\xa8\xa9\x88\x46\xfc\x2f\x30\x99\x13\x8e\x8c\x3d\x3d\x00\
-\xfd\x96\x5d\xd6\xb9\x43\xba\xb4\x29\xb0\xef\x4d\x2d\xcb\xe8\xab\
-\x47\x79\x8b\xba\xd3\xd2\xed\x7b\x5a\xa1\xb6\x59\xf4\x2a\xed\x2b\
-\x2c\x2e\xdf\x6b\x6f\x45\x95\x44\xa5\x67\xdf\x48\x75\x92\x79\x70\
-\x58\xf1\x1e\x31\xfb\x2a\x41\x32\x83\x7d\xc8\x61\xba\x71\x93\x2e\
-\x7c\x48\xb7\x09\xfe\x4a\x16\xf5\x10\x11\x25\xfc\xa9\x9b\x40\xdf\
-\xe8\xd3\xf9\x75\xc4\xd6\xb8\x2c\x1b\xd2\xb8\x36\xc1\x95\xf3\xfa\
-\x48\xbf\x6b\x2c\x3c\x96\x48\x55\xd9\x2b\x2e\x49\xbd\xba\xbf\x68\
-\x3c\x83\x2e\x4b\x23\x51\x9e\xd7\x12\xfb\x53\x26\xc7\x9b\x70\x1c\
-\x31\xb2\x1b\x45\x3c\x78\x29\xab\x58\x73\xc7\xe6\x5d\x14\x6c\x3d\
-\x45\x27\x23\x70\x4b\xbe\x1f\x03\xfc\x37\x55\x93\xb4\xbb\xea\x65\
-\xc2\xb1\x76\x0c\x5a\xd7\x79\xc5\xa5\x9e\x9c\xd6\x55\xb7\x51\xb0\
-\xb7\x9c\x4e\x78\xea\xa5\x2b\x33\x1c\x6b\x07\x6d\x3e\xc0\x43\x19\
-\x5d\xcc\xe9\xad\x35\xc0\x4f\xdf\x4d\xe8\x1e\x5b\x67\x9a\xbb\x30\
-\xc9\xe9\x98\xc4\xee\xdc\xb1\x08\x35\xfa\x9a\xcd\xe8\xbc\x39\x69\
-\x4e\xd4\x67\x21\xa0\x80\x01\xb9\x2d\xf2\x22\xaa\x5d\xbe\xf0\xe4\
-\x2f\x75\x1d\x66\x16\xad\xa4\x00\x9a\x47\x70\x58\x51\x95\xa9\x21\
-\x9a\x40\x0b\xec\x0a\x45\xcb\x50\xb8\xb5\x2b\x68\x99\x60\x2e\x7a\
-\xab\x73\x05\x03\xf5\x54\x2f\x6d\x95\x4d\x42\xab\x2f\x82\xda\x26\
-\xc7\x87\xad\xfb\xe8\x59\xa3\x2d\xba\xf1\x35\x9d\xb9\x46\x3f\x64\
-\xb4\xcb\xc3\xb5\x69\x63\x21\xd9\x4d\x24\x1e\xd3\xe9\x35\x14\x9a\
-\xe3\xe9\xf6\x89\x5f\xd8\x78\x3c\x92\x86\x9d\x8b\x9e\xee\x9e\xca\
-\xca\x57\x2c\xc8\x31\xf1\x90\x25\xe0\xaa\xb4\x37\xcd\xd4\x18\xe6\
-\x98\x7a\xc6\x6a\x1a\x67\x0c\x73\x16\xa2\xf6\x11\x9b\xd8\x8d\x73\
-\x04\x7a\xca\x3a\xc9\xe6\xf1\xa3\x31\xf7\x91\x01\x02\x22\x0e\xcb\
-\x91\xb6\xe4\x63\x41\xd0\x99\x88\xde\x21\xba\x15\x80\x3e\x95\xb0\
-\xb4\x98\x2e\xab\x5d\x5d\xb6\x1a\x2e\xe5\xeb\x8a\x80\x60\xe9\xc4\
-\xae\xd6\xe7\x77\x6b\x7a\x1b\x13\xd3\x36\xf4\x45\xee\x18\xa3\x8a\
-\xcb\xad\x97\x59\x00\x79\x2b\xa7\xdf\x73\x80\xbe\x72\x44\x67\x25\
-\x6d\x76\x68\x33\xa6\x97\x38\x77\x8c\xd9\xb0\xed\x91\x02\x06\xf2\
-\x9c\xdb\x50\x30\x5b\xf8\xf4\xc8\x2d\x13\x5d\x35\xd7\x9a\xe7\x86\
-\xaf\x5e\xb6\x09\xb9\x88\xbb\xab\x57\xae\x58\x5a\x0c\x96\x69\x9e\
-\x24\x3a\x2d\x3e\x45\x75\x2b\x26\x75\x70\xe3\xce\x95\xeb\x1c\xe9\
-\x4f\xeb\x45\x6d\x03\xc3\xae\xb1\x9a\xf6\x28\x38\x4c\x9f\x7c\x43\
-\xaf\x5e\xa5\x3b\x9a\x1e\x47\xa5\x3f\x75\x79\x82\x07\xfc\xed\x6e\
-\xf3\x4d\xb5\x2b\x2a\x2f\xf9\xda\x8f\x2c\x1b\x53\xce\x54\x92\xa5\
-\xba\x4c\x46\x34\xa1\x69\xa2\x30\x4e\x29\x56\x14\xfa\x06\x7f\xa1\
-\x5b\x50\xd2\x9e\x40\xa4\xcb\xbe\xd2\x3d\x9b\x2d\x1b\x26\x05\xb0\
-\x95\x41\x88\xc5\x9c\xbe\xc2\xe9\xaf\xd8\xb5\x98\x22\x77\xef\x45\
-\x2c\xc0\x0d\x84\x3f\x03\xc7\x4b\xf2\x4a\x47\x94\x80\x02\x1e\xb1\
-\x43\xa8\x29\xa9\x7f\xcd\xe8\x5c\x40\x57\x04\xdd\x1a\xc3\xfd\x38\
-\x51\x8e\x2d\x47\xf5\xa1\x21\xe9\xea\x46\x15\x65\xab\xe1\xd8\x5d\
-\x7c\x0c\x99\x16\xa8\x18\x81\x95\x64\xc7\xf8\x29\x43\x3c\xdd\x5d\
-\x7a\x5b\xd1\xfb\x1d\x50\x95\x1e\x49\x7a\x25\xa1\xd7\x53\xe8\xc2\
-\x4e\x62\x48\x06\xed\x2a\x48\x55\xee\x6b\x40\x45\x63\xbe\x43\x0a\
-\xf6\x5e\xc6\x55\x44\xd5\xd9\x68\x3f\x43\xdd\x6a\x89\xdc\x98\x39\
-\x8a\x65\xe9\xbc\x1d\x3a\x6d\x09\x59\xd5\x5a\x9c\x2c\x55\x0b\xa5\
-\x65\x98\x94\x58\xf0\x5a\xab\x5f\x4b\x85\x3f\x9d\x7c\x97\x06\xa3\
-\x1a\x56\x55\x94\xbe\xd8\x0d\x1f\x07\xc1\x5e\x90\x18\x7e\xe6\x7c\
-\x64\x6f\x24\x1f\xdf\x9c\x9c\x7c\x8f\x7e\x21\x8c\x7e\x53\xaf\x68\
-\x09\xca\x56\xc9\x3c\xfc\x28\x21\x04\x27\x81\xf7\x71\x6b\xe7\x00\
-\x6e\xd7\x05\x4d\x14\x99\x03\xbd\x43\xb0\x83\x4d\x18\xcd\x21\x59\
-\x41\x89\x99\x45\x9a\x18\x6a\x45\x7d\x12\xb9\x01\xf9\xb4\xb6\xae\
-\x26\x0f\xc2\x1d\x32\xb1\x66\x6b\x58\xf3\xb4\x02\x38\x11\x74\x05\
-\x05\x80\x98\x7f\xc6\xf4\x58\x02\x4f\x70\x9b\xd4\x1c\xc4\x90\xd1\
-\x2b\x00\xd4\x03\x3e\xb3\x95\x4f\x4c\x49\x62\x85\x1a\x70\x21\x1b\
-\x8a\x2e\x4c\x50\x43\xdf\xd2\xa8\xfe\xc5\x4c\xbb\x2f\x85\xdb\x80\
-\xd1\x5e\xbd\xa5\xcb\x22\x27\x4d\x18\xce\x7c\x4e\x79\x9f\x55\xb6\
-\x19\x57\x36\xfd\xc3\x09\x89\x52\xfe\x8d\x1e\x46\x5e\x7b\x12\xdd\
-\xe7\x70\x1f\x4a\xf3\x4f\x3b\xa8\xb2\xc0\xa9\x16\x8c\x86\x9a\x67\
-\x1e\xa2\xfa\x32\x65\x8c\x96\xcd\x08\x90\xf5\x0e\x5b\x2c\x0b\xdf\
-\x17\x6e\x43\x55\x6b\x43\x39\x85\x32\x44\xab\xf1\x72\x8b\xf8\xfd\
-\xd2\xb8\x57\xad\x65\xcc\x41\xe9\x3d\xe6\x1b\xdb\x3a\x7f\xfd\xdf\
-\xc1\xd0\xc4\xa8\x98\x2e\x8f\x2b\xfb\x57\x50\x08\x3f\x9b\xba\x67\
-\x5f\xcb\xb3\x01\x44\xce\x8e\xd3\x07\x5f\xe2\x9e\xb9\x33\x81\xdd\
-\xa9\xe2\x95\x3f\x49\xd5\x88\xd0\xce\x25\xe3\x0c\xd4\x8e\x3e\xbb\
-\x0d\xab\x3d\x7c\x91\xd8\x66\x67\x7b\x82\x6e\x08\x4a\x53\x12\xba\
-\xa9\x8e\x45\x9d\x4c\x2d\x34\x61\xee\x5a\xc6\x84\xec\x5c\xb8\x2f\
-\x5b\xcd\xd3\xb7\xa8\xb1\xf0\xcb\x3b\x4a\x0a\x0f\x0c\xd7\x60\x3b\
-\x9a\xe8\xef\x32\x4f\xb0\xc3\x65\xcf\x5f\x23\xc8\xba\xf7\x13\x97\
-\x35\x2d\xd7\x57\xb1\xf5\x39\x8c\xe2\x52\x26\x8e\xc7\x18\x8f\x74\
-\x04\x50\x55\xf3\xb3\x59\xd0\x9b\x11\x3d\x78\x4e\xb7\xb9\x40\x22\
-\x56\xa8\xb4\xa2\x4e\x7a\x8a\x53\xda\x1c\x6f\xb3\x83\x72\x48\xaa\
-\x66\xb2\x4d\x67\x48\xdb\x29\xbd\x1a\xd3\x89\x1e\xed\xac\x81\xb0\
-\x10\xb0\x0d\x63\xbf\xc0\x4a\xd1\x1e\xb3\xcf\x27\x6c\xfe\x0c\x7d\
-\x14\xa6\xa7\x6b\x46\xf4\x74\x29\xd6\xa3\xcb\x97\x08\x18\x1a\x57\
-\x75\x37\x35\xbd\x60\xc8\x2d\x56\x2e\x4e\x96\x8a\x4e\xce\xf5\x5d\
-\xf3\xc3\xae\x68\x9d\x4c\xcc\x8d\xfb\x96\x41\xa7\x9e\x69\xf3\xe8\
-\x80\x9d\x46\x43\x23\xa3\x29\x81\xa3\xfe\x13\x60\x00\x65\xb8\x6c\
-\x0c\x85\xad\xab\x2e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x00\xa9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x70\x49\x44\x41\x54\x48\xc7\xed\xd5\x3d\x0a\xc0\x20\
-\x0c\x40\x61\x97\x9c\xbb\x4b\xab\xe7\xec\xa0\x97\xe8\xcf\xeb\x5c\
-\x5a\xa1\x6a\x0a\x06\x7c\xab\xf0\x0d\x09\x44\xe7\x46\x66\x43\x58\
-\x48\x3c\x9b\x4a\xa1\x99\x5c\x65\x14\x2b\xa8\x50\x6c\xd4\x94\xf0\
-\x88\x06\x04\x10\xee\xd0\x5e\x0d\x45\x2d\x88\xde\xa1\x23\xf3\x90\
-\xdb\xb2\x4d\x48\x6d\x46\x6d\xd0\xf9\x03\xf4\x65\x2e\x46\xa1\xb6\
-\x19\xd1\x1d\x14\xb5\xee\x51\xd0\xba\x90\x82\x7f\xfd\x8e\x4a\x6f\
-\xf6\xc8\x54\x17\xc0\x98\x7d\x8e\x02\x88\xb3\x83\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xa2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x01\x69\x49\x44\x41\x54\x48\xc7\xed\xd4\xbf\x2b\xc4\x71\
-\x1c\xc7\xf1\xaf\x88\x45\x74\xa5\xd4\x4d\x52\x36\x99\xac\xea\xca\
-\x64\x16\xb9\xf8\x13\xdc\xe4\x0f\xb0\x19\x70\x4e\x4c\xfe\x00\xb3\
-\x41\x46\x99\x4c\x57\x26\x06\x0c\x06\x44\x49\xe6\x8b\x3c\x0c\xf7\
-\x75\xb9\xf2\xf9\x7e\x8e\xbb\x8d\xf7\xf6\xf9\xbc\x5f\x9f\x67\x7d\
-\xde\x3f\x5e\x49\xf2\x97\xc3\x6a\x87\x30\x74\x08\xd3\x01\x50\x1d\
-\xd3\x36\xe8\x13\x83\x15\x8b\x26\x75\xb5\x8b\xf9\x8c\x47\x7b\x46\
-\x3b\x01\x82\x9a\xb2\xbe\xdf\xa3\x36\xec\xbb\x6d\x9c\x4e\x0d\xb7\
-\xf2\x7c\xc0\x91\x91\xef\x8a\x6d\xca\x49\x8a\x3a\x37\x10\xc3\x74\
-\x39\xc4\x4d\x33\xea\x4b\x7e\xd9\x2b\x38\x8c\x94\xde\x1c\x78\x37\
-\x1b\x1a\x48\x0b\xde\xc1\x7c\x16\xa6\xc7\x15\xd8\xca\x5a\x11\x65\
-\x70\xad\x27\x0c\x9a\x06\x4f\x06\x23\x55\x7c\x02\xd3\x61\xc9\x0e\
-\x28\x47\x1b\xb2\x09\x76\xc3\x82\x2a\x28\x44\x41\x05\x50\x0d\x0b\
-\xee\x41\x3e\x0a\xca\x83\xfb\xb0\xa0\x06\x7a\xa3\xa0\xde\xfa\x94\
-\x87\x05\x0f\x10\x9f\x5b\xc3\xe0\x21\x2c\x38\xfb\x51\x8d\xce\x62\
-\x5d\x5b\x8f\x82\xd6\xc1\x4e\x58\x30\x03\x9e\xf5\x67\x62\xfa\x3d\
-\x83\x99\xb0\xa4\xdb\x25\xa8\x64\x82\x2a\xe0\x52\x77\x96\x68\x29\
-\xdd\xb5\x62\x50\x51\x4c\x77\x6d\x29\xf6\xff\x03\xf0\xa6\xf4\x6d\
-\xb6\xe4\x0d\x1c\xc4\xfd\x28\xe7\x22\x75\x9d\xe3\xe6\xfe\x29\x38\
-\x4e\x33\x17\x72\xad\x58\xdb\x50\xba\x2a\x70\x57\xff\xa4\xa2\xbb\
-\xc6\x5d\xd5\x50\xab\x26\xdb\x67\x2d\x35\x30\x75\x13\x69\xd8\xee\
-\xab\xb5\x1f\x7a\xb6\x31\xdb\x5e\x9a\x40\x2f\xb6\x8d\x25\xbf\x0b\
-\x13\xc6\x93\x24\x49\x8c\x9b\x48\xfe\xa3\xcd\xf8\x00\x2d\xce\xd7\
-\x5e\xea\x77\x1c\x95\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x01\xad\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x01\x74\x49\x44\x41\x54\x48\x0d\xed\xc1\xb1\x6a\x56\x07\
-\x00\x80\xd1\x13\x14\xb3\x48\x44\x10\x02\x4e\x22\xb8\x05\x27\x57\
-\xe1\x07\x27\xe7\x62\x31\xe8\x23\x98\xa9\x0f\x70\xb7\x0c\xda\xa8\
-\xa4\x53\x1f\xc0\xd9\x41\x1c\xa5\x93\x53\xc0\xa9\x0e\xea\xd0\xa1\
-\x8a\x82\x88\x73\x88\xe4\x2b\x21\x48\x53\xe8\xfd\x6f\x62\xdc\xda\
-\x73\xfc\xb7\x0d\xbe\x8b\x41\xbe\x83\x41\x72\x6c\x83\x24\xc7\x34\
-\x48\x92\x9f\xdc\x72\xc5\x82\x6f\x32\x48\x92\x24\xf9\xe0\x57\x17\
-\x1d\xd9\x20\x49\x92\x24\xd9\xb6\x61\xd1\x11\x0d\x92\xe4\x9e\x47\
-\xfe\x94\x24\xcf\x2d\x3b\x84\x25\x4f\x5d\xb0\x6f\x90\x64\xdf\x55\
-\xbf\x49\xf2\xbb\x25\x13\x16\x3c\x91\x3f\x5c\xb0\x6f\x90\xfc\xed\
-\x8e\x1d\xc9\x13\x0b\xe6\xba\x21\xd9\xf5\x83\xaf\x06\x39\xe8\xa6\
-\x5d\xc9\x8f\xe6\x38\xe9\xb5\xe4\xbe\x83\x06\xff\xb4\x21\x79\xe3\
-\xa4\x51\xd7\x24\x1f\x9d\x31\xcf\x92\x8f\x92\x6b\x46\x6d\x4a\x36\
-\x4c\xf9\x59\xf2\x8b\x51\x5b\x92\x99\x29\x33\xc9\x96\x51\xef\x24\
-\xe7\x4d\x39\x2f\x79\x67\xd4\xb6\xe4\x94\x29\xa7\x24\xdb\x46\xbd\
-\x97\x2c\x9b\xb2\x2c\x79\x6f\xd4\x0b\xc9\xcc\x94\x99\xe4\x85\x51\
-\x9b\x92\xbb\xa6\xdc\x95\x6c\x1a\x75\x5d\xf2\xc9\x69\xf3\x9c\xf6\
-\x49\x72\xdd\xa8\x13\x5e\x49\x1e\x98\xe7\x81\xe4\x95\x13\xe6\xb8\
-\x2d\xd9\xb5\x6a\xcc\xaa\x5d\xc9\x6d\x13\x1e\x4b\xbe\x58\xf3\x6f\
-\xd6\x7c\x91\x3c\x36\xe9\xac\x97\x92\x3c\x33\x73\xd0\xcc\x33\x49\
-\x5e\x3a\xeb\x10\xce\xd9\x92\x24\x6f\xad\xda\xb3\xea\xad\x24\xd9\
-\x72\xce\x21\x2d\x5a\xb7\x23\xc9\x60\xcf\x20\xc9\x8e\x75\x8b\x8e\
-\xe4\x92\x87\x3e\xcb\x60\xcf\x20\x9f\x3d\x74\xc9\x37\xba\x6c\xc5\
-\x9e\x15\x97\xfd\xef\x98\xfe\x02\xb5\xd3\xc6\x61\x2b\x32\x35\xda\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x28\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
-\x00\x00\x01\xef\x49\x44\x41\x54\x78\x01\xed\xd7\x03\x8c\x5c\x61\
-\x14\x86\xe1\xda\xb6\x6d\xdb\xb6\x82\xda\xb6\x8d\x60\x11\x6f\x50\
-\xb7\x41\x6d\xdb\xb6\x19\xd4\xb6\x6d\x9f\xbe\x49\x4e\x92\x9b\xbf\
-\xb8\x2c\x77\xdf\xe4\x59\x0e\xbe\xf1\x4c\xb4\xa8\xa2\xfa\x0b\x4a\
-\x8c\x6c\x2a\x2e\xdc\x94\x15\xbe\x4b\x81\x6e\x58\x85\x57\x10\xc3\
-\x23\xcc\x45\x1b\xc4\xc3\x8f\x1a\x85\x30\xbf\xd7\x44\x28\x9e\x41\
-\x1c\xba\x85\x9e\x88\x0d\x6b\x83\x21\x7e\x06\x15\xc3\x35\x88\x09\
-\xef\x70\xd5\xf8\xbf\xe9\x08\x32\xe9\x69\xf5\xc1\x17\x3f\x83\x9a\
-\xe2\x35\xc4\xe2\x34\xfa\x23\x37\xcc\x4a\x22\x1c\xb7\x20\x16\x77\
-\x11\x61\x19\xe3\x69\x50\x65\xbc\x87\xa8\x67\x68\x8f\x18\xb0\x2b\
-\x1e\x46\xe2\x2d\xc4\xe0\x69\x50\x16\x3c\x80\xa8\x73\xc8\x0b\xb7\
-\x95\xc5\xed\x20\x06\x2d\x86\xa8\x07\xc8\x06\x2f\x15\xc2\x43\xbf\
-\x83\x4a\x18\xb7\x75\x2d\xfc\xa8\x30\x08\x76\xc2\x2c\x2f\xee\x05\
-\x71\x93\xcd\x86\xa8\xf5\x20\xd7\x83\x72\xe2\x36\xc4\xef\xa0\x18\
-\xc6\x55\x5c\xc5\xc3\xa0\x6c\xb8\x0e\x09\x62\x50\x19\xe3\x59\x37\
-\xa6\x87\x41\xc9\x91\xcd\x81\x64\xb0\xad\xa5\x79\x73\x79\x18\x14\
-\x68\x03\x21\x6a\xda\xdf\x30\x68\x38\x44\x4d\x76\x31\xe8\x06\x8a\
-\xc1\xae\x51\xb8\xaa\x7a\xc0\xb6\xf6\x10\xb5\x1c\x76\x35\xc1\x1b\
-\x08\x3e\x61\x32\x92\xe3\x47\xcd\x80\xa8\xb6\xb0\xad\x3a\x44\x5d\
-\x80\x93\xb2\x61\x25\x44\x3d\x44\x37\xc4\x80\xd9\x3e\x88\xaa\x08\
-\xdb\x12\xe0\x0d\x44\xe5\x85\xd3\xea\xe2\x3c\x44\x6d\x84\xb5\x94\
-\xf8\x04\xc1\x53\xc4\x86\xa3\xd6\x42\xd4\x18\xb8\x29\x0e\x46\xe2\
-\x25\x7a\xc0\xda\x10\x88\x5a\x04\xc7\x35\x81\xa8\xb7\xc8\x02\xb7\
-\xa5\x33\x6e\xb2\xe4\x78\x0c\x51\xd5\xe1\xb8\xe8\x38\x0c\x51\x07\
-\x10\x17\x5e\x8b\x89\xf5\x10\xb5\x03\xae\xab\x84\x4f\xc6\x55\x1c\
-\xc7\xe3\x98\xa9\x10\xf5\x1e\xa5\xfd\x3f\x49\x02\xfb\x91\x11\x4e\
-\x4b\x8d\x6d\x10\x8b\xde\xf0\xd5\x04\x88\xc5\x6b\x44\x20\x93\xcd\
-\xfd\x27\x1c\xcf\x21\x16\x13\x10\x48\xfd\xf0\x11\x62\x38\x89\x99\
-\x08\x47\x18\x66\xe0\x30\xc4\xf0\x11\xfd\x10\x68\x15\x70\x00\xe2\
-\xd2\x01\x70\xdc\x5f\x57\x23\xf3\x43\xa2\x49\xff\xb7\x0a\x8d\xf0\
-\xdb\x8a\x8b\xf2\xe8\x88\x61\xaa\xa3\xfe\x2d\x6e\xb4\x3f\x54\x54\
-\x51\x7d\x05\x23\xd6\x15\xc3\xf0\x2b\x8f\x7d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\x5c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x24\x08\x04\x00\x00\x00\x4b\x09\x50\x13\
-\x00\x00\x00\x23\x49\x44\x41\x54\x48\xc7\x63\x60\x18\x05\xa3\x60\
-\x90\x83\xff\x44\xc0\x51\x83\x46\x0d\x1a\x35\x68\xd4\xa0\x91\x69\
-\xd0\x28\x18\x05\x03\x06\x00\x52\xe6\x42\xcc\x7f\x94\x10\x19\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x15\x44\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x04\x00\x00\x00\x28\x08\x06\x00\x00\x00\x18\x11\x84\xf3\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x32\x41\x32\x43\x43\x33\x30\x41\x38\x33\x32\
-\x38\x31\x31\x45\x45\x41\x33\x30\x44\x41\x44\x34\x36\x46\x38\x41\
-\x36\x43\x39\x34\x45\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x32\x41\x32\x43\x43\x33\x30\x42\x38\x33\x32\x38\x31\x31\x45\
-\x45\x41\x33\x30\x44\x41\x44\x34\x36\x46\x38\x41\x36\x43\x39\x34\
-\x45\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x32\x41\x32\x43\x43\x33\x30\x38\x38\x33\x32\x38\x31\x31\x45\
-\x45\x41\x33\x30\x44\x41\x44\x34\x36\x46\x38\x41\x36\x43\x39\x34\
-\x45\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x32\x41\x32\
-\x43\x43\x33\x30\x39\x38\x33\x32\x38\x31\x31\x45\x45\x41\x33\x30\
-\x44\x41\x44\x34\x36\x46\x38\x41\x36\x43\x39\x34\x45\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x97\
-\xa4\xea\xd8\x00\x00\x11\xb8\x49\x44\x41\x54\x78\xda\xec\x5d\x09\
-\x74\x56\xc5\x15\x9e\x3f\x3b\x88\x11\x12\x65\x53\x22\x8b\x80\x80\
-\xa2\x20\x42\x28\x41\x51\x5c\xc1\xad\x20\x8a\x5a\x44\xd4\xca\x71\
-\xab\xad\xf5\x58\x4f\x71\x41\xc4\xed\xa8\x6d\xd5\xd8\x5a\x4b\x45\
-\x5b\xb7\x52\xb1\xa0\xa2\x10\x90\x20\x50\x51\xd1\xa2\x22\xa0\x28\
-\x9b\x48\x82\x06\xc5\x40\x08\x09\xd9\x3a\xf7\xfc\xdf\x3b\x99\x4c\
-\xe6\xce\x9b\xf7\xff\xf9\x43\x94\x77\xcf\xb9\x27\xc9\xff\xde\x3f\
-\x6f\xde\xbc\x7b\xbf\xfb\xdd\x3b\x33\x2f\x91\x4e\x9d\x3a\x89\x50\
-\x12\x22\xb7\x4a\x7d\x90\x39\xb6\x53\xea\x79\x52\x97\x3b\xb4\x93\
-\x2d\x75\xae\xd4\x61\xcc\xf1\x42\xa9\x63\xa4\xfe\xe0\xd3\x4e\x37\
-\xa9\xf3\xa4\xf6\x31\x1c\x2b\x95\x7a\x8e\x63\x7f\x7e\xaa\x92\x87\
-\xb1\x4c\x31\x1c\x7b\x54\xea\xaf\x0f\x84\x41\x48\x0a\xfd\x36\x61\
-\xb2\xda\x72\xec\x20\xa9\x47\x38\xb6\xd3\x1e\xce\xcc\xc9\xe1\x52\
-\x0f\x71\x68\x27\x5d\x6a\x06\x73\x6c\x93\xd4\x8d\x2d\x60\xcc\xd2\
-\x18\x87\x0c\x25\x04\x84\x1f\xbd\xac\x91\x5a\x64\x31\xfc\x5e\x8e\
-\xed\x9c\x28\xb5\xb3\xe5\x78\x2f\x1f\xc0\xf0\xa4\xb7\xd4\x23\x99\
-\x63\x1f\x59\xfa\x9a\x68\xe9\x20\x75\xb0\xd4\x3b\xa4\xbe\x29\xf5\
-\xcc\xd0\x74\xf6\x9f\x84\x68\x9c\x38\x29\x91\xfa\xa1\xc5\x99\x07\
-\x02\x18\xf6\xf9\x00\xf6\x50\x47\xba\xbb\xc4\xe7\x9c\xfe\x4c\x00\
-\xa8\x91\xfa\x5e\x33\x8f\x4d\x96\xd4\xd1\x52\x4f\xc0\xfd\x0d\xc6\
-\xe7\x55\x52\x1f\x0e\x4d\x27\x04\x84\x9f\xa2\xec\x95\xfa\x3f\xa9\
-\xe7\x32\xc7\x73\x50\x1f\x28\xb6\xb4\x91\xe1\x08\x08\x74\x4e\x32\
-\x9c\x9b\x63\x24\xfd\x98\x63\xbb\x01\x5c\xcd\x29\x57\x4a\x7d\xc8\
-\xf0\x79\x55\x68\x36\x61\xca\xf0\x53\x16\x8a\xbc\x15\xcc\xb1\x2e\
-\x3e\xa9\x80\x40\x04\xed\xef\x70\x9d\x9f\x49\x6d\x63\x39\xde\xd6\
-\xd2\x4e\x11\x80\xab\x39\x25\xac\x64\x87\x80\x70\x40\xca\x27\x52\
-\x37\x30\xc7\x0e\x95\xda\xd7\xe7\xfb\x27\x4b\x8d\x38\x5c\xa7\xad\
-\x42\xbb\x39\x8a\xde\x87\x39\xf6\x86\x85\x59\x24\x4a\x42\x26\x10\
-\x02\xc2\x01\x29\xdb\xa4\x7e\xe6\xc3\x00\x6c\x0e\x3f\x5c\xfb\xbb\
-\xce\xe2\xbc\x79\x96\x76\xfa\x59\x8e\xfd\xb7\x85\x8d\x59\x5d\x68\
-\x36\x2d\xb3\x86\x40\x60\x31\x44\xea\x49\x30\xa8\x9e\xf8\xbc\x56\
-\xea\x57\xa0\x99\x05\x88\x82\xb6\x87\x48\x06\x3f\x00\xed\x50\x21\
-\xad\x07\xda\xae\x96\xba\x59\xea\x4a\x11\x9d\x67\xdf\x12\xa0\xdf\
-\x3d\x14\xda\x49\xf3\xef\xeb\x14\x47\x69\x25\x75\xa4\xd4\x51\x88\
-\xc0\xe9\xf8\x7c\xad\xd4\x77\xa5\xce\x11\xd1\x82\x5f\x10\xa1\xfb\
-\x3f\x1f\x3f\xbb\xe3\xb3\x72\x11\x9d\x5a\x5c\x25\x75\x81\xd4\xed\
-\xcc\x77\xe9\xfe\xc6\x32\xc7\x8e\x42\xff\x4c\x69\x45\x4f\x8c\x97\
-\x9e\xef\x6f\xc5\x7d\x45\x7c\xc0\x43\x4f\x29\x4c\xb2\xc7\x07\x10\
-\x92\x51\xeb\x38\x19\xf5\x8c\xcb\xb5\xeb\xee\xc2\xbd\xaf\x90\xfa\
-\xbe\x05\xac\xe8\x3b\xa9\x5a\xbb\x9c\xa4\xa2\xe6\xa1\x4a\x35\xec\
-\x4e\xf8\xd8\xd9\xd1\x22\x3a\x2b\x33\xc4\x30\x76\x74\xaf\xf3\x00\
-\xd0\x05\x71\xb2\x22\x6a\x7b\x34\x6c\x4c\x28\xf6\xf5\x6f\x11\x2d\
-\xee\x56\xc4\xd0\x26\xdd\x33\xd5\x82\x4e\x93\x3a\x42\xf3\xcd\x42\
-\xd8\xee\x62\xa9\x65\x0e\x6d\x25\x33\x63\xec\x05\x94\x5a\x85\x81\
-\x4e\x54\xd8\xe3\xa2\x88\x61\x61\x12\x75\x84\xa6\x7e\xa6\x20\x82\
-\xa5\x59\x2e\x5c\x89\x4e\xfe\x19\xd4\xb3\x56\x7b\x40\xe4\x98\xb7\
-\xe2\xc2\xb6\x76\xc8\xb9\x9e\x94\x7a\x8f\xf0\x5f\x60\x43\xf2\x94\
-\xd4\x2b\x94\x3c\xfd\x2c\x3c\xf0\x53\xa4\xde\x07\xa3\xe0\x8c\x8e\
-\x1c\x97\x0a\x5a\x7f\x11\xd1\xc2\x9f\x4d\x0e\x43\x9f\x2e\x07\xd0\
-\x70\x11\x8d\x1c\x75\x86\xd4\xbf\xc3\x30\x54\xa1\x31\x78\x5d\x98\
-\xd7\x00\x7c\x03\xe3\x32\x4d\xf9\x5d\x2a\xf5\x19\xcd\x91\xb6\xc3\
-\xe0\x2e\x30\xb4\xf7\x35\x1c\xa1\x88\x49\x0b\xce\x36\x7c\xfe\xb6\
-\xd4\xd3\x35\x0a\x4f\xe3\xd6\x15\x20\x76\x19\x80\x29\xc3\x87\xc9\
-\xd0\x4c\xc9\x7a\xa9\xb7\xc1\xe9\x74\x19\x00\xa3\x4e\x56\x8c\x9f\
-\xb3\x87\x0a\x00\x80\x2a\xe3\xa4\xce\xb7\x04\xae\x33\xa4\xfe\x06\
-\x41\x27\xdd\xa7\xaf\xd4\xf6\x8b\x70\x84\x3a\x8d\x61\xf9\x2d\x4c\
-\xca\x86\x7d\x4d\x54\x02\x8d\xde\x36\x15\x68\x6f\x96\xfa\x8e\x23\
-\x10\x50\x3b\x17\x4b\xfd\x1d\xc6\x3a\x95\x39\x8f\x1c\xf9\x5b\xa9\
-\x8f\xc3\xdf\x4a\x2d\x6d\xd2\x82\xb8\xeb\x0c\x9f\xef\xc6\x73\x5d\
-\x8d\x36\xc6\x6b\xd7\x7b\x33\xc9\x90\x8b\xe6\xc3\x80\x87\x6a\x0f\
-\x6d\x2f\x1a\xac\xd4\x6e\x86\x0c\x6d\x8c\x36\x90\x84\x32\x4f\x48\
-\x5d\x08\x83\x4b\xd3\x8c\x67\x97\x76\xdd\xd6\x18\xc4\x59\x52\x0f\
-\x76\x18\xc4\x54\x45\x53\xf0\x60\x27\x8b\xe8\x3c\x76\xae\x62\x78\
-\xbb\x0d\x68\xdd\x51\xea\x23\x00\x84\x4c\xcb\x35\xba\xc2\x91\x26\
-\x6b\x60\x50\x86\x76\x55\xe0\xcb\x44\xff\xef\x33\xb4\x43\x91\x93\
-\x9b\x49\xa0\x39\xf8\x2e\xcc\xb1\x5c\x83\x71\x54\x21\x52\x14\x33\
-\x35\x89\x41\x86\xcf\x33\x01\x90\x26\x59\x64\xc8\xe7\x69\x21\xd4\
-\xab\x30\xaa\xfe\xb8\x77\xbf\x3a\x06\x3d\xdf\x63\xf0\xbd\x29\x8c\
-\xd3\x52\x3f\xda\x40\x6d\xc1\x21\x43\x39\xcf\x53\x8e\xc9\x76\x84\
-\x61\xbf\x09\x50\xc8\x70\xe8\x2b\xb5\xd5\x4e\x04\x9b\x61\xab\x84\
-\x4d\x13\xbb\xbc\x86\x01\x03\xaf\xed\x21\x38\x2f\xd7\xa1\x5d\x6a\
-\xf3\x59\x68\x5f\x0b\x18\x78\x40\xdd\x09\x36\x36\x5b\xd8\xd7\x9e\
-\x98\xc6\xb0\x0d\xfc\x2c\x1d\x6d\x4c\x30\x5c\xaf\x32\x45\x33\x1c\
-\x1a\xdc\x4b\x94\xcf\x7e\x00\xe2\x17\x20\x4d\xa8\xc6\xc3\xec\x01\
-\x23\x1b\x0f\x87\x9b\x2e\xea\xe7\xd3\x29\xaa\xfe\x0d\x94\xca\x93\
-\x12\x18\xcb\x12\x44\xb0\x7d\xb8\x1e\x0d\xda\xb5\x30\x66\x01\xf0\
-\x20\xc7\xba\x3b\x40\x9e\xb9\x07\xfd\xc8\xc7\x03\xd9\x04\xb6\x41\
-\x69\xc4\x4e\x7c\x46\xce\xfd\x0b\x44\x6b\x4f\x26\xc2\xb1\x6e\x37\
-\xd0\x47\x1a\xb8\xfb\x15\x07\xa3\xfe\xfe\x0b\x86\xf7\x35\xae\x9f\
-\x0d\xaa\x35\x16\xe7\x51\x1b\x7f\x62\x50\x79\x21\x0c\xc9\x24\x83\
-\x44\xe3\x75\x00\xed\x19\x9a\x5f\x01\x5a\x3a\xd6\x60\x10\x19\x60\
-\x74\xaf\x1a\xea\x14\x99\x4c\x54\x2f\x60\x22\x56\x72\x1c\x35\xa9\
-\xe9\xa0\xe5\xb3\xb5\x63\xb5\x71\xb4\x6b\x4a\x49\x69\xa5\xe7\xf3\
-\x60\x05\x41\xa5\x36\xe0\xf9\x07\x83\x95\xe6\x39\x9e\x7f\x18\xc6\
-\x61\x8c\x21\xf8\x79\x42\xa9\xd8\xcb\x16\xb0\xb6\xc9\x48\xdc\xfb\
-\x78\xf8\xa5\x6b\x1d\xa6\x1c\x76\x7f\x91\x4b\x0d\x61\x9a\x06\x06\
-\x1f\x20\x3a\xae\x36\x44\x91\xc5\xa0\xc7\x44\xbd\x69\xf5\xdb\x46\
-\x2d\xaf\x9c\x0f\xc4\x4e\xc1\x79\xf7\xa1\xe3\x35\x06\x2a\x3b\x0f\
-\x03\xe3\x2d\xe5\xfd\xad\xd4\x99\xcc\x8d\x9a\x84\xf2\xc6\xa9\xb8\
-\x16\x81\xc2\xbd\x4c\x3e\x4f\x06\x7a\xb5\x88\x2e\x7c\xf1\x98\xd1\
-\x2d\x40\x73\xdd\x21\x4f\x54\x06\xad\x0a\x20\xf5\x94\x61\x1c\xe6\
-\xe2\xf3\x0b\xe1\xc4\x4b\x98\x3e\x2e\xb1\x00\x42\x1e\xd8\x94\x2a\
-\xbd\x95\x9a\x8d\xde\x4e\x11\x1c\x6e\x38\x93\xdb\x26\x69\x06\xdf\
-\x8b\x89\x3c\x9f\x03\xdc\x4c\xc6\x54\x6b\xa0\xab\x65\x1a\x95\x6f\
-\x6b\x71\xf0\x07\xc1\x3e\x4a\x7d\x72\xda\x58\x6b\x5d\xad\x40\xfb\
-\xf3\x44\xf3\xc8\x04\x61\x9f\xd6\x35\xc9\xa9\x48\x61\xe7\x32\x8c\
-\xea\x49\x0b\x18\xd4\x28\xa9\x73\x6b\x26\x5d\x1d\x0a\x5f\xb9\x29\
-\x40\x9f\x0e\x43\x60\xe4\xd8\x51\x8a\x77\x60\x88\x96\x73\x7c\x2c\
-\xa2\x9b\x6f\x8a\x7d\x50\xf6\x0b\xa8\x4e\xaf\xf2\x11\xcd\x52\x70\
-\xe3\x36\x21\x67\x7c\x00\xdf\xf1\xd0\xf8\x74\x00\x89\x8b\x1c\x8e\
-\x9f\x7f\x95\x7a\xa3\xe5\x3c\x8a\xd4\x7f\xc4\x00\x4f\x57\x0c\xed\
-\x26\xe4\xeb\x7a\xce\xeb\x81\xc6\x97\x52\x9f\x16\xfc\x54\xd9\xf7\
-\x00\x05\x9b\xac\x80\x33\xa5\x30\xa9\x81\x2e\x7d\x99\xa8\xbe\x5c\
-\x49\x43\xae\x12\x8d\x67\x89\x7a\x83\x39\xa8\x53\x9d\xc3\x18\x1a\
-\xbd\xc6\x52\x5c\x6d\x8d\x9f\x1b\x50\x67\x58\x84\x20\xf0\x8d\x72\
-\xce\x65\x00\xca\x81\x4c\xba\x45\x0b\xb2\x9e\x53\x98\xe6\x22\xa5\
-\xbf\x3d\x84\x79\x19\x35\x39\xc2\xa7\x52\xbf\x33\xd4\x5a\x84\x16\
-\xbc\xfc\xc0\xa0\x04\xfd\x2f\xc7\xdf\x6d\x90\x9e\x75\x82\x43\x06\
-\x99\xcd\x68\xa3\x05\xca\x5d\x00\xd9\xe3\x2d\x29\x2e\x8d\xf9\x39\
-\x60\x6c\x75\x1a\x8b\xba\x89\xa9\xe9\x08\x04\x60\x0a\x5a\xff\xc0\
-\xdf\x83\x11\xe4\x4e\x33\x9c\x7b\x0d\x6c\x6f\x4d\x8c\xc0\xba\x4e\
-\xf1\x71\x4a\xa3\x76\x7a\x27\xdc\xac\x44\x91\x7d\xa0\xf1\xc5\x71\
-\xa2\xea\x8c\x00\xe7\xce\x45\x9a\x90\x8d\xbf\xbb\x05\xbc\x16\x45\
-\xbb\xbb\x1c\xcf\xcd\x07\x95\xf3\x0c\x79\x2c\xa2\xe8\x7a\xe5\x9c\
-\x6c\x2d\x25\xd9\x1b\xe7\x58\x94\xc0\x90\x4c\xce\xdf\x16\x0e\xb4\
-\x59\x79\x68\xa6\xc8\x51\x05\xe7\xf4\x8c\xb2\x14\x0f\x51\x95\x2e\
-\x1a\x20\x24\x0b\x7e\xcf\xc4\x2a\x06\xe4\x52\x10\x10\x9e\x06\x2d\
-\xe5\xd6\x51\x3c\x0f\x30\x5f\x88\xfe\xeb\xf9\xee\x30\x05\x10\xd6\
-\x03\xe4\x3d\x99\xca\x3c\x2f\x0a\x22\x37\x08\xfb\xae\xcb\x3e\x00\
-\x43\x5b\x81\x9a\x0a\x6f\xaf\x89\x86\x33\x28\xc9\x70\xe0\x2b\x60\
-\xeb\x19\xc2\xad\x62\xaf\xa6\xcf\x53\x91\x56\x7b\xe3\x76\x16\x02\
-\x51\x0e\xf3\x9d\x01\x00\x9f\x4a\x2d\x80\x4d\x66\xce\x5f\x07\x20\
-\xdd\xa2\xd5\xa0\x7e\x8e\x31\x39\xce\x90\x26\x8e\x0b\x00\x08\x9e\
-\xec\x00\x6b\x7f\x49\xf1\x73\xda\x70\x77\x64\x12\x3a\xa0\x2e\x8f\
-\x7d\x05\x11\xad\x39\xe5\x07\x2d\x0a\x74\x0f\xf8\xfd\x7c\x43\x14\
-\xe1\xa4\x14\x29\x89\x4a\xdf\x86\x19\x8c\xca\x93\xce\x48\x4b\xe2\
-\x91\x72\x14\x03\xb9\xe8\x93\xab\xd5\x0f\x46\x1a\xce\x23\x27\xdd\
-\xa6\x44\x91\x22\xa6\x98\x34\x40\x4b\x17\x3a\x33\xac\x86\x7b\xc6\
-\xc5\x88\x3c\xd3\x2c\x60\x20\x14\xf6\x34\xcf\x92\xca\x65\x58\x8a\
-\x5e\x5c\x54\xf5\x2b\x2a\x4f\x30\x00\xa1\x3a\xce\xc4\x5c\x6e\x13\
-\x8d\xa7\x53\x89\x7d\x7c\x08\x16\x39\x55\xd8\xf7\x90\x98\x84\xa2\
-\xf4\xa3\x1a\x88\x52\x6a\x7c\xa7\x85\x6d\xf4\x31\x44\xe5\x91\x8c\
-\x7d\x57\x81\xb9\x9a\xa6\xdf\x09\xb8\x1e\x63\xae\x71\x7e\x0c\xf6\
-\x78\x37\xd8\x72\xb1\x16\xf8\xd6\x12\x20\x4c\xd2\x1e\xc2\x0b\xcd\
-\x04\x02\x11\x50\xd3\x6c\x44\xb5\x56\x5a\xa4\x73\x15\x72\x8c\xa5\
-\x01\xaf\xfd\x96\xf6\x10\x07\x1a\xa2\x67\xad\x02\x08\x8f\xc0\xc0\
-\xe3\x29\x8a\xcd\x67\x8a\x59\x64\x30\xea\xb2\xe2\x1e\x86\x88\x4b\
-\xb2\x4c\xc9\xe1\x6b\x2c\x00\x93\xab\x38\x1c\xf5\xb9\x83\xe1\x9c\
-\xcd\x82\xdf\xbf\x50\x6e\x01\x57\x6f\xba\xb0\x15\xfa\x68\x63\x72\
-\x59\x1a\xd3\x6a\x0a\xc9\x14\xfc\x9a\x8a\x3a\x44\xbd\x39\x0e\xed\
-\x6c\x0f\x08\x08\x45\x60\x1d\x26\x79\xd1\x52\x38\x4c\xd3\xd2\xba\
-\x64\x00\x42\x84\x01\x62\x9b\xef\x7d\xc4\x7c\xde\x55\xb8\xcd\xcc\
-\xa9\xe9\xeb\xb3\xb6\x9c\x82\x68\x4f\xba\x92\x33\xae\x49\x80\xf3\
-\xd3\xc0\x1c\x05\xe7\xea\x80\xdf\x3b\x80\x6a\x1d\x89\x9f\x99\x1a\
-\x58\xb8\xca\xb7\x50\x11\xf0\x3b\x45\x4a\xfd\x21\xc7\x30\x68\x8b\
-\x95\xbc\x6d\x14\x8a\x78\x2f\xc3\xb1\x57\x83\x06\x07\x59\xdc\xb2\
-\x01\x8e\x68\x8a\x0e\xc7\x2a\xbf\x8f\x60\x8c\x5d\x2f\x4e\x15\x30\
-\xd4\x79\x10\x0c\xa4\x02\x63\x9b\xc6\xe4\xa9\xe5\x8e\x39\xe7\x31\
-\x60\x1a\x69\xc8\x89\xbd\xa2\xde\x79\x8e\xa0\xdf\x94\xd2\xc5\x02\
-\x42\x94\x36\xfe\x33\x41\xc1\xab\x40\xa3\xfd\xaa\x54\x83\xea\xe7\
-\x32\xcf\xad\x9d\xa8\x9f\xa6\x3e\xc8\x40\xfb\xd5\x1a\xd7\x38\xcb\
-\x98\x71\x2c\x95\x40\xe6\x08\xf4\xc1\x45\x16\x89\x86\xd3\xe6\x8d\
-\x1e\xb8\x1a\x99\xb7\x09\xb7\x85\x41\xae\x42\x40\x33\x11\xc6\xd3\
-\x8f\x89\x7c\xf1\xca\x5e\xd0\x9d\x20\x42\x91\x7a\xa7\x02\x08\x47\
-\x18\xd2\x8a\xbb\x41\xbf\xb3\x95\x62\xe7\x24\xe8\x26\x38\xd5\x42\
-\x44\x88\xef\x1c\xae\xf9\x35\x1e\x9a\x09\x10\x7a\xc1\xd8\xb7\x32\
-\x14\x70\xa3\x52\x63\xf0\x64\x21\xa8\x7f\x96\xf6\x79\x0e\x9c\xa6\
-\x44\x98\xd7\x25\xd4\x3a\xa4\x84\xc9\xa0\xe6\x63\xd0\x46\x4b\xd9\
-\x8c\xd4\x51\x79\x66\xa6\x31\xfa\x2a\x41\xd7\xdd\xe9\x73\xbc\xc2\
-\x02\x88\xaa\x7f\xd1\xef\xbd\x99\x73\xc9\x3f\x66\xc5\xc8\xb4\x33\
-\x1c\xcf\xad\x12\xf6\x17\xf7\x34\xaa\x52\x27\x8b\xa6\xdb\xdf\x30\
-\x14\x85\x10\x9a\x65\x18\xad\x81\x41\x0d\x28\xdb\x77\x30\xce\x39\
-\x0e\x83\x6e\x1b\x90\x48\x8c\xdf\x53\x91\x5c\x97\xe5\xa0\x77\xa6\
-\xcd\x3f\xdd\x00\x72\x8f\x23\x57\xbd\xc1\x61\xdc\x2a\x2c\xb4\xaf\
-\x3d\x1c\xb9\xa3\xc6\x16\xd4\x88\xbe\xdd\x10\x51\xb8\x65\xc7\xc3\
-\x01\x60\x5d\x99\x7e\xd8\x96\x2b\xd3\xd4\x14\xad\xb9\x98\x81\xfa\
-\x52\x4b\xda\x99\x98\x65\x49\xdb\x4a\x12\x78\xdd\xa4\x00\xb6\x64\
-\x62\x09\xea\x79\x69\x09\xe8\x9f\xeb\x8c\xc9\x5e\x04\x11\x2b\x25\
-\x4c\x84\x8c\x04\xda\x65\x29\x00\xb0\x06\xce\x4f\x3f\xd7\x02\xcd\
-\xb7\x82\x72\xb5\x83\x03\xb6\x6b\xc6\xfa\x45\x8a\x36\x50\x82\x29\
-\xe4\x9d\x8b\xd4\xe1\x7a\x11\xad\x52\xb7\xd7\x10\xb9\x37\x80\xe1\
-\x38\x14\xac\x6c\xeb\xd8\x3f\xc4\x71\x1d\xd1\xdb\x82\xde\x1f\xca\
-\x18\xcc\xc7\x06\xca\x4a\xe3\xb6\x52\x98\xdf\xb7\x40\x53\x55\xaf\
-\xa1\x1e\xa1\x0b\x55\xad\x3f\x65\xfa\x47\x11\x6c\xa6\x68\xb8\xa8\
-\x4c\x97\x1d\x70\x90\x2d\x60\x1b\x9d\x9b\x11\x34\x52\x7c\x58\xdf\
-\x81\x28\x6d\x9a\xd2\x8f\xf5\x86\x6a\x9a\x60\x60\xb3\x40\xb7\x3d\
-\x30\xa0\x4a\xf4\x3d\xa0\xd6\x55\x2d\xe4\x61\xa6\x6a\x75\x83\x2f\
-\x7d\x0c\xad\x00\x4a\x74\x7f\x20\x0a\x5b\xc3\x44\xc3\x2d\xc7\x57\
-\xa3\x2e\x61\x9b\xfe\x7c\x07\xa9\xc3\x51\x86\x63\x3d\x18\x40\x2c\
-\x87\xe3\x9b\xe4\x5d\x44\x07\x3d\x42\x0d\x44\xce\xd9\xd1\xf0\x1d\
-\x5b\x01\xf6\x2a\x0b\x18\x2c\x45\x0d\x65\x25\xc6\x6f\x19\x3e\xbf\
-\x53\xf8\xaf\x2c\x6d\x2a\xb1\x81\x6d\xf6\x8f\xc4\x81\x6b\x19\xc6\
-\xb1\x55\x98\x17\x31\xf9\x49\xa5\xe0\x37\xd6\xc5\x0d\x08\x87\x23\
-\x5a\x7d\x1f\x47\x9b\x17\x88\xfa\x69\x3c\xaa\xbe\xde\xe2\x78\xa3\
-\xb1\x6e\x7b\xad\x8b\xe1\xbb\x39\x5a\x6e\xb7\xc9\xf1\x7b\x1b\xa1\
-\xe4\x18\x1d\x00\x02\xb7\x2b\x11\x9f\xea\x0b\xcf\x58\xda\xa3\xea\
-\xfd\x27\x0c\x20\xd0\x67\xc7\x18\x3e\xdf\x60\xc9\xf9\x37\xe0\x5a\
-\xdd\x0d\x8c\xe3\x64\xe6\x3b\xcb\x2c\xf7\x77\x25\xf3\x39\x15\x52\
-\x2f\x61\xea\x4b\xa9\xcd\x48\x7f\x77\x59\x1c\xaa\x3b\x98\x4a\x71\
-\x0b\x06\x03\x0a\x88\xdf\x32\x40\xfd\x8d\xb0\x2f\xac\x6b\x16\x49\
-\x82\xf3\x57\x2b\x51\x2a\x27\x4e\x2a\xae\x2e\xaa\xd9\x8c\xe2\x97\
-\x9f\xa4\x81\x8a\xc7\x22\x87\xc6\xf0\x5d\x7d\x9e\xff\xd3\x18\xae\
-\x4b\x0f\x90\xe6\xa6\xa7\x29\x46\xdc\x45\xf8\xbf\xf2\xec\x6d\xe6\
-\xf3\x9e\xc8\xdf\x75\xf9\xcc\x02\xd0\xc5\x4c\xdf\x5b\x09\xf3\x0b\
-\x53\xc8\x18\xb9\x6a\x74\x1f\xe6\xd9\x13\x6b\xcc\x17\x7c\xb1\xb9\
-\x4b\x13\xda\x63\xb2\xe0\x77\x95\x7a\x51\x74\xb3\xa5\xff\xe3\x5a\
-\x38\x3b\xa8\xb0\xf4\xbf\x67\x9c\xbe\xd7\x64\x80\x40\x05\x24\x75\
-\x2b\xe5\xa4\x38\xda\x4b\xd7\x9c\xb3\x54\xb8\x4d\x6f\x1d\x1b\x47\
-\xfd\x80\x66\x08\xfa\x06\xbc\xe7\x31\xca\xdf\x54\xcc\x5c\x1c\xc7\
-\x3d\xcf\x12\x0d\xf7\x72\xf8\x39\xc8\x7b\x4c\x8a\x74\x82\x30\x2f\
-\x22\x7a\xcf\xa7\x48\x54\x68\xf8\xbc\xb5\x30\xaf\x76\xa4\x14\x83\
-\x9b\x11\x69\xc7\x44\xde\x6a\x1f\x30\x18\x16\xa3\xdd\x71\xf6\xd3\
-\xc7\x07\x10\x3e\xb7\x80\x09\x6d\x21\x1e\xe1\x68\x33\xa9\xfb\xc1\
-\xdf\xe8\x79\x7d\xc0\x1c\xa3\x57\xe9\x4f\x0e\xe8\x6b\x07\x27\x02\
-\x10\x1e\x15\x0d\x57\xbd\xd1\x32\xc9\x21\x71\x30\x84\x88\x56\x4f\
-\x38\xc4\xa1\x0f\xf1\x50\xa5\x56\xa0\xba\xae\x85\x15\x02\x3c\x75\
-\x35\xdf\x1b\xc2\xbe\xb7\xdc\x05\xf5\xcb\x35\x5a\x68\x93\x55\xc2\
-\xbc\xca\x30\x4d\x34\xae\xa0\x57\x58\x18\x85\x27\x9f\x18\xfa\x1f\
-\x11\xe6\x2d\xba\x85\xc2\x3e\x45\x16\x61\x0c\x6f\x00\xf3\x9d\x1b\
-\x99\xf4\xc7\x4f\x6c\x4b\x86\x69\x95\xe4\x29\xca\xdf\xe4\xe0\xdd\
-\x14\x87\x7a\xc5\x32\xc6\x04\xa8\xb4\xb8\x67\x8a\xa1\x5f\xc4\xbe\
-\xa8\x38\xfc\x04\x58\x5d\xfa\x7e\xaa\x1f\xbc\x21\x1a\xbf\xef\xc1\
-\x13\xda\x4f\x74\x91\x43\x3b\x23\x70\x9f\xfd\x13\x01\x08\x84\xb8\
-\x2f\x2a\x9f\x11\xea\xcc\x0c\x18\x75\xd5\x02\x87\x6a\xec\x54\x39\
-\xf7\xdb\x17\x4e\x2f\x50\x39\x27\xce\xfb\xa0\xb9\x7b\x97\xc2\x16\
-\xe5\xe8\x77\x29\xe0\x51\x0e\x3a\x5c\xc7\x9c\xeb\xc2\x5a\x7a\x2a\
-\x06\x4b\xed\x6c\xf3\x39\x7f\x1f\x8c\xc2\x45\x68\x36\xc6\xef\x8d\
-\xc8\xab\x1d\xf3\xe6\x32\x4b\x74\x12\x60\x0e\x9c\xa3\x4d\x15\x0d\
-\x17\x41\x0d\x46\xad\x24\xd6\xff\x66\xf4\x85\xe5\x18\xd9\xcc\x6c\
-\xb0\xb6\xc5\x00\x00\x75\x2a\xf6\x05\x9f\x31\xa1\x3a\x02\x2d\x01\
-\x5e\x80\x7a\xc9\x5b\xd0\x42\xd4\x7e\xae\x43\x0e\x5f\x21\xf6\x8f\
-\x2c\xb5\xd4\x71\xa8\xf6\x43\x9b\xfa\xe8\xf5\x01\x67\x1b\xc0\x8e\
-\xea\x38\xcf\x63\x4c\xc6\x88\xf8\x76\x90\x5a\xa9\x1b\xb1\x84\x25\
-\x5a\x3e\xf6\x1f\x38\xda\x21\x4c\x54\xee\x0f\xe7\xca\xd6\x10\x70\
-\x91\xf2\x37\x4d\x89\x50\xd1\xcd\xb4\xc1\x86\x10\x9b\xfe\x39\xc7\
-\xfd\x70\xa4\x58\x17\x44\xed\x43\x64\xfb\xbd\x88\x6e\xbb\x35\xd5\
-\x13\x0e\x42\x74\x98\xa5\x51\xfa\x7c\x61\x5e\x02\x4c\x46\xf9\x1c\
-\xea\x1f\x67\x30\xc0\x40\x63\xd7\x55\x44\xb7\xa0\x7a\xbb\xe1\x36\
-\x08\xb7\xff\x71\x30\xdf\xf1\xde\x0a\x85\x7f\xc1\xb4\x44\xd8\xdf\
-\xdb\xe8\xc9\x16\x61\x7f\x4d\xdd\x7a\xcb\x71\x7a\xc6\xb4\xab\x6e\
-\x07\x94\x6c\x65\x62\x1c\xb4\x7b\xad\xb0\xaf\x1b\x68\x07\x96\x70\
-\x0a\x7e\x57\xd7\x81\x94\x03\xa0\xfc\x16\xa3\x51\x91\x91\x76\x44\
-\x9e\x0a\xed\xa7\xd8\x72\x95\x68\xfa\x55\x94\xae\x42\xfd\xbe\x53\
-\xf0\xeb\x6e\xc8\x96\xa8\x58\x3d\x47\x19\xef\x1d\xa8\xfd\xd0\x0e\
-\xc8\x4b\x31\x26\x7b\x44\x02\xde\x3f\xa9\x46\xca\x2b\xe1\x30\xde\
-\xea\xb6\x5e\xe8\xd4\x32\x20\xf5\x26\x3c\x18\x42\x60\x9a\x76\xa3\
-\x25\xcf\x19\xd0\x29\x4a\x5e\xec\x6d\x97\xf5\x96\xfd\xe6\xc1\xb1\
-\x5e\x01\xb2\xa7\x20\xaa\x5e\xa0\xb0\x90\xe9\x00\x9f\xb6\x31\xdc\
-\x03\x4d\x83\x7d\x09\x03\xf5\xd8\x06\x6d\x39\xf5\x96\x60\x77\x80\
-\x41\x8c\xd2\xbe\x47\x7d\x7a\x98\xa1\xc8\xd4\x1f\x6f\x89\xe9\x02\
-\x80\xc6\x07\xd0\x1a\x00\xe2\x09\xb8\x96\xba\x72\xee\x71\x4b\xd1\
-\x48\xa7\xf9\x65\xc2\x7f\x8f\xbd\xeb\x6b\xb8\xde\xc1\x78\xda\xe4\
-\x33\xe4\xe0\x36\x3a\x3b\x43\x98\x57\x37\x7a\x00\x98\x6d\xc8\xe9\
-\xb7\x08\x7e\x8b\x35\x27\x54\x08\xa5\x69\xdc\xcb\x62\xb4\xdb\x05\
-\x70\x9a\xa7\x85\xbd\x08\xd9\x52\x65\x39\x02\xd8\x13\x96\x7a\x4a\
-\x9a\xd8\x0f\x53\xa9\x6a\xde\x4d\x0e\x4f\x55\x5a\x7a\xe9\xc9\x85\
-\xca\xe7\xc3\x85\xfd\x05\x9e\xd7\x82\xe2\x6c\x54\x8a\x74\xbf\x02\
-\x98\x78\xcc\x20\xc7\x42\x2f\xef\x80\x23\x5d\xec\x50\x74\x32\x49\
-\x0d\xda\xa8\x06\xad\xed\xeb\x90\xee\xcc\x02\x78\x94\x30\xb9\xb4\
-\x1e\xf9\x72\x1d\x52\x9f\x7b\x45\xe3\x17\x9d\xd8\xe8\xf9\x2a\x9f\
-\x71\xdd\x23\xdc\xff\x81\xca\x0a\x8c\x43\xb2\x8f\x11\xfa\x09\x45\
-\x20\xda\xa6\x3c\xd6\xe1\x5c\x1a\xef\x5f\x8a\x68\xf1\x32\x2f\x40\
-\xe1\xd0\x7b\x66\xf4\x0e\x8c\x93\x84\xdb\x2c\x85\xe9\xbe\x5e\x42\
-\xa4\x7f\x20\x86\x3a\x46\x2a\xf3\xdc\x93\x2c\xf5\x15\x17\xa6\x1d\
-\x64\x0c\x9e\x44\x50\xf8\x83\x30\xcf\x2e\xf9\x49\x6b\xcb\xf3\x8e\
-\x58\xfa\x13\x09\x72\x23\x14\xdd\x26\x20\xda\xac\x40\x4d\xa0\x8e\
-\x89\x26\xbb\x90\x93\xd1\x4a\x39\x7d\x61\xc4\x3a\x44\xe5\x99\xc2\
-\xbc\x29\xa4\x06\x14\x75\xbc\xa8\x7f\x59\x49\x39\x06\xa8\x4c\x04\
-\xdb\x9b\x40\x11\x9d\xa6\x00\xaf\x07\x7d\xdf\x24\xcc\x9b\x8e\xc8\
-\x78\x68\xc5\xdf\x15\x60\x13\x5b\x2c\x45\xc2\x6b\xc0\x58\x5e\x46\
-\x21\xab\xc6\x52\x33\xa1\xe8\x7c\x1e\x40\xc9\x75\xb3\x53\x29\xbe\
-\x57\x66\xd1\xf9\xc2\x7d\x4b\x37\x31\x98\xf7\x2d\x6d\x7d\x25\xcc\
-\xb3\x11\xba\xec\xc5\xf8\x3c\x26\xf8\xcd\x3c\x35\xa8\x01\x5c\x8c\
-\x48\x1d\xb1\x5c\xb7\xce\x87\x25\x8c\x02\xa3\xac\xb2\x5c\xeb\x2d\
-\xc1\xaf\xc3\x98\x8d\x02\xdb\x23\x18\x53\xbf\xf1\xaf\x45\x10\x98\
-\x67\x28\xec\x55\xc3\xa6\x4d\xf7\xe1\x57\x6f\xd8\xc3\x7c\x6f\x97\
-\xb0\x2f\xba\x7b\x0e\xfd\xa7\xd4\x75\xb7\xf0\x5f\xa0\x57\x87\x67\
-\xb4\x12\x8c\x7e\xa5\xc5\x86\x4d\xfd\xd9\x6d\x29\x68\x46\x91\xc4\
-\xf2\xef\xe0\x93\x10\x69\xa9\x80\x74\xb4\xa8\x7f\x8b\x4e\x11\x0c\
-\x82\x1e\xa4\xcb\x2e\xc3\xe3\x41\x29\x7b\x03\x99\xbd\xb9\xf3\x85\
-\xa2\x7e\xd7\x95\xb7\x94\x38\xa2\x3c\x38\x5b\xc7\x89\x2a\x4e\x52\
-\x9c\xe1\x4c\x51\xbf\x05\x35\x0b\x83\x4c\x91\x2b\x13\x6d\x52\xfa\
-\xf0\x11\x28\x7f\x65\x40\x24\xee\x0c\x76\xd0\x17\xc5\xa8\x08\xea\
-\x16\x9f\xc3\x50\x57\x8b\xd8\x56\x5a\x46\x7c\x72\xf0\xea\x80\xed\
-\xda\x5e\x53\x56\x27\x82\xff\x73\x14\x5a\xed\x48\x8b\x9b\xd4\xaa\
-\xf7\x76\xb0\x88\xa5\xa2\x7e\xfa\xd2\xf6\xca\xef\x6a\x87\x3c\x37\
-\x0d\x0c\xe3\x12\xd1\x70\x61\x16\x01\x36\x15\xbb\x5f\x77\x04\xda\
-\x6c\x30\x8e\x41\x08\x46\x7a\x41\x75\x3e\x0a\xbe\x73\x18\x07\xb7\
-\x3d\x8f\x1a\x9f\x3e\xa4\x58\xd8\x40\x95\x63\xae\x4f\xb6\x3a\x1a\
-\xfe\x96\x6b\x00\xb2\x42\xb0\xf0\x02\xf8\x60\x6d\x0c\xb6\xa0\xbf\
-\x86\x3d\x10\x20\xb4\x64\xb1\x01\x42\x28\xa1\x84\x12\xa3\x84\xff\
-\xb9\x29\x94\x50\x42\x09\x01\x21\x94\x50\x42\x09\x01\x21\x94\x50\
-\x42\x09\x01\x21\x94\x50\x42\x09\x01\x21\x94\x50\x42\x09\x01\x21\
-\x94\x50\x42\x09\x01\x21\x94\x50\x42\x89\x53\xfe\x2f\xc0\x00\x1f\
-\x50\x2e\x0e\x98\x0d\xc9\xc8\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x08\x44\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x03\x22\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
-\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
-\x43\x6f\x72\x65\x20\x35\x2e\x33\x2d\x63\x30\x31\x31\x20\x36\x36\
-\x2e\x31\x34\x35\x36\x36\x31\x2c\x20\x32\x30\x31\x32\x2f\x30\x32\
-\x2f\x30\x36\x2d\x31\x34\x3a\x35\x36\x3a\x32\x37\x20\x20\x20\x20\
-\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
-\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
-\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\x36\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x36\x45\x41\x41\x31\x41\x41\x39\x38\x34\x39\
-\x42\x31\x31\x45\x45\x38\x44\x43\x41\x42\x42\x36\x39\x32\x35\x34\
-\x42\x46\x37\x33\x42\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
-\x3a\x36\x45\x41\x41\x31\x41\x41\x41\x38\x34\x39\x42\x31\x31\x45\
-\x45\x38\x44\x43\x41\x42\x42\x36\x39\x32\x35\x34\x42\x46\x37\x33\
-\x42\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\
-\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\
-\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\
-\x3a\x36\x45\x41\x41\x31\x41\x41\x37\x38\x34\x39\x42\x31\x31\x45\
-\x45\x38\x44\x43\x41\x42\x42\x36\x39\x32\x35\x34\x42\x46\x37\x33\
-\x42\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\
-\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x36\x45\x41\
-\x41\x31\x41\x41\x38\x38\x34\x39\x42\x31\x31\x45\x45\x38\x44\x43\
-\x41\x42\x42\x36\x39\x32\x35\x34\x42\x46\x37\x33\x42\x22\x2f\x3e\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\
-\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\
-\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\x10\
-\xa2\xa4\x9e\x00\x00\x04\xb8\x49\x44\x41\x54\x78\xda\xec\x9d\x69\
-\xa8\x4c\x61\x18\xc7\xcf\x45\x5c\xe5\xda\xb2\xdd\x1b\xca\x12\xd2\
-\x25\x4b\x24\x24\x3b\xd9\x6f\xf6\x3d\x3b\xc9\xbe\x64\x2b\x5f\x14\
-\x11\x8a\x90\x2d\x24\x4a\x44\xf8\x60\xfb\x40\x59\x3f\xd9\xf9\xa0\
-\x08\x69\xec\x4b\xae\xb2\x1b\xff\xc7\x3c\x93\xb9\xe3\xdc\x71\xe6\
-\x9c\x77\x66\xce\xcc\xfd\xff\xeb\xdf\xdc\x5b\x33\xef\x9c\xf3\xfe\
-\xce\xfb\xbc\xcf\xbb\xdd\x9b\x15\x0c\x06\x2d\xca\x3f\x2a\xc5\x2a\
-\x20\x10\x8a\x40\x08\x84\x22\x10\x02\xa1\x08\x84\x40\x28\x02\x21\
-\x10\x8a\x40\x28\x02\x21\x10\x8a\x40\x08\x84\x22\x10\x02\xa1\x08\
-\x84\x40\x28\x02\xa1\x08\x84\x40\x28\x02\x21\x10\x8a\x40\x08\x84\
-\x22\x10\x02\xa1\x08\x84\x22\x10\x02\xa1\x08\x24\xad\x95\x95\x9b\
-\x9b\xdb\x19\xaf\x17\x58\x15\xa9\x51\x20\x10\xf8\xa7\x85\x2c\x85\
-\x77\xc3\xf9\xac\x1e\x7f\x84\xac\x9e\xf0\x44\xf8\x0e\xbc\x11\xae\
-\xc1\x6a\x49\xbe\xf2\xf2\xf2\x06\xc0\xc7\x24\x64\x45\x1f\x32\x3c\
-\x0b\x5f\x84\xd7\xc2\xdf\x58\x55\x09\x97\x74\x19\x33\xe0\xca\xd2\
-\x38\xec\x80\x84\x75\x1a\x3e\x06\xef\x60\x9d\x25\x44\x2d\xe0\x39\
-\xd2\x38\x34\x4a\xfd\x51\x99\x18\x1f\xe8\xad\x21\xad\x2f\xbc\x1f\
-\x3e\xc2\x3a\x34\xa2\xfa\xf0\x02\xb8\x61\x24\x08\x27\x40\xac\x88\
-\x0f\x64\xc3\x43\xe1\x6d\xcc\xc8\x5c\xab\x2a\xbc\x08\x6e\x65\x07\
-\xc2\x29\x90\x68\x30\x12\xe7\xc6\x6a\xe7\x7f\x97\x75\xec\x48\x65\
-\xe1\xf9\x70\x97\x58\x20\xe2\x05\x12\x0d\xa6\x36\x7c\x1f\x5e\x0d\
-\xbf\x62\x9d\x17\xab\xe9\xf0\x40\x0d\xff\x8e\x07\x86\x5e\xfe\x94\
-\x03\x33\x32\x7b\x8d\x82\x47\xeb\x03\xdf\x33\x9e\x0f\x7a\x05\xc2\
-\x8c\xac\xa8\xfa\xc0\x93\xe0\x0a\xf1\x82\x08\xab\x74\x4e\x4e\xce\
-\x53\xbc\xb6\x84\x2b\x79\xb8\x10\xc9\x18\xca\x69\xc7\xff\x43\xc3\
-\x59\x49\x52\x47\x0d\xdf\x5d\xe1\x7e\x70\x03\xb7\x05\x09\x90\x9b\
-\x78\xdd\x0e\x7f\x84\xdb\x68\x46\xe5\x46\x72\x11\x8d\xb5\xe3\xef\
-\x0f\xbf\x81\x1f\x67\x38\x88\xe6\xf0\x2a\x78\x00\x3c\xc8\x0b\x88\
-\xc8\x90\x55\xe4\x77\x25\x7c\x50\x9b\x9d\x17\x49\xff\xf2\x2c\x43\
-\x33\xb2\xba\x3a\x96\x68\xe2\x36\x34\xd9\xe8\x24\x3c\x35\x1a\x48\
-\x64\xf6\x35\x19\xde\xec\x22\x13\xb3\x03\x93\x29\x19\x59\x65\x05\
-\xd1\xd6\x20\x88\x6b\xf0\x98\x40\x20\xf0\xd0\xae\x85\x44\xab\x3c\
-\xbc\x02\x5e\x66\xe0\x8b\xd3\x39\x23\x93\x87\x72\x2e\xdc\xc3\x20\
-\x88\x07\xf0\x08\x80\xb8\x11\x2b\x64\xc5\x1a\x65\x6e\x91\x02\x4a\
-\x60\x46\x36\x15\x2e\x88\x67\x2c\xf1\x1f\xbd\x84\x47\xea\x8c\x47\
-\xd0\x6e\x3d\xc4\x89\xde\x69\x21\xf5\xe0\xab\x1e\x2f\x48\x6e\x6c\
-\x30\x7c\x1c\x1e\xe2\x63\x10\xc3\xf4\x1a\x07\x1b\x82\xf1\x49\xcb\
-\x92\xc9\xc4\xf3\x02\xc3\x49\xa7\xee\x54\xad\xb5\xe3\x6f\x64\x20\
-\x8c\x7d\xb0\xfc\x35\x47\xd6\x5b\xc7\x12\x15\x0d\x85\x27\x19\x06\
-\xcc\x82\x77\xe9\xcf\x45\x14\xdd\x42\xdc\x02\x09\x67\x64\x72\xf1\
-\x07\xe0\x2a\x19\x90\x91\xb5\x87\x67\xc2\xd5\x0c\xf6\x13\x2b\xb5\
-\xcf\xfc\x52\xdc\x1b\xa2\x81\x78\xc9\xa0\xa4\xc9\x9d\x82\xab\xc3\
-\xe3\xb4\x4f\x70\x5b\x5e\x2a\xe7\xc8\x9a\xc2\xf3\x34\x95\x35\x05\
-\x62\x2b\xbc\x04\x2e\xf4\x3a\x0e\xf1\x22\x19\xa9\x2f\xd5\xa7\x22\
-\x1d\x32\xb2\xda\x9a\xc2\x36\x35\x08\x42\x92\x95\x19\xda\x71\x3b\
-\x92\xc9\x90\x15\x2b\x57\xdf\x00\x4f\xf0\x69\x46\x56\x51\x41\xb4\
-\x33\x08\xe2\x12\x3c\x1e\x7e\x14\xef\x07\x93\x01\x24\xac\x3a\xf0\
-\x1e\xb8\x9b\x81\xd6\x22\x31\x78\x1f\x7c\xd4\x63\x59\xb2\x2e\xd1\
-\xcb\x20\x88\xfb\x9a\x7d\xde\x76\x5b\x40\x32\x81\x44\xce\xf7\x1c\
-\x4e\x71\x46\x26\xbb\x6a\x86\x5a\x7f\x77\xd9\x78\xd5\x0b\x78\xb8\
-\x86\x55\x4f\xb3\xe5\xa9\x00\x12\xce\xc8\xba\x5b\xa1\xb5\xf9\x9a\
-\x49\xcc\xc8\x64\x9c\x23\x2b\x9c\xd9\x86\x40\x14\x6a\x02\x73\x02\
-\xfe\x65\xa2\x62\x4c\x66\x59\xf1\x66\x64\xe7\x74\x50\x24\x8b\x37\
-\x3b\x2d\xf7\xb3\xca\x4e\x32\x32\x81\x3f\xcd\xf0\x58\x62\xba\x86\
-\xcd\x1f\x09\x7d\x72\x93\xd4\x42\xec\x32\x32\x99\x1b\x5a\x63\x30\
-\x23\x93\x44\x22\x5f\x07\x61\x35\x0c\xf6\x13\xcb\xe1\xf5\xf0\xd7\
-\x44\x54\x44\xaa\x42\x56\x71\xca\xd1\x8a\x9c\xec\xc3\xa9\x93\xcd\
-\x0a\xa3\x30\x91\x5f\xe2\x76\x2e\x2b\x51\x92\x9b\x9d\xa2\xa1\xec\
-\x8c\x4f\x40\x1c\xd2\x16\x36\x3b\xd1\x30\xec\xe4\x97\xe3\x08\xcf\
-\x75\x1a\x46\x42\xce\xad\x14\x5d\x83\x64\x6e\x32\x79\x2a\x33\xda\
-\xaf\x53\x55\x11\x7e\x3b\x1f\x72\xcf\x0a\xad\xef\x77\x8a\x67\xb4\
-\xeb\x51\xf2\x00\x34\xb3\x42\xfb\xa6\x1e\xa7\xba\x02\xfc\x78\x60\
-\x27\xa8\x9d\x74\x9e\x3e\xad\x9f\x13\xf4\x3d\x4f\xac\xd0\xe6\x84\
-\x96\x96\x8f\x96\x98\xfd\x7c\x82\xea\x97\xc6\x73\xd9\x0d\xb3\xd0\
-\xeb\x00\x2c\x42\xef\xad\xd0\xa6\x04\xd9\x63\x7b\xd9\x60\xb9\x19\
-\x0f\x24\xac\xef\x9a\x76\xca\x98\x62\x93\x87\x72\x64\xfa\x45\xe6\
-\xd7\x64\x76\xfa\xa4\xa9\x81\x5d\x49\x04\x12\x96\xac\xb8\xc9\xf6\
-\xfd\x5a\x5a\xa1\xf1\x84\xc0\xc5\xda\xd2\xf6\xc2\x3f\xfd\x7c\x93\
-\xe9\x78\xe8\xf3\xa5\x86\x1c\xd9\x03\x76\xfd\x3f\xef\xdd\xa8\x2d\
-\x6b\x9d\x95\x26\x1b\x2b\xd2\xf9\x14\xae\xec\xda\x90\xa5\xe4\x0e\
-\xda\x41\x47\x4a\x96\x97\x65\xe5\x6f\xbe\xb6\xac\xb4\x51\x26\x1c\
-\x8b\xbe\xa2\x1d\x74\x81\x86\x32\x59\xf9\x93\x8d\xce\x6f\xd3\xf1\
-\x66\xb2\xf8\x7f\x0c\xd9\x42\x28\x02\x21\x10\x8a\x40\x08\x84\x22\
-\x10\x02\xa1\x08\x84\x40\x28\x02\xa1\x08\x84\x40\x28\x02\x21\x10\
-\x8a\x40\x08\x84\x22\x10\x02\xa1\x08\x84\x22\x10\x02\xa1\x08\x84\
-\x40\x28\x02\x21\x10\x8a\x40\x08\x84\xf2\x85\x7e\x0b\x30\x00\x2d\
-\x4e\xff\xe2\x17\x46\xa8\xa4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-"
+# The icons ship as binary .rcc bundles built by resources/buildResources.py, Qt maps them instead of unpacking Python literals
 
-qt_resource_name = b"\
-\x00\x0b\
-\x0d\x59\x91\xc2\
-\x00\x63\
-\x00\x61\x00\x70\x00\x73\x00\x57\x00\x61\x00\x74\x00\x63\x00\x68\x00\x65\x00\x72\
-\x00\x0a\
-\x00\xf2\x66\x67\
-\x00\x62\
-\x00\x72\x00\x61\x00\x7a\x00\x69\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x01\x6f\x1d\xa7\
-\x00\x65\
-\x00\x78\x00\x69\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x01\xa0\xd5\xa7\
-\x00\x73\
-\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x02\xbc\xb5\xc7\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x02\xd0\x42\x47\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x03\x70\x6c\x87\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x69\x00\x65\x00\x77\x00\x4c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x4d\x00\x6f\x00\x64\x00\x65\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x03\x88\x33\x67\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x79\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x03\xe3\x89\x87\
-\x00\x65\
-\x00\x78\x00\x69\x00\x74\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x04\x5d\x8e\xa7\
-\x00\x69\
-\x00\x6e\x00\x66\x00\x6f\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x18\
-\x05\x52\x9a\x27\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x79\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\
-\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x06\x6d\xa6\x07\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x79\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x06\xdf\xbd\xc7\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x08\x18\xfd\xc7\
-\x00\x69\
-\x00\x6e\x00\x66\x00\x6f\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x08\x82\x16\x47\
-\x00\x77\
-\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2d\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x2d\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x08\xe9\x8f\x67\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0a\xb1\xba\xa7\
-\x00\x61\
-\x00\x70\x00\x70\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x0a\xb9\x8a\x67\
-\x00\x63\
-\x00\x61\x00\x70\x00\x73\x00\x57\x00\x61\x00\x74\x00\x63\x00\x68\x00\x65\x00\x72\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x0b\x3b\x8c\x07\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x0c\xbe\x88\x07\
-\x00\x75\
-\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x0c\xc6\x72\x47\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x69\x00\x65\x00\x77\x00\x44\x00\x61\x00\x72\x00\x6b\x00\x4d\x00\x6f\x00\x64\x00\x65\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x10\
-\x0c\xdf\x09\x87\
-\x00\x73\
-\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x0d\x20\xb8\x07\
-\x00\x72\
-\x00\x65\x00\x73\x00\x74\x00\x61\x00\x72\x00\x74\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x10\
-\x0d\x83\x2e\xa7\
-\x00\x72\
-\x00\x65\x00\x73\x00\x74\x00\x61\x00\x72\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x0d\x9a\xcd\xa7\
-\x00\x75\
-\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0d\xe2\x9d\xe7\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x15\
-\x0e\x49\x74\xe7\
-\x00\x63\
-\x00\x61\x00\x70\x00\x73\x00\x57\x00\x61\x00\x74\x00\x63\x00\x68\x00\x65\x00\x72\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x0e\x9b\x2b\xc7\
-\x00\x67\
-\x00\x72\x00\x65\x00\x79\x00\x2d\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x2d\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-"
+def resourcePath(bundle):
+    basePath = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(basePath, 'resources', f"{bundle}.rcc")
 
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x1b\x00\x00\x00\x02\
-\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x19\xa9\
-\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x1a\x93\
-\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x43\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x2f\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xc1\
-\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x56\
-\x00\x00\x01\x34\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x08\
-\x00\x00\x01\x56\x00\x00\x00\x00\x00\x01\x00\x00\x8f\xf5\
-\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x91\xd2\
-\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x00\x96\x56\
-\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x97\x02\
-\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x97\xbd\
-\x00\x00\x02\x10\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x50\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xa2\x2e\
-\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\xa2\xe9\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xc0\x35\
-\x00\x00\x02\xaa\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x08\
-\x00\x00\x02\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x65\
-\x00\x00\x02\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x8d\
-\x00\x00\x03\x1e\x00\x00\x00\x00\x00\x01\x00\x01\x42\x33\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x01\x42\xe0\
-\x00\x00\x03\x6c\x00\x00\x00\x00\x00\x01\x00\x01\x44\x86\
-\x00\x00\x03\x92\x00\x00\x00\x00\x00\x01\x00\x01\x46\x37\
-\x00\x00\x03\xb6\x00\x00\x00\x00\x00\x01\x00\x01\x48\x63\
-\x00\x00\x03\xd6\x00\x00\x00\x00\x00\x01\x00\x01\x48\xc3\
-\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x01\x5e\x0b\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x1b\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8b\xd9\x2a\x4c\xfd\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x19\xa9\
-\x00\x00\x01\x80\x2f\x7f\x6d\xd0\
-\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x1a\x93\
-\x00\x00\x01\x80\x2f\x7e\x25\xb0\
-\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x43\
-\x00\x00\x01\x8c\x2b\xd2\x0a\xc6\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x2f\
-\x00\x00\x01\x8c\x2b\xd0\xc2\xa0\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xc1\
-\x00\x00\x01\x8c\x37\xf4\xf9\x4c\
-\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x56\
-\x00\x00\x01\x80\x2f\x66\x38\xb0\
-\x00\x00\x01\x34\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x08\
-\x00\x00\x01\x80\x2f\x7f\x6d\xd0\
-\x00\x00\x01\x56\x00\x00\x00\x00\x00\x01\x00\x00\x8f\xf5\
-\x00\x00\x01\x8c\x3d\x0f\xd6\xd0\
-\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x91\xd2\
-\x00\x00\x01\x8c\x2b\xd3\x0e\x69\
-\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x00\x96\x56\
-\x00\x00\x01\x80\x2f\x66\x38\xb0\
-\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x97\x02\
-\x00\x00\x01\x80\x2f\x79\x5b\x20\
-\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x97\xbd\
-\x00\x00\x01\x8c\x3d\x0e\xfa\xfb\
-\x00\x00\x02\x10\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x50\
-\x00\x00\x01\x8b\xd8\xea\x88\x9f\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xa2\x2e\
-\x00\x00\x01\x80\x2f\x79\x5b\x20\
-\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\xa2\xe9\
-\x00\x00\x01\x8b\xd5\x01\xb9\x3b\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xc0\x35\
-\x00\x00\x01\x8b\xcf\x6a\x21\x00\
-\x00\x00\x02\xaa\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x08\
-\x00\x00\x01\x80\x2f\x6b\x80\x40\
-\x00\x00\x02\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x65\
-\x00\x00\x01\x80\x2f\x6d\x45\x60\
-\x00\x00\x02\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x8d\
-\x00\x00\x01\x8c\x37\xf5\xd8\x29\
-\x00\x00\x03\x1e\x00\x00\x00\x00\x00\x01\x00\x01\x42\x33\
-\x00\x00\x01\x80\x2f\x7e\x25\xb0\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x01\x42\xe0\
-\x00\x00\x01\x80\x2f\x79\xb1\x10\
-\x00\x00\x03\x6c\x00\x00\x00\x00\x00\x01\x00\x01\x44\x86\
-\x00\x00\x01\x80\x2f\x79\xb1\x10\
-\x00\x00\x03\x92\x00\x00\x00\x00\x00\x01\x00\x01\x46\x37\
-\x00\x00\x01\x80\x2f\x6d\x45\x60\
-\x00\x00\x03\xb6\x00\x00\x00\x00\x00\x01\x00\x01\x48\x63\
-\x00\x00\x01\x80\x2f\x6b\x80\x40\
-\x00\x00\x03\xd6\x00\x00\x00\x00\x00\x01\x00\x01\x48\xc3\
-\x00\x00\x01\x8b\xcf\x69\xd9\x14\
-\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x01\x5e\x0b\
-\x00\x00\x01\x8b\xd8\xea\xfc\x9b\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
+def registerResources(bundle):
+    return QResource.registerResource(resourcePath(bundle))
@@ -0,0 +1,138 @@
+import builtins, sys, os, time, json, threading
+from contextlib import contextmanager
+
+# Imported first by both executables so the import timer is in place before PyQt5 loads.
+# Tracing is off unless /startupTrace=<report.json> is passed, /headless also forces the offscreen platform
+# and /importBudget=<ms> makes the process exit with 1 when imports took longer than that.
+
+class capsWatcher_startupTrace:
+    def __init__(self, reportFile, application, importBudget=None, timeout=10000):
+        self.reportFile = reportFile
+        self.application = application
+        self.importBudget = importBudget
+        self.timeout = timeout
+        self.startedAt = time.perf_counter()
+        self.threadId = threading.get_ident()
+        self.imports = []
+        self.importStack = []
+        self.phases = []
+        self.phaseDepth = 0
+        self.milestones = {}
+        self.finished = False
+        self.originalImport = builtins.__import__
+        builtins.__import__ = self.timedImport
+
+    def elapsed(self, since=None):
+        return round((time.perf_counter() - (self.startedAt if since is None else since)) * 1000, 3)
+
+    def timedImport(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or threading.get_ident() != self.threadId : return self.originalImport(name, globals, locals, fromlist, level)
+        # 'from package import module' loads the submodule without a separate __import__ call, so it is timed here
+        if name not in sys.modules : modules = [name]
+        else : modules = [f"{name}.{item}" for item in fromlist or () if item != '*' and not hasattr(sys.modules[name], item)]
+        if not modules : return self.originalImport(name, globals, locals, fromlist, level)
+
+        importedAt = time.perf_counter()
+        self.importStack.append(0.0)
+        try:
+            return self.originalImport(name, globals, locals, fromlist, level)
+        finally:
+            wall = time.perf_counter() - importedAt
+            nestedWall = self.importStack.pop()
+            if self.importStack : self.importStack[-1] += wall
+            self.imports.append({"module": ", ".join(modules), "at": round((importedAt - self.startedAt) * 1000, 3), "wall": round(wall * 1000, 3), "self": round((wall - nestedWall) * 1000, 3), "depth": len(self.importStack)})
+
+    @contextmanager
+    def phase(self, name):
+        startedAt, cpuStartedAt = time.perf_counter(), time.thread_time()
+        self.phaseDepth += 1
+        try:
+            yield
+        finally:
+            self.phaseDepth -= 1
+            self.phases.append({"phase": name, "at": round((startedAt - self.startedAt) * 1000, 3), "wall": self.elapsed(startedAt), "cpu": round((time.thread_time() - cpuStartedAt) * 1000, 3), "depth": self.phaseDepth})
+
+    def instrument(self, target, names):
+        # every method is timed on its first call only, then the original lookup is restored
+        for name in names:
+            original, method = target.__dict__.get(name), getattr(target, name)
+            def timedMethod(*args, name=name, original=original, method=method, **kwargs):
+                if original is None : delattr(target, name)
+                else : setattr(target, name, original)
+                with self.phase(name):
+                    return method(*args, **kwargs)
+            setattr(target, name, timedMethod)
+
+    def mark(self, milestone):
+        self.milestones.setdefault(milestone, self.elapsed())
+
+    def watch(self, window):
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+
+        trace = self
+        class capsWatcher_firstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint and 'firstPaint' not in trace.milestones:
+                    trace.mark('firstPaint')
+                    QTimer.singleShot(0, trace.finish)
+                return False
+
+        self.paintFilter = capsWatcher_firstPaintFilter()
+        window.installEventFilter(self.paintFilter)
+        QTimer.singleShot(self.timeout, self.finish)
+
+    def finish(self):
+        from PyQt5.QtWidgets import QApplication
+
+        if self.finished : return
+        self.finished = True
+        builtins.__import__ = self.originalImport
+        self.mark('finished')
+
+        topLevelImports = [entry for entry in self.imports if entry['depth'] == 0]
+        report = {
+            "application": self.application,
+            "platform": QApplication.platformName(),
+            "python": sys.version.split()[0],
+            "summary": {
+                "imports": round(sum(entry['wall'] for entry in topLevelImports), 3),
+                "phases": round(sum(entry['wall'] for entry in self.phases if entry['depth'] == 0), 3),
+                "timeToTray": self.milestones.get('trayIcon'),
+                "timeToFirstPaint": self.milestones.get('firstPaint'),
+                "processCpu": round(time.process_time() * 1000, 3),
+                "importBudget": self.importBudget
+            },
+            "milestones": self.milestones,
+            "phases": sorted(self.phases, key=lambda entry: entry['at']),
+            "imports": sorted(self.imports, key=lambda entry: entry['self'], reverse=True)
+        }
+
+        tempFilePath = f"{self.reportFile}.tmp"
+        with open(tempFilePath, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+        os.replace(tempFilePath, self.reportFile)
+        print(json.dumps({"application": self.application} | report['summary']))
+        if self.importBudget is not None and report['summary']['imports'] > self.importBudget:
+            print(f"Imports took {report['summary']['imports']} ms, over the budget of {self.importBudget} ms.")
+            QApplication.instance().exit(1)
+        else : QApplication.instance().quit()
+
+class capsWatcher_lazyModule:
+    # stands in for a module that only rare actions need, the real import happens on first attribute access
+    def __init__(self, name):
+        self.name = name
+        self.module = None
+
+    def __getattr__(self, attribute):
+        if self.module is None:
+            __import__(self.name)
+            self.module = sys.modules[self.name]
+        return getattr(self.module, attribute)
+
+def traceFromArguments(arguments):
+    options = dict(argument[1:].split('=', 1) for argument in arguments if argument.startswith('/') and '=' in argument)
+    if 'startupTrace' not in options : return None
+    if '/headless' in arguments : os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    return capsWatcher_startupTrace(options['startupTrace'], os.path.splitext(os.path.basename(sys.argv[0]))[0], float(options['importBudget']) if 'importBudget' in options else None)
+
+startupTrace = traceFromArguments(sys.argv[1:])
@@ -0,0 +1,161 @@
+from PyQt5.QtGui import QImage
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from concurrent.futures import ProcessPoolExecutor
+from capsWatcherThemes import capsWatcher_themeBundle, themeSchemes, loadManifest, readThemeFile, supportedKeys, validateBundle
+import sys, os, json, time, zipfile
+
+lintLimits = {'maxEdge': 256, 'maxFileSize': 64 * 1024}
+
+def findThemes(paths):
+    themes = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if path.endswith('.zip') or os.path.exists(os.path.join(path, f"{os.path.basename(path)}.json")):
+            themes.append(path)
+        elif os.path.isdir(path):
+            themes.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.zip') or os.path.exists(os.path.join(path, name, f"{name}.json")))
+    return themes
+
+def themeLabels(themes):
+    # two sources can hold a theme of the same name, each one gets its own report and output name
+    labels = []
+    for path in themes:
+        name = label = os.path.splitext(os.path.basename(path))[0]
+        copy = 1
+        while label in labels:
+            copy += 1
+            label = f"{name}-{copy}"
+        labels.append(label)
+    return labels
+
+def inspectImage(data):
+    image = QImage.fromData(data)
+    if image.isNull() : return None
+    alpha = image.convertToFormat(QImage.Format_Alpha8)
+    alphaBytes = alpha.constBits().asstring(alpha.sizeInBytes())
+    opaque, transparent = alphaBytes.count(b'\xff'), alphaBytes.count(b'\x00')
+    if opaque == len(alphaBytes) : alphaUsage = 'none'
+    elif opaque + transparent == len(alphaBytes) : alphaUsage = 'binary'
+    else : alphaUsage = 'translucent'
+    return image, {'width': image.width(), 'height': image.height(), 'fileSize': len(data), 'hasAlphaChannel': image.hasAlphaChannel(), 'alphaUsage': alphaUsage}
+
+def encodeImage(image):
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, 'PNG', 0)
+    return bytes(encoded)
+
+def lintTheme(path, optimize=False, outputPath=None):
+    startedAt = time.perf_counter()
+    report = {'source': path, 'theme': None, 'errors': [], 'warnings': [], 'images': {}, 'optimized': {}}
+    source = path
+    try:
+        if path.endswith('.zip'):
+            with capsWatcher_themeBundle(path) as bundle : report['theme'] = validateBundle(bundle)
+            if f"{report['theme']}.zip" != os.path.basename(path) : raise ValueError(f"The bundle holds the theme '{report['theme']}' and must be named '{report['theme']}.zip'.")
+        else:
+            report['theme'] = os.path.basename(path)
+            source = os.path.join(path, f"{report['theme']}.json")
+        manifest = loadManifest(source)
+    except (ValueError, KeyError, TypeError, OSError, zipfile.BadZipFile) as error:
+        report['errors'].append(f"Invalid theme: {error}")
+        report['elapsed'] = round(time.perf_counter() - startedAt, 3)
+        return report
+
+    if manifest.theme != report['theme'] : report['errors'].append(f"Manifest names the theme '{manifest.theme}' but it is installed as '{report['theme']}'.")
+    if not any(getattr(manifest, scheme).isSupported for scheme in themeSchemes) : report['errors'].append("Neither dark nor light mode is supported.")
+
+    replacements, sizes = {}, set()
+    for scheme in themeSchemes:
+        schemeData = getattr(manifest, scheme)
+        if not schemeData.isSupported : continue
+        if not supportedKeys(schemeData) : report['errors'].append(f"{scheme} is supported but no key is.")
+        for keyCode in supportedKeys(schemeData):
+            for state in [0, 1]:
+                imageName = f"{scheme}/{keyCode}{state}.png"
+                imagePath = os.path.join(schemeData.overlayPath, f"{keyCode}{state}.png")
+                try : data = readThemeFile(imagePath)
+                except (OSError, KeyError):
+                    report['errors'].append(f"{imageName} is missing.")
+                    continue
+                inspected = inspectImage(data)
+                if inspected is None:
+                    report['errors'].append(f"{imageName} is not a readable image.")
+                    continue
+                image, details = inspected
+                report['images'][imageName] = details
+                sizes.add((details['width'], details['height']))
+                if max(details['width'], details['height']) > lintLimits['maxEdge'] : report['warnings'].append(f"{imageName} is {details['width']}x{details['height']}, larger than {lintLimits['maxEdge']}px.")
+                if not details['hasAlphaChannel'] : report['warnings'].append(f"{imageName} has no alpha channel, the overlay will show a solid box.")
+                if details['fileSize'] > lintLimits['maxFileSize'] : report['warnings'].append(f"{imageName} is {details['fileSize']} bytes, larger than {lintLimits['maxFileSize']} bytes.")
+                if optimize:
+                    optimized = encodeImage(image)
+                    if len(optimized) < len(data):
+                        replacements[imagePath] = optimized
+                        report['optimized'][imageName] = {'before': len(data), 'after': len(optimized)}
+    if len(sizes) > 1 : report['warnings'].append(f"Overlay images have mixed sizes {sorted(sizes)}.")
+
+    if replacements and outputPath is not None and not report['errors'] : writeOptimizedTheme(path, report['theme'], replacements, outputPath)
+    report['elapsed'] = round(time.perf_counter() - startedAt, 3)
+    return report
+
+def writeOptimizedTheme(path, theme, replacements, outputPath):
+    # optimized themes are always written as a bundle, ready to be installed
+    replacements = {imagePath.replace(os.sep, '/'): data for imagePath, data in replacements.items()}
+    os.makedirs(outputPath, exist_ok=True)
+    tempFilePath = os.path.join(outputPath, f"{theme}.zip.tmp")
+    with zipfile.ZipFile(tempFilePath, 'w', zipfile.ZIP_DEFLATED) as optimizedBundle:
+        if path.endswith('.zip'):
+            with capsWatcher_themeBundle(path) as bundle:
+                for name in bundle.entries:
+                    optimizedBundle.writestr(name, replacements.get(f"{path}/{name}".replace(os.sep, '/'), b'' if name.endswith('/') else bundle.read(name)))
+        else:
+            for folder, subFolders, files in os.walk(path):
+                for fileName in files:
+                    filePath = os.path.join(folder, fileName)
+                    name = f"{theme}/{os.path.relpath(filePath, path).replace(os.sep, '/')}"
+                    optimizedData = replacements.get(filePath.replace(os.sep, '/'))
+                    if optimizedData is not None : optimizedBundle.writestr(name, optimizedData)
+                    else : optimizedBundle.write(filePath, name)
+    os.replace(tempFilePath, os.path.join(outputPath, f"{theme}.zip"))
+
+def parseArguments(arguments):
+    isOption = lambda argument: argument.startswith('/') and not os.path.exists(argument)
+    options = dict(argument[1:].split('=', 1) if '=' in argument else (argument[1:], '1') for argument in arguments if isOption(argument))
+    paths = [argument for argument in arguments if not isOption(argument)]
+    return paths, options
+
+def main(arguments):
+    paths, options = parseArguments(arguments)
+    if not paths or 'help' in options:
+        print("usage: capsWatcherThemeLint [/optimize] [/output=folder] [/report=folder] [/jobs=N] <theme.zip | theme folder | themes folder> ...")
+        return 2
+    themes = findThemes(paths)
+    labels = themeLabels(themes)
+    optimize = 'optimize' in options
+    outputPath = options.get('output', 'optimized') if optimize else None
+    reportPath = options.get('report')
+    for folder in [outputPath, reportPath]:
+        if folder is not None : os.makedirs(folder, exist_ok=True)
+
+    startedAt, failed = time.perf_counter(), 0
+    # a renamed duplicate keeps its installable <theme>.zip name inside a folder of its own
+    outputPaths = []
+    for path, label in zip(themes, labels):
+        if outputPath is None or label == os.path.splitext(os.path.basename(path))[0] : outputPaths.append(outputPath)
+        else : outputPaths.append(os.path.join(outputPath, label))
+    with ProcessPoolExecutor(max_workers=int(options['jobs']) if 'jobs' in options else None) as executor:
+        for name, report in zip(labels, executor.map(lintTheme, themes, [optimize] * len(themes), outputPaths, chunksize=max(1, len(themes) // 64))):
+            status = 'FAIL' if report['errors'] else 'WARN' if report['warnings'] else 'OK'
+            failed += bool(report['errors'])
+            print(f"{status:4} {name}")
+            for message in report['errors'] + report['warnings'] : print(f"     {message}")
+            if reportPath is not None:
+                with open(os.path.join(reportPath, f"{name}.json"), 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=4)
+    print(f"{len(themes)} themes checked in {time.perf_counter() - startedAt:.2f}s, {failed} failed.")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
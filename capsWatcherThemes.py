@@ -0,0 +1,208 @@
+from collections import namedtuple
+import os, json, mmap, zipfile, zlib
+
+themeSchemes = ('darkMode', 'lightMode')
+bundleBudget = {'entries': 256, 'uncompressedSize': 16 * 1024 * 1024, 'compressionRatio': 200}
+themeKeySupport = ((144, 'numLockSupport'), (20, 'capsLockSupport'), (145, 'scrollLockSupport'))
+
+themeScheme = namedtuple('themeScheme', ['isSupported', 'numLockSupport', 'capsLockSupport', 'scrollLockSupport', 'overlayPath'])
+themeManifest = namedtuple('themeManifest', ['theme', 'name', 'creator', 'description', 'githubUser', 'creationDate', 'darkMode', 'lightMode'])
+
+def parseManifest(data:dict, themeFolder):
+    schemes = {}
+    for scheme in themeSchemes:
+        schemeData = data[scheme]
+        schemes[scheme] = themeScheme(bool(schemeData['isSupported']), bool(schemeData['numLockSupport']), bool(schemeData['capsLockSupport']), bool(schemeData['scrollLockSupport']), os.path.join(themeFolder, schemeData['overlayPath']))
+    return themeManifest(data['theme'], data['name'], data.get('creator', ''), data.get('description', ''), data.get('github_user', ''), data.get('creation_date', ''), schemes['darkMode'], schemes['lightMode'])
+
+def supportedKeys(scheme:themeScheme):
+    return [keyCode for keyCode, support in themeKeySupport if getattr(scheme, support)]
+
+def manifestToIndex(manifest:themeManifest):
+    return manifest._asdict() | {scheme: getattr(manifest, scheme)._asdict() for scheme in themeSchemes}
+
+def manifestFromIndex(data:dict):
+    return themeManifest(**(data | {scheme: themeScheme(**data[scheme]) for scheme in themeSchemes}))
+
+def themeSource(themesPath, theme):
+    # an installed bundle takes precedence over an extracted folder of the same theme
+    bundlePath = os.path.join(themesPath, f"{theme}.zip")
+    return bundlePath if os.path.exists(bundlePath) else os.path.join(themesPath, theme, f"{theme}.json")
+
+def loadManifest(themeSource):
+    if themeSource.endswith('.zip'):
+        theme = os.path.splitext(os.path.basename(themeSource))[0]
+        return parseManifest(json.loads(openBundle(themeSource).read(f"{theme}/{theme}.json")), os.path.join(themeSource, theme))
+    with open(themeSource, encoding='utf-8') as f:
+        return parseManifest(json.load(f), os.path.dirname(themeSource))
+
+def readThemeFile(path):
+    # files of a bundled theme are addressed as <themes>/<theme>.zip/<theme>/<member>
+    bundlePath, separator, member = path.partition(f".zip{os.sep}")
+    if separator : return openBundle(f"{bundlePath}.zip").read(member.replace(os.sep, '/'))
+    with open(path, 'rb') as f:
+        return f.read()
+
+bundleCache = {}
+
+def openBundle(bundlePath):
+    bundleStat = os.stat(bundlePath)
+    stamp = (bundleStat.st_mtime_ns, bundleStat.st_size)
+    bundle = bundleCache.get(bundlePath)
+    if bundle is not None and bundle.stamp == stamp : return bundle
+    if bundle is not None : bundle.close()
+    bundle = bundleCache[bundlePath] = capsWatcher_themeBundle(bundlePath, stamp)
+    return bundle
+
+def releaseBundles():
+    # a mapped bundle cannot be replaced on Windows, so callers drop their maps once they are done reading
+    for bundle in bundleCache.values() : bundle.close()
+    bundleCache.clear()
+
+class capsWatcher_themeMapping(mmap.mmap):
+    # zipfile asks its file object for seekable(), which mmap only provides from Python 3.13 on
+    def seekable(self):
+        return True
+
+class capsWatcher_themeBundle:
+    def __init__(self, bundlePath, stamp=None):
+        self.bundlePath = bundlePath
+        self.stamp = stamp
+        with open(bundlePath, 'rb') as f:
+            try : self.mapping = capsWatcher_themeMapping(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError : raise ValueError(f"'{bundlePath}' is not a valid theme bundle.")
+        try:
+            self.archive = zipfile.ZipFile(self.mapping)
+        except (zipfile.BadZipFile, ValueError):
+            self.mapping.close()
+            raise ValueError(f"'{bundlePath}' is not a valid theme bundle.")
+        self.entries = {info.filename: info for info in self.archive.infolist()}
+
+    def themeName(self):
+        for name in self.entries:
+            folder, separator, fileName = name.partition('/')
+            if separator and fileName == f"{folder}.json" : return folder
+        raise ValueError(f"'{self.bundlePath}' does not contain a theme manifest.")
+
+    def read(self, member):
+        if member not in self.entries : raise KeyError(member)
+        return self.archive.read(self.entries[member])
+
+    def close(self):
+        self.archive.close()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def validateBundle(bundle, progress=None):
+    theme = bundle.themeName()
+    infos = list(bundle.entries.values())
+    if len(infos) > bundleBudget['entries'] : raise ValueError(f"The theme has {len(infos)} entries, the limit is {bundleBudget['entries']}.")
+
+    declaredSize = 0
+    for info in infos:
+        parts = info.filename.split('/')
+        if parts[0] != theme or '\\' in info.filename or ':' in info.filename or '..' in parts : raise ValueError(f"Entry '{info.filename}' is outside the theme folder.")
+        if info.file_size > bundleBudget['compressionRatio'] * max(info.compress_size, 1) : raise ValueError(f"Entry '{info.filename}' has a suspicious compression ratio.")
+        declaredSize += info.file_size
+    if declaredSize > bundleBudget['uncompressedSize'] : raise ValueError(f"The theme unpacks to {declaredSize} bytes, the limit is {bundleBudget['uncompressedSize']}.")
+
+    manifest = parseManifest(json.loads(bundle.read(f"{theme}/{theme}.json")), theme)
+    for scheme in themeSchemes:
+        schemeData = getattr(manifest, scheme)
+        if not schemeData.isSupported : continue
+        for keyCode in supportedKeys(schemeData):
+            for state in [0, 1]:
+                if f"{schemeData.overlayPath}/{keyCode}{state}.png".replace(os.sep, '/') not in bundle.entries : raise ValueError(f"Overlay '{keyCode}{state}.png' of {scheme} is missing.")
+
+    # headers can lie about sizes, so every entry is streamed and the budget is enforced on real bytes
+    readSize = 0
+    for index, info in enumerate(infos):
+        with bundle.archive.open(info) as entry:
+            while chunk := entry.read(65536):
+                readSize += len(chunk)
+                if readSize > bundleBudget['uncompressedSize'] : raise ValueError(f"The theme unpacks to more than {bundleBudget['uncompressedSize']} bytes.")
+        if progress is not None : progress(index + 1, len(infos))
+    return theme
+
+class capsWatcher_themeCatalog:
+    indexVersion = 1
+
+    def __init__(self, themesPath, indexFilePath):
+        self.themesPath = themesPath
+        self.indexFilePath = indexFilePath
+        self.entries = self.loadIndex()
+
+    def loadIndex(self):
+        try:
+            with open(self.indexFilePath, encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != self.indexVersion or index.get('themesPath') != self.themesPath : return {}
+            return {folder: (tuple(entry['stamp']), manifestFromIndex(entry['manifest']) if entry['manifest'] is not None else None) for folder, entry in index['themes'].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def saveIndex(self):
+        index = {'version': self.indexVersion, 'themesPath': self.themesPath, 'themes': {folder: {'stamp': stamp, 'manifest': manifestToIndex(manifest) if manifest is not None else None} for folder, (stamp, manifest) in self.entries.items()}}
+        tempFilePath = f"{self.indexFilePath}.tmp"
+        try:
+            with open(tempFilePath, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(tempFilePath, self.indexFilePath)
+        except OSError : pass
+
+    def themeStamp(self, entry:os.DirEntry, themeFile):
+        # the folder stamp catches added or removed files, the manifest stamp catches in-place edits
+        folderStat, fileStat = entry.stat(), os.stat(themeFile)
+        return (folderStat.st_mtime_ns, entry.inode(), fileStat.st_mtime_ns, fileStat.st_size)
+
+    def themes(self):
+        entries, changed = {}, False
+        with os.scandir(self.themesPath) as folders:
+            for entry in sorted(folders, key=lambda entry: entry.is_dir()):
+                if entry.is_dir():
+                    theme, themeFile = entry.name, os.path.join(entry.path, f"{entry.name}.json")
+                    if theme in entries : continue
+                elif entry.name.endswith('.zip') : theme, themeFile = entry.name[:-4], entry.path
+                else : continue
+                try : stamp = self.themeStamp(entry, themeFile)
+                except OSError : continue
+                cached = self.entries.get(theme)
+                if cached is not None and cached[0] == stamp:
+                    entries[theme] = cached
+                    continue
+                # a broken theme is indexed without a manifest so it is not parsed again, a read error is left for the next scan
+                try : manifest = loadManifest(themeFile)
+                except (ValueError, KeyError, TypeError, zipfile.BadZipFile, zlib.error) : manifest = None
+                except OSError : continue
+                entries[theme] = (stamp, manifest)
+                changed = True
+        # the interface stays open for a long time, so bundles read for the index are not kept mapped
+        releaseBundles()
+        if changed or entries.keys() != self.entries.keys():
+            self.entries = entries
+            self.saveIndex()
+        return [manifest for stamp, manifest in entries.values() if manifest is not None]
+
+class capsWatcher_themeRepository:
+    def __init__(self, catalog:capsWatcher_themeCatalog):
+        self.catalog = catalog
+        self.manifests = {}
+
+    def get(self, theme):
+        themeFile = themeSource(self.catalog.themesPath, theme)
+        fileStat = os.stat(themeFile)
+        stamp = (fileStat.st_mtime_ns, fileStat.st_size)
+        cached = self.manifests.get(theme)
+        if cached is None and theme in self.catalog.entries:
+            catalogStamp, manifest = self.catalog.entries[theme]
+            cached = (catalogStamp[2:], manifest)
+        if cached is not None and cached[0] == stamp and cached[1] is not None : return cached[1]
+        manifest = loadManifest(themeFile)
+        releaseBundles()
+        self.manifests[theme] = (stamp, manifest)
+        return manifest
@@ -0,0 +1,77 @@
+from xml.etree import ElementTree
+import sys, os, struct
+
+# Writes Qt binary resource bundles (.rcc, format version 1) straight from the .qrc files,
+# so building them needs nothing beyond Python and the Qt runtime that loads them.
+
+bundles = {'capsWatcher.rcc': 'res.qrc', 'capsWatcherOverlay.rcc': 'overlay.qrc'}
+directoryFlag = 0x02
+localeLanguage, localeCountry = 1, 0
+
+def qtHash(name):
+    nameHash = 0
+    encodedName = name.encode('utf-16-be')
+    for codeUnit in struct.unpack(f'>{len(encodedName) // 2}H', encodedName):
+        nameHash = (nameHash << 4) + codeUnit
+        nameHash ^= (nameHash & 0xf0000000) >> 23
+        nameHash &= 0x0fffffff
+    return nameHash
+
+def readQrc(qrcFile):
+    tree, qrcFolder = {}, os.path.dirname(os.path.abspath(qrcFile))
+    for resource in ElementTree.parse(qrcFile).getroot().iter('qresource'):
+        node = tree
+        for part in [part for part in resource.get('prefix', '/').split('/') if part]:
+            node = node.setdefault(part, {})
+        for file in resource.iter('file'):
+            parts = (file.get('alias') or file.text).split('/')
+            fileNode = node
+            for part in parts[:-1]:
+                fileNode = fileNode.setdefault(part, {})
+            fileNode[parts[-1]] = os.path.join(qrcFolder, file.text)
+    return tree
+
+def writeBundle(tree, bundleFile):
+    data, names, nameOffsets = bytearray(), bytearray(), {}
+
+    def nameOffset(name):
+        if name not in nameOffsets:
+            nameOffsets[name] = len(names)
+            names.extend(struct.pack('>HI', len(name), qtHash(name)) + name.encode('utf-16-be'))
+        return nameOffsets[name]
+
+    # nodes are laid out breadth first, every directory's children contiguous and sorted by name hash
+    nodes, queue = [None], [(0, '', tree)]
+    while queue:
+        index, name, node = queue.pop(0)
+        children = sorted(node.items(), key=lambda item: qtHash(item[0]))
+        firstChild = len(nodes)
+        nodes[index] = struct.pack('>IHII', nameOffset(name) if name else 0, directoryFlag, len(children), firstChild)
+        nodes.extend([None] * len(children))
+        for childIndex, (childName, child) in enumerate(children, firstChild):
+            if isinstance(child, dict):
+                queue.append((childIndex, childName, child))
+                continue
+            with open(child, 'rb') as f:
+                content = f.read()
+            nodes[childIndex] = struct.pack('>IHHHI', nameOffset(childName), 0, localeCountry, localeLanguage, len(data))
+            data.extend(struct.pack('>I', len(content)) + content)
+
+    header = struct.Struct('>4sIIII')
+    dataOffset = header.size
+    namesOffset = dataOffset + len(data)
+    treeOffset = namesOffset + len(names)
+    tempFilePath = f"{bundleFile}.tmp"
+    with open(tempFilePath, 'wb') as f:
+        f.write(header.pack(b'qres', 1, treeOffset, dataOffset, namesOffset))
+        f.write(data)
+        f.write(names)
+        f.write(b''.join(nodes))
+    os.replace(tempFilePath, bundleFile)
+
+if __name__ == '__main__':
+    resourcesPath = os.path.dirname(os.path.abspath(__file__))
+    for bundleFile, qrcFile in bundles.items():
+        writeBundle(readQrc(os.path.join(resourcesPath, qrcFile)), os.path.join(resourcesPath, bundleFile))
+        print(f"{bundleFile}: {os.path.getsize(os.path.join(resourcesPath, bundleFile))} bytes")
+    sys.exit(0)
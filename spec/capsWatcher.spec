@@ -2,7 +2,7 @@ a = Analysis(
     ['..\\capsWatcher.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('..\\resources\\capsWatcherOverlay.rcc', 'resources')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -2,8 +2,8 @@ a = Analysis(
     ['..\\capsWatcherInterface.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=[],
+    datas=[('..\\resources\\capsWatcher.rcc', 'resources')],
+    hiddenimports=['requests', 'webbrowser', 'pywinstyles', 'psutil'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,114 @@
+from unittest import mock
+import unittest, threading, statistics, types, ctypes, json, time, os
+
+# the channel name carries the Windows session id
+windowsSession = hasattr(ctypes, 'windll')
+testApplication = 'capsWatcherTests'
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+@unittest.skipUnless(windowsSession, "the channel name needs the Windows session id")
+class capsWatcher_commandChannelTests(unittest.TestCase):
+    rounds = 100
+
+    def setUp(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        from capsWatcherChannel import capsWatcher_commandServer
+        self.application = QApplication.instance() or QApplication([])
+        self.reloads = 0
+        self.commandServer = capsWatcher_commandServer({
+            'ping': lambda: ("pong", None),
+            'status': lambda: (json.dumps({"pid": os.getpid()}), None),
+            'reload': self.handleReloadCommand
+        }, testApplication)
+        if not self.commandServer.listen() : self.skipTest(f"the {testApplication} channel is already in use")
+
+    def tearDown(self):
+        self.commandServer.server.close()
+
+    def handleReloadCommand(self):
+        self.reloads += 1
+        return "ok", None
+
+    def sendCommands(self, commands):
+        # sendCommand blocks, so it runs on its own thread while this one serves the channel
+        from capsWatcherChannel import sendCommand
+        results = []
+        def client():
+            for command in commands:
+                startedAt = time.perf_counter()
+                reply = sendCommand(command, testApplication)
+                results.append((command, reply, (time.perf_counter() - startedAt) * 1000))
+        clientThread = threading.Thread(target=client)
+        clientThread.start()
+        while clientThread.is_alive() : self.application.processEvents()
+        clientThread.join()
+        return results
+
+    def testRoundTrips(self):
+        results, summary = self.sendCommands(['ping', 'status', 'reload'] * self.rounds), []
+        for command, expected in [('ping', lambda reply: reply == "pong"), ('status', lambda reply: json.loads(reply)['pid'] == os.getpid()), ('reload', lambda reply: reply == "ok")]:
+            timings = [elapsed for sent, reply, elapsed in results if sent == command]
+            summary.append(f"{command} p50 {percentile(timings, 0.5):.3f} ms p95 {percentile(timings, 0.95):.3f} ms")
+            with self.subTest(command=command):
+                self.assertTrue(all(expected(reply) for sent, reply, elapsed in results if sent == command))
+                # the sentinel files this channel replaced were polled once a second
+                self.assertLess(percentile(timings, 0.95), 50)
+        print(f"\nround trips: {', '.join(summary)}")
+        self.assertEqual(self.reloads, self.rounds)
+
+    def testUnknownCommand(self):
+        self.assertEqual(self.sendCommands(['restart'])[0][1], "error unknown command")
+
+def syntheticProcessTable(size):
+    return [types.SimpleNamespace(info={'name': 'capsWatcher.exe' if index == size // 2 else f"process{index}.exe"}) for index in range(size)]
+
+def scanProcessTable(processTable):
+    # what checkForExistingProcess did before the lock: walk every process looking for another capsWatcher.exe
+    return sum('capsWatcher.exe' in process.info['name'] for process in processTable) > 1
+
+@unittest.skipUnless(windowsSession, "the lock name needs the Windows session id")
+class capsWatcher_instanceLockTests(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        self.application = QApplication.instance() or QApplication([])
+
+    def timeAcquire(self, processTable):
+        from capsWatcherChannel import acquireInstanceLock
+        timings = []
+        # psutil is swapped for the synthetic table, a lock that still walked the processes would slow down with it
+        with mock.patch.dict('sys.modules', {'psutil': types.SimpleNamespace(process_iter=mock.Mock(return_value=processTable))}) as modules:
+            for _ in range(50):
+                startedAt = time.perf_counter()
+                instanceLock = acquireInstanceLock(testApplication)
+                timings.append((time.perf_counter() - startedAt) * 1000)
+                instanceLock.unlock()
+            self.assertFalse(modules['psutil'].process_iter.called)
+        return statistics.median(timings)
+
+    def testAcquireIgnoresProcessCount(self):
+        smallTable, largeTable = syntheticProcessTable(100), syntheticProcessTable(20000)
+        timings = {}
+        for size, processTable in [(100, smallTable), (20000, largeTable)]:
+            startedAt = time.perf_counter()
+            scanProcessTable(processTable)
+            timings[size] = ((time.perf_counter() - startedAt) * 1000, self.timeAcquire(processTable))
+        print(f"\nprocess scan: {timings[100][0]:.3f} ms for 100, {timings[20000][0]:.3f} ms for 20000; lock: {timings[100][1]:.3f} ms, {timings[20000][1]:.3f} ms")
+        self.assertLess(timings[20000][1], timings[100][1] * 3 + 0.5)
+
+    def testSecondAcquireFails(self):
+        from capsWatcherChannel import acquireInstanceLock
+        instanceLock = acquireInstanceLock(testApplication)
+        self.assertIsNotNone(instanceLock)
+        try : self.assertIsNone(acquireInstanceLock(testApplication))
+        finally : instanceLock.unlock()
+        secondLock = acquireInstanceLock(testApplication)
+        self.assertIsNotNone(secondLock)
+        secondLock.unlock()
+
+if __name__ == '__main__':
+    unittest.main()
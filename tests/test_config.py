@@ -0,0 +1,92 @@
+from capsWatcherConfig import defaultConfig, loadSettings, writeConfig, settingsCache
+import unittest, tempfile, json, time, os
+
+validationCases = (
+    ({}, None),
+    ({'displayTime': '500'}, None),
+    ({'displayTime': '2001'}, "Display Time"),
+    ({'opacity': '9'}, "Opacity"),
+    ({'fadeEffectTime': '600'}, "Fade Time"),
+    ({'positionOnScreen': '6'}, "Position on screen"),
+    ({'theme': 'missing'}, "The theme file 'missing.json'"),
+    ({'theme': ''}, "The theme file '.json'"),
+    ({'colorScheme': '3'}, "Color scheme"),
+    ({'keysToWatch': '20,21'}, "Invalid key [20, 21]"),
+    ({'keyStateBackend': '2'}, "Key state backend"),
+    ({'pollMinInterval': '200', 'pollMaxInterval': '100'}, "Poll intervals"),
+    ({'pollBackoff': '99'}, "Poll backoff"),
+    ({'pollFastWindow': '10001'}, "Poll fast window"),
+    ({'language': 'xx-XX'}, "The language file 'xx-XX.json'"),
+)
+
+class capsWatcher_settingsTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.themesPath = os.path.join(self.folder.name, 'themes')
+        self.languagesPath = os.path.join(self.folder.name, 'languages')
+        self.configFilePath = os.path.join(self.folder.name, 'capsWatcher.cfg')
+        os.makedirs(os.path.join(self.themesPath, 'elegant'))
+        os.makedirs(self.languagesPath)
+        for path in [os.path.join(self.themesPath, 'elegant', 'elegant.json'), os.path.join(self.languagesPath, 'en-US.json')]:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({}, f)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def writeSettings(self, overrides:dict):
+        configParser = defaultConfig()
+        for key, value in overrides.items():
+            section = 'settings' if key in ('runAtStartup', 'trayIcon', 'language', 'checkForUpdates', 'diagnostics') else 'overlay'
+            configParser.set(section, key, value)
+        writeConfig(self.configFilePath, configParser)
+        return loadSettings(self.configFilePath)
+
+    def testValidationTable(self):
+        for overrides, expectedError in validationCases:
+            with self.subTest(overrides=overrides):
+                error = self.writeSettings(overrides).validate(self.themesPath, self.languagesPath)
+                if expectedError is None : self.assertIsNone(error)
+                else : self.assertIn(expectedError, error)
+
+    def testOverlayAndInterfaceAgree(self):
+        # the overlay validates without the languages folder, every other rule must give the same answer
+        for overrides, expectedError in validationCases:
+            if 'language' in overrides : continue
+            with self.subTest(overrides=overrides):
+                settings = self.writeSettings(overrides)
+                self.assertEqual(settings.validate(self.themesPath), settings.validate(self.themesPath, self.languagesPath))
+
+    def testUnconvertibleValue(self):
+        for overrides in [{'opacity': 'high'}, {'keysToWatch': '20,,144'}, {'trayIcon': 'yes'}]:
+            with self.subTest(overrides=overrides):
+                with self.assertRaises(ValueError):
+                    self.writeSettings(overrides)
+
+    def testCacheFollowsRewrites(self):
+        settings = self.writeSettings({'opacity': '95'})
+        self.assertIs(loadSettings(self.configFilePath), settings)
+
+        rewrittenSettings = self.writeSettings({'opacity': '100'})
+        self.assertIsNot(rewrittenSettings, settings)
+        self.assertEqual(rewrittenSettings.opacity, 100)
+        self.assertEqual(rewrittenSettings.diff(settings), {'opacity'})
+
+    def testParseAndValidateCost(self):
+        self.writeSettings({})
+        rounds = 200
+        startedAt = time.perf_counter()
+        for _ in range(rounds):
+            settingsCache.clear()
+            loadSettings(self.configFilePath).validate(self.themesPath, self.languagesPath)
+        coldCost = (time.perf_counter() - startedAt) / rounds
+        startedAt = time.perf_counter()
+        for _ in range(rounds) : loadSettings(self.configFilePath).validate(self.themesPath, self.languagesPath)
+        cachedCost = (time.perf_counter() - startedAt) / rounds
+        print(f"\nparse+validate: cold {coldCost * 1e6:.0f} us, cached {cachedCost * 1e6:.0f} us")
+        # a loose ceiling, it only catches an order of magnitude regression
+        self.assertLess(coldCost, 0.005)
+        self.assertLess(cachedCost, coldCost)
+
+if __name__ == '__main__':
+    unittest.main()
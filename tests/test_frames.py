@@ -0,0 +1,98 @@
+from importlib.util import find_spec
+import unittest, statistics, tempfile, types, time, os
+
+repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+windowsModules = all(find_spec(module) is not None for module in ('win32api', 'winreg'))
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+@unittest.skipUnless(windowsModules, "capsWatcher needs pywin32 to import")
+class capsWatcher_overlayFrameTests(unittest.TestCase):
+    rounds = 300
+
+    def setUp(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        self.application = QApplication.instance() or QApplication([])
+        if not isinstance(self.application, QApplication) : self.skipTest("another test started a non-GUI application")
+        self.folder = tempfile.TemporaryDirectory()
+        self.overlayPath = os.path.join(repositoryPath, 'themes', 'elegant', 'dark')
+        self.keys = [(keyCode, state) for keyCode in [20, 144, 145] for state in [False, True]]
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def timeShows(self, showFrame):
+        from PyQt5.QtWidgets import QLabel
+        label, timings = QLabel(), []
+        for index in range(self.rounds):
+            key = self.keys[index % len(self.keys)]
+            startedAt = time.perf_counter()
+            showFrame(label, key)
+            # the opacity effect only costs anything when the label paints, so every show is rendered
+            label.grab()
+            timings.append((time.perf_counter() - startedAt) * 1000)
+        return timings
+
+    def testCachedFramesShowFaster(self):
+        from PyQt5.QtWidgets import QGraphicsOpacityEffect
+        from PyQt5.QtGui import QPixmap
+        from capsWatcher import capsWatcher_Overlay, capsWatcher_pixelCache
+        overlayFile = lambda key: os.path.join(self.overlayPath, f'{key[0]}{int(key[1])}.png')
+
+        # what overlayShow did before the frames were baked: load the PNG by name and let an opacity effect blend it on paint
+        opacityEffect = QGraphicsOpacityEffect()
+        opacityEffect.setOpacity(0.8)
+        def showUncached(label, key):
+            label.setPixmap(QPixmap(overlayFile(key)))
+            label.setGraphicsEffect(opacityEffect)
+
+        overlay = types.SimpleNamespace(pixelCache=capsWatcher_pixelCache(self.folder.name), overlayOpacity=0.8)
+        frames = {key: capsWatcher_Overlay.bakeOverlayFrame(overlay, overlayFile(key)) for key in self.keys}
+        overlay.pixelCache.release()
+        def showCached(label, key):
+            label.setPixmap(frames[key])
+
+        uncached, cached = self.timeShows(showUncached), self.timeShows(showCached)
+        print(f"\nshow and paint: uncached p50 {percentile(uncached, 0.5):.3f} ms p95 {percentile(uncached, 0.95):.3f} ms, cached p50 {percentile(cached, 0.5):.3f} ms p95 {percentile(cached, 0.95):.3f} ms")
+        self.assertTrue(all(not frame.isNull() for frame in frames.values()))
+        self.assertLess(percentile(cached, 0.95), percentile(uncached, 0.95))
+
+    def testPixelCacheSkipsDecode(self):
+        from PyQt5.QtGui import QImage
+        from capsWatcher import capsWatcher_pixelCache
+        sources = []
+        for keyCode, state in self.keys:
+            with open(os.path.join(self.overlayPath, f'{keyCode}{int(state)}.png'), 'rb') as f:
+                sources.append(f.read())
+
+        def timeLoads(load, rounds=20):
+            timings = []
+            for index in range(rounds):
+                startedAt = time.perf_counter()
+                images = load(index)
+                timings.append((time.perf_counter() - startedAt) * 1000)
+            return statistics.median(timings), images
+
+        decodeCost, decodedImages = timeLoads(lambda index: [QImage.fromData(data).convertToFormat(QImage.Format_ARGB32_Premultiplied) for data in sources])
+        # every cold round gets an empty cache folder, every warm round maps the files the cold rounds left behind
+        coldCost, coldImages = timeLoads(lambda index: [capsWatcher_pixelCache(os.path.join(self.folder.name, str(index))).load(data) for data in sources])
+        warmCaches = []
+        def loadWarm(index):
+            warmCaches.append(capsWatcher_pixelCache(os.path.join(self.folder.name, str(index))))
+            return [warmCaches[-1].load(data) for data in sources]
+        try:
+            warmCost, warmImages = timeLoads(loadWarm)
+            print(f"\nsix overlay images: PNG decode {decodeCost:.2f} ms, cold cache {coldCost:.2f} ms, warm cache {warmCost:.2f} ms")
+            self.assertEqual(coldImages, decodedImages)
+            self.assertEqual(warmImages, decodedImages)
+            self.assertEqual(len(warmCaches[-1].mappings), len(sources))
+            self.assertLess(warmCost, decodeCost)
+        finally:
+            # Windows keeps mapped files from being deleted with the test folder
+            for pixelCache in warmCaches : pixelCache.release()
+
+if __name__ == '__main__':
+    unittest.main()
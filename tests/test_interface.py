@@ -0,0 +1,152 @@
+from importlib.util import find_spec
+import unittest, subprocess, statistics, tempfile, json, time, sys, os
+
+repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+interfaceModules = all(find_spec(module) is not None for module in ('winreg', 'pywinstyles', 'psutil', 'requests'))
+
+@unittest.skipUnless(interfaceModules, "the interface needs its Windows dependencies to import")
+class capsWatcher_processWatcherTests(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        from capsWatcherChannel import capsWatcher_commandServer, sendCommand
+        self.application = QApplication.instance() or QApplication([])
+        if sendCommand('ping') is not None : self.skipTest("capsWatcher is already running for this user")
+
+        # stands in for the overlay: a process to wait on and a channel that answers status for it
+        self.overlayProcess = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+        self.statusReply = json.dumps({"pid": self.overlayProcess.pid})
+        self.commandServer = capsWatcher_commandServer({'status': lambda: (self.statusReply, None)})
+
+    def tearDown(self):
+        self.commandServer.server.close()
+        if self.overlayProcess.poll() is None : self.overlayProcess.kill()
+        self.overlayProcess.wait()
+
+    def runFor(self, milliseconds):
+        from PyQt5.QtCore import QEventLoop, QTimer
+        # the event loop sleeps between events, so the cpu measured here is the watcher's and the channel's
+        loop = QEventLoop()
+        cpuStartedAt = time.process_time()
+        QTimer.singleShot(milliseconds, loop.quit)
+        loop.exec_()
+        return (time.process_time() - cpuStartedAt) / milliseconds * 1000
+
+    def testEmitsOnlyOnTransitions(self):
+        from capsWatcherInterface import capsWatcher_processWatcher
+        emitted = []
+        processWatcher = capsWatcher_processWatcher()
+        processWatcher.processData.connect(lambda running, pid: emitted.append((running, pid)))
+        processWatcher.start()
+        try:
+            stoppedCpu = self.runFor(2500)
+            self.assertEqual(emitted, [(False, "")])
+
+            self.commandServer.listen()
+            self.runFor(1500)
+            self.assertEqual(emitted, [(False, ""), (True, str(self.overlayProcess.pid))])
+            # measured after the transition, which also pays for the first psutil import
+            runningCpu = self.runFor(2000)
+            self.assertEqual(len(emitted), 2)
+
+            # a reply that is not a status object must read as stopped, not kill the watcher
+            self.statusReply = "pong"
+            self.overlayProcess.kill()
+            self.runFor(2500)
+            self.assertEqual(emitted, [(False, ""), (True, str(self.overlayProcess.pid)), (False, "")])
+            self.assertTrue(processWatcher.isRunning())
+        finally:
+            processWatcher.requestInterruption()
+            processWatcher.wait()
+        print(f"\nprocess watcher cpu: {stoppedCpu * 1e3:.2f} ms/s while stopped, {runningCpu * 1e3:.2f} ms/s while running")
+        self.assertLess(stoppedCpu, 0.02)
+        self.assertLess(runningCpu, 0.02)
+
+@unittest.skipUnless(interfaceModules, "the interface needs its Windows dependencies to import")
+class capsWatcher_settingsStoreTests(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        self.application = QApplication.instance() or QApplication([])
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def testFailedFlushStaysDirty(self):
+        from capsWatcherInterface import capsWatcher_settingsStore
+        from capsWatcherConfig import defaultConfig, loadSettings
+        # the config folder does not exist yet, so every write fails with FileNotFoundError
+        configFilePath = os.path.join(self.folder.name, 'capsWatcher', 'capsWatcher.cfg')
+        settingsStore, errors = capsWatcher_settingsStore(configFilePath), []
+        settingsStore.flushFailed.connect(errors.append)
+        settingsStore.load(defaultConfig())
+        settingsStore.set('overlay', 'opacity', '60')
+        settingsStore.flush()
+        settingsStore.flush()
+        self.assertTrue(settingsStore.dirty)
+        self.assertEqual(len(errors), 1)
+
+        os.makedirs(os.path.dirname(configFilePath))
+        settingsStore.flush()
+        self.assertFalse(settingsStore.dirty)
+        self.assertEqual(loadSettings(configFilePath).opacity, 60)
+
+@unittest.skipUnless(interfaceModules, "the interface needs its Windows dependencies to import")
+class capsWatcher_languageIndexTests(unittest.TestCase):
+    rounds = 10
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.languagesPath = os.path.join(self.folder.name, 'languages')
+        self.indexFilePath = os.path.join(self.folder.name, 'capsWatcherLanguages.json')
+        os.makedirs(self.languagesPath)
+        # 100 locales made from the shipped string tables, each under its own short name
+        shippedPath = os.path.join(repositoryPath, 'languages')
+        shipped = sorted(os.listdir(shippedPath))
+        for index in range(100):
+            with open(os.path.join(shippedPath, shipped[index % len(shipped)]), encoding='utf-8') as f:
+                strings = json.load(f)
+            strings['LANGUAGE_SHORTNAME'] = shortName = 'en-US' if index == 0 else f"x{index:02}-XX"
+            with open(os.path.join(self.languagesPath, f"{shortName}.json"), 'w', encoding='utf-8') as f:
+                json.dump(strings, f, ensure_ascii=False)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def timeStartup(self, startup):
+        timings = []
+        for _ in range(self.rounds):
+            startedAt = time.perf_counter()
+            result = startup()
+            timings.append((time.perf_counter() - startedAt) * 1000)
+        return statistics.median(timings), result
+
+    def testStartupCost(self):
+        from capsWatcherInterface import capsWatcher_languageIndex
+        def loadEveryFile():
+            # what parseLanguages did before the index: parse every file to fill the combo box
+            languages = []
+            for languageFile in os.listdir(self.languagesPath):
+                with open(os.path.join(self.languagesPath, languageFile), encoding='utf-8') as f:
+                    strings = json.load(f)
+                languages.append((strings["LANGUAGE_SHORTNAME"], strings["LANGUAGE_DESCRIPTION"]))
+            return sorted(languages)
+        def loadIndex(cold):
+            if cold and os.path.exists(self.indexFilePath) : os.unlink(self.indexFilePath)
+            languageIndex = capsWatcher_languageIndex(self.languagesPath, self.indexFilePath)
+            languages = languageIndex.languages()
+            languageIndex.strings('en-US')
+            return sorted(languages)
+
+        directCost, directLanguages = self.timeStartup(loadEveryFile)
+        coldCost, coldLanguages = self.timeStartup(lambda: loadIndex(cold=True))
+        warmCost, warmLanguages = self.timeStartup(lambda: loadIndex(cold=False))
+        print(f"\n100 locales: every file {directCost:.1f} ms, cold index {coldCost:.1f} ms, warm index and active table {warmCost:.1f} ms")
+        self.assertEqual(len(directLanguages), 100)
+        self.assertEqual(coldLanguages, directLanguages)
+        self.assertEqual(warmLanguages, directLanguages)
+        self.assertLess(warmCost, directCost)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+from importlib.util import find_spec
+import unittest, collections, time
+
+windowsModules = all(find_spec(module) is not None for module in ('win32api', 'winreg'))
+
+class countingKeySource:
+    # stands in for GetKeyboardState, every read is one wakeup of whoever polls it
+    def __init__(self):
+        self.states = {20: False, 144: False, 145: False}
+        self.reads = 0
+
+    def readStates(self, keyCodes):
+        self.reads += 1
+        return {keyCode: self.states[keyCode] for keyCode in keyCodes}
+
+    def keyboardActivity(self):
+        return b''
+
+def simulateHour(scheduler, toggleTimes):
+    # an hour on a virtual clock, returns the wakeups and the longest wait between a toggle and the wakeup that sees it
+    toggles, wakeups, worstLatency, now = collections.deque(toggleTimes), 0, 0, 0
+    scheduler.notifyActivity(now)
+    while now < 3600000:
+        wakeups += 1
+        if toggles and toggles[0] <= now:
+            while toggles and toggles[0] <= now : worstLatency = max(worstLatency, now - toggles.popleft())
+            scheduler.notifyActivity(now)
+        now += scheduler.nextInterval(now)
+    return wakeups, worstLatency
+
+@unittest.skipUnless(windowsModules, "capsWatcher needs pywin32 to import")
+class capsWatcher_keyStateEngineTests(unittest.TestCase):
+    watchTime = 1.0
+
+    def setUp(self):
+        from PyQt5.QtCore import QThread
+
+        class legacyKeyThread(QThread):
+            # the per-key thread capsWatcher used before the batched engine, one 25 ms poll loop per watched key
+            def __init__(self, keyCode, source):
+                super(legacyKeyThread, self).__init__()
+                self.keyCode, self.source = keyCode, source
+
+            def run(self):
+                while not self.isInterruptionRequested():
+                    self.source.readStates([self.keyCode])
+                    self.msleep(25)
+
+        self.legacyKeyThread = legacyKeyThread
+
+    def watch(self, threads, source):
+        source.reads = 0
+        startedAt, cpuStartedAt = time.perf_counter(), time.process_time()
+        for thread in threads : thread.start()
+        time.sleep(self.watchTime)
+        for thread in threads:
+            thread.requestInterruption()
+            thread.wait()
+        elapsed, cpu = time.perf_counter() - startedAt, time.process_time() - cpuStartedAt
+        return source.reads / elapsed, cpu / elapsed
+
+    def testBatchedEngineWakesLess(self):
+        from capsWatcher import capsWatcher_KeyStateEngine, capsWatcher_PollScheduler
+        keyCodes = [20, 144, 145]
+        legacySource, engineSource = countingKeySource(), countingKeySource()
+        legacyWakeups, legacyCpu = self.watch([self.legacyKeyThread(keyCode, legacySource) for keyCode in keyCodes], legacySource)
+        # the old threads' fixed 25 ms interval, so only batching the keys into one loop is measured
+        engine = capsWatcher_KeyStateEngine(keyCodes, scheduler=capsWatcher_PollScheduler(25, 25, 1, 0), source=engineSource)
+        engineWakeups, engineCpu = self.watch([engine], engineSource)
+        print(f"\nidle wakeups: per-key threads {legacyWakeups:.0f}/s, engine {engineWakeups:.0f}/s; cpu: {legacyCpu * 1e3:.2f} ms/s, {engineCpu * 1e3:.2f} ms/s")
+        self.assertLess(engineWakeups, legacyWakeups / 2)
+        # the three old threads wake on the same tick and share most of the timer cost, so cpu only has to not grow
+        self.assertLess(engineCpu, legacyCpu * 1.25)
+
+    def testToggleReportedOnce(self):
+        from PyQt5.QtCore import Qt
+        from capsWatcher import capsWatcher_KeyStateEngine, capsWatcher_PollScheduler
+        source, changes = countingKeySource(), []
+        engine = capsWatcher_KeyStateEngine([20, 144], scheduler=capsWatcher_PollScheduler(5, 5, 1, 0), source=source)
+        # a direct connection records on the engine thread, so no event loop is needed to see the signal
+        engine.stateChanged.connect(lambda keyCode, state: changes.append((keyCode, state)), Qt.DirectConnection)
+        engine.start()
+        time.sleep(0.05)
+        source.states = source.states | {144: True}
+        time.sleep(0.05)
+        engine.stop()
+        self.assertEqual([change for change in changes if change[0]], [(144, True)])
+
+    def testAdaptiveScheduleOverAnHour(self):
+        from capsWatcher import capsWatcher_PollScheduler
+        # a mostly idle hour with a toggle every five minutes, off the poll grid so the wait is not zero
+        toggleTimes = [minute * 60000 + 7 for minute in range(2, 60, 5)]
+        fixedWakeups, fixedLatency = simulateHour(capsWatcher_PollScheduler(25, 25, 1, 0), toggleTimes)
+        adaptiveWakeups, adaptiveLatency = simulateHour(capsWatcher_PollScheduler(10, 100, 1.5, 1500), toggleTimes)
+        print(f"\nwakeups per hour: fixed 25 ms {fixedWakeups}, adaptive {adaptiveWakeups}; worst latency: {fixedLatency} ms, {adaptiveLatency} ms")
+        self.assertLess(adaptiveWakeups, fixedWakeups / 3)
+        self.assertLessEqual(adaptiveLatency, 100)
+
+if __name__ == '__main__':
+    unittest.main()
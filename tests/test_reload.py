@@ -0,0 +1,70 @@
+from importlib.util import find_spec
+import unittest, subprocess, tempfile, itertools, json, time, sys, os
+
+repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+windowsModules = all(find_spec(module) is not None for module in ('win32api', 'winreg'))
+
+@unittest.skipUnless(windowsModules, "capsWatcher needs pywin32 to start")
+class capsWatcher_reloadStormTests(unittest.TestCase):
+    # toggles are replayed into a real overlay while another process keeps rewriting the config and asking it to reload
+    variants = (
+        {'opacity': '60'}, {'keysToWatch': '144,20,145'}, {'keyStateBackend': '1'}, {'positionOnScreen': '2'},
+        {'opacity': '95', 'keyStateBackend': '0'}, {'keysToWatch': '20,144,145', 'pollMaxInterval': '50'}, {'positionOnScreen': '4'},
+    )
+
+    def setUp(self):
+        from PyQt5.QtCore import QCoreApplication
+        from capsWatcherChannel import sendCommand
+        self.application = QCoreApplication.instance() or QCoreApplication([])
+        self.sendCommand = sendCommand
+        if sendCommand('ping') is not None : self.skipTest("capsWatcher is already running for this user")
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.configFilePath = os.path.join(self.folder.name, 'capsWatcher', 'capsWatcher.cfg')
+        self.traceFile = os.path.join(self.folder.name, 'storm.jsonl')
+        self.reportFile = os.path.join(self.folder.name, 'storm.report.json')
+        os.makedirs(os.path.dirname(self.configFilePath))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def writeConfig(self, overrides:dict):
+        from capsWatcherConfig import defaultConfig, writeConfig
+        configParser = defaultConfig()
+        if os.path.exists(self.configFilePath) : configParser.read(self.configFilePath, encoding='utf-8')
+        for key, value in overrides.items() : configParser.set('overlay', key, value)
+        writeConfig(self.configFilePath, configParser)
+
+    def runStorm(self, keyStateBackend):
+        self.writeConfig({'keysToWatch': '20,144,145', 'keyStateBackend': keyStateBackend})
+        with open(self.traceFile, 'w', encoding='utf-8') as f:
+            for index, key in zip(range(300), itertools.cycle([20, 144, 145, 20, 145])):
+                f.write(json.dumps({"t": index * 10, "key": key}) + "\n")
+
+        environment = os.environ | {'APPDATA': self.folder.name, 'QT_QPA_PLATFORM': 'offscreen'}
+        overlay = subprocess.Popen([sys.executable, os.path.join(repositoryPath, 'capsWatcher.py'), f"/replay={self.traceFile}", f"/replayReport={self.reportFile}"], env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        reloads, variants, startedAt = 0, itertools.cycle(self.variants), time.monotonic()
+        try:
+            while overlay.poll() is None and time.monotonic() - startedAt < 60:
+                self.writeConfig(next(variants))
+                if self.sendCommand('reload') == 'ok' : reloads += 1
+                time.sleep(0.005)
+        finally:
+            if overlay.poll() is None : overlay.kill()
+            overlay.wait()
+
+        self.assertEqual(overlay.returncode, 0)
+        with open(self.reportFile, encoding='utf-8') as f:
+            summary = json.load(f)['summary']
+        return reloads, summary
+
+    def testNoToggleMissedDuringReloads(self):
+        for keyStateBackend in ['0', '1']:
+            with self.subTest(keyStateBackend=keyStateBackend):
+                reloads, summary = self.runStorm(keyStateBackend)
+                self.assertGreater(reloads, 50)
+                self.assertEqual(summary['events'], 300)
+                self.assertEqual(summary['missed'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
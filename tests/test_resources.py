@@ -0,0 +1,41 @@
+from xml.etree import ElementTree
+import unittest, subprocess, statistics, tempfile, sys, os
+
+repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+resourcesPath = os.path.join(repositoryPath, 'resources')
+
+def qrcFiles(qrcFile):
+    for resource in ElementTree.parse(os.path.join(resourcesPath, qrcFile)).getroot().iter('qresource'):
+        for file in resource.iter('file') : yield f":/{resource.get('prefix')}/{file.get('alias') or file.text}", os.path.join(resourcesPath, file.text)
+
+class capsWatcher_resourceBundleTests(unittest.TestCase):
+    def testBundlesMatchSources(self):
+        from PyQt5.QtCore import QFile
+        from capsWatcherResources import registerResources
+        # a bundle left behind after an icon changed would still load, just with the old image
+        for bundle, qrcFile in [('capsWatcher', 'res.qrc'), ('capsWatcherOverlay', 'overlay.qrc')]:
+            self.assertTrue(registerResources(bundle))
+            for resourcePath, sourcePath in qrcFiles(qrcFile):
+                with self.subTest(resourcePath=resourcePath):
+                    resource = QFile(resourcePath)
+                    self.assertTrue(resource.open(QFile.ReadOnly))
+                    with open(sourcePath, 'rb') as f:
+                        self.assertEqual(bytes(resource.readAll()), f.read())
+                    resource.close()
+
+    def timeImport(self, setup, statement, rounds=5):
+        # a fresh interpreter per round, QtCore is imported before the clock starts since both ways need it
+        script = f"import sys, time\nfrom PyQt5 import QtCore\n{setup}\nstartedAt = time.perf_counter()\n{statement}\nprint((time.perf_counter() - startedAt) * 1000)"
+        return statistics.median(float(subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout) for _ in range(rounds))
+
+    def testMappedBundleLoadsFaster(self):
+        with tempfile.TemporaryDirectory() as folder:
+            # the compiled module capsWatcherResources.py used to be, built from the same .qrc by pyrcc5
+            subprocess.run([sys.executable, '-m', 'PyQt5.pyrcc_main', os.path.join(resourcesPath, 'res.qrc'), '-o', os.path.join(folder, 'compiledResources.py')], check=True)
+            compiledCost = self.timeImport(f"sys.path.insert(0, {folder!r})", "import compiledResources")
+            mappedCost = self.timeImport(f"sys.path.insert(0, {repositoryPath!r})", "import capsWatcherResources\ncapsWatcherResources.registerResources('capsWatcher')")
+        print(f"\nicon resources: compiled module {compiledCost:.2f} ms, mapped .rcc {mappedCost:.2f} ms")
+        self.assertLess(mappedCost, compiledCost)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+from importlib.util import find_spec
+import unittest, subprocess, tempfile, json, sys, os
+
+repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+interfaceModules = all(find_spec(module) is not None for module in ('winreg', 'pywinstyles', 'psutil', 'requests'))
+
+# cold imports of the interface measured about 145 ms after the lazy import layer, against about 320 ms before it
+importBudget = 250
+
+@unittest.skipUnless(interfaceModules, "the interface needs its Windows dependencies to start")
+class capsWatcher_importBudgetTests(unittest.TestCase):
+    def setUp(self):
+        from PyQt5.QtCore import QCoreApplication
+        from capsWatcherChannel import sendCommand
+        self.application = QCoreApplication.instance() or QCoreApplication([])
+        if sendCommand('ping', 'capsWatcherInterface') is not None : self.skipTest("capsWatcher interface is already running for this user")
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.reportFile = os.path.join(self.folder.name, 'interface-startup.json')
+        from capsWatcherConfig import defaultConfig, writeConfig
+        configParser = defaultConfig()
+        # the update check would keep a network request running when the traced interface quits
+        configParser.set('settings', 'checkForUpdates', '0')
+        os.makedirs(os.path.join(self.folder.name, 'capsWatcher'))
+        writeConfig(os.path.join(self.folder.name, 'capsWatcher', 'capsWatcher.cfg'), configParser)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def testInterfaceImportsWithinBudget(self):
+        environment = os.environ | {'APPDATA': self.folder.name}
+        interface = subprocess.run([sys.executable, os.path.join(repositoryPath, 'capsWatcherInterface.py'), f"/startupTrace={self.reportFile}", "/headless", f"/importBudget={importBudget}"], env=environment, capture_output=True, text=True, timeout=60)
+        self.assertTrue(os.path.exists(self.reportFile), interface.stderr)
+        with open(self.reportFile, encoding='utf-8') as f:
+            summary = json.load(f)['summary']
+        self.assertEqual(interface.returncode, 0, f"imports took {summary['imports']} ms, the budget is {importBudget} ms")
+        self.assertIsNotNone(summary['timeToFirstPaint'])
+
+if __name__ == '__main__':
+    unittest.main()
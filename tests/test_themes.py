@@ -0,0 +1,139 @@
+from capsWatcherThemes import capsWatcher_themeBundle, capsWatcher_themeCatalog, validateBundle, loadManifest, bundleBudget
+import unittest, tempfile, zipfile, json, time, os
+
+def themeManifest(theme):
+    scheme = {'isSupported': True, 'numLockSupport': True, 'capsLockSupport': True, 'scrollLockSupport': True}
+    return json.dumps({'theme': theme, 'name': theme.capitalize(), 'darkMode': scheme | {'overlayPath': 'dark'}, 'lightMode': scheme | {'overlayPath': 'light'}})
+
+def themeEntries(theme):
+    entries = {f"{theme}/{theme}.json": themeManifest(theme).encode('utf-8')}
+    for folder in ['dark', 'light']:
+        for keyCode in [20, 144, 145]:
+            for state in [0, 1] : entries[f"{theme}/{folder}/{keyCode}{state}.png"] = b'\x89PNG\r\n\x1a\n' + os.urandom(64)
+    return entries
+
+class capsWatcher_bundleValidationTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def writeBundle(self, name, entries:dict):
+        bundlePath = os.path.join(self.folder.name, name)
+        with zipfile.ZipFile(bundlePath, 'w', zipfile.ZIP_DEFLATED) as bundle:
+            for entryName, data in entries.items() : bundle.writestr(entryName, data)
+        return bundlePath
+
+    def validate(self, bundlePath):
+        with capsWatcher_themeBundle(bundlePath) as bundle:
+            return validateBundle(bundle)
+
+    def testValidTheme(self):
+        progress = []
+        bundlePath = self.writeBundle('elegant.zip', themeEntries('elegant'))
+        with capsWatcher_themeBundle(bundlePath) as bundle:
+            self.assertEqual(validateBundle(bundle, lambda done, total: progress.append((done, total))), 'elegant')
+        self.assertEqual(progress[-1], (13, 13))
+
+    def testZipBomb(self):
+        entries = themeEntries('bomb') | {'bomb/dark/padding.bin': bytes(bundleBudget['uncompressedSize'] + 1)}
+        with self.assertRaisesRegex(ValueError, "compression ratio"):
+            self.validate(self.writeBundle('bomb.zip', entries))
+
+    def testUncompressedSizeBudget(self):
+        # random data does not compress, so only the total size budget can stop it
+        entries = themeEntries('large') | {f"large/dark/padding{index}.bin": os.urandom(bundleBudget['uncompressedSize'] // 4) for index in range(5)}
+        with self.assertRaisesRegex(ValueError, "unpacks to"):
+            self.validate(self.writeBundle('large.zip', entries))
+
+    def testTooManyEntries(self):
+        entries = themeEntries('many') | {f"many/dark/extra{index}.png": b'' for index in range(1000)}
+        with self.assertRaisesRegex(ValueError, "entries"):
+            self.validate(self.writeBundle('many.zip', entries))
+
+    def testPathTraversal(self):
+        for entryName in ['../evil.dll', 'traversal/../../evil.dll', 'traversal/dark\\..\\evil.dll', 'C:/evil.dll', 'other/evil.dll']:
+            with self.subTest(entryName=entryName):
+                entries = themeEntries('traversal') | {entryName: b'MZ'}
+                with self.assertRaisesRegex(ValueError, "outside the theme folder"):
+                    self.validate(self.writeBundle('traversal.zip', entries))
+
+    def testMissingOverlay(self):
+        entries = themeEntries('partial')
+        del entries['partial/light/1451.png']
+        with self.assertRaisesRegex(ValueError, "1451.png"):
+            self.validate(self.writeBundle('partial.zip', entries))
+
+    def testNotAZip(self):
+        for name, content in [('empty.zip', b''), ('text.zip', b'not a zip file')]:
+            with self.subTest(name=name):
+                bundlePath = os.path.join(self.folder.name, name)
+                with open(bundlePath, 'wb') as f:
+                    f.write(content)
+                with self.assertRaisesRegex(ValueError, "not a valid theme bundle"):
+                    self.validate(bundlePath)
+
+class capsWatcher_themeCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.themesPath = os.path.join(self.folder.name, 'themes')
+        self.indexFilePath = os.path.join(self.folder.name, 'capsWatcherThemes.json')
+        os.makedirs(self.themesPath)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def writeFolderTheme(self, theme):
+        os.makedirs(os.path.join(self.themesPath, theme))
+        with open(os.path.join(self.themesPath, theme, f"{theme}.json"), 'w', encoding='utf-8') as f:
+            f.write(themeManifest(theme))
+
+    def writeBundle(self, theme, corrupt=None):
+        bundlePath = os.path.join(self.themesPath, f"{theme}.zip")
+        with zipfile.ZipFile(bundlePath, 'w', zipfile.ZIP_DEFLATED) as bundle:
+            for entryName, data in themeEntries(theme).items() : bundle.writestr(entryName, data)
+        if corrupt is not None:
+            with open(bundlePath, 'r+b') as f:
+                data = bytearray(f.read())
+                corrupt(data, data.find(f"{theme}/{theme}.json".encode('utf-8')) + len(f"{theme}/{theme}.json"))
+                f.seek(0)
+                f.truncate()
+                f.write(data)
+
+    def testBrokenThemesSkipped(self):
+        def scrambleManifest(data, offset):
+            for index in range(offset, offset + 8) : data[index] ^= 0xff
+        def flipCrc(data, offset):
+            data[data.find(b'PK\x01\x02') + 16] ^= 0xff
+        def truncate(data, offset):
+            del data[len(data) // 2:]
+        self.writeFolderTheme('elegant')
+        self.writeBundle('bundled')
+        for theme, corrupt in [('deflate', scrambleManifest), ('crc', flipCrc), ('truncated', truncate)] : self.writeBundle(theme, corrupt)
+        with open(os.path.join(self.themesPath, 'notazip.zip'), 'wb') as f:
+            f.write(b'not a zip file')
+
+        catalog = capsWatcher_themeCatalog(self.themesPath, self.indexFilePath)
+        self.assertEqual(sorted(manifest.theme for manifest in catalog.themes()), ['bundled', 'elegant'])
+        self.assertEqual(sorted(capsWatcher_themeCatalog(self.themesPath, self.indexFilePath).themes()), sorted(catalog.themes()))
+
+    def testIndexCost(self):
+        for index in range(1000) : self.writeFolderTheme(f"theme{index:04}")
+        startedAt = time.perf_counter()
+        for entry in os.scandir(self.themesPath) : loadManifest(os.path.join(entry.path, f"{entry.name}.json"))
+        directCost = time.perf_counter() - startedAt
+        startedAt = time.perf_counter()
+        coldThemes = capsWatcher_themeCatalog(self.themesPath, self.indexFilePath).themes()
+        coldCost = time.perf_counter() - startedAt
+        # a new catalog reads the index written by the cold one, as the interface does on its next start
+        startedAt = time.perf_counter()
+        warmThemes = capsWatcher_themeCatalog(self.themesPath, self.indexFilePath).themes()
+        warmCost = time.perf_counter() - startedAt
+        print(f"\n1000 themes: every manifest {directCost * 1e3:.0f} ms, cold index {coldCost * 1e3:.0f} ms, warm index {warmCost * 1e3:.0f} ms")
+        self.assertEqual(len(coldThemes), 1000)
+        self.assertEqual(warmThemes, coldThemes)
+        self.assertLess(warmCost, coldCost)
+
+if __name__ == '__main__':
+    unittest.main()